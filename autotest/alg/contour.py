@@ -268,6 +268,49 @@ def test_contour_3():
     ogr_ds.ReleaseResultSet(lyr)
     ogr_ds.Destroy()
 
+###############################################################################
+# Test that processing by strips gives the same lines as the single pass
+
+
+def _contour_lines(ds, options):
+
+    ogr_ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    ogr_lyr = ogr_ds.CreateLayer('contour', geom_type=ogr.wkbLineString)
+    ogr_lyr.CreateField(ogr.FieldDefn('elev', ogr.OFTReal))
+    gdal.ContourGenerateEx(ds.GetRasterBand(1), ogr_lyr,
+                           options=['LEVEL_INTERVAL=10', 'ELEV_FIELD=0'] + options)
+
+    lines = []
+    for f in ogr_lyr:
+        points = f.GetGeometryRef().GetPoints()
+        if points[0] == points[-1]:
+            # Closed lines may start at a different point
+            points = points[:-1]
+            start = points.index(min(points))
+            points = points[start:] + points[:start]
+            lines.append((f['elev'], min(points, points[:1] + points[:0:-1])))
+        else:
+            lines.append((f['elev'], min(points, points[::-1])))
+    return sorted(lines)
+
+
+@pytest.mark.parametrize("nodata", [False, True])
+def test_contour_num_threads(nodata):
+
+    ds = gdal.Translate('', 'data/contour_in.tif', format='MEM')
+    options = []
+    if nodata:
+        options = ['NODATA=%.19g' % ds.GetRasterBand(1).ComputeRasterMinMax()[0]]
+
+    ref_lines = _contour_lines(ds, options)
+    assert ref_lines
+
+    for strip_options in (['STRIP_HEIGHT=1'],
+                          ['STRIP_HEIGHT=3', 'NUM_THREADS=4'],
+                          ['NUM_THREADS=ALL_CPUS']):
+        assert _contour_lines(ds, options + strip_options) == ref_lines, \
+            strip_options
+
 ###############################################################################
 # Cleanup
 
@@ -33,6 +33,7 @@
 
 
 from osgeo import gdal
+import gdaltest
 import pytest
 
 ###############################################################################
@@ -95,3 +96,44 @@ def test_dither_1():
 
 
 
+
+###############################################################################
+# Test GDAL_NUM_THREADS and GDAL_DITHER_NUM_THREADS: same color table, and
+# dithering by strips whose result does not depend on the number of threads
+
+
+def test_dither_num_threads():
+
+    src_ds = gdal.Translate('', '../gdrivers/data/rgbsmall.tif', format='MEM',
+                            width=200, height=600, resampleAlg='bilinear')
+    r_band = src_ds.GetRasterBand(1)
+    g_band = src_ds.GetRasterBand(2)
+    b_band = src_ds.GetRasterBand(3)
+
+    ct_ref = gdal.ColorTable()
+    gdal.ComputeMedianCutPCT(r_band, g_band, b_band, 64, ct_ref)
+    dst_ref_ds = gdal.GetDriverByName('MEM').Create('', 200, 600)
+    gdal.DitherRGB2PCT(r_band, g_band, b_band, dst_ref_ds.GetRasterBand(1), ct_ref)
+
+    data = []
+    for num_threads in ['2', '4']:
+        ct = gdal.ColorTable()
+        dst_ds = gdal.GetDriverByName('MEM').Create('', 200, 600)
+        with gdaltest.config_option('GDAL_NUM_THREADS', num_threads):
+            gdal.ComputeMedianCutPCT(r_band, g_band, b_band, 64, ct)
+            # GDAL_NUM_THREADS alone does not change the dithering
+            gdal.DitherRGB2PCT(r_band, g_band, b_band, dst_ds.GetRasterBand(1), ct)
+            assert dst_ds.ReadRaster() == dst_ref_ds.ReadRaster()
+        with gdaltest.config_option('GDAL_DITHER_NUM_THREADS', num_threads):
+            gdal.DitherRGB2PCT(r_band, g_band, b_band, dst_ds.GetRasterBand(1), ct)
+
+        assert ct.GetCount() == ct_ref.GetCount()
+        for i in range(ct.GetCount()):
+            assert ct.GetColorEntry(i) == ct_ref.GetColorEntry(i)
+
+        # The first strip is dithered as by the single-threaded code
+        assert dst_ds.ReadRaster(0, 0, 200, 256) == \
+            dst_ref_ds.ReadRaster(0, 0, 200, 256)
+        data.append(dst_ds.ReadRaster())
+
+    assert data[0] == data[1]
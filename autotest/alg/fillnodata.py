@@ -29,6 +29,7 @@
 ###############################################################################
 
 from osgeo import gdal
+import pytest
 
 import struct
 
@@ -155,3 +156,70 @@ def test_fillnodata_3x3_central_column_and_line_invalid_search_dist_1_5():
                 == (2, 3, 4,
                     4, 5, 6,
                     6, 7, 8)
+
+
+def _fillnodata_float32(options, maxSearchDist, smoothingIterations):
+    width = 100
+    height = 80
+    ds = gdal.GetDriverByName('MEM').Create('', width, height, 1,
+                                            gdal.GDT_Float32)
+    ds.GetRasterBand(1).SetNoDataValue(-1)
+    values = []
+    for y in range(height):
+        for x in range(width):
+            if (x * 7 + y * 13) % 11 < 4 or 20 <= x < 45 and 30 <= y < 50:
+                values.append(-1)
+            else:
+                values.append((x * y) % 97 + 0.5 * x)
+    ds.WriteRaster(0, 0, width, height, struct.pack('f' * len(values), *values))
+    gdal.FillNodata(targetBand = ds.GetRasterBand(1),
+                    maxSearchDist = maxSearchDist,
+                    maskBand = None,
+                    smoothingIterations = smoothingIterations,
+                    options = options)
+    return ds.ReadRaster()
+
+
+@pytest.mark.parametrize('maxSearchDist,smoothingIterations',
+                         [(5, 0), (12.5, 3)])
+@pytest.mark.parametrize('options',
+                         [['BLOCK_SIZE=16'],
+                          ['NUM_THREADS=4', 'BLOCK_SIZE=13'],
+                          ['NUM_THREADS=ALL_CPUS']])
+def test_fillnodata_by_blocks(options, maxSearchDist, smoothingIterations):
+
+    expected = _fillnodata_float32([], maxSearchDist, smoothingIterations)
+    got = _fillnodata_float32(options, maxSearchDist, smoothingIterations)
+    assert got == expected
+
+
+@pytest.mark.parametrize('maxSearchDist', [1, 2.5, 3])
+def test_fillnodata_by_blocks_holes_at_block_edges(maxSearchDist):
+
+    # Nodata columns on both sides of the block boundaries, so that the
+    # search reaches the edges of the halo read around each block.
+    width = 64
+    height = 40
+    values = []
+    for y in range(height):
+        for x in range(width):
+            if x % 16 in (0, 1, 14, 15) and (x + y) % 5 != 0:
+                values.append(-1)
+            else:
+                values.append(x + 3 * y + 0.25)
+    data = struct.pack('f' * len(values), *values)
+
+    res = []
+    for options in ([], ['BLOCK_SIZE=16'], ['NUM_THREADS=4', 'BLOCK_SIZE=16']):
+        ds = gdal.GetDriverByName('MEM').Create('', width, height, 1,
+                                                gdal.GDT_Float32)
+        ds.GetRasterBand(1).SetNoDataValue(-1)
+        ds.WriteRaster(0, 0, width, height, data)
+        gdal.FillNodata(targetBand = ds.GetRasterBand(1),
+                        maxSearchDist = maxSearchDist,
+                        maskBand = None,
+                        smoothingIterations = 0,
+                        options = options)
+        res.append(ds.ReadRaster())
+    assert res[1] == res[0]
+    assert res[2] == res[0]
@@ -32,6 +32,7 @@
 
 
 import ogrtest
+import pytest
 
 from osgeo import gdal, ogr
 
@@ -193,3 +194,45 @@ def test_polygonize_4():
 
 
 
+
+###############################################################################
+# Test that processing by strips, in parallel or not, gives the same polygons
+
+
+def _polygonize_as_wkt(filename, use_mask, is_int_polygonize, options):
+
+    src_ds = gdal.Open(filename)
+    src_band = src_ds.GetRasterBand(1)
+    mask_band = src_band.GetMaskBand() if use_mask else None
+
+    mem_ds = ogr.GetDriverByName('Memory').CreateDataSource('out')
+    mem_layer = mem_ds.CreateLayer('poly', None, ogr.wkbPolygon)
+    mem_layer.CreateField(ogr.FieldDefn('DN', ogr.OFTInteger))
+
+    if is_int_polygonize:
+        result = gdal.Polygonize(src_band, mask_band, mem_layer, 0, options)
+    else:
+        result = gdal.FPolygonize(src_band, mask_band, mem_layer, 0, options)
+    assert result == 0, 'Polygonize failed'
+
+    return sorted((f.GetField('DN'), f.GetGeometryRef().ExportToWkt())
+                  for f in mem_layer)
+
+
+@pytest.mark.parametrize('filename,use_mask', [('data/polygonize_in.grd', True),
+                                               ('data/polygonize_in.grd', False),
+                                               ('data/polygonize_in_2.grd', False)])
+@pytest.mark.parametrize('connectedness', [4, 8])
+@pytest.mark.parametrize('is_int_polygonize', [True, False])
+def test_polygonize_5(filename, use_mask, connectedness, is_int_polygonize):
+
+    options = ['8CONNECTED=8'] if connectedness == 8 else []
+    expected = _polygonize_as_wkt(filename, use_mask, is_int_polygonize,
+                                  options)
+
+    for strip_options in (['STRIP_HEIGHT=1'],
+                          ['NUM_THREADS=4', 'STRIP_HEIGHT=3'],
+                          ['NUM_THREADS=ALL_CPUS', 'STRIP_HEIGHT=7']):
+        got = _polygonize_as_wkt(filename, use_mask, is_int_polygonize,
+                                 options + strip_options)
+        assert got == expected, strip_options
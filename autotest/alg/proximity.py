@@ -29,7 +29,8 @@
 ###############################################################################
 
 
-
+import math
+import struct
 
 from osgeo import gdal
 import pytest
@@ -131,3 +132,48 @@ def test_proximity_3():
     
 
 
+
+###############################################################################
+# Test the exact algorithm against a brute force computation
+
+
+@pytest.mark.parametrize('num_threads', ['1', '4'])
+def test_proximity_exact(num_threads):
+
+    src_ds = gdal.Open('data/pat.tif')
+    src_band = src_ds.GetRasterBand(1)
+    xsize = src_ds.RasterXSize
+    ysize = src_ds.RasterYSize
+
+    dst_ds = gdal.GetDriverByName('MEM').Create('', xsize, ysize, 2,
+                                                gdal.GDT_Float64)
+    gdal.ComputeProximity(src_band, dst_ds.GetRasterBand(1),
+                          options=['ALGORITHM=EXACT',
+                                   'VALUES=65,64',
+                                   'MAXDIST=12',
+                                   'NODATA=-1',
+                                   'NUM_THREADS=' + num_threads,
+                                   'NEAREST_INDEX_BAND=2'])
+
+    src = struct.unpack('i' * xsize * ysize,
+                        src_band.ReadRaster(buf_type=gdal.GDT_Int32))
+    dist = struct.unpack('d' * xsize * ysize,
+                         dst_ds.GetRasterBand(1).ReadRaster())
+    index = struct.unpack('d' * xsize * ysize,
+                          dst_ds.GetRasterBand(2).ReadRaster())
+    targets = [(i % xsize, i // xsize)
+               for i in range(xsize * ysize) if src[i] in (64, 65)]
+    assert targets
+
+    for y in range(ysize):
+        for x in range(xsize):
+            i = y * xsize + x
+            expected = min(math.hypot(x - tx, y - ty) for tx, ty in targets)
+            if expected > 12:
+                assert dist[i] == -1 and index[i] == -1, (x, y)
+            else:
+                assert dist[i] == pytest.approx(expected, abs=1e-5), (x, y)
+                nearest = int(index[i])
+                assert src[nearest] in (64, 65)
+                assert math.hypot(x - nearest % xsize, y - nearest // xsize) == \
+                    pytest.approx(expected, abs=1e-5)
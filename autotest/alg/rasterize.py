@@ -385,3 +385,61 @@ def test_rasterize_merge_alg_add_multiple_segment_linestring():
                 1, 1, 0, 0, 0, 0, 0, 0, 0, 0,
                 1, 0, 0, 0, 0, 0, 0, 0, 0, 0)
     assert got == expected, '%s' % str(got)
+
+###############################################################################
+# Test that rasterizing with NUM_THREADS gives the same result as the
+# default single-threaded code path
+
+
+@pytest.mark.parametrize("merge_alg", ['REPLACE', 'ADD'])
+@pytest.mark.parametrize("all_touched", [False, True])
+@pytest.mark.parametrize("burn_value_from_z", [False, True])
+def test_rasterize_num_threads(merge_alg, all_touched, burn_value_from_z):
+
+    sr_wkt = 'LOCAL_CS["arbitrary"]'
+    sr = osr.SpatialReference(sr_wkt)
+
+    data_source = ogr.GetDriverByName('MEMORY').CreateDataSource('')
+    layer = data_source.CreateLayer('', sr, geom_type=ogr.wkbUnknown)
+    layer.CreateField(ogr.FieldDefn('val', ogr.OFTInteger))
+    for i in range(100):
+        x = (i * 37) % 1500 + 0.3
+        y = (i * 53) % 1200 + 0.7
+        s = 20 + (i * 17) % 300
+        z = i % 50
+        feature = ogr.Feature(layer.GetLayerDefn())
+        feature['val'] = 1 + i % 7
+        if i % 3 == 0:
+            wkt = 'LINESTRING Z (%f %f %d,%f %f %d)' % (
+                x, y, z, x + s, y + s / 2, z + 30)
+        else:
+            wkt = 'POLYGON Z ((%f %f %d,%f %f %d,%f %f %d,%f %f %d))' % (
+                x, y, z, x + s, y + s / 3, z + 10, x + s / 2, y + s, z + 20,
+                x, y, z)
+        feature.SetGeometryDirectly(ogr.CreateGeometryFromWkt(wkt))
+        layer.CreateFeature(feature)
+
+    common_options = ['MERGE_ALG=' + merge_alg]
+    if all_touched:
+        common_options.append('ALL_TOUCHED=TRUE')
+    burn_values = []
+    if burn_value_from_z:
+        common_options.append('BURN_VALUE_FROM=Z')
+        burn_values = [1]
+    else:
+        common_options.append('ATTRIBUTE=val')
+
+    ref_ds = None
+    for options in ([], ['NUM_THREADS=1'], ['NUM_THREADS=4'],
+                    ['NUM_THREADS=ALL_CPUS']):
+        ds = gdal.GetDriverByName('MEM').Create('', 1700, 1500, 1)
+        ds.SetGeoTransform([0, 1, 0, 0, 0, 1])
+        ds.SetProjection(sr_wkt)
+        gdal.RasterizeLayer(ds, [1], layer, burn_values=burn_values,
+                            options=common_options + options)
+        if ref_ds is None:
+            ref_ds = ds
+            assert ds.GetRasterBand(1).Checksum() != 0
+        else:
+            # Bit-identical, including the pixels of lines crossing tiles
+            assert ds.ReadRaster() == ref_ds.ReadRaster(), options
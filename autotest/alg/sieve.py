@@ -324,3 +324,43 @@ cellsize     60.000000000000
     
 
 
+
+###############################################################################
+# Test that processing by strips gives the same result as the default
+# algorithm
+
+
+@pytest.mark.parametrize('connectedness', [4, 8])
+@pytest.mark.parametrize('options', [['NUM_THREADS=4', 'STRIP_HEIGHT=7'],
+                                     ['STRIP_HEIGHT=1'],
+                                     ['NUM_THREADS=ALL_CPUS']])
+def test_sieve_9(connectedness, options):
+
+    xsize = 61
+    ysize = 1050
+    seed = 1
+    data = bytearray()
+    for i in range(xsize * ysize):
+        seed = (seed * 1103515245 + 12345) % 2147483648
+        # Favour runs of the previous value to get polygons of various sizes
+        if i > 0 and (seed >> 16) % 3 != 0:
+            data.append(data[i - 1 - (xsize - 1 if i >= xsize and seed % 2 else 0)])
+        else:
+            data.append((seed >> 16) % 4)
+
+    drv = gdal.GetDriverByName('MEM')
+    src_ds = drv.Create('', xsize, ysize)
+    src_band = src_ds.GetRasterBand(1)
+    src_band.WriteRaster(0, 0, xsize, ysize, bytes(data))
+
+    ref_ds = drv.Create('', xsize, ysize)
+    gdal.SieveFilter(src_band, None, ref_ds.GetRasterBand(1), 12,
+                     connectedness)
+
+    dst_ds = drv.Create('', xsize, ysize)
+    gdal.SieveFilter(src_band, None, dst_ds.GetRasterBand(1), 12,
+                     connectedness, options)
+
+    assert dst_ds.GetRasterBand(1).ReadRaster() == \
+        ref_ds.GetRasterBand(1).ReadRaster()
+    assert dst_ds.GetRasterBand(1).ReadRaster() != bytes(data)
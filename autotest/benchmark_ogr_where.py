@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###############################################################################
+#
+# Project:  GDAL/OGR Test Suite
+# Purpose:  Benchmark the evaluation of attribute filters with ogrinfo -where,
+#           with and without the compiled program (OGR_SQL_COMPILE_WHERE)
+#
+###############################################################################
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+###############################################################################
+
+# Usage: python benchmark_ogr_where.py [-features N] [-repeat N] [-keep]
+#
+# A shapefile of N features (1000000 by default) with integer, real, string
+# and date fields is generated from a fixed random seed in a temporary
+# directory, with the ogr2ogr found in the PATH. Each expression is then
+# counted with "ogrinfo -ro -so -al -where", with OGR_SQL_COMPILE_WHERE set
+# to NO and to YES. The best of the repeated timings is reported, and the
+# feature counts of both runs must be identical.
+#
+# The timings include the reading of the shapefile, so the speed-up of the
+# whole command is lower than the one of the evaluation of the filter alone.
+
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+EXPRESSIONS = [
+    "i > 3 AND r < 2.5",
+    "i BETWEEN 100 AND 200 OR i IN (5, 7, 11, 13)",
+    "r * 2 + 1 > 10.5",
+    "s LIKE 'a%' OR s = 'x%y'",
+    "s IS NULL OR NOT (s <> 'abc')",
+    "d > '2010/01/01'",
+    "CAST(i AS CHARACTER(10)) = '42'",
+]
+
+
+def generate_csv(filename, nfeatures):
+    rnd = random.Random(1)
+    letters = 'abcxyz%'
+    with open(filename, 'wt') as f:
+        f.write('i,r,s,d\n')
+        for _ in range(nfeatures):
+            if rnd.random() < 0.05:
+                s = ''
+            else:
+                s = ''.join(rnd.choice(letters)
+                            for _ in range(rnd.randint(1, 5)))
+            f.write('%d,%.3f,%s,%04d/%02d/%02d\n' % (
+                rnd.randint(0, 1000), rnd.uniform(0, 10), s,
+                rnd.randint(1990, 2030), rnd.randint(1, 12),
+                rnd.randint(1, 28)))
+    with open(filename[0:-4] + '.csvt', 'wt') as f:
+        f.write('Integer,Real,String,Date\n')
+
+
+def run_ogrinfo(filename, expression, compile_where):
+    args = ['ogrinfo', '-ro', '-so', '-al', '-where', expression,
+            '--config', 'OGR_SQL_COMPILE_WHERE', compile_where, filename]
+    start = time.time()
+    out = subprocess.check_output(args).decode('utf-8')
+    elapsed = time.time() - start
+    m = re.search(r'Feature Count: (\d+)', out)
+    if m is None:
+        raise Exception('Cannot find feature count in:\n' + out)
+    return elapsed, int(m.group(1))
+
+
+def Usage():
+    print('Usage: benchmark_ogr_where.py [-features N] [-repeat N] [-keep]')
+    return 1
+
+
+def main(argv):
+    nfeatures = 1000000
+    repeat = 5
+    keep = False
+    i = 1
+    while i < len(argv):
+        if argv[i] == '-features' and i + 1 < len(argv):
+            i += 1
+            nfeatures = int(argv[i])
+        elif argv[i] == '-repeat' and i + 1 < len(argv):
+            i += 1
+            repeat = int(argv[i])
+        elif argv[i] == '-keep':
+            keep = True
+        else:
+            return Usage()
+        i += 1
+
+    tmpdir = tempfile.mkdtemp(prefix='benchmark_ogr_where')
+    try:
+        csv_filename = os.path.join(tmpdir, 'points.csv')
+        shp_filename = os.path.join(tmpdir, 'points.shp')
+        generate_csv(csv_filename, nfeatures)
+        subprocess.check_call(['ogr2ogr', '-f', 'ESRI Shapefile',
+                               shp_filename, csv_filename])
+
+        print('%d features, best of %d runs' % (nfeatures, repeat))
+        print('%-50s %10s %10s %8s' % ('Expression', 'Tree (s)',
+                                       'Program (s)', 'Speed-up'))
+        for expression in EXPRESSIONS:
+            timings = {}
+            counts = {}
+            for compile_where in ('NO', 'YES'):
+                best = None
+                for _ in range(repeat):
+                    elapsed, count = run_ogrinfo(shp_filename, expression,
+                                                 compile_where)
+                    if best is None or elapsed < best:
+                        best = elapsed
+                timings[compile_where] = best
+                counts[compile_where] = count
+            if counts['NO'] != counts['YES']:
+                print('Feature count mismatch for %s: %d vs %d' % (
+                    expression, counts['NO'], counts['YES']))
+                return 1
+            print('%-50s %10.3f %10.3f %7.2fx' % (
+                expression, timings['NO'], timings['YES'],
+                timings['NO'] / timings['YES']))
+    finally:
+        if keep:
+            print('Files kept in %s' % tmpdir)
+        else:
+            shutil.rmtree(tmpdir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -31,6 +31,7 @@
 ###############################################################################
 
 import os
+import re
 import shutil
 import struct
 
@@ -1308,3 +1309,127 @@ def test_vrt_shared_no_proxy_pool_error():
     with gdaltest.error_handler():
         ds = gdal.Open(vrt_text)
     assert not ds
+
+###############################################################################
+# Test reading a VRT with enough sources to use the spatial index of sources
+
+
+def test_vrt_read_sources_spatial_index():
+
+    src_ds = gdal.Open('data/byte.tif')
+    tiles = []
+    for j in range(4):
+        for i in range(4):
+            name = '/vsimem/vrt_read_sources_spatial_index_%d_%d.tif' % (i, j)
+            gdal.Translate(name, src_ds, srcWin=[i * 5, j * 5, 5, 5])
+            tiles.append(name)
+
+    windows = [(0, 0, 20, 20), (3, 7, 9, 4), (10, 10, 1, 1), (0, 0, 20, 20, 7, 9)]
+
+    def read_all(vrt_ds):
+        res = []
+        for win in windows:
+            res.append(vrt_ds.GetRasterBand(1).ReadRaster(*win))
+            res.append(vrt_ds.ReadRaster(*win))
+        return res
+
+    with gdaltest.config_option('VRT_SOURCES_INDEX_THRESHOLD', '1000'):
+        vrt_ds = gdal.BuildVRT('', tiles)
+        expected = read_all(vrt_ds)
+        assert vrt_ds.GetRasterBand(1).Checksum() == 4672
+
+    with gdaltest.config_option('VRT_SOURCES_INDEX_THRESHOLD', '1'):
+        vrt_ds = gdal.BuildVRT('', tiles)
+        assert read_all(vrt_ds) == expected
+        assert vrt_ds.GetRasterBand(1).Checksum() == 4672
+
+        (flags, _) = vrt_ds.GetRasterBand(1).GetDataCoverageStatus(0, 0, 20, 20)
+        assert flags & gdal.GDAL_DATA_COVERAGE_STATUS_DATA
+
+        # Replacing a source must invalidate the index
+        vrt_ds.GetRasterBand(1).SetMetadataItem('source_15',
+            """<SimpleSource>
+  <SourceFilename relativeToVRT="0">data/byte.tif</SourceFilename>
+  <SourceBand>1</SourceBand>
+  <SrcRect xOff="10" yOff="10" xSize="5" ySize="5" />
+  <DstRect xOff="0" yOff="0" xSize="5" ySize="5" />
+</SimpleSource>""", 'vrt_sources')
+        assert vrt_ds.GetRasterBand(1).ReadRaster(0, 0, 5, 5) == \
+            src_ds.GetRasterBand(1).ReadRaster(10, 10, 5, 5)
+        vrt_ds = None
+
+    for name in tiles:
+        gdal.Unlink(name)
+
+###############################################################################
+# Test deferred parsing of sources until a window touches them
+
+
+def test_vrt_read_deferred_sources():
+
+    src_ds = gdal.Open('data/byte.tif')
+    tiles = []
+    for j in range(4):
+        for i in range(4):
+            name = '/vsimem/vrt_read_deferred_sources_%d_%d.tif' % (i, j)
+            gdal.Translate(name, src_ds, srcWin=[i * 5, j * 5, 5, 5])
+            tiles.append(name)
+    vrt_ds = gdal.BuildVRT('', tiles)
+    # Without SourceProperties, parsing a source opens its dataset
+    vrt_xml = re.sub('<SourceProperties [^>]*/>', '',
+                     vrt_ds.GetMetadata('xml:VRT')[0])
+    vrt_ds = None
+    gdal.Unlink(tiles[-1])
+
+    with gdaltest.config_option('VRT_SOURCES_INDEX_THRESHOLD', '1'):
+        with gdaltest.config_option('VRT_DEFER_SOURCES_PARSING', 'NO'):
+            with gdaltest.error_handler():
+                assert gdal.Open(vrt_xml) is None
+
+        vrt_ds = gdal.Open(vrt_xml)
+        assert vrt_ds is not None
+        assert vrt_ds.GetRasterBand(1).ReadRaster(0, 0, 15, 15) == \
+            src_ds.GetRasterBand(1).ReadRaster(0, 0, 15, 15)
+        gdal.ErrorReset()
+        with gdaltest.error_handler():
+            assert vrt_ds.GetRasterBand(1).ReadRaster(10, 10, 10, 10) is None
+        assert gdal.GetLastErrorMsg() != ''
+        # The failed source is not parsed again, so the error is not repeated
+        gdal.ErrorReset()
+        with gdaltest.error_handler():
+            assert vrt_ds.GetRasterBand(1).ReadRaster(15, 15, 5, 5) is None
+        assert gdal.GetLastErrorMsg() == ''
+        vrt_ds = None
+
+    for name in tiles:
+        gdal.Unlink(name)
+
+###############################################################################
+# Test statistics of the pool of datasets used by VRT sources
+
+
+def test_vrt_read_dataset_pool_statistics():
+
+    src_ds = gdal.Open('data/byte.tif')
+    tiles = []
+    for i in range(3):
+        name = '/vsimem/vrt_read_dataset_pool_statistics_%d.tif' % i
+        gdal.Translate(name, src_ds, srcWin=[i * 5, 0, 5, 20])
+        tiles.append(name)
+
+    hits_before = gdal.GetDatasetPoolHits()
+    misses_before = gdal.GetDatasetPoolMisses()
+    evictions_before = gdal.GetDatasetPoolEvictions()
+
+    with gdaltest.config_option('GDAL_MAX_DATASET_POOL_SIZE', '2'):
+        vrt_ds = gdal.BuildVRT('', tiles)
+        for _ in range(2):
+            vrt_ds.GetRasterBand(1).Checksum()
+        vrt_ds = None
+
+    assert gdal.GetDatasetPoolMisses() >= misses_before + 3
+    assert gdal.GetDatasetPoolHits() > hits_before
+    assert gdal.GetDatasetPoolEvictions() >= evictions_before + 1
+
+    for name in tiles:
+        gdal.Unlink(name)
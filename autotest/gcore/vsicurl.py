@@ -447,6 +447,68 @@ def test_vsicurl_test_parse_html_filelist_apache():
         assert gdal.VSIStatL('/vsicurl/http://localhost:%d/mydir/i_dont_exist' % gdaltest.webserver_port, gdal.VSI_STAT_EXISTS_FLAG) is None
 
     
+###############################################################################
+# Test CPL_VSIL_CURL_DISK_CACHE_DIR
+
+
+def test_vsicurl_test_disk_cache():
+
+    if gdaltest.webserver_port == 0:
+        pytest.skip()
+
+    cache_dir = 'tmp/vsicurl_disk_cache'
+    gdal.RmdirRecursive(cache_dir)
+    gdal.Mkdir(cache_dir, 0o755)
+
+    url = '/vsicurl/http://localhost:%d/test_disk_cache/test.bin' % gdaltest.webserver_port
+
+    def read(etag, expect_download):
+        gdal.VSICurlClearCache()
+        handler = webserver.SequentialHandler()
+        handler.add('HEAD', '/test_disk_cache/test.bin', 200,
+                    {'Content-Length': '20000', 'ETag': '"%s"' % etag})
+        if expect_download:
+            handler.add('GET', '/test_disk_cache/test.bin', 206,
+                        {'Content-Range': 'bytes 0-16383/20000'},
+                        etag[0] * 16384,
+                        expected_headers={'Range': 'bytes=0-16383'})
+        with webserver.install_http_handler(handler):
+            f = gdal.VSIFOpenL(url, 'rb')
+            assert f is not None
+            data = gdal.VSIFReadL(1, 3, f).decode('ascii')
+            gdal.VSIFCloseL(f)
+        return data
+
+    with gdaltest.config_options({'CPL_VSIL_CURL_DISK_CACHE_DIR': cache_dir,
+                                  'GDAL_DISABLE_READDIR_ON_OPEN': 'EMPTY_DIR'}):
+        assert read('a_etag', expect_download=True) == 'aaa'
+        assert len(gdal.ReadDir(cache_dir)) >= 1
+
+        # Served from the disk cache
+        assert read('a_etag', expect_download=False) == 'aaa'
+
+        # Remote file changed: downloaded again
+        assert read('b_etag', expect_download=True) == 'bbb'
+        chunks = [x for x in gdal.ReadDir(cache_dir) if x.endswith('.vsicurl_chunk')]
+        assert len(chunks) == 2
+
+        # Make the chunk of a_etag the most recently used one
+        assert read('a_etag', expect_download=False) == 'aaa'
+
+        # Eviction of least recently used chunks: room for two chunks of
+        # 16384 bytes plus their 8 byte header, but eviction goes 10% below
+        # that. The chunk of b_etag is the least recently used one.
+        with gdaltest.config_option('CPL_VSIL_CURL_DISK_CACHE_SIZE', '40980'):
+            assert read('c_etag', expect_download=True) == 'ccc'
+        chunks = [x for x in gdal.ReadDir(cache_dir) if x.endswith('.vsicurl_chunk')]
+        assert len(chunks) == 2
+        assert read('a_etag', expect_download=False) == 'aaa'
+        assert read('c_etag', expect_download=False) == 'ccc'
+        assert read('b_etag', expect_download=True) == 'bbb'
+
+    gdal.VSICurlClearCache()
+    gdal.RmdirRecursive(cache_dir)
+
 ###############################################################################
 
 
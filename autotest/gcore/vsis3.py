@@ -2373,6 +2373,41 @@ def test_vsis3_read_credentials_ec2_expiration():
     gdal.SetConfigOption('CPL_AWS_AUTODETECT_EC2', None)
 
 ###############################################################################
+# Test that the first chunk, downloaded to get the file size, is stored in
+# the disk cache of CPL_VSIL_CURL_DISK_CACHE_DIR
+
+
+def test_vsis3_disk_cache_first_chunk():
+
+    if gdaltest.webserver_port == 0:
+        pytest.skip()
+
+    cache_dir = 'tmp/vsis3_disk_cache'
+    gdal.RmdirRecursive(cache_dir)
+    gdal.Mkdir(cache_dir, 0o755)
+
+    gdal.VSICurlClearCache()
+    handler = webserver.SequentialHandler()
+    handler.add('GET', '/s3_fake_bucket/disk_cache_resource', 206,
+                {'Content-Range': 'bytes 0-16383/20000',
+                 'ETag': '"the_etag"'},
+                'x' * 16384,
+                expected_headers={'Range': 'bytes=0-16383'})
+    with gdaltest.config_option('CPL_VSIL_CURL_DISK_CACHE_DIR', cache_dir):
+        with webserver.install_http_handler(handler):
+            f = open_for_read('/vsis3/s3_fake_bucket/disk_cache_resource')
+            assert f is not None
+            assert gdal.VSIFReadL(1, 3, f).decode('ascii') == 'xxx'
+            gdal.VSIFCloseL(f)
+
+    chunks = [x for x in gdal.ReadDir(cache_dir)
+              if x.endswith('.vsicurl_chunk')]
+    assert len(chunks) == 1
+
+    gdal.VSICurlClearCache()
+    gdal.RmdirRecursive(cache_dir)
+
+###############################################################################
 
 
 def test_vsis3_stop_webserver():
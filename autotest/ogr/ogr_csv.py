@@ -2197,6 +2197,95 @@ def test_ogr_csv_iter_and_set_feature():
 
     assert count == 2
 
+###############################################################################
+# Test multi-threaded translation of records
+
+
+def test_ogr_csv_num_threads():
+
+    content = 'id,str,val,WKT\n'
+    for i in range(20000):
+        if i % 3 == 0:
+            content += '%d,"multi\nline ""%d""",%d.5,"POINT (%d 2)"\r\n' % (i, i, i, i)
+        elif i % 3 == 1:
+            content += '%d,,%d,\n' % (i, i)
+        else:
+            content += '\n%d,"a,b",,"POINT (1 %d)"\n' % (i, i)
+    gdal.FileFromMemBuffer('/vsimem/ogr_csv_num_threads.csv', content)
+
+    def read_all():
+        ds = ogr.Open('/vsimem/ogr_csv_num_threads.csv')
+        lyr = ds.GetLayer(0)
+        ret = [f.DumpReadableAsString() for f in lyr]
+        # Switch to sequential reading in the middle of a batch
+        lyr.ResetReading()
+        for _ in range(100):
+            lyr.GetNextFeature()
+        f = lyr.GetFeature(5000)
+        ret.append(f.DumpReadableAsString())
+        ret.append(lyr.GetNextFeature().DumpReadableAsString())
+        return ret
+
+    ref = read_all()
+    assert len(ref) == 20002
+    with gdaltest.config_option('OGR_CSV_NUM_THREADS', '4'):
+        got = read_all()
+    gdal.Unlink('/vsimem/ogr_csv_num_threads.csv')
+
+    assert got == ref
+
+###############################################################################
+# Test ROW_OFFSET_INDEX open option
+
+
+def test_ogr_csv_row_offset_index():
+
+    filename = '/vsimem/ogr_csv_row_offset_index.csv'
+    gdal.FileFromMemBuffer(filename, """id,str
+1,"a
+b"
+2,c
+
+3,d
+""")
+
+    for _ in range(2):
+        ds = gdal.OpenEx(filename, open_options=['ROW_OFFSET_INDEX=YES'])
+        lyr = ds.GetLayer(0)
+        assert lyr.TestCapability(ogr.OLCFastSetNextByIndex)
+        assert lyr.TestCapability(ogr.OLCRandomRead)
+        assert lyr.GetFeatureCount() == 3
+        f = lyr.GetFeature(3)
+        assert f.GetFID() == 3 and f['id'] == 3
+        f = lyr.GetFeature(1)
+        assert f['str'] == 'a\nb'
+        f = lyr.GetNextFeature()
+        assert f.GetFID() == 2 and f['str'] == 'c'
+        assert lyr.GetFeature(4) is None
+        assert lyr.SetNextByIndex(1) == 0
+        f = lyr.GetNextFeature()
+        assert f.GetFID() == 2 and f['id'] == 2
+        assert lyr.SetNextByIndex(3) == 0
+        assert lyr.GetNextFeature() is None
+        ds = None
+        assert gdal.VSIStatL(filename + '.rowidx') is not None
+
+    # Modified file: the index must be rebuilt
+    gdal.FileFromMemBuffer(filename, """id,str
+1,a
+2,b
+3,c
+4,d
+""")
+    ds = gdal.OpenEx(filename, open_options=['ROW_OFFSET_INDEX=YES'])
+    lyr = ds.GetLayer(0)
+    assert lyr.GetFeatureCount() == 4
+    assert lyr.GetFeature(4)['str'] == 'd'
+    ds = None
+
+    gdal.Unlink(filename)
+    gdal.Unlink(filename + '.rowidx')
+
 ###############################################################################
 #
 
@@ -3702,6 +3702,88 @@ def test_ogr_geojson_3D_geom_type():
     assert lyr.GetGeomType() == ogr.wkbPoint25D
 
 ###############################################################################
+# Test multi-threaded translation of features of a streamed FeatureCollection
+
+
+def test_ogr_geojson_multithreaded_reading():
+
+    if gdaltest.geojson_drv is None:
+        pytest.skip()
+
+    features = []
+    for i in range(5000):
+        features.append('{ "type": "Feature", "properties": { "a": %d, "b": "x\\"}{[%d" }, "geometry": { "type": "Point", "coordinates": [%d, 2] } }' % (i, i, i))
+    json_content = '{ "type": "FeatureCollection", "name": "features", "features": [ null, ' + \
+        ',\n'.join(features) + ' ], "bbox": [0, 2, 4999, 2] }'
+    tmpfilename = '/vsimem/temp.json'
+    gdal.FileFromMemBuffer(tmpfilename, json_content)
+
+    def read_all():
+        ds = ogr.Open(tmpfilename)
+        lyr = ds.GetLayer(0)
+        ret = [f for f in lyr]
+        lyr.ResetReading()
+        assert len([f for f in lyr]) == len(ret)
+        return ret
+
+    ref_features = read_all()
+    assert len(ref_features) == 5000
+    for num_threads in ('2', 'ALL_CPUS'):
+        with gdaltest.config_option('OGR_GEOJSON_NUM_THREADS', num_threads):
+            got_features = read_all()
+        assert len(got_features) == len(ref_features)
+        for (f_ref, f) in zip(ref_features, got_features):
+            assert f.Equal(f_ref)
+        assert got_features[4999]['b'] == 'x"}{[4999'
+
+    gdal.Unlink(tmpfilename)
+
+###############################################################################
+# Test that errors raised while translating features in worker threads reach
+# the error handler of the calling thread
+
+
+def test_ogr_geojson_multithreaded_reading_errors():
+
+    if gdaltest.geojson_drv is None:
+        pytest.skip()
+
+    features = []
+    for i in range(5000):
+        if (i % 1000) == 999:
+            geom = '{ "type": "Point" }'
+        else:
+            geom = '{ "type": "Point", "coordinates": [%d, 2] }' % i
+        features.append('{ "type": "Feature", "properties": { "a": %d }, "geometry": %s }' % (i, geom))
+    json_content = '{ "type": "FeatureCollection", "features": [ ' + \
+        ',\n'.join(features) + ' ] }'
+    tmpfilename = '/vsimem/temp.json'
+    gdal.FileFromMemBuffer(tmpfilename, json_content)
+
+    def read_all():
+        with gdaltest.error_handler():
+            ds = ogr.Open(tmpfilename)
+        lyr = ds.GetLayer(0)
+        errors = []
+
+        def my_error_handler(err_type, err_no, err_msg):
+            errors.append((err_type, err_msg))
+
+        gdal.PushErrorHandler(my_error_handler)
+        count = len([f for f in lyr])
+        gdal.PopErrorHandler()
+        assert count == 5000
+        return errors
+
+    ref_errors = read_all()
+    assert len(ref_errors) == 5
+    assert ref_errors[0][0] == gdal.CE_Failure
+    with gdaltest.config_option('OGR_GEOJSON_NUM_THREADS', '2'):
+        assert read_all() == ref_errors
+
+    gdal.Unlink(tmpfilename)
+
+###############################################################################
 
 
 def test_ogr_geojson_cleanup():
@@ -195,6 +195,30 @@ def test_ogr_geojsonseq_read_rs_json_pretty():
     assert lyr.GetNextFeature() is None
 
 
+def test_ogr_geojsonseq_multithreaded_reading():
+
+    tmpfilename = '/vsimem/temp.geojsonl'
+    content = ''
+    for i in range(5000):
+        if i % 3 == 0:
+            content += '{"type":"Point","coordinates":[%d,2]}\n' % i
+        else:
+            content += '{"type":"Feature","properties":{"foo":%d},"geometry":{"type":"Point","coordinates":[%d,2]}}\n' % (i, i)
+    gdal.FileFromMemBuffer(tmpfilename, content)
+
+    def read_all():
+        ds = ogr.Open(tmpfilename)
+        lyr = ds.GetLayer(0)
+        return [(f.GetFID(), f['foo'], f.GetGeometryRef().ExportToWkt()) for f in lyr]
+
+    ref = read_all()
+    assert len(ref) == 5000
+    with gdaltest.config_option('OGR_GEOJSON_NUM_THREADS', '4'):
+        assert read_all() == ref
+
+    gdal.Unlink(tmpfilename)
+
+
 def test_ogr_geojsonseq_test_ogrsf():
 
     import test_cli_utilities
@@ -30,6 +30,7 @@ import os
 
 
 import gdaltest
+from osgeo import gdal
 from osgeo import ogr
 import ogrtest
 import pytest
@@ -411,6 +412,210 @@ def test_ogr_index_11():
     ds = None
 
 ###############################################################################
+# Test the driver independent sidecar index, on CSV and GeoJSON datasets.
+
+
+def ogr_index_sidecar_check(filename, layername):
+
+    def check(lyr, where, expected_ids):
+        lyr.SetAttributeFilter(where)
+        got = sorted([f.GetField('id') for f in lyr])
+        assert got == expected_ids, where
+
+    ds = ogr.Open(filename)
+    ds.ExecuteSQL('CREATE INDEX ON %s USING intfield' % layername)
+    ds.ExecuteSQL('CREATE INDEX ON %s USING strfield' % layername)
+    ds.ExecuteSQL('CREATE INDEX ON %s USING realfield' % layername)
+    assert os.path.exists(filename + '.ogrind')
+
+    lyr = ds.GetLayer(0)
+    assert lyr.GetFeatureCount() == 5
+    check(lyr, 'intfield = 2', [3, 4])
+    check(lyr, 'intfield IN (1, 3)', [1, 2, 5])
+    check(lyr, 'intfield > 1', [3, 4, 5])
+    check(lyr, 'intfield <= 1.5', [1, 2])
+    check(lyr, 'realfield BETWEEN 1.5 AND 3.5', [2, 3])
+    check(lyr, "strfield = 'FOO'", [1, 3])
+    check(lyr, "strfield >= 'c' AND intfield < 3", [1, 3])
+    check(lyr, "intfield = 1 OR strfield = 'baz'", [1, 2, 5])
+    check(lyr, "intfield = 2 AND strfield LIKE 'b%'", [4])
+    ds = None
+
+    # The index is reused when reopening the dataset
+    ds = ogr.Open(filename)
+    lyr = ds.GetLayer(0)
+    check(lyr, 'intfield >= 2', [3, 4, 5])
+    ds.ExecuteSQL('DROP INDEX ON %s USING intfield' % layername)
+    check(lyr, 'intfield >= 2', [3, 4, 5])
+    ds.ExecuteSQL('DROP INDEX ON %s' % layername)
+    ds = None
+    assert not os.path.exists(filename + '.ogrind')
+
+
+def test_ogr_index_sidecar():
+
+    csv_content = """id,intfield,strfield,realfield
+1,1,foo,1.0
+2,1,bar,2.0
+3,2,Foo,3.0
+4,2,bar,4.0
+5,3,baz,5.0
+"""
+    filename = 'tmp/ogr_index_sidecar.csv'
+    with open(filename, 'wt') as f:
+        f.write(csv_content)
+    with open(filename[0:-4] + '.csvt', 'wt') as f:
+        f.write('Integer,Integer,String,Real\n')
+    try:
+        ogr_index_sidecar_check(filename, 'ogr_index_sidecar')
+    finally:
+        gdal.Unlink(filename[0:-4] + '.csvt')
+
+    # A stale index must not be used
+    ds = ogr.Open(filename)
+    ds.ExecuteSQL('CREATE INDEX ON ogr_index_sidecar USING intfield')
+    ds = None
+    with open(filename, 'at') as f:
+        f.write('6,1,qux,6.0\n')
+    ds = ogr.Open(filename)
+    lyr = ds.GetLayer(0)
+    lyr.SetAttributeFilter('intfield = 1')
+    assert lyr.GetFeatureCount() == 3
+    ds = None
+
+    # A count resolved with the index must not be taken as the total count
+    gdal.Unlink(filename + '.ogrind')
+    ds = ogr.Open(filename)
+    ds.ExecuteSQL('CREATE INDEX ON ogr_index_sidecar USING intfield')
+    lyr = ds.GetLayer(0)
+    lyr.SetAttributeFilter('intfield = 2')
+    assert lyr.GetFeatureCount() == 2
+    lyr.SetAttributeFilter(None)
+    assert lyr.GetFeatureCount() == 6
+    # Not resolved with the index: the scan reaches the end of the file
+    lyr.SetAttributeFilter('id = 3')
+    assert lyr.GetFeatureCount() == 1
+    lyr.SetAttributeFilter(None)
+    assert lyr.GetFeatureCount() == 6
+    ds = None
+    gdal.Unlink(filename + '.ogrind')
+    gdal.Unlink(filename)
+
+    geojson_content = '{"type":"FeatureCollection","features":['
+    rows = [(1, 'foo', 1.0), (1, 'bar', 2.0), (2, 'Foo', 3.0),
+            (2, 'bar', 4.0), (3, 'baz', 5.0)]
+    geojson_content += ','.join(
+        ['{"type":"Feature","properties":{"id":%d,"intfield":%d,'
+         '"strfield":"%s","realfield":%.1f},"geometry":null}' %
+         (i + 1, row[0], row[1], row[2]) for i, row in enumerate(rows)])
+    geojson_content += ']}'
+    filename = 'tmp/ogr_index_sidecar.geojson'
+    with open(filename, 'wt') as f:
+        f.write(geojson_content)
+    try:
+        ogr_index_sidecar_check(filename, 'ogr_index_sidecar')
+    finally:
+        gdal.Unlink(filename)
+
+###############################################################################
+# Test the driver independent sidecar spatial index.
+
+
+def ogr_index_sidecar_spatial_check(filename, layername):
+
+    def check(lyr, bbox, where, expected_ids):
+        lyr.SetSpatialFilterRect(*bbox)
+        lyr.SetAttributeFilter(where)
+        got = sorted([f.GetField('id') for f in lyr])
+        assert got == expected_ids, (bbox, where)
+
+    ds = ogr.Open(filename)
+    ds.ExecuteSQL('CREATE SPATIAL INDEX ON %s' % layername)
+    assert os.path.exists(filename + '.ogrind')
+    ds.ExecuteSQL('CREATE INDEX ON %s USING intfield' % layername)
+    lyr = ds.GetLayer(0)
+    check(lyr, (-0.5, -0.5, 1.5, 1.5), None, [1, 2])
+    check(lyr, (1.5, 1.5, 10, 10), None, [3, 4, 5])
+    check(lyr, (1.5, 1.5, 10, 10), 'intfield = 2', [3, 4])
+    check(lyr, (100, 100, 200, 200), None, [])
+    lyr.SetAttributeFilter(None)
+    lyr.SetSpatialFilterRect(-0.5, -0.5, 1.5, 1.5)
+    assert lyr.GetFeatureCount() == 2
+    lyr.SetSpatialFilter(None)
+    assert lyr.GetFeatureCount() == 5
+    ds = None
+
+    # Both indexes are reused when reopening the dataset
+    ds = ogr.Open(filename)
+    lyr = ds.GetLayer(0)
+    check(lyr, (2.5, 2.5, 10, 10), 'intfield >= 2', [4, 5])
+    ds.ExecuteSQL('DROP INDEX ON %s' % layername)
+    assert os.path.exists(filename + '.ogrind')
+    check(lyr, (2.5, 2.5, 10, 10), None, [4, 5])
+    ds.ExecuteSQL('DROP SPATIAL INDEX ON %s' % layername)
+    ds = None
+    assert not os.path.exists(filename + '.ogrind')
+
+    # Built on demand by the first filtered scan, and only kept in memory
+    with gdaltest.config_option('OGR_SIDECAR_SPATIAL_INDEX', 'AUTO'):
+        ds = ogr.Open(filename)
+        lyr = ds.GetLayer(0)
+        check(lyr, (0.5, 0.5, 3.5, 3.5), None, [2, 3, 4])
+        check(lyr, (2.5, 2.5, 10, 10), None, [4, 5])
+        ds = None
+    assert not os.path.exists(filename + '.ogrind')
+
+    # Written in the sidecar file when explicitly requested
+    with gdaltest.config_option('OGR_SIDECAR_SPATIAL_INDEX', 'AUTO_WRITE'):
+        ds = ogr.Open(filename)
+        lyr = ds.GetLayer(0)
+        check(lyr, (0.5, 0.5, 3.5, 3.5), None, [2, 3, 4])
+        ds = None
+    assert os.path.exists(filename + '.ogrind')
+    ds = ogr.Open(filename)
+    check(ds.GetLayer(0), (0.5, 0.5, 3.5, 3.5), None, [2, 3, 4])
+    ds = None
+    gdal.Unlink(filename + '.ogrind')
+
+
+def test_ogr_index_sidecar_spatial():
+
+    rows = [(1, 1, 0, 0), (2, 1, 1, 1), (3, 2, 2, 2), (4, 2, 3, 3),
+            (5, 3, 4, 5)]
+
+    filename = 'tmp/ogr_index_sidecar_spatial.csv'
+    with open(filename, 'wt') as f:
+        f.write('WKT,id,intfield\n')
+        for row in rows:
+            f.write('"POINT (%d %d)",%d,%d\n' % (row[2], row[3],
+                                                  row[0], row[1]))
+    with open(filename[0:-4] + '.csvt', 'wt') as f:
+        f.write('String,Integer,Integer\n')
+    try:
+        ogr_index_sidecar_spatial_check(filename,
+                                        'ogr_index_sidecar_spatial')
+    finally:
+        gdal.Unlink(filename[0:-4] + '.csvt')
+        gdal.Unlink(filename)
+
+    geojson_content = '{"type":"FeatureCollection","features":['
+    geojson_content += ','.join(
+        ['{"type":"Feature","properties":{"id":%d,"intfield":%d},'
+         '"geometry":{"type":"LineString","coordinates":'
+         '[[%d,%d],[%f,%f]]}}' %
+         (row[0], row[1], row[2], row[3], row[2] + 0.1, row[3] + 0.1)
+         for row in rows])
+    geojson_content += ']}'
+    filename = 'tmp/ogr_index_sidecar_spatial.geojson'
+    with open(filename, 'wt') as f:
+        f.write(geojson_content)
+    try:
+        ogr_index_sidecar_spatial_check(filename,
+                                        'ogr_index_sidecar_spatial')
+    finally:
+        gdal.Unlink(filename)
+
+###############################################################################
 
 
 def test_ogr_index_cleanup():
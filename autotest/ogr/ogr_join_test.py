@@ -495,6 +495,77 @@ def test_ogr_join_23():
     ds = None
 
 ###############################################################################
+# Test that the hash join gives the same results as the attribute filter
+# based join, including when features are spilled to disk
+
+
+def test_ogr_join_hash_join():
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('first')
+    lyr.CreateField(ogr.FieldDefn('int_key', ogr.OFTInteger))
+    lyr.CreateField(ogr.FieldDefn('real_key', ogr.OFTReal))
+    lyr.CreateField(ogr.FieldDefn('str_key', ogr.OFTString))
+    for i in range(20):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        if i != 5:
+            f['int_key'] = i % 12
+            f['real_key'] = (i % 12) * 0.5
+            f['str_key'] = 'KEY%d' % (i % 12)
+        lyr.CreateFeature(f)
+    # Only matches 0.3 once formatted with 16 significant digits
+    f = ogr.Feature(lyr.GetLayerDefn())
+    f['real_key'] = 0.1 + 0.2
+    lyr.CreateFeature(f)
+
+    lyr = ds.CreateLayer('second')
+    lyr.CreateField(ogr.FieldDefn('int_key', ogr.OFTInteger64))
+    lyr.CreateField(ogr.FieldDefn('real_key', ogr.OFTReal))
+    lyr.CreateField(ogr.FieldDefn('str_key', ogr.OFTString))
+    lyr.CreateField(ogr.FieldDefn('val', ogr.OFTString))
+    lyr.CreateField(ogr.FieldDefn('list', ogr.OFTIntegerList))
+    lyr.CreateField(ogr.FieldDefn('dt', ogr.OFTDateTime))
+    for i in range(10):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        f['int_key'] = i
+        f['real_key'] = i * 0.5
+        f['str_key'] = 'key%d' % i
+        f['val'] = 'val%d' % i
+        f.SetFieldIntegerList(4, [i, i + 1])
+        f['dt'] = '2020/01/%02d 12:34:56' % (i + 1)
+        f.SetGeometry(ogr.CreateGeometryFromWkt('POINT (%d 2)' % i))
+        lyr.CreateFeature(f)
+    # Duplicated key: only the first feature must be used
+    f = ogr.Feature(lyr.GetLayerDefn())
+    f['int_key'] = 1
+    f['real_key'] = 0.5
+    f['str_key'] = 'KEY1'
+    f['val'] = 'duplicate'
+    lyr.CreateFeature(f)
+    f = ogr.Feature(lyr.GetLayerDefn())
+    f['real_key'] = 0.3
+    f['val'] = 'rounded'
+    lyr.CreateFeature(f)
+
+    def get_results(key, options):
+        with gdaltest.config_options(options):
+            sql_lyr = ds.ExecuteSQL(
+                'SELECT * FROM first LEFT JOIN second ON first.%s = second.%s' % (key, key))
+            res = []
+            for f in sql_lyr:
+                res.append(f.ExportToJson())
+            ds.ReleaseResultSet(sql_lyr)
+        return res
+
+    for key in ('int_key', 'real_key', 'str_key'):
+        ref = get_results(key, {'OGR_SQL_HASH_JOIN': 'NO'})
+        if key == 'real_key':
+            assert 'rounded' in ref[-1]
+        assert get_results(key, {'OGR_SQL_HASH_JOIN': 'YES'}) == ref
+        assert get_results(key, {'OGR_SQL_HASH_JOIN': 'YES',
+                                 'OGR_SQL_HASH_JOIN_MAX_MEMORY': '0'}) == ref
+
+###############################################################################
 
 
 def test_ogr_join_cleanup():
@@ -1335,6 +1335,77 @@ def test_ogr_rfc28_int_overflows():
 
     
 
+###############################################################################
+# Check that the compiled evaluation of attribute filters gives the same
+# results as the evaluation of the expression tree
+
+
+def test_ogr_rfc28_compiled_where():
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('lyr', geom_type=ogr.wkbNone)
+    lyr.CreateField(ogr.FieldDefn('s', ogr.OFTString))
+    lyr.CreateField(ogr.FieldDefn('i', ogr.OFTInteger))
+    fld_defn = ogr.FieldDefn('b', ogr.OFTInteger)
+    fld_defn.SetSubType(ogr.OFSTBoolean)
+    lyr.CreateField(fld_defn)
+    lyr.CreateField(ogr.FieldDefn('l', ogr.OFTInteger64))
+    lyr.CreateField(ogr.FieldDefn('r', ogr.OFTReal))
+    strings = ['abc', 'ABC', 'abd', 'x%y', '', '2020/01/01 10:00:00+00']
+    for i in range(200):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        if i % 7 != 0:
+            f['s'] = strings[i % len(strings)]
+        if i % 5 == 1:
+            f.SetFieldNull('i')
+        elif i % 5 != 0:
+            f['i'] = i % 13 - 6
+        if i % 3 != 0:
+            f['b'] = i % 2
+        if i % 11 != 0:
+            f['l'] = (i % 9 - 4) * (1 << 40 if i % 4 == 0 else 1)
+        if i % 6 != 0:
+            f['r'] = (i % 17 - 8) / 4.0
+        lyr.CreateFeature(f)
+
+    filters = ["i > 3",
+               "i > 3 AND r < 1.5",
+               "s = 'abc' OR i = 3",
+               "NOT (i >= 0)",
+               "b",
+               "b OR i > 0",
+               "NOT b",
+               "i IN (1, 2, 3, -5)",
+               "r IN (1, 2.5, -1)",
+               "s IN ('abc', 'x%y')",
+               "i BETWEEN -2 AND 4",
+               "s LIKE 'ab%'",
+               "s LIKE 'x#%%' ESCAPE '#'",
+               "s IS NULL OR r IS NOT NULL",
+               "s = '2020/01/01 10:00:00'",
+               "l > 1000",
+               "l + i > 2",
+               "l * l > 5",
+               "i * 2 + 1 = 7",
+               "r / 2 > 1",
+               "i % 3 = 1",
+               "i / 0 > 5",
+               "FID % 7 = 0 AND i > 0",
+               "i > 1 + 2 * 3",
+               "i = NULL",
+               "r = i",
+               "SUBSTR(s, 1, 2) = 'ab' AND i > 0",
+               "CAST(i AS CHARACTER(10)) = '3' OR b"]
+    for where in filters:
+        res = []
+        for compile_where in ('NO', 'YES'):
+            with gdaltest.config_option('OGR_SQL_COMPILE_WHERE', compile_where):
+                assert lyr.SetAttributeFilter(where) == 0, where
+            res.append([f.GetFID() for f in lyr])
+        assert res[0] == res[1], where
+    lyr.SetAttributeFilter(None)
+
+
 ###############################################################################
 
 
@@ -1364,6 +1364,175 @@ def test_ogr_sql_48():
     assert i == 1001
 
 
+###############################################################################
+# Test GROUP BY and HAVING
+
+
+def _ogr_sql_group_by_create_ds():
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test', geom_type=ogr.wkbNone)
+    lyr.CreateField(ogr.FieldDefn('cat', ogr.OFTString))
+    lyr.CreateField(ogr.FieldDefn('val', ogr.OFTInteger))
+    for i in range(100):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        if i % 10 != 9:
+            f['cat'] = 'cat%d' % (i % 10)
+        f['val'] = i
+        lyr.CreateFeature(f)
+    return ds
+
+
+def _ogr_sql_group_by_fetch(ds, sql):
+    sql_lyr = ds.ExecuteSQL(sql)
+    ret = [[f.GetField(i) for i in range(f.GetFieldCount())] for f in sql_lyr]
+    assert sql_lyr.GetFeatureCount() == len(ret)
+    ds.ReleaseResultSet(sql_lyr)
+    return ret
+
+
+def test_ogr_sql_group_by():
+
+    ds = _ogr_sql_group_by_create_ds()
+
+    sql = 'SELECT cat, COUNT(*) AS cnt, SUM(val), MIN(val), MAX(val) ' + \
+          'FROM test GROUP BY cat ORDER BY cat DESC'
+    res = _ogr_sql_group_by_fetch(ds, sql)
+    assert len(res) == 10
+    assert res[0] == ['cat8', 10, sum(range(8, 100, 10)), 8, 98]
+    assert res[-1] == [None, 10, sum(range(9, 100, 10)), 9, 99]
+
+    res = _ogr_sql_group_by_fetch(
+        ds, "SELECT cat, COUNT(*) AS cnt, SUM(val) FROM test "
+            "WHERE val >= 50 GROUP BY cat HAVING SUM(val) > 360 AND "
+            "cat <> 'cat8' ORDER BY cnt, cat")
+    assert res == [['cat3', 5, 365], ['cat4', 5, 370], ['cat5', 5, 375],
+                   ['cat6', 5, 380], ['cat7', 5, 385]]
+
+    res = _ogr_sql_group_by_fetch(
+        ds, 'SELECT cat, COUNT(DISTINCT val) FROM test GROUP BY cat '
+            'ORDER BY cat LIMIT 2 OFFSET 1')
+    assert res == [['cat0', 10], ['cat1', 10]]
+
+    for sql in ['SELECT cat, val FROM test GROUP BY cat',
+                'SELECT cat FROM test HAVING cat IS NULL',
+                'SELECT DISTINCT cat FROM test GROUP BY cat',
+                'SELECT cat, COUNT(*) FROM test GROUP BY cat ORDER BY val',
+                'SELECT cat FROM test GROUP BY cat HAVING MAX(val) > 0',
+                'SELECT cat FROM test GROUP BY non_existing']:
+        with gdaltest.error_handler():
+            sql_lyr = ds.ExecuteSQL(sql)
+        assert sql_lyr is None, sql
+
+###############################################################################
+# Test GROUP BY when the groups do not fit in memory
+
+
+def test_ogr_sql_group_by_spill_to_disk():
+
+    ds = _ogr_sql_group_by_create_ds()
+
+    sql = 'SELECT cat, COUNT(*), AVG(val) FROM test GROUP BY cat'
+    expected = _ogr_sql_group_by_fetch(ds, sql)
+    with gdaltest.config_option('OGR_SQL_GROUP_BY_MAX_MEMORY', '0'):
+        got = _ogr_sql_group_by_fetch(ds, sql)
+    assert sorted(got, key=str) == sorted(expected, key=str)
+
+    sql += ' ORDER BY cat'
+    with gdaltest.config_option('OGR_SQL_GROUP_BY_MAX_MEMORY', '0'):
+        got = _ogr_sql_group_by_fetch(ds, sql)
+    assert got == sorted(expected, key=lambda x: '' if x[0] is None else x[0])
+
+
+###############################################################################
+# Test ORDER BY with the features sorted in runs written to temporary files
+
+
+def _ogr_sql_order_by_create_ds():
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test', geom_type=ogr.wkbNone)
+    lyr.CreateField(ogr.FieldDefn('cat', ogr.OFTString))
+    lyr.CreateField(ogr.FieldDefn('val', ogr.OFTInteger))
+    for i in range(100):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        if i % 7 != 6:
+            f['cat'] = 'cat%d' % (i % 7)
+        # Not in the order of the features, and with duplicates
+        f['val'] = (i * 37) % 50
+        lyr.CreateFeature(f)
+    return ds
+
+
+def _ogr_sql_order_by_fetch(ds, sql):
+    sql_lyr = ds.ExecuteSQL(sql)
+    ret = [[f.GetField(i) for i in range(f.GetFieldCount())] for f in sql_lyr]
+    ds.ReleaseResultSet(sql_lyr)
+    return ret
+
+
+def test_ogr_sql_order_by_external_sort():
+
+    ds = _ogr_sql_order_by_create_ds()
+
+    for sql in ['SELECT * FROM test ORDER BY cat DESC, val',
+                'SELECT val, cat FROM test ORDER BY val LIMIT 15 OFFSET 20',
+                'SELECT * FROM test WHERE val > 30 ORDER BY val DESC OFFSET 3']:
+        with gdaltest.config_option('OGR_SQL_EXTERNAL_SORT', 'NO'):
+            expected = _ogr_sql_order_by_fetch(ds, sql)
+        assert expected
+        # One run per feature, so that runs are merged before reading
+        with gdaltest.config_options({'OGR_SQL_EXTERNAL_SORT': 'YES',
+                                      'OGR_SQL_ORDER_BY_RUN_SIZE': '0'}):
+            sql_lyr = ds.ExecuteSQL(sql)
+            got = [[f.GetField(i) for i in range(f.GetFieldCount())]
+                   for f in sql_lyr]
+            assert got == expected, sql
+            sql_lyr.ResetReading()
+            got = [[f.GetField(i) for i in range(f.GetFieldCount())]
+                   for f in sql_lyr]
+            assert got == expected, sql
+            sql_lyr.SetNextByIndex(2)
+            f = sql_lyr.GetNextFeature()
+            assert [f.GetField(i) for i in range(f.GetFieldCount())] == \
+                expected[2], sql
+            ds.ReleaseResultSet(sql_lyr)
+
+        with gdaltest.config_option('OGR_SQL_EXTERNAL_SORT', 'YES'):
+            got = _ogr_sql_order_by_fetch(ds, sql)
+        assert got == expected, sql
+
+        # A value lower than the minimum run size does not spill
+        with gdaltest.config_options({'OGR_SQL_EXTERNAL_SORT': 'YES',
+                                      'OGR_SQL_ORDER_BY_MAX_MEMORY': '0'}):
+            got = _ogr_sql_order_by_fetch(ds, sql)
+        assert got == expected, sql
+
+
+###############################################################################
+# Test that ORDER BY fails, rather than returning unsorted features, when
+# the temporary files cannot be created
+
+
+def test_ogr_sql_order_by_external_sort_error():
+
+    ds = _ogr_sql_order_by_create_ds()
+
+    with gdaltest.config_options({'OGR_SQL_EXTERNAL_SORT': 'YES',
+                                  'OGR_SQL_ORDER_BY_RUN_SIZE': '0',
+                                  'CPL_TMPDIR': '/i_do/not/exist'}):
+        sql_lyr = ds.ExecuteSQL('SELECT * FROM test ORDER BY val')
+        gdal.ErrorReset()
+        with gdaltest.error_handler():
+            f = sql_lyr.GetNextFeature()
+        assert f is None
+        assert gdal.GetLastErrorMsg() != ''
+        with gdaltest.error_handler():
+            assert sql_lyr.SetNextByIndex(1) != 0
+            assert sql_lyr.GetNextFeature() is None
+        ds.ReleaseResultSet(sql_lyr)
+
+
 def test_ogr_sql_cleanup():
     gdaltest.lyr = None
     gdaltest.ds = None
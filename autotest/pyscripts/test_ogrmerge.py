@@ -350,3 +350,24 @@ def test_ogrmerge_12():
 
 
 
+
+###############################################################################
+# Test -j
+
+
+def test_ogrmerge_13():
+    script_path = test_py_scripts.get_py_script('ogrmerge')
+    if script_path is None:
+        pytest.skip()
+
+    test_py_scripts.run_py_script(script_path, 'ogrmerge',
+                                  '-j 2 -o tmp/out ../ogr/data/poly.shp '
+                                  '../ogr/data/testpoly.shp')
+
+    ds = ogr.Open('tmp/out')
+    assert ds is not None
+    assert ds.GetLayerCount() == 2
+    assert ds.GetLayerByName('poly').GetFeatureCount() == 10
+    ds = None
+
+    ogr.GetDriverByName('ESRI Shapefile').DeleteDataSource('tmp/out')
@@ -31,9 +31,11 @@
 
 import struct
 
+import pytest
 
 from osgeo import gdal, ogr
 
+import gdaltest
 import ogrtest
 
 ###############################################################################
@@ -133,6 +135,47 @@ def test_gdal_grid_lib_3():
               width=115, height=93, outputBounds=[37.3495161160827, 55.6901531392856, 37.3497618734837, 55.6902650179072],
               format='MEM', algorithm='linear')
 
+###############################################################################
+# Test gridding by tiles (-tile_size)
+
+
+def test_gdal_grid_lib_tile_size():
+
+    for algorithm in ['nearest:radius1=0.02:radius2=0.02',
+                      'average:radius1=0.03:radius2=0.02:angle=30',
+                      'invdist:radius1=0.03:radius2=0.03:max_points=5',
+                      'invdistnn:radius=0.03:max_points=5',
+                      'count:radius1=0.02:radius2=0.02']:
+        ds_ref = gdal.Grid('', '/vsimem/tmp/n43.shp', format='MEM',
+                           outputBounds=[-80.0041667, 42.9958333, -78.9958333, 44.0041667],
+                           width=121, height=121, outputType=gdal.GDT_Float32,
+                           algorithm=algorithm)
+        ds = gdal.Grid('', '/vsimem/tmp/n43.shp', format='MEM',
+                       outputBounds=[-80.0041667, 42.9958333, -78.9958333, 44.0041667],
+                       width=121, height=121, outputType=gdal.GDT_Float32,
+                       algorithm=algorithm, tileSize=(32, 20))
+        assert ds is not None, algorithm
+        # The grid nodes of a tile are computed from the origin of the tile,
+        # and the points of a tile are searched in a quadtree built from the
+        # tile bucket only. This changes the rounding of node coordinates and
+        # of sums of values, so only counts are expected to be identical.
+        ref = struct.unpack('f' * 121 * 121, ds_ref.ReadRaster())
+        got = struct.unpack('f' * 121 * 121, ds.ReadRaster())
+        if algorithm.startswith('count'):
+            assert got == ref
+        else:
+            for i in range(121 * 121):
+                assert got[i] == pytest.approx(ref[i], abs=1e-3), (algorithm, i)
+
+        # Spilling the buckets to the temporary file keeps the order of the
+        # points, hence the result is identical.
+        with gdaltest.config_option('GDAL_GRID_BUCKETS_MAX_MEMORY', '10000'):
+            ds_spilled = gdal.Grid('', '/vsimem/tmp/n43.shp', format='MEM',
+                                   outputBounds=[-80.0041667, 42.9958333, -78.9958333, 44.0041667],
+                                   width=121, height=121, outputType=gdal.GDT_Float32,
+                                   algorithm=algorithm, tileSize=(32, 20))
+        assert ds_spilled.ReadRaster() == ds.ReadRaster(), algorithm
+
 ###############################################################################
 # Cleanup
 
@@ -480,3 +480,37 @@ def test_gdaldem_lib_nodata():
 
 
 
+
+###############################################################################
+# Test multi-threaded processing
+
+
+@pytest.mark.parametrize('processing', ['hillshade', 'slope', 'aspect', 'TRI',
+                                        'TPI', 'roughness', 'color-relief'])
+@pytest.mark.parametrize('src_type', [gdal.GDT_Int16, gdal.GDT_Float32])
+def test_gdaldem_lib_num_threads(processing, src_type):
+
+    src_ds = gdal.Translate('', '../gdrivers/data/n43.dt0', format='MEM',
+                            outputType=src_type)
+    src_ds.GetRasterBand(1).SetNoDataValue(0)
+    src_ds.GetRasterBand(1).WriteRaster(60, 60, 1, 1,
+                                        struct.pack('f', 0), buf_type=gdal.GDT_Float32)
+
+    kwargs = {'computeEdges': True, 'scale': 111120}
+    if processing == 'color-relief':
+        kwargs = {'colorFilename': 'data/color_file.txt', 'addAlpha': True}
+
+    ref_ds = gdal.DEMProcessing('', src_ds, processing, format='MEM', **kwargs)
+    ds = gdal.DEMProcessing('', src_ds, processing, format='MEM',
+                            numThreads=4, **kwargs)
+    assert ds.ReadRaster() == ref_ds.ReadRaster()
+
+    # Strips aligned on the blocks of a tiled output
+    ds = gdal.DEMProcessing('/vsimem/test_gdaldem_lib_num_threads.tif',
+                            src_ds, processing, format='GTiff',
+                            creationOptions=['TILED=YES', 'BLOCKXSIZE=16',
+                                             'BLOCKYSIZE=16'],
+                            numThreads=4, **kwargs)
+    assert ds.ReadRaster() == ref_ds.ReadRaster()
+    ds = None
+    gdal.Unlink('/vsimem/test_gdaldem_lib_num_threads.tif')
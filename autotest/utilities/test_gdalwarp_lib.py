@@ -489,6 +489,55 @@ def test_gdalwarp_lib_cutline_all_touched_single_pixel():
 
     gdal.Unlink(cutlineDSName)
 
+###############################################################################
+# Test that the cutline mask computed chunk by chunk from the cutline prepared
+# once per warping operation matches the rasterized cutline
+
+
+def test_gdalwarp_lib_cutline_prepared():
+
+    src_ds = gdal.GetDriverByName('MEM').Create('', 200, 200)
+    src_ds.SetGeoTransform([0, 1, 0, 200, 0, -1])
+    src_ds.GetRasterBand(1).Fill(1)
+
+    cutlineDSName = '/vsimem/test_gdalwarp_lib_cutline_prepared.json'
+    cutline_ds = ogr.GetDriverByName('GeoJSON').CreateDataSource(cutlineDSName)
+    cutline_lyr = cutline_ds.CreateLayer('cutline')
+    f = ogr.Feature(cutline_lyr.GetLayerDefn())
+    f.SetGeometry(ogr.CreateGeometryFromWkt('MULTIPOLYGON(((10.5 10.5,150.3 20.5,180 120.5,120.5 120.5,90 190.2,3.7 100,10.5 10.5),(40 40,100.5 40.5,100.5 80.5,40 80.5,40 40)),((160.5 150.5,195.5 150.5,195.5 195.5,170.2 170.8,160.5 150.5)))'))
+    cutline_lyr.CreateFeature(f)
+    f = None
+    cutline_lyr = None
+    cutline_ds = None
+
+    ref_ds = gdal.GetDriverByName('MEM').Create('', 200, 200)
+    ref_ds.SetGeoTransform([0, 1, 0, 200, 0, -1])
+    gdal.Rasterize(ref_ds, cutlineDSName, burnValues=[1])
+    ref_data = ref_ds.ReadRaster()
+
+    for multithread in [False, True]:
+        debug_msgs = []
+
+        def my_error_handler(err_type, err_no, err_msg):
+            if err_type == gdal.CE_Debug:
+                debug_msgs.append(err_msg)
+
+        with gdaltest.config_option('CPL_DEBUG', 'ON'):
+            gdal.PushErrorHandler(my_error_handler)
+            ds = gdal.Warp('', src_ds, format='MEM',
+                           cutlineDSName=cutlineDSName,
+                           warpMemoryLimit=10000, multithread=multithread)
+            gdal.PopErrorHandler()
+        assert ds.ReadRaster() == ref_data
+
+        # The cutline is prepared once, and used for all the chunks
+        assert len([msg for msg in debug_msgs
+                    if 'Prepared cutline' in msg]) == 1
+        assert len([msg for msg in debug_msgs
+                    if 'GDALWarpKernel()' in msg]) > 1
+
+    gdal.Unlink(cutlineDSName)
+
 ###############################################################################
 # Test callback
 
@@ -1832,6 +1881,145 @@ def test_gdalwarp_lib_restrict_output_dataset_warp_rpc_existing_RPC_FOOTPRINT():
         cs = dstDS.GetRasterBand(1).Checksum()
         assert cs == 53230
 
+###############################################################################
+# Test -multi with several chunks in flight
+
+
+def test_gdalwarp_lib_multi_num_chunks_in_flight():
+
+    ref_ds = gdal.Warp('', '../gcore/data/utmsmall.tif',
+                       options='-f MEM -ts 400 400 -wm 0.1')
+    ref_cs = ref_ds.GetRasterBand(1).Checksum()
+
+    for num_chunks in ('2', '4', 'ALL_CPUS'):
+        ds = gdal.Warp('', '../gcore/data/utmsmall.tif',
+                       options='-f MEM -ts 400 400 -wm 0.1 -multi -wo NUM_THREADS=2 -wo NUM_CHUNKS_IN_FLIGHT=' + num_chunks)
+        assert ds.GetRasterBand(1).Checksum() == ref_cs, num_chunks
+
+    ds = gdal.Warp('', '../gcore/data/utmsmall.tif',
+                   format='MEM', width=400, height=400,
+                   warpMemoryLimit=100000, multithread=True,
+                   warpOptions=['NUM_CHUNKS_IN_FLIGHT=ALL_CPUS'])
+    assert ds.GetRasterBand(1).Checksum() == ref_cs
+
+###############################################################################
+# Test GDALWARP_TRANSFORMER_CACHE_DIR
+
+
+def test_gdalwarp_lib_transformer_cache():
+
+    cache_dir = '/vsimem/gdalwarp_lib_transformer_cache'
+    with gdaltest.config_option('GDALWARP_TRANSFORMER_CACHE_DIR', cache_dir):
+        ds = gdal.Warp('', '../gcore/data/byte.tif', format='MEM',
+                       dstSRS='EPSG:4326', errorThreshold=0)
+        cs1 = ds.GetRasterBand(1).Checksum()
+        files = gdal.ReadDir(cache_dir)
+        assert len(files) == 1 and files[0].endswith('.gtc')
+        cache_size = gdal.VSIStatL(cache_dir + '/' + files[0]).size
+
+        # Second run uses the cache
+        ds = gdal.Warp('', '../gcore/data/byte.tif', format='MEM',
+                       dstSRS='EPSG:4326', errorThreshold=0)
+        assert ds.GetRasterBand(1).Checksum() == cs1
+        assert gdal.ReadDir(cache_dir) == files
+        assert gdal.VSIStatL(cache_dir + '/' + files[0]).size == cache_size
+
+        # Move the origin of all cached rows out of the source raster: if
+        # the cache is used, nothing is warped.
+        row_size = 24 + 8 * ds.RasterXSize
+        f = gdal.VSIFOpenL(cache_dir + '/' + files[0], 'rb+')
+        for row in range(ds.RasterYSize):
+            gdal.VSIFSeekL(f, 20 + row * row_size, 0)
+            assert struct.unpack('=i', gdal.VSIFReadL(1, 4, f))[0] == 1
+            gdal.VSIFSeekL(f, 20 + row * row_size + 8, 0)
+            gdal.VSIFWriteL(struct.pack('=dd', -1e6, -1e6), 1, 16, f)
+        gdal.VSIFCloseL(f)
+        ds = gdal.Warp('', '../gcore/data/byte.tif', format='MEM',
+                       dstSRS='EPSG:4326', errorThreshold=0)
+        assert ds.GetRasterBand(1).Checksum() == 0
+
+        # Different target grid: different cache file
+        ds = gdal.Warp('', '../gcore/data/byte.tif', format='MEM',
+                       dstSRS='EPSG:4326', errorThreshold=0,
+                       width=40, height=40)
+        assert len(gdal.ReadDir(cache_dir)) == 2
+
+    ds = gdal.Warp('', '../gcore/data/byte.tif', format='MEM',
+                   dstSRS='EPSG:4326', errorThreshold=0)
+    assert ds.GetRasterBand(1).Checksum() == cs1
+
+    for f in gdal.ReadDir(cache_dir):
+        gdal.Unlink(cache_dir + '/' + f)
+
+    # A cache that cannot be created is only a warning
+    errors = []
+
+    def my_error_handler(err_type, err_no, err_msg):
+        errors.append(err_type)
+
+    with gdaltest.config_option('GDALWARP_TRANSFORMER_CACHE_DIR',
+                                '/i_do/not/exist'):
+        gdal.PushErrorHandler(my_error_handler)
+        ds = gdal.Warp('', '../gcore/data/byte.tif', format='MEM',
+                       dstSRS='EPSG:4326', errorThreshold=0)
+        gdal.PopErrorHandler()
+    assert gdal.CE_Warning in errors
+    assert gdal.CE_Failure not in errors
+    assert ds.GetRasterBand(1).Checksum() == cs1
+
+###############################################################################
+# Test that GDALWARP_TRANSFORMER_CACHE_DIR does not reuse a cache after the
+# geolocation arrays have been modified
+
+
+def test_gdalwarp_lib_transformer_cache_geoloc():
+
+    def create_geoloc_array(filename, data_type, values):
+        ds = gdal.GetDriverByName('GTiff').Create(filename, 20, 20, 1,
+                                                  data_type)
+        ds.GetRasterBand(1).WriteRaster(
+            0, 0, 20, 20, struct.pack('=400d', *values),
+            buf_type=gdal.GDT_Float64)
+        ds = None
+
+    lon = [-117.64 + 0.001 * (i % 20) for i in range(400)]
+    lat = [33.90 - 0.001 * (i // 20) for i in range(400)]
+    x_filename = '/vsimem/gdalwarp_lib_transformer_cache_geoloc_x.tif'
+    y_filename = '/vsimem/gdalwarp_lib_transformer_cache_geoloc_y.tif'
+    create_geoloc_array(x_filename, gdal.GDT_Float64, lon)
+    create_geoloc_array(y_filename, gdal.GDT_Float64, lat)
+
+    src_ds = gdal.Translate('', '../gcore/data/byte.tif', format='MEM')
+    src_ds.SetMetadata({'SRS': osr.SRS_WKT_WGS84_LAT_LONG,
+                        'X_DATASET': x_filename, 'X_BAND': '1',
+                        'Y_DATASET': y_filename, 'Y_BAND': '1',
+                        'PIXEL_OFFSET': '0', 'PIXEL_STEP': '1',
+                        'LINE_OFFSET': '0', 'LINE_STEP': '1'},
+                       'GEOLOCATION')
+
+    def warp():
+        return gdal.Warp('', src_ds, format='MEM', geoloc=True,
+                         dstSRS='EPSG:4326', errorThreshold=0,
+                         outputBounds=[-117.65, 33.87, -117.60, 33.91],
+                         width=50, height=40).GetRasterBand(1).Checksum()
+
+    cache_dir = '/vsimem/gdalwarp_lib_transformer_cache_geoloc'
+    with gdaltest.config_option('GDALWARP_TRANSFORMER_CACHE_DIR', cache_dir):
+        warp()
+        assert len(gdal.ReadDir(cache_dir)) == 1
+
+        # Same file name, but different size and content
+        create_geoloc_array(x_filename, gdal.GDT_Float32,
+                            [x + 0.01 for x in lon])
+        cs = warp()
+        assert len(gdal.ReadDir(cache_dir)) == 2
+    assert cs == warp()
+
+    for f in gdal.ReadDir(cache_dir):
+        gdal.Unlink(cache_dir + '/' + f)
+    gdal.Unlink(x_filename)
+    gdal.Unlink(y_filename)
+
 ###############################################################################
 # Cleanup
 
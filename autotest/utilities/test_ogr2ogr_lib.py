@@ -32,7 +32,7 @@
 import sys
 
 
-from osgeo import gdal, gdalconst, ogr
+from osgeo import gdal, gdalconst, ogr, osr
 import gdaltest
 import ogrtest
 import pytest
@@ -533,3 +533,136 @@ def test_ogr2ogr_lib_ct_no_srs():
     f = lyr.GetNextFeature()
     #f.DumpReadable()
     assert ogrtest.check_feature_geometry(f, "POLYGON ((-479819.84375 4765180.5,-479690.1875 4765259.5,-479647.0 4765369.5,-479730.375 4765400.5,-480039.03125 4765539.5,-480035.34375 4765558.5,-480159.78125 4765610.5,-480202.28125 4765482.0,-480365.0 4765015.5,-480389.6875 4764950.0,-480133.96875 4764856.5,-480080.28125 4764979.5,-480082.96875 4765049.5,-480088.8125 4765139.5,-480059.90625 4765239.5,-480019.71875 4765319.5,-479980.21875 4765409.5,-479909.875 4765370.0,-479859.875 4765270.0,-479819.84375 4765180.5))") == 0
+
+
+###############################################################################
+# Test -pipeline_threads
+
+
+@pytest.mark.parametrize('unordered', [False, True])
+def test_ogr2ogr_lib_pipeline_threads(unordered):
+
+    src_ds = gdal.GetDriverByName('Memory').Create('', 0, 0, 0, gdal.GDT_Unknown)
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    lyr = src_ds.CreateLayer('test', srs=srs)
+    lyr.CreateField(ogr.FieldDefn('id', ogr.OFTInteger))
+    for i in range(1000):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        f['id'] = i
+        if i % 10 == 0:
+            f.SetGeometry(ogr.CreateGeometryFromWkt('MULTIPOINT ((%d 49),(2 %d))' % (i % 90, i % 80)))
+        elif i % 10 != 1:
+            f.SetGeometry(ogr.CreateGeometryFromWkt('POINT (%d 49)' % (i % 90)))
+        lyr.CreateFeature(f)
+
+    def translate(options):
+        ds = gdal.VectorTranslate('', src_ds, format='Memory',
+                                  options=options + ['-t_srs', 'EPSG:32631',
+                                                     '-explodecollections',
+                                                     '-limit', '990'])
+        lyr = ds.GetLayer(0)
+        return [(f['id'], f.GetGeometryRef().ExportToWkt() if f.GetGeometryRef() else '') for f in lyr]
+
+    ref = translate([])
+    assert len(ref) == 990 + 99
+    options = ['-pipeline_threads', '4']
+    if unordered:
+        options += ['-pipeline_unordered']
+    got = translate(options)
+    if unordered:
+        got = sorted(got)
+        ref = sorted(ref)
+    assert got == ref
+
+###############################################################################
+# Test -layer_threads
+
+
+@pytest.mark.parametrize('out_format', ['ESRI Shapefile', 'GPKG'])
+def test_ogr2ogr_lib_layer_threads(out_format):
+
+    if gdal.GetDriverByName(out_format) is None:
+        pytest.skip()
+
+    src_ds = gdal.GetDriverByName('ESRI Shapefile').Create('/vsimem/src_layer_threads', 0, 0, 0, gdal.GDT_Unknown)
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    for i in range(5):
+        lyr = src_ds.CreateLayer('test%d' % i, srs=srs, geom_type=ogr.wkbPoint)
+        lyr.CreateField(ogr.FieldDefn('id', ogr.OFTInteger))
+        for j in range(100 * (i + 1)):
+            f = ogr.Feature(lyr.GetLayerDefn())
+            f['id'] = j
+            f.SetGeometry(ogr.CreateGeometryFromWkt('POINT (%d %d)' % (j % 90, i)))
+            lyr.CreateFeature(f)
+    src_ds = None
+
+    if out_format == 'GPKG':
+        dst_names = ['/vsimem/out_layer_threads_ref.gpkg', '/vsimem/out_layer_threads.gpkg']
+    else:
+        dst_names = ['/vsimem/out_layer_threads_ref', '/vsimem/out_layer_threads']
+
+    def translate(dst_name, **kwargs):
+        ds = gdal.VectorTranslate(dst_name, '/vsimem/src_layer_threads',
+                                  format=out_format, dstSRS='EPSG:32631',
+                                  where='id < 250', **kwargs)
+        assert ds is not None
+        ret = {}
+        for lyr in ds:
+            ret[lyr.GetName()] = [(f['id'], f.GetGeometryRef().ExportToWkt()) for f in lyr]
+        return ret
+
+    ref = translate(dst_names[0])
+    assert len(ref) == 5
+    got = translate(dst_names[1], layerThreads=3)
+    assert got == ref
+
+    for name in dst_names:
+        gdal.GetDriverByName(out_format).Delete(name)
+    gdal.GetDriverByName('ESRI Shapefile').Delete('/vsimem/src_layer_threads')
+
+###############################################################################
+# Test progress and cancellation with -layer_threads
+
+
+def test_ogr2ogr_lib_layer_threads_progress():
+
+    src_ds = gdal.GetDriverByName('ESRI Shapefile').Create('/vsimem/src_layer_threads_progress', 0, 0, 0, gdal.GDT_Unknown)
+    for i in range(5):
+        lyr = src_ds.CreateLayer('test%d' % i, geom_type=ogr.wkbPoint)
+        lyr.CreateField(ogr.FieldDefn('id', ogr.OFTInteger))
+        for j in range(100 * (i + 1)):
+            f = ogr.Feature(lyr.GetLayerDefn())
+            f['id'] = j
+            f.SetGeometry(ogr.CreateGeometryFromWkt('POINT (%d %d)' % (j % 90, i)))
+            lyr.CreateFeature(f)
+    src_ds = None
+
+    tab = [0]
+
+    def my_progress(pct, msg, user_data):
+        assert pct >= user_data[0]
+        user_data[0] = pct
+        return 1
+
+    ds = gdal.VectorTranslate('/vsimem/out_layer_threads_progress', '/vsimem/src_layer_threads_progress',
+                              format='ESRI Shapefile', layerThreads=3,
+                              callback=my_progress, callback_data=tab)
+    assert ds is not None
+    ds = None
+    assert tab[0] == pytest.approx(1.0, abs=1e-6)
+    gdal.GetDriverByName('ESRI Shapefile').Delete('/vsimem/out_layer_threads_progress')
+
+    def my_cancelling_progress(pct, msg, user_data):
+        return 0 if pct >= 0.3 else 1
+
+    with gdaltest.error_handler():
+        ds = gdal.VectorTranslate('/vsimem/out_layer_threads_progress', '/vsimem/src_layer_threads_progress',
+                                  format='ESRI Shapefile', layerThreads=3,
+                                  callback=my_cancelling_progress)
+    assert ds is None
+    assert gdal.GetLastErrorMsg() != ''
+
+    gdal.RmdirRecursive('/vsimem/out_layer_threads_progress')
+    gdal.GetDriverByName('ESRI Shapefile').Delete('/vsimem/src_layer_threads_progress')
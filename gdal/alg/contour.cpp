@@ -38,11 +38,17 @@
 #include "gdal.h"
 #include "gdal_alg.h"
 #include "cpl_conv.h"
+#include "cpl_multiproc.h"
 #include "cpl_string.h"
+#include "cpl_worker_thread_pool.h"
 #include "ogr_api.h"
 #include "ogr_srs_api.h"
 #include "ogr_geometry.h"
 
+#include <limits>
+#include <map>
+#include <memory>
+
 static CPLErr OGRPolygonContourWriter( double dfLevelMin, double dfLevelMax,
                                 const OGRMultiPolygon& multipoly,
                                 void *pInfo )
@@ -196,6 +202,329 @@ private:
     void *data_;
 };
 
+/************************************************************************/
+/*                      Contour generation by strips                    */
+/*                                                                      */
+/*      The raster is split into strips of lines, contoured in worker   */
+/*      threads. Lines reaching the boundary between two strips are     */
+/*      then joined in strip order, so that the written lines are the   */
+/*      same as with the single pass over the raster.                   */
+/************************************************************************/
+
+namespace marching_squares {
+
+// A line emitted while processing a strip
+struct ContourFragment
+{
+    double level = 0;
+    LineString ls = LineString();
+};
+
+// Line writer keeping the lines emitted by the segment merger of a strip
+struct ContourFragmentCollector
+{
+    void addLine( double level, LineString& ls, bool /*closed*/ )
+    {
+        fragments.push_back( ContourFragment() );
+        fragments.back().level = level;
+        fragments.back().ls.swap( ls );
+    }
+
+    std::vector<ContourFragment> fragments = {};
+};
+
+template <typename LevelGenerator>
+struct ContourStripJob
+{
+    CPL_DISALLOW_COPY_ASSIGN(ContourStripJob)
+
+    ContourStripJob() = default;
+
+    // inputs
+    GDALRasterBandH band = nullptr;
+    CPLMutex** ioMutex = nullptr;
+    const LevelGenerator* levels = nullptr;
+    bool hasNoData = false;
+    double noDataValue = 0;
+    int yOff = 0;
+    int ySize = 0;
+
+    // outputs
+    CPLErr err = CE_None;
+    std::vector<ContourFragment> fragments = {};
+
+    static void run( void* data )
+    {
+        ContourStripJob* job = static_cast<ContourStripJob*>( data );
+        try
+        {
+            job->process();
+        }
+        catch ( const std::bad_alloc& )
+        {
+            CPLError( CE_Failure, CPLE_OutOfMemory,
+                      "Out of memory in GDALContourGenerateEx()" );
+            job->err = CE_Failure;
+        }
+    }
+
+private:
+    void process()
+    {
+        const int width = GDALGetRasterBandXSize( band );
+        const int height = GDALGetRasterBandYSize( band );
+
+        // The line above the strip is needed to process the squares
+        // between this strip and the previous one.
+        const int firstLine = std::max( 0, yOff - 1 );
+        const int lineCount = yOff + ySize - firstLine;
+        std::vector<double> values( size_t(width) * lineCount );
+        {
+            CPLMutexHolderD( ioMutex );
+            err = GDALRasterIO( band, GF_Read, 0, firstLine, width, lineCount,
+                                &values[0], width, lineCount, GDT_Float64, 0, 0 );
+        }
+        if ( err != CE_None )
+            return;
+
+        ContourFragmentCollector collector;
+        {
+            // each thread uses its own copy of the level generator
+            LevelGenerator stripLevels( *levels );
+            SegmentMerger<ContourFragmentCollector, LevelGenerator> merger( collector, stripLevels, /* polygonize */ false );
+            ContourGenerator<decltype(merger), LevelGenerator> cg( width, height, hasNoData, noDataValue, merger, stripLevels );
+            const double* line = &values[0];
+            if ( yOff > 0 )
+            {
+                cg.setStartLine( yOff, line );
+                line += width;
+            }
+            for ( int i = 0; i < ySize; i++, line += width )
+                cg.feedLine( line );
+            // the destructor of the merger emits the lines still open
+        }
+        fragments.swap( collector.fragments );
+    }
+};
+
+// Joins the lines of consecutive strips that end on their common boundary,
+// and writes the lines that cannot be extended any more.
+class ContourStripStitcher
+{
+public:
+    ContourStripStitcher( GDALRingAppender& writer, int height )
+        : writer_( writer )
+        , height_( height )
+    {}
+
+    void addStrip( int yOff, int ySize, std::vector<ContourFragment>& fragments )
+    {
+        // pieces to join: the lines reaching the top of the strip from
+        // the previous strips, then the lines of the strip
+        std::vector<ContourFragment> pieces;
+        pieces.swap( pending_ );
+        for ( auto& fragment : fragments )
+            pieces.push_back( std::move( fragment ) );
+        fragments.clear();
+
+        // links between the ends of the pieces: 2 * piece index for the
+        // front, 2 * piece index + 1 for the back
+        const size_t count = pieces.size();
+        const size_t noLink = std::numeric_limits<size_t>::max();
+        std::vector<size_t> links( 2 * count, noLink );
+        if ( yOff > 0 )
+        {
+            const double seamY = yOff - .5;
+            std::map<std::pair<double, double>, size_t> seamEnds;
+            for ( size_t i = 0; i < count; i++ )
+            {
+                const LineString& ls = pieces[i].ls;
+                if ( ls.front() == ls.back() )
+                    continue;
+                for ( size_t end = 0; end < 2; end++ )
+                {
+                    const Point& p = end == 0 ? ls.front() : ls.back();
+                    if ( p.y != seamY )
+                        continue;
+                    const auto key = std::make_pair( pieces[i].level, p.x );
+                    const auto it = seamEnds.find( key );
+                    if ( it == seamEnds.end() )
+                        seamEnds[key] = 2 * i + end;
+                    else if ( links[it->second] == noLink )
+                    {
+                        links[it->second] = 2 * i + end;
+                        links[2 * i + end] = it->second;
+                    }
+                }
+            }
+        }
+
+        const bool lastStrip = yOff + ySize >= height_;
+        const double bottomY = yOff + ySize - .5;
+        std::vector<bool> visited( count, false );
+        for ( size_t i = 0; i < count; i++ )
+        {
+            if ( visited[i] )
+                continue;
+
+            // walk back to the first piece of the line, unless it is a ring
+            size_t entry = 2 * i;
+            while ( links[entry] != noLink && links[entry] / 2 != i )
+                entry = links[entry] ^ 1;
+            if ( links[entry] != noLink )
+                entry = 2 * i;
+
+            LineString line;
+            while ( true )
+            {
+                const size_t piece = entry / 2;
+                visited[piece] = true;
+                LineString& ls = pieces[piece].ls;
+                if ( entry % 2 == 1 )
+                    ls.reverse();
+                if ( !line.empty() )
+                    ls.pop_front(); // same as the last point of the line
+                line.splice( line.end(), ls );
+                const size_t next = links[entry ^ 1];
+                if ( next == noLink || visited[next / 2] )
+                    break;
+                entry = next;
+            }
+
+            if ( !lastStrip && !( line.front() == line.back() )
+                 && ( line.front().y == bottomY || line.back().y == bottomY ) )
+            {
+                pending_.push_back( ContourFragment() );
+                pending_.back().level = pieces[i].level;
+                pending_.back().ls.swap( line );
+            }
+            else
+            {
+                writer_.addLine( pieces[i].level, line, /* closed */ false );
+            }
+        }
+    }
+
+private:
+    CPL_DISALLOW_COPY_ASSIGN(ContourStripStitcher)
+
+    GDALRingAppender& writer_;
+    int height_;
+    // lines reaching the bottom of the last strip added
+    std::vector<ContourFragment> pending_ = {};
+};
+
+}
+
+/************************************************************************/
+/*                     GDALContourGenerateTiled()                       */
+/************************************************************************/
+
+template <typename LevelGenerator>
+static CPLErr GDALContourGenerateTiled( GDALRasterBandH hBand,
+                                        bool useNoData, double noDataValue,
+                                        const LevelGenerator& levels,
+                                        OGRContourWriterInfo* poInfo,
+                                        int nThreads, int nStripHeight,
+                                        GDALProgressFunc pfnProgress,
+                                        void *pProgressArg )
+{
+    using namespace marching_squares;
+
+    const int nYSize = GDALGetRasterBandYSize( hBand );
+    const int nStrips = (nYSize + nStripHeight - 1) / nStripHeight;
+
+    CPLWorkerThreadPool oPool;
+    if( !oPool.Setup( std::min(nThreads, nStrips), nullptr, nullptr ) )
+        return CE_Failure;
+
+    OGRLayerH hLayer = static_cast<OGRLayerH>(poInfo->hLayer);
+    const bool bUseTransactions =
+        OGR_L_TestCapability( hLayer, OLCTransactions ) != FALSE;
+
+    CPLMutex *hIOMutex = nullptr;
+    GDALRingAppender oAppender( OGRContourWriter, poInfo );
+    ContourStripStitcher oStitcher( oAppender, nYSize );
+
+    const int nBatchSize = oPool.GetThreadCount();
+    CPLErr eErr = CE_None;
+
+    try
+    {
+/* -------------------------------------------------------------------- */
+/*      Process the strips by batches of as many strips as threads,     */
+/*      and write the lines completed by each batch in a transaction.   */
+/* -------------------------------------------------------------------- */
+        for( int iStripStart = 0;
+             eErr == CE_None && iStripStart < nStrips;
+             iStripStart += nBatchSize )
+        {
+            const int nBatchStrips = std::min(nBatchSize, nStrips - iStripStart);
+            std::vector<std::unique_ptr<ContourStripJob<LevelGenerator>>> apoJobs;
+            std::vector<void*> apJobData;
+            for( int iStrip = iStripStart;
+                 iStrip < iStripStart + nBatchStrips;
+                 iStrip++ )
+            {
+                std::unique_ptr<ContourStripJob<LevelGenerator>> poJob(
+                    new ContourStripJob<LevelGenerator>() );
+                poJob->band = hBand;
+                poJob->ioMutex = &hIOMutex;
+                poJob->levels = &levels;
+                poJob->hasNoData = useNoData;
+                poJob->noDataValue = noDataValue;
+                poJob->yOff = iStrip * nStripHeight;
+                poJob->ySize = std::min(nStripHeight, nYSize - poJob->yOff);
+                apJobData.push_back( poJob.get() );
+                apoJobs.push_back( std::move(poJob) );
+            }
+
+            oPool.SubmitJobs( ContourStripJob<LevelGenerator>::run, apJobData );
+            oPool.WaitCompletion();
+
+            const bool bInTransaction = bUseTransactions &&
+                OGR_L_StartTransaction( hLayer ) == OGRERR_NONE;
+
+            for( int i = 0; eErr == CE_None && i < nBatchStrips; i++ )
+            {
+                eErr = apoJobs[i]->err;
+                if( eErr == CE_None )
+                {
+                    oStitcher.addStrip( apoJobs[i]->yOff, apoJobs[i]->ySize,
+                                        apoJobs[i]->fragments );
+                }
+
+                if( eErr == CE_None
+                    && !pfnProgress( (iStripStart + i + 1) /
+                                        static_cast<double>(nStrips),
+                                     "", pProgressArg ) )
+                {
+                    CPLError( CE_Failure, CPLE_UserInterrupt,
+                              "User terminated" );
+                    eErr = CE_Failure;
+                }
+            }
+
+            if( bInTransaction &&
+                OGR_L_CommitTransaction( hLayer ) != OGRERR_NONE )
+            {
+                eErr = CE_Failure;
+            }
+        }
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALContourGenerateEx()" );
+        eErr = CE_Failure;
+    }
+
+    if( hIOMutex )
+        CPLDestroyMutex( hIOMutex );
+
+    return eErr;
+}
+
 /************************************************************************/
 /* ==================================================================== */
 /*                   Additional C Callable Functions                    */
@@ -517,6 +846,22 @@ an averaged value from the two nearby points (in this case (12+3+5)/3).
  *
  * If YES, contour polygons will be created, rather than polygon lines.
  *
+ *   NUM_THREADS=n|ALL_CPUS
+ *
+ * (GDAL &gt;= 3.1) Number of worker threads. When greater than 1, the raster
+ * is processed by strips of lines in parallel, and the lines crossing the
+ * strip boundaries are joined afterwards. The lines written are the same as
+ * with a single thread, but may be written in a different order, and closed
+ * lines may start at a different point. The lines completed by each batch of
+ * strips are written in a transaction if the layer supports it.
+ * Only used in line contouring mode.
+ *
+ *   STRIP_HEIGHT=d
+ *
+ * (GDAL &gt;= 3.1) Height in lines of the strips processed in parallel.
+ * Defaults to about 16 million pixels per strip, between 16 and 1024 lines.
+ * Setting it also enables processing by strips with a single thread.
+ *
  *
  * @return CE_None on success or CE_Failure if an error occurs.
  */
@@ -592,6 +937,23 @@ CPLErr GDALContourGenerateEx( GDALRasterBandH hBand, void *hLayer,
 
     bool polygonize = CPLFetchBool( options, "POLYGONIZE", false );
 
+    int numThreads = 1;
+    opt = CSLFetchNameValue( options, "NUM_THREADS" );
+    if ( opt ) {
+        numThreads = EQUAL( opt, "ALL_CPUS" ) ? CPLGetNumCPUs() : atoi( opt );
+    }
+
+    // Aim at strips of about 16 million pixels by default
+    const int width = GDALGetRasterBandXSize( hBand );
+    const int height = GDALGetRasterBandYSize( hBand );
+    int stripHeight = std::max( 16, std::min( 1024, (1 << 24) / std::max( 1, width ) ) );
+    opt = CSLFetchNameValue( options, "STRIP_HEIGHT" );
+    if ( opt ) {
+        stripHeight = std::max( 1, atoi( opt ) );
+    }
+    const bool byStrips = !polygonize && height > stripHeight
+                          && ( numThreads > 1 || opt != nullptr );
+
     using namespace marching_squares;
 
     OGRContourWriterInfo oCWI;
@@ -638,6 +1000,22 @@ CPLErr GDALContourGenerateEx( GDALRasterBandH hBand, void *hLayer,
                 cg.process( pfnProgress, pProgressArg );
             }
         }
+        else if ( byStrips )
+        {
+            const int threads = std::max( 1, numThreads );
+            if ( ! fixedLevels.empty() ) {
+                FixedLevelRangeIterator levels( &fixedLevels[0], fixedLevels.size() );
+                return GDALContourGenerateTiled( hBand, useNoData, noDataValue, levels, &oCWI, threads, stripHeight, pfnProgress, pProgressArg );
+            }
+            else if ( expBase > 0.0 ) {
+                ExponentialLevelRangeIterator levels( expBase );
+                return GDALContourGenerateTiled( hBand, useNoData, noDataValue, levels, &oCWI, threads, stripHeight, pfnProgress, pProgressArg );
+            }
+            else {
+                IntervalLevelRangeIterator levels( contourBase, contourInterval );
+                return GDALContourGenerateTiled( hBand, useNoData, noDataValue, levels, &oCWI, threads, stripHeight, pfnProgress, pProgressArg );
+            }
+        }
         else
         {
             GDALRingAppender appender(OGRContourWriter, &oCWI);
@@ -248,6 +248,17 @@ int  CPL_DLL GDALApproxTransform(
     void *pTransformArg, int bDstToSrc, int nPointCount,
     double *x, double *y, double *z, int *panSuccess );
 
+/* Cached transformer */
+void CPL_DLL *
+GDALCreateCachedTransformer( GDALTransformerFunc pfnBaseTransformer,
+                             void *pBaseTransformArg,
+                             int nDstXSize, int nDstYSize,
+                             const char *pszCacheDir );
+void CPL_DLL GDALDestroyCachedTransformer( void *pTransformArg );
+int  CPL_DLL GDALCachedTransform(
+    void *pTransformArg, int bDstToSrc, int nPointCount,
+    double *x, double *y, double *z, int *panSuccess );
+
 int CPL_DLL CPL_STDCALL
 GDALSimpleImageWarp( GDALDatasetH hSrcDS,
                      GDALDatasetH hDstDS,
@@ -34,6 +34,8 @@
 
 #ifndef DOXYGEN_SKIP
 
+#include <memory>
+
 #include "gdal_alg.h"
 #include "ogr_spatialref.h"
 
@@ -183,7 +185,8 @@ GDALComputeMedianCutPCTInternal( GDALRasterBandH hRed,
                                  T* panHistogram,
                                  GDALColorTableH hColorTable,
                                  GDALProgressFunc pfnProgress,
-                                 void * pProgressArg );
+                                 void * pProgressArg,
+                                 int nThreads = 1 );
 
 int GDALDitherRGB2PCTInternal( GDALRasterBandH hRed,
                                GDALRasterBandH hGreen,
@@ -194,7 +197,8 @@ int GDALDitherRGB2PCTInternal( GDALRasterBandH hRed,
                                GInt16* pasDynamicColorMap,
                                int bDither,
                                GDALProgressFunc pfnProgress,
-                               void * pProgressArg );
+                               void * pProgressArg,
+                               int nThreads = 1 );
 
 #define PRIME_FOR_65536 98317
 
@@ -241,6 +245,17 @@ bool GDALComputeAreaOfInterest(OGRSpatialReference* poSRS,
                                double& dfEastLongitudeDeg,
                                double& dfNorthLatitudeDeg );
 
+class GDALPreparedCutline;
+
+std::shared_ptr<GDALPreparedCutline>
+GDALCreatePreparedCutline( OGRGeometryH hCutline );
+
+CPLErr
+GDALWarpCutlineMaskerEx( void *pMaskFuncArg, int nBandCount, GDALDataType eType,
+                         int nXOff, int nYOff, int nXSize, int nYSize,
+                         GByte ** /*ppImageData */,
+                         int bMaskIsFloat, void *pValidityMask,
+                         const GDALPreparedCutline *poPreparedCutline );
 
 #endif /* #ifndef DOXYGEN_SKIP */
 
@@ -34,12 +34,18 @@
 #include <cstdio>
 #include <cstring>
 #include <algorithm>
+#include <limits>
+#include <memory>
+#include <new>
+#include <utility>
+#include <vector>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
 #include "cpl_string.h"
 #include "gdal.h"
 #include "gdal_alg.h"
+#include "gdal_alg_priv.h"
 #include "ogr_api.h"
 #include "ogr_core.h"
 #include "ogr_geometry.h"
@@ -257,6 +263,327 @@ static int CutlineTransformer( void *pTransformArg,
     return TRUE;
 }
 
+/************************************************************************/
+/*                          RasterizeCutline()                          */
+/*                                                                      */
+/*      Burn the cutline into pabyPolyMask with GDALRasterizeGeometries */
+/*      through a memory dataset wrapping it.                           */
+/************************************************************************/
+
+static CPLErr RasterizeCutline( GDALWarpOptions *psWO, OGRGeometryH hPolygon,
+                                int nXOff, int nYOff, int nXSize, int nYSize,
+                                GByte *pabyPolyMask )
+{
+    GDALDriverH hMemDriver = GDALGetDriverByName("MEM");
+    if( hMemDriver == nullptr )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "GDALWarpCutlineMasker needs MEM driver");
+        return CE_Failure;
+    }
+
+    char szDataPointer[100] = {};
+
+    // cppcheck-suppress redundantCopy
+    snprintf( szDataPointer, sizeof(szDataPointer), "DATAPOINTER=" );
+    CPLPrintPointer(
+        szDataPointer+strlen(szDataPointer),
+        pabyPolyMask,
+        static_cast<int>(sizeof(szDataPointer) - strlen(szDataPointer)) );
+
+    GDALDatasetH hMemDS = GDALCreate( hMemDriver, "warp_temp",
+                                      nXSize, nYSize, 0, GDT_Byte, nullptr );
+    char *apszOptions[] = { szDataPointer, nullptr };
+    GDALAddBand( hMemDS, GDT_Byte, apszOptions );
+
+    double adfGeoTransform[6] = { 0.0, 1.0, 0.0, 0.0, 0.0, 1.0 };
+    GDALSetGeoTransform( hMemDS, adfGeoTransform );
+
+/* -------------------------------------------------------------------- */
+/*      Burn the polygon into the mask with 1.0 values.                 */
+/* -------------------------------------------------------------------- */
+    int nTargetBand = 1;
+    double dfBurnValue = 255.0;
+    char **papszRasterizeOptions = nullptr;
+
+    if( CPLFetchBool( psWO->papszWarpOptions, "CUTLINE_ALL_TOUCHED", false ))
+        papszRasterizeOptions =
+            CSLSetNameValue( papszRasterizeOptions, "ALL_TOUCHED", "TRUE" );
+
+    int anXYOff[2] = { nXOff, nYOff };
+
+    CPLErr eErr =
+        GDALRasterizeGeometries( hMemDS, 1, &nTargetBand,
+                                 1, &hPolygon,
+                                 CutlineTransformer, anXYOff,
+                                 &dfBurnValue, papszRasterizeOptions,
+                                 nullptr, nullptr );
+
+    CSLDestroy( papszRasterizeOptions );
+
+    // Close and ensure data flushed to underlying array.
+    GDALClose( hMemDS );
+
+    return eErr;
+}
+
+/************************************************************************/
+/*                         GDALPreparedCutline                          */
+/*                                                                      */
+/*      Edges of the cutline rings, indexed by bands of source lines,   */
+/*      so that the mask of a chunk can be computed by scanline         */
+/*      intersection without rasterizing the whole cutline geometry.    */
+/*      The fill rules are the ones of GDALdllImageFilledPolygon(), so  */
+/*      the resulting mask is the same as with                         */
+/*      GDALRasterizeGeometries().                                      */
+/************************************************************************/
+
+class GDALPreparedCutline
+{
+    // Edge from (dfX1, dfY1) to (dfX2, dfY2), in the order in which
+    // GDALdllImageFilledPolygon() sees it, that is to say with rings
+    // traversed backwards.
+    struct Edge
+    {
+        double dfX1;
+        double dfY1;
+        double dfX2;
+        double dfY2;
+    };
+
+    std::vector<Edge> m_asEdges{};
+    int m_nFirstLine = 0;
+    int m_nBandHeight = 1;
+    std::vector<std::vector<int>> m_aanBandEdges{};
+
+    void CollectEdges( const OGRGeometry *poGeom );
+
+  public:
+    explicit GDALPreparedCutline( const OGRGeometry *poCutline );
+
+    int GetEdgeCount() const { return static_cast<int>(m_asEdges.size()); }
+    void FillMask( int nXOff, int nYOff, int nXSize, int nYSize,
+                   GByte *pabyPolyMask ) const;
+};
+
+/************************************************************************/
+/*                            CollectEdges()                            */
+/************************************************************************/
+
+void GDALPreparedCutline::CollectEdges( const OGRGeometry *poGeom )
+{
+    if( poGeom == nullptr || poGeom->IsEmpty() )
+        return;
+
+    const OGRwkbGeometryType eFlatType = wkbFlatten(poGeom->getGeometryType());
+    if( eFlatType == wkbPolygon )
+    {
+        const OGRPolygon *poPolygon = poGeom->toPolygon();
+        for( const auto *poRing : *poPolygon )
+        {
+            if( poRing->IsEmpty() )
+                continue;
+            const int nCount = poRing->getNumPoints();
+            for( int i = 0; i < nCount; i++ )
+            {
+                // The rasterizer reverses the ring, so the edge between
+                // points i and i+1 is walked from i+1 to i.
+                const int iNext = (i + 1 == nCount) ? 0 : i + 1;
+                Edge sEdge;
+                sEdge.dfX1 = poRing->getX(iNext);
+                sEdge.dfY1 = poRing->getY(iNext);
+                sEdge.dfX2 = poRing->getX(i);
+                sEdge.dfY2 = poRing->getY(i);
+                m_asEdges.push_back(sEdge);
+            }
+        }
+    }
+    else if( eFlatType == wkbMultiPolygon )
+    {
+        for( const auto *poSubGeom : *(poGeom->toMultiPolygon()) )
+            CollectEdges( poSubGeom );
+    }
+}
+
+/************************************************************************/
+/*                        GDALPreparedCutline()                         */
+/************************************************************************/
+
+GDALPreparedCutline::GDALPreparedCutline( const OGRGeometry *poCutline )
+{
+    CollectEdges( poCutline );
+
+/* -------------------------------------------------------------------- */
+/*      Only keep the edges that can contribute to the mask: those      */
+/*      that cross the center of a line, and the horizontal ones        */
+/*      walked from right to left that lie on the center of a line.     */
+/*      A small tolerance keeps the edges whose status could change     */
+/*      once shifted relative to a chunk.                               */
+/* -------------------------------------------------------------------- */
+    const double dfMaxLine = std::numeric_limits<int>::max() / 2;
+    std::vector<Edge> asKeptEdges;
+    std::vector<std::pair<int, int>> anEdgeLines;
+    int nMinLine = std::numeric_limits<int>::max();
+    int nMaxLine = std::numeric_limits<int>::min();
+    for( const auto& sEdge : m_asEdges )
+    {
+        if( !std::isfinite(sEdge.dfX1) || !std::isfinite(sEdge.dfY1) ||
+            !std::isfinite(sEdge.dfX2) || !std::isfinite(sEdge.dfY2) )
+            continue;
+        if( sEdge.dfY1 == sEdge.dfY2 && sEdge.dfX1 <= sEdge.dfX2 )
+            continue;
+        const double dfMinY = std::min(sEdge.dfY1, sEdge.dfY2);
+        const double dfMaxY = std::max(sEdge.dfY1, sEdge.dfY2);
+        const double dfEps =
+            1e-10 * std::max(1.0, std::max(fabs(dfMinY), fabs(dfMaxY)));
+        const double dfFirstLine = std::max(-dfMaxLine,
+                                        ceil(dfMinY - dfEps - 0.5));
+        const double dfLastLine = std::min(dfMaxLine,
+                                        floor(dfMaxY + dfEps - 0.5));
+        if( dfFirstLine > dfLastLine )
+            continue;
+        asKeptEdges.push_back(sEdge);
+        anEdgeLines.emplace_back(static_cast<int>(dfFirstLine),
+                                 static_cast<int>(dfLastLine));
+        nMinLine = std::min(nMinLine, anEdgeLines.back().first);
+        nMaxLine = std::max(nMaxLine, anEdgeLines.back().second);
+    }
+    m_asEdges = std::move(asKeptEdges);
+    if( m_asEdges.empty() )
+        return;
+
+/* -------------------------------------------------------------------- */
+/*      Index the edges by bands of lines.                              */
+/* -------------------------------------------------------------------- */
+    const GIntBig nLines = static_cast<GIntBig>(nMaxLine) - nMinLine + 1;
+    const int nMaxBands = 65536;
+    m_nFirstLine = nMinLine;
+    m_nBandHeight = static_cast<int>(
+        std::max(static_cast<GIntBig>(16), (nLines + nMaxBands - 1) / nMaxBands));
+    m_aanBandEdges.resize(
+        static_cast<size_t>((nLines + m_nBandHeight - 1) / m_nBandHeight));
+    for( size_t i = 0; i < m_asEdges.size(); i++ )
+    {
+        const int iFirstBand =
+            (anEdgeLines[i].first - m_nFirstLine) / m_nBandHeight;
+        const int iLastBand =
+            (anEdgeLines[i].second - m_nFirstLine) / m_nBandHeight;
+        for( int iBand = iFirstBand; iBand <= iLastBand; iBand++ )
+            m_aanBandEdges[iBand].push_back(static_cast<int>(i));
+    }
+}
+
+/************************************************************************/
+/*                              FillMask()                              */
+/*                                                                      */
+/*      Burn 255 into the pixels of the nXSize x nYSize chunk at        */
+/*      (nXOff, nYOff) whose center is inside the cutline.              */
+/************************************************************************/
+
+void GDALPreparedCutline::FillMask( int nXOff, int nYOff,
+                                    int nXSize, int nYSize,
+                                    GByte *pabyPolyMask ) const
+{
+    const auto BurnSpan = [pabyPolyMask, nXSize](int iY, int nXStart,
+                                                 int nXEnd)
+    {
+        if( nXStart > nXEnd )
+            return;
+        nXStart = std::max(nXStart, 0);
+        nXEnd = std::min(nXEnd, nXSize - 1);
+        if( nXStart > nXEnd )
+            return;
+        memset( pabyPolyMask + static_cast<size_t>(iY) * nXSize + nXStart,
+                255, nXEnd - nXStart + 1 );
+    };
+
+    const int nMaxX = nXSize - 1;
+    std::vector<int> anInts;
+    for( int iY = 0; iY < nYSize; iY++ )
+    {
+        const GIntBig iBand =
+            (static_cast<GIntBig>(iY) + nYOff - m_nFirstLine) / m_nBandHeight;
+        if( static_cast<GIntBig>(iY) + nYOff < m_nFirstLine ||
+            iBand >= static_cast<GIntBig>(m_aanBandEdges.size()) )
+            continue;
+
+        // Same computations as GDALdllImageFilledPolygon() on the cutline
+        // shifted relative to the chunk.
+        const double dfY = iY + 0.5;
+        anInts.clear();
+        for( const int iEdge : m_aanBandEdges[static_cast<size_t>(iBand)] )
+        {
+            const Edge& sEdge = m_asEdges[iEdge];
+            double dfY1 = sEdge.dfY1 - nYOff;
+            double dfY2 = sEdge.dfY2 - nYOff;
+            if( (dfY1 < dfY && dfY2 < dfY) || (dfY1 > dfY && dfY2 > dfY) )
+                continue;
+
+            double dfX1 = sEdge.dfX1 - nXOff;
+            double dfX2 = sEdge.dfX2 - nXOff;
+            if( dfY1 > dfY2 )
+            {
+                std::swap(dfY1, dfY2);
+                std::swap(dfX1, dfX2);
+            }
+            else if( dfY1 == dfY2 )
+            {
+                // Horizontal segments are filled separately.
+                if( dfX1 > dfX2 )
+                {
+                    const int nX1 = static_cast<int>(floor(dfX2 + 0.5));
+                    const int nX2 = static_cast<int>(floor(dfX1 + 0.5));
+                    if( nX1 <= nMaxX && nX2 > 0 )
+                        BurnSpan(iY, nX1, nX2 - 1);
+                }
+                continue;
+            }
+
+            if( dfY < dfY2 && dfY >= dfY1 )
+            {
+                const double dfIntersect =
+                    (dfY - dfY1) * (dfX2 - dfX1) / (dfY2 - dfY1) + dfX1;
+                anInts.push_back(static_cast<int>(floor(dfIntersect + 0.5)));
+            }
+        }
+
+        std::sort(anInts.begin(), anInts.end());
+        for( size_t i = 0; i + 1 < anInts.size(); i += 2 )
+        {
+            if( anInts[i] <= nMaxX && anInts[i+1] > 0 )
+                BurnSpan(iY, anInts[i], anInts[i+1] - 1);
+        }
+    }
+}
+
+/************************************************************************/
+/*                     GDALCreatePreparedCutline()                      */
+/*                                                                      */
+/*      Prepare a cutline for GDALWarpCutlineMaskerEx(). The caller     */
+/*      keeps it for the masking of all the chunks of a warping         */
+/*      operation.                                                      */
+/************************************************************************/
+
+std::shared_ptr<GDALPreparedCutline>
+GDALCreatePreparedCutline( OGRGeometryH hCutline )
+{
+    std::shared_ptr<GDALPreparedCutline> poPrepared;
+    try
+    {
+        poPrepared = std::make_shared<GDALPreparedCutline>(
+            reinterpret_cast<OGRGeometry *>(hCutline));
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALCreatePreparedCutline()" );
+        return nullptr;
+    }
+    CPLDebug( "WARP", "Prepared cutline with %d edges",
+              poPrepared->GetEdgeCount() );
+    return poPrepared;
+}
+
 /************************************************************************/
 /*                       GDALWarpCutlineMasker()                        */
 /*                                                                      */
@@ -266,12 +593,36 @@ static int CutlineTransformer( void *pTransformArg,
 
 CPLErr
 GDALWarpCutlineMasker( void *pMaskFuncArg,
-                       int /* nBandCount */,
-                       GDALDataType /* eType */,
+                       int nBandCount,
+                       GDALDataType eType,
                        int nXOff, int nYOff, int nXSize, int nYSize,
-                       GByte ** /*ppImageData */,
+                       GByte **ppImageData,
                        int bMaskIsFloat, void *pValidityMask )
 
+{
+    return GDALWarpCutlineMaskerEx( pMaskFuncArg, nBandCount, eType,
+                                    nXOff, nYOff, nXSize, nYSize,
+                                    ppImageData,
+                                    bMaskIsFloat, pValidityMask, nullptr );
+}
+
+/************************************************************************/
+/*                      GDALWarpCutlineMaskerEx()                       */
+/*                                                                      */
+/*      Same as GDALWarpCutlineMasker(), but computing the polygon      */
+/*      mask from poPreparedCutline when it is provided, instead of     */
+/*      rasterizing the cutline geometry.                               */
+/************************************************************************/
+
+CPLErr
+GDALWarpCutlineMaskerEx( void *pMaskFuncArg,
+                         int /* nBandCount */,
+                         GDALDataType /* eType */,
+                         int nXOff, int nYOff, int nXSize, int nYSize,
+                         GByte ** /*ppImageData */,
+                         int bMaskIsFloat, void *pValidityMask,
+                         const GDALPreparedCutline *poPreparedCutline )
+
 {
     if( nXSize < 1 || nYSize < 1 )
         return CE_None;
@@ -293,14 +644,6 @@ GDALWarpCutlineMasker( void *pMaskFuncArg,
         return CE_Failure;
     }
 
-    GDALDriverH hMemDriver = GDALGetDriverByName("MEM");
-    if( hMemDriver == nullptr )
-    {
-        CPLError(CE_Failure, CPLE_AppDefined,
-                 "GDALWarpCutlineMasker needs MEM driver");
-        return CE_Failure;
-    }
-
 /* -------------------------------------------------------------------- */
 /*      Check the polygon.                                              */
 /* -------------------------------------------------------------------- */
@@ -331,52 +674,21 @@ GDALWarpCutlineMasker( void *pMaskFuncArg,
     }
 
 /* -------------------------------------------------------------------- */
-/*      Create a byte buffer into which we can burn the                 */
-/*      mask polygon and wrap it up as a memory dataset.                */
+/*      Create a byte buffer into which we can burn the mask polygon.   */
 /* -------------------------------------------------------------------- */
     GByte *pabyPolyMask = static_cast<GByte *>(CPLCalloc(nXSize, nYSize));
 
-    char szDataPointer[100] = {};
-
-    // cppcheck-suppress redundantCopy
-    snprintf( szDataPointer, sizeof(szDataPointer), "DATAPOINTER=" );
-    CPLPrintPointer(
-        szDataPointer+strlen(szDataPointer),
-        pabyPolyMask,
-        static_cast<int>(sizeof(szDataPointer) - strlen(szDataPointer)) );
-
-    GDALDatasetH hMemDS = GDALCreate( hMemDriver, "warp_temp",
-                                      nXSize, nYSize, 0, GDT_Byte, nullptr );
-    char *apszOptions[] = { szDataPointer, nullptr };
-    GDALAddBand( hMemDS, GDT_Byte, apszOptions );
-
-    double adfGeoTransform[6] = { 0.0, 1.0, 0.0, 0.0, 0.0, 1.0 };
-    GDALSetGeoTransform( hMemDS, adfGeoTransform );
-
-/* -------------------------------------------------------------------- */
-/*      Burn the polygon into the mask with 1.0 values.                 */
-/* -------------------------------------------------------------------- */
-    int nTargetBand = 1;
-    double dfBurnValue = 255.0;
-    char **papszRasterizeOptions = nullptr;
-
-    if( CPLFetchBool( psWO->papszWarpOptions, "CUTLINE_ALL_TOUCHED", false ))
-        papszRasterizeOptions =
-            CSLSetNameValue( papszRasterizeOptions, "ALL_TOUCHED", "TRUE" );
-
-    int anXYOff[2] = { nXOff, nYOff };
-
-    CPLErr eErr =
-        GDALRasterizeGeometries( hMemDS, 1, &nTargetBand,
-                                 1, &hPolygon,
-                                 CutlineTransformer, anXYOff,
-                                 &dfBurnValue, papszRasterizeOptions,
-                                 nullptr, nullptr );
-
-    CSLDestroy( papszRasterizeOptions );
-
-    // Close and ensure data flushed to underlying array.
-    GDALClose( hMemDS );
+    CPLErr eErr = CE_None;
+    if( poPreparedCutline != nullptr )
+    {
+        poPreparedCutline->FillMask( nXOff, nYOff, nXSize, nYSize,
+                                     pabyPolyMask );
+    }
+    else
+    {
+        eErr = RasterizeCutline( psWO, hPolygon, nXOff, nYOff, nXSize, nYSize,
+                                 pabyPolyMask );
+    }
 
 /* -------------------------------------------------------------------- */
 /*      In the case with no blend distance, we just apply this as a     */
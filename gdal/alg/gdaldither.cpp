@@ -53,11 +53,15 @@
 #include <cstdlib>
 #include <cstring>
 #include <algorithm>
+#include <new>
+#include <vector>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
+#include "cpl_multiproc.h"
 #include "cpl_progress.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 #include "gdal.h"
 #include "gdal_priv.h"
 
@@ -106,6 +110,265 @@ typedef struct
     GByte   nPadding;
 } ColorIndex;
 
+/************************************************************************/
+/*                           DitherScanline()                           */
+/*                                                                      */
+/*      Convert one line of RGB values to color indices, carrying the   */
+/*      error of the previous line from panError and storing the error  */
+/*      for the next line in it.                                        */
+/************************************************************************/
+
+template<class FindIndexFunc> static void
+DitherScanline( int nXSize, GByte *pabyRed, GByte *pabyGreen, GByte *pabyBlue,
+                GByte *pabyIndex, int *panError, int *anPCT, int bDither,
+                FindIndexFunc& pfnFindIndex )
+{
+/* -------------------------------------------------------------------- */
+/*      Apply the error from the previous line to this one.             */
+/* -------------------------------------------------------------------- */
+    if( bDither )
+    {
+      for( int i = 0; i < nXSize; i++ )
+      {
+          pabyRed[i] = static_cast<GByte>(
+              std::max(0, std::min(255, (pabyRed[i] + panError[i*3+0+3]))));
+          pabyGreen[i] = static_cast<GByte>(
+              std::max(0,
+                       std::min(255, (pabyGreen[i] + panError[i*3+1+3]))));
+          pabyBlue[i] = static_cast<GByte>(
+              std::max(0, std::min(255,
+                                   (pabyBlue[i] + panError[i*3+2+3]))));
+      }
+
+      memset( panError, 0, sizeof(int) * (nXSize+2) * 3 );
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Figure out the nearest color to the RGB value.                  */
+/* -------------------------------------------------------------------- */
+    int nLastRedError = 0;
+    int nLastGreenError = 0;
+    int nLastBlueError = 0;
+
+    for( int i = 0; i < nXSize; i++ )
+    {
+        const int nRedValue =
+            std::max(0, std::min(255, pabyRed[i] + nLastRedError));
+        const int nGreenValue =
+            std::max(0, std::min(255, pabyGreen[i] + nLastGreenError));
+        const int nBlueValue =
+            std::max(0, std::min(255, pabyBlue[i] + nLastBlueError));
+
+        const int iIndex =
+            pfnFindIndex(nRedValue, nGreenValue, nBlueValue);
+        pabyIndex[i] = static_cast<GByte>(iIndex);
+        if( !bDither )
+            continue;
+
+/* -------------------------------------------------------------------- */
+/*      Compute Red error, and carry it on to the next error line.      */
+/* -------------------------------------------------------------------- */
+        int nError = nRedValue - CAST_PCT(anPCT)[4 * iIndex + 0];
+        int nSixth = nError / 6;
+
+        panError[i * 3    ] += nSixth;
+        panError[i * 3 + 6] = nSixth;
+        panError[i * 3 + 3] += nError - 5 * nSixth;
+
+        nLastRedError = 2 * nSixth;
+
+/* -------------------------------------------------------------------- */
+/*      Compute Green error, and carry it on to the next error line.    */
+/* -------------------------------------------------------------------- */
+        nError = nGreenValue - CAST_PCT(anPCT)[4*iIndex+1];
+        nSixth = nError / 6;
+
+        panError[i * 3 + 1] += nSixth;
+        panError[i * 3 + 6 + 1] = nSixth;
+        panError[i * 3 + 3 + 1] += nError - 5 * nSixth;
+
+        nLastGreenError = 2 * nSixth;
+
+/* -------------------------------------------------------------------- */
+/*      Compute Blue error, and carry it on to the next error line.     */
+/* -------------------------------------------------------------------- */
+        nError = nBlueValue - CAST_PCT(anPCT)[4*iIndex+2];
+        nSixth = nError / 6;
+
+        panError[i * 3 + 2] += nSixth;
+        panError[i * 3 + 6 + 2] = nSixth;
+        panError[i * 3 + 3 + 2] += nError - 5 * nSixth;
+
+        nLastBlueError = 2 * nSixth;
+    }
+}
+
+/************************************************************************/
+/*                          GDALDitherStripJob                          */
+/************************************************************************/
+
+template<class FindIndexFunc> struct GDALDitherStripJob
+{
+    GDALRasterBandH  hRed = nullptr;
+    GDALRasterBandH  hGreen = nullptr;
+    GDALRasterBandH  hBlue = nullptr;
+    GDALRasterBandH  hTarget = nullptr;
+    CPLMutex       **phIOMutex = nullptr;
+    int             *anPCT = nullptr;
+    int              bDither = FALSE;
+    FindIndexFunc   *pfnFindIndex = nullptr;
+    int              nXSize = 0;
+    int              nYOff = 0;
+    int              nYCount = 0;
+    CPLErr           eErr = CE_None;
+
+    static void Run( void *pData );
+};
+
+template<class FindIndexFunc>
+void GDALDitherStripJob<FindIndexFunc>::Run( void *pData )
+{
+    GDALDitherStripJob<FindIndexFunc> *psJob =
+        static_cast<GDALDitherStripJob<FindIndexFunc> *>(pData);
+    try
+    {
+        const int nXSize = psJob->nXSize;
+        std::vector<GByte> abyRed(nXSize);
+        std::vector<GByte> abyGreen(nXSize);
+        std::vector<GByte> abyBlue(nXSize);
+        std::vector<GByte> abyIndex(nXSize);
+        std::vector<int> anError((nXSize + 2) * 3);
+
+        for( int iScanline = psJob->nYOff;
+             iScanline < psJob->nYOff + psJob->nYCount; iScanline++ )
+        {
+            {
+                CPLMutexHolderD( psJob->phIOMutex );
+                psJob->eErr = GDALRasterIO( psJob->hRed, GF_Read,
+                                            0, iScanline, nXSize, 1,
+                                            &abyRed[0],
+                                            nXSize, 1, GDT_Byte, 0, 0 );
+                if( psJob->eErr == CE_None )
+                    psJob->eErr = GDALRasterIO( psJob->hGreen, GF_Read,
+                                                0, iScanline, nXSize, 1,
+                                                &abyGreen[0],
+                                                nXSize, 1, GDT_Byte, 0, 0 );
+                if( psJob->eErr == CE_None )
+                    psJob->eErr = GDALRasterIO( psJob->hBlue, GF_Read,
+                                                0, iScanline, nXSize, 1,
+                                                &abyBlue[0],
+                                                nXSize, 1, GDT_Byte, 0, 0 );
+            }
+            if( psJob->eErr != CE_None )
+                return;
+
+            DitherScanline( nXSize, &abyRed[0], &abyGreen[0], &abyBlue[0],
+                            &abyIndex[0], &anError[0], psJob->anPCT,
+                            psJob->bDither, *(psJob->pfnFindIndex) );
+
+            {
+                CPLMutexHolderD( psJob->phIOMutex );
+                psJob->eErr = GDALRasterIO( psJob->hTarget, GF_Write,
+                                            0, iScanline, nXSize, 1,
+                                            &abyIndex[0],
+                                            nXSize, 1, GDT_Byte, 0, 0 );
+            }
+            if( psJob->eErr != CE_None )
+                return;
+        }
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALDitherRGB2PCT()" );
+        psJob->eErr = CE_Failure;
+    }
+}
+
+/************************************************************************/
+/*                           DitherByStrips()                           */
+/*                                                                      */
+/*      Dither the image by strips of DITHER_STRIP_HEIGHT lines in      */
+/*      worker threads. The error diffusion starts again at the top     */
+/*      of each strip. The strip height does not depend on the number   */
+/*      of threads, so neither does the result.                         */
+/************************************************************************/
+
+constexpr int DITHER_STRIP_HEIGHT = 256;
+
+template<class FindIndexFunc> static CPLErr
+DitherByStrips( GDALRasterBandH hRed,
+                GDALRasterBandH hGreen,
+                GDALRasterBandH hBlue,
+                GDALRasterBandH hTarget,
+                int *anPCT, int bDither,
+                FindIndexFunc& pfnFindIndex,
+                int nThreads,
+                GDALProgressFunc pfnProgress,
+                void *pProgressArg )
+{
+    const int nXSize = GDALGetRasterBandXSize( hRed );
+    const int nYSize = GDALGetRasterBandYSize( hRed );
+    const int nStrips =
+        (nYSize + DITHER_STRIP_HEIGHT - 1) / DITHER_STRIP_HEIGHT;
+
+    CPLWorkerThreadPool oPool;
+    if( !oPool.Setup( std::min(nThreads, nStrips), nullptr, nullptr ) )
+        return CE_Failure;
+
+    CPLMutex *hIOMutex = nullptr;
+    const int nBatchSize = oPool.GetThreadCount();
+    CPLErr eErr = CE_None;
+
+    // Process the strips by batches of as many strips as threads, to
+    // bound the memory in use.
+    for( int iStripStart = 0;
+         eErr == CE_None && iStripStart < nStrips;
+         iStripStart += nBatchSize )
+    {
+        const int nBatchStrips = std::min(nBatchSize, nStrips - iStripStart);
+        std::vector<GDALDitherStripJob<FindIndexFunc>> asJobs(nBatchStrips);
+        std::vector<void*> apJobData;
+        for( int i = 0; i < nBatchStrips; i++ )
+        {
+            asJobs[i].hRed = hRed;
+            asJobs[i].hGreen = hGreen;
+            asJobs[i].hBlue = hBlue;
+            asJobs[i].hTarget = hTarget;
+            asJobs[i].phIOMutex = &hIOMutex;
+            asJobs[i].anPCT = anPCT;
+            asJobs[i].bDither = bDither;
+            asJobs[i].pfnFindIndex = &pfnFindIndex;
+            asJobs[i].nXSize = nXSize;
+            asJobs[i].nYOff = (iStripStart + i) * DITHER_STRIP_HEIGHT;
+            asJobs[i].nYCount = std::min(DITHER_STRIP_HEIGHT,
+                                         nYSize - asJobs[i].nYOff);
+            apJobData.push_back(&asJobs[i]);
+        }
+
+        oPool.SubmitJobs( GDALDitherStripJob<FindIndexFunc>::Run, apJobData );
+        oPool.WaitCompletion();
+
+        for( int i = 0; eErr == CE_None && i < nBatchStrips; i++ )
+        {
+            eErr = asJobs[i].eErr;
+            if( eErr == CE_None &&
+                !pfnProgress( 1.0 * (asJobs[i].nYOff + asJobs[i].nYCount) /
+                                                                    nYSize,
+                              nullptr, pProgressArg ) )
+            {
+                CPLError( CE_Failure, CPLE_UserInterrupt, "User Terminated" );
+                eErr = CE_Failure;
+            }
+        }
+    }
+
+    if( hIOMutex )
+        CPLDestroyMutex( hIOMutex );
+
+    return eErr;
+}
+
 /************************************************************************/
 /*                         GDALDitherRGB2PCT()                          */
 /************************************************************************/
@@ -134,6 +397,14 @@ typedef struct
  * GDALProgressFunc() semantics.  May be NULL.
  * @param pProgressArg callback argument passed to pfnProgress.
  *
+ * Starting with GDAL 3.1, the GDAL_DITHER_NUM_THREADS configuration option
+ * can be set to a number of threads, or ALL_CPUS, to dither the image by
+ * strips of 256 lines in worker threads. The error diffusion then starts again
+ * at the top of each strip, so the result slightly differs from the
+ * single-threaded one along the strip boundaries, but does not depend on the
+ * number of threads. As the result changes, the generic GDAL_NUM_THREADS
+ * option is not used.
+ *
  * @return CE_None on success or CE_Failure if an error occurs.
  */
 
@@ -147,9 +418,14 @@ GDALDitherRGB2PCT( GDALRasterBandH hRed,
                    void * pProgressArg )
 
 {
+    const char* pszThreads =
+        CPLGetConfigOption("GDAL_DITHER_NUM_THREADS", "1");
+    const int nThreads = EQUAL(pszThreads, "ALL_CPUS") ? CPLGetNumCPUs() :
+                                                         atoi(pszThreads);
+
     return GDALDitherRGB2PCTInternal( hRed, hGreen, hBlue, hTarget,
                                       hColorTable, 5, nullptr, TRUE,
-                                      pfnProgress, pProgressArg );
+                                      pfnProgress, pProgressArg, nThreads );
 }
 
 int GDALDitherRGB2PCTInternal(
@@ -163,7 +439,8 @@ int GDALDitherRGB2PCTInternal(
     GInt16* pasDynamicColorMap,
     int bDither,
     GDALProgressFunc pfnProgress,
-    void* pProgressArg )
+    void* pProgressArg,
+    int nThreads )
 {
     VALIDATE_POINTER1( hRed, "GDALDitherRGB2PCT", CE_Failure );
     VALIDATE_POINTER1( hGreen, "GDALDitherRGB2PCT", CE_Failure );
@@ -328,6 +605,134 @@ int GDALDitherRGB2PCTInternal(
         }
     }
 
+    const auto FindIndex = [&](int nRedValue, int nGreenValue,
+                               int nBlueValue)
+    {
+        int iIndex = 0;
+        if( psColorIndexMap )
+        {
+            const GUInt32 nColorCode =
+                MAKE_COLOR_CODE(nRedValue, nGreenValue, nBlueValue);
+            GUInt32 nIdx = nColorCode % PRIME_FOR_65536;
+            while( true )
+            {
+                if( psColorIndexMap[nIdx].nColorCode == nColorCode )
+                {
+                    iIndex = psColorIndexMap[nIdx].nIndex;
+                    break;
+                }
+                if( static_cast<int>(psColorIndexMap[nIdx].nColorCode) < 0 )
+                {
+                    psColorIndexMap[nIdx].nColorCode = nColorCode;
+                    iIndex = FindNearestColor(
+                        nColors, anPCT, nRedValue, nGreenValue, nBlueValue);
+                    psColorIndexMap[nIdx].nIndex =
+                        static_cast<GByte>(iIndex);
+                    break;
+                }
+                if( psColorIndexMap[nIdx].nColorCode2 == nColorCode )
+                {
+                    iIndex = psColorIndexMap[nIdx].nIndex2;
+                    break;
+                }
+                if( static_cast<int>(psColorIndexMap[nIdx].nColorCode2) <
+                    0 )
+                {
+                    psColorIndexMap[nIdx].nColorCode2 = nColorCode;
+                    iIndex = FindNearestColor(
+                        nColors, anPCT, nRedValue, nGreenValue, nBlueValue);
+                    psColorIndexMap[nIdx].nIndex2 =
+                        static_cast<GByte>(iIndex);
+                    break;
+                }
+                if( psColorIndexMap[nIdx].nColorCode3 == nColorCode )
+                {
+                    iIndex = psColorIndexMap[nIdx].nIndex3;
+                    break;
+                }
+                if( static_cast<int>(psColorIndexMap[nIdx].nColorCode3) <
+                    0 )
+                {
+                    psColorIndexMap[nIdx].nColorCode3 = nColorCode;
+                    iIndex = FindNearestColor( nColors, anPCT,
+                                               nRedValue, nGreenValue,
+                                               nBlueValue );
+                    psColorIndexMap[nIdx].nIndex3 =
+                        static_cast<GByte>(iIndex);
+                    break;
+                }
+
+                do
+                {
+                    nIdx+=257;
+                    if( nIdx >= PRIME_FOR_65536 )
+                        nIdx -= PRIME_FOR_65536;
+                }
+                while( static_cast<int>(psColorIndexMap[nIdx].nColorCode)
+                       >= 0 &&
+                       psColorIndexMap[nIdx].nColorCode != nColorCode &&
+                       static_cast<int>(psColorIndexMap[nIdx].nColorCode2)
+                       >= 0 &&
+                       psColorIndexMap[nIdx].nColorCode2 != nColorCode&&
+                       static_cast<int>(psColorIndexMap[nIdx].nColorCode3)
+                       >= 0 &&
+                       psColorIndexMap[nIdx].nColorCode3 != nColorCode );
+            }
+        }
+        else if( pasDynamicColorMap == nullptr )
+        {
+            const int iRed   = nRedValue *   nCLevels / 256;
+            const int iGreen = nGreenValue * nCLevels / 256;
+            const int iBlue  = nBlueValue *  nCLevels / 256;
+
+            iIndex = pabyColorMap[iRed + iGreen * nCLevels
+                                  + iBlue * nCLevels * nCLevels];
+        }
+        else
+        {
+            const GUInt32 nColorCode =
+                MAKE_COLOR_CODE(nRedValue, nGreenValue, nBlueValue);
+            GInt16* psIndex = &pasDynamicColorMap[nColorCode];
+            if( *psIndex < 0 )
+            {
+                *psIndex = static_cast<GInt16>(
+                    FindNearestColor( nColors, anPCT,
+                                      nRedValue,
+                                      nGreenValue,
+                                      nBlueValue ));
+                iIndex = *psIndex;
+            }
+            else
+            {
+                iIndex = *psIndex;
+            }
+        }
+        return iIndex;
+    };
+
+/* -------------------------------------------------------------------- */
+/*      With several threads and the static color map, which is only   */
+/*      read, dither by strips.                                         */
+/* -------------------------------------------------------------------- */
+    if( nThreads > 1 && pabyColorMap != nullptr )
+    {
+        const CPLErr eErr = DitherByStrips( hRed, hGreen, hBlue, hTarget,
+                                            anPCT, bDither, FindIndex,
+                                            nThreads,
+                                            pfnProgress, pProgressArg );
+        if( eErr == CE_None )
+            pfnProgress( 1.0, nullptr, pProgressArg );
+
+        CPLFree( pabyRed );
+        CPLFree( pabyGreen );
+        CPLFree( pabyBlue );
+        CPLFree( pabyIndex );
+        CPLFree( panError );
+        CPLFree( pabyColorMap );
+
+        return eErr;
+    }
+
 /* ==================================================================== */
 /*      Loop over all scanlines of data to process.                     */
 /* ==================================================================== */
@@ -376,184 +781,8 @@ int GDALDitherRGB2PCTInternal(
             return err1;
         }
 
-/* -------------------------------------------------------------------- */
-/*      Apply the error from the previous line to this one.             */
-/* -------------------------------------------------------------------- */
-        if( bDither )
-        {
-          for( int i = 0; i < nXSize; i++ )
-          {
-              pabyRed[i] = static_cast<GByte>(
-                  std::max(0, std::min(255, (pabyRed[i] + panError[i*3+0+3]))));
-              pabyGreen[i] = static_cast<GByte>(
-                  std::max(0,
-                           std::min(255, (pabyGreen[i] + panError[i*3+1+3]))));
-              pabyBlue[i] = static_cast<GByte>(
-                  std::max(0, std::min(255,
-                                       (pabyBlue[i] + panError[i*3+2+3]))));
-          }
-
-          memset( panError, 0, sizeof(int) * (nXSize+2) * 3 );
-        }
-
-/* -------------------------------------------------------------------- */
-/*      Figure out the nearest color to the RGB value.                  */
-/* -------------------------------------------------------------------- */
-        int nLastRedError = 0;
-        int nLastGreenError = 0;
-        int nLastBlueError = 0;
-
-        for( int i = 0; i < nXSize; i++ )
-        {
-            const int nRedValue =
-                std::max(0, std::min(255, pabyRed[i] + nLastRedError));
-            const int nGreenValue =
-                std::max(0, std::min(255, pabyGreen[i] + nLastGreenError));
-            const int nBlueValue =
-                std::max(0, std::min(255, pabyBlue[i] + nLastBlueError));
-
-            int iIndex = 0;
-            int nError = 0;
-            int nSixth = 0;
-            if( psColorIndexMap )
-            {
-                const GUInt32 nColorCode =
-                    MAKE_COLOR_CODE(nRedValue, nGreenValue, nBlueValue);
-                GUInt32 nIdx = nColorCode % PRIME_FOR_65536;
-                while( true )
-                {
-                    if( psColorIndexMap[nIdx].nColorCode == nColorCode )
-                    {
-                        iIndex = psColorIndexMap[nIdx].nIndex;
-                        break;
-                    }
-                    if( static_cast<int>(psColorIndexMap[nIdx].nColorCode) < 0 )
-                    {
-                        psColorIndexMap[nIdx].nColorCode = nColorCode;
-                        iIndex = FindNearestColor(
-                            nColors, anPCT, nRedValue, nGreenValue, nBlueValue);
-                        psColorIndexMap[nIdx].nIndex =
-                            static_cast<GByte>(iIndex);
-                        break;
-                    }
-                    if( psColorIndexMap[nIdx].nColorCode2 == nColorCode )
-                    {
-                        iIndex = psColorIndexMap[nIdx].nIndex2;
-                        break;
-                    }
-                    if( static_cast<int>(psColorIndexMap[nIdx].nColorCode2) <
-                        0 )
-                    {
-                        psColorIndexMap[nIdx].nColorCode2 = nColorCode;
-                        iIndex = FindNearestColor(
-                            nColors, anPCT, nRedValue, nGreenValue, nBlueValue);
-                        psColorIndexMap[nIdx].nIndex2 =
-                            static_cast<GByte>(iIndex);
-                        break;
-                    }
-                    if( psColorIndexMap[nIdx].nColorCode3 == nColorCode )
-                    {
-                        iIndex = psColorIndexMap[nIdx].nIndex3;
-                        break;
-                    }
-                    if( static_cast<int>(psColorIndexMap[nIdx].nColorCode3) <
-                        0 )
-                    {
-                        psColorIndexMap[nIdx].nColorCode3 = nColorCode;
-                        iIndex = FindNearestColor( nColors, anPCT,
-                                                   nRedValue, nGreenValue,
-                                                   nBlueValue );
-                        psColorIndexMap[nIdx].nIndex3 =
-                            static_cast<GByte>(iIndex);
-                        break;
-                    }
-
-                    do
-                    {
-                        nIdx+=257;
-                        if( nIdx >= PRIME_FOR_65536 )
-                            nIdx -= PRIME_FOR_65536;
-                    }
-                    while( static_cast<int>(psColorIndexMap[nIdx].nColorCode)
-                           >= 0 &&
-                           psColorIndexMap[nIdx].nColorCode != nColorCode &&
-                           static_cast<int>(psColorIndexMap[nIdx].nColorCode2)
-                           >= 0 &&
-                           psColorIndexMap[nIdx].nColorCode2 != nColorCode&&
-                           static_cast<int>(psColorIndexMap[nIdx].nColorCode3)
-                           >= 0 &&
-                           psColorIndexMap[nIdx].nColorCode3 != nColorCode );
-                }
-            }
-            else if( pasDynamicColorMap == nullptr )
-            {
-                const int iRed   = nRedValue *   nCLevels / 256;
-                const int iGreen = nGreenValue * nCLevels / 256;
-                const int iBlue  = nBlueValue *  nCLevels / 256;
-
-                iIndex = pabyColorMap[iRed + iGreen * nCLevels
-                                      + iBlue * nCLevels * nCLevels];
-            }
-            else
-            {
-                const GUInt32 nColorCode =
-                    MAKE_COLOR_CODE(nRedValue, nGreenValue, nBlueValue);
-                GInt16* psIndex = &pasDynamicColorMap[nColorCode];
-                if( *psIndex < 0 )
-                {
-                    *psIndex = static_cast<GInt16>(
-                        FindNearestColor( nColors, anPCT,
-                                          nRedValue,
-                                          nGreenValue,
-                                          nBlueValue ));
-                    iIndex = *psIndex;
-                }
-                else
-                {
-                    iIndex = *psIndex;
-                }
-            }
-
-            pabyIndex[i] = static_cast<GByte>(iIndex);
-            if( !bDither )
-                continue;
-
-/* -------------------------------------------------------------------- */
-/*      Compute Red error, and carry it on to the next error line.      */
-/* -------------------------------------------------------------------- */
-            nError = nRedValue - CAST_PCT(anPCT)[4 * iIndex + 0];
-            nSixth = nError / 6;
-
-            panError[i * 3    ] += nSixth;
-            panError[i * 3 + 6] = nSixth;
-            panError[i * 3 + 3] += nError - 5 * nSixth;
-
-            nLastRedError = 2 * nSixth;
-
-/* -------------------------------------------------------------------- */
-/*      Compute Green error, and carry it on to the next error line.    */
-/* -------------------------------------------------------------------- */
-            nError = nGreenValue - CAST_PCT(anPCT)[4*iIndex+1];
-            nSixth = nError / 6;
-
-            panError[i * 3 + 1] += nSixth;
-            panError[i * 3 + 6 + 1] = nSixth;
-            panError[i * 3 + 3 + 1] += nError - 5 * nSixth;
-
-            nLastGreenError = 2 * nSixth;
-
-/* -------------------------------------------------------------------- */
-/*      Compute Blue error, and carry it on to the next error line.     */
-/* -------------------------------------------------------------------- */
-            nError = nBlueValue - CAST_PCT(anPCT)[4*iIndex+2];
-            nSixth = nError / 6;
-
-            panError[i * 3 + 2] += nSixth;
-            panError[i * 3 + 6 + 2] = nSixth;
-            panError[i * 3 + 3 + 2] += nError - 5 * nSixth;
-
-            nLastBlueError = 2 * nSixth;
-        }
+        DitherScanline( nXSize, pabyRed, pabyGreen, pabyBlue, pabyIndex,
+                        panError, anPCT, bDither, FindIndex );
 
 /* -------------------------------------------------------------------- */
 /*      Write results.                                                  */
@@ -45,11 +45,15 @@
 
 #include <algorithm>
 #include <limits>
+#include <new>
+#include <vector>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
+#include "cpl_multiproc.h"
 #include "cpl_progress.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 #include "gdal.h"
 #include "gdal_priv.h"
 
@@ -140,6 +144,10 @@ static Colorbox* largest_box( Colorbox *usedboxes );
  * GDALProgressFunc() semantics.  May be NULL.
  * @param pProgressArg callback argument passed to pfnProgress.
  *
+ * Starting with GDAL 3.1, the GDAL_NUM_THREADS configuration option can be
+ * set to a number of threads, or ALL_CPUS, to collect the histogram by
+ * strips of lines in worker threads. The resulting color table is the same.
+ *
  * @return returns CE_None on success or CE_Failure if an error occurs.
  */
 
@@ -159,6 +167,10 @@ GDALComputeMedianCutPCT( GDALRasterBandH hRed,
     const int nYSize = GDALGetRasterBandYSize( hRed );
     if( nYSize == 0 )
         return CE_Failure;
+
+    const char* pszThreads = CPLGetConfigOption("GDAL_NUM_THREADS", "1");
+    const int nThreads = EQUAL(pszThreads, "ALL_CPUS") ? CPLGetNumCPUs() :
+                                                         atoi(pszThreads);
     if( static_cast<GUInt32>(nXSize) < std::numeric_limits<GUInt32>::max() / static_cast<GUInt32>(nYSize) )
     {
         return GDALComputeMedianCutPCTInternal(hRed, hGreen, hBlue,
@@ -167,7 +179,8 @@ GDALComputeMedianCutPCT( GDALRasterBandH hRed,
                                                5,
                                                static_cast<GUInt32 *>(nullptr),
                                                hColorTable,
-                                               pfnProgress, pProgressArg);
+                                               pfnProgress, pProgressArg,
+                                               nThreads);
     }
     else
     {
@@ -177,7 +190,8 @@ GDALComputeMedianCutPCT( GDALRasterBandH hRed,
                                                5,
                                                static_cast<GUIntBig * >(nullptr),
                                                hColorTable,
-                                               pfnProgress, pProgressArg);
+                                               pfnProgress, pProgressArg,
+                                               nThreads);
     }
 }
 
@@ -280,6 +294,208 @@ FindAndInsertColorCount( HashHistogram* psHashHistogram, GUInt32 nColorCode )
     }
 }
 
+/************************************************************************/
+/*                     GDALMedianCutHistogramJob                        */
+/************************************************************************/
+
+template<class T> struct GDALMedianCutHistogramJob
+{
+    GDALRasterBandH  hRed = nullptr;
+    GDALRasterBandH  hGreen = nullptr;
+    GDALRasterBandH  hBlue = nullptr;
+    CPLMutex       **phIOMutex = nullptr;
+    int              nXSize = 0;
+    int              nYOff = 0;
+    int              nYCount = 0;
+    int              nColorShift = 0;
+    int              nCLevels = 0;
+    std::vector<T>   anHistogram{};
+    Colorbox         sBox{};
+    CPLErr           eErr = CE_None;
+
+    static void Run( void *pData );
+};
+
+template<class T> void GDALMedianCutHistogramJob<T>::Run( void *pData )
+{
+    GDALMedianCutHistogramJob<T> *psJob =
+        static_cast<GDALMedianCutHistogramJob<T> *>(pData);
+    try
+    {
+        const int nXSize = psJob->nXSize;
+        const int nColorShift = psJob->nColorShift;
+        const int nCLevels = psJob->nCLevels;
+        std::vector<GByte> abyRed(nXSize);
+        std::vector<GByte> abyGreen(nXSize);
+        std::vector<GByte> abyBlue(nXSize);
+        psJob->anHistogram.assign(
+            static_cast<size_t>(nCLevels) * nCLevels * nCLevels, 0);
+        T* histogram = &psJob->anHistogram[0];
+        Colorbox *ptr = &psJob->sBox;
+        ptr->rmin = 999;
+        ptr->gmin = 999;
+        ptr->bmin = 999;
+        ptr->rmax = -1;
+        ptr->gmax = -1;
+        ptr->bmax = -1;
+
+        for( int iLine = psJob->nYOff;
+             iLine < psJob->nYOff + psJob->nYCount; iLine++ )
+        {
+            {
+                CPLMutexHolderD( psJob->phIOMutex );
+                psJob->eErr = GDALRasterIO( psJob->hRed, GF_Read, 0, iLine,
+                                            nXSize, 1, &abyRed[0],
+                                            nXSize, 1, GDT_Byte, 0, 0 );
+                if( psJob->eErr == CE_None )
+                    psJob->eErr = GDALRasterIO( psJob->hGreen, GF_Read,
+                                                0, iLine, nXSize, 1,
+                                                &abyGreen[0],
+                                                nXSize, 1, GDT_Byte, 0, 0 );
+                if( psJob->eErr == CE_None )
+                    psJob->eErr = GDALRasterIO( psJob->hBlue, GF_Read,
+                                                0, iLine, nXSize, 1,
+                                                &abyBlue[0],
+                                                nXSize, 1, GDT_Byte, 0, 0 );
+            }
+            if( psJob->eErr != CE_None )
+                return;
+
+            for( int iPixel = 0; iPixel < nXSize; iPixel++ )
+            {
+                const int nRed = abyRed[iPixel] >> nColorShift;
+                const int nGreen = abyGreen[iPixel] >> nColorShift;
+                const int nBlue = abyBlue[iPixel] >> nColorShift;
+
+                ptr->rmin = std::min(ptr->rmin, nRed);
+                ptr->gmin = std::min(ptr->gmin, nGreen);
+                ptr->bmin = std::min(ptr->bmin, nBlue);
+                ptr->rmax = std::max(ptr->rmax, nRed);
+                ptr->gmax = std::max(ptr->gmax, nGreen);
+                ptr->bmax = std::max(ptr->bmax, nBlue);
+
+                (*HISTOGRAM(histogram, nCLevels, nRed, nGreen, nBlue))++;
+            }
+        }
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALComputeMedianCutPCT()" );
+        psJob->eErr = CE_Failure;
+    }
+}
+
+/************************************************************************/
+/*                   GDALMedianCutHistogramByStrips()                   */
+/*                                                                      */
+/*      Collect the histogram by strips of lines in worker threads,     */
+/*      each strip into its own histogram, which is then added to       */
+/*      the global one. The result is the same as when collecting it    */
+/*      line by line.                                                   */
+/************************************************************************/
+
+template<class T> static CPLErr
+GDALMedianCutHistogramByStrips( GDALRasterBandH hRed,
+                                GDALRasterBandH hGreen,
+                                GDALRasterBandH hBlue,
+                                int nColorShift, int nCLevels,
+                                T* histogram, Colorbox *ptr,
+                                int nThreads,
+                                GDALProgressFunc pfnProgress,
+                                void * pProgressArg )
+{
+    const int nXSize = GDALGetRasterBandXSize( hRed );
+    const int nYSize = GDALGetRasterBandYSize( hRed );
+
+    // About one million pixels per strip, so that adding the histogram of
+    // a strip to the global one is cheap compared to collecting it.
+    const int nStripHeight =
+        std::max(1, std::min(nYSize, (1 << 20) / std::max(1, nXSize)));
+    const int nStrips = (nYSize + nStripHeight - 1) / nStripHeight;
+
+    CPLWorkerThreadPool oPool;
+    if( !oPool.Setup( std::min(nThreads, nStrips), nullptr, nullptr ) )
+        return CE_Failure;
+
+    CPLMutex *hIOMutex = nullptr;
+    const int nBatchSize = oPool.GetThreadCount();
+    const size_t nHistogramSize =
+        static_cast<size_t>(nCLevels) * nCLevels * nCLevels;
+    CPLErr eErr = CE_None;
+
+    try
+    {
+        // Process the strips by batches of as many strips as threads, to
+        // bound the memory in use.
+        for( int iStripStart = 0;
+             eErr == CE_None && iStripStart < nStrips;
+             iStripStart += nBatchSize )
+        {
+            const int nBatchStrips =
+                std::min(nBatchSize, nStrips - iStripStart);
+            std::vector<GDALMedianCutHistogramJob<T>> asJobs(nBatchStrips);
+            std::vector<void*> apJobData;
+            for( int i = 0; i < nBatchStrips; i++ )
+            {
+                asJobs[i].hRed = hRed;
+                asJobs[i].hGreen = hGreen;
+                asJobs[i].hBlue = hBlue;
+                asJobs[i].phIOMutex = &hIOMutex;
+                asJobs[i].nXSize = nXSize;
+                asJobs[i].nYOff = (iStripStart + i) * nStripHeight;
+                asJobs[i].nYCount = std::min(nStripHeight,
+                                             nYSize - asJobs[i].nYOff);
+                asJobs[i].nColorShift = nColorShift;
+                asJobs[i].nCLevels = nCLevels;
+                apJobData.push_back(&asJobs[i]);
+            }
+
+            oPool.SubmitJobs( GDALMedianCutHistogramJob<T>::Run, apJobData );
+            oPool.WaitCompletion();
+
+            for( int i = 0; eErr == CE_None && i < nBatchStrips; i++ )
+            {
+                eErr = asJobs[i].eErr;
+                if( eErr != CE_None )
+                    break;
+
+                const T* panStripHistogram = &asJobs[i].anHistogram[0];
+                for( size_t j = 0; j < nHistogramSize; j++ )
+                    histogram[j] += panStripHistogram[j];
+
+                const Colorbox& sBox = asJobs[i].sBox;
+                ptr->rmin = std::min(ptr->rmin, sBox.rmin);
+                ptr->gmin = std::min(ptr->gmin, sBox.gmin);
+                ptr->bmin = std::min(ptr->bmin, sBox.bmin);
+                ptr->rmax = std::max(ptr->rmax, sBox.rmax);
+                ptr->gmax = std::max(ptr->gmax, sBox.gmax);
+                ptr->bmax = std::max(ptr->bmax, sBox.bmax);
+
+                if( !pfnProgress( 1.0 * (asJobs[i].nYOff + asJobs[i].nYCount) /
+                                                                    nYSize,
+                                  "Generating Histogram", pProgressArg ) )
+                {
+                    CPLError( CE_Failure, CPLE_UserInterrupt,
+                              "User Terminated" );
+                    eErr = CE_Failure;
+                }
+            }
+        }
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALComputeMedianCutPCT()" );
+        eErr = CE_Failure;
+    }
+
+    if( hIOMutex )
+        CPLDestroyMutex( hIOMutex );
+
+    return eErr;
+}
+
 template<class T> int
 GDALComputeMedianCutPCTInternal(
     GDALRasterBandH hRed,
@@ -294,7 +510,8 @@ GDALComputeMedianCutPCTInternal(
     T* panHistogram,  // NULL, or >= size (1<<nBits)^3 * sizeof(T) bytes.
     GDALColorTableH hColorTable,
     GDALProgressFunc pfnProgress,
-    void * pProgressArg )
+    void * pProgressArg,
+    int nThreads )
 
 {
     VALIDATE_POINTER1( hRed, "GDALComputeMedianCutPCT", CE_Failure );
@@ -462,64 +679,76 @@ GDALComputeMedianCutPCTInternal(
         goto end_and_cleanup;
     }
 
-    for( int iLine = 0; iLine < nYSize; iLine++ )
+    if( nThreads > 1 && histogram != nullptr && nColorShift >= 2 )
     {
-        if( !pfnProgress( iLine / static_cast<double>(nYSize),
-                          "Generating Histogram", pProgressArg ) )
-        {
-            CPLError( CE_Failure, CPLE_UserInterrupt, "User Terminated" );
-            err = CE_Failure;
-            goto end_and_cleanup;
-        }
-
-        err = GDALRasterIO( hRed, GF_Read, 0, iLine, nXSize, 1,
-                      pabyRedLine, nXSize, 1, GDT_Byte, 0, 0 );
-        if( err == CE_None )
-            err = GDALRasterIO( hGreen, GF_Read, 0, iLine, nXSize, 1,
-                      pabyGreenLine, nXSize, 1, GDT_Byte, 0, 0 );
-        if( err == CE_None )
-            err = GDALRasterIO( hBlue, GF_Read, 0, iLine, nXSize, 1,
-                      pabyBlueLine, nXSize, 1, GDT_Byte, 0, 0 );
+        err = GDALMedianCutHistogramByStrips( hRed, hGreen, hBlue,
+                                              nColorShift, nCLevels,
+                                              histogram, ptr, nThreads,
+                                              pfnProgress, pProgressArg );
         if( err != CE_None )
             goto end_and_cleanup;
-
-        for( int iPixel = 0; iPixel < nXSize; iPixel++ )
+    }
+    else
+    {
+        for( int iLine = 0; iLine < nYSize; iLine++ )
         {
-            const int nRed = pabyRedLine[iPixel] >> nColorShift;
-            const int nGreen = pabyGreenLine[iPixel] >> nColorShift;
-            const int nBlue = pabyBlueLine[iPixel] >> nColorShift;
-
-            ptr->rmin = std::min(ptr->rmin, nRed);
-            ptr->gmin = std::min(ptr->gmin, nGreen);
-            ptr->bmin = std::min(ptr->bmin, nBlue);
-            ptr->rmax = std::max(ptr->rmax, nRed);
-            ptr->gmax = std::max(ptr->gmax, nGreen);
-            ptr->bmax = std::max(ptr->bmax, nBlue);
-
-            bool bFirstOccurrence;
-            if( psHashHistogram )
-            {
-                int* pnColor = FindAndInsertColorCount(psHashHistogram,
-                                         MAKE_COLOR_CODE(nRed, nGreen, nBlue));
-                bFirstOccurrence = ( *pnColor == 0 );
-                (*pnColor)++;
-            }
-            else
+            if( !pfnProgress( iLine / static_cast<double>(nYSize),
+                              "Generating Histogram", pProgressArg ) )
             {
-                T* pnColor =
-                    HISTOGRAM(histogram, nCLevels, nRed, nGreen, nBlue);
-                bFirstOccurrence = ( *pnColor == 0 );
-                (*pnColor)++;
+                CPLError( CE_Failure, CPLE_UserInterrupt, "User Terminated" );
+                err = CE_Failure;
+                goto end_and_cleanup;
             }
-            if( bFirstOccurrence)
+
+            err = GDALRasterIO( hRed, GF_Read, 0, iLine, nXSize, 1,
+                          pabyRedLine, nXSize, 1, GDT_Byte, 0, 0 );
+            if( err == CE_None )
+                err = GDALRasterIO( hGreen, GF_Read, 0, iLine, nXSize, 1,
+                          pabyGreenLine, nXSize, 1, GDT_Byte, 0, 0 );
+            if( err == CE_None )
+                err = GDALRasterIO( hBlue, GF_Read, 0, iLine, nXSize, 1,
+                          pabyBlueLine, nXSize, 1, GDT_Byte, 0, 0 );
+            if( err != CE_None )
+                goto end_and_cleanup;
+
+            for( int iPixel = 0; iPixel < nXSize; iPixel++ )
             {
-                if( nColorShift == 0 && nColorCounter < nColors )
+                const int nRed = pabyRedLine[iPixel] >> nColorShift;
+                const int nGreen = pabyGreenLine[iPixel] >> nColorShift;
+                const int nBlue = pabyBlueLine[iPixel] >> nColorShift;
+
+                ptr->rmin = std::min(ptr->rmin, nRed);
+                ptr->gmin = std::min(ptr->gmin, nGreen);
+                ptr->bmin = std::min(ptr->bmin, nBlue);
+                ptr->rmax = std::max(ptr->rmax, nRed);
+                ptr->gmax = std::max(ptr->gmax, nGreen);
+                ptr->bmax = std::max(ptr->bmax, nBlue);
+
+                bool bFirstOccurrence;
+                if( psHashHistogram )
+                {
+                    int* pnColor = FindAndInsertColorCount(psHashHistogram,
+                                             MAKE_COLOR_CODE(nRed, nGreen, nBlue));
+                    bFirstOccurrence = ( *pnColor == 0 );
+                    (*pnColor)++;
+                }
+                else
                 {
-                    anRed[nColorCounter] = static_cast<GByte>(nRed);
-                    anGreen[nColorCounter] = static_cast<GByte>(nGreen);
-                    anBlue[nColorCounter] = static_cast<GByte>(nBlue);
+                    T* pnColor =
+                        HISTOGRAM(histogram, nCLevels, nRed, nGreen, nBlue);
+                    bFirstOccurrence = ( *pnColor == 0 );
+                    (*pnColor)++;
+                }
+                if( bFirstOccurrence)
+                {
+                    if( nColorShift == 0 && nColorCounter < nColors )
+                    {
+                        anRed[nColorCounter] = static_cast<GByte>(nRed);
+                        anGreen[nColorCounter] = static_cast<GByte>(nGreen);
+                        anBlue[nColorCounter] = static_cast<GByte>(nBlue);
+                    }
+                    nColorCounter++;
                 }
-                nColorCounter++;
             }
         }
     }
@@ -1246,7 +1475,8 @@ GDALComputeMedianCutPCTInternal<GUInt32>(
     GUInt32* panHistogram,
     GDALColorTableH hColorTable,
     GDALProgressFunc pfnProgress,
-    void * pProgressArg );
+    void * pProgressArg,
+    int nThreads );
 
 template int
 GDALComputeMedianCutPCTInternal<GUIntBig>(
@@ -1262,4 +1492,5 @@ GDALComputeMedianCutPCTInternal<GUIntBig>(
     GUIntBig* panHistogram,
     GDALColorTableH hColorTable,
     GDALProgressFunc pfnProgress,
-    void * pProgressArg );
+    void * pProgressArg,
+    int nThreads );
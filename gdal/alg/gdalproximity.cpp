@@ -34,12 +34,15 @@
 #include <cstdlib>
 
 #include <algorithm>
+#include <limits>
+#include <vector>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
 #include "cpl_progress.h"
 #include "cpl_string.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 #include "gdal.h"
 
 CPL_CVSID("$Id$")
@@ -50,6 +53,19 @@ ProcessProximityLine( GInt32 *panSrcScanline, int *panNearX, int *panNearY,
                       float *pafProximity, double *pdfSrcNoDataValue,
                       int nTargetValues, int *panTargetValues );
 
+static CPLErr
+GDALComputeProximityExact( GDALRasterBandH hSrcBand,
+                           GDALRasterBandH hProximityBand,
+                           GDALRasterBandH hNearestIndexBand,
+                           int nThreads,
+                           double dfResX, double dfResY, double dfMaxDist,
+                           float fNoDataValue,
+                           bool bFixedBufVal, double dfFixedBufVal,
+                           const double *pdfSrcNoDataValue,
+                           int nTargetValues, const int *panTargetValues,
+                           GDALProgressFunc pfnProgress,
+                           void * pProgressArg );
+
 /************************************************************************/
 /*                        GDALComputeProximity()                        */
 /************************************************************************/
@@ -106,6 +122,28 @@ the proximity output.
 
 If this option is set, all pixels within the MAXDIST threadhold are
 set to this fixed value instead of to a proximity distance.
+
+  ALGORITHM=[SCANLINE]/EXACT
+
+(GDAL >= 3.1) The default SCANLINE algorithm propagates the nearest
+target found so far in two sweeps over the image, which is approximate
+and needs a temporary file when the proximity band is unsigned.  EXACT
+computes the exact Euclidean distance transform, in linear time but
+holding a 32 bit integer per pixel in memory.  With DISTUNITS=GEO it
+also takes into account non square pixels.
+
+  NUM_THREADS=n/ALL_CPUS
+
+(GDAL >= 3.1) Number of worker threads used by the EXACT algorithm.
+Defaults to 1.
+
+  NEAREST_INDEX_BAND=n
+
+(GDAL >= 3.1) With the EXACT algorithm, band number, in the dataset of
+hProximityBand, into which the index (line * width + column) of the
+nearest target pixel is written.  Pixels set to the nodata value in the
+proximity band are set to -1.  The band data type must be able to hold
+the index of every pixel.
 */
 
 CPLErr CPL_STDCALL
@@ -122,11 +160,31 @@ GDALComputeProximity( GDALRasterBandH hSrcBand,
     if( pfnProgress == nullptr )
         pfnProgress = GDALDummyProgress;
 
+/* -------------------------------------------------------------------- */
+/*      Which algorithm?                                                */
+/* -------------------------------------------------------------------- */
+    const char *pszOpt = CSLFetchNameValue( papszOptions, "ALGORITHM" );
+    bool bExact = false;
+    if( pszOpt )
+    {
+        if( EQUAL(pszOpt, "EXACT") )
+            bExact = true;
+        else if( !EQUAL(pszOpt, "SCANLINE") )
+        {
+            CPLError(
+                CE_Failure, CPLE_AppDefined,
+                "Unrecognized ALGORITHM value '%s', should be SCANLINE or "
+                "EXACT.", pszOpt );
+            return CE_Failure;
+        }
+    }
+
 /* -------------------------------------------------------------------- */
 /*      Are we using pixels or georeferenced coordinates for distances? */
 /* -------------------------------------------------------------------- */
     double dfDistMult = 1.0;
-    const char *pszOpt = CSLFetchNameValue( papszOptions, "DISTUNITS" );
+    double dfDistMultY = 1.0;
+    pszOpt = CSLFetchNameValue( papszOptions, "DISTUNITS" );
     if( pszOpt )
     {
         if( EQUAL(pszOpt, "GEO") )
@@ -137,12 +195,14 @@ GDALComputeProximity( GDALRasterBandH hSrcBand,
                 double adfGeoTransform[6] = { 0.0, 0.0, 0.0, 0.0, 0.0, 0.0 };
 
                 GDALGetGeoTransform( hSrcDS, adfGeoTransform );
-                if( std::abs(adfGeoTransform[1]) !=
+                if( !bExact &&
+                    std::abs(adfGeoTransform[1]) !=
                     std::abs(adfGeoTransform[5]) )
                     CPLError(
                         CE_Warning, CPLE_AppDefined,
                         "Pixels not square, distances will be inaccurate." );
                 dfDistMult = std::abs(adfGeoTransform[1]);
+                dfDistMultY = std::abs(adfGeoTransform[5]);
             }
         }
         else if( !EQUAL(pszOpt, "PIXEL") )
@@ -253,6 +313,51 @@ GDALComputeProximity( GDALRasterBandH hSrcBand,
         return CE_Failure;
     }
 
+/* -------------------------------------------------------------------- */
+/*      Exact distance transform, computed in memory.                   */
+/* -------------------------------------------------------------------- */
+    if( bExact )
+    {
+        int nThreads = 1;
+        pszOpt = CSLFetchNameValue( papszOptions, "NUM_THREADS" );
+        if( pszOpt )
+            nThreads = EQUAL(pszOpt, "ALL_CPUS") ? CPLGetNumCPUs() :
+                                                   atoi(pszOpt);
+
+        GDALRasterBandH hNearestIndexBand = nullptr;
+        pszOpt = CSLFetchNameValue( papszOptions, "NEAREST_INDEX_BAND" );
+        if( pszOpt )
+        {
+            GDALDatasetH hProximityDS = GDALGetBandDataset( hProximityBand );
+            if( hProximityDS )
+                hNearestIndexBand =
+                    GDALGetRasterBand( hProximityDS, atoi(pszOpt) );
+            if( hNearestIndexBand == nullptr )
+            {
+                CPLError( CE_Failure, CPLE_AppDefined,
+                          "Invalid NEAREST_INDEX_BAND value '%s'.", pszOpt );
+                CPLFree(panTargetValues);
+                return CE_Failure;
+            }
+        }
+
+        pszOpt = CSLFetchNameValue( papszOptions, "MAXDIST" );
+        const double dfMaxDistExact = pszOpt ?
+            CPLAtof(pszOpt) : std::numeric_limits<double>::infinity();
+
+        const CPLErr eErrExact = GDALComputeProximityExact(
+            hSrcBand, hProximityBand, hNearestIndexBand,
+            std::max(1, nThreads),
+            dfDistMult > 0 ? dfDistMult : 1.0,
+            dfDistMultY > 0 ? dfDistMultY : 1.0,
+            dfMaxDistExact, fNoDataValue, bFixedBufVal, dfFixedBufVal,
+            pdfSrcNoData, nTargetValues, panTargetValues,
+            pfnProgress, pProgressArg );
+
+        CPLFree(panTargetValues);
+        return eErrExact;
+    }
+
 /* -------------------------------------------------------------------- */
 /*      We need a signed type for the working proximity values kept     */
 /*      on disk.  If our proximity band is not signed, then create a    */
@@ -592,3 +697,399 @@ ProcessProximityLine( GInt32 *panSrcScanline, int *panNearX, int *panNearY,
 
     return CE_None;
 }
+
+/************************************************************************/
+/*                         IsProximityTarget()                          */
+/************************************************************************/
+
+static bool IsProximityTarget( GInt32 nValue, int nTargetValues,
+                               const int *panTargetValues )
+{
+    if( nTargetValues == 0 )
+        return nValue != 0;
+
+    for( int i = 0; i < nTargetValues; i++ )
+    {
+        if( nValue == panTargetValues[i] )
+            return true;
+    }
+    return false;
+}
+
+/************************************************************************/
+/* ==================================================================== */
+/*                     Exact Euclidean distance transform               */
+/*                                                                      */
+/*      Separable algorithm of Felzenszwalb and Huttenlocher: a first   */
+/*      pass finds the nearest target of each pixel within its column,  */
+/*      and a second pass the nearest target within its line, as the    */
+/*      lower envelope of the parabolas rooted at the column results.   */
+/*      Both passes are split between threads, by strips of columns     */
+/*      and by strips of lines respectively.                            */
+/* ==================================================================== */
+/************************************************************************/
+
+namespace {
+
+struct GDALProximityExactJob
+{
+    int          nXSize = 0;
+    int          nYSize = 0;
+    // Line of the nearest target in the column of each pixel, or -1.
+    GInt32      *panColNearY = nullptr;
+
+    // Column pass: columns to process.
+    int          nXOff = 0;
+    int          nXCount = 0;
+
+    // Line pass: lines to process, and their outputs.
+    int          nYOff = 0;
+    int          nYCount = 0;
+    double       dfResX = 1.0;
+    double       dfResY = 1.0;
+    double       dfMaxDist = 0.0;
+    float        fNoDataValue = 0.0f;
+    bool         bFixedBufVal = false;
+    double       dfFixedBufVal = 0.0;
+    const GInt32 *panSrcLines = nullptr;
+    const double *pdfSrcNoDataValue = nullptr;
+    float       *pafProximity = nullptr;
+    double      *padfNearestIndex = nullptr;
+};
+
+}  // namespace
+
+/************************************************************************/
+/*                     ProcessProximityColumns()                        */
+/*                                                                      */
+/*      Complete the nearest target within the column, computed from    */
+/*      the top by the caller, with the targets below each pixel.       */
+/************************************************************************/
+
+static void ProcessProximityColumns( void *pData )
+{
+    GDALProximityExactJob *psJob = static_cast<GDALProximityExactJob*>(pData);
+    const int nXSize = psJob->nXSize;
+    std::vector<GInt32> anNextY(psJob->nXCount, -1);
+
+    for( int iLine = psJob->nYSize - 1; iLine >= 0; iLine-- )
+    {
+        GInt32 *panNearY = psJob->panColNearY +
+            static_cast<size_t>(iLine) * nXSize + psJob->nXOff;
+        for( int i = 0; i < psJob->nXCount; i++ )
+        {
+            if( panNearY[i] == iLine )
+                anNextY[i] = iLine;
+            else if( anNextY[i] >= 0 &&
+                     (panNearY[i] < 0 ||
+                      anNextY[i] - iLine < iLine - panNearY[i]) )
+                panNearY[i] = anNextY[i];
+        }
+    }
+}
+
+/************************************************************************/
+/*                       ProcessProximityLines()                        */
+/************************************************************************/
+
+static void ProcessProximityLines( void *pData )
+{
+    GDALProximityExactJob *psJob = static_cast<GDALProximityExactJob*>(pData);
+    const int nXSize = psJob->nXSize;
+    const double dfWX = psJob->dfResX * psJob->dfResX;
+    const double dfWY = psJob->dfResY * psJob->dfResY;
+    const double dfMaxDistSq = psJob->dfMaxDist * psJob->dfMaxDist;
+
+    // Lower envelope of the parabolas: their column, value at their
+    // column, and start of the range of the line where they are the lowest.
+    std::vector<int> anEnvX(nXSize);
+    std::vector<double> adfEnvF(nXSize);
+    std::vector<double> adfEnvStart(nXSize);
+
+    for( int iLine = psJob->nYOff;
+         iLine < psJob->nYOff + psJob->nYCount; iLine++ )
+    {
+        const GInt32 *panNearY =
+            psJob->panColNearY + static_cast<size_t>(iLine) * nXSize;
+        const size_t nOutOff =
+            static_cast<size_t>(iLine - psJob->nYOff) * nXSize;
+
+        int nEnv = 0;
+        for( int iPixel = 0; iPixel < nXSize; iPixel++ )
+        {
+            if( panNearY[iPixel] < 0 )
+                continue;
+            const double dfDY = iLine - panNearY[iPixel];
+            const double dfF = dfWY * dfDY * dfDY;
+            double dfStart = -std::numeric_limits<double>::infinity();
+            while( nEnv > 0 )
+            {
+                const int nPrevX = anEnvX[nEnv-1];
+                dfStart = ((dfF + dfWX * iPixel * iPixel) -
+                           (adfEnvF[nEnv-1] + dfWX * nPrevX * nPrevX)) /
+                          (2 * dfWX * (iPixel - nPrevX));
+                if( dfStart > adfEnvStart[nEnv-1] )
+                    break;
+                nEnv--;
+                dfStart = -std::numeric_limits<double>::infinity();
+            }
+            anEnvX[nEnv] = iPixel;
+            adfEnvF[nEnv] = dfF;
+            adfEnvStart[nEnv] = dfStart;
+            nEnv++;
+        }
+
+        float *pafProximity = psJob->pafProximity + nOutOff;
+        double *padfNearestIndex = psJob->padfNearestIndex ?
+            psJob->padfNearestIndex + nOutOff : nullptr;
+        const GInt32 *panSrcLine = psJob->panSrcLines ?
+            psJob->panSrcLines + nOutOff : nullptr;
+
+        int iEnv = 0;
+        for( int iPixel = 0; iPixel < nXSize; iPixel++ )
+        {
+            double dfDistSq = std::numeric_limits<double>::infinity();
+            int nNearX = -1;
+            if( nEnv > 0 )
+            {
+                while( iEnv + 1 < nEnv && adfEnvStart[iEnv+1] <= iPixel )
+                    iEnv++;
+                nNearX = anEnvX[iEnv];
+                const double dfDX = iPixel - nNearX;
+                dfDistSq = dfWX * dfDX * dfDX + adfEnvF[iEnv];
+            }
+
+            const bool bIsTarget = dfDistSq == 0.0;
+            if( nNearX < 0 || dfDistSq > dfMaxDistSq ||
+                (!bIsTarget && panSrcLine != nullptr &&
+                 panSrcLine[iPixel] == *(psJob->pdfSrcNoDataValue)) )
+            {
+                pafProximity[iPixel] = psJob->fNoDataValue;
+                if( padfNearestIndex )
+                    padfNearestIndex[iPixel] = -1.0;
+                continue;
+            }
+
+            if( bIsTarget )
+                pafProximity[iPixel] = 0.0f;
+            else if( psJob->bFixedBufVal )
+                pafProximity[iPixel] =
+                    static_cast<float>(psJob->dfFixedBufVal);
+            else
+                pafProximity[iPixel] = static_cast<float>(sqrt(dfDistSq));
+
+            if( padfNearestIndex )
+                padfNearestIndex[iPixel] =
+                    static_cast<double>(panNearY[nNearX]) * nXSize + nNearX;
+        }
+    }
+}
+
+/************************************************************************/
+/*                     GDALComputeProximityExact()                      */
+/************************************************************************/
+
+static CPLErr
+GDALComputeProximityExact( GDALRasterBandH hSrcBand,
+                           GDALRasterBandH hProximityBand,
+                           GDALRasterBandH hNearestIndexBand,
+                           int nThreads,
+                           double dfResX, double dfResY, double dfMaxDist,
+                           float fNoDataValue,
+                           bool bFixedBufVal, double dfFixedBufVal,
+                           const double *pdfSrcNoDataValue,
+                           int nTargetValues, const int *panTargetValues,
+                           GDALProgressFunc pfnProgress,
+                           void * pProgressArg )
+
+{
+    const int nXSize = GDALGetRasterBandXSize( hSrcBand );
+    const int nYSize = GDALGetRasterBandYSize( hSrcBand );
+
+    GInt32 *panColNearY = static_cast<GInt32 *>(
+        VSI_MALLOC3_VERBOSE(sizeof(GInt32), nXSize, nYSize));
+    GInt32 *panSrcScanline = static_cast<GInt32 *>(
+        VSI_MALLOC2_VERBOSE(sizeof(GInt32), nXSize));
+    if( panColNearY == nullptr || panSrcScanline == nullptr )
+    {
+        CPLFree( panColNearY );
+        CPLFree( panSrcScanline );
+        return CE_Failure;
+    }
+
+    CPLWorkerThreadPool oPool;
+    if( nThreads > 1 && !oPool.Setup( nThreads, nullptr, nullptr ) )
+        nThreads = 1;
+    const auto RunJobs =
+        [nThreads, &oPool]( CPLThreadFunc pfnFunc,
+                            std::vector<GDALProximityExactJob>& asJobs )
+    {
+        if( nThreads > 1 )
+        {
+            std::vector<void*> apJobData;
+            for( auto& sJob: asJobs )
+                apJobData.push_back(&sJob);
+            oPool.SubmitJobs( pfnFunc, apJobData );
+            oPool.WaitCompletion();
+        }
+        else
+        {
+            for( auto& sJob: asJobs )
+                pfnFunc( &sJob );
+        }
+    };
+
+    GDALProximityExactJob sTemplate;
+    sTemplate.nXSize = nXSize;
+    sTemplate.nYSize = nYSize;
+    sTemplate.panColNearY = panColNearY;
+
+/* -------------------------------------------------------------------- */
+/*      Read the source, finding the nearest target above each pixel    */
+/*      in its column.                                                  */
+/* -------------------------------------------------------------------- */
+    CPLErr eErr = CE_None;
+    for( int iPixel = 0; iPixel < nXSize; iPixel++ )
+        panColNearY[iPixel] = -1;
+
+    for( int iLine = 0; eErr == CE_None && iLine < nYSize; iLine++ )
+    {
+        eErr = GDALRasterIO( hSrcBand, GF_Read, 0, iLine, nXSize, 1,
+                             panSrcScanline, nXSize, 1, GDT_Int32, 0, 0 );
+        if( eErr != CE_None )
+            break;
+
+        GInt32 *panNearY = panColNearY + static_cast<size_t>(iLine) * nXSize;
+        const GInt32 *panPrevNearY = panNearY - nXSize;
+        for( int iPixel = 0; iPixel < nXSize; iPixel++ )
+        {
+            if( IsProximityTarget( panSrcScanline[iPixel],
+                                   nTargetValues, panTargetValues ) )
+                panNearY[iPixel] = iLine;
+            else
+                panNearY[iPixel] = iLine > 0 ? panPrevNearY[iPixel] : -1;
+        }
+
+        if( !pfnProgress( 0.25 * (iLine+1) / static_cast<double>(nYSize),
+                          "", pProgressArg ) )
+        {
+            CPLError( CE_Failure, CPLE_UserInterrupt, "User terminated" );
+            eErr = CE_Failure;
+        }
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Complete the column pass with the targets below, by strips of   */
+/*      columns.                                                        */
+/* -------------------------------------------------------------------- */
+    if( eErr == CE_None )
+    {
+        std::vector<GDALProximityExactJob> asJobs;
+        const int nXStep = std::max(1, (nXSize + nThreads - 1) / nThreads);
+        for( int nXOff = 0; nXOff < nXSize; nXOff += nXStep )
+        {
+            asJobs.push_back(sTemplate);
+            asJobs.back().nXOff = nXOff;
+            asJobs.back().nXCount = std::min(nXStep, nXSize - nXOff);
+        }
+        RunJobs( ProcessProximityColumns, asJobs );
+
+        if( !pfnProgress( 0.5, "", pProgressArg ) )
+        {
+            CPLError( CE_Failure, CPLE_UserInterrupt, "User terminated" );
+            eErr = CE_Failure;
+        }
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Line pass, by batches of strips of lines, each one processed    */
+/*      by a thread. The batch is then written out in order.            */
+/* -------------------------------------------------------------------- */
+    const int nStripLines =
+        std::max(1, std::min(nYSize, (1024 * 1024) / std::max(1, nXSize)));
+    const int nBatchLines = std::min(nYSize, nStripLines * nThreads);
+
+    float *pafProximity = nullptr;
+    double *padfNearestIndex = nullptr;
+    GInt32 *panSrcLines = nullptr;
+    if( eErr == CE_None )
+    {
+        pafProximity = static_cast<float *>(
+            VSI_MALLOC3_VERBOSE(sizeof(float), nXSize, nBatchLines));
+        if( hNearestIndexBand )
+            padfNearestIndex = static_cast<double *>(
+                VSI_MALLOC3_VERBOSE(sizeof(double), nXSize, nBatchLines));
+        if( pdfSrcNoDataValue )
+            panSrcLines = static_cast<GInt32 *>(
+                VSI_MALLOC3_VERBOSE(sizeof(GInt32), nXSize, nBatchLines));
+        if( pafProximity == nullptr ||
+            (hNearestIndexBand && padfNearestIndex == nullptr) ||
+            (pdfSrcNoDataValue && panSrcLines == nullptr) )
+            eErr = CE_Failure;
+    }
+
+    sTemplate.dfResX = dfResX;
+    sTemplate.dfResY = dfResY;
+    sTemplate.dfMaxDist = dfMaxDist;
+    sTemplate.fNoDataValue = fNoDataValue;
+    sTemplate.bFixedBufVal = bFixedBufVal;
+    sTemplate.dfFixedBufVal = dfFixedBufVal;
+    sTemplate.pdfSrcNoDataValue = pdfSrcNoDataValue;
+
+    for( int nBatchOff = 0;
+         eErr == CE_None && nBatchOff < nYSize;
+         nBatchOff += nBatchLines )
+    {
+        const int nLines = std::min(nBatchLines, nYSize - nBatchOff);
+
+        // The input nodata pixels are needed for the output.
+        if( panSrcLines )
+        {
+            eErr = GDALRasterIO( hSrcBand, GF_Read, 0, nBatchOff,
+                                 nXSize, nLines, panSrcLines, nXSize, nLines,
+                                 GDT_Int32, 0, 0 );
+            if( eErr != CE_None )
+                break;
+        }
+
+        std::vector<GDALProximityExactJob> asJobs;
+        for( int nYOff = 0; nYOff < nLines; nYOff += nStripLines )
+        {
+            const size_t nOff = static_cast<size_t>(nYOff) * nXSize;
+            asJobs.push_back(sTemplate);
+            GDALProximityExactJob& sJob = asJobs.back();
+            sJob.nYOff = nBatchOff + nYOff;
+            sJob.nYCount = std::min(nStripLines, nLines - nYOff);
+            sJob.pafProximity = pafProximity + nOff;
+            sJob.padfNearestIndex =
+                padfNearestIndex ? padfNearestIndex + nOff : nullptr;
+            sJob.panSrcLines = panSrcLines ? panSrcLines + nOff : nullptr;
+        }
+        RunJobs( ProcessProximityLines, asJobs );
+
+        eErr = GDALRasterIO( hProximityBand, GF_Write, 0, nBatchOff,
+                             nXSize, nLines, pafProximity, nXSize, nLines,
+                             GDT_Float32, 0, 0 );
+        if( eErr == CE_None && hNearestIndexBand )
+            eErr = GDALRasterIO( hNearestIndexBand, GF_Write, 0, nBatchOff,
+                                 nXSize, nLines, padfNearestIndex,
+                                 nXSize, nLines, GDT_Float64, 0, 0 );
+
+        if( eErr == CE_None &&
+            !pfnProgress( 0.5 + 0.5 * (nBatchOff + nLines) /
+                                    static_cast<double>(nYSize),
+                          "", pProgressArg ) )
+        {
+            CPLError( CE_Failure, CPLE_UserInterrupt, "User terminated" );
+            eErr = CE_Failure;
+        }
+    }
+
+    CPLFree( panColNearY );
+    CPLFree( panSrcScanline );
+    CPLFree( pafProximity );
+    CPLFree( padfNearestIndex );
+    CPLFree( panSrcLines );
+
+    return eErr;
+}
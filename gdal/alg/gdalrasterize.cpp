@@ -36,14 +36,19 @@
 #include <cstdlib>
 #include <cstring>
 #include <cfloat>
+#include <cmath>
+#include <limits>
+#include <new>
 #include <vector>
 #include <algorithm>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
+#include "cpl_multiproc.h"
 #include "cpl_progress.h"
 #include "cpl_string.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 #include "gdal.h"
 #include "gdal_priv.h"
 #include "ogr_api.h"
@@ -217,6 +222,36 @@ void gvBurnPoint( void *pCBData, int nY, int nX, double dfVariant )
     }
 }
 
+/************************************************************************/
+/*                        gvBurnPointInWindow()                         */
+/************************************************************************/
+
+// Burning into a buffer covering a window of the raster, from points in
+// pixel coordinates of the whole raster. sInfo must be the first member,
+// as the low level rasterizer functions read it from the callback data.
+struct GDALRasterizeWindowInfo
+{
+    GDALRasterizeInfo sInfo;
+    int nXOff;
+    int nYOff;
+};
+
+static
+void gvBurnPointInWindow( void *pCBData, int nY, int nX, double dfVariant )
+
+{
+    GDALRasterizeWindowInfo *psWindowInfo =
+        static_cast<GDALRasterizeWindowInfo *>(pCBData);
+
+    nX -= psWindowInfo->nXOff;
+    nY -= psWindowInfo->nYOff;
+    if( nX < 0 || nX >= psWindowInfo->sInfo.nXSize ||
+        nY < 0 || nY >= psWindowInfo->sInfo.nYSize )
+        return;
+
+    gvBurnPoint( &psWindowInfo->sInfo, nY, nX, dfVariant );
+}
+
 /************************************************************************/
 /*                    GDALCollectRingsFromGeometry()                    */
 /************************************************************************/
@@ -351,22 +386,87 @@ static void GDALCollectRingsFromGeometry(
 }
 
 /************************************************************************/
-/*                       gv_rasterize_one_shape()                       */
+/*                    GDALRasterizeRemoveFailedPoints()                 */
+/*                                                                      */
+/*      Remove the points that the transformer failed to transform,     */
+/*      and the parts left without points.                              */
+/************************************************************************/
+
+static void GDALRasterizeRemoveFailedPoints( const int *panSuccess,
+                                             std::vector<double> &aPointX,
+                                             std::vector<double> &aPointY,
+                                             std::vector<double> &aPointVariant,
+                                             std::vector<int> &aPartSize )
+{
+    const bool bHasVariant = aPointVariant.size() == aPointX.size();
+    size_t iIn = 0;
+    size_t iOut = 0;
+    size_t iPartOut = 0;
+    for( size_t iPart = 0; iPart < aPartSize.size(); iPart++ )
+    {
+        int nPartSizeOut = 0;
+        for( int i = 0; i < aPartSize[iPart]; i++, iIn++ )
+        {
+            if( !panSuccess[iIn] )
+                continue;
+            aPointX[iOut] = aPointX[iIn];
+            aPointY[iOut] = aPointY[iIn];
+            if( bHasVariant )
+                aPointVariant[iOut] = aPointVariant[iIn];
+            iOut++;
+            nPartSizeOut++;
+        }
+        if( nPartSizeOut > 0 )
+            aPartSize[iPartOut++] = nPartSizeOut;
+    }
+    aPointX.resize(iOut);
+    aPointY.resize(iOut);
+    if( bHasVariant )
+        aPointVariant.resize(iOut);
+    aPartSize.resize(iPartOut);
+}
+
+/************************************************************************/
+/*                         gv_rasterize_rings()                         */
+/*                                                                      */
+/*      Burn the rings of a geometry, in buffer pixel coordinates, as   */
+/*      collected by GDALCollectRingsFromGeometry().  The variants may  */
+/*      be modified.                                                    */
+/*                                                                      */
+/*      When the buffer is a window of a larger raster, psWindow gives  */
+/*      the points in pixel coordinates of the whole raster.  They are  */
+/*      used to find the pixels touched by the lines with ALL_TOUCHED,  */
+/*      as this depends on where the lines are clipped.                 */
 /************************************************************************/
+
+// Position of the buffer in the raster, and points in pixel coordinates of
+// the raster.
+struct GDALRasterizeWindow
+{
+    int           nXOff = 0;
+    int           nYOff = 0;
+    int           nRasterXSize = 0;
+    int           nRasterYSize = 0;
+    const double *padfX = nullptr;
+    const double *padfY = nullptr;
+};
+
 static void
-gv_rasterize_one_shape( unsigned char *pabyChunkBuf, int nXOff, int nYOff,
-                        int nXSize, int nYSize,
-                        int nBands, GDALDataType eType,
-                        int nPixelSpace, GSpacing nLineSpace, GSpacing nBandSpace,
-                        int bAllTouched,
-                        OGRGeometry *poShape, double *padfBurnValue,
-                        GDALBurnValueSrc eBurnValueSrc,
-                        GDALRasterMergeAlg eMergeAlg,
-                        GDALTransformerFunc pfnTransformer,
-                        void *pTransformArg )
+gv_rasterize_rings( unsigned char *pabyChunkBuf, int nXSize, int nYSize,
+                    int nBands, GDALDataType eType,
+                    int nPixelSpace, GSpacing nLineSpace, GSpacing nBandSpace,
+                    int bAllTouched, OGRwkbGeometryType eFlatType,
+                    std::vector<double> &aPointX,
+                    std::vector<double> &aPointY,
+                    std::vector<double> &aPointVariant,
+                    std::vector<int> &aPartSize,
+                    double *padfBurnValue,
+                    GDALBurnValueSrc eBurnValueSrc,
+                    GDALRasterMergeAlg eMergeAlg,
+                    const GDALRasterizeWindow *psWindow = nullptr )
 
 {
-    if( poShape == nullptr || poShape->IsEmpty() )
+    if( aPartSize.empty() )
         return;
 
     if(nPixelSpace == 0)
@@ -395,39 +495,30 @@ gv_rasterize_one_shape( unsigned char *pabyChunkBuf, int nXOff, int nYOff,
     sInfo.eBurnValueSource = eBurnValueSrc;
     sInfo.eMergeAlg = eMergeAlg;
 
-/* -------------------------------------------------------------------- */
-/*      Transform polygon geometries into a set of rings and a part     */
-/*      size list.                                                      */
-/* -------------------------------------------------------------------- */
-    std::vector<double> aPointX;
-    std::vector<double> aPointY;
-    std::vector<double> aPointVariant;
-    std::vector<int> aPartSize;
-
-    GDALCollectRingsFromGeometry( poShape, aPointX, aPointY, aPointVariant,
-                                  aPartSize, eBurnValueSrc );
-
-/* -------------------------------------------------------------------- */
-/*      Transform points if needed.                                     */
-/* -------------------------------------------------------------------- */
-    if( pfnTransformer != nullptr )
+    const auto BurnLinesAllTouched = [&]( double *padfVariant )
     {
-        int *panSuccess =
-            static_cast<int *>(CPLCalloc(sizeof(int), aPointX.size()));
-
-        // TODO: We need to add all appropriate error checking at some point.
-        pfnTransformer( pTransformArg, FALSE, static_cast<int>(aPointX.size()),
-                        &(aPointX[0]), &(aPointY[0]), nullptr, panSuccess );
-        CPLFree( panSuccess );
-    }
-
-/* -------------------------------------------------------------------- */
-/*      Shift to account for the buffer offset of this buffer.          */
-/* -------------------------------------------------------------------- */
-    for( unsigned int i = 0; i < aPointX.size(); i++ )
-        aPointX[i] -= nXOff;
-    for( unsigned int i = 0; i < aPointY.size(); i++ )
-        aPointY[i] -= nYOff;
+        if( psWindow == nullptr )
+        {
+            GDALdllImageLineAllTouched(
+                sInfo.nXSize, nYSize,
+                static_cast<int>(aPartSize.size()), &(aPartSize[0]),
+                &(aPointX[0]), &(aPointY[0]), padfVariant,
+                gvBurnPoint, &sInfo, eMergeAlg == GRMA_Add );
+        }
+        else
+        {
+            GDALRasterizeWindowInfo sWindowInfo;
+            sWindowInfo.sInfo = sInfo;
+            sWindowInfo.nXOff = psWindow->nXOff;
+            sWindowInfo.nYOff = psWindow->nYOff;
+            GDALdllImageLineAllTouched(
+                psWindow->nRasterXSize, psWindow->nRasterYSize,
+                static_cast<int>(aPartSize.size()), &(aPartSize[0]),
+                const_cast<double *>(psWindow->padfX),
+                const_cast<double *>(psWindow->padfY), padfVariant,
+                gvBurnPointInWindow, &sWindowInfo, eMergeAlg == GRMA_Add );
+        }
+    };
 
 /* -------------------------------------------------------------------- */
 /*      Perform the rasterization.                                      */
@@ -441,7 +532,7 @@ gv_rasterize_one_shape( unsigned char *pabyChunkBuf, int nXOff, int nYOff,
     //    // Fill polygon.
     // else
     //    // How to report this problem?
-    switch( wkbFlatten(poShape->getGeometryType()) )
+    switch( eFlatType )
     {
       case wkbPoint:
       case wkbMultiPoint:
@@ -456,14 +547,8 @@ gv_rasterize_one_shape( unsigned char *pabyChunkBuf, int nXOff, int nYOff,
       case wkbMultiLineString:
       {
           if( bAllTouched )
-              GDALdllImageLineAllTouched( sInfo.nXSize, nYSize,
-                                          static_cast<int>(aPartSize.size()),
-                                          &(aPartSize[0]),
-                                          &(aPointX[0]), &(aPointY[0]),
-                                          (eBurnValueSrc == GBV_UserBurnValue)?
-                                          nullptr : &(aPointVariant[0]),
-                                          gvBurnPoint, &sInfo,
-                                          eMergeAlg == GRMA_Add );
+              BurnLinesAllTouched( (eBurnValueSrc == GBV_UserBurnValue)?
+                                   nullptr : &(aPointVariant[0]) );
           else
               GDALdllImageLine( sInfo.nXSize, nYSize,
                                 static_cast<int>(aPartSize.size()),
@@ -492,13 +577,7 @@ gv_rasterize_one_shape( unsigned char *pabyChunkBuf, int nXOff, int nYOff,
               // polygons more appropriately is added.
               if( eBurnValueSrc == GBV_UserBurnValue )
               {
-                  GDALdllImageLineAllTouched(
-                      sInfo.nXSize, nYSize,
-                      static_cast<int>(aPartSize.size()), &(aPartSize[0]),
-                      &(aPointX[0]), &(aPointY[0]),
-                      nullptr,
-                      gvBurnPoint, &sInfo,
-                      eMergeAlg == GRMA_Add );
+                  BurnLinesAllTouched( nullptr );
               }
               else
               {
@@ -510,13 +589,7 @@ gv_rasterize_one_shape( unsigned char *pabyChunkBuf, int nXOff, int nYOff,
                           aPointVariant[n++] = aPointVariant[0];
                   }
 
-                  GDALdllImageLineAllTouched(
-                      sInfo.nXSize, nYSize,
-                      static_cast<int>(aPartSize.size()), &(aPartSize[0]),
-                      &(aPointX[0]), &(aPointY[0]),
-                      &(aPointVariant[0]),
-                      gvBurnPoint, &sInfo,
-                      eMergeAlg == GRMA_Add );
+                  BurnLinesAllTouched( &(aPointVariant[0]) );
               }
           }
       }
@@ -524,6 +597,67 @@ gv_rasterize_one_shape( unsigned char *pabyChunkBuf, int nXOff, int nYOff,
     }
 }
 
+/************************************************************************/
+/*                       gv_rasterize_one_shape()                       */
+/************************************************************************/
+static void
+gv_rasterize_one_shape( unsigned char *pabyChunkBuf, int nXOff, int nYOff,
+                        int nXSize, int nYSize,
+                        int nBands, GDALDataType eType,
+                        int nPixelSpace, GSpacing nLineSpace, GSpacing nBandSpace,
+                        int bAllTouched,
+                        OGRGeometry *poShape, double *padfBurnValue,
+                        GDALBurnValueSrc eBurnValueSrc,
+                        GDALRasterMergeAlg eMergeAlg,
+                        GDALTransformerFunc pfnTransformer,
+                        void *pTransformArg )
+
+{
+    if( poShape == nullptr || poShape->IsEmpty() )
+        return;
+
+/* -------------------------------------------------------------------- */
+/*      Transform polygon geometries into a set of rings and a part     */
+/*      size list.                                                      */
+/* -------------------------------------------------------------------- */
+    std::vector<double> aPointX;
+    std::vector<double> aPointY;
+    std::vector<double> aPointVariant;
+    std::vector<int> aPartSize;
+
+    GDALCollectRingsFromGeometry( poShape, aPointX, aPointY, aPointVariant,
+                                  aPartSize, eBurnValueSrc );
+
+/* -------------------------------------------------------------------- */
+/*      Transform points if needed.                                     */
+/* -------------------------------------------------------------------- */
+    if( pfnTransformer != nullptr )
+    {
+        int *panSuccess =
+            static_cast<int *>(CPLCalloc(sizeof(int), aPointX.size()));
+
+        pfnTransformer( pTransformArg, FALSE, static_cast<int>(aPointX.size()),
+                        &(aPointX[0]), &(aPointY[0]), nullptr, panSuccess );
+        GDALRasterizeRemoveFailedPoints( panSuccess, aPointX, aPointY,
+                                         aPointVariant, aPartSize );
+        CPLFree( panSuccess );
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Shift to account for the buffer offset of this buffer.          */
+/* -------------------------------------------------------------------- */
+    for( unsigned int i = 0; i < aPointX.size(); i++ )
+        aPointX[i] -= nXOff;
+    for( unsigned int i = 0; i < aPointY.size(); i++ )
+        aPointY[i] -= nYOff;
+
+    gv_rasterize_rings( pabyChunkBuf, nXSize, nYSize, nBands, eType,
+                        nPixelSpace, nLineSpace, nBandSpace, bAllTouched,
+                        wkbFlatten(poShape->getGeometryType()),
+                        aPointX, aPointY, aPointVariant, aPartSize,
+                        padfBurnValue, eBurnValueSrc, eMergeAlg );
+}
+
 /************************************************************************/
 /*                        GDALRasterizeOptions()                        */
 /*                                                                      */
@@ -613,6 +747,402 @@ static CPLErr GDALRasterizeOptions( char **papszOptions,
     return CE_None;
 }
 
+/************************************************************************/
+/*                     GDALRasterizeGetNumThreads()                     */
+/************************************************************************/
+
+static int GDALRasterizeGetNumThreads( char **papszOptions )
+{
+    const char *pszNumThreads = CSLFetchNameValue(papszOptions, "NUM_THREADS");
+    if( pszNumThreads == nullptr )
+        return 0;
+    const int nThreads = EQUAL(pszNumThreads, "ALL_CPUS") ? CPLGetNumCPUs() :
+                                                            atoi(pszNumThreads);
+    return std::max(1, nThreads);
+}
+
+/************************************************************************/
+/*                      GDALRasterizeTileSize()                         */
+/*                                                                      */
+/*      Tiles are made of whole blocks, unless blocks are very large    */
+/*      (e.g. strips of a whole line).                                  */
+/************************************************************************/
+
+static int GDALRasterizeTileSize( int nBlockSize, int nRasterSize )
+{
+    const int nTargetSize = 512;
+    int nTileSize = nTargetSize;
+    if( nBlockSize <= nTargetSize )
+        nTileSize = ((nTargetSize + nBlockSize - 1) / nBlockSize) * nBlockSize;
+    else if( nBlockSize <= 4 * nTargetSize )
+        nTileSize = nBlockSize;
+    return std::min(nTileSize, nRasterSize);
+}
+
+/************************************************************************/
+/*                       GDALRasterizeTileJob                           */
+/************************************************************************/
+
+// Rings of a geometry in pixel coordinates of the raster.
+struct GDALRasterizeTileShape
+{
+    OGRwkbGeometryType  eFlatType = wkbUnknown;
+    std::vector<double> aPointX{};
+    std::vector<double> aPointY{};
+    std::vector<double> aPointVariant{};
+    std::vector<int>    aPartSize{};
+};
+
+struct GDALRasterizeTileContext
+{
+    GDALDataset        *poDS = nullptr;
+    int                 nBandCount = 0;
+    int                *panBandList = nullptr;
+    GDALDataType        eType = GDT_Unknown;
+    const std::vector<GDALRasterizeTileShape> *paoShapes = nullptr;
+    const double       *padfGeomBurnValue = nullptr;
+    int                 bAllTouched = FALSE;
+    GDALBurnValueSrc    eBurnValueSource = GBV_UserBurnValue;
+    GDALRasterMergeAlg  eMergeAlg = GRMA_Replace;
+    CPLMutex           *hMutex = nullptr;
+};
+
+struct GDALRasterizeTileJob
+{
+    GDALRasterizeTileContext *psContext = nullptr;
+    int                 nXOff = 0;
+    int                 nYOff = 0;
+    int                 nXSize = 0;
+    int                 nYSize = 0;
+    const std::vector<int> *panGeoms = nullptr;
+    CPLErr              eErr = CE_None;
+
+    static void Run( void *pData );
+};
+
+/************************************************************************/
+/*                     GDALRasterizeTileJob::Run()                      */
+/*                                                                      */
+/*      Burn the geometries of a tile, in their original order, so     */
+/*      that the result does not depend on the number of threads.      */
+/************************************************************************/
+
+void GDALRasterizeTileJob::Run( void *pData )
+{
+    GDALRasterizeTileJob *psJob = static_cast<GDALRasterizeTileJob *>(pData);
+    GDALRasterizeTileContext *psContext = psJob->psContext;
+    GDALDataset *poDS = psContext->poDS;
+
+    const int nPixelSize = GDALGetDataTypeSizeBytes(psContext->eType);
+    unsigned char *pabyChunkBuf = static_cast<unsigned char *>(
+        VSI_MALLOC3_VERBOSE(nPixelSize * psContext->nBandCount,
+                            psJob->nXSize, psJob->nYSize));
+    if( pabyChunkBuf == nullptr )
+    {
+        psJob->eErr = CE_Failure;
+        return;
+    }
+
+    {
+        CPLMutexHolderD( &psContext->hMutex );
+        psJob->eErr =
+            poDS->RasterIO( GF_Read, psJob->nXOff, psJob->nYOff,
+                            psJob->nXSize, psJob->nYSize, pabyChunkBuf,
+                            psJob->nXSize, psJob->nYSize, psContext->eType,
+                            psContext->nBandCount, psContext->panBandList,
+                            0, 0, 0, nullptr );
+    }
+
+    if( psJob->eErr == CE_None )
+    {
+        try
+        {
+            // The rings are shifted to the tile, and their variants may be
+            // modified when burning, so work on a copy. The lines burnt with
+            // ALL_TOUCHED are drawn from the points in raster coordinates,
+            // so that the touched pixels and their variants do not depend
+            // on where the tiles clip them.
+            GDALRasterizeWindow sWindow;
+            sWindow.nXOff = psJob->nXOff;
+            sWindow.nYOff = psJob->nYOff;
+            sWindow.nRasterXSize = poDS->GetRasterXSize();
+            sWindow.nRasterYSize = poDS->GetRasterYSize();
+            std::vector<double> aPointX;
+            std::vector<double> aPointY;
+            std::vector<double> aPointVariant;
+            std::vector<int> aPartSize;
+            for( const int iShape: *psJob->panGeoms )
+            {
+                const GDALRasterizeTileShape &oShape =
+                    (*psContext->paoShapes)[iShape];
+                aPointX.resize(oShape.aPointX.size());
+                aPointY.resize(oShape.aPointY.size());
+                for( size_t i = 0; i < aPointX.size(); i++ )
+                {
+                    aPointX[i] = oShape.aPointX[i] - psJob->nXOff;
+                    aPointY[i] = oShape.aPointY[i] - psJob->nYOff;
+                }
+                aPointVariant = oShape.aPointVariant;
+                aPartSize = oShape.aPartSize;
+                sWindow.padfX = oShape.aPointX.data();
+                sWindow.padfY = oShape.aPointY.data();
+
+                gv_rasterize_rings(
+                    pabyChunkBuf, psJob->nXSize, psJob->nYSize,
+                    psContext->nBandCount, psContext->eType,
+                    0, 0, 0,
+                    psContext->bAllTouched, oShape.eFlatType,
+                    aPointX, aPointY, aPointVariant, aPartSize,
+                    const_cast<double *>(psContext->padfGeomBurnValue) +
+                                        iShape * psContext->nBandCount,
+                    psContext->eBurnValueSource, psContext->eMergeAlg,
+                    &sWindow );
+            }
+        }
+        catch( const std::bad_alloc& )
+        {
+            CPLError( CE_Failure, CPLE_OutOfMemory,
+                      "Out of memory in GDALRasterizeGeometries()" );
+            psJob->eErr = CE_Failure;
+        }
+
+        CPLMutexHolderD( &psContext->hMutex );
+        if( psJob->eErr == CE_None )
+            psJob->eErr =
+                poDS->RasterIO( GF_Write, psJob->nXOff, psJob->nYOff,
+                                psJob->nXSize, psJob->nYSize, pabyChunkBuf,
+                                psJob->nXSize, psJob->nYSize,
+                                psContext->eType,
+                                psContext->nBandCount, psContext->panBandList,
+                                0, 0, 0, nullptr );
+    }
+
+    VSIFree( pabyChunkBuf );
+}
+
+/************************************************************************/
+/*                    GDALRasterizeGeometriesTiled()                    */
+/*                                                                      */
+/*      Transform the geometries to pixel coordinates once, bin them    */
+/*      to output tiles from their extent, then burn the tiles in       */
+/*      worker threads. Tiles without geometries are neither read nor   */
+/*      written.                                                        */
+/************************************************************************/
+
+static CPLErr
+GDALRasterizeGeometriesTiled( GDALDataset *poDS,
+                              int nBandCount, int *panBandList,
+                              GDALDataType eType,
+                              int nGeomCount, const OGRGeometryH *pahGeometries,
+                              GDALTransformerFunc pfnTransformer,
+                              void *pTransformArg,
+                              const double *padfGeomBurnValue,
+                              int bAllTouched,
+                              GDALBurnValueSrc eBurnValueSource,
+                              GDALRasterMergeAlg eMergeAlg,
+                              int nThreads,
+                              GDALProgressFunc pfnProgress,
+                              void *pProgressArg )
+{
+    const int nXSize = poDS->GetRasterXSize();
+    const int nYSize = poDS->GetRasterYSize();
+    int nXBlockSize = 0;
+    int nYBlockSize = 0;
+    poDS->GetRasterBand(panBandList[0])->GetBlockSize(&nXBlockSize,
+                                                      &nYBlockSize);
+    const int nTileXSize = GDALRasterizeTileSize(nXBlockSize, nXSize);
+    const int nTileYSize = GDALRasterizeTileSize(nYBlockSize, nYSize);
+    const int nTilesX = (nXSize + nTileXSize - 1) / nTileXSize;
+    const int nTilesY = (nYSize + nTileYSize - 1) / nTileYSize;
+
+    pfnProgress( 0.0, nullptr, pProgressArg );
+
+/* -------------------------------------------------------------------- */
+/*      Collect the rings of the geometries in pixel coordinates, and   */
+/*      bin the geometries, in their order, to the tiles covering the   */
+/*      extent of their points, with a margin of one pixel.             */
+/* -------------------------------------------------------------------- */
+    std::vector<GDALRasterizeTileShape> aoShapes;
+    std::vector<std::vector<int>> aanTileGeoms;
+    try
+    {
+        aoShapes.resize(nGeomCount);
+        aanTileGeoms.resize(static_cast<size_t>(nTilesX) * nTilesY);
+        std::vector<int> anSuccess;
+
+        for( int iShape = 0; iShape < nGeomCount; iShape++ )
+        {
+            OGRGeometry *poShape =
+                reinterpret_cast<OGRGeometry *>(pahGeometries[iShape]);
+            if( poShape == nullptr || poShape->IsEmpty() )
+                continue;
+
+            GDALRasterizeTileShape &oShape = aoShapes[iShape];
+            std::vector<double> &aPointX = oShape.aPointX;
+            std::vector<double> &aPointY = oShape.aPointY;
+            oShape.eFlatType = wkbFlatten(poShape->getGeometryType());
+            GDALCollectRingsFromGeometry( poShape, aPointX, aPointY,
+                                          oShape.aPointVariant,
+                                          oShape.aPartSize,
+                                          eBurnValueSource );
+            if( aPointX.empty() )
+                continue;
+
+            if( pfnTransformer != nullptr )
+            {
+                anSuccess.resize(aPointX.size());
+                pfnTransformer( pTransformArg, FALSE,
+                                static_cast<int>(aPointX.size()),
+                                &(aPointX[0]), &(aPointY[0]), nullptr,
+                                &(anSuccess[0]) );
+                GDALRasterizeRemoveFailedPoints( &(anSuccess[0]),
+                                                 aPointX, aPointY,
+                                                 oShape.aPointVariant,
+                                                 oShape.aPartSize );
+                if( aPointX.empty() )
+                {
+                    oShape = GDALRasterizeTileShape();
+                    continue;
+                }
+            }
+
+            double dfMinX = std::numeric_limits<double>::max();
+            double dfMinY = std::numeric_limits<double>::max();
+            double dfMaxX = -std::numeric_limits<double>::max();
+            double dfMaxY = -std::numeric_limits<double>::max();
+            for( size_t i = 0; i < aPointX.size(); i++ )
+            {
+                if( !CPLIsFinite(aPointX[i]) || !CPLIsFinite(aPointY[i]) )
+                    continue;
+                dfMinX = std::min(dfMinX, aPointX[i]);
+                dfMinY = std::min(dfMinY, aPointY[i]);
+                dfMaxX = std::max(dfMaxX, aPointX[i]);
+                dfMaxY = std::max(dfMaxY, aPointY[i]);
+            }
+            if( dfMaxX < -1.0 || dfMinX > nXSize + 1.0 ||
+                dfMaxY < -1.0 || dfMinY > nYSize + 1.0 )
+            {
+                oShape = GDALRasterizeTileShape();
+                continue;
+            }
+
+            const int nMinTileX = static_cast<int>(
+                std::max(0.0, floor(dfMinX) - 1) / nTileXSize);
+            const int nMinTileY = static_cast<int>(
+                std::max(0.0, floor(dfMinY) - 1) / nTileYSize);
+            const int nMaxTileX = static_cast<int>(
+                std::min(nXSize - 1.0, floor(dfMaxX) + 1) / nTileXSize);
+            const int nMaxTileY = static_cast<int>(
+                std::min(nYSize - 1.0, floor(dfMaxY) + 1) / nTileYSize);
+
+            for( int iTileY = nMinTileY; iTileY <= nMaxTileY; iTileY++ )
+            {
+                for( int iTileX = nMinTileX; iTileX <= nMaxTileX; iTileX++ )
+                {
+                    aanTileGeoms[static_cast<size_t>(iTileY) * nTilesX +
+                                 iTileX].push_back(iShape);
+                }
+            }
+        }
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALRasterizeGeometries()" );
+        return CE_Failure;
+    }
+
+    GDALRasterizeTileContext sContext;
+    sContext.poDS = poDS;
+    sContext.nBandCount = nBandCount;
+    sContext.panBandList = panBandList;
+    sContext.eType = eType;
+    sContext.paoShapes = &aoShapes;
+    sContext.padfGeomBurnValue = padfGeomBurnValue;
+    sContext.bAllTouched = bAllTouched;
+    sContext.eBurnValueSource = eBurnValueSource;
+    sContext.eMergeAlg = eMergeAlg;
+
+    std::vector<GDALRasterizeTileJob> asJobs;
+    for( int iTileY = 0; iTileY < nTilesY; iTileY++ )
+    {
+        for( int iTileX = 0; iTileX < nTilesX; iTileX++ )
+        {
+            const std::vector<int> &anGeoms =
+                aanTileGeoms[static_cast<size_t>(iTileY) * nTilesX + iTileX];
+            if( anGeoms.empty() )
+                continue;
+            GDALRasterizeTileJob sJob;
+            sJob.psContext = &sContext;
+            sJob.nXOff = iTileX * nTileXSize;
+            sJob.nYOff = iTileY * nTileYSize;
+            sJob.nXSize = std::min(nTileXSize, nXSize - sJob.nXOff);
+            sJob.nYSize = std::min(nTileYSize, nYSize - sJob.nYOff);
+            sJob.panGeoms = &anGeoms;
+            asJobs.push_back(sJob);
+        }
+    }
+
+    CPLDebug( "GDAL", "Rasterizer operating on %d tiles of %dx%d pixels "
+              "with %d thread(s).",
+              static_cast<int>(asJobs.size()), nTileXSize, nTileYSize,
+              nThreads );
+
+/* -------------------------------------------------------------------- */
+/*      Process the tiles by batches, reporting progress in between.    */
+/* -------------------------------------------------------------------- */
+    CPLWorkerThreadPool oPool;
+    CPLErr eErr = CE_None;
+    if( nThreads > 1 && !oPool.Setup( nThreads, nullptr, nullptr ) )
+        eErr = CE_Failure;
+
+    const int nJobs = static_cast<int>(asJobs.size());
+    const int nBatchSize = 4 * nThreads;
+    for( int iJobStart = 0; eErr == CE_None && iJobStart < nJobs;
+         iJobStart += nBatchSize )
+    {
+        const int nBatchJobs = std::min(nBatchSize, nJobs - iJobStart);
+        if( nThreads > 1 )
+        {
+            std::vector<void*> apJobData;
+            for( int i = iJobStart; i < iJobStart + nBatchJobs; i++ )
+                apJobData.push_back(&asJobs[i]);
+            oPool.SubmitJobs( GDALRasterizeTileJob::Run, apJobData );
+            oPool.WaitCompletion();
+        }
+        else
+        {
+            for( int i = iJobStart; i < iJobStart + nBatchJobs; i++ )
+                GDALRasterizeTileJob::Run( &asJobs[i] );
+        }
+
+        for( int i = iJobStart; eErr == CE_None && i < iJobStart + nBatchJobs;
+             i++ )
+        {
+            eErr = asJobs[i].eErr;
+        }
+
+        if( eErr == CE_None &&
+            !pfnProgress( (iJobStart + nBatchJobs) / static_cast<double>(nJobs),
+                          "", pProgressArg ) )
+        {
+            CPLError( CE_Failure, CPLE_UserInterrupt, "User terminated" );
+            eErr = CE_Failure;
+        }
+    }
+
+    if( eErr == CE_None && nJobs == 0 )
+        pfnProgress( 1.0, "", pProgressArg );
+
+/* -------------------------------------------------------------------- */
+/*      Cleanup.                                                        */
+/* -------------------------------------------------------------------- */
+    if( sContext.hMutex )
+        CPLDestroyMutex( sContext.hMutex );
+
+    return eErr;
+}
+
 /************************************************************************/
 /*                      GDALRasterizeGeometries()                       */
 /************************************************************************/
@@ -667,6 +1197,13 @@ static CPLErr GDALRasterizeOptions( char **papszOptions,
  * used. Default size will be estimated based on the GDAL cache buffer size
  * using formula: cache_size_bytes/scanline_size_bytes, so the chunk will
  * not exceed the cache. Not used in OPTIM=RASTER mode.</li>
+ * <li>"NUM_THREADS": (GDAL &gt;= 3.1) Number of worker threads, or ALL_CPUS.
+ * When set, the geometries are transformed to pixel coordinates once and
+ * assigned to output tiles from their extent, and the tiles are burnt in
+ * parallel. Tiles that no geometry intersects are neither read nor written.
+ * Geometries are burnt in their original order within a tile, so the result
+ * does not depend on the number of threads.
+ * OPTIM and CHUNKYSIZE are ignored in that mode.</li>
  * </ul>
  * @param pfnProgress the progress function to report completion.
  * @param pProgressArg callback data for progress function.
@@ -801,6 +1338,25 @@ CPLErr GDALRasterizeGeometries( GDALDatasetH hDS,
         }
     }
 
+/* -------------------------------------------------------------------- */
+/*      Rasterize by tiles in worker threads if requested.              */
+/* -------------------------------------------------------------------- */
+    const int nThreads = GDALRasterizeGetNumThreads( papszOptions );
+    if( nThreads > 0 )
+    {
+        const CPLErr eErr = GDALRasterizeGeometriesTiled(
+            poDS, nBandCount, panBandList,
+            GDALGetNonComplexDataType(poBand->GetRasterDataType()),
+            nGeomCount, pahGeometries, pfnTransformer, pTransformArg,
+            padfGeomBurnValue, bAllTouched, eBurnValueSource, eMergeAlg,
+            nThreads, pfnProgress, pProgressArg );
+
+        if( bNeedToFreeTransformer )
+            GDALDestroyTransformer( pTransformArg );
+
+        return eErr;
+    }
+
 /* -------------------------------------------------------------------- */
 /*      Choice of optimisation in auto mode. Use vector optim :         */
 /*      1) if output is tiled                                           */
@@ -1137,6 +1693,13 @@ CPLErr GDALRasterizeGeometries( GDALDatasetH hDS,
  * <li>"MERGE_ALG": May be REPLACE (the default) or ADD.  REPLACE results in
  * overwriting of value, while ADD adds the new value to the existing raster,
  * suitable for heatmaps for instance.</li>
+ * <li>"NUM_THREADS": (GDAL &gt;= 3.1) Number of worker threads, or ALL_CPUS.
+ * When set, the geometries of each layer are loaded in memory, transformed to
+ * pixel coordinates once, assigned to output tiles from their extent, and the
+ * tiles are burnt in parallel. Tiles that no geometry intersects are neither
+ * read nor written. Features are burnt in their original order within a tile,
+ * so the result does not depend on the number of threads. CHUNKYSIZE is
+ * ignored in that mode.</li>
  * </ul>
  * @param pfnProgress the progress function to report completion.
  * @param pProgressArg callback data for progress function.
@@ -1216,21 +1779,26 @@ CPLErr GDALRasterizeLayers( GDALDatasetH hDS,
     if( nYChunkSize > poDS->GetRasterYSize() )
         nYChunkSize = poDS->GetRasterYSize();
 
-    CPLDebug( "GDAL", "Rasterizer operating on %d swaths of %d scanlines.",
-              (poDS->GetRasterYSize() + nYChunkSize - 1) / nYChunkSize,
-              nYChunkSize );
-    unsigned char *pabyChunkBuf = static_cast<unsigned char *>(
-        VSI_MALLOC2_VERBOSE(nYChunkSize, nScanlineBytes));
-    if( pabyChunkBuf == nullptr )
+    const int nThreads = GDALRasterizeGetNumThreads( papszOptions );
+    unsigned char *pabyChunkBuf = nullptr;
+    if( nThreads == 0 )
     {
-        return CE_Failure;
+        CPLDebug( "GDAL", "Rasterizer operating on %d swaths of %d scanlines.",
+                  (poDS->GetRasterYSize() + nYChunkSize - 1) / nYChunkSize,
+                  nYChunkSize );
+        pabyChunkBuf = static_cast<unsigned char *>(
+            VSI_MALLOC2_VERBOSE(nYChunkSize, nScanlineBytes));
+        if( pabyChunkBuf == nullptr )
+        {
+            return CE_Failure;
+        }
     }
 
 /* -------------------------------------------------------------------- */
 /*      Read the image once for all layers if user requested to render  */
 /*      the whole raster in single chunk.                               */
 /* -------------------------------------------------------------------- */
-    if( nYChunkSize == poDS->GetRasterYSize() )
+    if( nThreads == 0 && nYChunkSize == poDS->GetRasterYSize() )
     {
         if( poDS->RasterIO( GF_Read, 0, 0, poDS->GetRasterXSize(),
                             nYChunkSize, pabyChunkBuf,
@@ -1347,6 +1915,60 @@ CPLErr GDALRasterizeLayers( GDALDatasetH hDS,
 
         poLayer->ResetReading();
 
+/* -------------------------------------------------------------------- */
+/*      Rasterize by tiles in worker threads if requested. This needs   */
+/*      all the geometries of the layer in memory.                      */
+/* -------------------------------------------------------------------- */
+        if( nThreads > 0 )
+        {
+            std::vector<OGRGeometryH> ahGeometries;
+            std::vector<double> adfBurnValues;
+            OGRFeature *poFeat = nullptr;
+            while( (poFeat = poLayer->GetNextFeature()) != nullptr )
+            {
+                OGRGeometry *poGeom = poFeat->StealGeometry();
+                if( poGeom != nullptr )
+                {
+                    ahGeometries.push_back(
+                        reinterpret_cast<OGRGeometryH>(poGeom));
+                    for( int iBand = 0 ; iBand < nBandCount ; iBand++)
+                    {
+                        adfBurnValues.push_back(
+                            pszBurnAttribute ?
+                                poFeat->GetFieldAsDouble( iBurnField ) :
+                                padfBurnValues[iBand] );
+                    }
+                }
+                delete poFeat;
+            }
+
+            void *pScaledProgress = GDALCreateScaledProgress(
+                iLayer / static_cast<double>(nLayerCount),
+                (iLayer + 1) / static_cast<double>(nLayerCount),
+                pfnProgress, pProgressArg );
+            if( eErr == CE_None && !ahGeometries.empty() )
+            {
+                eErr = GDALRasterizeGeometriesTiled(
+                    poDS, nBandCount, panBandList, eType,
+                    static_cast<int>(ahGeometries.size()), &ahGeometries[0],
+                    pfnTransformer, pTransformArg, &adfBurnValues[0],
+                    bAllTouched, eBurnValueSource, eMergeAlg, nThreads,
+                    GDALScaledProgress, pScaledProgress );
+            }
+            GDALDestroyScaledProgress( pScaledProgress );
+
+            for( OGRGeometryH hGeom: ahGeometries )
+                OGR_G_DestroyGeometry( hGeom );
+
+            if( bNeedToFreeTransformer )
+            {
+                GDALDestroyTransformer( pTransformArg );
+                pTransformArg = nullptr;
+                pfnTransformer = nullptr;
+            }
+            continue;
+        }
+
 /* -------------------------------------------------------------------- */
 /*      Loop over image in designated chunks.                           */
 /* -------------------------------------------------------------------- */
@@ -1441,7 +2063,8 @@ CPLErr GDALRasterizeLayers( GDALDatasetH hDS,
 /*      Write out the image once for all layers if user requested       */
 /*      to render the whole raster in single chunk.                     */
 /* -------------------------------------------------------------------- */
-    if( eErr == CE_None && nYChunkSize == poDS->GetRasterYSize() )
+    if( eErr == CE_None && nThreads == 0 &&
+        nYChunkSize == poDS->GetRasterYSize() )
     {
         eErr = poDS->RasterIO( GF_Write, 0, 0,
                                 poDS->GetRasterXSize(), nYChunkSize,
@@ -33,14 +33,20 @@
 #include <cstring>
 
 #include <algorithm>
+#include <map>
+#include <memory>
+#include <new>
 #include <set>
 #include <vector>
 #include <utility>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
+#include "cpl_multiproc.h"
 #include "cpl_progress.h"
+#include "cpl_string.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 #include "gdal.h"
 #include "gdal_alg_priv.h"
 
@@ -146,6 +152,995 @@ static inline void CompareNeighbour( int nPolyId1, int nPolyId2,
         anBigNeighbour[nPolyId2] = nPolyId1;
 }
 
+/************************************************************************/
+/*                              GSOutcome                               */
+/*                                                                      */
+/*      What happens to the pixels of a polygon when processing by      */
+/*      strips: they keep their value, take a new value, or follow a    */
+/*      polygon whose fate is only known once all the strips have been */
+/*      stitched.                                                       */
+/************************************************************************/
+
+enum GSOutcomeKind
+{
+    GS_KEEP,
+    GS_REPLACE,
+    GS_DEFER
+};
+
+struct GSOutcome
+{
+    GSOutcomeKind eKind = GS_KEEP;
+    GInt32        nValue = 0;   // New pixel value, for GS_REPLACE.
+    int           nRef = -1;    // Polygon or node to follow, for GS_DEFER.
+};
+
+/************************************************************************/
+/*                             GSNeighbour                              */
+/*                                                                      */
+/*      A candidate biggest neighbour. Ties between neighbours of the   */
+/*      same size are broken by the scan position of their first        */
+/*      contact, as CompareNeighbour() does over the whole raster.      */
+/************************************************************************/
+
+struct GSNeighbour
+{
+    int           nSize = -1;   // -1 if there is no neighbour.
+    GIntBig       nKey = 0;
+    GSOutcome     sOutcome{};
+};
+
+static bool GSIsBigger( const GSNeighbour &sA, const GSNeighbour &sB )
+{
+    return sA.nSize > sB.nSize || (sA.nSize == sB.nSize && sA.nKey < sB.nKey);
+}
+
+/************************************************************************/
+/*                            GSContactKey()                            */
+/*                                                                      */
+/*      Scan position of a comparison between pixel (iX, iY) and one   */
+/*      of its neighbours: 0 above, 1 above left, 2 above right and 3   */
+/*      left, in the order of GDALSieveFilter().                        */
+/************************************************************************/
+
+static GIntBig GSContactKey( int nXSize, int iY, int iX, int iNeighbour )
+{
+    return (static_cast<GIntBig>(iY) * nXSize + iX) * 4 + iNeighbour;
+}
+
+static GIntBig GSAddSizes( GIntBig nSize1, GIntBig nSize2 )
+{
+    return std::min(nSize1 + nSize2, static_cast<GIntBig>(MY_MAX_INT));
+}
+
+/************************************************************************/
+/*                                GSNode                                */
+/*                                                                      */
+/*      A polygon of a strip whose fate depends on other strips: it     */
+/*      touches a strip boundary, or it is smaller than the threshold   */
+/*      and has such a polygon as neighbour.                            */
+/************************************************************************/
+
+struct GSNode
+{
+    GInt32        nId = -1;      // Polygon id in its strip.
+    int           nSize = 0;     // Size within its strip.
+    GInt32        nValue = 0;
+
+    // Biggest neighbour entirely inside the strip.
+    GSNeighbour   sBestInner{};
+
+    // Neighbours touching a strip boundary, with the scan position of
+    // the first contact. Polygon ids in the strip job, node indices in
+    // the stitcher.
+    std::vector<std::pair<int, GIntBig>> anBoundaryNeighbours{};
+};
+
+/************************************************************************/
+/*                              GSStripJob                              */
+/************************************************************************/
+
+struct GSStripJob
+{
+    // Inputs.
+    GDALRasterBandH  hSrcBand = nullptr;
+    GDALRasterBandH  hMaskBand = nullptr;
+    GDALRasterBandH  hDstBand = nullptr;
+    CPLMutex       **phIOMutex = nullptr;
+    int              nSizeThreshold = 0;
+    int              nConnectedness = 4;
+    int              nXSize = 0;
+    int              nYOff = 0;
+    int              nYSize = 0;
+    bool             bTopBoundary = false;
+    bool             bBottomBoundary = false;
+
+    // New values of the nodes of the strip, by polygon id, once all the
+    // strips have been stitched.
+    std::map<GInt32, GInt32> oMapNodeValues{};
+
+    // Outputs.
+    CPLErr           eErr = CE_None;
+
+    // Polygon ids and values of the first and last lines of the strip,
+    // when they are a strip boundary.
+    std::vector<GInt32> anTopLineId{};
+    std::vector<GInt32> anTopLineVal{};
+    std::vector<GInt32> anBottomLineId{};
+    std::vector<GInt32> anBottomLineVal{};
+
+    std::vector<GSNode> asNodes{};
+
+    GSStripJob() = default;
+
+    CPLErr      ReadLine( int iY, GInt32 *panImageLine, GByte *pabyMaskLine,
+                          GInt32 *panUnmaskedLine = nullptr );
+    void        Analyze( GDALRasterPolygonEnumerator &oFirstEnum,
+                         std::vector<GSOutcome> &asOutcomes,
+                         bool bCollectNodes );
+    void        Apply();
+
+    static void RunAnalyze( void *pData );
+    static void RunApply( void *pData );
+
+  private:
+    CPL_DISALLOW_COPY_ASSIGN(GSStripJob)
+};
+
+/************************************************************************/
+/*                       GSStripJob::ReadLine()                         */
+/*                                                                      */
+/*      Read a line of the strip. The bands are shared by all jobs, so  */
+/*      reads are serialized.                                           */
+/************************************************************************/
+
+CPLErr GSStripJob::ReadLine( int iY, GInt32 *panImageLine,
+                             GByte *pabyMaskLine, GInt32 *panUnmaskedLine )
+{
+    CPLMutexHolderD(phIOMutex);
+
+    CPLErr eErrLine = GDALRasterIO( hSrcBand, GF_Read, 0, nYOff + iY,
+                                    nXSize, 1, panImageLine, nXSize, 1,
+                                    GDT_Int32, 0, 0 );
+
+    if( eErrLine == CE_None && panUnmaskedLine != nullptr )
+        memcpy( panUnmaskedLine, panImageLine, sizeof(GInt32) * nXSize );
+
+    if( eErrLine == CE_None && hMaskBand != nullptr )
+        eErrLine = GPMaskImageData( hMaskBand, pabyMaskLine, nYOff + iY,
+                                    nXSize, panImageLine );
+
+    return eErrLine;
+}
+
+/************************************************************************/
+/*                       GSStripJob::Analyze()                          */
+/*                                                                      */
+/*      Same first two passes as GDALSieveFilter(), restricted to the   */
+/*      lines of the strip. The polygons touching a strip boundary     */
+/*      have an unknown final size, so they are not candidates for the */
+/*      biggest neighbour of other polygons here: their neighbours are */
+/*      collected in nodes instead. The outcome of every other polygon  */
+/*      smaller than the threshold is then resolved as far as possible  */
+/*      within the strip.                                               */
+/************************************************************************/
+
+void GSStripJob::Analyze( GDALRasterPolygonEnumerator &oFirstEnum,
+                          std::vector<GSOutcome> &asOutcomes,
+                          bool bCollectNodes )
+{
+    std::vector<GInt32> anLastLineValV(nXSize);
+    std::vector<GInt32> anThisLineValV(nXSize);
+    std::vector<GInt32> anLastLineIdV(nXSize);
+    std::vector<GInt32> anThisLineIdV(nXSize);
+    std::vector<GByte> abyMaskLine(hMaskBand != nullptr ? nXSize : 0);
+
+    GInt32 *panLastLineVal = anLastLineValV.data();
+    GInt32 *panThisLineVal = anThisLineValV.data();
+    GInt32 *panLastLineId = anLastLineIdV.data();
+    GInt32 *panThisLineId = anThisLineIdV.data();
+    GByte *pabyMaskLine = abyMaskLine.empty() ? nullptr : abyMaskLine.data();
+
+/* -------------------------------------------------------------------- */
+/*      First pass to build the polygon id map and polygon sizes of     */
+/*      the strip.                                                      */
+/* -------------------------------------------------------------------- */
+    std::vector<int> anPolySizes;
+
+    for( int iY = 0; iY < nYSize; iY++ )
+    {
+        eErr = ReadLine( iY, panThisLineVal, pabyMaskLine );
+        if( eErr != CE_None )
+            return;
+
+        if( iY == 0 )
+            oFirstEnum.ProcessLine(
+                nullptr, panThisLineVal, nullptr, panThisLineId, nXSize );
+        else
+            oFirstEnum.ProcessLine(
+                panLastLineVal, panThisLineVal,
+                panLastLineId,  panThisLineId,
+                nXSize );
+
+        if( iY == 0 && bTopBoundary )
+        {
+            anTopLineId.assign(panThisLineId, panThisLineId + nXSize);
+            anTopLineVal.assign(panThisLineVal, panThisLineVal + nXSize);
+        }
+        if( iY == nYSize - 1 && bBottomBoundary )
+        {
+            anBottomLineId.assign(panThisLineId, panThisLineId + nXSize);
+            anBottomLineVal.assign(panThisLineVal, panThisLineVal + nXSize);
+        }
+
+        if( oFirstEnum.nNextPolygonId > static_cast<int>(anPolySizes.size()) )
+            anPolySizes.resize( oFirstEnum.nNextPolygonId );
+
+        for( int iX = 0; iX < nXSize; iX++ )
+        {
+            const int iPoly = panThisLineId[iX];
+
+            if( iPoly >= 0 && anPolySizes[iPoly] < MY_MAX_INT )
+                anPolySizes[iPoly] += 1;
+        }
+
+        std::swap(panLastLineVal, panThisLineVal);
+        std::swap(panLastLineId, panThisLineId);
+    }
+
+    oFirstEnum.CompleteMerges();
+
+    const int nPolys = oFirstEnum.nNextPolygonId;
+    const GInt32 *panPolyIdMap = oFirstEnum.panPolyIdMap;
+
+    for( int iPoly = 0; iPoly < nPolys; iPoly++ )
+    {
+        if( panPolyIdMap[iPoly] != iPoly )
+        {
+            anPolySizes[panPolyIdMap[iPoly]] = static_cast<int>(
+                GSAddSizes(anPolySizes[panPolyIdMap[iPoly]],
+                           anPolySizes[iPoly]));
+            anPolySizes[iPoly] = 0;
+        }
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Flag the polygons touching a strip boundary.                    */
+/* -------------------------------------------------------------------- */
+    std::vector<bool> abBoundary(nPolys, false);
+    for( std::vector<GInt32> *panLineId: { &anTopLineId, &anBottomLineId } )
+    {
+        for( GInt32 &nId: *panLineId )
+        {
+            if( nId >= 0 )
+            {
+                nId = panPolyIdMap[nId];
+                abBoundary[nId] = true;
+            }
+        }
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Second pass to identify the biggest neighbour inside the strip  */
+/*      of each polygon, and the first contacts of the polygons         */
+/*      smaller than the threshold with boundary polygons.              */
+/* -------------------------------------------------------------------- */
+    GDALRasterPolygonEnumerator oSecondEnum( nConnectedness );
+    std::vector<int> anBigNeighbour(nPolys, -1);
+    std::vector<GIntBig> anBigNeighbourKey(nPolys, 0);
+    std::map<std::pair<int, int>, GIntBig> oMapBoundaryContacts;
+
+    const auto UpdateNeighbour =
+        [&]( int nPolyId, int nOtherId, GIntBig nKey )
+    {
+        if( abBoundary[nOtherId] )
+        {
+            // Contacts are visited in scan order, so the first one is kept.
+            if( anPolySizes[nPolyId] < nSizeThreshold )
+                oMapBoundaryContacts.insert(
+                    std::make_pair(std::make_pair(nPolyId, nOtherId), nKey));
+        }
+        else if( anBigNeighbour[nPolyId] == -1
+                 || anPolySizes[anBigNeighbour[nPolyId]] <
+                                                    anPolySizes[nOtherId] )
+        {
+            anBigNeighbour[nPolyId] = nOtherId;
+            anBigNeighbourKey[nPolyId] = nKey;
+        }
+    };
+
+    const auto CompareNeighbours =
+        [&]( int nPolyId1, int nPolyId2, int iY, int iX, int iNeighbour )
+    {
+        if( nPolyId1 < 0 || nPolyId2 < 0 )
+            return;
+
+        nPolyId1 = panPolyIdMap[nPolyId1];
+        nPolyId2 = panPolyIdMap[nPolyId2];
+
+        if( nPolyId1 == nPolyId2 )
+            return;
+
+        const GIntBig nKey = GSContactKey(nXSize, nYOff + iY, iX, iNeighbour);
+        UpdateNeighbour( nPolyId1, nPolyId2, nKey );
+        UpdateNeighbour( nPolyId2, nPolyId1, nKey );
+    };
+
+    for( int iY = 0; iY < nYSize; iY++ )
+    {
+        eErr = ReadLine( iY, panThisLineVal, pabyMaskLine );
+        if( eErr != CE_None )
+            return;
+
+        if( iY == 0 )
+            oSecondEnum.ProcessLine(
+                nullptr, panThisLineVal, nullptr, panThisLineId, nXSize );
+        else
+            oSecondEnum.ProcessLine(
+                panLastLineVal, panThisLineVal,
+                panLastLineId,  panThisLineId,
+                nXSize );
+
+        for( int iX = 0; iX < nXSize; iX++ )
+        {
+            if( iY > 0 )
+            {
+                CompareNeighbours( panThisLineId[iX], panLastLineId[iX],
+                                   iY, iX, 0 );
+
+                if( iX > 0 && nConnectedness == 8 )
+                    CompareNeighbours( panThisLineId[iX],
+                                       panLastLineId[iX-1], iY, iX, 1 );
+
+                if( iX < nXSize-1 && nConnectedness == 8 )
+                    CompareNeighbours( panThisLineId[iX],
+                                       panLastLineId[iX+1], iY, iX, 2 );
+            }
+
+            if( iX > 0 )
+                CompareNeighbours( panThisLineId[iX], panThisLineId[iX-1],
+                                   iY, iX, 3 );
+        }
+
+        std::swap(panLastLineVal, panThisLineVal);
+        std::swap(panLastLineId, panThisLineId);
+    }
+
+/* -------------------------------------------------------------------- */
+/*      The nodes are the boundary polygons and the polygons with a     */
+/*      boundary polygon as neighbour. Their outcome is decided by the  */
+/*      stitcher.                                                       */
+/* -------------------------------------------------------------------- */
+    std::vector<bool> abNode(abBoundary);
+    for( const auto &oContact: oMapBoundaryContacts )
+        abNode[oContact.first.first] = true;
+
+    asOutcomes.assign(nPolys, GSOutcome());
+    std::vector<GByte> abyState(nPolys, 0);  // 1 = walked, 2 = resolved.
+
+    for( int iPoly = 0; iPoly < nPolys; iPoly++ )
+    {
+        if( panPolyIdMap[iPoly] == iPoly && abNode[iPoly] )
+        {
+            asOutcomes[iPoly].eKind = GS_DEFER;
+            asOutcomes[iPoly].nRef = iPoly;
+            abyState[iPoly] = 2;
+        }
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Walk through the biggest neighbours of the other polygons       */
+/*      smaller than the threshold, until a polygon large enough or a   */
+/*      node is found.                                                  */
+/* -------------------------------------------------------------------- */
+    std::vector<int> anPath;
+    for( int iPoly = 0; iPoly < nPolys; iPoly++ )
+    {
+        if( panPolyIdMap[iPoly] != iPoly || abyState[iPoly] == 2 ||
+            anPolySizes[iPoly] >= nSizeThreshold )
+            continue;
+
+        GSOutcome sOutcome;
+        int iCurPoly = iPoly;
+        while( true )
+        {
+            if( abyState[iCurPoly] == 2 )
+            {
+                sOutcome = asOutcomes[iCurPoly];
+                break;
+            }
+            // Cycle on an already visited polygon.
+            if( abyState[iCurPoly] == 1 )
+                break;
+            abyState[iCurPoly] = 1;
+            anPath.push_back(iCurPoly);
+
+            const int iNextPoly = anBigNeighbour[iCurPoly];
+            if( iNextPoly < 0 )
+                break;
+            if( anPolySizes[iNextPoly] >= nSizeThreshold )
+            {
+                sOutcome.eKind = GS_REPLACE;
+                sOutcome.nValue = oFirstEnum.panPolyValue[iNextPoly];
+                break;
+            }
+            iCurPoly = iNextPoly;
+        }
+
+        for( const int iPathPoly: anPath )
+        {
+            asOutcomes[iPathPoly] = sOutcome;
+            abyState[iPathPoly] = 2;
+        }
+        anPath.clear();
+    }
+
+    if( !bCollectNodes )
+        return;
+
+/* -------------------------------------------------------------------- */
+/*      Collect the nodes.                                              */
+/* -------------------------------------------------------------------- */
+    std::vector<int> anNodeIndex(nPolys, -1);
+    for( int iPoly = 0; iPoly < nPolys; iPoly++ )
+    {
+        if( panPolyIdMap[iPoly] != iPoly || !abNode[iPoly] )
+            continue;
+
+        GSNode sNode;
+        sNode.nId = iPoly;
+        sNode.nSize = anPolySizes[iPoly];
+        sNode.nValue = oFirstEnum.panPolyValue[iPoly];
+
+        const int iBigPoly = anBigNeighbour[iPoly];
+        if( iBigPoly >= 0 )
+        {
+            sNode.sBestInner.nSize = anPolySizes[iBigPoly];
+            sNode.sBestInner.nKey = anBigNeighbourKey[iPoly];
+            if( anPolySizes[iBigPoly] >= nSizeThreshold )
+            {
+                sNode.sBestInner.sOutcome.eKind = GS_REPLACE;
+                sNode.sBestInner.sOutcome.nValue =
+                    oFirstEnum.panPolyValue[iBigPoly];
+            }
+            else
+            {
+                sNode.sBestInner.sOutcome = asOutcomes[iBigPoly];
+            }
+        }
+
+        anNodeIndex[iPoly] = static_cast<int>(asNodes.size());
+        asNodes.push_back(std::move(sNode));
+    }
+
+    for( const auto &oContact: oMapBoundaryContacts )
+    {
+        asNodes[anNodeIndex[oContact.first.first]].anBoundaryNeighbours.
+            emplace_back(oContact.first.second, oContact.second);
+    }
+}
+
+/************************************************************************/
+/*                        GSStripJob::Apply()                           */
+/*                                                                      */
+/*      Redo the analysis of the strip, then a third pass remapping     */
+/*      the pixel values, with the new values of the nodes decided by   */
+/*      the stitcher.                                                   */
+/************************************************************************/
+
+void GSStripJob::Apply()
+{
+    GDALRasterPolygonEnumerator oFirstEnum( nConnectedness );
+    std::vector<GSOutcome> asOutcomes;
+
+    Analyze( oFirstEnum, asOutcomes, false );
+    if( eErr != CE_None )
+        return;
+
+    for( GSOutcome &sOutcome: asOutcomes )
+    {
+        if( sOutcome.eKind == GS_DEFER )
+        {
+            const auto oIter = oMapNodeValues.find(sOutcome.nRef);
+            if( oIter == oMapNodeValues.end() )
+            {
+                sOutcome.eKind = GS_KEEP;
+            }
+            else
+            {
+                sOutcome.eKind = GS_REPLACE;
+                sOutcome.nValue = oIter->second;
+            }
+        }
+    }
+
+    std::vector<GInt32> anLastLineValV(nXSize);
+    std::vector<GInt32> anThisLineValV(nXSize);
+    std::vector<GInt32> anLastLineIdV(nXSize);
+    std::vector<GInt32> anThisLineIdV(nXSize);
+    std::vector<GInt32> anThisLineWriteValV(nXSize);
+    std::vector<GByte> abyMaskLine(hMaskBand != nullptr ? nXSize : 0);
+
+    GInt32 *panLastLineVal = anLastLineValV.data();
+    GInt32 *panThisLineVal = anThisLineValV.data();
+    GInt32 *panLastLineId = anLastLineIdV.data();
+    GInt32 *panThisLineId = anThisLineIdV.data();
+    GInt32 *panThisLineWriteVal = anThisLineWriteValV.data();
+    GByte *pabyMaskLine = abyMaskLine.empty() ? nullptr : abyMaskLine.data();
+
+    GDALRasterPolygonEnumerator oSecondEnum( nConnectedness );
+
+    for( int iY = 0; iY < nYSize; iY++ )
+    {
+        eErr = ReadLine( iY, panThisLineVal, pabyMaskLine,
+                         panThisLineWriteVal );
+        if( eErr != CE_None )
+            return;
+
+        if( iY == 0 )
+            oSecondEnum.ProcessLine(
+                nullptr, panThisLineVal, nullptr, panThisLineId, nXSize );
+        else
+            oSecondEnum.ProcessLine(
+                panLastLineVal, panThisLineVal,
+                panLastLineId,  panThisLineId,
+                nXSize );
+
+        for( int iX = 0; iX < nXSize; iX++ )
+        {
+            const int iThisPoly = panThisLineId[iX];
+            if( iThisPoly >= 0 )
+            {
+                const GSOutcome &sOutcome =
+                    asOutcomes[oFirstEnum.panPolyIdMap[iThisPoly]];
+                if( sOutcome.eKind == GS_REPLACE )
+                    panThisLineWriteVal[iX] = sOutcome.nValue;
+            }
+        }
+
+        {
+            CPLMutexHolderD(phIOMutex);
+            eErr = GDALRasterIO( hDstBand, GF_Write, 0, nYOff + iY, nXSize, 1,
+                                 panThisLineWriteVal, nXSize, 1, GDT_Int32,
+                                 0, 0 );
+        }
+        if( eErr != CE_None )
+            return;
+
+        std::swap(panLastLineVal, panThisLineVal);
+        std::swap(panLastLineId, panThisLineId);
+    }
+}
+
+/************************************************************************/
+/*                     GSStripJob::RunAnalyze()                         */
+/************************************************************************/
+
+void GSStripJob::RunAnalyze( void *pData )
+{
+    GSStripJob *psJob = static_cast<GSStripJob *>(pData);
+    try
+    {
+        GDALRasterPolygonEnumerator oFirstEnum( psJob->nConnectedness );
+        std::vector<GSOutcome> asOutcomes;
+        psJob->Analyze( oFirstEnum, asOutcomes, true );
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALSieveFilter()" );
+        psJob->eErr = CE_Failure;
+    }
+}
+
+/************************************************************************/
+/*                      GSStripJob::RunApply()                          */
+/************************************************************************/
+
+void GSStripJob::RunApply( void *pData )
+{
+    GSStripJob *psJob = static_cast<GSStripJob *>(pData);
+    try
+    {
+        psJob->Apply();
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALSieveFilter()" );
+        psJob->eErr = CE_Failure;
+    }
+}
+
+/************************************************************************/
+/*                           GSStripStitcher                            */
+/*                                                                      */
+/*      Gather the nodes of consecutive strips. Nodes of polygons       */
+/*      connected across a strip boundary are merged, and contacts      */
+/*      across the boundary are added as neighbours. Once all strips    */
+/*      are added, the biggest neighbour of each node smaller than the  */
+/*      threshold is known, and the chains of biggest neighbours are    */
+/*      followed as in GDALSieveFilter().                               */
+/************************************************************************/
+
+class GSStripStitcher
+{
+    CPL_DISALLOW_COPY_ASSIGN(GSStripStitcher)
+
+    int                     m_nSizeThreshold;
+    int                     m_nConnectedness;
+    int                     m_nXSize;
+
+    std::vector<GSNode>     m_asNodes{};
+    std::vector<int>        m_anParent{};
+    std::vector<int>        m_anStripFirstNode{};
+    std::vector<GSOutcome>  m_asFinalOutcomes{};
+
+    // Nodes and values of the last line of the previous strip.
+    std::vector<int>        m_anFrontierLineNode{};
+    std::vector<GInt32>     m_anFrontierLineVal{};
+
+    int                     FindNode( int iNode );
+    void                    MergeNodes( int iNode1, int iNode2 );
+
+  public:
+    GSStripStitcher( int nSizeThreshold, int nConnectedness, int nXSize ) :
+        m_nSizeThreshold(nSizeThreshold), m_nConnectedness(nConnectedness),
+        m_nXSize(nXSize) {}
+
+    void    AddStrip( GSStripJob *psJob );
+    void    Resolve();
+    void    GetNodeValues( int iStrip, std::map<GInt32, GInt32> &oMap );
+};
+
+int GSStripStitcher::FindNode( int iNode )
+{
+    while( m_anParent[iNode] != iNode )
+    {
+        m_anParent[iNode] = m_anParent[m_anParent[iNode]];
+        iNode = m_anParent[iNode];
+    }
+    return iNode;
+}
+
+void GSStripStitcher::MergeNodes( int iNode1, int iNode2 )
+{
+    iNode1 = FindNode(iNode1);
+    iNode2 = FindNode(iNode2);
+    if( iNode1 == iNode2 )
+        return;
+    if( iNode2 < iNode1 )
+        std::swap(iNode1, iNode2);
+
+    m_anParent[iNode2] = iNode1;
+
+    GSNode &sDst = m_asNodes[iNode1];
+    GSNode &sSrc = m_asNodes[iNode2];
+    sDst.nSize = static_cast<int>(GSAddSizes(sDst.nSize, sSrc.nSize));
+    if( GSIsBigger(sSrc.sBestInner, sDst.sBestInner) )
+        sDst.sBestInner = sSrc.sBestInner;
+    if( sDst.anBoundaryNeighbours.size() < sSrc.anBoundaryNeighbours.size() )
+        std::swap(sDst.anBoundaryNeighbours, sSrc.anBoundaryNeighbours);
+    sDst.anBoundaryNeighbours.insert(sDst.anBoundaryNeighbours.end(),
+                                     sSrc.anBoundaryNeighbours.begin(),
+                                     sSrc.anBoundaryNeighbours.end());
+    std::vector<std::pair<int, GIntBig>>().swap(sSrc.anBoundaryNeighbours);
+}
+
+/************************************************************************/
+/*                     GSStripStitcher::AddStrip()                      */
+/************************************************************************/
+
+void GSStripStitcher::AddStrip( GSStripJob *psJob )
+{
+    const int nFirstNode = static_cast<int>(m_asNodes.size());
+    m_anStripFirstNode.push_back(nFirstNode);
+
+    std::map<GInt32, int> oMapNodes;
+    for( size_t i = 0; i < psJob->asNodes.size(); i++ )
+        oMapNodes[psJob->asNodes[i].nId] = nFirstNode + static_cast<int>(i);
+
+    for( GSNode &sNode: psJob->asNodes )
+    {
+        for( auto &oNeighbour: sNode.anBoundaryNeighbours )
+            oNeighbour.first = oMapNodes[oNeighbour.first];
+        if( sNode.sBestInner.sOutcome.eKind == GS_DEFER )
+            sNode.sBestInner.sOutcome.nRef =
+                oMapNodes[sNode.sBestInner.sOutcome.nRef];
+
+        m_anParent.push_back(static_cast<int>(m_asNodes.size()));
+        m_asNodes.push_back(std::move(sNode));
+    }
+    std::vector<GSNode>().swap(psJob->asNodes);
+
+/* -------------------------------------------------------------------- */
+/*      Merge or add as neighbours the polygons across the boundary     */
+/*      with the previous strip, comparing the first line of the strip  */
+/*      to the line above it as GDALSieveFilter() does.                 */
+/* -------------------------------------------------------------------- */
+    if( psJob->bTopBoundary )
+    {
+        for( int iX = 0; iX < m_nXSize; iX++ )
+        {
+            if( psJob->anTopLineId[iX] < 0 )
+                continue;
+            const int iNode = oMapNodes[psJob->anTopLineId[iX]];
+
+            for( int iNeighbour = 0; iNeighbour < 3; iNeighbour++ )
+            {
+                const int iOtherX =
+                    iNeighbour == 0 ? iX : iNeighbour == 1 ? iX - 1 : iX + 1;
+                if( iNeighbour > 0 &&
+                    (m_nConnectedness != 8 ||
+                     iOtherX < 0 || iOtherX >= m_nXSize) )
+                    continue;
+
+                const int iOtherNode = m_anFrontierLineNode[iOtherX];
+                if( iOtherNode < 0 )
+                    continue;
+
+                if( psJob->anTopLineVal[iX] == m_anFrontierLineVal[iOtherX] )
+                {
+                    MergeNodes( iNode, iOtherNode );
+                }
+                else
+                {
+                    const GIntBig nKey = GSContactKey(m_nXSize, psJob->nYOff,
+                                                      iX, iNeighbour);
+                    m_asNodes[FindNode(iNode)].anBoundaryNeighbours.
+                        emplace_back(iOtherNode, nKey);
+                    m_asNodes[FindNode(iOtherNode)].anBoundaryNeighbours.
+                        emplace_back(iNode, nKey);
+                }
+            }
+        }
+    }
+
+    if( psJob->bBottomBoundary )
+    {
+        m_anFrontierLineNode.resize(m_nXSize);
+        for( int iX = 0; iX < m_nXSize; iX++ )
+        {
+            m_anFrontierLineNode[iX] = psJob->anBottomLineId[iX] < 0 ? -1 :
+                                       oMapNodes[psJob->anBottomLineId[iX]];
+        }
+        m_anFrontierLineVal.swap(psJob->anBottomLineVal);
+    }
+}
+
+/************************************************************************/
+/*                     GSStripStitcher::Resolve()                       */
+/************************************************************************/
+
+void GSStripStitcher::Resolve()
+{
+    const int nNodes = static_cast<int>(m_asNodes.size());
+
+/* -------------------------------------------------------------------- */
+/*      Identify the biggest neighbour of each node smaller than the    */
+/*      threshold.                                                      */
+/* -------------------------------------------------------------------- */
+    std::vector<GSOutcome> asBigNeighbour(nNodes);
+    for( int iNode = 0; iNode < nNodes; iNode++ )
+    {
+        GSNode &sNode = m_asNodes[iNode];
+        if( FindNode(iNode) != iNode || sNode.nSize >= m_nSizeThreshold )
+            continue;
+
+        GSNeighbour sBest = sNode.sBestInner;
+        for( const auto &oNeighbour: sNode.anBoundaryNeighbours )
+        {
+            const int iOtherNode = FindNode(oNeighbour.first);
+            if( iOtherNode == iNode )
+                continue;
+
+            GSNeighbour sOther;
+            sOther.nSize = m_asNodes[iOtherNode].nSize;
+            sOther.nKey = oNeighbour.second;
+            sOther.sOutcome.eKind = GS_DEFER;
+            sOther.sOutcome.nRef = iOtherNode;
+            if( GSIsBigger(sOther, sBest) )
+                sBest = sOther;
+        }
+        std::vector<std::pair<int, GIntBig>>().swap(
+            sNode.anBoundaryNeighbours);
+
+        asBigNeighbour[iNode] = sBest.sOutcome;
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Walk through the biggest neighbours until a polygon large       */
+/*      enough is found.                                                */
+/* -------------------------------------------------------------------- */
+    m_asFinalOutcomes.assign(nNodes, GSOutcome());
+    std::vector<GByte> abyState(nNodes, 0);  // 1 = walked, 2 = resolved.
+    std::vector<int> anPath;
+
+    for( int iNode = 0; iNode < nNodes; iNode++ )
+    {
+        if( FindNode(iNode) != iNode || abyState[iNode] == 2 ||
+            m_asNodes[iNode].nSize >= m_nSizeThreshold )
+            continue;
+
+        GSOutcome sOutcome;
+        int iCurNode = iNode;
+        while( true )
+        {
+            if( abyState[iCurNode] == 2 )
+            {
+                sOutcome = m_asFinalOutcomes[iCurNode];
+                break;
+            }
+            // Cycle on an already visited node.
+            if( abyState[iCurNode] == 1 )
+                break;
+            abyState[iCurNode] = 1;
+            anPath.push_back(iCurNode);
+
+            const GSOutcome &sNext = asBigNeighbour[iCurNode];
+            if( sNext.eKind != GS_DEFER )
+            {
+                sOutcome = sNext;
+                break;
+            }
+            const int iNextNode = FindNode(sNext.nRef);
+            if( m_asNodes[iNextNode].nSize >= m_nSizeThreshold )
+            {
+                sOutcome.eKind = GS_REPLACE;
+                sOutcome.nValue = m_asNodes[iNextNode].nValue;
+                break;
+            }
+            iCurNode = iNextNode;
+        }
+
+        for( const int iPathNode: anPath )
+        {
+            m_asFinalOutcomes[iPathNode] = sOutcome;
+            abyState[iPathNode] = 2;
+        }
+        anPath.clear();
+    }
+}
+
+/************************************************************************/
+/*                  GSStripStitcher::GetNodeValues()                    */
+/************************************************************************/
+
+void GSStripStitcher::GetNodeValues( int iStrip,
+                                     std::map<GInt32, GInt32> &oMap )
+{
+    const int nLastNode =
+        iStrip + 1 < static_cast<int>(m_anStripFirstNode.size()) ?
+            m_anStripFirstNode[iStrip + 1] :
+            static_cast<int>(m_asNodes.size());
+
+    for( int iNode = m_anStripFirstNode[iStrip]; iNode < nLastNode; iNode++ )
+    {
+        const int iRootNode = FindNode(iNode);
+        if( m_asNodes[iRootNode].nSize < m_nSizeThreshold &&
+            m_asFinalOutcomes[iRootNode].eKind == GS_REPLACE )
+        {
+            oMap[m_asNodes[iNode].nId] =
+                m_asFinalOutcomes[iRootNode].nValue;
+        }
+    }
+}
+
+/************************************************************************/
+/*                        GDALSieveFilterTiled()                        */
+/*                                                                      */
+/*      Process the raster by strips of lines in worker threads. A      */
+/*      first run analyzes each strip and keeps only its nodes. Once    */
+/*      all the nodes are stitched and resolved, a second run           */
+/*      analyzes each strip again and writes it.                        */
+/************************************************************************/
+
+static CPLErr
+GDALSieveFilterTiled( GDALRasterBandH hSrcBand, GDALRasterBandH hMaskBand,
+                      GDALRasterBandH hDstBand,
+                      int nSizeThreshold, int nConnectedness,
+                      int nThreads, int nStripHeight,
+                      GDALProgressFunc pfnProgress,
+                      void * pProgressArg )
+{
+    const int nXSize = GDALGetRasterBandXSize( hSrcBand );
+    const int nYSize = GDALGetRasterBandYSize( hSrcBand );
+    const int nStrips = (nYSize + nStripHeight - 1) / nStripHeight;
+
+    CPLWorkerThreadPool oPool;
+    if( !oPool.Setup( std::min(nThreads, nStrips), nullptr, nullptr ) )
+        return CE_Failure;
+
+    CPLMutex *hIOMutex = nullptr;
+    GSStripStitcher oStitcher( nSizeThreshold, nConnectedness, nXSize );
+
+    const int nBatchSize = oPool.GetThreadCount();
+    CPLErr eErr = CE_None;
+
+    try
+    {
+        for( int iRun = 0; eErr == CE_None && iRun < 2; iRun++ )
+        {
+            const bool bApply = iRun == 1;
+            if( bApply )
+                oStitcher.Resolve();
+
+/* -------------------------------------------------------------------- */
+/*      Process the strips by batches of as many strips as threads,     */
+/*      to bound the memory in use.                                     */
+/* -------------------------------------------------------------------- */
+            for( int iStripStart = 0;
+                 eErr == CE_None && iStripStart < nStrips;
+                 iStripStart += nBatchSize )
+            {
+                const int nBatchStrips =
+                    std::min(nBatchSize, nStrips - iStripStart);
+                std::vector<std::unique_ptr<GSStripJob>> apoJobs;
+                std::vector<void*> apJobData;
+                for( int iStrip = iStripStart;
+                     iStrip < iStripStart + nBatchStrips;
+                     iStrip++ )
+                {
+                    std::unique_ptr<GSStripJob> poJob(new GSStripJob());
+                    poJob->hSrcBand = hSrcBand;
+                    poJob->hMaskBand = hMaskBand;
+                    poJob->hDstBand = hDstBand;
+                    poJob->phIOMutex = &hIOMutex;
+                    poJob->nSizeThreshold = nSizeThreshold;
+                    poJob->nConnectedness = nConnectedness;
+                    poJob->nXSize = nXSize;
+                    poJob->nYOff = iStrip * nStripHeight;
+                    poJob->nYSize = std::min(nStripHeight,
+                                             nYSize - poJob->nYOff);
+                    poJob->bTopBoundary = iStrip > 0;
+                    poJob->bBottomBoundary = iStrip < nStrips - 1;
+                    if( bApply )
+                        oStitcher.GetNodeValues( iStrip,
+                                                 poJob->oMapNodeValues );
+                    apJobData.push_back(poJob.get());
+                    apoJobs.push_back(std::move(poJob));
+                }
+
+                oPool.SubmitJobs( bApply ? GSStripJob::RunApply :
+                                           GSStripJob::RunAnalyze,
+                                  apJobData );
+                oPool.WaitCompletion();
+
+                for( int i = 0; eErr == CE_None && i < nBatchStrips; i++ )
+                {
+                    eErr = apoJobs[i]->eErr;
+                    if( eErr == CE_None && !bApply )
+                        oStitcher.AddStrip( apoJobs[i].get() );
+
+/* -------------------------------------------------------------------- */
+/*      Report progress, and support interrupts.                        */
+/* -------------------------------------------------------------------- */
+                    if( eErr == CE_None
+                        && !pfnProgress( 0.5 * (iRun + (iStripStart + i + 1) /
+                                            static_cast<double>(nStrips)),
+                                         "", pProgressArg ) )
+                    {
+                        CPLError( CE_Failure, CPLE_UserInterrupt,
+                                  "User terminated" );
+                        eErr = CE_Failure;
+                    }
+                }
+            }
+        }
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALSieveFilter()" );
+        eErr = CE_Failure;
+    }
+
+    if( hIOMutex )
+        CPLDestroyMutex( hIOMutex );
+
+    return eErr;
+}
+
 /************************************************************************/
 /*                          GDALSieveFilter()                           */
 /************************************************************************/
@@ -187,8 +1182,18 @@ static inline void CompareNeighbour( int nPolyId1, int nPolyId2,
  * @param nConnectedness either 4 indicating that diagonal pixels are not
  * considered directly adjacent for polygon membership purposes or 8
  * indicating they are.
- * @param papszOptions algorithm options in name=value list form.  None
- * currently supported.
+ * @param papszOptions algorithm options in name=value list form.
+ * <dl>
+ * <dt>"NUM_THREADS":</dt> (GDAL &gt;= 3.1) Number of worker threads, or
+ * ALL_CPUS. When greater than 1, the raster is processed by strips of lines
+ * in parallel. The result is the same as with a single thread, and memory
+ * use is then proportional to the strip size plus the polygons touching the
+ * strip boundaries and their neighbours smaller than the threshold, instead
+ * of the total number of polygons.
+ * <dt>"STRIP_HEIGHT":</dt> (GDAL &gt;= 3.1) Height in lines of the strips
+ * processed in parallel. Defaults to 512. Setting it also enables processing
+ * by strips with a single thread.
+ * </dl>
  * @param pfnProgress callback for reporting algorithm progress matching the
  * GDALProgressFunc() semantics.  May be NULL.
  * @param pProgressArg callback argument passed to pfnProgress.
@@ -200,7 +1205,7 @@ CPLErr CPL_STDCALL
 GDALSieveFilter( GDALRasterBandH hSrcBand, GDALRasterBandH hMaskBand,
                  GDALRasterBandH hDstBand,
                  int nSizeThreshold, int nConnectedness,
-                 CPL_UNUSED char **papszOptions,
+                 char **papszOptions,
                  GDALProgressFunc pfnProgress,
                  void * pProgressArg )
 {
@@ -210,11 +1215,35 @@ GDALSieveFilter( GDALRasterBandH hSrcBand, GDALRasterBandH hMaskBand,
     if( pfnProgress == nullptr )
         pfnProgress = GDALDummyProgress;
 
+    int nXSize = GDALGetRasterBandXSize( hSrcBand );
+    int nYSize = GDALGetRasterBandYSize( hSrcBand );
+
+/* -------------------------------------------------------------------- */
+/*      Use the tiled algorithm if requested.                           */
+/* -------------------------------------------------------------------- */
+    int nThreads = 1;
+    const char* pszNumThreads = CSLFetchNameValue(papszOptions, "NUM_THREADS");
+    if( pszNumThreads )
+    {
+        nThreads = EQUAL(pszNumThreads, "ALL_CPUS") ? CPLGetNumCPUs() :
+                                                      atoi(pszNumThreads);
+    }
+    const char* pszStripHeight = CSLFetchNameValue(papszOptions,
+                                                   "STRIP_HEIGHT");
+    const int nStripHeight =
+        std::max(1, pszStripHeight ? atoi(pszStripHeight) : 512);
+
+    if( (nThreads > 1 || pszStripHeight != nullptr) && nYSize > nStripHeight )
+    {
+        return GDALSieveFilterTiled( hSrcBand, hMaskBand, hDstBand,
+                                     nSizeThreshold, nConnectedness,
+                                     std::max(1, nThreads), nStripHeight,
+                                     pfnProgress, pProgressArg );
+    }
+
 /* -------------------------------------------------------------------- */
 /*      Allocate working buffers.                                       */
 /* -------------------------------------------------------------------- */
-    int nXSize = GDALGetRasterBandXSize( hSrcBand );
-    int nYSize = GDALGetRasterBandYSize( hSrcBand );
     GInt32 *panLastLineVal = static_cast<GInt32 *>(
         VSI_MALLOC2_VERBOSE(sizeof(GInt32), nXSize));
     GInt32 *panThisLineVal = static_cast<GInt32 *>(
@@ -42,10 +42,15 @@
 #include <cstring>
 
 #include <algorithm>
+#include <limits>
+#include <memory>
+#include <mutex>
+#include <vector>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
 #include "cpl_list.h"
+#include "cpl_md5.h"
 #include "cpl_minixml.h"
 #include "cpl_multiproc.h"
 #include "cpl_string.h"
@@ -3707,6 +3712,611 @@ GDALDeserializeApproxTransformer( CPLXMLNode *psTree )
     return pApproxCBData;
 }
 
+/************************************************************************/
+/* ==================================================================== */
+/*      Cached transformer.                                             */
+/* ==================================================================== */
+/************************************************************************/
+
+// A cache file starts with a header, followed by one fixed size record per
+// destination row:
+//   - int32 status (0 = not computed yet, 1 = computed) and int32 padding
+//   - double X and Y origin of the row (first successfully transformed point)
+//   - float32 X offsets and float32 Y offsets of each pixel center of the
+//     row, relative to the origin. A NaN X offset flags a failed point.
+// Values are stored in the native byte order. A cache written with another
+// byte order has a non matching header and is rewritten.
+
+constexpr char CACHED_TRANSFORMER_MAGIC[8] = {'G','D','A','L','T','C','1','\0'};
+constexpr int CACHED_TRANSFORMER_HEADER_SIZE = 8 + 3 * 4;
+constexpr int CACHED_TRANSFORMER_ROW_HEADER_SIZE = 4 + 4 + 2 * 8;
+
+namespace {
+class GDALTransformerCacheFile
+{
+    std::mutex m_oMutex{};
+    VSILFILE  *m_fp = nullptr;
+    int        m_nXSize = 0;
+    int        m_nYSize = 0;
+    CPLString  m_osFilename{};
+
+    vsi_l_offset GetRowOffset( int nRow ) const
+    {
+        return CACHED_TRANSFORMER_HEADER_SIZE + static_cast<vsi_l_offset>(
+            nRow) * (CACHED_TRANSFORMER_ROW_HEADER_SIZE +
+                     2 * sizeof(float) * static_cast<size_t>(m_nXSize));
+    }
+
+    CPL_DISALLOW_COPY_ASSIGN(GDALTransformerCacheFile)
+
+public:
+    GDALTransformerCacheFile() = default;
+    ~GDALTransformerCacheFile();
+
+    bool Open( const char* pszFilename, int nXSize, int nYSize );
+    const CPLString& GetFilename() const { return m_osFilename; }
+    int GetXSize() const { return m_nXSize; }
+    int GetYSize() const { return m_nYSize; }
+
+    bool ReadRow( int nRow, int nCol0, int nCount, double adfOrigin[2],
+                  std::vector<float>& afOffsets );
+    void WriteRow( int nRow, const double adfOrigin[2],
+                   const std::vector<float>& afOffsets );
+};
+} // namespace
+
+GDALTransformerCacheFile::~GDALTransformerCacheFile()
+{
+    if( m_fp )
+        VSIFCloseL(m_fp);
+}
+
+bool GDALTransformerCacheFile::Open( const char* pszFilename,
+                                     int nXSize, int nYSize )
+{
+    m_osFilename = pszFilename;
+    m_nXSize = nXSize;
+    m_nYSize = nYSize;
+
+    GByte abyHeader[CACHED_TRANSFORMER_HEADER_SIZE] = {};
+    memcpy(abyHeader, CACHED_TRANSFORMER_MAGIC, 8);
+    const GInt32 anHeader[3] = { 1, nXSize, nYSize };  // 1: byte order check.
+    memcpy(abyHeader + 8, anHeader, sizeof(anHeader));
+
+    m_fp = VSIFOpenL(pszFilename, "rb+");
+    if( m_fp )
+    {
+        GByte abyFileHeader[CACHED_TRANSFORMER_HEADER_SIZE] = {};
+        if( VSIFReadL(abyFileHeader, sizeof(abyFileHeader), 1, m_fp) == 1 &&
+            memcmp(abyHeader, abyFileHeader, sizeof(abyHeader)) == 0 )
+        {
+            return true;
+        }
+        CPLDebug("GDAL", "Invalid transformer cache %s. Recreating it",
+                 pszFilename);
+        VSIFCloseL(m_fp);
+    }
+
+    m_fp = VSIFOpenL(pszFilename, "wb+");
+    if( m_fp == nullptr )
+        return false;
+    // Truncating zero-fills all rows, flagging them as not computed.
+    return VSIFWriteL(abyHeader, sizeof(abyHeader), 1, m_fp) == 1 &&
+           VSIFTruncateL(m_fp, GetRowOffset(nYSize)) == 0;
+}
+
+// Reads the origin of a computed row, and the X offsets followed by the Y
+// offsets of its nCount pixels starting at column nCol0.
+bool GDALTransformerCacheFile::ReadRow( int nRow, int nCol0, int nCount,
+                                        double adfOrigin[2],
+                                        std::vector<float>& afOffsets )
+{
+    std::lock_guard<std::mutex> oLock(m_oMutex);
+    GByte abyRowHeader[CACHED_TRANSFORMER_ROW_HEADER_SIZE];
+    GInt32 nStatus = 0;
+    const vsi_l_offset nRowOffset = GetRowOffset(nRow);
+    if( VSIFSeekL(m_fp, nRowOffset, SEEK_SET) != 0 ||
+        VSIFReadL(abyRowHeader, sizeof(abyRowHeader), 1, m_fp) != 1 )
+    {
+        return false;
+    }
+    memcpy(&nStatus, abyRowHeader, sizeof(nStatus));
+    if( nStatus != 1 )
+        return false;
+    memcpy(adfOrigin, abyRowHeader + 8, 2 * sizeof(double));
+
+    afOffsets.resize(2 * static_cast<size_t>(nCount));
+    const vsi_l_offset nXOffsetsOffset = nRowOffset +
+        CACHED_TRANSFORMER_ROW_HEADER_SIZE +
+        sizeof(float) * static_cast<vsi_l_offset>(nCol0);
+    const vsi_l_offset nYOffsetsOffset = nXOffsetsOffset +
+        sizeof(float) * static_cast<vsi_l_offset>(m_nXSize);
+    return VSIFSeekL(m_fp, nXOffsetsOffset, SEEK_SET) == 0 &&
+           VSIFReadL(&afOffsets[0], sizeof(float), nCount, m_fp) ==
+                                            static_cast<size_t>(nCount) &&
+           VSIFSeekL(m_fp, nYOffsetsOffset, SEEK_SET) == 0 &&
+           VSIFReadL(&afOffsets[nCount], sizeof(float), nCount, m_fp) ==
+                                            static_cast<size_t>(nCount);
+}
+
+void GDALTransformerCacheFile::WriteRow( int nRow, const double adfOrigin[2],
+                                         const std::vector<float>& afOffsets )
+{
+    std::lock_guard<std::mutex> oLock(m_oMutex);
+    GByte abyRowHeader[CACHED_TRANSFORMER_ROW_HEADER_SIZE] = {};
+    memcpy(abyRowHeader + 8, adfOrigin, 2 * sizeof(double));
+    // Write the offsets before flagging the row as computed, so that an
+    // interrupted process does not leave a row with garbage.
+    const vsi_l_offset nOffset = GetRowOffset(nRow);
+    if( VSIFSeekL(m_fp, nOffset, SEEK_SET) != 0 ||
+        VSIFWriteL(abyRowHeader, sizeof(abyRowHeader), 1, m_fp) != 1 ||
+        VSIFWriteL(&afOffsets[0], sizeof(float), afOffsets.size(), m_fp) !=
+                                                            afOffsets.size() )
+    {
+        return;
+    }
+    const GInt32 nStatus = 1;
+    if( VSIFSeekL(m_fp, nOffset, SEEK_SET) == 0 )
+        VSIFWriteL(&nStatus, sizeof(nStatus), 1, m_fp);
+}
+
+struct CachedTransformInfo
+{
+    GDALTransformerInfo sTI;
+
+    GDALTransformerFunc pfnBaseTransformer;
+    void *pBaseCBData;
+
+    // Shared with the clones of the transformer. nullptr if the transformer
+    // just forwards to the base transformer.
+    std::shared_ptr<GDALTransformerCacheFile> poCache;
+};
+
+static CPLXMLNode *GDALSerializeCachedTransformer( void *pTransformArg );
+static void *GDALCreateSimilarCachedTransformer( void *hTransformArg,
+                                                 double dfSrcRatioX,
+                                                 double dfSrcRatioY );
+
+/************************************************************************/
+/*                   GDALCreateCachedTransformerInt()                   */
+/************************************************************************/
+
+static CachedTransformInfo *
+GDALCreateCachedTransformerInt( GDALTransformerFunc pfnBaseTransformer,
+                                void *pBaseTransformArg,
+                                const std::shared_ptr<GDALTransformerCacheFile>&
+                                                                    poCache )
+{
+    CachedTransformInfo *psInfo = new CachedTransformInfo();
+    memcpy(psInfo->sTI.abySignature,
+           GDAL_GTI2_SIGNATURE, strlen(GDAL_GTI2_SIGNATURE));
+    psInfo->sTI.pszClassName = "GDALCachedTransformer";
+    psInfo->sTI.pfnTransform = GDALCachedTransform;
+    psInfo->sTI.pfnCleanup = GDALDestroyCachedTransformer;
+    psInfo->sTI.pfnSerialize = GDALSerializeCachedTransformer;
+    psInfo->sTI.pfnCreateSimilar = GDALCreateSimilarCachedTransformer;
+    psInfo->pfnBaseTransformer = pfnBaseTransformer;
+    psInfo->pBaseCBData = pBaseTransformArg;
+    psInfo->poCache = poCache;
+    return psInfo;
+}
+
+/************************************************************************/
+/*                  GDALAppendCachedTransformerFiles()                  */
+/************************************************************************/
+
+// The serialized transformer only references the datasets holding
+// geolocation arrays or a DEM by name. Append the size and modification
+// time of their files to the cache key, so that a cache file is not reused
+// after they have been modified.
+
+static void GDALAppendCachedTransformerFiles( const CPLXMLNode* psNode,
+                                              CPLString& osKey )
+{
+    for( const CPLXMLNode* psIter = psNode; psIter != nullptr;
+         psIter = psIter->psNext )
+    {
+        if( psIter->eType != CXT_Element )
+            continue;
+
+        const char* pszDSName = nullptr;
+        if( EQUAL(psIter->pszValue, "MDI") &&
+            psIter->psChild != nullptr &&
+            psIter->psChild->eType == CXT_Attribute &&
+            psIter->psChild->psChild != nullptr &&
+            psIter->psChild->psNext != nullptr &&
+            (EQUAL(psIter->psChild->psChild->pszValue, "X_DATASET") ||
+             EQUAL(psIter->psChild->psChild->pszValue, "Y_DATASET")) )
+        {
+            pszDSName = psIter->psChild->psNext->pszValue;
+        }
+        else if( EQUAL(psIter->pszValue, "DEMPath") )
+        {
+            pszDSName = CPLGetXMLValue(psIter, nullptr, nullptr);
+        }
+
+        if( pszDSName != nullptr )
+        {
+            // The dataset name may not be a file name, as with netCDF
+            // subdatasets.
+            char** papszFiles = nullptr;
+            CPLPushErrorHandler(CPLQuietErrorHandler);
+            GDALDatasetH hDS = GDALOpenEx(pszDSName, GDAL_OF_RASTER,
+                                          nullptr, nullptr, nullptr);
+            CPLPopErrorHandler();
+            if( hDS != nullptr )
+            {
+                papszFiles = GDALGetFileList(hDS);
+                GDALClose(hDS);
+            }
+            if( papszFiles == nullptr )
+                papszFiles = CSLAddString(nullptr, pszDSName);
+            for( char** papszIter = papszFiles; *papszIter; ++papszIter )
+            {
+                VSIStatBufL sStat;
+                if( VSIStatL(*papszIter, &sStat) == 0 )
+                {
+                    osKey += CPLSPrintf(
+                        "%s," CPL_FRMT_GIB "," CPL_FRMT_GIB ";", *papszIter,
+                        static_cast<GIntBig>(sStat.st_size),
+                        static_cast<GIntBig>(sStat.st_mtime));
+                }
+            }
+            CSLDestroy(papszFiles);
+        }
+
+        GDALAppendCachedTransformerFiles(psIter->psChild, osKey);
+    }
+}
+
+/************************************************************************/
+/*                    GDALCreateCachedTransformer()                     */
+/************************************************************************/
+
+/**
+ * Create a transformer caching destination to source coordinates.
+ *
+ * The source pixel/line coordinates of the centers of the pixels of the
+ * destination raster, as requested by the warp kernel, are stored in a file
+ * of the cache directory, so that later warps with the same transformation
+ * onto the same destination grid skip the computations of the base
+ * transformer. The cache file is named after a hash of the serialized base
+ * transformer, of the size and modification time of the files holding
+ * geolocation arrays or a DEM it references, and of the destination raster
+ * size. Coordinates are stored
+ * as float32 offsets relative to the start of each row.
+ *
+ * Other requests are forwarded to the base transformer.
+ *
+ * A cache file should not be used by several processes at the same time.
+ *
+ * @param pfnBaseTransformer the base transformer, which must be
+ * serializable.
+ * @param pBaseTransformArg callback data for the base transformer. On
+ * success, it is owned by the returned transformer.
+ * @param nDstXSize width of the destination raster.
+ * @param nDstYSize height of the destination raster.
+ * @param pszCacheDir directory where to store the cache file.
+ *
+ * @return callback pointer suitable for use with GDALCachedTransform(), or
+ * nullptr in case of failure. If only the cache file cannot be created, a
+ * warning is emitted and the base transformer can be used directly.
+ *
+ * @since GDAL 3.1
+ */
+
+void *GDALCreateCachedTransformer( GDALTransformerFunc pfnBaseTransformer,
+                                   void *pBaseTransformArg,
+                                   int nDstXSize, int nDstYSize,
+                                   const char *pszCacheDir )
+{
+    if( nDstXSize <= 0 || nDstYSize <= 0 )
+        return nullptr;
+
+    CPLXMLNode* psTree =
+        GDALSerializeTransformer( pfnBaseTransformer, pBaseTransformArg );
+    if( psTree == nullptr )
+        return nullptr;
+    char* pszXML = CPLSerializeXMLTree(psTree);
+    CPLString osKey(pszXML);
+    CPLFree(pszXML);
+    GDALAppendCachedTransformerFiles(psTree, osKey);
+    CPLDestroyXMLNode(psTree);
+    osKey += CPLSPrintf("%d,%d", nDstXSize, nDstYSize);
+
+    const CPLString osFilename(
+        CPLFormFilename(pszCacheDir, CPLMD5String(osKey), "gtc"));
+    auto poCache = std::make_shared<GDALTransformerCacheFile>();
+    if( !poCache->Open(osFilename, nDstXSize, nDstYSize) )
+    {
+        // The caller can go on without the cache.
+        CPLError( CE_Warning, CPLE_FileIO,
+                  "Cannot create transformer cache %s", osFilename.c_str() );
+        return nullptr;
+    }
+    CPLDebug("GDAL", "Using transformer cache %s", osFilename.c_str());
+
+    return GDALCreateCachedTransformerInt(pfnBaseTransformer,
+                                          pBaseTransformArg, poCache);
+}
+
+/************************************************************************/
+/*                    GDALDestroyCachedTransformer()                    */
+/************************************************************************/
+
+/**
+ * Cleanup cached transformer.
+ *
+ * Deallocates the resources allocated by GDALCreateCachedTransformer(),
+ * including the base transformer.
+ *
+ * @param pTransformArg callback data originally returned by
+ * GDALCreateCachedTransformer().
+ */
+
+void GDALDestroyCachedTransformer( void *pTransformArg )
+
+{
+    if( pTransformArg == nullptr )
+        return;
+
+    CachedTransformInfo *psInfo =
+        static_cast<CachedTransformInfo *>(pTransformArg);
+    GDALDestroyTransformer( psInfo->pBaseCBData );
+    delete psInfo;
+}
+
+/************************************************************************/
+/*                 GDALCreateSimilarCachedTransformer()                 */
+/************************************************************************/
+
+static void *
+GDALCreateSimilarCachedTransformer( void *hTransformArg,
+                                    double dfSrcRatioX, double dfSrcRatioY )
+{
+    VALIDATE_POINTER1( hTransformArg,
+                       "GDALCreateSimilarCachedTransformer", nullptr );
+
+    CachedTransformInfo *psInfo =
+        static_cast<CachedTransformInfo *>(hTransformArg);
+
+    void* pBaseCBData = GDALCreateSimilarTransformer( psInfo->pBaseCBData,
+                                                      dfSrcRatioX,
+                                                      dfSrcRatioY );
+    if( pBaseCBData == nullptr )
+        return nullptr;
+
+    // The cache only remains valid for the same source raster.
+    return GDALCreateCachedTransformerInt(
+        psInfo->pfnBaseTransformer, pBaseCBData,
+        dfSrcRatioX == 1.0 && dfSrcRatioY == 1.0 ? psInfo->poCache : nullptr);
+}
+
+/************************************************************************/
+/*                   GDALSerializeCachedTransformer()                   */
+/************************************************************************/
+
+static CPLXMLNode *
+GDALSerializeCachedTransformer( void *pTransformArg )
+
+{
+    CachedTransformInfo *psInfo =
+        static_cast<CachedTransformInfo *>(pTransformArg);
+
+    CPLXMLNode *psTree =
+        CPLCreateXMLNode( nullptr, CXT_Element, "CachedTransformer" );
+
+    if( psInfo->poCache )
+    {
+        CPLCreateXMLElementAndValue( psTree, "CacheFile",
+                                     psInfo->poCache->GetFilename() );
+        CPLCreateXMLElementAndValue( psTree, "DstXSize",
+                        CPLSPrintf("%d", psInfo->poCache->GetXSize()) );
+        CPLCreateXMLElementAndValue( psTree, "DstYSize",
+                        CPLSPrintf("%d", psInfo->poCache->GetYSize()) );
+    }
+
+    CPLXMLNode *psTransformerContainer =
+        CPLCreateXMLNode( psTree, CXT_Element, "BaseTransformer" );
+
+    CPLXMLNode *psTransformer =
+        GDALSerializeTransformer( psInfo->pfnBaseTransformer,
+                                  psInfo->pBaseCBData );
+    if( psTransformer != nullptr )
+        CPLAddXMLChild( psTransformerContainer, psTransformer );
+
+    return psTree;
+}
+
+/************************************************************************/
+/*                  GDALDeserializeCachedTransformer()                  */
+/************************************************************************/
+
+static void *
+GDALDeserializeCachedTransformer( CPLXMLNode *psTree )
+
+{
+    GDALTransformerFunc pfnBaseTransform = nullptr;
+    void *pBaseCBData = nullptr;
+
+    CPLXMLNode *psContainer = CPLGetXMLNode( psTree, "BaseTransformer" );
+    if( psContainer != nullptr && psContainer->psChild != nullptr )
+    {
+        GDALDeserializeTransformer( psContainer->psChild,
+                                    &pfnBaseTransform,
+                                    &pBaseCBData );
+    }
+
+    if( pfnBaseTransform == nullptr )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined,
+                  "Cannot get base transform for cached transformer." );
+        return nullptr;
+    }
+
+    std::shared_ptr<GDALTransformerCacheFile> poCache;
+    const char* pszCacheFile = CPLGetXMLValue( psTree, "CacheFile", nullptr );
+    if( pszCacheFile != nullptr )
+    {
+        poCache = std::make_shared<GDALTransformerCacheFile>();
+        if( !poCache->Open( pszCacheFile,
+                            atoi(CPLGetXMLValue(psTree, "DstXSize", "0")),
+                            atoi(CPLGetXMLValue(psTree, "DstYSize", "0")) ) )
+        {
+            CPLError( CE_Warning, CPLE_FileIO,
+                      "Cannot open transformer cache %s", pszCacheFile );
+            poCache.reset();
+        }
+    }
+
+    return GDALCreateCachedTransformerInt(pfnBaseTransform, pBaseCBData,
+                                          poCache);
+}
+
+/************************************************************************/
+/*                        GDALCachedTransform()                         */
+/************************************************************************/
+
+/**
+ * Perform cached transformation.
+ *
+ * Destination to source transformations of a run of consecutive pixel
+ * centers of a row of the destination raster, as issued by the warp kernel,
+ * are served from the cache, the whole row being computed with the base
+ * transformer and stored in the cache on first use. Other requests are
+ * forwarded to the base transformer.
+ *
+ * This function matches the GDALTransformerFunc signature.
+ *
+ * @param pCBData callback data returned by GDALCreateCachedTransformer().
+ * @param bDstToSrc TRUE if transformation is from the destination
+ * (georeferenced) coordinates to pixel/line or FALSE when transforming
+ * from pixel/line to georeferenced coordinates.
+ * @param nPoints number of points in arrays.
+ * @param x array containing the X coordinates to transform.
+ * @param y array containing the Y coordinates to transform.
+ * @param z array containing the Z coordinates to transform.
+ * @param panSuccess array of ints in which success (TRUE) or failure (FALSE)
+ * flags are returned for the translation of each point.
+ *
+ * @return TRUE if the overall transformation succeeds (though some individual
+ * points may have failed) or FALSE if the overall transformation fails.
+ */
+
+int GDALCachedTransform( void *pCBData, int bDstToSrc, int nPoints,
+                         double *x, double *y, double *z, int *panSuccess )
+
+{
+    CachedTransformInfo *psInfo = static_cast<CachedTransformInfo *>(pCBData);
+    GDALTransformerCacheFile* poCache = psInfo->poCache.get();
+
+/* -------------------------------------------------------------------- */
+/*      Check that the points are consecutive pixel centers of a row    */
+/*      of the destination raster.                                      */
+/* -------------------------------------------------------------------- */
+    bool bCacheable = poCache != nullptr && bDstToSrc && nPoints > 0;
+    int nRow = 0;
+    int nCol0 = 0;
+    if( bCacheable )
+    {
+        const double dfRow = y[0] - 0.5;
+        const double dfCol0 = x[0] - 0.5;
+        bCacheable = dfRow >= 0 && dfRow < poCache->GetYSize() &&
+                     dfCol0 >= 0 &&
+                     dfCol0 + nPoints <= poCache->GetXSize();
+        if( bCacheable )
+        {
+            nRow = static_cast<int>(dfRow);
+            nCol0 = static_cast<int>(dfCol0);
+            bCacheable = nRow == dfRow && nCol0 == dfCol0;
+        }
+        for( int i = 0; bCacheable && i < nPoints; i++ )
+        {
+            bCacheable = y[i] == y[0] && x[i] == nCol0 + i + 0.5 &&
+                         (z == nullptr || z[i] == 0.0);
+        }
+    }
+    if( !bCacheable )
+    {
+        return psInfo->pfnBaseTransformer( psInfo->pBaseCBData, bDstToSrc,
+                                           nPoints, x, y, z, panSuccess );
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Compute and store the whole row if not already cached.          */
+/* -------------------------------------------------------------------- */
+    const int nXSize = poCache->GetXSize();
+    double adfOrigin[2] = { 0.0, 0.0 };
+    std::vector<float> afOffsets;
+    // Offsets of the requested points, in afOffsets.
+    const float* pafXOffsets = nullptr;
+    const float* pafYOffsets = nullptr;
+    if( poCache->ReadRow(nRow, nCol0, nPoints, adfOrigin, afOffsets) )
+    {
+        pafXOffsets = &afOffsets[0];
+        pafYOffsets = &afOffsets[nPoints];
+    }
+    else
+    {
+        std::vector<double> adfX(nXSize);
+        std::vector<double> adfY(nXSize, y[0]);
+        std::vector<double> adfZ(nXSize, 0.0);
+        std::vector<int> abSuccess(nXSize, FALSE);
+        for( int i = 0; i < nXSize; i++ )
+            adfX[i] = i + 0.5;
+        if( !psInfo->pfnBaseTransformer( psInfo->pBaseCBData, TRUE, nXSize,
+                                         &adfX[0], &adfY[0], &adfZ[0],
+                                         &abSuccess[0] ) )
+        {
+            return psInfo->pfnBaseTransformer( psInfo->pBaseCBData, bDstToSrc,
+                                               nPoints, x, y, z, panSuccess );
+        }
+
+        afOffsets.resize(2 * static_cast<size_t>(nXSize));
+        bool bOriginSet = false;
+        for( int i = 0; i < nXSize; i++ )
+        {
+            if( !abSuccess[i] )
+            {
+                afOffsets[i] = std::numeric_limits<float>::quiet_NaN();
+                afOffsets[nXSize + i] = 0.0f;
+                continue;
+            }
+            if( !bOriginSet )
+            {
+                adfOrigin[0] = adfX[i];
+                adfOrigin[1] = adfY[i];
+                bOriginSet = true;
+            }
+            afOffsets[i] = static_cast<float>(adfX[i] - adfOrigin[0]);
+            afOffsets[nXSize + i] = static_cast<float>(adfY[i] - adfOrigin[1]);
+        }
+        poCache->WriteRow(nRow, adfOrigin, afOffsets);
+        pafXOffsets = &afOffsets[nCol0];
+        pafYOffsets = &afOffsets[nXSize + nCol0];
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Serve the requested points from the row. The values returned    */
+/*      on first computation are the ones stored, so that results do    */
+/*      not depend on whether the cache was already populated.          */
+/* -------------------------------------------------------------------- */
+    for( int i = 0; i < nPoints; i++ )
+    {
+        const float fX = pafXOffsets[i];
+        if( CPLIsNan(fX) )
+        {
+            panSuccess[i] = FALSE;
+            continue;
+        }
+        x[i] = adfOrigin[0] + fX;
+        y[i] = adfOrigin[1] + pafYOffsets[i];
+        panSuccess[i] = TRUE;
+    }
+
+    return TRUE;
+}
+
 /************************************************************************/
 /*                       GDALApplyGeoTransform()                        */
 /************************************************************************/
@@ -3964,6 +4574,11 @@ CPLErr GDALDeserializeTransformer( CPLXMLNode *psTree,
         *ppfnFunc = GDALApproxTransform;
         *ppTransformArg = GDALDeserializeApproxTransformer( psTree );
     }
+    else if( EQUAL(psTree->pszValue, "CachedTransformer") )
+    {
+        *ppfnFunc = GDALCachedTransform;
+        *ppTransformArg = GDALDeserializeCachedTransformer( psTree );
+    }
     else
     {
         GDALTransformDeserializeFunc pfnDeserializeFunc = nullptr;
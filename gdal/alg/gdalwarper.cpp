@@ -1147,6 +1147,16 @@ GDALWarpDstAlphaMasker( void *pMaskFuncArg, int nBandCount,
  * set the number of threads to use to parallelize the computation part of the
  * warping. If not set, computation will be done in a single thread.</li>
  *
+ * <li>NUM_CHUNKS_IN_FLIGHT: (GDAL >= 3.1) Only used by
+ * GDALWarpOperation::ChunkAndWarpMulti(). Number of chunks processed at the
+ * same time. Defaults to 2, where the input/output of one chunk is interleaved
+ * with the computation of another one. Can be set to a larger value or
+ * ALL_CPUS so that the computation of several chunks runs concurrently, each
+ * chunk using its own copy of the transformer. Input/output remains
+ * serialized, and the warp memory limit and the threads set with NUM_THREADS
+ * are shared among the chunks in flight. Ignored if pre/post warp chunk
+ * processors are set.</li>
+ *
  * <li>STREAMABLE_OUTPUT: (GDAL >= 2.0) This defaults to FALSE, but may
  * be set to TRUE typically when writing to a streamed file. The
  * gdalwarp utility automatically sets this option when writing to
@@ -49,6 +49,7 @@
 #include "cpl_string.h"
 #include "cpl_vsi.h"
 #include "gdal.h"
+#include "gdal_alg_priv.h"
 #include "gdal_priv.h"
 #include "ogr_api.h"
 #include "ogr_core.h"
@@ -61,12 +62,35 @@ struct _GDALWarpChunk {
     double sExtraSx, sExtraSy;
 };
 
+// Resources owned by one slot of ChunkAndWarpMulti() when several chunks
+// are warped concurrently.
+struct GDALWarpChunkContext
+{
+    GDALWarpOperation *poOperation = nullptr;
+    void              *pTransformerArg = nullptr;
+    void              *psThreadData = nullptr;
+    GDALProgressFunc   pfnProgress = nullptr;
+    void              *pProgressArg = nullptr;
+};
+
+static thread_local GDALWarpChunkContext* tlsChunkContext = nullptr;
+
+struct GDALWarpMultiProgressData
+{
+    std::mutex        oMutex{};
+    double            dfMaxComplete = 0.0;
+    bool              bStop = false;
+    GDALProgressFunc  pfnProgress = nullptr;
+    void             *pProgressArg = nullptr;
+};
+
 struct GDALWarpPrivateData
 {
     int nStepCount = 0;
     std::vector<int> abSuccess{};
     std::vector<double> adfDstX{};
     std::vector<double> adfDstY{};
+    std::shared_ptr<GDALPreparedCutline> poPreparedCutline{};
 };
 
 static std::mutex gMutex{};
@@ -621,6 +645,22 @@ CPLErr GDALWarpOperation::Initialize( const GDALWarpOptions *psNewOptions )
             eErr = CE_Failure;
     }
 
+/* -------------------------------------------------------------------- */
+/*      Prepare the cutline once for the masking of all the chunks,     */
+/*      unless all touched pixels must be selected, which is left to    */
+/*      the rasterizer.                                                 */
+/* -------------------------------------------------------------------- */
+    if( eErr == CE_None && psOptions->hCutline != nullptr &&
+        !CPLFetchBool( psOptions->papszWarpOptions,
+                       "CUTLINE_ALL_TOUCHED", false ) )
+    {
+        GDALWarpPrivateData* privateData = GetWarpPrivateData(this);
+        privateData->poPreparedCutline = GDALCreatePreparedCutline(
+            static_cast<OGRGeometryH>(psOptions->hCutline) );
+        if( privateData->poPreparedCutline == nullptr )
+            eErr = CE_Failure;
+    }
+
     return eErr;
 }
 
@@ -989,6 +1029,9 @@ typedef struct
     CPLMutex          *hCondMutex;
     volatile int       bIOMutexTaken;
     CPLCond           *hCond;
+
+    // Only set when several chunks are warped concurrently.
+    GDALWarpChunkContext *psChunkContext;
 } ChunkThreadData;
 
 static void ChunkThreadMain( void *pThreadData )
@@ -999,6 +1042,10 @@ static void ChunkThreadMain( void *pThreadData )
 
     GDALWarpChunk *pasChunkInfo = psData->pasChunkInfo;
 
+    // Make the per-slot transformer and kernel thread pool visible to
+    // WarpRegionToBuffer().
+    tlsChunkContext = psData->psChunkContext;
+
 /* -------------------------------------------------------------------- */
 /*      Acquire IO mutex.                                               */
 /* -------------------------------------------------------------------- */
@@ -1033,6 +1080,69 @@ static void ChunkThreadMain( void *pThreadData )
     /* -------------------------------------------------------------------- */
         CPLReleaseMutex( psData->hIOMutex );
     }
+
+    tlsChunkContext = nullptr;
+}
+
+/************************************************************************/
+/*                        GDALWarpMultiProgress()                       */
+/************************************************************************/
+
+// Progress callback used by the kernels of chunks warped concurrently.
+// Chunks complete out of order, so only report increasing values.
+static int CPL_STDCALL GDALWarpMultiProgress( double dfComplete,
+                                              const char *pszMessage,
+                                              void *pProgressArg )
+{
+    GDALWarpMultiProgressData* psData =
+        static_cast<GDALWarpMultiProgressData*>(pProgressArg);
+    std::lock_guard<std::mutex> oLock(psData->oMutex);
+    if( psData->bStop )
+        return FALSE;
+    if( dfComplete <= psData->dfMaxComplete )
+        return TRUE;
+    psData->dfMaxComplete = dfComplete;
+    if( psData->pfnProgress != nullptr &&
+        !psData->pfnProgress(dfComplete, pszMessage, psData->pProgressArg) )
+    {
+        psData->bStop = true;
+        return FALSE;
+    }
+    return TRUE;
+}
+
+/************************************************************************/
+/*                       GetNumChunksInFlight()                         */
+/************************************************************************/
+
+static int GetNumChunksInFlight( const GDALWarpOptions* psOptions )
+{
+    const char* pszVal = CSLFetchNameValue(psOptions->papszWarpOptions,
+                                           "NUM_CHUNKS_IN_FLIGHT");
+    if( pszVal == nullptr )
+        return 2;
+    int nVal = 0;
+    if( EQUAL(pszVal, "ALL_CPUS") )
+        nVal = CPLGetNumCPUs();
+    else
+        nVal = atoi(pszVal);
+    return std::max(2, std::min(64, nVal));
+}
+
+/************************************************************************/
+/*                       GetNumKernelThreads()                          */
+/************************************************************************/
+
+// Same logic as GWKThreadsCreate().
+static int GetNumKernelThreads( char** papszWarpOptions )
+{
+    const char* pszWarpThreads =
+        CSLFetchNameValue(papszWarpOptions, "NUM_THREADS");
+    if( pszWarpThreads == nullptr )
+        pszWarpThreads = CPLGetConfigOption("GDAL_NUM_THREADS", "1");
+    int nThreads = EQUAL(pszWarpThreads, "ALL_CPUS") ?
+                        CPLGetNumCPUs() : atoi(pszWarpThreads);
+    return std::max(1, std::min(128, nThreads));
 }
 
 /************************************************************************/
@@ -1051,6 +1161,10 @@ static void ChunkThreadMain( void *pThreadData )
  * internally this method uses multiple threads to interleave input/output
  * for one region while the processing is being done for another.
  *
+ * The NUM_CHUNKS_IN_FLIGHT warp option (default 2) controls how many chunks
+ * are processed at the same time. Values greater than 2 let the warping of
+ * several chunks run concurrently, while input/output remains serialized.
+ *
  * @param nDstXOff X offset to window of destination data to be produced.
  * @param nDstYOff Y offset to window of destination data to be produced.
  * @param nDstXSize Width of output window on destination file to be produced.
@@ -1074,29 +1188,107 @@ CPLErr GDALWarpOperation::ChunkAndWarpMulti(
     CPLReleaseMutex(hCondMutex);
 
 /* -------------------------------------------------------------------- */
-/*      Collect the list of chunks to operate on.                       */
+/*      Determine how many chunks may be in flight at the same time.    */
+/*      With the default of 2, the I/O of one chunk is interleaved      */
+/*      with the warping of another one.  With more, the warping        */
+/*      stage of several chunks runs concurrently, which requires a     */
+/*      transformer and a kernel thread pool per slot.  I/O is always   */
+/*      serialized since datasets are not thread-safe.                  */
 /* -------------------------------------------------------------------- */
+    int nSlots = GetNumChunksInFlight(psOptions);
+    if( nSlots > 2 &&
+        (psOptions->pfnPreWarpChunkProcessor != nullptr ||
+         psOptions->pfnPostWarpChunkProcessor != nullptr) )
+    {
+        CPLDebug("WARP", "NUM_CHUNKS_IN_FLIGHT ignored due to chunk "
+                 "processors being set");
+        nSlots = 2;
+    }
+
+    std::vector<GDALWarpChunkContext> aoContexts;
+    GDALWarpMultiProgressData sProgressData;
+    if( nSlots > 2 )
+    {
+        const int nKernelThreads = std::max(1,
+            GetNumKernelThreads(psOptions->papszWarpOptions) / nSlots);
+        char** papszSlotOptions = CSLSetNameValue(
+            CSLDuplicate(psOptions->papszWarpOptions), "NUM_THREADS",
+            CPLSPrintf("%d", nKernelThreads));
+
+        sProgressData.pfnProgress = psOptions->pfnProgress;
+        sProgressData.pProgressArg = psOptions->pProgressArg;
+
+        aoContexts.resize(nSlots);
+        for( auto& oContext: aoContexts )
+        {
+            oContext.poOperation = this;
+            oContext.pfnProgress = GDALWarpMultiProgress;
+            oContext.pProgressArg = &sProgressData;
+            oContext.pTransformerArg =
+                GDALCloneTransformer(psOptions->pTransformerArg);
+            if( oContext.pTransformerArg == nullptr )
+                break;
+            oContext.psThreadData = GWKThreadsCreate(
+                papszSlotOptions, psOptions->pfnTransformer,
+                oContext.pTransformerArg);
+            if( oContext.psThreadData == nullptr )
+                break;
+        }
+        CSLDestroy(papszSlotOptions);
+
+        if( aoContexts.back().psThreadData == nullptr )
+        {
+            CPLDebug("WARP", "Cannot clone transformer. "
+                     "NUM_CHUNKS_IN_FLIGHT ignored");
+            for( auto& oContext: aoContexts )
+            {
+                if( oContext.psThreadData )
+                    GWKThreadsEnd(oContext.psThreadData);
+                if( oContext.pTransformerArg )
+                    GDALDestroyTransformer(oContext.pTransformerArg);
+            }
+            aoContexts.clear();
+            nSlots = 2;
+        }
+        else
+        {
+            CPLDebug("WARP", "%d chunks in flight, %d kernel thread(s) each",
+                     nSlots, nKernelThreads);
+        }
+    }
+    const bool bConcurrentWarp = !aoContexts.empty();
+
+/* -------------------------------------------------------------------- */
+/*      Collect the list of chunks to operate on.  When chunks are      */
+/*      warped concurrently, the memory limit is shared among them.     */
+/* -------------------------------------------------------------------- */
+    const double dfWarpMemoryLimit = psOptions->dfWarpMemoryLimit;
+    if( bConcurrentWarp )
+        psOptions->dfWarpMemoryLimit /= nSlots;
     CollectChunkList( nDstXOff, nDstYOff, nDstXSize, nDstYSize );
+    psOptions->dfWarpMemoryLimit = dfWarpMemoryLimit;
 
 /* -------------------------------------------------------------------- */
 /*      Process them one at a time, updating the progress               */
 /*      information for each region.                                    */
 /* -------------------------------------------------------------------- */
-    ChunkThreadData volatile asThreadData[2] = {};
-    memset(reinterpret_cast<void*>(
-        const_cast<ChunkThreadData(*)[2]>(&asThreadData)), 0, sizeof(asThreadData));
-    asThreadData[0].poOperation = this;
-    asThreadData[0].hIOMutex = hIOMutex;
-    asThreadData[1].poOperation = this;
-    asThreadData[1].hIOMutex = hIOMutex;
+    std::vector<ChunkThreadData> asThreadData(nSlots);
+    for( int iThread = 0; iThread < nSlots; iThread++ )
+    {
+        memset(&asThreadData[iThread], 0, sizeof(ChunkThreadData));
+        asThreadData[iThread].poOperation = this;
+        asThreadData[iThread].hIOMutex = hIOMutex;
+        if( bConcurrentWarp )
+            asThreadData[iThread].psChunkContext = &aoContexts[iThread];
+    }
 
     double dfPixelsProcessed = 0.0;
     double dfTotalPixels = static_cast<double>(nDstXSize)*nDstYSize;
 
     CPLErr eErr = CE_None;
-    for( int iChunk = 0; iChunk < nChunkListCount+1; iChunk++ )
+    for( int iChunk = 0; iChunk < nChunkListCount + nSlots - 1; iChunk++ )
     {
-        int iThread = iChunk % 2;
+        int iThread = iChunk % nSlots;
 
 /* -------------------------------------------------------------------- */
 /*      Launch thread for this chunk.                                   */
@@ -1116,7 +1308,10 @@ CPLErr GDALWarpOperation::ChunkAndWarpMulti(
 
             asThreadData[iThread].pasChunkInfo = pasThisChunk;
 
-            if( iChunk == 0 )
+            // When several chunks are in flight, wait for each of them to
+            // have acquired the IO mutex, so that chunks are read in order.
+            const bool bWaitIOMutex = iChunk == 0 || bConcurrentWarp;
+            if( bWaitIOMutex )
             {
                 asThreadData[iThread].hCond = hCond;
                 asThreadData[iThread].hCondMutex = hCondMutex;
@@ -1130,8 +1325,7 @@ CPLErr GDALWarpOperation::ChunkAndWarpMulti(
 
             CPLDebug( "GDAL", "Start chunk %d.", iChunk );
             asThreadData[iThread].hThreadHandle = CPLCreateJoinableThread(
-                ChunkThreadMain,
-                const_cast<ChunkThreadData *>(&asThreadData[iThread]));
+                ChunkThreadMain, &asThreadData[iThread]);
             if( asThreadData[iThread].hThreadHandle == nullptr )
             {
                 CPLError(
@@ -1144,7 +1338,7 @@ CPLErr GDALWarpOperation::ChunkAndWarpMulti(
             // Wait that the first thread has acquired the IO mutex before
             // proceeding.  This will ensure that the first thread will run
             // before the second one.
-            if( iChunk == 0 )
+            if( bWaitIOMutex )
             {
                 CPLAcquireMutex(hCondMutex, 1.0);
                 while( asThreadData[iThread].bIOMutexTaken == FALSE )
@@ -1154,17 +1348,19 @@ CPLErr GDALWarpOperation::ChunkAndWarpMulti(
         }
 
 /* -------------------------------------------------------------------- */
-/*      Wait for previous chunks thread to complete.                    */
+/*      Wait for the oldest chunk thread to complete, so that its slot  */
+/*      can be reused by the next chunk.                                */
 /* -------------------------------------------------------------------- */
-        if( iChunk > 0 )
+        const int iOldestChunk = iChunk - (nSlots - 1);
+        if( iOldestChunk >= 0 )
         {
-            iThread = (iChunk-1) % 2;
+            iThread = iOldestChunk % nSlots;
 
             // Wait for thread to finish.
             CPLJoinThread(asThreadData[iThread].hThreadHandle);
             asThreadData[iThread].hThreadHandle = nullptr;
 
-            CPLDebug( "GDAL", "Finished chunk %d.", iChunk-1 );
+            CPLDebug( "GDAL", "Finished chunk %d.", iOldestChunk );
 
             eErr = asThreadData[iThread].eErr;
 
@@ -1176,12 +1372,18 @@ CPLErr GDALWarpOperation::ChunkAndWarpMulti(
     /* -------------------------------------------------------------------- */
     /*      Wait for all threads to complete.                               */
     /* -------------------------------------------------------------------- */
-    for( int iThread = 0; iThread < 2; iThread++ )
+    for( int iThread = 0; iThread < nSlots; iThread++ )
     {
         if( asThreadData[iThread].hThreadHandle )
             CPLJoinThread(asThreadData[iThread].hThreadHandle);
     }
 
+    for( auto& oContext: aoContexts )
+    {
+        GWKThreadsEnd(oContext.psThreadData);
+        GDALDestroyTransformer(oContext.pTransformerArg);
+    }
+
     CPLDestroyCond(hCond);
     CPLDestroyMutex(hCondMutex);
 
@@ -1747,6 +1949,13 @@ CPLErr GDALWarpOperation::WarpRegionToBuffer(
 
     CPLAssert( eBufDataType == psOptions->eWorkingDataType );
 
+    // Set when this chunk is warped concurrently with others by
+    // ChunkAndWarpMulti(): it then has its own transformer and kernel
+    // thread pool, and does not need to take the warp mutex.
+    const GDALWarpChunkContext* psChunkContext =
+        (tlsChunkContext != nullptr && tlsChunkContext->poOperation == this) ?
+            tlsChunkContext : nullptr;
+
 /* -------------------------------------------------------------------- */
 /*      If not given a corresponding source window compute one now.     */
 /* -------------------------------------------------------------------- */
@@ -1792,6 +2001,14 @@ CPLErr GDALWarpOperation::WarpRegionToBuffer(
     oWK.papszWarpOptions = psOptions->papszWarpOptions;
     oWK.psThreadData = psThreadData;
 
+    if( psChunkContext != nullptr )
+    {
+        oWK.pTransformerArg = psChunkContext->pTransformerArg;
+        oWK.pfnProgress = psChunkContext->pfnProgress;
+        oWK.pProgress = psChunkContext->pProgressArg;
+        oWK.psThreadData = psChunkContext->psThreadData;
+    }
+
     oWK.padfDstNoDataReal = psOptions->padfDstNoDataReal;
 
 /* -------------------------------------------------------------------- */
@@ -1941,13 +2158,15 @@ CPLErr GDALWarpOperation::WarpRegionToBuffer(
 
         if( eErr == CE_None )
             eErr =
-                GDALWarpCutlineMasker( psOptions,
-                                       psOptions->nBandCount,
-                                       psOptions->eWorkingDataType,
-                                       oWK.nSrcXOff, oWK.nSrcYOff,
-                                       oWK.nSrcXSize, oWK.nSrcYSize,
-                                       oWK.papabySrcImage,
-                                       TRUE, oWK.pafUnifiedSrcDensity );
+                GDALWarpCutlineMaskerEx(
+                    psOptions,
+                    psOptions->nBandCount,
+                    psOptions->eWorkingDataType,
+                    oWK.nSrcXOff, oWK.nSrcYOff,
+                    oWK.nSrcXSize, oWK.nSrcYSize,
+                    oWK.papabySrcImage,
+                    TRUE, oWK.pafUnifiedSrcDensity,
+                    GetWarpPrivateData(this)->poPreparedCutline.get() );
     }
 
 /* -------------------------------------------------------------------- */
@@ -2170,7 +2389,8 @@ CPLErr GDALWarpOperation::WarpRegionToBuffer(
     if( hIOMutex != nullptr )
     {
         CPLReleaseMutex( hIOMutex );
-        if( !CPLAcquireMutex( hWarpMutex, 600.0 ) )
+        if( psChunkContext == nullptr &&
+            !CPLAcquireMutex( hWarpMutex, 600.0 ) )
         {
             CPLError( CE_Failure, CPLE_AppDefined,
                       "Failed to acquire WarpMutex in WarpRegion()." );
@@ -2206,7 +2426,8 @@ CPLErr GDALWarpOperation::WarpRegionToBuffer(
 /* -------------------------------------------------------------------- */
     if( hIOMutex != nullptr )
     {
-        CPLReleaseMutex( hWarpMutex );
+        if( psChunkContext == nullptr )
+            CPLReleaseMutex( hWarpMutex );
         if( !CPLAcquireMutex( hIOMutex, 600.0 ) )
         {
             CPLError( CE_Failure, CPLE_AppDefined,
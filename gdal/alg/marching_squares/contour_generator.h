@@ -71,6 +71,13 @@ public:
         }
         return CE_None;
     }
+    // Start at line lineIdx instead of the first line, previousLine
+    // being the values of line lineIdx - 1. Used to process a raster by strips.
+    void setStartLine( size_t lineIdx, const double* previousLine )
+    {
+        lineIdx_ = lineIdx;
+        std::copy( previousLine, previousLine + width_, previousLine_.begin() );
+    }
 private:
     size_t width_;
     size_t height_;
@@ -35,7 +35,11 @@
 #include <string.h>
 
 #include <algorithm>
+#include <climits>
+#include <map>
 #include <memory>
+#include <set>
+#include <utility>
 #include <vector>
 
 #include "gdal_alg_priv.h"
@@ -44,9 +48,11 @@
 #include "ogr_core.h"
 #include "cpl_conv.h"
 #include "cpl_error.h"
+#include "cpl_multiproc.h"
 #include "cpl_progress.h"
 #include "cpl_string.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 
 CPL_CVSID("$Id$")
 
@@ -261,18 +267,21 @@ void RPolygon::AddSegment( int x1, int y1, int x2, int y2 )
 /************************************************************************/
 
 /************************************************************************/
-/*                              AddEdges()                              */
+/*                            GPForEachEdge()                           */
 /*                                                                      */
 /*      Examine one pixel and compare to its neighbour above            */
 /*      (previous) and right.  If they are different polygon ids        */
-/*      then add the pixel edge to this polygon and the one on the      */
-/*      other side of the edge.                                         */
+/*      then call pfnAddEdge() for this polygon and the one on the      */
+/*      other side of the edge, with the polygon id and whether the     */
+/*      edge is the vertical one on the right of the pixel or the       */
+/*      horizontal one above it.                                        */
 /************************************************************************/
 
-template<class DataType>
-static void AddEdges( GInt32 *panThisLineId, GInt32 *panLastLineId,
-                      GInt32 *panPolyIdMap, DataType *panPolyValue,
-                      RPolygon **papoPoly, int iX, int iY )
+template<class AddEdgeFunc>
+static void GPForEachEdge( const GInt32 *panThisLineId,
+                           const GInt32 *panLastLineId,
+                           const GInt32 *panPolyIdMap, int iX,
+                           AddEdgeFunc&& pfnAddEdge )
 
 {
     // TODO(schwehr): Simplify these three vars.
@@ -286,53 +295,56 @@ static void AddEdges( GInt32 *panThisLineId, GInt32 *panLastLineId,
     if( nPreviousId != -1 )
         nPreviousId = panPolyIdMap[nPreviousId];
 
-    const int iXReal = iX - 1;
-
     if( nThisId != nPreviousId )
     {
         if( nThisId != -1 )
-        {
-            if( papoPoly[nThisId] == nullptr )
-                papoPoly[nThisId] = new RPolygon( panPolyValue[nThisId] );
-
-            papoPoly[nThisId]->AddSegment( iXReal, iY, iXReal+1, iY );
-        }
+            pfnAddEdge( nThisId, false );
         if( nPreviousId != -1 )
-        {
-            if( papoPoly[nPreviousId] == nullptr )
-                papoPoly[nPreviousId] = new RPolygon(panPolyValue[nPreviousId]);
-
-            papoPoly[nPreviousId]->AddSegment( iXReal, iY, iXReal+1, iY );
-        }
+            pfnAddEdge( nPreviousId, false );
     }
 
     if( nThisId != nRightId )
     {
         if( nThisId != -1 )
-        {
-            if( papoPoly[nThisId] == nullptr )
-                papoPoly[nThisId] = new RPolygon(panPolyValue[nThisId]);
+            pfnAddEdge( nThisId, true );
+        if( nRightId != -1 )
+            pfnAddEdge( nRightId, true );
+    }
+}
 
-            papoPoly[nThisId]->AddSegment( iXReal+1, iY, iXReal+1, iY+1 );
-        }
+/************************************************************************/
+/*                              AddEdges()                              */
+/*                                                                      */
+/*      Add the pixel edges found by GPForEachEdge() to the polygons.   */
+/************************************************************************/
 
-        if( nRightId != -1 )
-        {
-            if( papoPoly[nRightId] == nullptr )
-                papoPoly[nRightId] = new RPolygon(panPolyValue[nRightId]);
+template<class DataType>
+static void AddEdges( GInt32 *panThisLineId, GInt32 *panLastLineId,
+                      GInt32 *panPolyIdMap, DataType *panPolyValue,
+                      RPolygon **papoPoly, int iX, int iY )
 
-            papoPoly[nRightId]->AddSegment( iXReal+1, iY, iXReal+1, iY+1 );
-        }
-    }
+{
+    const int iXReal = iX - 1;
+
+    GPForEachEdge( panThisLineId, panLastLineId, panPolyIdMap, iX,
+        [=](int nId, bool bVertical)
+        {
+            if( papoPoly[nId] == nullptr )
+                papoPoly[nId] = new RPolygon( panPolyValue[nId] );
+
+            if( bVertical )
+                papoPoly[nId]->AddSegment( iXReal+1, iY, iXReal+1, iY+1 );
+            else
+                papoPoly[nId]->AddSegment( iXReal, iY, iXReal+1, iY );
+        } );
 }
 
 /************************************************************************/
-/*                         EmitPolygonToLayer()                         */
+/*                         RPolygonToGeometry()                         */
 /************************************************************************/
 
-static CPLErr
-EmitPolygonToLayer( OGRLayerH hOutLayer, int iPixValField,
-                    RPolygon *poRPoly, double *padfGeoTransform )
+static OGRGeometryH
+RPolygonToGeometry( RPolygon *poRPoly, const double *padfGeoTransform )
 
 {
 /* -------------------------------------------------------------------- */
@@ -374,6 +386,20 @@ EmitPolygonToLayer( OGRLayerH hOutLayer, int iPixValField,
         OGR_G_AddGeometryDirectly( hPolygon, hRing );
     }
 
+    return hPolygon;
+}
+
+/************************************************************************/
+/*                     EmitPolygonGeometryToLayer()                     */
+/*                                                                      */
+/*      Write a polygon to the layer. Takes ownership of the geometry.  */
+/************************************************************************/
+
+static CPLErr
+EmitPolygonGeometryToLayer( OGRLayerH hOutLayer, int iPixValField,
+                            OGRGeometryH hPolygon, double dfPolyValue )
+
+{
 /* -------------------------------------------------------------------- */
 /*      Create the feature object.                                      */
 /* -------------------------------------------------------------------- */
@@ -382,7 +408,7 @@ EmitPolygonToLayer( OGRLayerH hOutLayer, int iPixValField,
     OGR_F_SetGeometryDirectly( hFeat, hPolygon );
 
     if( iPixValField >= 0 )
-        OGR_F_SetFieldDouble( hFeat, iPixValField, poRPoly->dfPolyValue );
+        OGR_F_SetFieldDouble( hFeat, iPixValField, dfPolyValue );
 
 /* -------------------------------------------------------------------- */
 /*      Write the to the layer.                                         */
@@ -397,6 +423,21 @@ EmitPolygonToLayer( OGRLayerH hOutLayer, int iPixValField,
     return eErr;
 }
 
+/************************************************************************/
+/*                         EmitPolygonToLayer()                         */
+/************************************************************************/
+
+static CPLErr
+EmitPolygonToLayer( OGRLayerH hOutLayer, int iPixValField,
+                    RPolygon *poRPoly, double *padfGeoTransform )
+
+{
+    return EmitPolygonGeometryToLayer(
+        hOutLayer, iPixValField,
+        RPolygonToGeometry( poRPoly, padfGeoTransform ),
+        poRPoly->dfPolyValue );
+}
+
 /************************************************************************/
 /*                          GPMaskImageData()                           */
 /*                                                                      */
@@ -426,6 +467,702 @@ GPMaskImageData( GDALRasterBandH hMaskBand, GByte* pabyMaskLine,
     return CE_None;
 }
 
+/************************************************************************/
+/* ==================================================================== */
+/*                        Tiled polygonization                          */
+/*                                                                      */
+/*      The raster is split into strips of whole lines, which are       */
+/*      polygonized in parallel with the same algorithm as              */
+/*      GDALPolygonizeT(). Polygons touching the first or last line of  */
+/*      a strip may continue in the neighbouring strip: their edges are */
+/*      handed back to the calling thread, which stitches them across   */
+/*      the strip boundaries, adds the edges lying on the boundaries    */
+/*      themselves, and writes the polygons once they are complete.     */
+/*                                                                      */
+/*      The rings built by RPolygon::Coalesce() depend on the order in  */
+/*      which the edges were added, so the edges of these polygons are  */
+/*      kept as keys sorting in the order GDALPolygonizeT() visits      */
+/*      them, and replayed in that order. This way the output is the    */
+/*      same as without tiling.                                         */
+/* ==================================================================== */
+/************************************************************************/
+
+/************************************************************************/
+/*                            GPPolygonEdges                            */
+/************************************************************************/
+
+struct GPPolygonEdges
+{
+    double               dfPolyValue = 0.0;
+    std::vector<GIntBig> anEdgeKeys{};
+};
+
+/************************************************************************/
+/*                             GPEdgeKey()                              */
+/*                                                                      */
+/*      Key of the edge found by GPForEachEdge() for column iX (from 0  */
+/*      to nXSize, pixel iX - 1) of line iY.                            */
+/************************************************************************/
+
+static GIntBig GPEdgeKey( int nXSize, int iX, int iY, bool bVertical )
+{
+    return (static_cast<GIntBig>(iY) * (nXSize + 1) + iX) * 2 +
+           (bVertical ? 1 : 0);
+}
+
+/************************************************************************/
+/*                        GPEdgesToRPolygon()                           */
+/************************************************************************/
+
+static void GPEdgesToRPolygon( GPPolygonEdges *psEdges, int nXSize,
+                               RPolygon *poRPoly )
+{
+    std::sort(psEdges->anEdgeKeys.begin(), psEdges->anEdgeKeys.end());
+
+    for( const GIntBig nKey: psEdges->anEdgeKeys )
+    {
+        const bool bVertical = (nKey % 2) != 0;
+        const int iX = static_cast<int>((nKey / 2) % (nXSize + 1));
+        const int iY = static_cast<int>((nKey / 2) / (nXSize + 1));
+        if( bVertical )
+            poRPoly->AddSegment( iX, iY, iX, iY + 1 );
+        else
+            poRPoly->AddSegment( iX - 1, iY, iX, iY );
+    }
+}
+
+/************************************************************************/
+/*                              GPStripJob                              */
+/************************************************************************/
+
+template<class DataType, class EqualityTest>
+struct GPStripJob
+{
+    // Inputs.
+    GDALRasterBandH  hSrcBand = nullptr;
+    GDALRasterBandH  hMaskBand = nullptr;
+    GDALDataType     eDT = GDT_Unknown;
+    CPLMutex       **phIOMutex = nullptr;
+    const double    *padfGeoTransform = nullptr;
+    int              nConnectedness = 4;
+    int              nXSize = 0;
+    int              nYOff = 0;
+    int              nYSize = 0;
+    bool             bTopBoundary = false;
+    bool             bBottomBoundary = false;
+
+    // Outputs.
+    CPLErr           eErr = CE_None;
+
+    // Polygons entirely inside the strip, ready to be written.
+    std::vector<std::pair<OGRGeometryH, double>> aoCompleted{};
+
+    // Final polygon ids and values of the first and last lines of the
+    // strip, when they are a strip boundary.
+    std::vector<GInt32>   anTopLineId{};
+    std::vector<DataType> anTopLineVal{};
+    std::vector<GInt32>   anBottomLineId{};
+    std::vector<DataType> anBottomLineVal{};
+
+    // Edges of the polygons touching a strip boundary, by final polygon id.
+    std::map<GInt32, GPPolygonEdges> oMapBoundaryEdges{};
+
+    GPStripJob() = default;
+    ~GPStripJob();
+
+    CPLErr      ReadLine( int iY, DataType *panImageLine,
+                          GByte *pabyMaskLine );
+    void        Polygonize();
+
+    static void Run( void *pData );
+
+  private:
+    CPL_DISALLOW_COPY_ASSIGN(GPStripJob)
+};
+
+template<class DataType, class EqualityTest>
+GPStripJob<DataType, EqualityTest>::~GPStripJob()
+{
+    for( auto& oPair: aoCompleted )
+        OGR_G_DestroyGeometry( oPair.first );
+}
+
+/************************************************************************/
+/*                       GPStripJob::ReadLine()                         */
+/*                                                                      */
+/*      Read a line of the strip. The bands are shared by all jobs, so  */
+/*      reads are serialized.                                           */
+/************************************************************************/
+
+template<class DataType, class EqualityTest>
+CPLErr GPStripJob<DataType, EqualityTest>::ReadLine( int iY,
+                                                     DataType *panImageLine,
+                                                     GByte *pabyMaskLine )
+{
+    CPLMutexHolderD(phIOMutex);
+
+    CPLErr eErrLine = GDALRasterIO( hSrcBand, GF_Read, 0, nYOff + iY,
+                                    nXSize, 1, panImageLine, nXSize, 1,
+                                    eDT, 0, 0 );
+
+    if( eErrLine == CE_None && hMaskBand != nullptr )
+        eErrLine = GPMaskImageData( hMaskBand, pabyMaskLine, nYOff + iY,
+                                    nXSize, panImageLine );
+
+    return eErrLine;
+}
+
+/************************************************************************/
+/*                      GPStripJob::Polygonize()                        */
+/*                                                                      */
+/*      Same two passes as GDALPolygonizeT(), restricted to the lines   */
+/*      of the strip.                                                   */
+/************************************************************************/
+
+template<class DataType, class EqualityTest>
+void GPStripJob<DataType, EqualityTest>::Polygonize()
+{
+    std::vector<DataType> anLastLineValV(nXSize + 2);
+    std::vector<DataType> anThisLineValV(nXSize + 2);
+    std::vector<GInt32> anLastLineIdV(nXSize + 2);
+    std::vector<GInt32> anThisLineIdV(nXSize + 2);
+    std::vector<GByte> abyMaskLine(hMaskBand != nullptr ? nXSize : 0);
+
+    DataType *panLastLineVal = anLastLineValV.data();
+    DataType *panThisLineVal = anThisLineValV.data();
+    GInt32 *panLastLineId = anLastLineIdV.data();
+    GInt32 *panThisLineId = anThisLineIdV.data();
+    GByte *pabyMaskLine = abyMaskLine.empty() ? nullptr : abyMaskLine.data();
+
+/* -------------------------------------------------------------------- */
+/*      First pass to build the polygon id map of the strip.            */
+/* -------------------------------------------------------------------- */
+    GDALRasterPolygonEnumeratorT<DataType,
+                                 EqualityTest> oFirstEnum(nConnectedness);
+
+    for( int iY = 0; eErr == CE_None && iY < nYSize; iY++ )
+    {
+        eErr = ReadLine( iY, panThisLineVal, pabyMaskLine );
+        if( eErr != CE_None )
+            break;
+
+        if( iY == 0 )
+            oFirstEnum.ProcessLine(
+                nullptr, panThisLineVal, nullptr, panThisLineId, nXSize );
+        else
+            oFirstEnum.ProcessLine(
+                panLastLineVal, panThisLineVal,
+                panLastLineId,  panThisLineId,
+                nXSize );
+
+        if( iY == 0 && bTopBoundary )
+        {
+            anTopLineId.assign(panThisLineId, panThisLineId + nXSize);
+            anTopLineVal.assign(panThisLineVal, panThisLineVal + nXSize);
+        }
+        if( iY == nYSize - 1 && bBottomBoundary )
+        {
+            anBottomLineId.assign(panThisLineId, panThisLineId + nXSize);
+            anBottomLineVal.assign(panThisLineVal, panThisLineVal + nXSize);
+        }
+
+        std::swap(panLastLineVal, panThisLineVal);
+        std::swap(panLastLineId, panThisLineId);
+    }
+
+    if( eErr != CE_None )
+        return;
+
+    oFirstEnum.CompleteMerges();
+
+/* -------------------------------------------------------------------- */
+/*      Find the polygons touching a strip boundary.                    */
+/* -------------------------------------------------------------------- */
+    std::vector<GPPolygonEdges*> apsBoundaryEdges(oFirstEnum.nNextPolygonId,
+                                                  nullptr);
+    for( auto panLineId: { &anTopLineId, &anBottomLineId } )
+    {
+        for( auto& nId: *panLineId )
+        {
+            if( nId == -1 )
+                continue;
+            nId = oFirstEnum.panPolyIdMap[nId];
+            if( apsBoundaryEdges[nId] == nullptr )
+            {
+                GPPolygonEdges *psEdges = &oMapBoundaryEdges[nId];
+                psEdges->dfPolyValue = oFirstEnum.panPolyValue[nId];
+                apsBoundaryEdges[nId] = psEdges;
+            }
+        }
+    }
+
+    panThisLineId[0] = -1;
+    panThisLineId[nXSize+1] = -1;
+
+    for( int iX = 0; iX < nXSize+2; iX++ )
+        panLastLineId[iX] = -1;
+
+/* -------------------------------------------------------------------- */
+/*      Second pass collecting polygon edges. The edges on the last     */
+/*      line of the raster are only added by the last strip, and        */
+/*      edges on a boundary between two strips are added when           */
+/*      stitching them.                                                 */
+/* -------------------------------------------------------------------- */
+    GDALRasterPolygonEnumeratorT<DataType,
+                                 EqualityTest> oSecondEnum(nConnectedness);
+    std::vector<RPolygon*> apoPoly(oFirstEnum.nNextPolygonId, nullptr);
+    RPolygon **papoPoly = apoPoly.data();
+
+    const int nLines = bBottomBoundary ? nYSize : nYSize + 1;
+    for( int iY = 0; eErr == CE_None && iY < nLines; iY++ )
+    {
+        if( iY < nYSize )
+        {
+            eErr = ReadLine( iY, panThisLineVal, pabyMaskLine );
+            if( eErr != CE_None )
+                break;
+        }
+
+        if( iY == nYSize )
+        {
+            for( int iX = 0; iX < nXSize+2; iX++ )
+                panThisLineId[iX] = -1;
+        }
+        else if( iY == 0 )
+        {
+            oSecondEnum.ProcessLine(
+                nullptr, panThisLineVal, nullptr, panThisLineId+1, nXSize );
+        }
+        else
+        {
+            oSecondEnum.ProcessLine(
+                panLastLineVal, panThisLineVal,
+                panLastLineId+1,  panThisLineId+1,
+                nXSize );
+        }
+
+/* -------------------------------------------------------------------- */
+/*      Add polygon edges for the pixel boundaries within and above     */
+/*      this line. Passing the line itself as the previous one on the   */
+/*      first line of the strip skips the edges above it.               */
+/* -------------------------------------------------------------------- */
+        const int iYReal = nYOff + iY;
+        const GInt32 *panPrevLineId =
+            iY == 0 && bTopBoundary ? panThisLineId : panLastLineId;
+        for( int iX = 0; iX < nXSize+1; iX++ )
+        {
+            GPForEachEdge( panThisLineId, panPrevLineId,
+                           oFirstEnum.panPolyIdMap, iX,
+                [&](int nId, bool bVertical)
+                {
+                    if( apsBoundaryEdges[nId] != nullptr )
+                    {
+                        apsBoundaryEdges[nId]->anEdgeKeys.push_back(
+                            GPEdgeKey( nXSize, iX, iYReal, bVertical ) );
+                        return;
+                    }
+
+                    if( papoPoly[nId] == nullptr )
+                        papoPoly[nId] =
+                            new RPolygon( oFirstEnum.panPolyValue[nId] );
+
+                    if( bVertical )
+                        papoPoly[nId]->AddSegment( iX, iYReal,
+                                                   iX, iYReal+1 );
+                    else
+                        papoPoly[nId]->AddSegment( iX-1, iYReal,
+                                                   iX, iYReal );
+                } );
+        }
+
+/* -------------------------------------------------------------------- */
+/*      Periodically collect complete polygons.                         */
+/* -------------------------------------------------------------------- */
+        if( iY % 8 == 7 )
+        {
+            for( int iX = 0; iX < oSecondEnum.nNextPolygonId; iX++ )
+            {
+                if( papoPoly[iX] &&
+                    papoPoly[iX]->nLastLineUpdated < iYReal - 1 )
+                {
+                    aoCompleted.emplace_back(
+                        RPolygonToGeometry( papoPoly[iX], padfGeoTransform ),
+                        papoPoly[iX]->dfPolyValue );
+
+                    delete papoPoly[iX];
+                    papoPoly[iX] = nullptr;
+                }
+            }
+        }
+
+        std::swap(panLastLineVal, panThisLineVal);
+        std::swap(panLastLineId, panThisLineId);
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Dispatch the remaining polygons.                                */
+/* -------------------------------------------------------------------- */
+    for( int iX = 0; iX < oSecondEnum.nNextPolygonId; iX++ )
+    {
+        if( papoPoly[iX] == nullptr )
+            continue;
+        if( eErr == CE_None )
+        {
+            aoCompleted.emplace_back(
+                RPolygonToGeometry( papoPoly[iX], padfGeoTransform ),
+                papoPoly[iX]->dfPolyValue );
+        }
+        delete papoPoly[iX];
+        papoPoly[iX] = nullptr;
+    }
+}
+
+/************************************************************************/
+/*                          GPStripJob::Run()                           */
+/************************************************************************/
+
+template<class DataType, class EqualityTest>
+void GPStripJob<DataType, EqualityTest>::Run( void *pData )
+{
+    GPStripJob *psJob = static_cast<GPStripJob *>(pData);
+    try
+    {
+        psJob->Polygonize();
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALPolygonize()" );
+        psJob->eErr = CE_Failure;
+    }
+}
+
+/************************************************************************/
+/*                           GPStripStitcher                            */
+/*                                                                      */
+/*      Assemble the boundary polygons of consecutive strips. Polygons  */
+/*      connected across strip boundaries are put in the same group.    */
+/*      Groups are numbered in the order of their first pixel and a     */
+/*      group is always merged into the one with the smallest number,   */
+/*      so that the value of a polygon is the one of its first pixel,   */
+/*      as in GDALPolygonizeT().                                        */
+/************************************************************************/
+
+template<class DataType, class EqualityTest>
+class GPStripStitcher
+{
+    CPL_DISALLOW_COPY_ASSIGN(GPStripStitcher)
+
+    OGRLayerH              m_hOutLayer;
+    int                    m_iPixValField;
+    double                *m_padfGeoTransform;
+    int                    m_nConnectedness;
+    int                    m_nXSize;
+
+    std::vector<int>       m_anGroupParent{};
+    std::vector<GPPolygonEdges> m_asGroupEdges{};
+
+    // Groups of the polygons of the last line of the previous strip.
+    std::map<GInt32, int>  m_oMapFrontier{};
+    std::vector<GInt32>    m_anFrontierLineId{};
+    std::vector<DataType>  m_anFrontierLineVal{};
+
+    int                    FindGroup( int iGroup );
+    void                   MergeGroups( int iGroup1, int iGroup2 );
+
+  public:
+    GPStripStitcher( OGRLayerH hOutLayer, int iPixValField,
+                     double *padfGeoTransform, int nConnectedness,
+                     int nXSize ) :
+        m_hOutLayer(hOutLayer), m_iPixValField(iPixValField),
+        m_padfGeoTransform(padfGeoTransform),
+        m_nConnectedness(nConnectedness), m_nXSize(nXSize) {}
+
+    CPLErr AddStrip( GPStripJob<DataType, EqualityTest> *psJob );
+};
+
+template<class DataType, class EqualityTest>
+int GPStripStitcher<DataType, EqualityTest>::FindGroup( int iGroup )
+{
+    while( m_anGroupParent[iGroup] != iGroup )
+    {
+        m_anGroupParent[iGroup] = m_anGroupParent[m_anGroupParent[iGroup]];
+        iGroup = m_anGroupParent[iGroup];
+    }
+    return iGroup;
+}
+
+template<class DataType, class EqualityTest>
+void GPStripStitcher<DataType, EqualityTest>::MergeGroups( int iGroup1,
+                                                           int iGroup2 )
+{
+    iGroup1 = FindGroup(iGroup1);
+    iGroup2 = FindGroup(iGroup2);
+    if( iGroup1 == iGroup2 )
+        return;
+    if( iGroup2 < iGroup1 )
+        std::swap(iGroup1, iGroup2);
+
+    m_anGroupParent[iGroup2] = iGroup1;
+
+    // Edges are sorted before use, so append the smallest list.
+    std::vector<GIntBig>& anDst = m_asGroupEdges[iGroup1].anEdgeKeys;
+    std::vector<GIntBig>& anSrc = m_asGroupEdges[iGroup2].anEdgeKeys;
+    if( anDst.size() < anSrc.size() )
+        std::swap(anDst, anSrc);
+    anDst.insert(anDst.end(), anSrc.begin(), anSrc.end());
+    std::vector<GIntBig>().swap(anSrc);
+}
+
+/************************************************************************/
+/*                     GPStripStitcher::AddStrip()                      */
+/************************************************************************/
+
+template<class DataType, class EqualityTest>
+CPLErr GPStripStitcher<DataType, EqualityTest>::AddStrip(
+                                GPStripJob<DataType, EqualityTest> *psJob )
+{
+    CPLErr eErr = CE_None;
+
+/* -------------------------------------------------------------------- */
+/*      Write the polygons entirely inside the strip.                   */
+/* -------------------------------------------------------------------- */
+    for( auto& oPair: psJob->aoCompleted )
+    {
+        if( eErr == CE_None )
+            eErr = EmitPolygonGeometryToLayer( m_hOutLayer, m_iPixValField,
+                                               oPair.first, oPair.second );
+        else
+            OGR_G_DestroyGeometry( oPair.first );
+    }
+    psJob->aoCompleted.clear();
+    if( eErr != CE_None )
+        return eErr;
+
+/* -------------------------------------------------------------------- */
+/*      Create a group for each boundary polygon of the strip. Final    */
+/*      polygon ids are in the order of the first pixel of polygons.    */
+/* -------------------------------------------------------------------- */
+    std::map<GInt32, int> oMapStripGroups;
+    std::set<int> oSetCandidates;
+    for( auto& oPair: psJob->oMapBoundaryEdges )
+    {
+        const int iGroup = static_cast<int>(m_anGroupParent.size());
+        m_anGroupParent.push_back(iGroup);
+        m_asGroupEdges.push_back(std::move(oPair.second));
+        oMapStripGroups[oPair.first] = iGroup;
+        oSetCandidates.insert(iGroup);
+    }
+    psJob->oMapBoundaryEdges.clear();
+
+/* -------------------------------------------------------------------- */
+/*      Join the polygons connected across the boundary with the        */
+/*      previous strip, and add the edges lying on this boundary.       */
+/* -------------------------------------------------------------------- */
+    if( psJob->bTopBoundary )
+    {
+        EqualityTest eq;
+        const int nXSize = m_nXSize;
+        const int nDelta = m_nConnectedness == 8 ? 1 : 0;
+        const GInt32 *panAboveId = m_anFrontierLineId.data();
+        const DataType *panAboveVal = m_anFrontierLineVal.data();
+        const GInt32 *panBelowId = psJob->anTopLineId.data();
+        const DataType *panBelowVal = psJob->anTopLineVal.data();
+
+        for( int iX = 0; iX < nXSize; iX++ )
+        {
+            if( panAboveId[iX] == -1 )
+                continue;
+            for( int iXBelow = std::max(0, iX - nDelta);
+                 iXBelow <= std::min(nXSize - 1, iX + nDelta);
+                 iXBelow++ )
+            {
+                if( panBelowId[iXBelow] != -1 &&
+                    eq.operator()(panAboveVal[iX], panBelowVal[iXBelow]) )
+                {
+                    MergeGroups( m_oMapFrontier[panAboveId[iX]],
+                                 oMapStripGroups[panBelowId[iXBelow]] );
+                }
+            }
+        }
+
+        const int nY = psJob->nYOff;
+        for( int iX = 0; iX < nXSize; iX++ )
+        {
+            if( panAboveId[iX] != -1 && panBelowId[iX] != -1 &&
+                eq.operator()(panAboveVal[iX], panBelowVal[iX]) )
+            {
+                continue;
+            }
+            const GIntBig nKey = GPEdgeKey( nXSize, iX + 1, nY, false );
+            if( panAboveId[iX] != -1 )
+            {
+                m_asGroupEdges[FindGroup(m_oMapFrontier[panAboveId[iX]])].
+                    anEdgeKeys.push_back(nKey);
+            }
+            if( panBelowId[iX] != -1 )
+            {
+                m_asGroupEdges[FindGroup(oMapStripGroups[panBelowId[iX]])].
+                    anEdgeKeys.push_back(nKey);
+            }
+        }
+
+        for( const auto& oPair: m_oMapFrontier )
+            oSetCandidates.insert(oPair.second);
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Groups reaching the last line of the strip continue in the      */
+/*      next one. The others are complete.                              */
+/* -------------------------------------------------------------------- */
+    m_oMapFrontier.clear();
+    std::set<int> oSetLiveGroups;
+    if( psJob->bBottomBoundary )
+    {
+        for( const GInt32 nId: psJob->anBottomLineId )
+        {
+            if( nId != -1 && m_oMapFrontier.find(nId) == m_oMapFrontier.end() )
+            {
+                const int iGroup = oMapStripGroups[nId];
+                m_oMapFrontier[nId] = iGroup;
+                oSetLiveGroups.insert(FindGroup(iGroup));
+            }
+        }
+        m_anFrontierLineId = std::move(psJob->anBottomLineId);
+        m_anFrontierLineVal = std::move(psJob->anBottomLineVal);
+    }
+
+    std::set<int> oSetCompleted;
+    for( const int iGroup: oSetCandidates )
+    {
+        const int iRoot = FindGroup(iGroup);
+        if( oSetLiveGroups.find(iRoot) == oSetLiveGroups.end() )
+            oSetCompleted.insert(iRoot);
+    }
+
+    for( const int iRoot: oSetCompleted )
+    {
+        GPPolygonEdges *psEdges = &m_asGroupEdges[iRoot];
+        if( eErr == CE_None )
+        {
+            RPolygon oRPoly( psEdges->dfPolyValue );
+            GPEdgesToRPolygon( psEdges, m_nXSize, &oRPoly );
+            eErr = EmitPolygonToLayer( m_hOutLayer, m_iPixValField,
+                                       &oRPoly, m_padfGeoTransform );
+        }
+        std::vector<GIntBig>().swap(psEdges->anEdgeKeys);
+    }
+
+    return eErr;
+}
+
+/************************************************************************/
+/*                        GDALPolygonizeTiledT()                        */
+/************************************************************************/
+
+template<class DataType, class EqualityTest>
+static CPLErr
+GDALPolygonizeTiledT( GDALRasterBandH hSrcBand,
+                      GDALRasterBandH hMaskBand,
+                      OGRLayerH hOutLayer, int iPixValField,
+                      int nConnectedness, int nThreads, int nStripHeight,
+                      double *padfGeoTransform,
+                      GDALProgressFunc pfnProgress,
+                      void * pProgressArg,
+                      GDALDataType eDT )
+
+{
+    const int nXSize = GDALGetRasterBandXSize( hSrcBand );
+    const int nYSize = GDALGetRasterBandYSize( hSrcBand );
+    const int nStrips = (nYSize + nStripHeight - 1) / nStripHeight;
+
+    CPLWorkerThreadPool oPool;
+    if( !oPool.Setup( std::min(nThreads, nStrips), nullptr, nullptr ) )
+        return CE_Failure;
+
+    CPLMutex *hIOMutex = nullptr;
+    GPStripStitcher<DataType, EqualityTest> oStitcher(
+        hOutLayer, iPixValField, padfGeoTransform, nConnectedness, nXSize );
+
+/* -------------------------------------------------------------------- */
+/*      Process the strips by batches of as many strips as threads,     */
+/*      stitching and writing them in order, to bound the memory in     */
+/*      use.                                                            */
+/* -------------------------------------------------------------------- */
+    const int nBatchSize = oPool.GetThreadCount();
+    CPLErr eErr = CE_None;
+
+    try
+    {
+        for( int iStripStart = 0;
+             eErr == CE_None && iStripStart < nStrips;
+             iStripStart += nBatchSize )
+        {
+            const int nBatchStrips =
+                std::min(nBatchSize, nStrips - iStripStart);
+            std::vector<std::unique_ptr<
+                GPStripJob<DataType, EqualityTest>>> apoJobs;
+            std::vector<void*> apJobData;
+            for( int iStrip = iStripStart;
+                 iStrip < iStripStart + nBatchStrips;
+                 iStrip++ )
+            {
+                std::unique_ptr<GPStripJob<DataType, EqualityTest>> poJob(
+                    new GPStripJob<DataType, EqualityTest>());
+                poJob->hSrcBand = hSrcBand;
+                poJob->hMaskBand = hMaskBand;
+                poJob->eDT = eDT;
+                poJob->phIOMutex = &hIOMutex;
+                poJob->padfGeoTransform = padfGeoTransform;
+                poJob->nConnectedness = nConnectedness;
+                poJob->nXSize = nXSize;
+                poJob->nYOff = iStrip * nStripHeight;
+                poJob->nYSize = std::min(nStripHeight,
+                                         nYSize - poJob->nYOff);
+                poJob->bTopBoundary = iStrip > 0;
+                poJob->bBottomBoundary = iStrip < nStrips - 1;
+                apJobData.push_back(poJob.get());
+                apoJobs.push_back(std::move(poJob));
+            }
+
+            oPool.SubmitJobs( GPStripJob<DataType, EqualityTest>::Run,
+                              apJobData );
+            oPool.WaitCompletion();
+
+            for( int i = 0; eErr == CE_None && i < nBatchStrips; i++ )
+            {
+                eErr = apoJobs[i]->eErr;
+                if( eErr == CE_None )
+                    eErr = oStitcher.AddStrip( apoJobs[i].get() );
+
+/* -------------------------------------------------------------------- */
+/*      Report progress, and support interrupts.                        */
+/* -------------------------------------------------------------------- */
+                if( eErr == CE_None
+                    && !pfnProgress( (iStripStart + i + 1) /
+                                        static_cast<double>(nStrips),
+                                     "", pProgressArg ) )
+                {
+                    CPLError( CE_Failure, CPLE_UserInterrupt,
+                              "User terminated" );
+                    eErr = CE_Failure;
+                }
+            }
+        }
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALPolygonize()" );
+        eErr = CE_Failure;
+    }
+
+    if( hIOMutex )
+        CPLDestroyMutex( hIOMutex );
+
+    return eErr;
+}
+
 /************************************************************************/
 /*                           GDALPolygonizeT()                          */
 /************************************************************************/
@@ -462,11 +1199,59 @@ GDALPolygonizeT( GDALRasterBandH hSrcBand,
     }
 
 /* -------------------------------------------------------------------- */
-/*      Allocate working buffers.                                       */
+/*      Get the geotransform, if there is one, so we can convert the    */
+/*      vectors into georeferenced coordinates.                         */
+/* -------------------------------------------------------------------- */
+    double adfGeoTransform[6] = { 0.0, 1.0, 0.0, 0.0, 0.0, 1.0 };
+
+    const char* pszDatasetForGeoRef = CSLFetchNameValue(papszOptions,
+                                                        "DATASET_FOR_GEOREF");
+    if( pszDatasetForGeoRef )
+    {
+        GDALDatasetH hSrcDS = GDALOpen(pszDatasetForGeoRef, GA_ReadOnly);
+        if( hSrcDS )
+        {
+            GDALGetGeoTransform( hSrcDS, adfGeoTransform );
+            GDALClose(hSrcDS);
+        }
+    }
+    else
+    {
+        GDALDatasetH hSrcDS = GDALGetBandDataset( hSrcBand );
+        if( hSrcDS )
+            GDALGetGeoTransform( hSrcDS, adfGeoTransform );
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Use the tiled algorithm if requested.                           */
 /* -------------------------------------------------------------------- */
     const int nXSize = GDALGetRasterBandXSize( hSrcBand );
     const int nYSize = GDALGetRasterBandYSize( hSrcBand );
 
+    int nThreads = 1;
+    const char* pszNumThreads = CSLFetchNameValue(papszOptions, "NUM_THREADS");
+    if( pszNumThreads )
+    {
+        nThreads = EQUAL(pszNumThreads, "ALL_CPUS") ? CPLGetNumCPUs() :
+                                                      atoi(pszNumThreads);
+    }
+    const char* pszStripHeight = CSLFetchNameValue(papszOptions,
+                                                   "STRIP_HEIGHT");
+    const int nStripHeight =
+        std::max(1, pszStripHeight ? atoi(pszStripHeight) : 512);
+
+    if( (nThreads > 1 || pszStripHeight != nullptr) && nYSize > nStripHeight )
+    {
+        return GDALPolygonizeTiledT<DataType, EqualityTest>(
+            hSrcBand, hMaskBand, hOutLayer, iPixValField, nConnectedness,
+            std::max(1, nThreads), nStripHeight, adfGeoTransform,
+            pfnProgress, pProgressArg, eDT );
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Allocate working buffers.                                       */
+/* -------------------------------------------------------------------- */
+
     DataType *panLastLineVal = static_cast<DataType *>(
         VSI_MALLOC2_VERBOSE(sizeof(DataType), nXSize + 2));
     DataType *panThisLineVal = static_cast<DataType *>(
@@ -493,30 +1278,6 @@ GDALPolygonizeT( GDALRasterBandH hSrcBand,
         return CE_Failure;
     }
 
-/* -------------------------------------------------------------------- */
-/*      Get the geotransform, if there is one, so we can convert the    */
-/*      vectors into georeferenced coordinates.                         */
-/* -------------------------------------------------------------------- */
-    double adfGeoTransform[6] = { 0.0, 1.0, 0.0, 0.0, 0.0, 1.0 };
-
-    const char* pszDatasetForGeoRef = CSLFetchNameValue(papszOptions,
-                                                        "DATASET_FOR_GEOREF");
-    if( pszDatasetForGeoRef )
-    {
-        GDALDatasetH hSrcDS = GDALOpen(pszDatasetForGeoRef, GA_ReadOnly);
-        if( hSrcDS )
-        {
-            GDALGetGeoTransform( hSrcDS, adfGeoTransform );
-            GDALClose(hSrcDS);
-        }
-    }
-    else
-    {
-        GDALDatasetH hSrcDS = GDALGetBandDataset( hSrcBand );
-        if( hSrcDS )
-            GDALGetGeoTransform( hSrcDS, adfGeoTransform );
-    }
-
 /* -------------------------------------------------------------------- */
 /*      The first pass over the raster is only used to build up the     */
 /*      polygon id map so we will know in advance what polygons are     */
@@ -814,6 +1575,13 @@ GBool GDALFloatEquals( float A, float B )
  * <dl>
  * <dt>"8CONNECTED":</dt> May be set to "8" to use 8 connectedness.
  * Otherwise 4 connectedness will be applied to the algorithm
+ * <dt>"NUM_THREADS":</dt> (GDAL &gt;= 3.1) Number of worker threads, or
+ * ALL_CPUS. When greater than 1, the raster is processed by strips of lines
+ * in parallel. The polygons are the same as with a single thread, but may
+ * be written in a different order.
+ * <dt>"STRIP_HEIGHT":</dt> (GDAL &gt;= 3.1) Height in lines of the strips
+ * processed in parallel. Defaults to 512. Setting it also enables processing
+ * by strips with a single thread.
  * </dl>
  * @param pfnProgress callback for reporting algorithm progress matching the
  * GDALProgressFunc() semantics.  May be NULL.
@@ -890,6 +1658,13 @@ GDALPolygonize( GDALRasterBandH hSrcBand,
  * <dl>
  * <dt>"8CONNECTED":</dt> May be set to "8" to use 8 connectedness.
  * Otherwise 4 connectedness will be applied to the algorithm
+ * <dt>"NUM_THREADS":</dt> (GDAL &gt;= 3.1) Number of worker threads, or
+ * ALL_CPUS. When greater than 1, the raster is processed by strips of lines
+ * in parallel. The polygons are the same as with a single thread, but may
+ * be written in a different order.
+ * <dt>"STRIP_HEIGHT":</dt> (GDAL &gt;= 3.1) Height in lines of the strips
+ * processed in parallel. Defaults to 512. Setting it also enables processing
+ * by strips with a single thread.
  * </dl>
  * @param pfnProgress callback for reporting algorithm progress matching the
  * GDALProgressFunc() semantics.  May be NULL.
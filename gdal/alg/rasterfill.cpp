@@ -35,14 +35,18 @@
 #include <cstring>
 
 #include <algorithm>
+#include <memory>
 #include <string>
 #include <utility>
+#include <vector>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
+#include "cpl_multiproc.h"
 #include "cpl_progress.h"
 #include "cpl_string.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 #include "gdal.h"
 
 CPL_CVSID("$Id$")
@@ -365,6 +369,627 @@ inline void QUAD_CHECK(double& dfQuadDist, float& fQuadValue,
     }
 }
 
+/************************************************************************/
+/*                     GDALFillNodataInterpolate()                      */
+/*                                                                      */
+/*      Interpolate a nodata pixel from the nearest valid pixels found  */
+/*      in each quadrant, using the nearest valid pixel above (or on)   */
+/*      and below the line in each column.  The column arrays hold      */
+/*      the nXSize columns starting at column nXOff.  Returns false     */
+/*      if no valid pixel was found.                                    */
+/************************************************************************/
+
+static bool
+GDALFillNodataInterpolate( int iX, int iY, int nXSize, int nXOff,
+                           double dfMaxSearchDist,
+                           const GUInt32 *panTopDownY,
+                           const float *pafTopDownValue,
+                           const GUInt32 *panBottomUpY,
+                           const float *pafBottomUpValue,
+                           GUInt32 nNoDataVal,
+                           bool bHasNoData, float fNoData,
+                           float *pfValue )
+
+{
+    int nThisMaxSearchDist = static_cast<int>(floor(dfMaxSearchDist));
+
+    // Quadrants 0:topleft, 1:bottomleft, 2:topright, 3:bottomright
+    double adfQuadDist[4] = {};
+    float fQuadValue[4] = {};
+
+    for( int iQuad = 0; iQuad < 4; iQuad++ )
+    {
+        adfQuadDist[iQuad] = dfMaxSearchDist + 1.0;
+        fQuadValue[iQuad] = 0.0;
+    }
+
+    // Step left and right by one pixel searching for the closest
+    // target value for each quadrant.
+    for( int iStep = 0; iStep <= nThisMaxSearchDist; iStep++ )
+    {
+        // The search distance can exceed dfMaxSearchDist by one pixel,
+        // and the block windows only extend that far.
+        const int iLeftX = std::max(nXOff, iX - iStep);
+        const int iRightX = std::min(nXOff + nXSize - 1, iX + iStep);
+
+        // Top left includes current line.
+        QUAD_CHECK(adfQuadDist[0], fQuadValue[0],
+                   iLeftX, panTopDownY[iLeftX - nXOff], iX, iY,
+                   pafTopDownValue[iLeftX - nXOff], nNoDataVal );
+
+        // Bottom left.
+        QUAD_CHECK(adfQuadDist[1], fQuadValue[1],
+                   iLeftX, panBottomUpY[iLeftX - nXOff], iX, iY,
+                   pafBottomUpValue[iLeftX - nXOff], nNoDataVal );
+
+        // Top right and bottom right do no include center pixel.
+        if( iStep == 0 )
+             continue;
+
+        // Top right includes current line.
+        QUAD_CHECK(adfQuadDist[2], fQuadValue[2],
+                   iRightX, panTopDownY[iRightX - nXOff], iX, iY,
+                   pafTopDownValue[iRightX - nXOff], nNoDataVal );
+
+        // Bottom right.
+        QUAD_CHECK(adfQuadDist[3], fQuadValue[3],
+                   iRightX, panBottomUpY[iRightX - nXOff], iX, iY,
+                   pafBottomUpValue[iRightX - nXOff], nNoDataVal );
+
+        // Every four steps, recompute maximum distance.
+        if( (iStep & 0x3) == 0 )
+            nThisMaxSearchDist = static_cast<int>(floor(
+                std::max(std::max(adfQuadDist[0], adfQuadDist[1]),
+                         std::max(adfQuadDist[2], adfQuadDist[3]))));
+    }
+
+    double dfWeightSum = 0.0;
+    double dfValueSum = 0.0;
+    bool bHasSrcValues = false;
+
+    for( int iQuad = 0; iQuad < 4; iQuad++ )
+    {
+        if( adfQuadDist[iQuad] <= dfMaxSearchDist )
+        {
+            const double dfWeight = 1.0 / adfQuadDist[iQuad];
+
+            bHasSrcValues = dfWeight != 0;
+            if( !bHasNoData || fQuadValue[iQuad] != fNoData )
+            {
+                dfWeightSum += dfWeight;
+                dfValueSum += fQuadValue[iQuad] * dfWeight;
+            }
+        }
+    }
+
+    if( !bHasSrcValues )
+        return false;
+
+    if( dfWeightSum > 0.0 )
+        *pfValue = static_cast<float>(dfValueSum / dfWeightSum);
+    else
+        *pfValue = fNoData;
+    return true;
+}
+
+/************************************************************************/
+/* ==================================================================== */
+/*                      Processing by blocks                            */
+/*                                                                      */
+/*      The interpolation of a pixel only depends on the source pixels  */
+/*      within the maximum search distance, and each smoothing          */
+/*      iteration only on the 3x3 neighbourhood of the previous one.    */
+/*      So blocks can be processed independently by worker threads,     */
+/*      each one reading a window extended by a halo of that size, and  */
+/*      give the same result as the algorithm processing the whole      */
+/*      image.  Blocks are processed by rows of blocks, and the output  */
+/*      of a row is only written once the next row has been read, so    */
+/*      that halos are always read from the input of the step.  This    */
+/*      requires halos not to be larger than the block size.            */
+/* ==================================================================== */
+/************************************************************************/
+
+namespace {
+
+struct GDALFillBlockJob
+{
+    // Inputs.
+    GDALRasterBandH  hTargetBand = nullptr;
+    GDALRasterBandH  hMaskBand = nullptr;
+    GDALRasterBandH  hFiltMaskBand = nullptr;
+    CPLMutex       **phIOMutex = nullptr;
+    int              nXSize = 0;
+    int              nYSize = 0;
+    int              nBlockXOff = 0;
+    int              nBlockYOff = 0;
+    int              nBlockXSize = 0;
+    int              nBlockYSize = 0;
+    double           dfMaxSearchDist = 0.0;
+    GUInt32          nNoDataVal = 0;
+    bool             bHasNoData = false;
+    float            fNoData = 0.0f;
+    int              nIterations = 0;
+
+    // Outputs, for the pixels of the block.
+    CPLErr              eErr = CE_None;
+    std::vector<float>  afValues{};
+    std::vector<GByte>  abyFiltMask{};
+
+    CPLErr ReadWindow( GDALRasterBandH hBand, int nXOff, int nYOff,
+                       int nXCount, int nYCount,
+                       void *pData, GDALDataType eBufType );
+};
+
+}  // namespace
+
+/************************************************************************/
+/*                     GDALFillBlockJob::ReadWindow()                   */
+/*                                                                      */
+/*      The bands are shared by all jobs, so reads are serialized.      */
+/************************************************************************/
+
+CPLErr GDALFillBlockJob::ReadWindow( GDALRasterBandH hBand,
+                                     int nXOff, int nYOff,
+                                     int nXCount, int nYCount,
+                                     void *pData, GDALDataType eBufType )
+{
+    CPLMutexHolderD(phIOMutex);
+
+    return GDALRasterIO( hBand, GF_Read, nXOff, nYOff, nXCount, nYCount,
+                         pData, nXCount, nYCount, eBufType, 0, 0 );
+}
+
+/************************************************************************/
+/*                        GDALFillNodataBlock()                         */
+/*                                                                      */
+/*      Same as the two passes of GDALFillNodata(), for one block.      */
+/************************************************************************/
+
+static void GDALFillNodataBlock( void *pData )
+{
+    GDALFillBlockJob *psJob = static_cast<GDALFillBlockJob *>(pData);
+    const int nHalo = static_cast<int>(floor(psJob->dfMaxSearchDist));
+    const int nBlockXOff = psJob->nBlockXOff;
+    const int nBlockYOff = psJob->nBlockYOff;
+    const int nBlockXSize = psJob->nBlockXSize;
+    const int nBlockYSize = psJob->nBlockYSize;
+
+/* -------------------------------------------------------------------- */
+/*      Read the block and its halo. The nearest valid pixel below a    */
+/*      line is also needed for the last line of the block.             */
+/* -------------------------------------------------------------------- */
+    const int nWinXOff = std::max(0, nBlockXOff - nHalo);
+    const int nWinYOff = std::max(0, nBlockYOff - nHalo);
+    const int nWinXSize =
+        std::min(psJob->nXSize, nBlockXOff + nBlockXSize + nHalo) - nWinXOff;
+    const int nWinYSize =
+        std::min(psJob->nYSize, nBlockYOff + nBlockYSize + nHalo + 1) -
+        nWinYOff;
+
+    try
+    {
+        const size_t nWinPixels = static_cast<size_t>(nWinXSize) * nWinYSize;
+        std::vector<float> afWin(nWinPixels);
+        std::vector<GByte> abyWinMask(nWinPixels);
+
+        psJob->eErr = psJob->ReadWindow( psJob->hMaskBand,
+                                         nWinXOff, nWinYOff,
+                                         nWinXSize, nWinYSize,
+                                         abyWinMask.data(), GDT_Byte );
+        if( psJob->eErr == CE_None )
+            psJob->eErr = psJob->ReadWindow( psJob->hTargetBand,
+                                             nWinXOff, nWinYOff,
+                                             nWinXSize, nWinYSize,
+                                             afWin.data(), GDT_Float32 );
+        if( psJob->eErr != CE_None )
+            return;
+
+        const double dfMaxSearchDist = psJob->dfMaxSearchDist;
+        const GUInt32 nNoDataVal = psJob->nNoDataVal;
+        const size_t nBlockRowPixels = static_cast<size_t>(nWinXSize);
+
+/* -------------------------------------------------------------------- */
+/*      Nearest valid pixel on or above each line of the block, and     */
+/*      below each line of the block, in each column of the window.     */
+/* -------------------------------------------------------------------- */
+        std::vector<GUInt32> anTopDownY(nBlockRowPixels * nBlockYSize);
+        std::vector<float> afTopDownValue(nBlockRowPixels * nBlockYSize);
+        std::vector<GUInt32> anBottomUpY(nBlockRowPixels * nBlockYSize,
+                                         nNoDataVal);
+        std::vector<float> afBottomUpValue(nBlockRowPixels * nBlockYSize);
+
+        std::vector<GUInt32> anLastY(nWinXSize, nNoDataVal);
+        std::vector<GUInt32> anThisY(nWinXSize);
+        std::vector<float> afLastValue(nWinXSize);
+        std::vector<float> afThisValue(nWinXSize);
+
+        for( int iY = nWinYOff; iY < nBlockYOff + nBlockYSize; iY++ )
+        {
+            const size_t nOff = (iY - nWinYOff) * nBlockRowPixels;
+            for( int iX = 0; iX < nWinXSize; iX++ )
+            {
+                if( abyWinMask[nOff + iX] )
+                {
+                    afThisValue[iX] = afWin[nOff + iX];
+                    anThisY[iX] = iY;
+                }
+                else if( iY <= dfMaxSearchDist + anLastY[iX] )
+                {
+                    afThisValue[iX] = afLastValue[iX];
+                    anThisY[iX] = anLastY[iX];
+                }
+                else
+                {
+                    anThisY[iX] = nNoDataVal;
+                }
+            }
+            std::swap(afThisValue, afLastValue);
+            std::swap(anThisY, anLastY);
+
+            if( iY >= nBlockYOff )
+            {
+                const size_t nDst = (iY - nBlockYOff) * nBlockRowPixels;
+                std::copy(anLastY.begin(), anLastY.end(),
+                          anTopDownY.begin() + nDst);
+                std::copy(afLastValue.begin(), afLastValue.end(),
+                          afTopDownValue.begin() + nDst);
+            }
+        }
+
+        std::fill(anLastY.begin(), anLastY.end(), nNoDataVal);
+        for( int iY = nWinYOff + nWinYSize - 1; iY > nBlockYOff; iY-- )
+        {
+            const size_t nOff = (iY - nWinYOff) * nBlockRowPixels;
+            for( int iX = 0; iX < nWinXSize; iX++ )
+            {
+                if( abyWinMask[nOff + iX] )
+                {
+                    afThisValue[iX] = afWin[nOff + iX];
+                    anThisY[iX] = iY;
+                }
+                else if( anLastY[iX] - iY <= dfMaxSearchDist )
+                {
+                    afThisValue[iX] = afLastValue[iX];
+                    anThisY[iX] = anLastY[iX];
+                }
+                else
+                {
+                    anThisY[iX] = nNoDataVal;
+                }
+            }
+            std::swap(afThisValue, afLastValue);
+            std::swap(anThisY, anLastY);
+
+            // Nearest valid pixel below line iY - 1 of the block.
+            if( iY <= nBlockYOff + nBlockYSize )
+            {
+                const size_t nDst = (iY - 1 - nBlockYOff) * nBlockRowPixels;
+                std::copy(anLastY.begin(), anLastY.end(),
+                          anBottomUpY.begin() + nDst);
+                std::copy(afLastValue.begin(), afLastValue.end(),
+                          afBottomUpValue.begin() + nDst);
+            }
+        }
+
+/* -------------------------------------------------------------------- */
+/*      Interpolate the nodata pixels of the block.                     */
+/* -------------------------------------------------------------------- */
+        psJob->afValues.resize(static_cast<size_t>(nBlockXSize) *
+                               nBlockYSize);
+        psJob->abyFiltMask.assign(psJob->afValues.size(), 0);
+
+        for( int iY = nBlockYOff; iY < nBlockYOff + nBlockYSize; iY++ )
+        {
+            const size_t nRow = (iY - nBlockYOff) * nBlockRowPixels;
+            const size_t nWinOff = (iY - nWinYOff) * nBlockRowPixels;
+            for( int iX = nBlockXOff; iX < nBlockXOff + nBlockXSize; iX++ )
+            {
+                const size_t nDst =
+                    static_cast<size_t>(iY - nBlockYOff) * nBlockXSize +
+                    (iX - nBlockXOff);
+                psJob->afValues[nDst] = afWin[nWinOff + iX - nWinXOff];
+
+                if( abyWinMask[nWinOff + iX - nWinXOff] )
+                    continue;
+
+                if( GDALFillNodataInterpolate( iX, iY, nWinXSize,
+                                               nWinXOff, dfMaxSearchDist,
+                                               &anTopDownY[nRow],
+                                               &afTopDownValue[nRow],
+                                               &anBottomUpY[nRow],
+                                               &afBottomUpValue[nRow],
+                                               nNoDataVal,
+                                               psJob->bHasNoData,
+                                               psJob->fNoData,
+                                               &psJob->afValues[nDst] ) )
+                {
+                    psJob->abyFiltMask[nDst] = 255;
+                }
+            }
+        }
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALFillNodata()" );
+        psJob->eErr = CE_Failure;
+    }
+}
+
+/************************************************************************/
+/*                       GDALMultiFilterBlock()                         */
+/*                                                                      */
+/*      Same as GDALMultiFilter(), for one block.                       */
+/************************************************************************/
+
+static void GDALMultiFilterBlock( void *pData )
+{
+    GDALFillBlockJob *psJob = static_cast<GDALFillBlockJob *>(pData);
+    const int nHalo = psJob->nIterations;
+    const int nBlockXOff = psJob->nBlockXOff;
+    const int nBlockYOff = psJob->nBlockYOff;
+    const int nBlockXSize = psJob->nBlockXSize;
+    const int nBlockYSize = psJob->nBlockYSize;
+
+    const int nWinXOff = std::max(0, nBlockXOff - nHalo);
+    const int nWinYOff = std::max(0, nBlockYOff - nHalo);
+    const int nWinXSize =
+        std::min(psJob->nXSize, nBlockXOff + nBlockXSize + nHalo) - nWinXOff;
+    const int nWinYSize =
+        std::min(psJob->nYSize, nBlockYOff + nBlockYSize + nHalo) - nWinYOff;
+
+    try
+    {
+        const size_t nWinPixels = static_cast<size_t>(nWinXSize) * nWinYSize;
+        std::vector<float> afLastPass(nWinPixels);
+        std::vector<float> afThisPass(nWinPixels);
+        std::vector<GByte> abyTMask(nWinPixels);
+        std::vector<GByte> abyFMask(nWinPixels);
+
+        psJob->eErr = psJob->ReadWindow( psJob->hMaskBand,
+                                         nWinXOff, nWinYOff,
+                                         nWinXSize, nWinYSize,
+                                         abyTMask.data(), GDT_Byte );
+        if( psJob->eErr == CE_None )
+            psJob->eErr = psJob->ReadWindow( psJob->hFiltMaskBand,
+                                             nWinXOff, nWinYOff,
+                                             nWinXSize, nWinYSize,
+                                             abyFMask.data(), GDT_Byte );
+        if( psJob->eErr == CE_None )
+            psJob->eErr = psJob->ReadWindow( psJob->hTargetBand,
+                                             nWinXOff, nWinYOff,
+                                             nWinXSize, nWinYSize,
+                                             afLastPass.data(), GDT_Float32 );
+        if( psJob->eErr != CE_None )
+            return;
+
+/* -------------------------------------------------------------------- */
+/*      Each iteration filters all lines of the window but the first    */
+/*      and last ones of the image, which are left unchanged.  The      */
+/*      lines and columns at the edge of the window are wrong where     */
+/*      it is not the edge of the image, but errors only progress by    */
+/*      one pixel per iteration, and stay in the halo.                  */
+/* -------------------------------------------------------------------- */
+        for( int iIter = 0; iIter < psJob->nIterations; iIter++ )
+        {
+            for( int iLine = 0; iLine < nWinYSize; iLine++ )
+            {
+                const int iY = nWinYOff + iLine;
+                const size_t nOff = static_cast<size_t>(iLine) * nWinXSize;
+                if( iY < 1 || iY >= psJob->nYSize - 1 ||
+                    iLine == 0 || iLine == nWinYSize - 1 )
+                {
+                    memcpy( &afThisPass[nOff], &afLastPass[nOff],
+                            sizeof(float) * nWinXSize );
+                    continue;
+                }
+
+                GDALFilterLine(
+                    &afLastPass[nOff - nWinXSize],
+                    &afLastPass[nOff],
+                    &afLastPass[nOff + nWinXSize],
+                    &afThisPass[nOff],
+                    &abyTMask[nOff - nWinXSize],
+                    &abyTMask[nOff],
+                    &abyTMask[nOff + nWinXSize],
+                    &abyFMask[nOff],
+                    nWinXSize );
+            }
+            std::swap(afLastPass, afThisPass);
+        }
+
+        psJob->afValues.resize(static_cast<size_t>(nBlockXSize) *
+                               nBlockYSize);
+        for( int iLine = 0; iLine < nBlockYSize; iLine++ )
+        {
+            memcpy( &psJob->afValues[static_cast<size_t>(iLine) * nBlockXSize],
+                    &afLastPass[static_cast<size_t>(
+                        nBlockYOff + iLine - nWinYOff) * nWinXSize +
+                        nBlockXOff - nWinXOff],
+                    sizeof(float) * nBlockXSize );
+        }
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALFillNodata()" );
+        psJob->eErr = CE_Failure;
+    }
+}
+
+/************************************************************************/
+/*                       GDALFillNodataRunBlocks()                      */
+/*                                                                      */
+/*      Run a function on all blocks of the image, by rows of blocks,   */
+/*      writing out the output of a row of blocks once the next one     */
+/*      has been processed.                                             */
+/************************************************************************/
+
+static CPLErr
+GDALFillNodataRunBlocks( CPLWorkerThreadPool *poPool,
+                         CPLThreadFunc pfnFunc,
+                         const GDALFillBlockJob &sTemplate,
+                         int nBlockSize,
+                         GDALProgressFunc pfnProgress,
+                         void * pProgressArg,
+                         const char *pszMessage )
+
+{
+    const int nXSize = sTemplate.nXSize;
+    const int nYSize = sTemplate.nYSize;
+    const int nBlockRows = (nYSize + nBlockSize - 1) / nBlockSize;
+
+    std::vector<GDALFillBlockJob> asPrevJobs;
+    CPLErr eErr = CE_None;
+
+    for( int iBlockRow = 0;
+         eErr == CE_None && iBlockRow <= nBlockRows;
+         iBlockRow++ )
+    {
+        std::vector<GDALFillBlockJob> asJobs;
+        if( iBlockRow < nBlockRows )
+        {
+            for( int nXOff = 0; nXOff < nXSize; nXOff += nBlockSize )
+            {
+                asJobs.push_back(sTemplate);
+                GDALFillBlockJob &sJob = asJobs.back();
+                sJob.nBlockXOff = nXOff;
+                sJob.nBlockYOff = iBlockRow * nBlockSize;
+                sJob.nBlockXSize = std::min(nBlockSize, nXSize - nXOff);
+                sJob.nBlockYSize =
+                    std::min(nBlockSize, nYSize - sJob.nBlockYOff);
+            }
+
+            if( poPool )
+            {
+                std::vector<void*> apJobData;
+                for( auto &sJob: asJobs )
+                    apJobData.push_back(&sJob);
+                poPool->SubmitJobs( pfnFunc, apJobData );
+                poPool->WaitCompletion();
+            }
+            else
+            {
+                for( auto &sJob: asJobs )
+                    pfnFunc( &sJob );
+            }
+
+            for( const auto &sJob: asJobs )
+            {
+                if( sJob.eErr != CE_None )
+                    eErr = sJob.eErr;
+            }
+        }
+
+/* -------------------------------------------------------------------- */
+/*      Write out the previous row of blocks.                           */
+/* -------------------------------------------------------------------- */
+        for( size_t i = 0; eErr == CE_None && i < asPrevJobs.size(); i++ )
+        {
+            GDALFillBlockJob &sJob = asPrevJobs[i];
+            eErr = GDALRasterIO( sJob.hTargetBand, GF_Write,
+                                 sJob.nBlockXOff, sJob.nBlockYOff,
+                                 sJob.nBlockXSize, sJob.nBlockYSize,
+                                 sJob.afValues.data(),
+                                 sJob.nBlockXSize, sJob.nBlockYSize,
+                                 GDT_Float32, 0, 0 );
+            if( eErr == CE_None && !sJob.abyFiltMask.empty() &&
+                sJob.hFiltMaskBand != nullptr )
+            {
+                eErr = GDALRasterIO( sJob.hFiltMaskBand, GF_Write,
+                                     sJob.nBlockXOff, sJob.nBlockYOff,
+                                     sJob.nBlockXSize, sJob.nBlockYSize,
+                                     sJob.abyFiltMask.data(),
+                                     sJob.nBlockXSize, sJob.nBlockYSize,
+                                     GDT_Byte, 0, 0 );
+            }
+        }
+
+        if( eErr == CE_None && iBlockRow > 0 &&
+            !pfnProgress( iBlockRow / static_cast<double>(nBlockRows),
+                          pszMessage, pProgressArg ) )
+        {
+            CPLError( CE_Failure, CPLE_UserInterrupt, "User terminated" );
+            eErr = CE_Failure;
+        }
+
+        asPrevJobs = std::move(asJobs);
+    }
+
+    return eErr;
+}
+
+/************************************************************************/
+/*                       GDALFillNodataByBlocks()                       */
+/************************************************************************/
+
+static CPLErr
+GDALFillNodataByBlocks( GDALRasterBandH hTargetBand,
+                        GDALRasterBandH hMaskBand,
+                        GDALRasterBandH hFiltMaskBand,
+                        double dfMaxSearchDist,
+                        GUInt32 nNoDataVal,
+                        bool bHasNoData, float fNoData,
+                        int nSmoothingIterations,
+                        int nThreads, int nBlockSize,
+                        double dfProgressRatio,
+                        GDALProgressFunc pfnProgress,
+                        void * pProgressArg )
+
+{
+    std::unique_ptr<CPLWorkerThreadPool> poPool;
+    if( nThreads > 1 )
+    {
+        poPool.reset(new CPLWorkerThreadPool());
+        if( !poPool->Setup( nThreads, nullptr, nullptr ) )
+            poPool.reset();
+    }
+
+    CPLMutex *hIOMutex = nullptr;
+
+    GDALFillBlockJob sTemplate;
+    sTemplate.hTargetBand = hTargetBand;
+    sTemplate.hMaskBand = hMaskBand;
+    sTemplate.hFiltMaskBand = hFiltMaskBand;
+    sTemplate.phIOMutex = &hIOMutex;
+    sTemplate.nXSize = GDALGetRasterBandXSize(hTargetBand);
+    sTemplate.nYSize = GDALGetRasterBandYSize(hTargetBand);
+    sTemplate.dfMaxSearchDist = dfMaxSearchDist;
+    sTemplate.nNoDataVal = nNoDataVal;
+    sTemplate.bHasNoData = bHasNoData;
+    sTemplate.fNoData = fNoData;
+    sTemplate.nIterations = nSmoothingIterations;
+
+    void *pScaledProgress =
+        GDALCreateScaledProgress( 0.0, dfProgressRatio,
+                                  pfnProgress, pProgressArg );
+    CPLErr eErr = GDALFillNodataRunBlocks( poPool.get(), GDALFillNodataBlock,
+                                           sTemplate, nBlockSize,
+                                           GDALScaledProgress,
+                                           pScaledProgress, "Filling..." );
+    GDALDestroyScaledProgress( pScaledProgress );
+
+    if( eErr == CE_None && nSmoothingIterations > 0 )
+    {
+        // Force masks to be to flushed and recomputed.
+        GDALFlushRasterCache( hMaskBand );
+
+        pScaledProgress =
+            GDALCreateScaledProgress( dfProgressRatio, 1.0,
+                                      pfnProgress, pProgressArg );
+        eErr = GDALFillNodataRunBlocks( poPool.get(), GDALMultiFilterBlock,
+                                        sTemplate, nBlockSize,
+                                        GDALScaledProgress, pScaledProgress,
+                                        "Smoothing Filter..." );
+        GDALDestroyScaledProgress( pScaledProgress );
+    }
+
+    if( hIOMutex )
+        CPLDestroyMutex( hIOMutex );
+
+    return eErr;
+}
+
 /************************************************************************/
 /*                           GDALFillNodata()                           */
 /************************************************************************/
@@ -401,6 +1026,17 @@ inline void QUAD_CHECK(double& dfQuadDist, float& fQuadValue,
  * <li>NODATA=value (starting with GDAL 2.4).
  * Source pixels at that value will be ignored by the interpolator. Warning:
  * currently this will not be honored by smoothing passes.</li>
+ * <li>NUM_THREADS=number_of_threads or ALL_CPUS (starting with GDAL 3.1).
+ * When greater than 1, the image is processed by blocks in parallel, both
+ * for the interpolation and the smoothing passes. The result is the same as
+ * with a single thread.</li>
+ * <li>BLOCK_SIZE=n (starting with GDAL 3.1). Size in pixels of the blocks
+ * processed in parallel. Defaults to 512. Setting it also enables processing
+ * by blocks with a single thread, which does not need the temporary work
+ * files of the interpolation. Each block is read with a margin of the
+ * maximum search distance, or of the number of smoothing iterations,
+ * which must not be larger than the block size: otherwise the image is
+ * processed as a whole.</li>
  * </ul>
  * @param pfnProgress the progress function to report completion.
  * @param pProgressArg callback data for progress function.
@@ -497,9 +1133,69 @@ GDALFillNodata( GDALRasterBandH hTargetBand,
     }
 
 /* -------------------------------------------------------------------- */
-/*      Create a work file to hold the Y "last value" indices.          */
+/*      Process by blocks if requested and possible.                    */
 /* -------------------------------------------------------------------- */
     const CPLString osTmpFile = CPLGenerateTempFilename("");
+
+    int nThreads = 1;
+    const char* pszNumThreads = CSLFetchNameValue(papszOptions, "NUM_THREADS");
+    if( pszNumThreads )
+    {
+        nThreads = EQUAL(pszNumThreads, "ALL_CPUS") ? CPLGetNumCPUs() :
+                                                      atoi(pszNumThreads);
+    }
+    const char* pszBlockSize = CSLFetchNameValue(papszOptions, "BLOCK_SIZE");
+    const int nBlockSize =
+        std::max(1, pszBlockSize ? atoi(pszBlockSize) : 512);
+
+    if( nThreads > 1 || pszBlockSize != nullptr )
+    {
+        if( std::max(nMaxSearchDist, nSmoothingIterations) <= nBlockSize )
+        {
+            GDALDatasetH hFiltMaskDS = nullptr;
+            const CPLString osFiltMaskTmpFile =
+                osTmpFile + "fill_filtmask_work.tif";
+            if( nSmoothingIterations > 0 )
+            {
+                hFiltMaskDS =
+                    GDALCreate( hDriver, osFiltMaskTmpFile,
+                                nXSize, nYSize, 1,
+                                GDT_Byte, papszWorkFileOptions );
+                if( hFiltMaskDS == nullptr )
+                {
+                    CPLError(CE_Failure, CPLE_AppDefined,
+                             "Could not create mask work file. "
+                             "Check driver capabilities.");
+                    CSLDestroy(papszWorkFileOptions);
+                    return CE_Failure;
+                }
+            }
+
+            const CPLErr eErr = GDALFillNodataByBlocks(
+                hTargetBand, hMaskBand,
+                hFiltMaskDS ? GDALGetRasterBand( hFiltMaskDS, 1 ) : nullptr,
+                dfMaxSearchDist, nNoDataVal, bHasNoData, fNoData,
+                nSmoothingIterations, nThreads, nBlockSize,
+                dfProgressRatio, pfnProgress, pProgressArg );
+
+            CSLDestroy(papszWorkFileOptions);
+            if( hFiltMaskDS )
+            {
+                GDALClose( hFiltMaskDS );
+                GDALDeleteDataset( hDriver, osFiltMaskTmpFile );
+            }
+            return eErr;
+        }
+
+        CPLDebug( "GDAL",
+                  "GDALFillNodata(): maximum search distance or smoothing "
+                  "iterations larger than BLOCK_SIZE=%d. "
+                  "Not processing by blocks.", nBlockSize );
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Create a work file to hold the Y "last value" indices.          */
+/* -------------------------------------------------------------------- */
     const CPLString osYTmpFile = osTmpFile + "fill_y_work.tif";
 
     GDALDatasetH hYDS =
@@ -743,87 +1439,19 @@ GDALFillNodata( GDALRasterBandH hTargetBand,
         memset( pabyFiltMask, 0, nXSize );
         for( int iX = 0; iX < nXSize; iX++ )
         {
-            int nThisMaxSearchDist = nMaxSearchDist;
-
             // If this was a valid target - no change.
             if( pabyMask[iX] )
                 continue;
 
-            // Quadrants 0:topleft, 1:bottomleft, 2:topright, 3:bottomright
-            double adfQuadDist[4] = {};
-            float fQuadValue[4] = {};
-
-            for( int iQuad = 0; iQuad < 4; iQuad++ )
-            {
-                adfQuadDist[iQuad] = dfMaxSearchDist + 1.0;
-                fQuadValue[iQuad] = 0.0;
-            }
-
-            // Step left and right by one pixel searching for the closest
-            // target value for each quadrant.
-            for( int iStep = 0; iStep <= nThisMaxSearchDist; iStep++ )
-            {
-                const int iLeftX = std::max(0, iX - iStep);
-                const int iRightX = std::min(nXSize - 1, iX + iStep);
-
-                // Top left includes current line.
-                QUAD_CHECK(adfQuadDist[0], fQuadValue[0],
-                           iLeftX, panTopDownY[iLeftX], iX, iY,
-                           pafTopDownValue[iLeftX], nNoDataVal );
-
-                // Bottom left.
-                QUAD_CHECK(adfQuadDist[1], fQuadValue[1],
-                           iLeftX, panLastY[iLeftX], iX, iY,
-                           pafLastValue[iLeftX], nNoDataVal );
-
-                // Top right and bottom right do no include center pixel.
-                if( iStep == 0 )
-                     continue;
-
-                // Top right includes current line.
-                QUAD_CHECK(adfQuadDist[2], fQuadValue[2],
-                           iRightX, panTopDownY[iRightX], iX, iY,
-                           pafTopDownValue[iRightX], nNoDataVal );
-
-                // Bottom right.
-                QUAD_CHECK(adfQuadDist[3], fQuadValue[3],
-                           iRightX, panLastY[iRightX], iX, iY,
-                           pafLastValue[iRightX], nNoDataVal );
-
-                // Every four steps, recompute maximum distance.
-                if( (iStep & 0x3) == 0 )
-                    nThisMaxSearchDist = static_cast<int>(floor(
-                        std::max(std::max(adfQuadDist[0], adfQuadDist[1]),
-                                 std::max(adfQuadDist[2], adfQuadDist[3]))));
-            }
-
-            double dfWeightSum = 0.0;
-            double dfValueSum = 0.0;
-            bool bHasSrcValues = false;
-
-            for( int iQuad = 0; iQuad < 4; iQuad++ )
-            {
-                if( adfQuadDist[iQuad] <= dfMaxSearchDist )
-                {
-                    const double dfWeight = 1.0 / adfQuadDist[iQuad];
-
-                    bHasSrcValues = dfWeight != 0;
-                    if( !bHasNoData || fQuadValue[iQuad] != fNoData )
-                    {
-                        dfWeightSum += dfWeight;
-                        dfValueSum += fQuadValue[iQuad] * dfWeight;
-                    }
-                }
-            }
-
-            if( bHasSrcValues )
+            if( GDALFillNodataInterpolate( iX, iY, nXSize, 0,
+                                           dfMaxSearchDist,
+                                           panTopDownY, pafTopDownValue,
+                                           panLastY, pafLastValue,
+                                           nNoDataVal, bHasNoData, fNoData,
+                                           pafScanline + iX ) )
             {
                 pabyMask[iX] = 255;
                 pabyFiltMask[iX] = 255;
-                if( dfWeightSum > 0.0 )
-                    pafScanline[iX] = static_cast<float>(dfValueSum / dfWeightSum);
-                else
-                    pafScanline[iX] = fNoData;
             }
         }
 
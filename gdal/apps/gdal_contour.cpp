@@ -61,7 +61,7 @@ static void Usage(const char* pszErrorMsg = nullptr)
         "                    [-3d] [-inodata] [-snodata n] [-f <formatname>] [-i <interval>]\n"
         "                    [[-dsco NAME=VALUE] ...] [[-lco NAME=VALUE] ...]\n"
         "                    [-off <offset>] [-fl <level> <level>...] [-e <exp_base>]\n"
-        "                    [-nln <outlayername>] [-q] [-p]\n"
+        "                    [-nln <outlayername>] [-q] [-p] [-num_threads n|ALL_CPUS]\n"
         "                    <src_filename> <dst_filename>\n" );
 
     if( pszErrorMsg != nullptr )
@@ -115,6 +115,7 @@ MAIN_START(argc, argv)
     bool bQuiet = false;
     GDALProgressFunc pfnProgress = nullptr;
     bool bPolygonize = false;
+    const char *pszNumThreads = nullptr;
 
     // Check that we are running against at least GDAL 1.4.
     // Note to developers: if we use newer API, please change the requirement.
@@ -231,6 +232,11 @@ MAIN_START(argc, argv)
         {
             bIgnoreNoData = true;
         }
+        else if( EQUAL(argv[i],"-num_threads") )
+        {
+            CHECK_HAS_ENOUGH_ADDITIONAL_ARGS(1);
+            pszNumThreads = argv[++i];
+        }
         else if ( EQUAL(argv[i],"-q") || EQUAL(argv[i],"-quiet") )
         {
             bQuiet = TRUE;
@@ -450,6 +456,9 @@ MAIN_START(argc, argv)
     if ( bPolygonize ) {
         options = CSLAppendPrintf( options, "POLYGONIZE=YES" );
     }
+    if ( pszNumThreads ) {
+        options = CSLSetNameValue( options, "NUM_THREADS", pszNumThreads );
+    }
 
     CPLErr eErr = GDALContourGenerateEx( hBand, hLayer, options, pfnProgress, nullptr );
     
@@ -52,6 +52,7 @@ static void Usage(const char* pszErrorMsg = nullptr)
         "    [-clipsrcwhere expression]\n"
         "    [-l layername]* [-where expression] [-sql select_statement]\n"
         "    [-txe xmin xmax] [-tye ymin ymax] [-outsize xsize ysize]\n"
+        "    [-tile_size xsize ysize]\n"
         "    [-a algorithm[:parameter1=value1]*]"
         "    [-q]\n"
         "    <src_datasource> <dst_filename>\n"
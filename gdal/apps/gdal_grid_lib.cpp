@@ -32,6 +32,7 @@
 #include "gdal_utils_priv.h"
 #include "commonutils.h"
 
+#include <cmath>
 #include <cstdio>
 #include <cstdlib>
 #include <algorithm>
@@ -105,6 +106,8 @@ struct GDALGridOptions
     char            *pszClipSrcWhere;
     bool             bNoDataSet;
     double           dfNoDataValue;
+    int              nTileXSize;
+    int              nTileYSize;
 };
 
 /************************************************************************/
@@ -393,6 +396,529 @@ static void ProcessCommonGeometry(OGRGeometry* poGeom, OGRGeometry *poClipSrc,
     }
 }
 
+/************************************************************************/
+/*                         ComputeGridExtent()                          */
+/*                                                                      */
+/*      Use the extent of the layer for the grid extent not set by the  */
+/*      user.                                                           */
+/************************************************************************/
+
+static void ComputeGridExtent( OGRLayerH hSrcLayer,
+                               bool& bIsXExtentSet, bool& bIsYExtentSet,
+                               double& dfXMin, double& dfXMax,
+                               double& dfYMin, double& dfYMax )
+{
+    if ( !bIsXExtentSet || !bIsYExtentSet )
+    {
+        OGREnvelope sEnvelope;
+        OGR_L_GetExtent( hSrcLayer, &sEnvelope, TRUE );
+
+        if ( !bIsXExtentSet )
+        {
+            dfXMin = sEnvelope.MinX;
+            dfXMax = sEnvelope.MaxX;
+            bIsXExtentSet = true;
+        }
+
+        if ( !bIsYExtentSet )
+        {
+            dfYMin = sEnvelope.MinY;
+            dfYMax = sEnvelope.MaxY;
+            bIsYExtentSet = true;
+        }
+    }
+}
+
+/************************************************************************/
+/*                           PrintGridInfo()                            */
+/************************************************************************/
+
+static void PrintGridInfo( GDALDataType eType, int nXSize, int nYSize,
+                           double dfXMin, double dfXMax,
+                           double dfYMin, double dfYMax,
+                           GUIntBig nPoints,
+                           GDALGridAlgorithm eAlgorithm, void *pOptions )
+{
+    const double dfDeltaX = (dfXMax - dfXMin) / nXSize;
+    const double dfDeltaY = (dfYMax - dfYMin) / nYSize;
+
+    printf( "Grid data type is \"%s\"\n", GDALGetDataTypeName(eType) );
+    printf("Grid size = (%lu %lu).\n",
+           static_cast<unsigned long>(nXSize),
+           static_cast<unsigned long>(nYSize));
+    CPLprintf( "Corner coordinates = (%f %f)-(%f %f).\n",
+            dfXMin - dfDeltaX / 2, dfYMax + dfDeltaY / 2,
+            dfXMax + dfDeltaX / 2, dfYMin - dfDeltaY / 2 );
+    CPLprintf( "Grid cell size = (%f %f).\n", dfDeltaX, dfDeltaY );
+    printf("Source point count = %lu.\n",
+           static_cast<unsigned long>(nPoints));
+    PrintAlgorithmAndOptions( eAlgorithm, pOptions );
+}
+
+/************************************************************************/
+/*                          GetSearchRadius()                           */
+/*                                                                      */
+/*      Return the distance beyond which points have no influence on    */
+/*      a grid node, or 0 if any point may have some.                   */
+/************************************************************************/
+
+static double GetSearchRadius( GDALGridAlgorithm eAlgorithm,
+                               const void *pOptions )
+{
+    double dfRadius1 = 0.0;
+    double dfRadius2 = 0.0;
+    switch( eAlgorithm )
+    {
+        case GGA_InverseDistanceToAPower:
+        {
+            const GDALGridInverseDistanceToAPowerOptions *pOptions2 =
+                static_cast<const GDALGridInverseDistanceToAPowerOptions *>(
+                    pOptions);
+            dfRadius1 = pOptions2->dfRadius1;
+            dfRadius2 = pOptions2->dfRadius2;
+            break;
+        }
+        case GGA_InverseDistanceToAPowerNearestNeighbor:
+        {
+            const GDALGridInverseDistanceToAPowerNearestNeighborOptions
+                *pOptions2 = static_cast<
+                    const GDALGridInverseDistanceToAPowerNearestNeighborOptions *>(
+                        pOptions);
+            dfRadius1 = pOptions2->dfRadius;
+            dfRadius2 = pOptions2->dfRadius;
+            break;
+        }
+        case GGA_MovingAverage:
+        {
+            const GDALGridMovingAverageOptions *pOptions2 =
+                static_cast<const GDALGridMovingAverageOptions *>(pOptions);
+            dfRadius1 = pOptions2->dfRadius1;
+            dfRadius2 = pOptions2->dfRadius2;
+            break;
+        }
+        case GGA_NearestNeighbor:
+        {
+            const GDALGridNearestNeighborOptions *pOptions2 =
+                static_cast<const GDALGridNearestNeighborOptions *>(pOptions);
+            dfRadius1 = pOptions2->dfRadius1;
+            dfRadius2 = pOptions2->dfRadius2;
+            break;
+        }
+        case GGA_MetricMinimum:
+        case GGA_MetricMaximum:
+        case GGA_MetricRange:
+        case GGA_MetricCount:
+        case GGA_MetricAverageDistance:
+        case GGA_MetricAverageDistancePts:
+        {
+            const GDALGridDataMetricsOptions *pOptions2 =
+                static_cast<const GDALGridDataMetricsOptions *>(pOptions);
+            dfRadius1 = pOptions2->dfRadius1;
+            dfRadius2 = pOptions2->dfRadius2;
+            break;
+        }
+        case GGA_Linear:
+        default:
+            break;
+    }
+
+    // A zero radius means an unlimited search.
+    if( !(dfRadius1 > 0.0) || !(dfRadius2 > 0.0) )
+        return 0.0;
+    return std::max(dfRadius1, dfRadius2);
+}
+
+/************************************************************************/
+/*                         GDALGridPointBuckets                         */
+/*                                                                      */
+/*      Points sorted into buckets, one per output tile. The points     */
+/*      are kept in memory until the buckets hold more than a global    */
+/*      budget. The largest buckets are then appended as chunks to a    */
+/*      temporary file shared by all buckets.                           */
+/************************************************************************/
+
+class GDALGridPointBuckets
+{
+    struct Chunk
+    {
+        vsi_l_offset nOffset;
+        size_t       nPoints;
+    };
+
+    struct Bucket
+    {
+        std::vector<double> adfXYZ{};
+        std::vector<Chunk>  aoChunks{};
+    };
+
+    std::vector<Bucket> m_aoBuckets;
+    size_t              m_nMaxMemory;
+    // Capacity of the adfXYZ arrays of the buckets, in bytes.
+    size_t              m_nMemory = 0;
+    CPLString           m_osFilename{};
+    VSILFILE           *m_fp = nullptr;
+    vsi_l_offset        m_nFileSize = 0;
+
+    bool Spill();
+
+    CPL_DISALLOW_COPY_ASSIGN(GDALGridPointBuckets)
+
+  public:
+    explicit GDALGridPointBuckets( int nBuckets );
+    ~GDALGridPointBuckets();
+
+    bool AddPoint( int iBucket, double dfX, double dfY, double dfZ );
+    bool GetPoints( int iBucket, std::vector<double> &adfX,
+                    std::vector<double> &adfY, std::vector<double> &adfZ );
+};
+
+GDALGridPointBuckets::GDALGridPointBuckets( int nBuckets ) :
+    m_aoBuckets(nBuckets),
+    // Keep at most 256 MB of points in memory.
+    // Undocumented: for testing purposes only.
+    m_nMaxMemory(static_cast<size_t>(CPLAtoGIntBig(CPLGetConfigOption(
+        "GDAL_GRID_BUCKETS_MAX_MEMORY", "268435456"))))
+{
+}
+
+GDALGridPointBuckets::~GDALGridPointBuckets()
+{
+    if( m_fp != nullptr )
+    {
+        VSIFCloseL(m_fp);
+        VSIUnlink(m_osFilename);
+    }
+}
+
+bool GDALGridPointBuckets::AddPoint( int iBucket,
+                                     double dfX, double dfY, double dfZ )
+{
+    Bucket &oBucket = m_aoBuckets[iBucket];
+    const size_t nOldCapacity = oBucket.adfXYZ.capacity();
+    oBucket.adfXYZ.push_back(dfX);
+    oBucket.adfXYZ.push_back(dfY);
+    oBucket.adfXYZ.push_back(dfZ);
+    m_nMemory += (oBucket.adfXYZ.capacity() - nOldCapacity) * sizeof(double);
+    if( m_nMemory <= m_nMaxMemory )
+        return true;
+    return Spill();
+}
+
+/************************************************************************/
+/*                               Spill()                                */
+/*                                                                      */
+/*      Write the largest buckets to the temporary file, until they     */
+/*      hold at most half of the budget, so that a spill writes         */
+/*      large chunks and is not needed again soon.                      */
+/************************************************************************/
+
+bool GDALGridPointBuckets::Spill()
+{
+    if( m_fp == nullptr )
+    {
+        m_osFilename = CPLGenerateTempFilename("gdal_grid");
+        m_fp = VSIFOpenL(m_osFilename, "wb+");
+        if( m_fp == nullptr )
+        {
+            CPLError(CE_Failure, CPLE_FileIO,
+                     "Cannot create temporary file %s", m_osFilename.c_str());
+            return false;
+        }
+    }
+
+    std::vector<int> anBuckets;
+    for( int i = 0; i < static_cast<int>(m_aoBuckets.size()); i++ )
+    {
+        if( m_aoBuckets[i].adfXYZ.capacity() > 0 )
+            anBuckets.push_back(i);
+    }
+    std::sort(anBuckets.begin(), anBuckets.end(),
+              [this](int i, int j)
+              {
+                  return m_aoBuckets[i].adfXYZ.capacity() >
+                         m_aoBuckets[j].adfXYZ.capacity();
+              });
+
+    for( size_t i = 0; i < anBuckets.size() && m_nMemory > m_nMaxMemory / 2;
+         i++ )
+    {
+        Bucket &oBucket = m_aoBuckets[anBuckets[i]];
+        const size_t nBytes = oBucket.adfXYZ.size() * sizeof(double);
+        if( nBytes > 0 )
+        {
+            if( VSIFSeekL(m_fp, m_nFileSize, SEEK_SET) != 0 ||
+                VSIFWriteL(&oBucket.adfXYZ[0], 1, nBytes, m_fp) != nBytes )
+            {
+                CPLError(CE_Failure, CPLE_FileIO,
+                         "Cannot write to temporary file %s",
+                         m_osFilename.c_str());
+                return false;
+            }
+            Chunk oChunk;
+            oChunk.nOffset = m_nFileSize;
+            oChunk.nPoints = oBucket.adfXYZ.size() / 3;
+            oBucket.aoChunks.push_back(oChunk);
+            m_nFileSize += nBytes;
+        }
+        m_nMemory -= oBucket.adfXYZ.capacity() * sizeof(double);
+        std::vector<double>().swap(oBucket.adfXYZ);
+    }
+    return true;
+}
+
+bool GDALGridPointBuckets::GetPoints( int iBucket,
+                                      std::vector<double> &adfX,
+                                      std::vector<double> &adfY,
+                                      std::vector<double> &adfZ )
+{
+    Bucket &oBucket = m_aoBuckets[iBucket];
+    size_t nPoints = oBucket.adfXYZ.size() / 3;
+    for( const auto &oChunk : oBucket.aoChunks )
+        nPoints += oChunk.nPoints;
+    adfX.resize(nPoints);
+    adfY.resize(nPoints);
+    adfZ.resize(nPoints);
+
+    // Read the chunks in the order they were written, so that the points
+    // come in the order of the source layer.
+    std::vector<double> adfChunk;
+    size_t iPoint = 0;
+    for( size_t iChunk = 0; iChunk <= oBucket.aoChunks.size(); iChunk++ )
+    {
+        const double *padfXYZ = oBucket.adfXYZ.data();
+        size_t nChunkPoints = oBucket.adfXYZ.size() / 3;
+        if( iChunk < oBucket.aoChunks.size() )
+        {
+            const Chunk &oChunk = oBucket.aoChunks[iChunk];
+            adfChunk.resize(3 * oChunk.nPoints);
+            const size_t nBytes = adfChunk.size() * sizeof(double);
+            if( VSIFSeekL(m_fp, oChunk.nOffset, SEEK_SET) != 0 ||
+                VSIFReadL(&adfChunk[0], 1, nBytes, m_fp) != nBytes )
+            {
+                CPLError(CE_Failure, CPLE_FileIO,
+                         "Cannot read temporary file %s",
+                         m_osFilename.c_str());
+                return false;
+            }
+            padfXYZ = adfChunk.data();
+            nChunkPoints = oChunk.nPoints;
+        }
+        for( size_t i = 0; i < nChunkPoints; i++, iPoint++ )
+        {
+            adfX[iPoint] = padfXYZ[3 * i];
+            adfY[iPoint] = padfXYZ[3 * i + 1];
+            adfZ[iPoint] = padfXYZ[3 * i + 2];
+        }
+    }
+
+    // The bucket is not needed any more.
+    m_nMemory -= oBucket.adfXYZ.capacity() * sizeof(double);
+    std::vector<double>().swap(oBucket.adfXYZ);
+    std::vector<Chunk>().swap(oBucket.aoChunks);
+    return true;
+}
+
+/************************************************************************/
+/*                        ProcessLayerByTiles()                         */
+/*                                                                      */
+/*      Out-of-core variant of ProcessLayer(). The points are sorted    */
+/*      into one bucket per output tile, extended by the search radius  */
+/*      of the algorithm, and each tile is then gridded from its own    */
+/*      bucket only.                                                    */
+/************************************************************************/
+
+static CPLErr ProcessLayerByTiles( OGRLayerH hSrcLayer, GDALRasterBandH hBand,
+                                   OGRGeometry *poClipSrc,
+                                   int nXSize, int nYSize,
+                                   int nTileXSize, int nTileYSize,
+                                   bool& bIsXExtentSet, bool& bIsYExtentSet,
+                                   double& dfXMin, double& dfXMax,
+                                   double& dfYMin, double& dfYMax,
+                                   int iBurnField,
+                                   const double dfIncreaseBurnValue,
+                                   const double dfMultiplyBurnValue,
+                                   GDALDataType eType,
+                                   GDALGridAlgorithm eAlgorithm,
+                                   void *pOptions,
+                                   bool bQuiet, GDALProgressFunc pfnProgress,
+                                   void* pProgressData )
+
+{
+    ComputeGridExtent( hSrcLayer, bIsXExtentSet, bIsYExtentSet,
+                       dfXMin, dfXMax, dfYMin, dfYMax );
+
+    const double dfDeltaX = (dfXMax - dfXMin) / nXSize;
+    const double dfDeltaY = (dfYMax - dfYMin) / nYSize;
+
+    nTileXSize = std::min(nTileXSize, nXSize);
+    nTileYSize = std::min(nTileYSize, nYSize);
+    const int nTilesX = (nXSize + nTileXSize - 1) / nTileXSize;
+    const int nTilesY = (nYSize + nTileYSize - 1) / nTileYSize;
+
+    // Add a margin of one cell to the search radius, so that rounding
+    // errors cannot leave out a point.
+    const double dfSearchRadius = GetSearchRadius( eAlgorithm, pOptions );
+    const double dfHaloX = dfSearchRadius + fabs(dfDeltaX);
+    const double dfHaloY = dfSearchRadius + fabs(dfDeltaY);
+
+    // Range of the tiles whose extent, grown by the halo, contains a
+    // coordinate.
+    const auto GetTileRange = []( double dfCoord, double dfHalo,
+                                  double dfOrigin, double dfTileSize,
+                                  int nTiles, int &iFirst, int &iLast )
+    {
+        const double df1 = (dfCoord - dfHalo - dfOrigin) / dfTileSize;
+        const double df2 = (dfCoord + dfHalo - dfOrigin) / dfTileSize;
+        const double dfFirst = std::max(0.0, floor(std::min(df1, df2)));
+        const double dfLast = std::min(nTiles - 1.0,
+                                       floor(std::max(df1, df2)));
+        if( !(dfFirst <= dfLast) )
+            return false;
+        iFirst = static_cast<int>(dfFirst);
+        iLast = static_cast<int>(dfLast);
+        return true;
+    };
+
+/* -------------------------------------------------------------------- */
+/*      Sort the points of the layer into the buckets of the tiles.     */
+/* -------------------------------------------------------------------- */
+    GDALGridPointBuckets oBuckets( nTilesX * nTilesY );
+    GUIntBig nPoints = 0;
+    std::vector<double> adfX, adfY, adfZ;
+    OGRFeature *poFeat = nullptr;
+    bool bOK = true;
+
+    OGR_L_ResetReading( hSrcLayer );
+
+    while( bOK &&
+           (poFeat = reinterpret_cast<OGRFeature*>(OGR_L_GetNextFeature( hSrcLayer ))) != nullptr )
+    {
+        OGRGeometry *poGeom = poFeat->GetGeometryRef();
+        double  dfBurnValue = 0.0;
+
+        if ( iBurnField >= 0 )
+            dfBurnValue = poFeat->GetFieldAsDouble( iBurnField );
+
+        adfX.clear();
+        adfY.clear();
+        adfZ.clear();
+        ProcessCommonGeometry(poGeom, poClipSrc, iBurnField, dfBurnValue,
+            dfIncreaseBurnValue, dfMultiplyBurnValue, adfX, adfY, adfZ);
+
+        OGRFeature::DestroyFeature( poFeat );
+
+        for( size_t i = 0; bOK && i < adfX.size(); i++ )
+        {
+            nPoints++;
+            int iTileX0 = 0;
+            int iTileX1 = 0;
+            int iTileY0 = 0;
+            int iTileY1 = 0;
+            if( !GetTileRange( adfX[i], dfHaloX, dfXMin, dfDeltaX * nTileXSize,
+                               nTilesX, iTileX0, iTileX1 ) ||
+                !GetTileRange( adfY[i], dfHaloY, dfYMin, dfDeltaY * nTileYSize,
+                               nTilesY, iTileY0, iTileY1 ) )
+                continue;
+            for( int iTileY = iTileY0; bOK && iTileY <= iTileY1; iTileY++ )
+            {
+                for( int iTileX = iTileX0; bOK && iTileX <= iTileX1; iTileX++ )
+                {
+                    bOK = oBuckets.AddPoint( iTileY * nTilesX + iTileX,
+                                             adfX[i], adfY[i], adfZ[i] );
+                }
+            }
+        }
+    }
+
+    if( !bOK )
+        return CE_Failure;
+
+    if ( nPoints == 0 )
+    {
+        printf( "No point geometry found on layer %s, skipping.\n",
+                OGR_FD_GetName( OGR_L_GetLayerDefn( hSrcLayer ) ) );
+        return CE_None;
+    }
+
+    if ( !bQuiet )
+    {
+        PrintGridInfo( eType, nXSize, nYSize, dfXMin, dfXMax, dfYMin, dfYMax,
+                       nPoints, eAlgorithm, pOptions );
+        printf( "Tile size = (%d %d).\n\n", nTileXSize, nTileYSize );
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Grid each tile from its bucket.                                 */
+/* -------------------------------------------------------------------- */
+    const int nDataTypeSize = GDALGetDataTypeSizeBytes(eType);
+    void *pData = VSIMalloc3(nTileXSize, nTileYSize, nDataTypeSize);
+    if( pData == nullptr )
+    {
+        CPLError(CE_Failure, CPLE_OutOfMemory, "Cannot allocate work buffer");
+        return CE_Failure;
+    }
+
+    const int nTileCount = nTilesX * nTilesY;
+    CPLErr eErr = CE_None;
+    for( int iTile = 0; iTile < nTileCount && eErr == CE_None; iTile++ )
+    {
+        void *pScaledProgress = GDALCreateScaledProgress(
+            static_cast<double>(iTile) / nTileCount,
+            static_cast<double>(iTile + 1) / nTileCount,
+            pfnProgress, pProgressData);
+
+        const int nXOffset = (iTile % nTilesX) * nTileXSize;
+        const int nYOffset = (iTile / nTilesX) * nTileYSize;
+        const int nXRequest = std::min(nTileXSize, nXSize - nXOffset);
+        const int nYRequest = std::min(nTileYSize, nYSize - nYOffset);
+
+        if( !oBuckets.GetPoints( iTile, adfX, adfY, adfZ ) )
+            eErr = CE_Failure;
+
+        if( eErr == CE_None )
+        {
+            // GDALGridContextCreate() requires arrays, even if empty.
+            const GUInt32 nTilePoints = static_cast<GUInt32>(adfX.size());
+            if( adfX.empty() )
+            {
+                adfX.resize(1);
+                adfY.resize(1);
+                adfZ.resize(1);
+            }
+
+            GDALGridContext* psContext =
+                GDALGridContextCreate( eAlgorithm, pOptions, nTilePoints,
+                                       &(adfX[0]), &(adfY[0]), &(adfZ[0]),
+                                       TRUE );
+            if( psContext == nullptr )
+            {
+                eErr = CE_Failure;
+            }
+            else
+            {
+                eErr = GDALGridContextProcess( psContext,
+                                dfXMin + dfDeltaX * nXOffset,
+                                dfXMin + dfDeltaX * (nXOffset + nXRequest),
+                                dfYMin + dfDeltaY * nYOffset,
+                                dfYMin + dfDeltaY * (nYOffset + nYRequest),
+                                nXRequest, nYRequest, eType, pData,
+                                GDALScaledProgress, pScaledProgress );
+                GDALGridContextFree( psContext );
+            }
+        }
+
+        if( eErr == CE_None )
+            eErr = GDALRasterIO( hBand, GF_Write, nXOffset, nYOffset,
+                      nXRequest, nYRequest, pData,
+                      nXRequest, nYRequest, eType, 0, 0 );
+
+        GDALDestroyScaledProgress( pScaledProgress );
+    }
+
+    CPLFree( pData );
+    return eErr;
+}
+
 /************************************************************************/
 /*                            ProcessLayer()                            */
 /*                                                                      */
@@ -403,6 +929,7 @@ static void ProcessCommonGeometry(OGRGeometry* poGeom, OGRGeometry *poClipSrc,
 static CPLErr ProcessLayer( OGRLayerH hSrcLayer, GDALDatasetH hDstDS,
                           OGRGeometry *poClipSrc,
                           int nXSize, int nYSize, int nBand,
+                          int nTileXSize, int nTileYSize,
                           bool& bIsXExtentSet, bool& bIsYExtentSet,
                           double& dfXMin, double& dfXMax,
                           double& dfYMin, double& dfYMax,
@@ -433,6 +960,20 @@ static CPLErr ProcessLayer( OGRLayerH hSrcLayer, GDALDatasetH hDstDS,
         }
     }
 
+    if ( nTileXSize > 0 && nTileYSize > 0 )
+    {
+        return ProcessLayerByTiles( hSrcLayer,
+                                    GDALGetRasterBand( hDstDS, nBand ),
+                                    poClipSrc, nXSize, nYSize,
+                                    nTileXSize, nTileYSize,
+                                    bIsXExtentSet, bIsYExtentSet,
+                                    dfXMin, dfXMax, dfYMin, dfYMax,
+                                    iBurnField, dfIncreaseBurnValue,
+                                    dfMultiplyBurnValue, eType,
+                                    eAlgorithm, pOptions,
+                                    bQuiet, pfnProgress, pProgressData );
+    }
+
 /* -------------------------------------------------------------------- */
 /*      Collect the geometries from this layer, and build list of       */
 /*      values to be interpolated.                                      */
@@ -466,25 +1007,8 @@ static CPLErr ProcessLayer( OGRLayerH hSrcLayer, GDALDatasetH hDstDS,
 /* -------------------------------------------------------------------- */
 /*      Compute grid geometry.                                          */
 /* -------------------------------------------------------------------- */
-    if ( !bIsXExtentSet || !bIsYExtentSet )
-    {
-        OGREnvelope sEnvelope;
-        OGR_L_GetExtent( hSrcLayer, &sEnvelope, TRUE );
-
-        if ( !bIsXExtentSet )
-        {
-            dfXMin = sEnvelope.MinX;
-            dfXMax = sEnvelope.MaxX;
-            bIsXExtentSet = true;
-        }
-
-        if ( !bIsYExtentSet )
-        {
-            dfYMin = sEnvelope.MinY;
-            dfYMax = sEnvelope.MaxY;
-            bIsYExtentSet = true;
-        }
-    }
+    ComputeGridExtent( hSrcLayer, bIsXExtentSet, bIsYExtentSet,
+                       dfXMin, dfXMax, dfYMin, dfYMax );
 
 /* -------------------------------------------------------------------- */
 /*      Perform gridding.                                               */
@@ -495,17 +1019,8 @@ static CPLErr ProcessLayer( OGRLayerH hSrcLayer, GDALDatasetH hDstDS,
 
     if ( !bQuiet )
     {
-        printf( "Grid data type is \"%s\"\n", GDALGetDataTypeName(eType) );
-        printf("Grid size = (%lu %lu).\n",
-               static_cast<unsigned long>(nXSize),
-               static_cast<unsigned long>(nYSize));
-        CPLprintf( "Corner coordinates = (%f %f)-(%f %f).\n",
-                dfXMin - dfDeltaX / 2, dfYMax + dfDeltaY / 2,
-                dfXMax + dfDeltaX / 2, dfYMin - dfDeltaY / 2 );
-        CPLprintf( "Grid cell size = (%f %f).\n", dfDeltaX, dfDeltaY );
-        printf("Source point count = %lu.\n",
-               static_cast<unsigned long>(adfX.size()));
-        PrintAlgorithmAndOptions( eAlgorithm, pOptions );
+        PrintGridInfo( eType, nXSize, nYSize, dfXMin, dfXMax, dfYMin, dfYMax,
+                       adfX.size(), eAlgorithm, pOptions );
         printf("\n");
     }
 
@@ -867,6 +1382,7 @@ GDALDatasetH GDALGrid( const char *pszDest, GDALDatasetH hSrcDataset,
             // Custom layer will be rasterized in the first band.
             eErr = ProcessLayer( reinterpret_cast<OGRLayerH>(poLayer), hDstDS, psOptions->poSpatialFilter,
                           nXSize, nYSize, 1,
+                          psOptions->nTileXSize, psOptions->nTileYSize,
                           bIsXExtentSet, bIsYExtentSet,
                           dfXMin, dfXMax, dfYMin, dfYMax, psOptions->pszBurnAttribute,
                           psOptions->dfIncreaseBurnValue, psOptions->dfMultiplyBurnValue,
@@ -915,6 +1431,7 @@ GDALDatasetH GDALGrid( const char *pszDest, GDALDatasetH hSrcDataset,
 
         eErr = ProcessLayer( hLayer, hDstDS, psOptions->poSpatialFilter, nXSize, nYSize,
                       i + 1 + nBands - nLayerCount,
+                      psOptions->nTileXSize, psOptions->nTileYSize,
                       bIsXExtentSet, bIsYExtentSet,
                       dfXMin, dfXMax, dfYMin, dfYMax, psOptions->pszBurnAttribute,
                       psOptions->dfIncreaseBurnValue, psOptions->dfMultiplyBurnValue,
@@ -1009,6 +1526,8 @@ GDALGridOptions *GDALGridOptionsNew(char** papszArgv, GDALGridOptionsForBinary*
     psOptions->papszCreateOptions = nullptr;
     psOptions->nXSize = 0;
     psOptions->nYSize = 0;
+    psOptions->nTileXSize = 0;
+    psOptions->nTileYSize = 0;
     psOptions->dfXMin = 0.0;
     psOptions->dfXMax = 0.0;
     psOptions->dfYMin = 0.0;
@@ -1093,6 +1612,19 @@ GDALGridOptions *GDALGridOptionsNew(char** papszArgv, GDALGridOptionsForBinary*
             psOptions->nYSize = atoi(papszArgv[++i]);
         }
 
+        else if( i+2 < argc && EQUAL(papszArgv[i],"-tile_size") )
+        {
+            psOptions->nTileXSize = atoi(papszArgv[++i]);
+            psOptions->nTileYSize = atoi(papszArgv[++i]);
+            if( psOptions->nTileXSize <= 0 || psOptions->nTileYSize <= 0 )
+            {
+                CPLError(CE_Failure, CPLE_IllegalArg,
+                         "Invalid value for -tile_size");
+                GDALGridOptionsFree(psOptions);
+                return nullptr;
+            }
+        }
+
         else if( i+1 < argc && EQUAL(papszArgv[i],"-co") )
         {
             psOptions->papszCreateOptions = CSLAddString( psOptions->papszCreateOptions, papszArgv[++i] );
@@ -1293,6 +1825,17 @@ GDALGridOptions *GDALGridOptionsNew(char** papszArgv, GDALGridOptionsForBinary*
         }
     }
 
+    if( psOptions->nTileXSize > 0 &&
+        GetSearchRadius( psOptions->eAlgorithm, psOptions->pOptions ) == 0.0 )
+    {
+        CPLError(CE_Failure, CPLE_NotSupported,
+                 "-tile_size requires an algorithm with a search radius: "
+                 "invdist, average, nearest or the data metrics with "
+                 "non-zero radius1 and radius2, or invdistnn.");
+        GDALGridOptionsFree(psOptions);
+        return nullptr;
+    }
+
     if ( psOptions->bClipSrc && psOptions->pszClipSrcDS != nullptr )
     {
         psOptions->poClipSrc = LoadGeometry( psOptions->pszClipSrcDS, psOptions->pszClipSrcSQL,
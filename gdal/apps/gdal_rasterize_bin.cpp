@@ -50,6 +50,7 @@ static void Usage(const char* pszErrorMsg = nullptr)
         "       [-te xmin ymin xmax ymax] [-tr xres yres] [-tap] [-ts width height]\n"
         "       [-ot {Byte/Int16/UInt16/UInt32/Int32/Float32/Float64/\n"
         "             CInt16/CInt32/CFloat32/CFloat64}] [-optim {[AUTO]/VECTOR/RASTER}] [-q]\n"
+        "       [-num_threads n|ALL_CPUS]\n"
         "       <src_datasource> <dst_filename>\n" );
 
     if( pszErrorMsg != nullptr )
@@ -928,6 +928,11 @@ GDALRasterizeOptions *GDALRasterizeOptionsNew(char** papszArgv,
             psOptions->papszRasterizeOptions =
                 CSLSetNameValue( psOptions->papszRasterizeOptions, "OPTIM", papszArgv[++i] );
         }
+        else if( i < argc-1 && EQUAL(papszArgv[i],"-num_threads") )
+        {
+            psOptions->papszRasterizeOptions =
+                CSLSetNameValue( psOptions->papszRasterizeOptions, "NUM_THREADS", papszArgv[++i] );
+        }
         else if( i < argc-1 && EQUAL(papszArgv[i],"-burn") )
         {
             if (strchr(papszArgv[i+1], ' '))
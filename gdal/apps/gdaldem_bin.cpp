@@ -53,12 +53,14 @@ static void Usage(const char* pszErrorMsg = nullptr)
             "                 [-az Azimuth (default=315)] [-alt Altitude (default=45)]\n"
             "                 [-alg ZevenbergenThorne] [-combined | -multidirectional | -igor]\n"
             "                 [-compute_edges] [-b Band (default=1)] [-of format] [-co \"NAME=VALUE\"]* [-q]\n"
+            "                 [-num_threads n|ALL_CPUS]\n"
             "\n"
             " - To generates a slope map from any GDAL-supported elevation raster :\n\n"
             "     gdaldem slope input_dem output_slope_map \n"
             "                 [-p use percent slope (default=degrees)] [-s scale* (default=1)]\n"
             "                 [-alg ZevenbergenThorne]\n"
             "                 [-compute_edges] [-b Band (default=1)] [-of format] [-co \"NAME=VALUE\"]* [-q]\n"
+            "                 [-num_threads n|ALL_CPUS]\n"
             "\n"
             " - To generate an aspect map from any GDAL-supported elevation raster\n"
             "   Outputs a 32-bit float tiff with pixel values from 0-360 indicating azimuth :\n\n"
@@ -66,24 +68,29 @@ static void Usage(const char* pszErrorMsg = nullptr)
             "                 [-trigonometric] [-zero_for_flat]\n"
             "                 [-alg ZevenbergenThorne]\n"
             "                 [-compute_edges] [-b Band (default=1)] [-of format] [-co \"NAME=VALUE\"]* [-q]\n"
+            "                 [-num_threads n|ALL_CPUS]\n"
             "\n"
             " - To generate a color relief map from any GDAL-supported elevation raster\n"
             "     gdaldem color-relief input_dem color_text_file output_color_relief_map\n"
             "                 [-alpha] [-exact_color_entry | -nearest_color_entry]\n"
             "                 [-b Band (default=1)] [-of format] [-co \"NAME=VALUE\"]* [-q]\n"
+            "                 [-num_threads n|ALL_CPUS]\n"
             "     where color_text_file contains lines of the format \"elevation_value red green blue\"\n"
             "\n"
             " - To generate a Terrain Ruggedness Index (TRI) map from any GDAL-supported elevation raster\n"
             "     gdaldem TRI input_dem output_TRI_map\n"
             "                 [-compute_edges] [-b Band (default=1)] [-of format] [-co \"NAME=VALUE\"]* [-q]\n"
+            "                 [-num_threads n|ALL_CPUS]\n"
             "\n"
             " - To generate a Topographic Position Index (TPI) map from any GDAL-supported elevation raster\n"
             "     gdaldem TPI input_dem output_TPI_map\n"
             "                 [-compute_edges] [-b Band (default=1)] [-of format] [-co \"NAME=VALUE\"]* [-q]\n"
+            "                 [-num_threads n|ALL_CPUS]\n"
             "\n"
             " - To generate a roughness map from any GDAL-supported elevation raster\n"
             "     gdaldem roughness input_dem output_roughness_map\n"
             "                 [-compute_edges] [-b Band (default=1)] [-of format] [-co \"NAME=VALUE\"]* [-q]\n"
+            "                 [-num_threads n|ALL_CPUS]\n"
             "\n"
             " Notes : \n"
             "   Scale is the ratio of vertical units to horizontal\n"
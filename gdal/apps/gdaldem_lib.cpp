@@ -101,12 +101,17 @@
 #endif
 
 #include <algorithm>
+#include <functional>
 #include <limits>
+#include <new>
+#include <vector>
 
 #include "cpl_error.h"
+#include "cpl_multiproc.h"
 #include "cpl_progress.h"
 #include "cpl_string.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 #include "gdal.h"
 #include "gdal_priv.h"
 
@@ -155,6 +160,7 @@ struct GDALDEMProcessingOptions
     bool bMultiDirectional;
     char** papszCreateOptions;
     int nBand;
+    int nNumThreads;
 };
 
 /************************************************************************/
@@ -274,6 +280,476 @@ GInt32 INTERPOL(GInt32 a, GInt32 b, int bSrcHasNoData, GInt32 fSrcNoDataValue)
     return nVal;
 }
 
+/************************************************************************/
+/*                           GDALDEMStripJob                            */
+/*                                                                      */
+/*      A strip of lines processed in a worker thread. The bands are    */
+/*      shared by all the jobs, so reads and writes must be done under  */
+/*      the mutex.                                                      */
+/************************************************************************/
+
+typedef std::function<CPLErr(int nYOff, int nYCount,
+                             CPLMutex **phIOMutex)> GDALDEMStripFunc;
+
+struct GDALDEMStripJob
+{
+    const GDALDEMStripFunc *pfnStrip = nullptr;
+    CPLMutex             **phIOMutex = nullptr;
+    int                    nYOff = 0;
+    int                    nYCount = 0;
+    CPLErr                 eErr = CE_None;
+
+    static void Run( void *pData );
+};
+
+void GDALDEMStripJob::Run( void *pData )
+{
+    GDALDEMStripJob *psJob = static_cast<GDALDEMStripJob *>(pData);
+    try
+    {
+        psJob->eErr = (*psJob->pfnStrip)(psJob->nYOff, psJob->nYCount,
+                                         psJob->phIOMutex);
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError( CE_Failure, CPLE_OutOfMemory,
+                  "Out of memory in GDALDEMProcessing()" );
+        psJob->eErr = CE_Failure;
+    }
+}
+
+/************************************************************************/
+/*                        GDALDEMGetStripHeight()                       */
+/*                                                                      */
+/*      Height of the strips processed by the worker threads. This is   */
+/*      a multiple of the block height of the output band, so that      */
+/*      each output block is written once and in whole.                 */
+/************************************************************************/
+
+static int GDALDEMGetStripHeight( GDALRasterBandH hDstBand )
+{
+    int nBlockXSize = 0;
+    int nBlockYSize = 0;
+    GDALGetBlockSize( hDstBand, &nBlockXSize, &nBlockYSize );
+    nBlockYSize = std::max(1, nBlockYSize);
+    return nBlockYSize * std::max(1, 64 / nBlockYSize);
+}
+
+/************************************************************************/
+/*                        GDALDEMProcessStrips()                        */
+/*                                                                      */
+/*      Run pfnStrip over the strips of lines of the raster, in worker  */
+/*      threads.                                                        */
+/************************************************************************/
+
+static CPLErr GDALDEMProcessStrips( int nYSize, int nStripHeight,
+                                    int nThreads,
+                                    const GDALDEMStripFunc &pfnStrip,
+                                    GDALProgressFunc pfnProgress,
+                                    void *pProgressData )
+{
+    const int nStrips = (nYSize + nStripHeight - 1) / nStripHeight;
+
+    CPLWorkerThreadPool oPool;
+    if( !oPool.Setup( std::min(nThreads, nStrips), nullptr, nullptr ) )
+        return CE_Failure;
+
+    CPLMutex *hIOMutex = nullptr;
+    const int nBatchSize = oPool.GetThreadCount();
+    CPLErr eErr = CE_None;
+
+    // Process the strips by batches of as many strips as threads, to
+    // bound the memory in use.
+    for( int iStripStart = 0;
+         eErr == CE_None && iStripStart < nStrips;
+         iStripStart += nBatchSize )
+    {
+        const int nBatchStrips = std::min(nBatchSize, nStrips - iStripStart);
+        std::vector<GDALDEMStripJob> asJobs(nBatchStrips);
+        std::vector<void*> apJobData;
+        for( int i = 0; i < nBatchStrips; i++ )
+        {
+            asJobs[i].pfnStrip = &pfnStrip;
+            asJobs[i].phIOMutex = &hIOMutex;
+            asJobs[i].nYOff = (iStripStart + i) * nStripHeight;
+            asJobs[i].nYCount = std::min(nStripHeight,
+                                         nYSize - asJobs[i].nYOff);
+            apJobData.push_back(&asJobs[i]);
+        }
+
+        oPool.SubmitJobs( GDALDEMStripJob::Run, apJobData );
+        oPool.WaitCompletion();
+
+        for( int i = 0; eErr == CE_None && i < nBatchStrips; i++ )
+        {
+            eErr = asJobs[i].eErr;
+            if( eErr == CE_None &&
+                !pfnProgress( 1.0 * (asJobs[i].nYOff + asJobs[i].nYCount) /
+                                                                    nYSize,
+                              nullptr, pProgressData ) )
+            {
+                CPLError( CE_Failure, CPLE_UserInterrupt, "User terminated" );
+                eErr = CE_Failure;
+            }
+        }
+    }
+
+    if( hIOMutex )
+        CPLDestroyMutex( hIOMutex );
+
+    return eErr;
+}
+
+/************************************************************************/
+/*                       GDALGeneric3x3Processor                        */
+/*                                                                      */
+/*      Computation of the output lines from the source lines, shared   */
+/*      by the line by line and the strip processing.                   */
+/************************************************************************/
+
+template<class T>
+struct GDALGeneric3x3Processor
+{
+    typename GDALGeneric3x3ProcessingAlg<T>::type pfnAlg = nullptr;
+    typename GDALGeneric3x3ProcessingAlg_multisample<T>::type
+                                            pfnAlg_multisample = nullptr;
+    void   *pData = nullptr;
+    bool    bComputeAtEdges = false;
+    int     nXSize = 0;
+    int     nYSize = 0;
+    bool    bSrcHasNoData = false;
+    T       fSrcNoDataValue = 0;
+    bool    bIsSrcNoDataNan = false;
+    float   fDstNoDataValue = 0.0f;
+
+    bool    LineHasNoData( const T* pafLine ) const;
+    void    ComputeFirstLine( const T* pafLine1, const T* pafLine2,
+                              float* pafOutputBuf ) const;
+    void    ComputeLine( const T* pafThreeLineWin,
+                         int nLine1Off, int nLine2Off, int nLine3Off,
+                         bool bOneOfThreeLinesHasNoData,
+                         float* pafOutputBuf ) const;
+    void    ComputeLastLine( const T* pafLine1, const T* pafLine2,
+                             float* pafOutputBuf ) const;
+    CPLErr  ProcessStrip( GDALRasterBandH hSrcBand, GDALRasterBandH hDstBand,
+                          GDALDataType eReadDT, int nYOff, int nYCount,
+                          CPLMutex **phIOMutex ) const;
+};
+
+/************************************************************************/
+/*                           LineHasNoData()                            */
+/*                                                                      */
+/*      In case none of the 3 lines have nodata values, then no need    */
+/*      to check it in ComputeVal(). Only done for integer values.      */
+/************************************************************************/
+
+template<class T>
+bool GDALGeneric3x3Processor<T>::LineHasNoData( const T* pafLine ) const
+{
+    if( !std::numeric_limits<T>::is_integer || !bSrcHasNoData )
+        return bSrcHasNoData;
+
+    int iX = 0;
+    for( ; iX + 3 < nXSize; iX +=4 )
+    {
+        if( pafLine[iX] == fSrcNoDataValue ||
+            pafLine[iX + 1] == fSrcNoDataValue ||
+            pafLine[iX + 2] == fSrcNoDataValue ||
+            pafLine[iX + 3] == fSrcNoDataValue )
+        {
+            return true;
+        }
+    }
+    for( ; iX < nXSize; iX++ )
+    {
+        if( pafLine[iX] == fSrcNoDataValue )
+            return true;
+    }
+    return false;
+}
+
+/************************************************************************/
+/*                          ComputeFirstLine()                          */
+/************************************************************************/
+
+template<class T>
+void GDALGeneric3x3Processor<T>::ComputeFirstLine( const T* pafLine1,
+                                                   const T* pafLine2,
+                                                   float* pafOutputBuf ) const
+{
+    if( !(bComputeAtEdges && nXSize >= 2 && nYSize >= 2) )
+    {
+        // Exclude the edges
+        for( int j = 0; j < nXSize; j++ )
+        {
+            pafOutputBuf[j] = fDstNoDataValue;
+        }
+        return;
+    }
+
+    for( int j = 0; j < nXSize; j++ )
+    {
+        int jmin = (j == 0) ? j : j - 1;
+        int jmax = (j == nXSize - 1) ? j : j + 1;
+
+        T afWin[9] = {
+            INTERPOL(pafLine1[jmin], pafLine2[jmin],
+                     bSrcHasNoData, fSrcNoDataValue),
+            INTERPOL(pafLine1[j],    pafLine2[j],
+                     bSrcHasNoData, fSrcNoDataValue),
+            INTERPOL(pafLine1[jmax], pafLine2[jmax],
+                     bSrcHasNoData, fSrcNoDataValue),
+            pafLine1[jmin],
+            pafLine1[j],
+            pafLine1[jmax],
+            pafLine2[jmin],
+            pafLine2[j],
+            pafLine2[jmax]
+        };
+        pafOutputBuf[j] = ComputeVal(
+            bSrcHasNoData,
+            fSrcNoDataValue,
+            bIsSrcNoDataNan,
+            afWin, fDstNoDataValue,
+            pfnAlg, pData, bComputeAtEdges);
+    }
+}
+
+/************************************************************************/
+/*                            ComputeLine()                             */
+/************************************************************************/
+
+template<class T>
+void GDALGeneric3x3Processor<T>::ComputeLine( const T* pafThreeLineWin,
+                                              int nLine1Off,
+                                              int nLine2Off,
+                                              int nLine3Off,
+                                              bool bOneOfThreeLinesHasNoData,
+                                              float* pafOutputBuf ) const
+{
+    if( bComputeAtEdges && nXSize >= 2 )
+    {
+        int j = 0;
+        T afWin[9] = {
+            INTERPOL(pafThreeLineWin[nLine1Off + j],
+                     pafThreeLineWin[nLine1Off + j+1],
+                     bSrcHasNoData, fSrcNoDataValue),
+            pafThreeLineWin[nLine1Off + j],
+            pafThreeLineWin[nLine1Off + j+1],
+            INTERPOL(pafThreeLineWin[nLine2Off + j],
+                     pafThreeLineWin[nLine2Off + j+1],
+                     bSrcHasNoData, fSrcNoDataValue),
+            pafThreeLineWin[nLine2Off + j],
+            pafThreeLineWin[nLine2Off + j+1],
+            INTERPOL(pafThreeLineWin[nLine3Off + j],
+                     pafThreeLineWin[nLine3Off + j+1],
+                     bSrcHasNoData, fSrcNoDataValue),
+            pafThreeLineWin[nLine3Off + j],
+            pafThreeLineWin[nLine3Off + j+1]
+        };
+
+        pafOutputBuf[j] =
+            ComputeVal(
+                bOneOfThreeLinesHasNoData,
+                fSrcNoDataValue,
+                bIsSrcNoDataNan,
+                afWin, fDstNoDataValue,
+                pfnAlg, pData, bComputeAtEdges);
+    }
+    else
+    {
+        // Exclude the edges
+        pafOutputBuf[0] = fDstNoDataValue;
+    }
+
+    int j = 1;
+    if( pfnAlg_multisample && !bOneOfThreeLinesHasNoData )
+    {
+        j = pfnAlg_multisample(pafThreeLineWin,
+                               nLine1Off,
+                               nLine2Off,
+                               nLine3Off,
+                               nXSize,
+                               pData,
+                               pafOutputBuf);
+    }
+
+    for( ; j < nXSize - 1; j++ )
+    {
+        T afWin[9] = {
+            pafThreeLineWin[nLine1Off + j-1],
+            pafThreeLineWin[nLine1Off + j],
+            pafThreeLineWin[nLine1Off + j+1],
+            pafThreeLineWin[nLine2Off + j-1],
+            pafThreeLineWin[nLine2Off + j],
+            pafThreeLineWin[nLine2Off + j+1],
+            pafThreeLineWin[nLine3Off + j-1],
+            pafThreeLineWin[nLine3Off + j],
+            pafThreeLineWin[nLine3Off + j+1]
+        };
+
+        pafOutputBuf[j] =
+            ComputeVal(
+                bOneOfThreeLinesHasNoData,
+                fSrcNoDataValue,
+                bIsSrcNoDataNan,
+                afWin, fDstNoDataValue,
+                pfnAlg, pData, bComputeAtEdges);
+    }
+
+    if( bComputeAtEdges && nXSize >= 2 )
+    {
+        j = nXSize - 1;
+
+        T afWin[9] = {
+            pafThreeLineWin[nLine1Off + j-1],
+            pafThreeLineWin[nLine1Off + j],
+            INTERPOL(pafThreeLineWin[nLine1Off + j],
+                     pafThreeLineWin[nLine1Off + j-1],
+                     bSrcHasNoData, fSrcNoDataValue),
+            pafThreeLineWin[nLine2Off + j-1],
+            pafThreeLineWin[nLine2Off + j],
+            INTERPOL(pafThreeLineWin[nLine2Off + j],
+                     pafThreeLineWin[nLine2Off + j-1],
+                     bSrcHasNoData, fSrcNoDataValue),
+            pafThreeLineWin[nLine3Off + j-1],
+            pafThreeLineWin[nLine3Off + j],
+            INTERPOL(pafThreeLineWin[nLine3Off + j],
+                     pafThreeLineWin[nLine3Off + j-1],
+                     bSrcHasNoData, fSrcNoDataValue)
+        };
+
+        pafOutputBuf[j] =
+            ComputeVal(
+                bOneOfThreeLinesHasNoData,
+                fSrcNoDataValue,
+                bIsSrcNoDataNan,
+                afWin, fDstNoDataValue,
+                pfnAlg, pData, bComputeAtEdges);
+    }
+    else
+    {
+        // Exclude the edges
+        if( nXSize > 1 )
+            pafOutputBuf[nXSize - 1] = fDstNoDataValue;
+    }
+}
+
+/************************************************************************/
+/*                          ComputeLastLine()                           */
+/************************************************************************/
+
+template<class T>
+void GDALGeneric3x3Processor<T>::ComputeLastLine( const T* pafLine1,
+                                                  const T* pafLine2,
+                                                  float* pafOutputBuf ) const
+{
+    if( !(bComputeAtEdges && nXSize >= 2 && nYSize >= 2) )
+    {
+        // Exclude the edges
+        for( int j = 0; j < nXSize; j++ )
+        {
+            pafOutputBuf[j] = fDstNoDataValue;
+        }
+        return;
+    }
+
+    for( int j = 0; j < nXSize; j++ )
+    {
+        int jmin = (j == 0) ? j : j - 1;
+        int jmax = (j == nXSize - 1) ? j : j + 1;
+
+        T afWin[9] = {
+            pafLine1[jmin],
+            pafLine1[j],
+            pafLine1[jmax],
+            pafLine2[jmin],
+            pafLine2[j],
+            pafLine2[jmax],
+            INTERPOL(pafLine2[jmin], pafLine1[jmin],
+                     bSrcHasNoData, fSrcNoDataValue),
+            INTERPOL(pafLine2[j],    pafLine1[j],
+                     bSrcHasNoData, fSrcNoDataValue),
+            INTERPOL(pafLine2[jmax], pafLine1[jmax],
+                     bSrcHasNoData, fSrcNoDataValue),
+        };
+
+        pafOutputBuf[j] = ComputeVal(
+            bSrcHasNoData,
+            fSrcNoDataValue,
+            bIsSrcNoDataNan,
+            afWin, fDstNoDataValue,
+            pfnAlg, pData, bComputeAtEdges);
+    }
+}
+
+/************************************************************************/
+/*                            ProcessStrip()                            */
+/*                                                                      */
+/*      Compute and write the lines [nYOff, nYOff + nYCount[, reading   */
+/*      them with one more line above and below.                        */
+/************************************************************************/
+
+template<class T>
+CPLErr GDALGeneric3x3Processor<T>::ProcessStrip( GDALRasterBandH hSrcBand,
+                                                 GDALRasterBandH hDstBand,
+                                                 GDALDataType eReadDT,
+                                                 int nYOff, int nYCount,
+                                                 CPLMutex **phIOMutex ) const
+{
+    const int nSrcYOff = std::max(0, nYOff - 1);
+    const int nSrcYCount = std::min(nYSize, nYOff + nYCount + 1) - nSrcYOff;
+
+    // One more value, as pfnAlg_multisample() may read one past the end
+    // of a line.
+    std::vector<T> afSrc( static_cast<size_t>(nSrcYCount) * nXSize + 1 );
+    std::vector<float> afDst( static_cast<size_t>(nYCount) * nXSize );
+
+    {
+        CPLMutexHolderD(phIOMutex);
+        if( GDALRasterIO( hSrcBand, GF_Read, 0, nSrcYOff, nXSize, nSrcYCount,
+                          &afSrc[0], nXSize, nSrcYCount, eReadDT,
+                          0, 0 ) != CE_None )
+        {
+            return CE_Failure;
+        }
+    }
+
+    std::vector<bool> abLineHasNoDataValue(nSrcYCount);
+    for( int iLine = 0; iLine < nSrcYCount; iLine++ )
+    {
+        abLineHasNoDataValue[iLine] =
+            LineHasNoData( &afSrc[static_cast<size_t>(iLine) * nXSize] );
+    }
+
+    for( int i = nYOff; i < nYOff + nYCount; i++ )
+    {
+        const int iLine = i - nSrcYOff;
+        const T* pafLine = &afSrc[static_cast<size_t>(iLine) * nXSize];
+        float* pafOutputBuf = &afDst[static_cast<size_t>(i - nYOff) * nXSize];
+        if( i == 0 )
+        {
+            ComputeFirstLine( pafLine, pafLine + nXSize, pafOutputBuf );
+        }
+        else if( i == nYSize - 1 )
+        {
+            ComputeLastLine( pafLine - nXSize, pafLine, pafOutputBuf );
+        }
+        else
+        {
+            ComputeLine( pafLine - nXSize, 0, nXSize, 2 * nXSize,
+                         abLineHasNoDataValue[iLine - 1] ||
+                         abLineHasNoDataValue[iLine] ||
+                         abLineHasNoDataValue[iLine + 1],
+                         pafOutputBuf );
+        }
+    }
+
+    CPLMutexHolderD(phIOMutex);
+    return GDALRasterIO( hDstBand, GF_Write, 0, nYOff, nXSize, nYCount,
+                         &afDst[0], nXSize, nYCount, GDT_Float32, 0, 0 );
+}
+
 /************************************************************************/
 /*                  GDALGeneric3x3Processing()                          */
 /************************************************************************/
@@ -287,6 +763,7 @@ CPLErr GDALGeneric3x3Processing(
     typename GDALGeneric3x3ProcessingAlg_multisample<T>::type pfnAlg_multisample,
     void *pData,
     bool bComputeAtEdges,
+    int nThreads,
     GDALProgressFunc pfnProgress,
     void *pProgressData )
 {
@@ -305,18 +782,13 @@ CPLErr GDALGeneric3x3Processing(
     const int nXSize = GDALGetRasterBandXSize(hSrcBand);
     const int nYSize = GDALGetRasterBandYSize(hSrcBand);
 
-    // 1 line destination buffer.
-    float *pafOutputBuf = static_cast<float *>(
-        VSI_MALLOC2_VERBOSE(sizeof(float), nXSize));
-    // 3 line rotating source buffer.
-    T *pafThreeLineWin  = static_cast<T *>(
-        VSI_MALLOC2_VERBOSE(3 * sizeof(T), nXSize + 1));
-    if( pafOutputBuf == nullptr || pafThreeLineWin == nullptr )
-    {
-        VSIFree(pafOutputBuf);
-        VSIFree(pafThreeLineWin);
-        return CE_Failure;
-    }
+    GDALGeneric3x3Processor<T> oProcessor;
+    oProcessor.pfnAlg = pfnAlg;
+    oProcessor.pfnAlg_multisample = pfnAlg_multisample;
+    oProcessor.pData = pData;
+    oProcessor.bComputeAtEdges = bComputeAtEdges;
+    oProcessor.nXSize = nXSize;
+    oProcessor.nYSize = nYSize;
 
     GDALDataType eReadDT;
     int bSrcHasNoData = FALSE;
@@ -365,6 +837,45 @@ CPLErr GDALGeneric3x3Processing(
     if( !bDstHasNoData )
         fDstNoDataValue = 0.0;
 
+    oProcessor.bSrcHasNoData = CPL_TO_BOOL(bSrcHasNoData);
+    oProcessor.fSrcNoDataValue = fSrcNoDataValue;
+    oProcessor.bIsSrcNoDataNan = CPL_TO_BOOL(bIsSrcNoDataNan);
+    oProcessor.fDstNoDataValue = fDstNoDataValue;
+
+/* -------------------------------------------------------------------- */
+/*      Process by strips of lines in worker threads if requested.      */
+/* -------------------------------------------------------------------- */
+    const int nStripHeight = GDALDEMGetStripHeight(hDstBand);
+    if( nThreads > 1 && nYSize > nStripHeight )
+    {
+        const GDALDEMStripFunc pfnStrip =
+            [&oProcessor, hSrcBand, hDstBand, eReadDT](
+                            int nYOff, int nYCount, CPLMutex **phIOMutex )
+        {
+            return oProcessor.ProcessStrip( hSrcBand, hDstBand, eReadDT,
+                                            nYOff, nYCount, phIOMutex );
+        };
+        const CPLErr eErr =
+            GDALDEMProcessStrips( nYSize, nStripHeight, nThreads, pfnStrip,
+                                  pfnProgress, pProgressData );
+        if( eErr == CE_None )
+            pfnProgress( 1.0, nullptr, pProgressData );
+        return eErr;
+    }
+
+    // 1 line destination buffer.
+    float *pafOutputBuf = static_cast<float *>(
+        VSI_MALLOC2_VERBOSE(sizeof(float), nXSize));
+    // 3 line rotating source buffer.
+    T *pafThreeLineWin  = static_cast<T *>(
+        VSI_MALLOC2_VERBOSE(3 * sizeof(T), nXSize + 1));
+    if( pafOutputBuf == nullptr || pafThreeLineWin == nullptr )
+    {
+        VSIFree(pafOutputBuf);
+        VSIFree(pafThreeLineWin);
+        return CE_Failure;
+    }
+
     int nLine1Off = 0;
     int nLine2Off = nXSize;
     int nLine3Off = 2*nXSize;
@@ -402,72 +913,16 @@ CPLErr GDALGeneric3x3Processing(
 
             return CE_Failure;
         }
-        if( std::numeric_limits<T>::is_integer && bSrcHasNoData )
-        {
-            abLineHasNoDataValue[i] = false;
-            for( int iX = 0; iX < nXSize; iX++ )
-            {
-                if( pafThreeLineWin[i * nXSize + iX] == fSrcNoDataValue )
-                {
-                    abLineHasNoDataValue[i] = true;
-                    break;
-                }
-            }
-        }
+        abLineHasNoDataValue[i] =
+            oProcessor.LineHasNoData(pafThreeLineWin + i * nXSize);
       }
     }  // End extra scope for VC12
 
-    CPLErr eErr = CE_None;
-    if( bComputeAtEdges && nXSize >= 2 && nYSize >= 2 )
-    {
-        for( int j = 0; j < nXSize; j++ )
-        {
-            int jmin = (j == 0) ? j : j - 1;
-            int jmax = (j == nXSize - 1) ? j : j + 1;
-
-            T afWin[9] = {
-                INTERPOL(pafThreeLineWin[jmin], pafThreeLineWin[nXSize + jmin],
-                         bSrcHasNoData, fSrcNoDataValue),
-                INTERPOL(pafThreeLineWin[j],    pafThreeLineWin[nXSize + j],
-                         bSrcHasNoData, fSrcNoDataValue),
-                INTERPOL(pafThreeLineWin[jmax], pafThreeLineWin[nXSize + jmax],
-                         bSrcHasNoData, fSrcNoDataValue),
-                pafThreeLineWin[jmin],
-                pafThreeLineWin[j],
-                pafThreeLineWin[jmax],
-                pafThreeLineWin[nXSize + jmin],
-                pafThreeLineWin[nXSize + j],
-                pafThreeLineWin[nXSize + jmax]
-            };
-            pafOutputBuf[j] = ComputeVal(
-                CPL_TO_BOOL(bSrcHasNoData),
-                fSrcNoDataValue,
-                CPL_TO_BOOL(bIsSrcNoDataNan),
-                afWin, fDstNoDataValue,
-                pfnAlg, pData, bComputeAtEdges);
-        }
-        eErr = GDALRasterIO(hDstBand, GF_Write,
-                    0, 0, nXSize, 1,
-                    pafOutputBuf, nXSize, 1, GDT_Float32, 0, 0);
-    }
-    else
-    {
-        // Exclude the edges
-        for( int j = 0; j < nXSize; j++ )
-        {
-            pafOutputBuf[j] = fDstNoDataValue;
-        }
-        eErr = GDALRasterIO(hDstBand, GF_Write,
-                    0, 0, nXSize, 1,
-                    pafOutputBuf, nXSize, 1, GDT_Float32, 0, 0);
-
-        if( eErr == CE_None && nYSize > 1 )
-        {
-            eErr = GDALRasterIO(hDstBand, GF_Write,
-                        0, nYSize - 1, nXSize, 1,
-                        pafOutputBuf, nXSize, 1, GDT_Float32, 0, 0);
-        }
-    }
+    oProcessor.ComputeFirstLine( pafThreeLineWin, pafThreeLineWin + nXSize,
+                                 pafOutputBuf );
+    CPLErr eErr = GDALRasterIO(hDstBand, GF_Write,
+                               0, 0, nXSize, 1,
+                               pafOutputBuf, nXSize, 1, GDT_Float32, 0, 0);
     if( eErr != CE_None )
     {
         CPLFree(pafOutputBuf);
@@ -496,147 +951,17 @@ CPLErr GDALGeneric3x3Processing(
             return eErr;
         }
 
-        // In case none of the 3 lines have nodata values, then no need to
-        // check it in ComputeVal()
-        bool bOneOfThreeLinesHasNoData = CPL_TO_BOOL(bSrcHasNoData);
-        if( std::numeric_limits<T>::is_integer && bSrcHasNoData )
-        {
-            bool bLastLineHasNoDataValue = false;
-            int iX = 0;
-            for( ; iX + 3 < nXSize; iX +=4 )
-            {
-                if( pafThreeLineWin[nLine3Off + iX] == fSrcNoDataValue ||
-                    pafThreeLineWin[nLine3Off + iX + 1] == fSrcNoDataValue ||
-                    pafThreeLineWin[nLine3Off + iX + 2] == fSrcNoDataValue ||
-                    pafThreeLineWin[nLine3Off + iX + 3] == fSrcNoDataValue )
-                {
-                    bLastLineHasNoDataValue = true;
-                    break;
-                }
-            }
-            if( !bLastLineHasNoDataValue )
-            {
-                for( ; iX < nXSize; iX++ )
-                {
-                    if( pafThreeLineWin[nLine3Off + iX] == fSrcNoDataValue )
-                    {
-                        bLastLineHasNoDataValue = true;
-                    }
-                }
-            }
-            abLineHasNoDataValue[nLine3Off / nXSize] = bLastLineHasNoDataValue;
+        abLineHasNoDataValue[nLine3Off / nXSize] =
+            oProcessor.LineHasNoData(pafThreeLineWin + nLine3Off);
 
-            bOneOfThreeLinesHasNoData = abLineHasNoDataValue[0] ||
-                                abLineHasNoDataValue[1] ||
-                                abLineHasNoDataValue[2];
-        }
+        const bool bOneOfThreeLinesHasNoData = abLineHasNoDataValue[0] ||
+                                               abLineHasNoDataValue[1] ||
+                                               abLineHasNoDataValue[2];
 
-        if( bComputeAtEdges && nXSize >= 2 )
-        {
-            int j = 0;
-            T afWin[9] = {
-                INTERPOL(pafThreeLineWin[nLine1Off + j],
-                         pafThreeLineWin[nLine1Off + j+1],
-                         bSrcHasNoData, fSrcNoDataValue),
-                pafThreeLineWin[nLine1Off + j],
-                pafThreeLineWin[nLine1Off + j+1],
-                INTERPOL(pafThreeLineWin[nLine2Off + j],
-                         pafThreeLineWin[nLine2Off + j+1],
-                         bSrcHasNoData, fSrcNoDataValue),
-                pafThreeLineWin[nLine2Off + j],
-                pafThreeLineWin[nLine2Off + j+1],
-                INTERPOL(pafThreeLineWin[nLine3Off + j],
-                         pafThreeLineWin[nLine3Off + j+1],
-                         bSrcHasNoData, fSrcNoDataValue),
-                pafThreeLineWin[nLine3Off + j],
-                pafThreeLineWin[nLine3Off + j+1]
-            };
-
-            pafOutputBuf[j] =
-                ComputeVal(
-                    CPL_TO_BOOL(bOneOfThreeLinesHasNoData),
-                    fSrcNoDataValue,
-                    CPL_TO_BOOL(bIsSrcNoDataNan),
-                    afWin, fDstNoDataValue,
-                    pfnAlg, pData, bComputeAtEdges);
-        }
-        else
-        {
-            // Exclude the edges
-            pafOutputBuf[0] = fDstNoDataValue;
-        }
-
-        int j = 1;
-        if( pfnAlg_multisample && !bOneOfThreeLinesHasNoData )
-        {
-            j = pfnAlg_multisample(pafThreeLineWin,
-                                   nLine1Off,
-                                   nLine2Off,
-                                   nLine3Off,
-                                   nXSize,
-                                   pData,
-                                   pafOutputBuf);
-        }
-
-        for( ; j < nXSize - 1; j++ )
-        {
-            T afWin[9] = {
-                pafThreeLineWin[nLine1Off + j-1],
-                pafThreeLineWin[nLine1Off + j],
-                pafThreeLineWin[nLine1Off + j+1],
-                pafThreeLineWin[nLine2Off + j-1],
-                pafThreeLineWin[nLine2Off + j],
-                pafThreeLineWin[nLine2Off + j+1],
-                pafThreeLineWin[nLine3Off + j-1],
-                pafThreeLineWin[nLine3Off + j],
-                pafThreeLineWin[nLine3Off + j+1]
-            };
-
-            pafOutputBuf[j] =
-                ComputeVal(
-                    CPL_TO_BOOL(bOneOfThreeLinesHasNoData),
-                    fSrcNoDataValue,
-                    CPL_TO_BOOL(bIsSrcNoDataNan),
-                    afWin, fDstNoDataValue,
-                    pfnAlg, pData, bComputeAtEdges);
-        }
-
-        if( bComputeAtEdges && nXSize >= 2 )
-        {
-            j = nXSize - 1;
-
-            T afWin[9] = {
-                pafThreeLineWin[nLine1Off + j-1],
-                pafThreeLineWin[nLine1Off + j],
-                INTERPOL(pafThreeLineWin[nLine1Off + j],
-                         pafThreeLineWin[nLine1Off + j-1],
-                         bSrcHasNoData, fSrcNoDataValue),
-                pafThreeLineWin[nLine2Off + j-1],
-                pafThreeLineWin[nLine2Off + j],
-                INTERPOL(pafThreeLineWin[nLine2Off + j],
-                         pafThreeLineWin[nLine2Off + j-1],
-                         bSrcHasNoData, fSrcNoDataValue),
-                pafThreeLineWin[nLine3Off + j-1],
-                pafThreeLineWin[nLine3Off + j],
-                INTERPOL(pafThreeLineWin[nLine3Off + j],
-                         pafThreeLineWin[nLine3Off + j-1],
-                         bSrcHasNoData, fSrcNoDataValue)
-            };
-
-            pafOutputBuf[j] =
-                ComputeVal(
-                    CPL_TO_BOOL(bOneOfThreeLinesHasNoData),
-                    fSrcNoDataValue,
-                    CPL_TO_BOOL(bIsSrcNoDataNan),
-                    afWin, fDstNoDataValue,
-                    pfnAlg, pData, bComputeAtEdges);
-        }
-        else
-        {
-            // Exclude the edges
-            if( nXSize > 1 )
-                pafOutputBuf[nXSize - 1] = fDstNoDataValue;
-        }
+        oProcessor.ComputeLine( pafThreeLineWin,
+                                nLine1Off, nLine2Off, nLine3Off,
+                                bOneOfThreeLinesHasNoData,
+                                pafOutputBuf );
 
         /* -----------------------------------------
          * Write Line to Raster
@@ -668,38 +993,11 @@ CPLErr GDALGeneric3x3Processing(
         nLine3Off = nTemp;
     }
 
-    if( bComputeAtEdges && nXSize >= 2 && nYSize >= 2 )
+    if( nYSize > 1 )
     {
-        for( int j = 0; j < nXSize; j++ )
-        {
-            int jmin = (j == 0) ? j : j - 1;
-            int jmax = (j == nXSize - 1) ? j : j + 1;
-
-            T afWin[9] = {
-                pafThreeLineWin[nLine1Off + jmin],
-                pafThreeLineWin[nLine1Off + j],
-                pafThreeLineWin[nLine1Off + jmax],
-                pafThreeLineWin[nLine2Off + jmin],
-                pafThreeLineWin[nLine2Off + j],
-                pafThreeLineWin[nLine2Off + jmax],
-                INTERPOL(pafThreeLineWin[nLine2Off + jmin],
-                         pafThreeLineWin[nLine1Off + jmin],
-                         bSrcHasNoData, fSrcNoDataValue),
-                INTERPOL(pafThreeLineWin[nLine2Off + j],
-                         pafThreeLineWin[nLine1Off + j],
-                         bSrcHasNoData, fSrcNoDataValue),
-                INTERPOL(pafThreeLineWin[nLine2Off + jmax],
-                         pafThreeLineWin[nLine1Off + jmax],
-                         bSrcHasNoData, fSrcNoDataValue),
-            };
-
-            pafOutputBuf[j] = ComputeVal(
-                CPL_TO_BOOL(bSrcHasNoData),
-                fSrcNoDataValue,
-                CPL_TO_BOOL(bIsSrcNoDataNan),
-                afWin, fDstNoDataValue,
-                pfnAlg, pData, bComputeAtEdges);
-        }
+        oProcessor.ComputeLastLine( pafThreeLineWin + nLine1Off,
+                                    pafThreeLineWin + nLine2Off,
+                                    pafOutputBuf );
         eErr = GDALRasterIO(hDstBand, GF_Write,
                             0, i, nXSize, 1,
                             pafOutputBuf, nXSize, 1, GDT_Float32, 0, 0);
@@ -2255,6 +2553,60 @@ GDALColorInterp GDALColorReliefRasterBand::GetColorInterpretation()
     return static_cast<GDALColorInterp>(GCI_RedBand + nBand - 1);
 }
 
+/************************************************************************/
+/*                    GDALColorReliefProcessPixels()                    */
+/************************************************************************/
+
+static
+void GDALColorReliefProcessPixels( const int* panSourceBuf,
+                                   const float* pafSourceBuf,
+                                   size_t nPixels,
+                                   const GByte* pabyPrecomputed,
+                                   int nIndexOffset,
+                                   ColorAssociation* pasColorAssociation,
+                                   int nColorAssociation,
+                                   ColorSelectionMode eColorSelectionMode,
+                                   GByte* pabyDestBuf1,
+                                   GByte* pabyDestBuf2,
+                                   GByte* pabyDestBuf3,
+                                   GByte* pabyDestBuf4 )
+{
+    if( pabyPrecomputed )
+    {
+        for( size_t j = 0; j < nPixels; j++ )
+        {
+            int nIndex = panSourceBuf[j] + nIndexOffset;
+            pabyDestBuf1[j] = pabyPrecomputed[4 * nIndex];
+            pabyDestBuf2[j] = pabyPrecomputed[4 * nIndex + 1];
+            pabyDestBuf3[j] = pabyPrecomputed[4 * nIndex + 2];
+            pabyDestBuf4[j] = pabyPrecomputed[4 * nIndex + 3];
+        }
+    }
+    else
+    {
+        int nR = 0;
+        int nG = 0;
+        int nB = 0;
+        int nA = 0;
+
+        for( size_t j = 0; j < nPixels; j++ )
+        {
+            GDALColorReliefGetRGBA  (pasColorAssociation,
+                                     nColorAssociation,
+                                     pafSourceBuf[j],
+                                     eColorSelectionMode,
+                                     &nR,
+                                     &nG,
+                                     &nB,
+                                     &nA);
+            pabyDestBuf1[j] = static_cast<GByte>(nR);
+            pabyDestBuf2[j] = static_cast<GByte>(nG);
+            pabyDestBuf3[j] = static_cast<GByte>(nB);
+            pabyDestBuf4[j] = static_cast<GByte>(nA);
+        }
+    }
+}
+
 static
 CPLErr GDALColorRelief( GDALRasterBandH hSrcBand,
                         GDALRasterBandH hDstBand1,
@@ -2263,6 +2615,7 @@ CPLErr GDALColorRelief( GDALRasterBandH hSrcBand,
                         GDALRasterBandH hDstBand4,
                         const char* pszColorFilename,
                         ColorSelectionMode eColorSelectionMode,
+                        int nThreads,
                         GDALProgressFunc pfnProgress,
                         void * pProgressData )
 {
@@ -2337,10 +2690,74 @@ CPLErr GDALColorRelief( GDALRasterBandH hSrcBand,
         return CE_Failure;
     }
 
-    int nR = 0;
-    int nG = 0;
-    int nB = 0;
-    int nA = 0;
+/* -------------------------------------------------------------------- */
+/*      Process by strips of lines in worker threads if requested.      */
+/* -------------------------------------------------------------------- */
+    const int nStripHeight = GDALDEMGetStripHeight(hDstBand1);
+    if( nThreads > 1 && nYSize > nStripHeight )
+    {
+        const GDALDEMStripFunc pfnStrip =
+            [=]( int nYOff, int nYCount, CPLMutex **phIOMutex ) -> CPLErr
+        {
+            const size_t nPixels = static_cast<size_t>(nXSize) * nYCount;
+            std::vector<int> anSrc( pabyPrecomputed ? nPixels : 0 );
+            std::vector<float> afSrc( pabyPrecomputed ? 0 : nPixels );
+            std::vector<GByte> abyDst( 4 * nPixels );
+            {
+                CPLMutexHolderD(phIOMutex);
+                if( GDALRasterIO( hSrcBand, GF_Read,
+                                  0, nYOff, nXSize, nYCount,
+                                  pabyPrecomputed
+                                  ? static_cast<void*>(&anSrc[0])
+                                  : static_cast<void*>(&afSrc[0]),
+                                  nXSize, nYCount,
+                                  pabyPrecomputed ? GDT_Int32 : GDT_Float32,
+                                  0, 0 ) != CE_None )
+                {
+                    return CE_Failure;
+                }
+            }
+
+            GDALColorReliefProcessPixels( anSrc.data(), afSrc.data(), nPixels,
+                                          pabyPrecomputed, nIndexOffset,
+                                          pasColorAssociation,
+                                          nColorAssociation,
+                                          eColorSelectionMode,
+                                          &abyDst[0],
+                                          &abyDst[nPixels],
+                                          &abyDst[2 * nPixels],
+                                          &abyDst[3 * nPixels] );
+
+            CPLMutexHolderD(phIOMutex);
+            const GDALRasterBandH ahDstBands[4] =
+                { hDstBand1, hDstBand2, hDstBand3, hDstBand4 };
+            for( int iBand = 0; iBand < 4; iBand++ )
+            {
+                if( ahDstBands[iBand] != nullptr &&
+                    GDALRasterIO( ahDstBands[iBand], GF_Write,
+                                  0, nYOff, nXSize, nYCount,
+                                  &abyDst[iBand * nPixels], nXSize, nYCount,
+                                  GDT_Byte, 0, 0 ) != CE_None )
+                {
+                    return CE_Failure;
+                }
+            }
+            return CE_None;
+        };
+        const CPLErr eErr =
+            GDALDEMProcessStrips( nYSize, nStripHeight, nThreads, pfnStrip,
+                                  pfnProgress, pProgressData );
+        if( eErr == CE_None )
+            pfnProgress( 1.0, nullptr, pProgressData );
+
+        VSIFree(pabyPrecomputed);
+        CPLFree(pafSourceBuf);
+        CPLFree(panSourceBuf);
+        CPLFree(pabyDestBuf1);
+        CPLFree(pasColorAssociation);
+
+        return eErr;
+    }
 
     for( int i = 0; i < nYSize; i++ )
     {
@@ -2365,35 +2782,12 @@ CPLErr GDALColorRelief( GDALRasterBandH hSrcBand,
             return eErr;
         }
 
-        if( pabyPrecomputed )
-        {
-            for( int j = 0; j < nXSize; j++ )
-            {
-                int nIndex = panSourceBuf[j] + nIndexOffset;
-                pabyDestBuf1[j] = pabyPrecomputed[4 * nIndex];
-                pabyDestBuf2[j] = pabyPrecomputed[4 * nIndex + 1];
-                pabyDestBuf3[j] = pabyPrecomputed[4 * nIndex + 2];
-                pabyDestBuf4[j] = pabyPrecomputed[4 * nIndex + 3];
-            }
-        }
-        else
-        {
-            for( int j = 0; j < nXSize; j++ )
-            {
-                GDALColorReliefGetRGBA  (pasColorAssociation,
-                                         nColorAssociation,
-                                         pafSourceBuf[j],
-                                         eColorSelectionMode,
-                                         &nR,
-                                         &nG,
-                                         &nB,
-                                         &nA);
-                pabyDestBuf1[j] = static_cast<GByte>(nR);
-                pabyDestBuf2[j] = static_cast<GByte>(nG);
-                pabyDestBuf3[j] = static_cast<GByte>(nB);
-                pabyDestBuf4[j] = static_cast<GByte>(nA);
-            }
-        }
+        GDALColorReliefProcessPixels( panSourceBuf, pafSourceBuf, nXSize,
+                                      pabyPrecomputed, nIndexOffset,
+                                      pasColorAssociation, nColorAssociation,
+                                      eColorSelectionMode,
+                                      pabyDestBuf1, pabyDestBuf2,
+                                      pabyDestBuf3, pabyDestBuf4 );
 
         /* -----------------------------------------
          * Write Line to Raster
@@ -3818,6 +4212,7 @@ GDALDatasetH GDALDEMProcessing( const char *pszDest,
                          psOptions->bAddAlpha ? GDALGetRasterBand(hDstDataset, 4) : nullptr,
                          pszColorFilename,
                          psOptions->eColorSelectionMode,
+                         psOptions->nNumThreads,
                          pfnProgress, pProgressData);
     }
     else
@@ -3832,6 +4227,7 @@ GDALDatasetH GDALDEMProcessing( const char *pszDest,
                                              pfnAlgInt32_multisample,
                                              pData,
                                              psOptions->bComputeAtEdges,
+                                             psOptions->nNumThreads,
                                              pfnProgress, pProgressData);
         }
         else
@@ -3841,6 +4237,7 @@ GDALDatasetH GDALDEMProcessing( const char *pszDest,
                                             nullptr,
                                             pData,
                                             psOptions->bComputeAtEdges,
+                                            psOptions->nNumThreads,
                                             pfnProgress, pProgressData);
         }
     }
@@ -3897,6 +4294,7 @@ GDALDEMProcessingOptions *GDALDEMProcessingOptionsNew(
     psOptions->bIgor = false;
     psOptions->bMultiDirectional = false;
     psOptions->nBand = 1;
+    psOptions->nNumThreads = 1;
     psOptions->papszCreateOptions = nullptr;
     bool bAzimuthSpecified = false;
     bool bAltSpecified = false;
@@ -4070,6 +4468,20 @@ GDALDEMProcessingOptions *GDALDEMProcessingOptionsNew(
         {
             psOptions->nBand = atoi(papszArgv[++i]);
         }
+        else if( i + 1 < argc && EQUAL(papszArgv[i], "-num_threads") )
+        {
+            const char* pszNumThreads = papszArgv[++i];
+            psOptions->nNumThreads =
+                EQUAL(pszNumThreads, "ALL_CPUS") ? CPLGetNumCPUs() :
+                                                   atoi(pszNumThreads);
+            if( psOptions->nNumThreads < 1 )
+            {
+                CPLError(CE_Failure, CPLE_IllegalArg,
+                         "Invalid value for -num_threads: %s", pszNumThreads);
+                GDALDEMProcessingOptionsFree(psOptions);
+                return nullptr;
+            }
+        }
         else if( EQUAL(papszArgv[i],"-co") && i+1<argc )
         {
             psOptions->papszCreateOptions =
@@ -200,7 +200,9 @@ interpreted as bytes.</dd>
 Two threads will be used to process chunks of image and perform
 input/output operation simultaneously. Note that computation is not
 multithreaded itself. To do that, you can use the -wo NUM_THREADS=val/ALL_CPUS
-option, which can be combined with -multi</dd>
+option, which can be combined with -multi. Starting with GDAL 3.1, the
+-wo NUM_CHUNKS_IN_FLIGHT=val/ALL_CPUS option can be combined with -multi to
+warp several chunks concurrently (input/output remains serialized).</dd>
 <dt> <b>-q</b>:</dt><dd> Be quiet.</dd>
 <dt> <b>-of</b> <em>format</em>:</dt><dd> Select the output format. The default is GeoTIFF (GTiff). Use the short format name. </dd>
 <dt> <b>-co</b> <em>"NAME=VALUE"</em>:</dt><dd> passes a creation option to
@@ -247,6 +249,17 @@ When doing vertical shift adjustments, the transformer option -to ERROR_ON_MISSI
 can be used to error out as soon as a vertical shift value is missing (instead of 
 0 being used).
 
+(GDAL &gt;= 3.1) When the GDALWARP_TRANSFORMER_CACHE_DIR configuration option
+is set to a directory, the source pixel coordinates computed for each pixel of
+the target raster are stored in a file of that directory, and reused by later
+warps with the same source georeferencing, transformer options and target
+grid, which then skip coordinate transformations. This is mostly useful when
+repeatedly warping rasters of a time series onto the same target grid, in
+particular with RPC or geolocation array transformers. Coordinates are stored
+as single precision offsets, so results may differ very slightly from a
+warp not using the cache. A cache file should not be used by several
+processes at the same time.
+
 <p>
 \section gdalwarp_examples EXAMPLES
 
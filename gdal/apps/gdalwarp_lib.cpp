@@ -2008,6 +2008,25 @@ GDALDatasetH GDALWarp( const char *pszDest, GDALDatasetH hDstDS, int nSrcCount,
             GDALApproxTransformerOwnsSubtransformer(hTransformArg, TRUE);
         }
 
+/* -------------------------------------------------------------------- */
+/*      Cache the coordinates computed by the transformer if asked      */
+/*      to, so that warps onto the same grid can reuse them.            */
+/* -------------------------------------------------------------------- */
+        const char* pszTransformerCacheDir =
+            CPLGetConfigOption("GDALWARP_TRANSFORMER_CACHE_DIR", nullptr);
+        if( pszTransformerCacheDir != nullptr && !bVRT )
+        {
+            void* hCachedTransformArg = GDALCreateCachedTransformer(
+                pfnTransformer, hTransformArg,
+                GDALGetRasterXSize(hDstDS), GDALGetRasterYSize(hDstDS),
+                pszTransformerCacheDir);
+            if( hCachedTransformArg != nullptr )
+            {
+                hTransformArg = hCachedTransformArg;
+                pfnTransformer = GDALCachedTransform;
+            }
+        }
+
         psWO->pfnTransformer = pfnTransformer;
         psWO->pTransformerArg = hTransformArg;
 
@@ -81,6 +81,8 @@ static void Usage( const char* pszAdditionalMsg = nullptr, bool bShort = true )
         "\n"
         "Advanced options :\n"
         "               [-gt n] [-ds_transaction]\n"
+        "               [-pipeline_threads n|ALL_CPUS] [-pipeline_unordered]\n"
+        "               [-layer_threads n|ALL_CPUS]\n"
         "               [[-oo NAME=VALUE] ...] [[-doo NAME=VALUE] ...]\n"
         "               [-clipsrc [xmin ymin xmax ymax]|WKT|datasource|spat_extent]\n"
         "               [-clipsrcsql sql_statement] [-clipsrclayer layer]\n"
@@ -145,6 +147,9 @@ static void Usage( const char* pszAdditionalMsg = nullptr, bool bShort = true )
         " -dialect value: select a dialect, usually OGRSQL to avoid native sql.\n"
         " -skipfailures: skip features or layers that fail to convert\n"
         " -gt n: group n features per transaction (default 20000). n can be set to unlimited\n"
+        " -pipeline_threads n|ALL_CPUS: number of threads used to translate features\n"
+        " -pipeline_unordered: allow features to be written in a different order\n"
+        " -layer_threads n|ALL_CPUS: number of layers translated concurrently\n"
         " -spat xmin ymin xmax ymax: spatial query extents\n"
         " -simplify tolerance: distance tolerance for simplification.\n"
         " -segmentize max_dist: maximum distance between 2 nodes.\n"
@@ -39,7 +39,9 @@
 #include <cstring>
 
 #include <algorithm>
+#include <deque>
 #include <map>
+#include <memory>
 #include <set>
 #include <unordered_set>
 #include <string>
@@ -49,9 +51,11 @@
 #include "commonutils.h"
 #include "cpl_conv.h"
 #include "cpl_error.h"
+#include "cpl_multiproc.h"
 #include "cpl_progress.h"
 #include "cpl_string.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 #include "gdal.h"
 #include "gdal_alg.h"
 #include "gdal_priv.h"
@@ -346,6 +350,21 @@ struct GDALVectorTranslateOptions
 
     /*! Maximum number of features, or -1 if no limit. */
     GIntBig nLimit;
+
+    /*! Number of worker threads used to translate features (reprojection,
+        clipping, simplification, field mapping...) while features are read
+        and written in the calling thread. 0 or 1 to disable. */
+    int nPipelineThreads;
+
+    /*! Whether features translated by worker threads may be written in a
+        different order than the one they are read in. */
+    bool bPipelineUnordered;
+
+    /*! Number of source layers translated concurrently, each in its own
+        worker thread. Only honoured for output drivers where layers can be
+        written independently (e.g. directory of shapefiles, PostgreSQL).
+        0 or 1 to disable. */
+    int nLayerThreads;
 };
 
 typedef struct
@@ -409,6 +428,15 @@ public:
                                       GIntBig& nTotalEventsDone);
 };
 
+/* Result of the translation of a source feature, or of one of its parts */
+/* with -explodecollections. */
+struct TranslatedFeaturePart
+{
+    OGRFeatureUniquePtr poDstFeature{};  /* nullptr if skipped */
+    bool                bSetFromFailed = false;
+    int                 nReprojectFailures = 0;
+};
+
 class LayerTranslator
 {
 public:
@@ -431,6 +459,20 @@ public:
     bool                          m_bExplodeCollections;
     bool                          m_bNativeData;
     GIntBig                       m_nLimit;
+    int                           m_nPipelineThreads;
+    bool                          m_bPipelineUnordered;
+
+    void                TranslateFeaturePart(
+                                  OGRFeature* poFeature,
+                                  int iPart,
+                                  int nParts,
+                                  const TargetLayerInfo* psInfo,
+                                  OGRFeatureDefn* poDstFDefn,
+                                  int nSrcGeomFieldCount,
+                                  bool bExplodeCollections,
+                                  OGRSpatialReference* poOutputSRS,
+                                  const OGRGeometryFactory::TransformWithOptionsCache& oCache,
+                                  TranslatedFeaturePart& sPart ) const;
 
     int                 Translate(OGRFeature* poFeatureIn,
                                   TargetLayerInfo* psInfo,
@@ -1580,6 +1622,311 @@ class OGR2OGRSpatialReferenceHolder
        OGRSpatialReference* get() { return m_poSRS; }
 };
 
+/************************************************************************/
+/*                    CanTranslateLayersConcurrently()                  */
+/*                                                                      */
+/*      Whether several layers can be written at the same time into     */
+/*      the output datasource, each through its own datasource handle.  */
+/*      This is the case for a directory of shapefiles, where each      */
+/*      layer is a separate file set, and for PostgreSQL where each     */
+/*      handle is an independent connection. Other formats, and in      */
+/*      particular single-file ones such as GeoPackage, only support a  */
+/*      single writer and are translated sequentially.                  */
+/************************************************************************/
+
+static bool CanTranslateLayersConcurrently( GDALDriver* poDriver,
+                                            const char* pszDestFilename )
+{
+    if( poDriver == nullptr )
+        return false;
+    const char* pszDriverName = poDriver->GetDescription();
+    if( EQUAL(pszDriverName, "PostgreSQL") )
+        return true;
+    if( EQUAL(pszDriverName, "ESRI Shapefile") )
+    {
+        VSIStatBufL sStat;
+        return VSIStatL(pszDestFilename, &sStat) == 0 &&
+               VSI_ISDIR(sStat.st_mode);
+    }
+    return false;
+}
+
+/************************************************************************/
+/*                        ReopenOutputDataset()                         */
+/************************************************************************/
+
+static GDALDataset* ReopenOutputDataset( GDALDriver* poDriver,
+                                         const char* pszDestFilename,
+                                         const GDALVectorTranslateOptions* psOptions )
+{
+    /* The shapefile driver refuses to open a directory without any */
+    /* shapefile in it, but its Create() method opens an existing */
+    /* directory in update mode. */
+    if( EQUAL(poDriver->GetDescription(), "ESRI Shapefile") )
+        return poDriver->Create( pszDestFilename, 0, 0, 0, GDT_Unknown,
+                                 psOptions->papszDSCO );
+
+    const char* const apszDrivers[] = { poDriver->GetDescription(), nullptr };
+    return static_cast<GDALDataset*>(
+        GDALOpenEx( pszDestFilename, GDAL_OF_VECTOR | GDAL_OF_UPDATE,
+                    apszDrivers, psOptions->papszDestOpenOptions, nullptr ));
+}
+
+/************************************************************************/
+/*                         LayerTranslationJob                          */
+/*                                                                      */
+/*      Translation of a source layer in a worker thread                */
+/*      (-layer_threads). The job reopens its own source and output     */
+/*      datasources, so that no dataset, layer or spatial reference     */
+/*      object is shared with other jobs.                               */
+/************************************************************************/
+
+/* Progress of the layer translation jobs, reported through the progress */
+/* callback of the user. */
+struct LayerTranslationProgress
+{
+    CPLMutex                   *hMutex = nullptr;
+    GDALProgressFunc            pfnProgress = nullptr;
+    void                       *pProgressData = nullptr;
+    /* Protected by hMutex */
+    double                      dfTotalWeight = 0;
+    double                      dfDoneWeight = 0;
+    bool                        bStop = false;
+
+    LayerTranslationProgress() = default;
+    ~LayerTranslationProgress()
+    {
+        if( hMutex )
+            CPLDestroyMutex(hMutex);
+    }
+
+  private:
+    CPL_DISALLOW_COPY_ASSIGN(LayerTranslationProgress)
+};
+
+struct LayerTranslationJob
+{
+    struct JobError
+    {
+        CPLErr                  eErr = CE_None;
+        CPLErrorNum             nErrorNum = CPLE_None;
+        CPLString               osMsg{};
+    };
+
+    GDALVectorTranslateOptions *psOptions = nullptr;
+    SetupTargetLayer            oSetup{};
+    LayerTranslator             oTranslator{};
+    CPLString                   osSrcFilename{};
+    CPLString                   osSrcDriver{};
+    char                      **papszSrcOpenOptions = nullptr;
+    GDALDriver                 *poDstDriver = nullptr;
+    CPLString                   osDestFilename{};
+    int                         iSrcLayer = -1;
+    CPLString                   osSrcLayerName{};
+    OGRSpatialReference        *poOutputSRS = nullptr;
+    OGRSpatialReference        *poSourceSRS = nullptr;
+    OGRSpatialReference        *poSpatSRS = nullptr;
+    bool                        bSuccess = false;
+    /* Number of features of the layer, or 1 if it is not known. */
+    GIntBig                     nCountLayerFeatures = 0;
+    LayerTranslationProgress   *psProgress = nullptr;
+    double                      dfWeight = 1;
+    /* Protected by psProgress->hMutex */
+    double                      dfDoneWeight = 0;
+    /* Errors are emitted by the calling thread once the job is completed, */
+    /* so that they reach the error handlers installed by the caller. */
+    std::vector<JobError>       aoErrors{};
+
+    LayerTranslationJob() = default;
+    ~LayerTranslationJob();
+
+    static void Run( void* pData );
+
+  private:
+    CPL_DISALLOW_COPY_ASSIGN(LayerTranslationJob)
+
+    void RunInternal();
+    static void CPL_STDCALL ErrorHandler( CPLErr eErr, CPLErrorNum nErrorNum,
+                                          const char* pszMsg );
+    static int CPL_STDCALL Progress( double dfComplete, const char* pszMsg,
+                                     void* pData );
+};
+
+LayerTranslationJob::~LayerTranslationJob()
+{
+    if( poOutputSRS )
+        poOutputSRS->Release();
+    if( poSourceSRS )
+        poSourceSRS->Release();
+    if( poSpatSRS )
+        poSpatSRS->Release();
+}
+
+void LayerTranslationJob::ErrorHandler( CPLErr eErr, CPLErrorNum nErrorNum,
+                                        const char* pszMsg )
+{
+    LayerTranslationJob* psJob =
+        static_cast<LayerTranslationJob*>(CPLGetErrorHandlerUserData());
+    JobError oError;
+    oError.eErr = eErr;
+    oError.nErrorNum = nErrorNum;
+    oError.osMsg = pszMsg;
+    psJob->aoErrors.push_back(oError);
+}
+
+/************************************************************************/
+/*                    LayerTranslationJob::Progress()                   */
+/*                                                                      */
+/*      Report the progress of all the jobs through the progress        */
+/*      callback of the user, one job at a time. Once it has asked      */
+/*      to stop, all the jobs stop.                                     */
+/************************************************************************/
+
+int LayerTranslationJob::Progress( double dfComplete, const char*,
+                                   void* pData )
+{
+    LayerTranslationJob* psJob = static_cast<LayerTranslationJob*>(pData);
+    LayerTranslationProgress* psProgress = psJob->psProgress;
+    CPLMutexHolderD(&psProgress->hMutex);
+    if( psProgress->bStop )
+        return FALSE;
+    const double dfDoneWeight =
+        std::min(1.0, std::max(0.0, dfComplete)) * psJob->dfWeight;
+    psProgress->dfDoneWeight += dfDoneWeight - psJob->dfDoneWeight;
+    psJob->dfDoneWeight = dfDoneWeight;
+    if( psProgress->pfnProgress != nullptr &&
+        !psProgress->pfnProgress(
+            psProgress->dfTotalWeight > 0 ?
+                psProgress->dfDoneWeight / psProgress->dfTotalWeight : 1.0,
+            "", psProgress->pProgressData) )
+    {
+        psProgress->bStop = true;
+        return FALSE;
+    }
+    return TRUE;
+}
+
+/************************************************************************/
+/*                      LayerTranslationJob::Run()                      */
+/************************************************************************/
+
+void LayerTranslationJob::Run( void* pData )
+{
+    LayerTranslationJob* psJob = static_cast<LayerTranslationJob*>(pData);
+    CPLPushErrorHandlerEx(ErrorHandler, psJob);
+    CPLSetCurrentErrorHandlerCatchDebug(false);
+    psJob->RunInternal();
+    CPLPopErrorHandler();
+}
+
+void LayerTranslationJob::RunInternal()
+{
+    {
+        /* Do not start once the user has asked to stop. */
+        CPLMutexHolderD(&psProgress->hMutex);
+        if( psProgress->bStop )
+            return;
+    }
+
+    const char* const apszSrcDrivers[] = { osSrcDriver.c_str(), nullptr };
+    GDALDataset* poSrcDS = static_cast<GDALDataset*>(
+        GDALOpenEx( osSrcFilename, GDAL_OF_VECTOR, apszSrcDrivers,
+                    papszSrcOpenOptions, nullptr ));
+    if( poSrcDS == nullptr )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined,
+                  "Cannot reopen %s to translate layer %s.",
+                  osSrcFilename.c_str(), osSrcLayerName.c_str() );
+        return;
+    }
+
+    GDALDataset* poDstDS = ReopenOutputDataset( poDstDriver,
+                                                osDestFilename,
+                                                psOptions );
+    if( poDstDS == nullptr )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined,
+                  "Cannot reopen %s to translate layer %s.",
+                  osDestFilename.c_str(), osSrcLayerName.c_str() );
+        GDALClose( poSrcDS );
+        return;
+    }
+
+    OGRLayer* poLayer = iSrcLayer >= 0 ?
+                            poSrcDS->GetLayer(iSrcLayer) :
+                            poSrcDS->GetLayerByName(osSrcLayerName);
+    if( poLayer == nullptr )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined,
+                  "Couldn't fetch layer '%s' from reopened datasource.",
+                  osSrcLayerName.c_str() );
+        GDALClose( poDstDS );
+        GDALClose( poSrcDS );
+        return;
+    }
+
+    if( psOptions->pszWHERE != nullptr )
+        poLayer->SetAttributeFilter( psOptions->pszWHERE );
+    ApplySpatialFilter(poLayer,
+                       reinterpret_cast<OGRGeometry*>(psOptions->hSpatialFilter),
+                       poSpatSRS, psOptions->pszGeomField,
+                       poSourceSRS);
+
+    OGRLayer* poPassedLayer = poLayer;
+    if( psOptions->bSplitListFields )
+    {
+        auto poSLFLayer = new OGRSplitListFieldLayer(
+                            poPassedLayer, psOptions->nMaxSplitListSubFields);
+        poPassedLayer = poSLFLayer;
+        if( !poSLFLayer->BuildLayerDefn(nullptr, nullptr) )
+        {
+            delete poPassedLayer;
+            poPassedLayer = poLayer;
+        }
+    }
+
+    oSetup.m_poSrcDS = poSrcDS;
+    oSetup.m_poDstDS = poDstDS;
+    oSetup.m_poOutputSRS = poOutputSRS;
+    oTranslator.m_poSrcDS = poSrcDS;
+    oTranslator.m_poODS = poDstDS;
+    oTranslator.m_poOutputSRS = poOutputSRS;
+    oTranslator.m_poUserSourceSRS = poSourceSRS;
+
+    if( psOptions->nGroupTransactions && !psOptions->nLayerTransaction )
+        poDstDS->StartTransaction(psOptions->bForceTransaction);
+
+    GIntBig nTotalEventsDone = 0;
+    TargetLayerInfo* psInfo = oSetup.Setup(poPassedLayer,
+                                           nullptr,
+                                           psOptions,
+                                           nTotalEventsDone);
+
+    poPassedLayer->ResetReading();
+
+    bSuccess = psInfo != nullptr &&
+        oTranslator.Translate( nullptr, psInfo, nCountLayerFeatures,
+                               nullptr, nTotalEventsDone,
+                               psProgress->pfnProgress ? Progress : nullptr,
+                               this, psOptions ) != 0;
+
+    FreeTargetLayerInfo(psInfo);
+
+    if( psOptions->nGroupTransactions && !psOptions->nLayerTransaction )
+    {
+        if( !bSuccess && !psOptions->bSkipFailures )
+            poDstDS->RollbackTransaction();
+        else
+            poDstDS->CommitTransaction();
+    }
+
+    if( poPassedLayer != poLayer )
+        delete poPassedLayer;
+
+    GDALClose( poDstDS );
+    GDALClose( poSrcDS );
+}
+
 /************************************************************************/
 /*                     GDALVectorTranslateCreateCopy()                  */
 /************************************************************************/
@@ -2536,6 +2883,8 @@ GDALDatasetH GDALVectorTranslate( const char *pszDest, GDALDatasetH hDstDS, int
     oTranslator.m_bExplodeCollections = psOptions->bExplodeCollections;
     oTranslator.m_bNativeData = psOptions->bNativeData;
     oTranslator.m_nLimit = psOptions->nLimit;
+    oTranslator.m_nPipelineThreads = psOptions->nPipelineThreads;
+    oTranslator.m_bPipelineUnordered = psOptions->bPipelineUnordered;
 
     if( psOptions->nGroupTransactions )
     {
@@ -3051,98 +3400,242 @@ GDALDatasetH GDALVectorTranslate( const char *pszDest, GDALDatasetH hDstDS, int
             }
         }
 
-        /* Second pass to do the real job */
-        for( int iLayer = 0; iLayer < nLayerCount && nRetCode == 0; iLayer++ )
+        /* Check if layers can be translated concurrently (-layer_threads) */
+        GDALDriver* poOutDriver = poODS->GetDriver();
+        const int nLayerThreads =
+            std::min(psOptions->nLayerThreads, nLayerCount);
+        bool bConcurrentLayers = false;
+        if( nLayerThreads > 1 )
         {
-            OGRLayer        *poLayer = apoLayers[iLayer];
-            if (poLayer == nullptr)
-                continue;
+            if( hDstDS == nullptr && poDS != poODS &&
+                psOptions->pszNewLayerName == nullptr &&
+                poGCPCoordTrans == nullptr &&
+                poDS->GetDriver() != nullptr &&
+                CanTranslateLayersConcurrently(poOutDriver, osDestFilename) )
+            {
+                /* Each job reopens the source datasource. */
+                const char* const apszSrcDrivers[] = {
+                    poDS->GetDriver()->GetDescription(), nullptr };
+                GDALDatasetH hSrcTestDS = GDALOpenEx(
+                    poDS->GetDescription(), GDAL_OF_VECTOR, apszSrcDrivers,
+                    poDS->GetOpenOptions(), nullptr );
+                if( hSrcTestDS != nullptr )
+                {
+                    bConcurrentLayers = true;
+                    GDALClose( hSrcTestDS );
+                }
+            }
+            if( !bConcurrentLayers )
+            {
+                CPLDebug("GDALVectorTranslate",
+                         "-layer_threads ignored: layers cannot be "
+                         "translated concurrently with this source, "
+                         "output driver or options. "
+                         "Translating them sequentially");
+            }
+        }
 
-            GDALProgressFunc pfnProgress = nullptr;
-            void        *pProgressArg = nullptr;
+        CPLWorkerThreadPool oLayerPool;
+        if( bConcurrentLayers &&
+            !oLayerPool.Setup(nLayerThreads, nullptr, nullptr) )
+        {
+            bConcurrentLayers = false;
+        }
 
-            OGRLayer* poPassedLayer = poLayer;
-            if (psOptions->bSplitListFields)
+        if( bConcurrentLayers )
+        {
+            LayerTranslationProgress sProgress;
+            if( psOptions->bDisplayProgress )
+            {
+                sProgress.pfnProgress = psOptions->pfnProgress;
+                sProgress.pProgressData = psOptions->pProgressData;
+            }
+            std::vector<std::unique_ptr<LayerTranslationJob>> apoJobs;
+            std::vector<void*> apJobData;
+            for( int iLayer = 0; iLayer < nLayerCount; iLayer++ )
             {
-                auto poSLFLayer = new OGRSplitListFieldLayer(poPassedLayer, psOptions->nMaxSplitListSubFields);
-                poPassedLayer = poSLFLayer;
+                OGRLayer        *poLayer = apoLayers[iLayer];
+                if (poLayer == nullptr)
+                    continue;
+
+                std::unique_ptr<LayerTranslationJob> poJob(
+                                                    new LayerTranslationJob());
+                poJob->psOptions = psOptions;
+                poJob->oSetup = oSetup;
+                poJob->oTranslator = oTranslator;
+                poJob->osSrcFilename = poDS->GetDescription();
+                poJob->osSrcDriver = poDS->GetDriver()->GetDescription();
+                poJob->papszSrcOpenOptions = poDS->GetOpenOptions();
+                poJob->poDstDriver = poOutDriver;
+                poJob->osDestFilename = osDestFilename;
+                poJob->iSrcLayer =
+                    CSLCount(psOptions->papszLayers) == 0 ? iLayer : -1;
+                poJob->osSrcLayerName = poLayer->GetName();
+                /* Spatial reference objects are not safe to use from */
+                /* several threads at once, so give each job its own copy. */
+                if( oOutputSRSHolder.get() )
+                    poJob->poOutputSRS = oOutputSRSHolder.get()->Clone();
+                if( poSourceSRS )
+                    poJob->poSourceSRS = poSourceSRS->Clone();
+                if( poSpatSRS )
+                    poJob->poSpatSRS = poSpatSRS->Clone();
+                /* Weight the progress of each layer by its feature count */
+                /* when it is known. */
+                poJob->nCountLayerFeatures = anLayerCountFeatures[iLayer];
+                poJob->psProgress = &sProgress;
+                poJob->dfWeight = nCountLayersFeatures != 0 ?
+                    static_cast<double>(anLayerCountFeatures[iLayer]) : 1.0;
+                sProgress.dfTotalWeight += poJob->dfWeight;
+                apJobData.push_back(poJob.get());
+                apoJobs.push_back(std::move(poJob));
+            }
 
-                if (psOptions->bDisplayProgress && psOptions->nMaxSplitListSubFields != 1 &&
-                    nCountLayersFeatures != 0)
+            oLayerPool.SubmitJobs(LayerTranslationJob::Run, apJobData);
+            oLayerPool.WaitCompletion();
+
+            for( const auto& poJob: apoJobs )
+            {
+                for( const auto& oError: poJob->aoErrors )
                 {
-                    pfnProgress = GDALScaledProgress;
-                    pProgressArg =
-                        GDALCreateScaledProgress(nAccCountFeatures * 1.0 / nCountLayersFeatures,
-                                                (nAccCountFeatures + anLayerCountFeatures[iLayer] / 2) * 1.0 / nCountLayersFeatures,
-                                                psOptions->pfnProgress,
-                                                psOptions->pProgressData);
+                    CPLError( oError.eErr, oError.nErrorNum, "%s",
+                              oError.osMsg.c_str() );
                 }
-                else
+                if( !poJob->bSuccess && !psOptions->bSkipFailures )
                 {
-                    pfnProgress = nullptr;
-                    pProgressArg = nullptr;
+                    CPLError( CE_Failure, CPLE_AppDefined,
+                            "Terminating translation prematurely after failed\n"
+                            "translation of layer %s (use -skipfailures to skip errors)",
+                            poJob->osSrcLayerName.c_str() );
+
+                    nRetCode = 1;
                 }
+            }
+            if( sProgress.bStop )
+            {
+                CPLError( CE_Failure, CPLE_UserInterrupt,
+                          "User terminated translation." );
+                nRetCode = 1;
+            }
 
-                int nRet = poSLFLayer->BuildLayerDefn(pfnProgress, pProgressArg);
-                if (!nRet)
+            /* The layers have been written through other datasource handles, */
+            /* so reopen the output datasource to expose them. */
+            if( psOptions->nGroupTransactions &&
+                !psOptions->nLayerTransaction )
+            {
+                poODS->CommitTransaction();
+            }
+            GDALClose( poODS );
+            poODS = ReopenOutputDataset(poOutDriver, osDestFilename, psOptions);
+            if( poODS == nullptr )
+            {
+                CPLError( CE_Failure, CPLE_AppDefined,
+                          "Cannot reopen %s after translation of its layers.",
+                          osDestFilename.c_str() );
+                GDALVectorTranslateOptionsFree(psOptions);
+                delete poGCPCoordTrans;
+                return nullptr;
+            }
+            if( psOptions->nGroupTransactions &&
+                !psOptions->nLayerTransaction )
+            {
+                poODS->StartTransaction(psOptions->bForceTransaction);
+            }
+        }
+        else
+        {
+            /* Second pass to do the real job */
+            for( int iLayer = 0; iLayer < nLayerCount && nRetCode == 0; iLayer++ )
+            {
+                OGRLayer        *poLayer = apoLayers[iLayer];
+                if (poLayer == nullptr)
+                    continue;
+
+                GDALProgressFunc pfnProgress = nullptr;
+                void        *pProgressArg = nullptr;
+
+                OGRLayer* poPassedLayer = poLayer;
+                if (psOptions->bSplitListFields)
                 {
-                    delete poPassedLayer;
-                    poPassedLayer = poLayer;
+                    auto poSLFLayer = new OGRSplitListFieldLayer(poPassedLayer, psOptions->nMaxSplitListSubFields);
+                    poPassedLayer = poSLFLayer;
+
+                    if (psOptions->bDisplayProgress && psOptions->nMaxSplitListSubFields != 1 &&
+                        nCountLayersFeatures != 0)
+                    {
+                        pfnProgress = GDALScaledProgress;
+                        pProgressArg =
+                            GDALCreateScaledProgress(nAccCountFeatures * 1.0 / nCountLayersFeatures,
+                                                    (nAccCountFeatures + anLayerCountFeatures[iLayer] / 2) * 1.0 / nCountLayersFeatures,
+                                                    psOptions->pfnProgress,
+                                                    psOptions->pProgressData);
+                    }
+                    else
+                    {
+                        pfnProgress = nullptr;
+                        pProgressArg = nullptr;
+                    }
+
+                    int nRet = poSLFLayer->BuildLayerDefn(pfnProgress, pProgressArg);
+                    if (!nRet)
+                    {
+                        delete poPassedLayer;
+                        poPassedLayer = poLayer;
+                    }
+
+                    if (psOptions->bDisplayProgress)
+                        GDALDestroyScaledProgress(pProgressArg);
+                    pfnProgress = nullptr;
+                    pProgressArg = nullptr;
                 }
 
                 if (psOptions->bDisplayProgress)
-                    GDALDestroyScaledProgress(pProgressArg);
-                pfnProgress = nullptr;
-                pProgressArg = nullptr;
-            }
-
-            if (psOptions->bDisplayProgress)
-            {
-                if( nCountLayersFeatures != 0 )
                 {
-                    pfnProgress = GDALScaledProgress;
-                    GIntBig nStart = 0;
-                    if (poPassedLayer != poLayer && psOptions->nMaxSplitListSubFields != 1)
-                        nStart = anLayerCountFeatures[iLayer] / 2;
-                    pProgressArg =
-                        GDALCreateScaledProgress((nAccCountFeatures + nStart) * 1.0 / nCountLayersFeatures,
-                                                (nAccCountFeatures + anLayerCountFeatures[iLayer]) * 1.0 / nCountLayersFeatures,
-                                                psOptions->pfnProgress,
-                                                psOptions->pProgressData);
+                    if( nCountLayersFeatures != 0 )
+                    {
+                        pfnProgress = GDALScaledProgress;
+                        GIntBig nStart = 0;
+                        if (poPassedLayer != poLayer && psOptions->nMaxSplitListSubFields != 1)
+                            nStart = anLayerCountFeatures[iLayer] / 2;
+                        pProgressArg =
+                            GDALCreateScaledProgress((nAccCountFeatures + nStart) * 1.0 / nCountLayersFeatures,
+                                                    (nAccCountFeatures + anLayerCountFeatures[iLayer]) * 1.0 / nCountLayersFeatures,
+                                                    psOptions->pfnProgress,
+                                                    psOptions->pProgressData);
+                    }
                 }
-            }
 
-            nAccCountFeatures += anLayerCountFeatures[iLayer];
+                nAccCountFeatures += anLayerCountFeatures[iLayer];
 
-            TargetLayerInfo* psInfo = oSetup.Setup(poPassedLayer,
-                                                   psOptions->pszNewLayerName,
-                                                   psOptions,
-                                                   nTotalEventsDone);
+                TargetLayerInfo* psInfo = oSetup.Setup(poPassedLayer,
+                                                       psOptions->pszNewLayerName,
+                                                       psOptions,
+                                                       nTotalEventsDone);
 
-            poPassedLayer->ResetReading();
+                poPassedLayer->ResetReading();
 
-            if( (psInfo == nullptr ||
-                !oTranslator.Translate( nullptr, psInfo,
-                                        anLayerCountFeatures[iLayer], nullptr,
-                                        nTotalEventsDone,
-                                        pfnProgress, pProgressArg, psOptions ))
-                && !psOptions->bSkipFailures )
-            {
-                CPLError( CE_Failure, CPLE_AppDefined,
-                        "Terminating translation prematurely after failed\n"
-                        "translation of layer %s (use -skipfailures to skip errors)",
-                        poLayer->GetName() );
+                if( (psInfo == nullptr ||
+                    !oTranslator.Translate( nullptr, psInfo,
+                                            anLayerCountFeatures[iLayer], nullptr,
+                                            nTotalEventsDone,
+                                            pfnProgress, pProgressArg, psOptions ))
+                    && !psOptions->bSkipFailures )
+                {
+                    CPLError( CE_Failure, CPLE_AppDefined,
+                            "Terminating translation prematurely after failed\n"
+                            "translation of layer %s (use -skipfailures to skip errors)",
+                            poLayer->GetName() );
 
-                nRetCode = 1;
-            }
+                    nRetCode = 1;
+                }
 
-            FreeTargetLayerInfo(psInfo);
+                FreeTargetLayerInfo(psInfo);
 
-            if (poPassedLayer != poLayer)
-                delete poPassedLayer;
+                if (poPassedLayer != poLayer)
+                    delete poPassedLayer;
 
-            if (psOptions->bDisplayProgress)
-                GDALDestroyScaledProgress(pProgressArg);
+                if (psOptions->bDisplayProgress)
+                    GDALDestroyScaledProgress(pProgressArg);
+            }
         }
     }
 /* -------------------------------------------------------------------- */
@@ -4466,120 +4959,772 @@ static bool SetupCT( TargetLayerInfo* psInfo,
 }
 
 /************************************************************************/
-/*                     LayerTranslator::Translate()                     */
+/*                            GetPartCount()                            */
+/*                                                                      */
+/*      Number of target features built from a source feature: the      */
+/*      number of parts of its geometry with -explodecollections, 1     */
+/*      otherwise.                                                      */
 /************************************************************************/
 
-int LayerTranslator::Translate( OGRFeature* poFeatureIn,
-                                TargetLayerInfo* psInfo,
-                                GIntBig nCountLayerFeatures,
-                                GIntBig* pnReadFeatureCount,
-                                GIntBig& nTotalEventsDone,
-                                GDALProgressFunc pfnProgress,
-                                void *pProgressArg,
-                                GDALVectorTranslateOptions *psOptions )
+static int GetPartCount( OGRFeature* poFeature,
+                         const TargetLayerInfo* psInfo,
+                         bool bExplodeCollections,
+                         int& nParts )
 {
-    const int eGType = m_eGType;
-    OGRSpatialReference* poOutputSRS = m_poOutputSRS;
+    nParts = 0;
+    int nIters = 1;
+    if (bExplodeCollections)
+    {
+        OGRGeometry* poSrcGeometry;
+        if( psInfo->iRequestedSrcGeomField >= 0 )
+            poSrcGeometry = poFeature->GetGeomFieldRef(
+                                    psInfo->iRequestedSrcGeomField);
+        else
+            poSrcGeometry = poFeature->GetGeometryRef();
+        if (poSrcGeometry &&
+            OGR_GT_IsSubClassOf(poSrcGeometry->getGeometryType(), wkbGeometryCollection) )
+        {
+            nParts = poSrcGeometry->toGeometryCollection()->getNumGeometries();
+            nIters = nParts;
+            if (nIters == 0)
+                nIters = 1;
+        }
+    }
+    return nIters;
+}
 
-    OGRLayer *poSrcLayer = psInfo->poSrcLayer;
-    OGRLayer *poDstLayer = psInfo->poDstLayer;
-    int* const panMap = psInfo->panMap;
+/************************************************************************/
+/*                LayerTranslator::TranslateFeaturePart()               */
+/*                                                                      */
+/*      Build the target feature for the iPart(th) part of a source     */
+/*      feature. This does not access the datasets or layers, so it     */
+/*      can be called from worker threads, provided that each of them   */
+/*      uses its own coordinate transformations in psInfo.              */
+/************************************************************************/
+
+void LayerTranslator::TranslateFeaturePart(
+    OGRFeature* poFeature,
+    int iPart,
+    int nParts,
+    const TargetLayerInfo* psInfo,
+    OGRFeatureDefn* poDstFDefn,
+    int nSrcGeomFieldCount,
+    bool bExplodeCollections,
+    OGRSpatialReference* poOutputSRS,
+    const OGRGeometryFactory::TransformWithOptionsCache& oCache,
+    TranslatedFeaturePart& sPart ) const
+{
+    const int eGType = m_eGType;
     const int iSrcZField = psInfo->iSrcZField;
     const bool bPreserveFID = psInfo->bPreserveFID;
-    const int nSrcGeomFieldCount = poSrcLayer->GetLayerDefn()->GetGeomFieldCount();
-    const int nDstGeomFieldCount = poDstLayer->GetLayerDefn()->GetGeomFieldCount();
-    const bool bExplodeCollections = m_bExplodeCollections && nDstGeomFieldCount <= 1;
+    const int nDstGeomFieldCount = poDstFDefn->GetGeomFieldCount();
 
-    if( poOutputSRS == nullptr && !m_bNullifyOutputSRS )
+    OGRFeatureUniquePtr poDstFeature(OGRFeature::CreateFeature(poDstFDefn));
+
+    /* Optimization to avoid duplicating the source geometry in the */
+    /* target feature : we steal it from the source feature for now... */
+    OGRGeometry* poStolenGeometry = nullptr;
+    if( !bExplodeCollections && nSrcGeomFieldCount == 1 &&
+        (nDstGeomFieldCount == 1 ||
+         (nDstGeomFieldCount == 0 && m_poClipSrc)) )
     {
-        if( nSrcGeomFieldCount == 1 )
-        {
-            poOutputSRS = poSrcLayer->GetSpatialRef();
-        }
-        else if( psInfo->iRequestedSrcGeomField > 0 )
-        {
-            poOutputSRS = poSrcLayer->GetLayerDefn()->GetGeomFieldDefn(
-                psInfo->iRequestedSrcGeomField)->GetSpatialRef();
-        }
+        poStolenGeometry = poFeature->StealGeometry();
+    }
+    else if( !bExplodeCollections &&
+             psInfo->iRequestedSrcGeomField >= 0 )
+    {
+        poStolenGeometry = poFeature->StealGeometry(
+            psInfo->iRequestedSrcGeomField);
     }
 
-/* -------------------------------------------------------------------- */
-/*      Transfer features.                                              */
-/* -------------------------------------------------------------------- */
-    if( psOptions->nGroupTransactions )
+    if( nDstGeomFieldCount == 0 && poStolenGeometry && m_poClipSrc )
     {
-        if( psOptions->nLayerTransaction )
+        OGRGeometry* poClipped = poStolenGeometry->Intersection(m_poClipSrc);
+        delete poStolenGeometry;
+        poStolenGeometry = nullptr;
+        if (poClipped == nullptr || poClipped->IsEmpty())
         {
-            if( poDstLayer->StartTransaction() == OGRERR_FAILURE )
-                return false;
+            delete poClipped;
+            return;
         }
+        delete poClipped;
     }
 
-    OGRFeature *poFeature = nullptr;
-    int         nFeaturesInTransaction = 0;
-    GIntBig      nCount = 0; /* written + failed */
-    GIntBig      nFeaturesWritten = 0;
+    if( poDstFeature->SetFrom( poFeature, psInfo->panMap, TRUE ) != OGRERR_NONE )
+    {
+        OGRGeometryFactory::destroyGeometry( poStolenGeometry );
+        sPart.bSetFromFailed = true;
+        return;
+    }
 
-    bool bRet = true;
-    CPLErrorReset();
-    OGRGeometryFactory::TransformWithOptionsCache transformWithOptionsCache;
-    while( true )
+    /* ... and now we can attach the stolen geometry */
+    if( poStolenGeometry )
     {
-        if( m_nLimit >= 0 && psInfo->nFeaturesRead >= m_nLimit )
+        poDstFeature->SetGeometryDirectly(poStolenGeometry);
+    }
+
+    if( bPreserveFID )
+        poDstFeature->SetFID( poFeature->GetFID() );
+    else if( psInfo->iSrcFIDField >= 0 &&
+             poFeature->IsFieldSetAndNotNull(psInfo->iSrcFIDField))
+        poDstFeature->SetFID( poFeature->GetFieldAsInteger64(psInfo->iSrcFIDField) );
+
+    /* Erase native data if asked explicitly */
+    if( !m_bNativeData )
+    {
+        poDstFeature->SetNativeData(nullptr);
+        poDstFeature->SetNativeMediaType(nullptr);
+    }
+
+    for( int iGeom = 0; iGeom < nDstGeomFieldCount; iGeom ++ )
+    {
+        OGRGeometry* poDstGeometry = poDstFeature->StealGeometry(iGeom);
+        if (poDstGeometry == nullptr)
+            continue;
+
+        if (nParts > 0)
         {
-            break;
+            /* For -explodecollections, extract the iPart(th) of the geometry */
+            OGRGeometry* poPart = poDstGeometry->toGeometryCollection()->getGeometryRef(iPart);
+            poDstGeometry->toGeometryCollection()->removeGeometry(iPart, FALSE);
+            delete poDstGeometry;
+            poDstGeometry = poPart;
+            assert(poDstGeometry);
         }
 
-        if( poFeatureIn != nullptr )
-            poFeature = poFeatureIn;
-        else if( psOptions->nFIDToFetch != OGRNullFID )
-            poFeature = poSrcLayer->GetFeature(psOptions->nFIDToFetch);
-        else
-            poFeature = poSrcLayer->GetNextFeature();
+        if (iSrcZField != -1)
+        {
+            SetZ(poDstGeometry, poFeature->GetFieldAsDouble(iSrcZField));
+            /* This will correct the coordinate dimension to 3 */
+            OGRGeometry* poDupGeometry = poDstGeometry->clone();
+            delete poDstGeometry;
+            poDstGeometry = poDupGeometry;
+        }
 
-        if( poFeature == nullptr )
+        if (m_nCoordDim == 2 || m_nCoordDim == 3)
+        {
+            poDstGeometry->setCoordinateDimension( m_nCoordDim );
+        }
+        else if (m_nCoordDim == 4)
+        {
+            poDstGeometry->set3D( TRUE );
+            poDstGeometry->setMeasured( TRUE );
+        }
+        else if (m_nCoordDim == COORD_DIM_XYM)
+        {
+            poDstGeometry->set3D( FALSE );
+            poDstGeometry->setMeasured( TRUE );
+        }
+        else if ( m_nCoordDim == COORD_DIM_LAYER_DIM )
+        {
+            const OGRwkbGeometryType eDstLayerGeomType =
+              poDstFDefn->GetGeomFieldDefn(iGeom)->GetType();
+            poDstGeometry->set3D( wkbHasZ(eDstLayerGeomType) );
+            poDstGeometry->setMeasured( wkbHasM(eDstLayerGeomType) );
+        }
+
+        if (m_eGeomOp == GEOMOP_SEGMENTIZE)
+        {
+            if (m_dfGeomOpParam > 0)
+                poDstGeometry->segmentize(m_dfGeomOpParam);
+        }
+        else if (m_eGeomOp == GEOMOP_SIMPLIFY_PRESERVE_TOPOLOGY)
         {
-            if( CPLGetLastErrorType() == CE_Failure )
+            if (m_dfGeomOpParam > 0)
             {
-                bRet = false;
+                OGRGeometry* poNewGeom = poDstGeometry->SimplifyPreserveTopology(m_dfGeomOpParam);
+                if (poNewGeom)
+                {
+                    delete poDstGeometry;
+                    poDstGeometry = poNewGeom;
+                }
             }
+        }
+
+        if (m_poClipSrc)
+        {
+            OGRGeometry* poClipped = poDstGeometry->Intersection(m_poClipSrc);
+            delete poDstGeometry;
+            if (poClipped == nullptr || poClipped->IsEmpty())
+            {
+                delete poClipped;
+                return;
+            }
+            poDstGeometry = poClipped;
+        }
+
+        OGRCoordinateTransformation* poCT = psInfo->papoCT[iGeom];
+        char** papszTransformOptions = psInfo->papapszTransformOptions[iGeom];
+
+        if( poCT != nullptr || papszTransformOptions != nullptr)
+        {
+            OGRGeometry* poReprojectedGeom =
+                OGRGeometryFactory::transformWithOptions(
+                    poDstGeometry, poCT, papszTransformOptions, oCache);
+            /* Reported by the caller, which decides whether to go on */
+            if( poReprojectedGeom == nullptr )
+                sPart.nReprojectFailures ++;
+
+            delete poDstGeometry;
+            poDstGeometry = poReprojectedGeom;
+        }
+        else if (poOutputSRS != nullptr)
+        {
+            poDstGeometry->assignSpatialReference(poOutputSRS);
+        }
+
+        if (m_poClipDst)
+        {
+            if( poDstGeometry == nullptr )
+                return;
+
+            OGRGeometry* poClipped = poDstGeometry->Intersection(m_poClipDst);
+            delete poDstGeometry;
+            if (poClipped == nullptr || poClipped->IsEmpty())
+            {
+                delete poClipped;
+                return;
+            }
+
+            poDstGeometry = poClipped;
+        }
+
+        if( eGType != GEOMTYPE_UNCHANGED )
+        {
+            poDstGeometry = OGRGeometryFactory::forceTo(
+                    poDstGeometry, static_cast<OGRwkbGeometryType>(eGType));
+        }
+        else if( m_eGeomTypeConversion == GTC_PROMOTE_TO_MULTI ||
+                 m_eGeomTypeConversion == GTC_CONVERT_TO_LINEAR ||
+                 m_eGeomTypeConversion == GTC_CONVERT_TO_CURVE )
+        {
+            if( poDstGeometry != nullptr )
+            {
+                OGRwkbGeometryType eTargetType = poDstGeometry->getGeometryType();
+                eTargetType = ConvertType(m_eGeomTypeConversion, eTargetType);
+                poDstGeometry = OGRGeometryFactory::forceTo(poDstGeometry, eTargetType);
+            }
+        }
+
+        poDstFeature->SetGeomFieldDirectly(iGeom, poDstGeometry);
+    }
+
+    sPart.poDstFeature = std::move(poDstFeature);
+}
+
+/************************************************************************/
+/*                        LayerTranslatorPipeline                       */
+/*                                                                      */
+/*      Translation of the features of a layer by worker threads        */
+/*      (-pipeline_threads). The calling thread keeps reading the       */
+/*      source layer and writing the target layer, since drivers are    */
+/*      generally not thread-safe and both may belong to the same       */
+/*      dataset. Source features are read by chunks, queued to the      */
+/*      workers, and translated chunks are handed back in reading       */
+/*      order, or as soon as they are ready with -pipeline_unordered.   */
+/*      The number of chunks in flight is bounded.                      */
+/************************************************************************/
+
+class LayerTranslatorPipeline
+{
+    CPL_DISALLOW_COPY_ASSIGN(LayerTranslatorPipeline)
+
+    struct Chunk
+    {
+        GIntBig                                          nSeq = 0;
+        std::vector<OGRFeature*>                         apoSrcFeatures{};
+        std::vector<std::vector<TranslatedFeaturePart>>  aasParts{};
+
+        ~Chunk()
+        {
+            for( auto poFeature: apoSrcFeatures )
+                OGRFeature::DestroyFeature(poFeature);
+        }
+    };
+
+    struct Worker
+    {
+        LayerTranslatorPipeline *poPipeline = nullptr;
+        CPLJoinableThread       *hThread = nullptr;
+        /* Copy of the TargetLayerInfo of the layer, with its own */
+        /* coordinate transformations. */
+        TargetLayerInfo          sInfo{};
+    };
+
+    static constexpr size_t CHUNK_SIZE = 64;
+
+    const LayerTranslator   *m_poTranslator;
+    TargetLayerInfo         *m_psInfo;
+    OGRSpatialReference     *m_poOutputSRS;
+    OGRFeatureDefn          *m_poDstFDefn;
+    int                      m_nSrcGeomFieldCount;
+    bool                     m_bExplodeCollections;
+
+    std::vector<std::unique_ptr<Worker>> m_apoWorkers{};
+    OGRFeature              *m_poFirstFeature = nullptr;
+
+    /* Protected by m_hMutex */
+    CPLMutex                *m_hMutex = nullptr;
+    CPLCond                 *m_hCondInput = nullptr;
+    CPLCond                 *m_hCondOutput = nullptr;
+    bool                     m_bStop = false;
+    int                      m_nWorkersStarting = 0;
+    int                      m_nWorkersFailed = 0;
+    std::deque<Chunk*>       m_apoInputChunks{};
+    std::map<GIntBig, Chunk*> m_oOutputChunks{};
+
+    /* Only used by the calling thread */
+    GIntBig                  m_nNextSeqToRead = 0;
+    GIntBig                  m_nNextSeqToWrite = 0;
+    int                      m_nChunksInFlight = 0;
+    bool                     m_bEOF = false;
+    bool                     m_bReadFailed = false;
+    std::unique_ptr<Chunk>   m_poCurChunk{};
+    size_t                   m_iCurFeature = 0;
+
+    static void WorkerThreadFunction( void* pData );
+    void        TranslateChunk( Worker* psWorker, Chunk* poChunk,
+                                const OGRGeometryFactory::TransformWithOptionsCache& oCache );
+    void        ReadChunk( OGRFeature* poFirstFeature );
+    void        Stop();
+
+public:
+    LayerTranslatorPipeline( const LayerTranslator* poTranslator,
+                             TargetLayerInfo* psInfo,
+                             OGRSpatialReference* poOutputSRS,
+                             int nSrcGeomFieldCount,
+                             bool bExplodeCollections ) :
+        m_poTranslator(poTranslator),
+        m_psInfo(psInfo),
+        m_poOutputSRS(poOutputSRS),
+        m_poDstFDefn(psInfo->poDstLayer->GetLayerDefn()),
+        m_nSrcGeomFieldCount(nSrcGeomFieldCount),
+        m_bExplodeCollections(bExplodeCollections)
+    {}
+    ~LayerTranslatorPipeline();
+
+    bool        Start( OGRFeature* poFirstFeature );
+    bool        GetNextFeature( OGRFeature*& poFeature,
+                                std::vector<TranslatedFeaturePart>& asParts );
+    bool        HasReadFailed() const { return m_bReadFailed; }
+};
+
+/************************************************************************/
+/*                 LayerTranslatorPipeline::~LayerTranslatorPipeline()  */
+/************************************************************************/
+
+LayerTranslatorPipeline::~LayerTranslatorPipeline()
+{
+    Stop();
+    if( m_hCondInput )
+        CPLDestroyCond(m_hCondInput);
+    if( m_hCondOutput )
+        CPLDestroyCond(m_hCondOutput);
+    if( m_hMutex )
+        CPLDestroyMutex(m_hMutex);
+}
+
+/************************************************************************/
+/*                    LayerTranslatorPipeline::Start()                  */
+/*                                                                      */
+/*      Start the worker threads, and queue the first feature (already  */
+/*      read by the caller) with the next ones. On failure, the caller  */
+/*      keeps the ownership of the first feature.                       */
+/************************************************************************/
+
+bool LayerTranslatorPipeline::Start( OGRFeature* poFirstFeature )
+{
+    m_hMutex = CPLCreateMutex();
+    if( m_hMutex == nullptr )
+        return false;
+    CPLReleaseMutex(m_hMutex);
+    m_hCondInput = CPLCreateCond();
+    m_hCondOutput = CPLCreateCond();
+    if( m_hCondInput == nullptr || m_hCondOutput == nullptr )
+        return false;
+
+    const int nDstGeomFieldCount = m_poDstFDefn->GetGeomFieldCount();
+    m_poFirstFeature = poFirstFeature;
+    for( int i = 0; i < m_poTranslator->m_nPipelineThreads; i++ )
+    {
+        std::unique_ptr<Worker> poWorker(new Worker());
+        poWorker->poPipeline = this;
+        poWorker->sInfo = *m_psInfo;
+        poWorker->sInfo.nFeaturesRead = 0;
+        poWorker->sInfo.papoCT = static_cast<OGRCoordinateTransformation **>(
+            CPLCalloc(nDstGeomFieldCount, sizeof(OGRCoordinateTransformation*)));
+        poWorker->sInfo.papapszTransformOptions = static_cast<char ***>(
+            CPLCalloc(nDstGeomFieldCount, sizeof(char**)));
+
+        CPLAcquireMutex(m_hMutex, 1000.0);
+        m_nWorkersStarting ++;
+        CPLReleaseMutex(m_hMutex);
+        poWorker->hThread =
+            CPLCreateJoinableThread(WorkerThreadFunction, poWorker.get());
+        if( poWorker->hThread == nullptr )
+        {
+            CPLAcquireMutex(m_hMutex, 1000.0);
+            m_nWorkersStarting --;
+            m_nWorkersFailed ++;
+            CPLReleaseMutex(m_hMutex);
+        }
+        m_apoWorkers.push_back(std::move(poWorker));
+    }
+
+    /* Wait for the workers to have set up their coordinate transformations */
+    CPLAcquireMutex(m_hMutex, 1000.0);
+    while( m_nWorkersStarting > 0 )
+        CPLCondWait(m_hCondOutput, m_hMutex);
+    const bool bOK = m_nWorkersFailed == 0;
+    CPLReleaseMutex(m_hMutex);
+    m_poFirstFeature = nullptr;
+
+    if( !bOK )
+    {
+        CPLDebug("GDALVectorTranslate",
+                 "Cannot start translation threads. Going on sequentially");
+        Stop();
+        return false;
+    }
+
+    ReadChunk(poFirstFeature);
+    return true;
+}
+
+/************************************************************************/
+/*                    LayerTranslatorPipeline::Stop()                   */
+/************************************************************************/
+
+void LayerTranslatorPipeline::Stop()
+{
+    if( m_hMutex != nullptr && m_hCondInput != nullptr )
+    {
+        CPLAcquireMutex(m_hMutex, 1000.0);
+        m_bStop = true;
+        CPLCondBroadcast(m_hCondInput);
+        CPLReleaseMutex(m_hMutex);
+    }
+
+    const int nDstGeomFieldCount = m_poDstFDefn->GetGeomFieldCount();
+    for( auto& poWorker: m_apoWorkers )
+    {
+        if( poWorker->hThread )
+            CPLJoinThread(poWorker->hThread);
+        for( int i = 0; i < nDstGeomFieldCount; i++ )
+        {
+            delete poWorker->sInfo.papoCT[i];
+            CSLDestroy(poWorker->sInfo.papapszTransformOptions[i]);
+        }
+        CPLFree(poWorker->sInfo.papoCT);
+        CPLFree(poWorker->sInfo.papapszTransformOptions);
+    }
+    m_apoWorkers.clear();
+
+    for( auto poChunk: m_apoInputChunks )
+        delete poChunk;
+    m_apoInputChunks.clear();
+    for( auto& oIter: m_oOutputChunks )
+        delete oIter.second;
+    m_oOutputChunks.clear();
+    m_poCurChunk.reset();
+}
+
+/************************************************************************/
+/*             LayerTranslatorPipeline::WorkerThreadFunction()          */
+/************************************************************************/
+
+void LayerTranslatorPipeline::WorkerThreadFunction( void* pData )
+{
+    Worker* psWorker = static_cast<Worker*>(pData);
+    LayerTranslatorPipeline* poThis = psWorker->poPipeline;
+    const LayerTranslator* poTranslator = poThis->m_poTranslator;
+
+    /* The coordinate transformations are created in this thread, so that */
+    /* PROJ objects are bound to its context. This is serialized, since */
+    /* SetupCT() queries the source and target layers. */
+    CPLAcquireMutex(poThis->m_hMutex, 1000.0);
+    const bool bOK = SetupCT( &psWorker->sInfo, poThis->m_psInfo->poSrcLayer,
+                              poTranslator->m_bTransform,
+                              poTranslator->m_bWrapDateline,
+                              poTranslator->m_osDateLineOffset,
+                              poTranslator->m_poUserSourceSRS,
+                              poThis->m_poFirstFeature,
+                              poThis->m_poOutputSRS,
+                              nullptr );
+    if( !bOK )
+        poThis->m_nWorkersFailed ++;
+    poThis->m_nWorkersStarting --;
+    CPLCondSignal(poThis->m_hCondOutput);
+
+    OGRGeometryFactory::TransformWithOptionsCache oCache;
+    while( bOK )
+    {
+        while( poThis->m_apoInputChunks.empty() && !poThis->m_bStop )
+            CPLCondWait(poThis->m_hCondInput, poThis->m_hMutex);
+        if( poThis->m_bStop )
             break;
+        Chunk* poChunk = poThis->m_apoInputChunks.front();
+        poThis->m_apoInputChunks.pop_front();
+        CPLReleaseMutex(poThis->m_hMutex);
+
+        poThis->TranslateChunk(psWorker, poChunk, oCache);
+
+        CPLAcquireMutex(poThis->m_hMutex, 1000.0);
+        poThis->m_oOutputChunks[poChunk->nSeq] = poChunk;
+        CPLCondSignal(poThis->m_hCondOutput);
+    }
+    CPLReleaseMutex(poThis->m_hMutex);
+}
+
+/************************************************************************/
+/*                LayerTranslatorPipeline::TranslateChunk()             */
+/************************************************************************/
+
+void LayerTranslatorPipeline::TranslateChunk(
+    Worker* psWorker, Chunk* poChunk,
+    const OGRGeometryFactory::TransformWithOptionsCache& oCache )
+{
+    poChunk->aasParts.resize(poChunk->apoSrcFeatures.size());
+    for( size_t i = 0; i < poChunk->apoSrcFeatures.size(); i++ )
+    {
+        OGRFeature* poFeature = poChunk->apoSrcFeatures[i];
+        int nParts = 0;
+        const int nIters = GetPartCount(poFeature, &psWorker->sInfo,
+                                        m_bExplodeCollections, nParts);
+        std::vector<TranslatedFeaturePart>& asParts = poChunk->aasParts[i];
+        asParts.resize(nIters);
+        for( int iPart = 0; iPart < nIters; iPart++ )
+        {
+            m_poTranslator->TranslateFeaturePart(
+                poFeature, iPart, nParts, &psWorker->sInfo, m_poDstFDefn,
+                m_nSrcGeomFieldCount, m_bExplodeCollections, m_poOutputSRS,
+                oCache, asParts[iPart]);
         }
+    }
+}
+
+/************************************************************************/
+/*                  LayerTranslatorPipeline::ReadChunk()                */
+/************************************************************************/
 
-        if( psInfo->nFeaturesRead == 0 || psInfo->bPerFeatureCT )
+void LayerTranslatorPipeline::ReadChunk( OGRFeature* poFirstFeature )
+{
+    std::unique_ptr<Chunk> poChunk(new Chunk());
+    poChunk->nSeq = m_nNextSeqToRead;
+    if( poFirstFeature )
+        poChunk->apoSrcFeatures.push_back(poFirstFeature);
+
+    const GIntBig nLimit = m_poTranslator->m_nLimit;
+    while( poChunk->apoSrcFeatures.size() < CHUNK_SIZE )
+    {
+        if( nLimit >= 0 && m_psInfo->nFeaturesRead >= nLimit )
+        {
+            m_bEOF = true;
+            break;
+        }
+        OGRFeature* poFeature = m_psInfo->poSrcLayer->GetNextFeature();
+        if( poFeature == nullptr )
+        {
+            m_bReadFailed = CPLGetLastErrorType() == CE_Failure;
+            m_bEOF = true;
+            break;
+        }
+        m_psInfo->nFeaturesRead ++;
+        poChunk->apoSrcFeatures.push_back(poFeature);
+    }
+    if( poChunk->apoSrcFeatures.empty() )
+        return;
+
+    m_nNextSeqToRead ++;
+    m_nChunksInFlight ++;
+    CPLAcquireMutex(m_hMutex, 1000.0);
+    m_apoInputChunks.push_back(poChunk.release());
+    CPLCondSignal(m_hCondInput);
+    CPLReleaseMutex(m_hMutex);
+}
+
+/************************************************************************/
+/*                LayerTranslatorPipeline::GetNextFeature()             */
+/*                                                                      */
+/*      Return the next source feature, with its translated parts.      */
+/************************************************************************/
+
+bool LayerTranslatorPipeline::GetNextFeature(
+    OGRFeature*& poFeature, std::vector<TranslatedFeaturePart>& asParts )
+{
+    while( true )
+    {
+        if( m_poCurChunk &&
+            m_iCurFeature < m_poCurChunk->apoSrcFeatures.size() )
+        {
+            poFeature = m_poCurChunk->apoSrcFeatures[m_iCurFeature];
+            m_poCurChunk->apoSrcFeatures[m_iCurFeature] = nullptr;
+            asParts = std::move(m_poCurChunk->aasParts[m_iCurFeature]);
+            m_iCurFeature ++;
+            return true;
+        }
+        m_poCurChunk.reset();
+
+        const int nMaxChunksInFlight = 4 * static_cast<int>(m_apoWorkers.size());
+        while( !m_bEOF && m_nChunksInFlight < nMaxChunksInFlight )
+            ReadChunk(nullptr);
+        if( m_nChunksInFlight == 0 )
+            return false;
+
+        CPLAcquireMutex(m_hMutex, 1000.0);
+        while( true )
         {
-            if( !SetupCT( psInfo, poSrcLayer, m_bTransform, m_bWrapDateline,
-                          m_osDateLineOffset, m_poUserSourceSRS,
-                          poFeature, poOutputSRS, m_poGCPCoordTrans) )
+            if( !m_oOutputChunks.empty() )
             {
-                OGRFeature::DestroyFeature( poFeature );
-                return false;
+                auto oIter = m_oOutputChunks.begin();
+                if( m_poTranslator->m_bPipelineUnordered ||
+                    oIter->first == m_nNextSeqToWrite )
+                {
+                    m_poCurChunk.reset(oIter->second);
+                    m_oOutputChunks.erase(oIter);
+                    break;
+                }
             }
+            CPLCondWait(m_hCondOutput, m_hMutex);
+        }
+        CPLReleaseMutex(m_hMutex);
+        m_nNextSeqToWrite ++;
+        m_nChunksInFlight --;
+        m_iCurFeature = 0;
+    }
+}
+
+/************************************************************************/
+/*                     LayerTranslator::Translate()                     */
+/************************************************************************/
+
+int LayerTranslator::Translate( OGRFeature* poFeatureIn,
+                                TargetLayerInfo* psInfo,
+                                GIntBig nCountLayerFeatures,
+                                GIntBig* pnReadFeatureCount,
+                                GIntBig& nTotalEventsDone,
+                                GDALProgressFunc pfnProgress,
+                                void *pProgressArg,
+                                GDALVectorTranslateOptions *psOptions )
+{
+    OGRSpatialReference* poOutputSRS = m_poOutputSRS;
+
+    OGRLayer *poSrcLayer = psInfo->poSrcLayer;
+    OGRLayer *poDstLayer = psInfo->poDstLayer;
+    const bool bPreserveFID = psInfo->bPreserveFID;
+    const int nSrcGeomFieldCount = poSrcLayer->GetLayerDefn()->GetGeomFieldCount();
+    OGRFeatureDefn* poDstFDefn = poDstLayer->GetLayerDefn();
+    const int nDstGeomFieldCount = poDstFDefn->GetGeomFieldCount();
+    const bool bExplodeCollections = m_bExplodeCollections && nDstGeomFieldCount <= 1;
+
+    if( poOutputSRS == nullptr && !m_bNullifyOutputSRS )
+    {
+        if( nSrcGeomFieldCount == 1 )
+        {
+            poOutputSRS = poSrcLayer->GetSpatialRef();
+        }
+        else if( psInfo->iRequestedSrcGeomField > 0 )
+        {
+            poOutputSRS = poSrcLayer->GetLayerDefn()->GetGeomFieldDefn(
+                psInfo->iRequestedSrcGeomField)->GetSpatialRef();
+        }
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Transfer features.                                              */
+/* -------------------------------------------------------------------- */
+    if( psOptions->nGroupTransactions )
+    {
+        if( psOptions->nLayerTransaction )
+        {
+            if( poDstLayer->StartTransaction() == OGRERR_FAILURE )
+                return false;
         }
+    }
 
-        psInfo->nFeaturesRead ++;
+    OGRFeature *poFeature = nullptr;
+    int         nFeaturesInTransaction = 0;
+    GIntBig      nCount = 0; /* written + failed */
+    GIntBig      nFeaturesWritten = 0;
+    std::unique_ptr<LayerTranslatorPipeline> poPipeline;
 
+    bool bRet = true;
+    CPLErrorReset();
+    OGRGeometryFactory::TransformWithOptionsCache transformWithOptionsCache;
+    while( true )
+    {
+        std::vector<TranslatedFeaturePart> asParts;
         int nParts = 0;
         int nIters = 1;
-        if (bExplodeCollections)
+        if( poPipeline )
         {
-            OGRGeometry* poSrcGeometry;
-            if( psInfo->iRequestedSrcGeomField >= 0 )
-                poSrcGeometry = poFeature->GetGeomFieldRef(
-                                        psInfo->iRequestedSrcGeomField);
+            if( !poPipeline->GetNextFeature(poFeature, asParts) )
+            {
+                if( poPipeline->HasReadFailed() )
+                {
+                    bRet = false;
+                }
+                break;
+            }
+            nIters = static_cast<int>(asParts.size());
+        }
+        else
+        {
+            if( m_nLimit >= 0 && psInfo->nFeaturesRead >= m_nLimit )
+            {
+                break;
+            }
+
+            if( poFeatureIn != nullptr )
+                poFeature = poFeatureIn;
+            else if( psOptions->nFIDToFetch != OGRNullFID )
+                poFeature = poSrcLayer->GetFeature(psOptions->nFIDToFetch);
             else
-                poSrcGeometry = poFeature->GetGeometryRef();
-            if (poSrcGeometry &&
-                OGR_GT_IsSubClassOf(poSrcGeometry->getGeometryType(), wkbGeometryCollection) )
+                poFeature = poSrcLayer->GetNextFeature();
+
+            if( poFeature == nullptr )
+            {
+                if( CPLGetLastErrorType() == CE_Failure )
+                {
+                    bRet = false;
+                }
+                break;
+            }
+
+            if( psInfo->nFeaturesRead == 0 || psInfo->bPerFeatureCT )
+            {
+                if( !SetupCT( psInfo, poSrcLayer, m_bTransform, m_bWrapDateline,
+                              m_osDateLineOffset, m_poUserSourceSRS,
+                              poFeature, poOutputSRS, m_poGCPCoordTrans) )
+                {
+                    OGRFeature::DestroyFeature( poFeature );
+                    return false;
+                }
+            }
+
+            psInfo->nFeaturesRead ++;
+
+            /* Now that the coordinate transformations are known, hand over */
+            /* the translation of the features to worker threads if asked. */
+            /* GCP transformers are shared, and per-feature CTs are set up */
+            /* in this thread, so those cases stay sequential. */
+            if( m_nPipelineThreads > 1 && psInfo->nFeaturesRead == 1 &&
+                poFeatureIn == nullptr &&
+                psOptions->nFIDToFetch == OGRNullFID &&
+                !psInfo->bPerFeatureCT && m_poGCPCoordTrans == nullptr )
             {
-                nParts = poSrcGeometry->toGeometryCollection()->getNumGeometries();
-                nIters = nParts;
-                if (nIters == 0)
-                    nIters = 1;
+                poPipeline.reset(new LayerTranslatorPipeline(
+                    this, psInfo, poOutputSRS, nSrcGeomFieldCount,
+                    bExplodeCollections));
+                if( poPipeline->Start(poFeature) )
+                    continue;
+                poPipeline.reset();
             }
+
+            nIters = GetPartCount(poFeature, psInfo, bExplodeCollections,
+                                  nParts);
         }
 
-        OGRFeature *poDstFeature = nullptr;
         for(int iPart = 0; iPart < nIters; iPart++)
         {
             if( psOptions->nLayerTransaction &&
@@ -4607,38 +5752,21 @@ int LayerTranslator::Translate( OGRFeature* poFeatureIn,
             }
 
             CPLErrorReset();
-            poDstFeature = OGRFeature::CreateFeature( poDstLayer->GetLayerDefn() );
-
-            /* Optimization to avoid duplicating the source geometry in the */
-            /* target feature : we steal it from the source feature for now... */
-            OGRGeometry* poStolenGeometry = nullptr;
-            if( !bExplodeCollections && nSrcGeomFieldCount == 1 &&
-                (nDstGeomFieldCount == 1 ||
-                 (nDstGeomFieldCount == 0 && m_poClipSrc)) )
+            TranslatedFeaturePart sPart;
+            if( poPipeline )
             {
-                poStolenGeometry = poFeature->StealGeometry();
+                sPart = std::move(asParts[iPart]);
             }
-            else if( !bExplodeCollections &&
-                     psInfo->iRequestedSrcGeomField >= 0 )
-            {
-                poStolenGeometry = poFeature->StealGeometry(
-                    psInfo->iRequestedSrcGeomField);
-            }
-
-            if( nDstGeomFieldCount == 0 && poStolenGeometry && m_poClipSrc )
+            else
             {
-                OGRGeometry* poClipped = poStolenGeometry->Intersection(m_poClipSrc);
-                delete poStolenGeometry;
-                poStolenGeometry = nullptr;
-                if (poClipped == nullptr || poClipped->IsEmpty())
-                {
-                    delete poClipped;
-                    goto end_loop;
-                }
-                delete poClipped;
+                TranslateFeaturePart( poFeature, iPart, nParts, psInfo,
+                                      poDstFDefn, nSrcGeomFieldCount,
+                                      bExplodeCollections, poOutputSRS,
+                                      transformWithOptionsCache, sPart );
             }
+            OGRFeature *poDstFeature = sPart.poDstFeature.release();
 
-            if( poDstFeature->SetFrom( poFeature, panMap, TRUE ) != OGRERR_NONE )
+            if( sPart.bSetFromFailed )
             {
                 if( psOptions->nGroupTransactions )
                 {
@@ -4647,8 +5775,6 @@ int LayerTranslator::Translate( OGRFeature* poFeatureIn,
                         if( poDstLayer->CommitTransaction() != OGRERR_NONE )
                         {
                             OGRFeature::DestroyFeature( poFeature );
-                            OGRFeature::DestroyFeature( poDstFeature );
-                            OGRGeometryFactory::destroyGeometry( poStolenGeometry );
                             return false;
                         }
                     }
@@ -4659,187 +5785,39 @@ int LayerTranslator::Translate( OGRFeature* poFeatureIn,
                         poFeature->GetFID(), poSrcLayer->GetName() );
 
                 OGRFeature::DestroyFeature( poFeature );
-                OGRFeature::DestroyFeature( poDstFeature );
-                OGRGeometryFactory::destroyGeometry( poStolenGeometry );
                 return false;
             }
 
-            /* ... and now we can attach the stolen geometry */
-            if( poStolenGeometry )
+            for( int i = 0; i < sPart.nReprojectFailures; i++ )
             {
-                poDstFeature->SetGeometryDirectly(poStolenGeometry);
-            }
-
-            if( bPreserveFID )
-                poDstFeature->SetFID( poFeature->GetFID() );
-            else if( psInfo->iSrcFIDField >= 0 &&
-                     poFeature->IsFieldSetAndNotNull(psInfo->iSrcFIDField))
-                poDstFeature->SetFID( poFeature->GetFieldAsInteger64(psInfo->iSrcFIDField) );
-
-            /* Erase native data if asked explicitly */
-            if( !m_bNativeData )
-            {
-                poDstFeature->SetNativeData(nullptr);
-                poDstFeature->SetNativeMediaType(nullptr);
-            }
-
-            for( int iGeom = 0; iGeom < nDstGeomFieldCount; iGeom ++ )
-            {
-                OGRGeometry* poDstGeometry = poDstFeature->StealGeometry(iGeom);
-                if (poDstGeometry == nullptr)
-                    continue;
-
-                if (nParts > 0)
-                {
-                    /* For -explodecollections, extract the iPart(th) of the geometry */
-                    OGRGeometry* poPart = poDstGeometry->toGeometryCollection()->getGeometryRef(iPart);
-                    poDstGeometry->toGeometryCollection()->removeGeometry(iPart, FALSE);
-                    delete poDstGeometry;
-                    poDstGeometry = poPart;
-                    assert(poDstGeometry);
-                }
-
-                if (iSrcZField != -1)
-                {
-                    SetZ(poDstGeometry, poFeature->GetFieldAsDouble(iSrcZField));
-                    /* This will correct the coordinate dimension to 3 */
-                    OGRGeometry* poDupGeometry = poDstGeometry->clone();
-                    delete poDstGeometry;
-                    poDstGeometry = poDupGeometry;
-                }
-
-                if (m_nCoordDim == 2 || m_nCoordDim == 3)
-                {
-                    poDstGeometry->setCoordinateDimension( m_nCoordDim );
-                }
-                else if (m_nCoordDim == 4)
-                {
-                    poDstGeometry->set3D( TRUE );
-                    poDstGeometry->setMeasured( TRUE );
-                }
-                else if (m_nCoordDim == COORD_DIM_XYM)
-                {
-                    poDstGeometry->set3D( FALSE );
-                    poDstGeometry->setMeasured( TRUE );
-                }
-                else if ( m_nCoordDim == COORD_DIM_LAYER_DIM )
-                {
-                    const OGRwkbGeometryType eDstLayerGeomType =
-                      poDstLayer->GetLayerDefn()->GetGeomFieldDefn(iGeom)->GetType();
-                    poDstGeometry->set3D( wkbHasZ(eDstLayerGeomType) );
-                    poDstGeometry->setMeasured( wkbHasM(eDstLayerGeomType) );
-                }
-
-                if (m_eGeomOp == GEOMOP_SEGMENTIZE)
-                {
-                    if (m_dfGeomOpParam > 0)
-                        poDstGeometry->segmentize(m_dfGeomOpParam);
-                }
-                else if (m_eGeomOp == GEOMOP_SIMPLIFY_PRESERVE_TOPOLOGY)
-                {
-                    if (m_dfGeomOpParam > 0)
-                    {
-                        OGRGeometry* poNewGeom = poDstGeometry->SimplifyPreserveTopology(m_dfGeomOpParam);
-                        if (poNewGeom)
-                        {
-                            delete poDstGeometry;
-                            poDstGeometry = poNewGeom;
-                        }
-                    }
-                }
-
-                if (m_poClipSrc)
-                {
-                    OGRGeometry* poClipped = poDstGeometry->Intersection(m_poClipSrc);
-                    delete poDstGeometry;
-                    if (poClipped == nullptr || poClipped->IsEmpty())
-                    {
-                        delete poClipped;
-                        goto end_loop;
-                    }
-                    poDstGeometry = poClipped;
-                }
-
-                OGRCoordinateTransformation* poCT = psInfo->papoCT[iGeom];
-                char** papszTransformOptions = psInfo->papapszTransformOptions[iGeom];
-
-                if( poCT != nullptr || papszTransformOptions != nullptr)
+                if( psOptions->nGroupTransactions )
                 {
-                    OGRGeometry* poReprojectedGeom =
-                        OGRGeometryFactory::transformWithOptions(
-                            poDstGeometry, poCT, papszTransformOptions, transformWithOptionsCache);
-                    if( poReprojectedGeom == nullptr )
+                    if( psOptions->nLayerTransaction )
                     {
-                        if( psOptions->nGroupTransactions )
-                        {
-                            if( psOptions->nLayerTransaction )
-                            {
-                                if( poDstLayer->CommitTransaction() != OGRERR_NONE &&
-                                    !psOptions->bSkipFailures )
-                                {
-                                    OGRFeature::DestroyFeature( poFeature );
-                                    OGRFeature::DestroyFeature( poDstFeature );
-                                    delete poDstGeometry;
-                                    return false;
-                                }
-                            }
-                        }
-
-                        CPLError( CE_Failure, CPLE_AppDefined, "Failed to reproject feature " CPL_FRMT_GIB " (geometry probably out of source or destination SRS).",
-                                  poFeature->GetFID() );
-                        if( !psOptions->bSkipFailures )
+                        if( poDstLayer->CommitTransaction() != OGRERR_NONE &&
+                            !psOptions->bSkipFailures )
                         {
                             OGRFeature::DestroyFeature( poFeature );
                             OGRFeature::DestroyFeature( poDstFeature );
-                            delete poDstGeometry;
                             return false;
                         }
                     }
-
-                    delete poDstGeometry;
-                    poDstGeometry = poReprojectedGeom;
-                }
-                else if (poOutputSRS != nullptr)
-                {
-                    poDstGeometry->assignSpatialReference(poOutputSRS);
                 }
 
-                if (m_poClipDst)
+                CPLError( CE_Failure, CPLE_AppDefined, "Failed to reproject feature " CPL_FRMT_GIB " (geometry probably out of source or destination SRS).",
+                          poFeature->GetFID() );
+                if( !psOptions->bSkipFailures )
                 {
-                    if( poDstGeometry == nullptr )
-                        goto end_loop;
-
-                    OGRGeometry* poClipped = poDstGeometry->Intersection(m_poClipDst);
-                    delete poDstGeometry;
-                    if (poClipped == nullptr || poClipped->IsEmpty())
-                    {
-                        delete poClipped;
-                        goto end_loop;
-                    }
-
-                    poDstGeometry = poClipped;
-                }
-
-                if( eGType != GEOMTYPE_UNCHANGED )
-                {
-                    poDstGeometry = OGRGeometryFactory::forceTo(
-                            poDstGeometry, static_cast<OGRwkbGeometryType>(eGType));
-                }
-                else if( m_eGeomTypeConversion == GTC_PROMOTE_TO_MULTI ||
-                         m_eGeomTypeConversion == GTC_CONVERT_TO_LINEAR ||
-                         m_eGeomTypeConversion == GTC_CONVERT_TO_CURVE )
-                {
-                    if( poDstGeometry != nullptr )
-                    {
-                        OGRwkbGeometryType eTargetType = poDstGeometry->getGeometryType();
-                        eTargetType = ConvertType(m_eGeomTypeConversion, eTargetType);
-                        poDstGeometry = OGRGeometryFactory::forceTo(poDstGeometry, eTargetType);
-                    }
+                    OGRFeature::DestroyFeature( poFeature );
+                    OGRFeature::DestroyFeature( poDstFeature );
+                    return false;
                 }
-
-                poDstFeature->SetGeomFieldDirectly(iGeom, poDstGeometry);
             }
 
+            /* Skipped, e.g. clipped out */
+            if( poDstFeature == nullptr )
+                continue;
+
             CPLErrorReset();
             if( poDstLayer->CreateFeature( poDstFeature ) == OGRERR_NONE )
             {
@@ -4887,7 +5865,6 @@ int LayerTranslator::Translate( OGRFeature* poFeatureIn,
                 }
             }
 
-end_loop:
             OGRFeature::DestroyFeature( poDstFeature );
         }
 
@@ -5052,6 +6029,9 @@ GDALVectorTranslateOptions *GDALVectorTranslateOptionsNew(char** papszArgv,
     psOptions->hSpatialFilter = nullptr;
     psOptions->bNativeData = true;
     psOptions->nLimit = -1;
+    psOptions->nPipelineThreads = 0;
+    psOptions->nLayerThreads = 0;
+    psOptions->bPipelineUnordered = false;
 
     int nArgc = CSLCount(papszArgv);
     for( int i = 0; papszArgv != nullptr && i < nArgc; i++ )
@@ -5644,6 +6624,26 @@ GDALVectorTranslateOptions *GDALVectorTranslateOptionsNew(char** papszArgv,
         {
             psOptions->nLimit = CPLAtoGIntBig( papszArgv[++i] );
         }
+        else if( i+1 < nArgc && EQUAL(papszArgv[i],"-pipeline_threads") )
+        {
+            ++i;
+            if( EQUAL(papszArgv[i], "ALL_CPUS") )
+                psOptions->nPipelineThreads = CPLGetNumCPUs();
+            else
+                psOptions->nPipelineThreads = atoi(papszArgv[i]);
+        }
+        else if( EQUAL(papszArgv[i],"-pipeline_unordered") )
+        {
+            psOptions->bPipelineUnordered = true;
+        }
+        else if( i+1 < nArgc && EQUAL(papszArgv[i],"-layer_threads") )
+        {
+            ++i;
+            if( EQUAL(papszArgv[i], "ALL_CPUS") )
+                psOptions->nLayerThreads = CPLGetNumCPUs();
+            else
+                psOptions->nLayerThreads = atoi(papszArgv[i]);
+        }
         else if( papszArgv[i][0] == '-' )
         {
             CPLError(CE_Failure, CPLE_NotSupported,
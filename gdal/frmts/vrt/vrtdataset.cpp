@@ -1328,6 +1328,10 @@ int VRTDataset::CheckCompatibleForDatasetIO()
         if( typeid(*poBand) != typeid(VRTSourcedRasterBand) )
             return FALSE;
 
+        // Dataset level requests would need all the sources to be parsed.
+        if( poBand->HasDeferredSources() )
+            return FALSE;
+
         if( iBand == 0 )
         {
             nSources = poBand->nSources;
@@ -1689,15 +1693,21 @@ CPLErr VRTDataset::IRasterIO( GDALRWFlag eRWFlag,
         // they don't necessary instantiate all underlying rasterbands.
         VRTSourcedRasterBand* poBand = reinterpret_cast<VRTSourcedRasterBand *>(
             papoBands[nBands - 1] );
-        for( int iSource = 0;
-             eErr == CE_None && iSource < poBand->nSources;
-             iSource++ )
+        std::vector<int> anSources;
+        const bool bUseIndex = poBand->GetSourcesIntersectingWindow(
+            nXOff, nYOff, nXSize, nYSize, anSources);
+        const int nCandidates =
+            bUseIndex ? static_cast<int>(anSources.size()) : poBand->nSources;
+        for( int iCandidate = 0;
+             eErr == CE_None && iCandidate < nCandidates;
+             iCandidate++ )
         {
+            const int iSource = bUseIndex ? anSources[iCandidate] : iCandidate;
             psExtraArg->pfnProgress = GDALScaledProgress;
             psExtraArg->pProgressData =
                 GDALCreateScaledProgress(
-                    1.0 * iSource / poBand->nSources,
-                    1.0 * (iSource + 1) / poBand->nSources,
+                    1.0 * iCandidate / nCandidates,
+                    1.0 * (iCandidate + 1) / nCandidates,
                     pfnProgressGlobal,
                     pProgressDataGlobal );
 
@@ -1744,6 +1754,7 @@ void VRTDataset::UnsetPreservedRelativeFilenames()
 
         VRTSourcedRasterBand* poBand
             = reinterpret_cast<VRTSourcedRasterBand *>( papoBands[iBand] );
+        poBand->ResolveDeferredSources();
         const int nSources = poBand->nSources;
         VRTSource** papoSources = poBand->papoSources;
         for(int iSource = 0; iSource < nSources; iSource++)
@@ -1780,6 +1791,9 @@ void VRTDataset::BuildVirtualOverviews()
 
         VRTSourcedRasterBand* poVRTBand
             = reinterpret_cast<VRTSourcedRasterBand *>( papoBands[iBand] );
+        if( poVRTBand->nSources != 1 )
+            return;
+        poVRTBand->ResolveDeferredSources();
         if( poVRTBand->nSources != 1 )
             return;
         if( !poVRTBand->papoSources[0]->IsSimpleSource() )
@@ -34,6 +34,7 @@
 #ifndef DOXYGEN_SKIP
 
 #include "cpl_hash_set.h"
+#include "cpl_quad_tree.h"
 #include "gdal_pam.h"
 #include "gdal_priv.h"
 #include "gdal_rat.h"
@@ -547,8 +548,30 @@ class CPL_DLL VRTSourcedRasterBand : public VRTRasterBand
     CPLString      m_osLastLocationInfo;
     char         **m_papszSourceList;
 
+    // Lazily built index of the destination windows of the sources.
+    CPLQuadTree   *m_hSourcesQuadTree;
+    bool           m_bSourcesQuadTreeBuilt;
+
+    // Sources whose parsing is deferred until a window touches them. The
+    // corresponding papoSources[] entry is nullptr until then.
+    struct DeferredSource
+    {
+        CPLXMLNode *psTree = nullptr;
+        CPLRectObj  sDstWindow{};
+        // Set once parsing failed, so that the error is emitted only once
+        bool        bFailed = false;
+    };
+    std::vector<DeferredSource> m_aoDeferredSources;
+    int            m_nDeferredSources;
+    CPLString      m_osDeferredSourcesVRTPath;
+    bool           m_bDeferredSourcesVRTPathSet;
+    void          *m_pDeferredSourcesUniqueHandle;
+
     bool           CanUseSourcesMinMaxImplementations();
     void           CheckSource( VRTSimpleSource *poSS );
+    void           InitSource( VRTSource *poNewSource );
+    void           InvalidateSourcesQuadTree();
+    bool           ParseDeferredSource( int iSource );
 
     CPL_DISALLOW_COPY_ASSIGN(VRTSourcedRasterBand)
 
@@ -640,6 +663,16 @@ class CPL_DLL VRTSourcedRasterBand : public VRTRasterBand
                                    double dfDstXOff, double dfDstYOff,
                                    double dfDstXSize, double dfDstYSize );
 
+    bool           GetSourcesIntersectingWindow( int nXOff, int nYOff,
+                                                 int nXSize, int nYSize,
+                                                 std::vector<int>& anSources );
+
+    bool           HasDeferredSources() const { return m_nDeferredSources > 0; }
+    bool           ResolveDeferredSource( int iSource )
+                        { return papoSources[iSource] != nullptr ||
+                                 ParseDeferredSource(iSource); }
+    void           ResolveDeferredSources();
+
     virtual CPLErr IReadBlock( int, int, void * ) override;
 
     virtual void   GetFileList(char*** ppapszFileList, int *pnSize,
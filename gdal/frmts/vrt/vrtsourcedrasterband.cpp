@@ -31,12 +31,16 @@
 #include "gdal_vrt.h"
 #include "vrtdataset.h"
 
+#include <algorithm>
 #include <cmath>
+#include <climits>
 #include <cstddef>
 #include <cstdio>
 #include <cstdlib>
 #include <cstring>
 #include <string>
+#include <typeinfo>
+#include <vector>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
@@ -66,6 +70,11 @@ CPL_CVSID("$Id$")
 VRTSourcedRasterBand::VRTSourcedRasterBand( GDALDataset *poDSIn, int nBandIn ) :
     m_nRecursionCounter(0),
     m_papszSourceList(nullptr),
+    m_hSourcesQuadTree(nullptr),
+    m_bSourcesQuadTreeBuilt(false),
+    m_nDeferredSources(0),
+    m_bDeferredSourcesVRTPathSet(false),
+    m_pDeferredSourcesUniqueHandle(nullptr),
     nSources(0),
     papoSources(nullptr),
     bSkipBufferInitialization(FALSE)
@@ -85,6 +94,11 @@ VRTSourcedRasterBand::VRTSourcedRasterBand( GDALDataType eType,
                                             int nXSize, int nYSize ) :
     m_nRecursionCounter(0),
     m_papszSourceList(nullptr),
+    m_hSourcesQuadTree(nullptr),
+    m_bSourcesQuadTreeBuilt(false),
+    m_nDeferredSources(0),
+    m_bDeferredSourcesVRTPathSet(false),
+    m_pDeferredSourcesUniqueHandle(nullptr),
     nSources(0),
     papoSources(nullptr),
     bSkipBufferInitialization(FALSE)
@@ -103,6 +117,11 @@ VRTSourcedRasterBand::VRTSourcedRasterBand( GDALDataset *poDSIn, int nBandIn,
                                             int nXSize, int nYSize ) :
     m_nRecursionCounter(0),
     m_papszSourceList(nullptr),
+    m_hSourcesQuadTree(nullptr),
+    m_bSourcesQuadTreeBuilt(false),
+    m_nDeferredSources(0),
+    m_bDeferredSourcesVRTPathSet(false),
+    m_pDeferredSourcesUniqueHandle(nullptr),
     nSources(0),
     papoSources(nullptr),
     bSkipBufferInitialization(FALSE)
@@ -124,6 +143,145 @@ VRTSourcedRasterBand::~VRTSourcedRasterBand()
 {
     VRTSourcedRasterBand::CloseDependentDatasets();
     CSLDestroy(m_papszSourceList);
+    InvalidateSourcesQuadTree();
+}
+
+/************************************************************************/
+/*                      InvalidateSourcesQuadTree()                     */
+/************************************************************************/
+
+void VRTSourcedRasterBand::InvalidateSourcesQuadTree()
+{
+    if( m_hSourcesQuadTree )
+        CPLQuadTreeDestroy(m_hSourcesQuadTree);
+    m_hSourcesQuadTree = nullptr;
+    m_bSourcesQuadTreeBuilt = false;
+}
+
+/************************************************************************/
+/*                    GetSourcesIntersectingWindow()                    */
+/************************************************************************/
+
+/* Returns false if the spatial index of sources cannot be used, in which */
+/* case the caller must iterate over all sources. Otherwise anSources     */
+/* receives the indices, in increasing order, of the sources whose        */
+/* destination window may intersect the requested window. Those sources   */
+/* may still be deferred, and must go through ResolveDeferredSource().    */
+
+bool VRTSourcedRasterBand::GetSourcesIntersectingWindow( int nXOff, int nYOff,
+                                                         int nXSize,
+                                                         int nYSize,
+                                                         std::vector<int>& anSources )
+{
+    anSources.clear();
+
+    // Building the index is not worth it for a small number of sources.
+    const int nThreshold = atoi(
+        CPLGetConfigOption("VRT_SOURCES_INDEX_THRESHOLD", "64"));
+    if( nSources == 0 || nSources < nThreshold )
+    {
+        // The caller will iterate over all sources.
+        ResolveDeferredSources();
+        return false;
+    }
+
+    if( !m_bSourcesQuadTreeBuilt )
+    {
+        m_bSourcesQuadTreeBuilt = true;
+
+        // Only simple sources have a known destination window. Other kinds
+        // of sources (e.g. function sources) may contribute to any pixel.
+        // Deferred sources are always simple sources.
+        for( int i = 0; i < nSources; i++ )
+        {
+            if( papoSources[i] != nullptr &&
+                !papoSources[i]->IsSimpleSource() )
+            {
+                ResolveDeferredSources();
+                return false;
+            }
+        }
+
+        CPLRectObj sGlobalBounds;
+        sGlobalBounds.minx = 0;
+        sGlobalBounds.miny = 0;
+        sGlobalBounds.maxx = nRasterXSize;
+        sGlobalBounds.maxy = nRasterYSize;
+        std::vector<CPLRectObj> asBounds(nSources);
+        for( int i = 0; i < nSources; i++ )
+        {
+            CPLRectObj& sBounds = asBounds[i];
+            if( papoSources[i] == nullptr )
+            {
+                sBounds = m_aoDeferredSources[i].sDstWindow;
+                sGlobalBounds.minx = std::min(sGlobalBounds.minx, sBounds.minx);
+                sGlobalBounds.miny = std::min(sGlobalBounds.miny, sBounds.miny);
+                sGlobalBounds.maxx = std::max(sGlobalBounds.maxx, sBounds.maxx);
+                sGlobalBounds.maxy = std::max(sGlobalBounds.maxy, sBounds.maxy);
+                continue;
+            }
+            VRTSimpleSource* poSS =
+                reinterpret_cast<VRTSimpleSource*>(papoSources[i]);
+            const bool bDstWinSet = poSS->m_dfDstXOff != -1 ||
+                                    poSS->m_dfDstXSize != -1 ||
+                                    poSS->m_dfDstYOff != -1 ||
+                                    poSS->m_dfDstYSize != -1;
+            if( bDstWinSet )
+            {
+                sBounds.minx = poSS->m_dfDstXOff;
+                sBounds.miny = poSS->m_dfDstYOff;
+                sBounds.maxx = poSS->m_dfDstXOff + poSS->m_dfDstXSize;
+                sBounds.maxy = poSS->m_dfDstYOff + poSS->m_dfDstYSize;
+            }
+            else
+            {
+                sBounds.minx = 0;
+                sBounds.miny = 0;
+                sBounds.maxx = nRasterXSize;
+                sBounds.maxy = nRasterYSize;
+            }
+            sGlobalBounds.minx = std::min(sGlobalBounds.minx, sBounds.minx);
+            sGlobalBounds.miny = std::min(sGlobalBounds.miny, sBounds.miny);
+            sGlobalBounds.maxx = std::max(sGlobalBounds.maxx, sBounds.maxx);
+            sGlobalBounds.maxy = std::max(sGlobalBounds.maxy, sBounds.maxy);
+        }
+
+        // The features stored in the quadtree are pointers to the elements
+        // of papoSources, so that the source index can be recovered. The
+        // quadtree is invalidated each time papoSources is reallocated.
+        m_hSourcesQuadTree = CPLQuadTreeCreate(&sGlobalBounds, nullptr);
+        CPLQuadTreeSetMaxDepth(m_hSourcesQuadTree,
+                               CPLQuadTreeGetAdvisedMaxDepth(nSources));
+        for( int i = 0; i < nSources; i++ )
+        {
+            CPLQuadTreeInsertWithBounds(m_hSourcesQuadTree,
+                                        &papoSources[i], &asBounds[i]);
+        }
+        CPLDebug("VRT", "Built spatial index of %d sources", nSources);
+    }
+
+    if( m_hSourcesQuadTree == nullptr )
+        return false;
+
+    CPLRectObj sAoi;
+    sAoi.minx = nXOff;
+    sAoi.miny = nYOff;
+    sAoi.maxx = static_cast<double>(nXOff) + nXSize;
+    sAoi.maxy = static_cast<double>(nYOff) + nYSize;
+    int nFeatureCount = 0;
+    void** pahFeatures =
+        CPLQuadTreeSearch(m_hSourcesQuadTree, &sAoi, &nFeatureCount);
+    anSources.reserve(nFeatureCount);
+    for( int i = 0; i < nFeatureCount; i++ )
+    {
+        anSources.push_back( static_cast<int>(
+            static_cast<VRTSource**>(pahFeatures[i]) - papoSources) );
+    }
+    CPLFree(pahFeatures);
+
+    // Sources must be composited in the order they are declared.
+    std::sort(anSources.begin(), anSources.end());
+    return true;
 }
 
 /************************************************************************/
@@ -183,8 +341,16 @@ CPLErr VRTSourcedRasterBand::IRasterIO( GDALRWFlag eRWFlag,
         psExtraArg->eResampleAlg != GRIORA_NearestNeighbour &&
         m_bNoDataValueSet )
     {
-        for( int i = 0; i < nSources; i++ )
+        std::vector<int> anSources;
+        const bool bUseIndex = GetSourcesIntersectingWindow(
+            nXOff, nYOff, nXSize, nYSize, anSources);
+        const int nCandidates =
+            bUseIndex ? static_cast<int>(anSources.size()) : nSources;
+        for( int iCandidate = 0; iCandidate < nCandidates; iCandidate++ )
         {
+            const int i = bUseIndex ? anSources[iCandidate] : iCandidate;
+            if( !ResolveDeferredSource(i) )
+                return CE_Failure;
             bool bFallbackToBase = false;
             if( !papoSources[i]->IsSimpleSource() )
             {
@@ -284,26 +450,42 @@ CPLErr VRTSourcedRasterBand::IRasterIO( GDALRWFlag eRWFlag,
     void * const pProgressDataGlobal = psExtraArg->pProgressData;
 
 /* -------------------------------------------------------------------- */
-/*      Overlay each source in turn over top this.                      */
+/*      Overlay each source in turn over top this. When there are many  */
+/*      sources, only consider the ones intersecting the window.        */
 /* -------------------------------------------------------------------- */
+    std::vector<int> anSources;
+    const bool bUseIndex = GetSourcesIntersectingWindow(
+        nXOff, nYOff, nXSize, nYSize, anSources);
+    const int nCandidates =
+        bUseIndex ? static_cast<int>(anSources.size()) : nSources;
+
     CPLErr eErr = CE_None;
-    for( int iSource = 0; eErr == CE_None && iSource < nSources; iSource++ )
+    for( int iCandidate = 0; eErr == CE_None && iCandidate < nCandidates;
+         iCandidate++ )
     {
+        const int iSource = bUseIndex ? anSources[iCandidate] : iCandidate;
         psExtraArg->pfnProgress = GDALScaledProgress;
         psExtraArg->pProgressData =
-            GDALCreateScaledProgress( 1.0 * iSource / nSources,
-                                      1.0 * (iSource + 1) / nSources,
+            GDALCreateScaledProgress( 1.0 * iCandidate / nCandidates,
+                                      1.0 * (iCandidate + 1) / nCandidates,
                                       pfnProgressGlobal,
                                       pProgressDataGlobal );
         if( psExtraArg->pProgressData == nullptr )
             psExtraArg->pfnProgress = nullptr;
 
-        eErr =
-            papoSources[iSource]->RasterIO( eDataType,
-                                            nXOff, nYOff, nXSize, nYSize,
-                                            pData, nBufXSize, nBufYSize,
-                                            eBufType, nPixelSpace, nLineSpace,
-                                            psExtraArg);
+        if( !ResolveDeferredSource(iSource) )
+        {
+            eErr = CE_Failure;
+        }
+        else
+        {
+            eErr =
+                papoSources[iSource]->RasterIO( eDataType,
+                                                nXOff, nYOff, nXSize, nYSize,
+                                                pData, nBufXSize, nBufYSize,
+                                                eBufType, nPixelSpace,
+                                                nLineSpace, psExtraArg );
+        }
 
         GDALDestroyScaledProgress( psExtraArg->pProgressData );
     }
@@ -354,9 +536,17 @@ int  VRTSourcedRasterBand::IGetDataCoverageStatus( int nXOff,
     poLR->addPoint( nXOff, nYOff );
     poPolyNonCoveredBySources->addRingDirectly(poLR);
 
-    for( int iSource = 0; iSource < nSources; iSource++ )
+    std::vector<int> anSources;
+    const bool bUseIndex = GetSourcesIntersectingWindow(
+        nXOff, nYOff, nXSize, nYSize, anSources);
+    const int nCandidates =
+        bUseIndex ? static_cast<int>(anSources.size()) : nSources;
+
+    for( int iCandidate = 0; iCandidate < nCandidates; iCandidate++ )
     {
-        if( !papoSources[iSource]->IsSimpleSource() )
+        const int iSource = bUseIndex ? anSources[iCandidate] : iCandidate;
+        if( !ResolveDeferredSource(iSource) ||
+            !papoSources[iSource]->IsSimpleSource() )
         {
             delete poPolyNonCoveredBySources;
             return GDAL_DATA_COVERAGE_STATUS_UNIMPLEMENTED |
@@ -477,7 +667,16 @@ bool VRTSourcedRasterBand::CanUseSourcesMinMaxImplementations()
     const char* pszUseSources =
         CPLGetConfigOption("VRT_MIN_MAX_FROM_SOURCES", nullptr);
     if( pszUseSources )
-        return CPLTestBool(pszUseSources);
+    {
+        if( !CPLTestBool(pszUseSources) )
+            return false;
+        ResolveDeferredSources();
+        return true;
+    }
+
+    // Do not parse all the sources of a huge mosaic just for that.
+    if( HasDeferredSources() )
+        return false;
 
     // Use heuristics to determine if we are going to use the source
     // GetMinimum() or GetMaximum() implementation: all the sources must be
@@ -691,6 +890,8 @@ CPLErr VRTSourcedRasterBand::ComputeRasterMinMax( int bApproxOK, double* adfMinM
     }
     m_nRecursionCounter ++;
 
+    ResolveDeferredSources();
+
     adfMinMax[0] = 0.0;
     adfMinMax[1] = 0.0;
     for( int iSource = 0; iSource < nSources; iSource++ )
@@ -730,6 +931,8 @@ VRTSourcedRasterBand::ComputeStatistics( int bApproxOK,
                                          void *pProgressData )
 
 {
+    ResolveDeferredSources();
+
     int bHasNoData = FALSE;
     if( nSources != 1 ||
         (m_bNoDataValueSet && !(
@@ -830,6 +1033,8 @@ CPLErr VRTSourcedRasterBand::GetHistogram( double dfMin, double dfMax,
                                            void *pProgressData )
 
 {
+    ResolveDeferredSources();
+
     if( nSources != 1 )
         return VRTRasterBand::GetHistogram( dfMin, dfMax,
                                              nBuckets, panHistogram,
@@ -902,14 +1107,30 @@ CPLErr VRTSourcedRasterBand::GetHistogram( double dfMin, double dfMax,
 CPLErr VRTSourcedRasterBand::AddSource( VRTSource *poNewSource )
 
 {
+    ResolveDeferredSources();
+
     nSources++;
 
     papoSources = static_cast<VRTSource **>(
         CPLRealloc( papoSources, sizeof(void*) * nSources ) );
     papoSources[nSources-1] = poNewSource;
 
+    InvalidateSourcesQuadTree();
+
     reinterpret_cast<VRTDataset *>( poDS )->SetNeedsFlush();
 
+    InitSource( poNewSource );
+
+    return CE_None;
+}
+
+/************************************************************************/
+/*                             InitSource()                             */
+/************************************************************************/
+
+void VRTSourcedRasterBand::InitSource( VRTSource *poNewSource )
+
+{
     if( poNewSource->IsSimpleSource() )
     {
         VRTSimpleSource* poSS = reinterpret_cast<VRTSimpleSource*>( poNewSource );
@@ -924,8 +1145,91 @@ CPLErr VRTSourcedRasterBand::AddSource( VRTSource *poNewSource )
 
         CheckSource( poSS );
     }
+}
 
-    return CE_None;
+/************************************************************************/
+/*                        ParseDeferredSource()                         */
+/************************************************************************/
+
+bool VRTSourcedRasterBand::ParseDeferredSource( int iSource )
+
+{
+    DeferredSource& oDeferred = m_aoDeferredSources[iSource];
+    if( oDeferred.bFailed )
+        return false;
+    VRTDriver * const poDriver = reinterpret_cast<VRTDriver *>(
+        GDALGetDriverByName( "VRT" ) );
+    if( poDriver == nullptr )
+        return false;
+
+    auto l_poDS = cpl::down_cast<VRTDataset*>(GetDataset());
+    CPLErrorReset();
+    VRTSource * const poSource = poDriver->ParseSource(
+        oDeferred.psTree,
+        m_bDeferredSourcesVRTPathSet ? m_osDeferredSourcesVRTPath.c_str()
+                                     : nullptr,
+        m_pDeferredSourcesUniqueHandle,
+        l_poDS->m_oMapSharedSources );
+    if( poSource == nullptr )
+    {
+        if( CPLGetLastErrorType() == CE_None )
+        {
+            CPLError( CE_Failure, CPLE_AppDefined,
+                      "Cannot parse source %d of band %d",
+                      iSource, nBand );
+        }
+        // Do not parse it again, and emit the same error, at each request
+        // touching it. The entry stays counted in m_nDeferredSources so
+        // that ResolveDeferredSources() removes it.
+        CPLDestroyXMLNode( oDeferred.psTree );
+        oDeferred.psTree = nullptr;
+        oDeferred.bFailed = true;
+        return false;
+    }
+
+    CPLDestroyXMLNode( oDeferred.psTree );
+    oDeferred.psTree = nullptr;
+    papoSources[iSource] = poSource;
+    m_nDeferredSources--;
+
+    InitSource( poSource );
+
+    return true;
+}
+
+/************************************************************************/
+/*                       ResolveDeferredSources()                       */
+/************************************************************************/
+
+/* Parses all the sources whose parsing was deferred at opening. Sources  */
+/* that cannot be parsed are removed, so that all entries of papoSources  */
+/* are valid afterwards.                                                 */
+
+void VRTSourcedRasterBand::ResolveDeferredSources()
+
+{
+    if( m_nDeferredSources == 0 )
+        return;
+
+    int nValidSources = 0;
+    for( int i = 0; i < nSources; i++ )
+    {
+        if( ResolveDeferredSource(i) )
+        {
+            papoSources[nValidSources++] = papoSources[i];
+        }
+        else
+        {
+            CPLDestroyXMLNode( m_aoDeferredSources[i].psTree );
+        }
+    }
+    if( nValidSources != nSources )
+    {
+        nSources = nValidSources;
+        InvalidateSourcesQuadTree();
+    }
+    m_nDeferredSources = 0;
+    m_aoDeferredSources.clear();
 }
 
 /*! @endcond */
@@ -949,6 +1253,46 @@ CPLErr CPL_STDCALL VRTAddSource( VRTSourcedRasterBandH hVRTBand,
 
 /*! @cond Doxygen_Suppress */
 
+/************************************************************************/
+/*                    GetDeferrableSourceDstWindow()                    */
+/************************************************************************/
+
+/* Returns whether the parsing of psSrc can be deferred, that is if it is */
+/* a simple source with a valid DstRect, and in that case its extent.     */
+
+static bool GetDeferrableSourceDstWindow( const CPLXMLNode* psSrc,
+                                          CPLRectObj& sDstWindow )
+{
+    if( psSrc->eType != CXT_Element ||
+        !(EQUAL(psSrc->pszValue, "SimpleSource") ||
+          EQUAL(psSrc->pszValue, "ComplexSource") ||
+          EQUAL(psSrc->pszValue, "AveragedSource") ||
+          EQUAL(psSrc->pszValue, "KernelFilteredSource")) )
+        return false;
+
+    const CPLXMLNode* psDstRect = CPLGetXMLNode(psSrc, "DstRect");
+    if( psDstRect == nullptr )
+        return false;
+    const double dfXOff = CPLAtof(CPLGetXMLValue(psDstRect, "xOff", "-1"));
+    const double dfYOff = CPLAtof(CPLGetXMLValue(psDstRect, "yOff", "-1"));
+    const double dfXSize = CPLAtof(CPLGetXMLValue(psDstRect, "xSize", "-1"));
+    const double dfYSize = CPLAtof(CPLGetXMLValue(psDstRect, "ySize", "-1"));
+    // Invalid windows are left to VRTSimpleSource::XMLInit() to report.
+    if( !CPLIsFinite(dfXOff) || !CPLIsFinite(dfYOff) ||
+        !CPLIsFinite(dfXSize) || !CPLIsFinite(dfYSize) ||
+        dfXOff < INT_MIN || dfXOff > INT_MAX ||
+        dfYOff < INT_MIN || dfYOff > INT_MAX ||
+        !(dfXSize > 0) || dfXSize > INT_MAX ||
+        !(dfYSize > 0) || dfYSize > INT_MAX )
+        return false;
+
+    sDstWindow.minx = dfXOff;
+    sDstWindow.miny = dfYOff;
+    sDstWindow.maxx = dfXOff + dfXSize;
+    sDstWindow.maxy = dfYOff + dfYSize;
+    return true;
+}
+
 /************************************************************************/
 /*                              XMLInit()                               */
 /************************************************************************/
@@ -967,6 +1311,38 @@ CPLErr VRTSourcedRasterBand::XMLInit( CPLXMLNode * psTree,
             return eErr;
     }
 
+/* -------------------------------------------------------------------- */
+/*      When there are enough sources for the spatial index of sources  */
+/*      to be used, defer the parsing of simple sources until a window  */
+/*      touches them. This avoids opening all the source datasets of    */
+/*      huge mosaics.                                                   */
+/* -------------------------------------------------------------------- */
+    bool bDeferSources = false;
+    if( typeid(*this) == typeid(VRTSourcedRasterBand) &&
+        CPLTestBool(CPLGetConfigOption("VRT_DEFER_SOURCES_PARSING", "YES")) )
+    {
+        const int nThreshold = atoi(
+            CPLGetConfigOption("VRT_SOURCES_INDEX_THRESHOLD", "64"));
+        int nDeferrableSources = 0;
+        CPLRectObj sDstWindow;
+        for( CPLXMLNode *psChild = psTree->psChild;
+             psChild != nullptr;
+             psChild = psChild->psNext)
+        {
+            if( GetDeferrableSourceDstWindow( psChild, sDstWindow ) )
+                nDeferrableSources++;
+        }
+        bDeferSources = nDeferrableSources > 0 &&
+                        nDeferrableSources >= nThreshold;
+        if( bDeferSources )
+        {
+            m_bDeferredSourcesVRTPathSet = pszVRTPath != nullptr;
+            if( pszVRTPath != nullptr )
+                m_osDeferredSourcesVRTPath = pszVRTPath;
+            m_pDeferredSourcesUniqueHandle = pUniqueHandle;
+        }
+    }
+
 /* -------------------------------------------------------------------- */
 /*      Process sources.                                                */
 /* -------------------------------------------------------------------- */
@@ -980,14 +1356,61 @@ CPLErr VRTSourcedRasterBand::XMLInit( CPLXMLNode * psTree,
         if( psChild->eType != CXT_Element )
             continue;
 
+        CPLRectObj sDstWindow;
+        if( bDeferSources &&
+            GetDeferrableSourceDstWindow( psChild, sDstWindow ) )
+        {
+            // Clone only this node, not its siblings.
+            CPLXMLNode* psNext = psChild->psNext;
+            psChild->psNext = nullptr;
+            DeferredSource oDeferred;
+            oDeferred.psTree = CPLCloneXMLTree( psChild );
+            oDeferred.sDstWindow = sDstWindow;
+            psChild->psNext = psNext;
+
+            m_aoDeferredSources.resize( nSources );
+            m_aoDeferredSources.push_back( oDeferred );
+            m_nDeferredSources++;
+
+            nSources++;
+            papoSources = static_cast<VRTSource **>(
+                CPLRealloc( papoSources, sizeof(void*) * nSources ) );
+            papoSources[nSources-1] = nullptr;
+            continue;
+        }
+
         CPLErrorReset();
         VRTSource * const poSource =
             poDriver->ParseSource( psChild, pszVRTPath, pUniqueHandle,
                                    oMapSharedSources );
-        if( poSource != nullptr )
+        if( poSource == nullptr )
+        {
+            if( CPLGetLastErrorType() != CE_None )
+                return CE_Failure;
+        }
+        else if( m_nDeferredSources > 0 )
+        {
+            // Do not go through AddSource(), which would parse the
+            // deferred sources.
+            nSources++;
+            papoSources = static_cast<VRTSource **>(
+                CPLRealloc( papoSources, sizeof(void*) * nSources ) );
+            papoSources[nSources-1] = poSource;
+            InvalidateSourcesQuadTree();
+            InitSource( poSource );
+        }
+        else
+        {
             AddSource( poSource );
-        else if( CPLGetLastErrorType() != CE_None )
-            return CE_Failure;
+        }
+    }
+
+    if( m_nDeferredSources > 0 )
+    {
+        m_aoDeferredSources.resize( nSources );
+        InvalidateSourcesQuadTree();
+        CPLDebug( "VRT", "Parsing of %d sources of band %d deferred",
+                  m_nDeferredSources, nBand );
     }
 
 /* -------------------------------------------------------------------- */
@@ -1017,6 +1440,8 @@ CPLXMLNode *VRTSourcedRasterBand::SerializeToXML( const char *pszVRTPath )
 /* -------------------------------------------------------------------- */
 /*      Process Sources.                                                */
 /* -------------------------------------------------------------------- */
+    ResolveDeferredSources();
+
     for( int iSource = 0; iSource < nSources; iSource++ )
     {
         CPLXMLNode * const psXMLSrc
@@ -1438,9 +1863,16 @@ const char *VRTSourcedRasterBand::GetMetadataItem( const char * pszName,
                                                       CPLHashSetEqualStr,
                                                       nullptr );
 
-        for( int iSource = 0; iSource < nSources; iSource++ )
+        std::vector<int> anSources;
+        const bool bUseIndex = GetSourcesIntersectingWindow(
+            iPixel, iLine, 1, 1, anSources);
+        const int nCandidates =
+            bUseIndex ? static_cast<int>(anSources.size()) : nSources;
+        for( int iCandidate = 0; iCandidate < nCandidates; iCandidate++ )
         {
-            if( !papoSources[iSource]->IsSimpleSource() )
+            const int iSource = bUseIndex ? anSources[iCandidate] : iCandidate;
+            if( !ResolveDeferredSource(iSource) ||
+                !papoSources[iSource]->IsSimpleSource() )
                 continue;
 
             VRTSimpleSource * const poSrc
@@ -1515,6 +1947,8 @@ char **VRTSourcedRasterBand::GetMetadata( const char *pszDomain )
         CSLDestroy(m_papszSourceList);
         m_papszSourceList = nullptr;
 
+        ResolveDeferredSources();
+
 /* -------------------------------------------------------------------- */
 /*      Process SimpleSources.                                          */
 /* -------------------------------------------------------------------- */
@@ -1582,6 +2016,8 @@ CPLErr VRTSourcedRasterBand::SetMetadataItem( const char *pszName,
     else if( pszDomain != nullptr
         && EQUAL(pszDomain,"vrt_sources") )
     {
+        ResolveDeferredSources();
+
         int iSource = 0;
         // TODO(schwehr): Replace sscanf.
         if( sscanf(pszName, "source_%d", &iSource) != 1 || iSource < 0 ||
@@ -1611,6 +2047,7 @@ CPLErr VRTSourcedRasterBand::SetMetadataItem( const char *pszName,
         {
             delete papoSources[iSource];
             papoSources[iSource] = poSource;
+            InvalidateSourcesQuadTree();
             reinterpret_cast<VRTDataset *>( poDS )->SetNeedsFlush();
             return CE_None;
         }
@@ -1637,11 +2074,7 @@ CPLErr VRTSourcedRasterBand::SetMetadata( char **papszNewMD, const char *pszDoma
 
         if( EQUAL(pszDomain,"vrt_sources") )
         {
-            for( int i = 0; i < nSources; i++ )
-                delete papoSources[i];
-            CPLFree( papoSources );
-            papoSources = nullptr;
-            nSources = 0;
+            CloseDependentDatasets();
         }
 
         for( int i = 0; i < CSLCount(papszNewMD); i++ )
@@ -1680,6 +2113,8 @@ CPLErr VRTSourcedRasterBand::SetMetadata( char **papszNewMD, const char *pszDoma
 void VRTSourcedRasterBand::GetFileList( char*** ppapszFileList, int *pnSize,
                                         int *pnMaxSize, CPLHashSet* hSetFiles )
 {
+    ResolveDeferredSources();
+
     for( int i = 0; i < nSources; i++ )
     {
         papoSources[i]->GetFileList( ppapszFileList, pnSize,
@@ -1706,6 +2141,13 @@ int VRTSourcedRasterBand::CloseDependentDatasets()
     papoSources = nullptr;
     nSources = 0;
 
+    for( auto& oDeferred: m_aoDeferredSources )
+        CPLDestroyXMLNode( oDeferred.psTree );
+    m_aoDeferredSources.clear();
+    m_nDeferredSources = 0;
+
+    InvalidateSourcesQuadTree();
+
     return TRUE;
 }
 
@@ -1718,7 +2160,9 @@ CPLErr VRTSourcedRasterBand::FlushCache()
     CPLErr eErr = VRTRasterBand::FlushCache();
     for( int i = 0; i < nSources && eErr == CE_None; i++ )
     {
-        eErr = papoSources[i]->FlushCache();
+        // Deferred sources have nothing to flush.
+        if( papoSources[i] != nullptr )
+            eErr = papoSources[i]->FlushCache();
     }
     return eErr;
 }
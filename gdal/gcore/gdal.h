@@ -1208,6 +1208,10 @@ GIntBig CPL_DLL CPL_STDCALL GDALGetCacheUsed64(void);
 
 int CPL_DLL CPL_STDCALL GDALFlushCacheBlock(void);
 
+void CPL_DLL CPL_STDCALL GDALGetDatasetPoolStatistics( GIntBig* pnHits,
+                                                       GIntBig* pnMisses,
+                                                       GIntBig* pnEvictions );
+
 /* ==================================================================== */
 /*      GDAL virtual memory                                             */
 /* ==================================================================== */
@@ -794,6 +794,10 @@ private:
 //! @cond Doxygen_Suppress
     OGRErr              ProcessSQLCreateIndex( const char * );
     OGRErr              ProcessSQLDropIndex( const char * );
+    OGRLayer           *ProcessSQLSpatialIndexLayer( const char *,
+                                                     const char *, int * );
+    OGRErr              ProcessSQLCreateSpatialIndex( const char * );
+    OGRErr              ProcessSQLDropSpatialIndex( const char * );
     OGRErr              ProcessSQLDropTable( const char * );
     OGRErr              ProcessSQLAlterTableAddColumn( const char * );
     OGRErr              ProcessSQLAlterTableDropColumn( const char * );
@@ -3375,6 +3375,10 @@ GDALDatasetH CPL_STDCALL GDALOpenEx( const char *pszFilename,
                 poDS->AddToDatasetOpenList();
             }
 
+            // Attach driver independent attribute indexes, if any.
+            if( nOpenFlags & GDAL_OF_VECTOR )
+                OGRInitializeSidecarAttrIndexes(poDS);
+
             if( nOpenFlags & GDAL_OF_SHARED )
             {
                 if (strcmp(pszFilename, poDS->GetDescription()) != 0)
@@ -5206,8 +5210,12 @@ OGRErr GDALDataset::ProcessSQLCreateIndex( const char *pszSQLCommand )
     }
 
 /* -------------------------------------------------------------------- */
-/*      Does this layer even support attribute indexes?                 */
+/*      Does this layer even support attribute indexes?  If the         */
+/*      driver does not manage them, fallback to a sidecar index        */
+/*      file, which is only reliable if the dataset is not modified.    */
 /* -------------------------------------------------------------------- */
+    if( poLayer->GetIndex() == nullptr && GetAccess() == GA_ReadOnly )
+        poLayer->InitializeSidecarIndexSupport(GetDescription());
     if( poLayer->GetIndex() == nullptr )
     {
         CPLError(CE_Failure, CPLE_AppDefined,
@@ -5223,7 +5231,7 @@ OGRErr GDALDataset::ProcessSQLCreateIndex( const char *pszSQLCommand )
 
     CSLDestroy(papszTokens);
 
-    if( i >= poLayer->GetLayerDefn()->GetFieldCount() )
+    if( i < 0 || i >= poLayer->GetLayerDefn()->GetFieldCount() )
     {
         CPLError(CE_Failure, CPLE_AppDefined,
                  "`%s' failed, field not found.",
@@ -5296,6 +5304,8 @@ OGRErr GDALDataset::ProcessSQLDropIndex( const char *pszSQLCommand )
 /* -------------------------------------------------------------------- */
 /*      Does this layer even support attribute indexes?                 */
 /* -------------------------------------------------------------------- */
+    if( poLayer->GetIndex() == nullptr && GetAccess() == GA_ReadOnly )
+        poLayer->InitializeSidecarIndexSupport(GetDescription());
     if( poLayer->GetIndex() == nullptr )
     {
         CPLError(CE_Failure, CPLE_AppDefined,
@@ -5335,7 +5345,7 @@ OGRErr GDALDataset::ProcessSQLDropIndex( const char *pszSQLCommand )
     int i = poLayer->GetLayerDefn()->GetFieldIndex(papszTokens[5]);
     CSLDestroy(papszTokens);
 
-    if( i >= poLayer->GetLayerDefn()->GetFieldCount() )
+    if( i < 0 || i >= poLayer->GetLayerDefn()->GetFieldCount() )
     {
         CPLError(CE_Failure, CPLE_AppDefined, "`%s' failed, field not found.",
                  pszSQLCommand);
@@ -5350,6 +5360,123 @@ OGRErr GDALDataset::ProcessSQLDropIndex( const char *pszSQLCommand )
     return eErr;
 }
 
+/************************************************************************/
+/*                     ProcessSQLSpatialIndexLayer()                    */
+/*                                                                      */
+/*      Parse the common part of the CREATE and DROP SPATIAL INDEX      */
+/*      commands, and return the layer and geometry field index.        */
+/************************************************************************/
+
+OGRLayer *GDALDataset::ProcessSQLSpatialIndexLayer( const char *pszSQLCommand,
+                                                    const char *pszVerb,
+                                                    int *piGeomField )
+
+{
+    CPLStringList aosTokens(CSLTokenizeString(pszSQLCommand));
+
+/* -------------------------------------------------------------------- */
+/*      Do some general syntax checking.                                */
+/* -------------------------------------------------------------------- */
+    if( (aosTokens.size() != 5 && aosTokens.size() != 7)
+        || !EQUAL(aosTokens[0], pszVerb)
+        || !EQUAL(aosTokens[1], "SPATIAL")
+        || !EQUAL(aosTokens[2], "INDEX")
+        || !EQUAL(aosTokens[3], "ON")
+        || (aosTokens.size() == 7 && !EQUAL(aosTokens[5], "USING")) )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "Syntax error in %s SPATIAL INDEX command.\n"
+                 "Was '%s'\n"
+                 "Should be of form '%s SPATIAL INDEX ON <table> "
+                 "[USING <geometry field>]'",
+                 pszVerb, pszSQLCommand, pszVerb);
+        return nullptr;
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Find the named layer and geometry field.                        */
+/* -------------------------------------------------------------------- */
+    OGRLayer *poLayer = GetLayerByName(aosTokens[4]);
+    if( poLayer == nullptr )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "%s SPATIAL INDEX ON failed, no such layer as `%s'.",
+                 pszVerb, aosTokens[4]);
+        return nullptr;
+    }
+
+    OGRFeatureDefn *poDefn = poLayer->GetLayerDefn();
+    *piGeomField = aosTokens.size() == 7 ?
+        poDefn->GetGeomFieldIndex(aosTokens[6]) : 0;
+    if( *piGeomField < 0 || *piGeomField >= poDefn->GetGeomFieldCount() )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "`%s' failed, geometry field not found.",
+                 pszSQLCommand);
+        return nullptr;
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Spatial indexes are only supported through a sidecar index      */
+/*      file, which is only reliable if the dataset is not modified.    */
+/* -------------------------------------------------------------------- */
+    if( poLayer->GetSidecarSpatialIndex() == nullptr &&
+        GetAccess() == GA_ReadOnly )
+        poLayer->InitializeSidecarSpatialIndexSupport(this);
+    if( poLayer->GetSidecarSpatialIndex() == nullptr )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "%s SPATIAL INDEX ON not supported by this driver.",
+                 pszVerb);
+        return nullptr;
+    }
+
+    return poLayer;
+}
+
+/************************************************************************/
+/*                    ProcessSQLCreateSpatialIndex()                    */
+/*                                                                      */
+/*      The correct syntax for creating a spatial index in our          */
+/*      dialect of SQL is:                                              */
+/*                                                                      */
+/*        CREATE SPATIAL INDEX ON <layername> [USING <geomfieldname>]   */
+/*                                                                      */
+/*      Drivers with native spatial indexes handle this command         */
+/*      themselves.                                                     */
+/************************************************************************/
+
+OGRErr GDALDataset::ProcessSQLCreateSpatialIndex( const char *pszSQLCommand )
+
+{
+    int iGeomField = 0;
+    OGRLayer *poLayer =
+        ProcessSQLSpatialIndexLayer(pszSQLCommand, "CREATE", &iGeomField);
+    if( poLayer == nullptr )
+        return OGRERR_FAILURE;
+
+    return poLayer->GetSidecarSpatialIndex()->CreateIndex(iGeomField,
+                                                          poLayer);
+}
+
+/************************************************************************/
+/*                     ProcessSQLDropSpatialIndex()                     */
+/*                                                                      */
+/*        DROP SPATIAL INDEX ON <layername> [USING <geomfieldname>]     */
+/************************************************************************/
+
+OGRErr GDALDataset::ProcessSQLDropSpatialIndex( const char *pszSQLCommand )
+
+{
+    int iGeomField = 0;
+    OGRLayer *poLayer =
+        ProcessSQLSpatialIndexLayer(pszSQLCommand, "DROP", &iGeomField);
+    if( poLayer == nullptr )
+        return OGRERR_FAILURE;
+
+    return poLayer->GetSidecarSpatialIndex()->DropIndex(iGeomField);
+}
+
 /************************************************************************/
 /*                        ProcessSQLDropTable()                         */
 /*                                                                      */
@@ -5958,6 +6085,20 @@ GDALDataset::ExecuteSQL( const char *pszStatement,
         return nullptr;
     }
 
+/* -------------------------------------------------------------------- */
+/*      Handle CREATE and DROP SPATIAL INDEX statements specially.      */
+/* -------------------------------------------------------------------- */
+    if( STARTS_WITH_CI(pszStatement, "CREATE SPATIAL INDEX") )
+    {
+        ProcessSQLCreateSpatialIndex(pszStatement);
+        return nullptr;
+    }
+    if( STARTS_WITH_CI(pszStatement, "DROP SPATIAL INDEX") )
+    {
+        ProcessSQLDropSpatialIndex(pszStatement);
+        return nullptr;
+    }
+
 /* -------------------------------------------------------------------- */
 /*      Handle DROP TABLE statements specially.                         */
 /* -------------------------------------------------------------------- */
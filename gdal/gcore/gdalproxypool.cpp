@@ -33,6 +33,8 @@
 #include <cstdio>
 #include <cstdlib>
 #include <cstring>
+#include <string>
+#include <unordered_map>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
@@ -61,6 +63,13 @@ CPL_CVSID("$Id$")
 class GDALDatasetPool;
 static GDALDatasetPool* singleton = nullptr;
 
+/* Statistics of the pool. They are kept outside of the singleton so that */
+/* they survive its destruction and re-creation. Protected by the */
+/* GDALGetphDLMutex() mutex */
+static GIntBig nPoolHits = 0;
+static GIntBig nPoolMisses = 0;
+static GIntBig nPoolEvictions = 0;
+
 void GDALNullifyProxyPoolSingleton() { singleton = nullptr; }
 
 struct _GDALProxyPoolCacheEntry
@@ -73,6 +82,11 @@ struct _GDALProxyPoolCacheEntry
     /* Ref count of the cached dataset */
     int           refCount;
 
+    /* Value of the use counter of the pool when the entry was last */
+    /* referenced, to find the most recently used one among the entries */
+    /* of a same filename */
+    GIntBig       nLastUse;
+
     GDALProxyPoolCacheEntry* prev;
     GDALProxyPoolCacheEntry* next;
 };
@@ -93,6 +107,14 @@ class GDALDatasetPool
         GDALProxyPoolCacheEntry* firstEntry = nullptr;
         GDALProxyPoolCacheEntry* lastEntry = nullptr;
 
+        /* Index of the entries of the list by their filename, to avoid */
+        /* scanning the whole list at each _RefDataset() call */
+        std::unordered_multimap<std::string, GDALProxyPoolCacheEntry*>
+                                                        oMapFileNameToEntry{};
+
+        /* Incremented each time an entry is referenced */
+        GIntBig nUseCounter = 0;
+
         /* This variable prevents a dataset that is going to be opened in GDALDatasetPool::_RefDataset */
         /* from increasing refCount if, during its opening, it creates a GDALProxyPoolDataset */
         /* We increment it before opening or closing a cached dataset and decrement it afterwards */
@@ -113,6 +135,7 @@ class GDALDatasetPool
                                              const char* pszOwner);
         void _CloseDataset(const char* pszFileName, GDALAccess eAccess,
                            const char* pszOwner);
+        void RemoveFromMap(GDALProxyPoolCacheEntry* entry);
 
 #ifdef DEBUG_PROXY_POOL
         // cppcheck-suppress unusedPrivateFunction
@@ -137,6 +160,9 @@ class GDALDatasetPool
 
         static void PreventDestroy();
         static void ForceDestroy();
+
+        static void GetStatistics(GIntBig* pnHits, GIntBig* pnMisses,
+                                  GIntBig* pnEvictions);
 };
 
 /************************************************************************/
@@ -213,6 +239,23 @@ void GDALDatasetPool::CheckLinks()
 }
 #endif
 
+/************************************************************************/
+/*                           RemoveFromMap()                            */
+/************************************************************************/
+
+void GDALDatasetPool::RemoveFromMap(GDALProxyPoolCacheEntry* entry)
+{
+    const auto oRange = oMapFileNameToEntry.equal_range(entry->pszFileName);
+    for( auto oIter = oRange.first; oIter != oRange.second; ++oIter )
+    {
+        if( oIter->second == entry )
+        {
+            oMapFileNameToEntry.erase(oIter);
+            break;
+        }
+    }
+}
+
 /************************************************************************/
 /*                            _RefDataset()                             */
 /************************************************************************/
@@ -227,54 +270,68 @@ GDALProxyPoolCacheEntry* GDALDatasetPool::_RefDataset(const char* pszFileName,
     if( bInDestruction )
         return nullptr;
 
-    GDALProxyPoolCacheEntry* cur = firstEntry;
+    GDALProxyPoolCacheEntry* cur = nullptr;
     GIntBig responsiblePID = GDALGetResponsiblePIDForCurrentThread();
-    GDALProxyPoolCacheEntry* lastEntryWithZeroRefCount = nullptr;
 
-    while(cur)
+    /* The entries of the map are in no particular order, so pick the most */
+    /* recently used matching entry, as scanning the LRU list would do */
+    const auto oRange = oMapFileNameToEntry.equal_range(pszFileName);
+    for( auto oIter = oRange.first; oIter != oRange.second; ++oIter )
     {
-        GDALProxyPoolCacheEntry* next = cur->next;
+        GDALProxyPoolCacheEntry* candidate = oIter->second;
+
+        if (((bShared && candidate->responsiblePID == responsiblePID &&
+              ((candidate->pszOwner == nullptr && pszOwner == nullptr) ||
+                (candidate->pszOwner != nullptr && pszOwner != nullptr &&
+                 strcmp(candidate->pszOwner, pszOwner) == 0))) ||
+             (!bShared && candidate->refCount == 0)) &&
+            (cur == nullptr || candidate->nLastUse > cur->nLastUse) )
+        {
+            cur = candidate;
+        }
+    }
 
-        if (strcmp(cur->pszFileName, pszFileName) == 0 &&
-            ((bShared && cur->responsiblePID == responsiblePID &&
-              ((cur->pszOwner == nullptr && pszOwner == nullptr) ||
-                (cur->pszOwner != nullptr && pszOwner != nullptr &&
-                 strcmp(cur->pszOwner, pszOwner) == 0))) ||
-             (!bShared && cur->refCount == 0)) )
+    if( cur != nullptr )
+    {
+        if (cur != firstEntry)
         {
-            if (cur != firstEntry)
-            {
-                /* Move to begin */
-                if (cur->next)
-                    cur->next->prev = cur->prev;
-                else
-                    lastEntry = cur->prev;
-                cur->prev->next = cur->next;
-                cur->prev = nullptr;
-                firstEntry->prev = cur;
-                cur->next = firstEntry;
-                firstEntry = cur;
+            /* Move to begin */
+            if (cur->next)
+                cur->next->prev = cur->prev;
+            else
+                lastEntry = cur->prev;
+            cur->prev->next = cur->next;
+            cur->prev = nullptr;
+            firstEntry->prev = cur;
+            cur->next = firstEntry;
+            firstEntry = cur;
 
 #ifdef DEBUG_PROXY_POOL
-                CheckLinks();
+            CheckLinks();
 #endif
-            }
-
-            cur->refCount ++;
-            return cur;
         }
 
-        if (cur->refCount == 0)
-            lastEntryWithZeroRefCount = cur;
-
-        cur = next;
+        cur->refCount ++;
+        cur->nLastUse = ++nUseCounter;
+        nPoolHits ++;
+        return cur;
     }
 
     if( !bForceOpen )
         return nullptr;
 
+    nPoolMisses ++;
+
     if (currentSize == maxSize)
     {
+        /* The least recently used entries are at the end of the list */
+        GDALProxyPoolCacheEntry* lastEntryWithZeroRefCount = lastEntry;
+        while( lastEntryWithZeroRefCount != nullptr &&
+               lastEntryWithZeroRefCount->refCount != 0 )
+        {
+            lastEntryWithZeroRefCount = lastEntryWithZeroRefCount->prev;
+        }
+
         if (lastEntryWithZeroRefCount == nullptr)
         {
             CPLError(CE_Failure, CPLE_AppDefined,
@@ -284,9 +341,12 @@ GDALProxyPoolCacheEntry* GDALDatasetPool::_RefDataset(const char* pszFileName,
             return nullptr;
         }
 
+        RemoveFromMap(lastEntryWithZeroRefCount);
         lastEntryWithZeroRefCount->pszFileName[0] = '\0';
         if (lastEntryWithZeroRefCount->poDS)
         {
+            nPoolEvictions ++;
+
             /* Close by pretending we are the thread that GDALOpen'ed this */
             /* dataset */
             GDALSetResponsiblePIDForCurrentThread(lastEntryWithZeroRefCount->responsiblePID);
@@ -345,6 +405,9 @@ GDALProxyPoolCacheEntry* GDALDatasetPool::_RefDataset(const char* pszFileName,
     cur->pszOwner = (pszOwner) ? CPLStrdup(pszOwner) : nullptr;
     cur->responsiblePID = responsiblePID;
     cur->refCount = 1;
+    cur->nLastUse = ++nUseCounter;
+    oMapFileNameToEntry.insert(
+        std::pair<std::string, GDALProxyPoolCacheEntry*>(pszFileName, cur));
 
     refCountOfDisableRefCount ++;
     int nFlag = ((eAccess == GA_Update) ? GDAL_OF_UPDATE : GDAL_OF_READONLY) | GDAL_OF_RASTER | GDAL_OF_VERBOSE_ERROR;
@@ -364,39 +427,50 @@ void GDALDatasetPool::_CloseDataset( const char* pszFileName,
                                      GDALAccess /* eAccess */,
                                      const char* pszOwner )
 {
-    GDALProxyPoolCacheEntry* cur = firstEntry;
     GIntBig responsiblePID = GDALGetResponsiblePIDForCurrentThread();
 
-    while(cur)
+    /* Close the most recently used matching entry */
+    const auto oRange = oMapFileNameToEntry.equal_range(pszFileName);
+    auto oIterCur = oRange.second;
+    for( auto oIter = oRange.first; oIter != oRange.second; ++oIter )
     {
-        GDALProxyPoolCacheEntry* next = cur->next;
-
-        CPLAssert(cur->pszFileName);
-        if (strcmp(cur->pszFileName, pszFileName) == 0 && cur->refCount == 0 &&
-            ((pszOwner == nullptr && cur->pszOwner == nullptr) ||
-             (pszOwner != nullptr && cur->pszOwner != nullptr &&
-              strcmp(cur->pszOwner, pszOwner) == 0)) &&
-            cur->poDS != nullptr )
+        GDALProxyPoolCacheEntry* candidate = oIter->second;
+
+        CPLAssert(candidate->pszFileName);
+        if (candidate->refCount == 0 &&
+            ((pszOwner == nullptr && candidate->pszOwner == nullptr) ||
+             (pszOwner != nullptr && candidate->pszOwner != nullptr &&
+              strcmp(candidate->pszOwner, pszOwner) == 0)) &&
+            candidate->poDS != nullptr &&
+            (oIterCur == oRange.second ||
+             candidate->nLastUse > oIterCur->second->nLastUse) )
         {
-            /* Close by pretending we are the thread that GDALOpen'ed this */
-            /* dataset */
-            GDALSetResponsiblePIDForCurrentThread(cur->responsiblePID);
+            oIterCur = oIter;
+        }
+    }
+    if( oIterCur == oRange.second )
+        return;
 
-            refCountOfDisableRefCount ++;
-            GDALClose(cur->poDS);
-            refCountOfDisableRefCount --;
+    GDALProxyPoolCacheEntry* cur = oIterCur->second;
 
-            GDALSetResponsiblePIDForCurrentThread(responsiblePID);
+    /* Remove the entry from the map before closing, as closing */
+    /* might recursively modify the pool */
+    oMapFileNameToEntry.erase(oIterCur);
+    cur->pszFileName[0] = '\0';
 
-            cur->poDS = nullptr;
-            cur->pszFileName[0] = '\0';
-            CPLFree(cur->pszOwner);
-            cur->pszOwner = nullptr;
-            break;
-        }
+    /* Close by pretending we are the thread that GDALOpen'ed this */
+    /* dataset */
+    GDALSetResponsiblePIDForCurrentThread(cur->responsiblePID);
 
-        cur = next;
-    }
+    refCountOfDisableRefCount ++;
+    GDALClose(cur->poDS);
+    refCountOfDisableRefCount --;
+
+    GDALSetResponsiblePIDForCurrentThread(responsiblePID);
+
+    cur->poDS = nullptr;
+    CPLFree(cur->pszOwner);
+    cur->pszOwner = nullptr;
 }
 
 /************************************************************************/
@@ -504,6 +578,22 @@ void GDALDatasetPool::UnrefDataset(GDALProxyPoolCacheEntry* cacheEntry)
     cacheEntry->refCount --;
 }
 
+/************************************************************************/
+/*                          GetStatistics()                             */
+/************************************************************************/
+
+void GDALDatasetPool::GetStatistics(GIntBig* pnHits, GIntBig* pnMisses,
+                                    GIntBig* pnEvictions)
+{
+    CPLMutexHolderD( GDALGetphDLMutex() );
+    if( pnHits )
+        *pnHits = nPoolHits;
+    if( pnMisses )
+        *pnMisses = nPoolMisses;
+    if( pnEvictions )
+        *pnEvictions = nPoolEvictions;
+}
+
 /************************************************************************/
 /*                       CloseDataset()                                 */
 /************************************************************************/
@@ -1488,3 +1578,33 @@ void GDALProxyPoolMaskBand::UnrefUnderlyingRasterBand(
 }
 
 //! @endcond
+
+/************************************************************************/
+/*                    GDALGetDatasetPoolStatistics()                    */
+/************************************************************************/
+
+/**
+ * \brief Return statistics on the pool of datasets.
+ *
+ * The pool of datasets is used by GDALProxyPoolDataset, typically to open
+ * the sources of VRT datasets, and its maximum size is controlled by the
+ * GDAL_MAX_DATASET_POOL_SIZE configuration option.
+ *
+ * The counters are cumulated since the start of the process.
+ *
+ * @param pnHits pointer to the number of requests that were satisfied by
+ * an already opened dataset, or NULL.
+ * @param pnMisses pointer to the number of requests that caused a dataset
+ * to be opened, or NULL.
+ * @param pnEvictions pointer to the number of datasets that were closed to
+ * make room for another one, or NULL.
+ *
+ * @since GDAL 3.1
+ */
+
+void CPL_STDCALL GDALGetDatasetPoolStatistics( GIntBig* pnHits,
+                                               GIntBig* pnMisses,
+                                               GIntBig* pnEvictions )
+{
+    GDALDatasetPool::GetStatistics(pnHits, pnMisses, pnEvictions);
+}
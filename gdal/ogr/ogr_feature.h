@@ -806,6 +806,7 @@ class CPL_DLL OGRFeatureQuery
   private:
     OGRFeatureDefn *poTargetDefn;
     void           *pSWQExpr;
+    void           *pProgram;
 
     char      **FieldCollector( void *, char ** );
 
@@ -32,9 +32,14 @@
 #include "ogr_feature.h"
 #include "swq.h"
 
+#include <climits>
+#include <cmath>
 #include <cstddef>
 #include <cstdlib>
 #include <algorithm>
+#include <limits>
+#include <memory>
+#include <vector>
 
 #include "cpl_conv.h"
 #include "cpl_error.h"
@@ -57,13 +62,794 @@ const char *const SpecialFieldNames[SPECIAL_FIELD_COUNT] = {
 const swq_field_type SpecialFieldTypes[SPECIAL_FIELD_COUNT] = {
     SWQ_INTEGER, SWQ_STRING, SWQ_STRING, SWQ_STRING, SWQ_FLOAT};
 
+/************************************************************************/
+/* ==================================================================== */
+/*                        OGRFeatureQueryProgram                        */
+/* ==================================================================== */
+/*                                                                      */
+/*      Flat form of a checked expression, evaluated with a value       */
+/*      stack instead of allocating a swq_expr_node per operation and   */
+/*      per feature.  Field indexes are resolved, and sub-expressions   */
+/*      that only involve constants are folded, when it is built.       */
+/*      Sub-expressions it cannot handle (functions, dates,             */
+/*      geometries, ...) are evaluated with the swq evaluator.          */
+/*                                                                      */
+/*      Operations follow SWQGeneralEvaluator() exactly.  In the rare   */
+/*      cases where they would emit an error, the evaluation is given   */
+/*      up so that the whole expression is evaluated by swq instead.    */
+/************************************************************************/
+
+static int OGRFeatureFetcherFixFieldIndex( OGRFeatureDefn* poFDefn,
+                                           int nIdx );
+static swq_expr_node *OGRFeatureFetcher( swq_expr_node *op, void *pFeatureIn );
+
+namespace {
+
+// Same content as the value members of swq_expr_node
+struct OGRFeatureQueryValue
+{
+    swq_field_type eType;
+    bool           bNull;
+    GIntBig        nValue;
+    double         dfValue;
+    const char    *pszValue;
+};
+
+enum OGRFeatureQueryOpcode
+{
+    OFQ_PUSH_CONSTANT,          // m_asConstants[nArg]
+    OFQ_PUSH_INTEGER,           // GetFieldAsInteger(nArg)
+    OFQ_PUSH_INTEGER64,         // GetFieldAsInteger64(nArg)
+    OFQ_PUSH_REAL,              // GetFieldAsDouble(nArg)
+    OFQ_PUSH_STRING,            // OFTString field nArg
+    OFQ_PUSH_SUBTREE,           // m_apoSubTrees[nArg] evaluated by swq
+    OFQ_AND_SHORTCUT,           // Jump to nArg if the AND is false
+    OFQ_OR_SHORTCUT,            // Jump to nArg if the OR is decided
+    OFQ_OPERATION               // eOperation on the nSubExprCount top values
+};
+
+constexpr int OFQ_LOCAL_STACK_SIZE = 64;
+
+/************************************************************************/
+/*                  OGRFeatureQueryEvaluateOperation()                  */
+/*                                                                      */
+/*      Evaluate an operation on pasValues[0 .. nSubExprCount-1], and   */
+/*      put the result in pasValues[0].  Return false when the swq      */
+/*      evaluator must be used instead.                                 */
+/************************************************************************/
+
+static bool OGRFeatureQueryEvaluateOperation( swq_op eOperation,
+                                              int nSubExprCount,
+                                              swq_field_type eResultType,
+                                              OGRFeatureQueryValue *pasValues )
+{
+    OGRFeatureQueryValue *v = pasValues;
+    OGRFeatureQueryValue sRet = { eResultType, false, 0, 0.0, nullptr };
+
+/* -------------------------------------------------------------------- */
+/*      Floating point operations.                                      */
+/* -------------------------------------------------------------------- */
+    if( v[0].eType == SWQ_FLOAT ||
+        (nSubExprCount > 1 && v[1].eType == SWQ_FLOAT) )
+    {
+        if( SWQ_IS_INTEGER(v[0].eType) )
+            v[0].dfValue = static_cast<double>(v[0].nValue);
+        if( nSubExprCount > 1 && SWQ_IS_INTEGER(v[1].eType) )
+            v[1].dfValue = static_cast<double>(v[1].nValue);
+
+        if( eOperation != SWQ_ISNULL )
+        {
+            for( int i = 0; i < nSubExprCount; i++ )
+            {
+                if( !v[i].bNull )
+                    continue;
+                if( eResultType == SWQ_BOOLEAN )
+                {
+                    pasValues[0] = sRet;
+                    return true;
+                }
+                if( eResultType == SWQ_FLOAT || SWQ_IS_INTEGER(eResultType) )
+                {
+                    if( eResultType != SWQ_FLOAT )
+                        sRet.eType = SWQ_INTEGER;
+                    sRet.bNull = true;
+                    pasValues[0] = sRet;
+                    return true;
+                }
+                return false;
+            }
+        }
+
+        switch( eOperation )
+        {
+          case SWQ_EQ: sRet.nValue = v[0].dfValue == v[1].dfValue; break;
+          case SWQ_NE: sRet.nValue = v[0].dfValue != v[1].dfValue; break;
+          case SWQ_GT: sRet.nValue = v[0].dfValue > v[1].dfValue; break;
+          case SWQ_LT: sRet.nValue = v[0].dfValue < v[1].dfValue; break;
+          case SWQ_GE: sRet.nValue = v[0].dfValue >= v[1].dfValue; break;
+          case SWQ_LE: sRet.nValue = v[0].dfValue <= v[1].dfValue; break;
+
+          case SWQ_IN:
+            for( int i = 1; i < nSubExprCount && !sRet.nValue; i++ )
+                sRet.nValue = v[0].dfValue == v[i].dfValue;
+            break;
+
+          case SWQ_BETWEEN:
+            sRet.nValue = v[0].dfValue >= v[1].dfValue &&
+                          v[0].dfValue <= v[2].dfValue;
+            break;
+
+          case SWQ_ISNULL: sRet.nValue = v[0].bNull; break;
+          case SWQ_ADD: sRet.dfValue = v[0].dfValue + v[1].dfValue; break;
+          case SWQ_SUBTRACT: sRet.dfValue = v[0].dfValue - v[1].dfValue; break;
+          case SWQ_MULTIPLY: sRet.dfValue = v[0].dfValue * v[1].dfValue; break;
+
+          case SWQ_DIVIDE:
+            sRet.dfValue = v[1].dfValue == 0 ?
+                INT_MAX : v[0].dfValue / v[1].dfValue;
+            break;
+
+          case SWQ_MODULUS:
+            sRet.dfValue = v[1].dfValue == 0 ?
+                INT_MAX : fmod(v[0].dfValue, v[1].dfValue);
+            break;
+
+          default:
+            return false;
+        }
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Integer/boolean operations.                                     */
+/* -------------------------------------------------------------------- */
+    else if( SWQ_IS_INTEGER(v[0].eType) || v[0].eType == SWQ_BOOLEAN )
+    {
+        if( eOperation != SWQ_ISNULL )
+        {
+            for( int i = 0; i < nSubExprCount; i++ )
+            {
+                if( !v[i].bNull )
+                    continue;
+                if( eResultType == SWQ_BOOLEAN )
+                {
+                    pasValues[0] = sRet;
+                    return true;
+                }
+                if( SWQ_IS_INTEGER(eResultType) )
+                {
+                    sRet.bNull = true;
+                    pasValues[0] = sRet;
+                    return true;
+                }
+                return false;
+            }
+        }
+
+        const GIntBig nA = v[0].nValue;
+        const GIntBig nB = nSubExprCount > 1 ? v[1].nValue : 0;
+        switch( eOperation )
+        {
+          case SWQ_AND: sRet.nValue = nA && nB; break;
+          case SWQ_OR: sRet.nValue = nA || nB; break;
+          case SWQ_NOT: sRet.nValue = !nA; break;
+          case SWQ_EQ: sRet.nValue = nA == nB; break;
+          case SWQ_NE: sRet.nValue = nA != nB; break;
+          case SWQ_GT: sRet.nValue = nA > nB; break;
+          case SWQ_LT: sRet.nValue = nA < nB; break;
+          case SWQ_GE: sRet.nValue = nA >= nB; break;
+          case SWQ_LE: sRet.nValue = nA <= nB; break;
+
+          case SWQ_IN:
+            for( int i = 1; i < nSubExprCount && !sRet.nValue; i++ )
+                sRet.nValue = nA == v[i].nValue;
+            break;
+
+          case SWQ_BETWEEN:
+            sRet.nValue = nA >= nB && nA <= v[2].nValue;
+            break;
+
+          case SWQ_ISNULL: sRet.nValue = v[0].bNull; break;
+
+          // Overflows are reported by the swq evaluator.
+          case SWQ_ADD:
+            if( (nB > 0 && nA > std::numeric_limits<GIntBig>::max() - nB) ||
+                (nB < 0 && nA < std::numeric_limits<GIntBig>::min() - nB) )
+                return false;
+            sRet.nValue = nA + nB;
+            break;
+
+          case SWQ_SUBTRACT:
+            if( (nB < 0 && nA > std::numeric_limits<GIntBig>::max() + nB) ||
+                (nB > 0 && nA < std::numeric_limits<GIntBig>::min() + nB) )
+                return false;
+            sRet.nValue = nA - nB;
+            break;
+
+          case SWQ_MULTIPLY:
+          {
+            const double dfProduct =
+                static_cast<double>(nA) * static_cast<double>(nB);
+            // Exact below 2^53, and conservative above.
+            if( std::fabs(dfProduct) >= 9007199254740992.0 )
+                return false;
+            sRet.nValue = nA * nB;
+            break;
+          }
+
+          case SWQ_DIVIDE:
+            if( nB == 0 )
+                sRet.nValue = INT_MAX;
+            else if( nB == -1 && nA == std::numeric_limits<GIntBig>::min() )
+                return false;
+            else
+                sRet.nValue = nA / nB;
+            break;
+
+          case SWQ_MODULUS:
+            if( nB == 0 )
+                sRet.nValue = INT_MAX;
+            else if( nB == -1 )
+                return false;
+            else
+                sRet.nValue = nA % nB;
+            break;
+
+          default:
+            return false;
+        }
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Dates are compared by the swq evaluator.                        */
+/* -------------------------------------------------------------------- */
+    else if( v[0].eType == SWQ_TIMESTAMP )
+    {
+        return false;
+    }
+
+/* -------------------------------------------------------------------- */
+/*      String operations.                                              */
+/* -------------------------------------------------------------------- */
+    else
+    {
+        for( int i = 0; i < nSubExprCount; i++ )
+        {
+            if( v[i].pszValue == nullptr )
+                return false;
+        }
+
+        if( eOperation != SWQ_ISNULL )
+        {
+            for( int i = 0; i < nSubExprCount; i++ )
+            {
+                if( !v[i].bNull )
+                    continue;
+                if( eResultType != SWQ_BOOLEAN )
+                    return false;
+                pasValues[0] = sRet;
+                return true;
+            }
+        }
+
+        switch( eOperation )
+        {
+          case SWQ_EQ:
+            if( (v[0].eType == SWQ_TIMESTAMP || v[0].eType == SWQ_STRING) &&
+                (v[1].eType == SWQ_TIMESTAMP || v[1].eType == SWQ_STRING) )
+                sRet.nValue = swq_test_timestamp_equal(v[0].pszValue,
+                                                       v[1].pszValue);
+            else
+                sRet.nValue = strcasecmp(v[0].pszValue, v[1].pszValue) == 0;
+            break;
+
+          case SWQ_NE:
+            sRet.nValue = strcasecmp(v[0].pszValue, v[1].pszValue) != 0;
+            break;
+          case SWQ_GT:
+            sRet.nValue = strcasecmp(v[0].pszValue, v[1].pszValue) > 0;
+            break;
+          case SWQ_LT:
+            sRet.nValue = strcasecmp(v[0].pszValue, v[1].pszValue) < 0;
+            break;
+          case SWQ_GE:
+            sRet.nValue = strcasecmp(v[0].pszValue, v[1].pszValue) >= 0;
+            break;
+          case SWQ_LE:
+            sRet.nValue = strcasecmp(v[0].pszValue, v[1].pszValue) <= 0;
+            break;
+
+          case SWQ_IN:
+            for( int i = 1; i < nSubExprCount && !sRet.nValue; i++ )
+                sRet.nValue = strcasecmp(v[0].pszValue, v[i].pszValue) == 0;
+            break;
+
+          case SWQ_BETWEEN:
+            sRet.nValue = strcasecmp(v[0].pszValue, v[1].pszValue) >= 0 &&
+                          strcasecmp(v[0].pszValue, v[2].pszValue) <= 0;
+            break;
+
+          case SWQ_LIKE:
+            sRet.nValue = swq_test_like(v[0].pszValue, v[1].pszValue,
+                                        nSubExprCount == 3 ?
+                                            v[2].pszValue[0] : '\0');
+            break;
+
+          case SWQ_ISNULL: sRet.nValue = v[0].bNull; break;
+
+          default:
+            return false;
+        }
+    }
+
+    pasValues[0] = sRet;
+    return true;
+}
+
+/************************************************************************/
+/*                        OGRFeatureQueryProgram                        */
+/************************************************************************/
+
+class OGRFeatureQueryProgram
+{
+    struct Instruction
+    {
+        OGRFeatureQueryOpcode eOpcode;
+        int            nArg;
+        swq_op         eOperation;
+        int            nSubExprCount;
+        swq_field_type eResultType;
+    };
+
+    OGRFeatureDefn *m_poDefn;
+    swq_expr_node  *m_poExpr;   // Constant folded copy of the expression
+
+    std::vector<Instruction> m_aoInstructions{};
+    std::vector<OGRFeatureQueryValue> m_asConstants{};
+    std::vector<swq_expr_node*> m_apoSubTrees{};
+    int             m_nStackDepth = 0;
+    int             m_nMaxStackDepth = 0;
+
+    void        Emit( OGRFeatureQueryOpcode eOpcode, int nArg );
+    void        EmitSubTree( swq_expr_node *poNode );
+    void        EmitNode( swq_expr_node *poNode );
+
+    CPL_DISALLOW_COPY_ASSIGN(OGRFeatureQueryProgram)
+
+  public:
+    OGRFeatureQueryProgram( OGRFeatureDefn *poDefn, swq_expr_node *poExpr );
+    ~OGRFeatureQueryProgram();
+
+    bool        IsUseful() const;
+    bool        Evaluate( OGRFeature *poFeature, int &bResult ) const;
+};
+
+/************************************************************************/
+/*                      OGRFeatureQueryFoldNode()                       */
+/*                                                                      */
+/*      Replace operations on constants by their result.  Returns the   */
+/*      node to use instead of poNode, which is then destroyed.         */
+/************************************************************************/
+
+static swq_expr_node *OGRFeatureQueryFoldNode( swq_expr_node *poNode )
+{
+    if( poNode->eNodeType != SNT_OPERATION )
+        return poNode;
+
+    bool bAllConstants = true;
+    for( int i = 0; i < poNode->nSubExprCount; i++ )
+    {
+        poNode->papoSubExpr[i] =
+            OGRFeatureQueryFoldNode(poNode->papoSubExpr[i]);
+        if( poNode->papoSubExpr[i]->eNodeType != SNT_CONSTANT )
+            bAllConstants = false;
+    }
+    if( !bAllConstants || poNode->nOperation == SWQ_CUSTOM_FUNC ||
+        poNode->field_type == SWQ_GEOMETRY )
+        return poNode;
+
+    // Keep operations that fail, so that the error is still reported
+    // while filtering.
+    swq_expr_node *poResult = nullptr;
+    {
+        CPLErrorStateBackuper oErrorStateBackuper;
+        CPLErrorHandlerPusher oErrorHandlerPusher(CPLQuietErrorHandler);
+        CPLErrorReset();
+        poResult = poNode->Evaluate(nullptr, nullptr);
+        if( poResult != nullptr && CPLGetLastErrorType() != CE_None )
+        {
+            delete poResult;
+            poResult = nullptr;
+        }
+    }
+    if( poResult == nullptr )
+        return poNode;
+
+    delete poNode;
+    return poResult;
+}
+
+/************************************************************************/
+/*                       OGRFeatureQueryProgram()                       */
+/************************************************************************/
+
+OGRFeatureQueryProgram::OGRFeatureQueryProgram( OGRFeatureDefn *poDefn,
+                                                swq_expr_node *poExpr ) :
+    m_poDefn(poDefn),
+    m_poExpr(OGRFeatureQueryFoldNode(poExpr->Clone()))
+{
+    EmitNode(m_poExpr);
+}
+
+/************************************************************************/
+/*                      ~OGRFeatureQueryProgram()                       */
+/************************************************************************/
+
+OGRFeatureQueryProgram::~OGRFeatureQueryProgram()
+{
+    delete m_poExpr;
+}
+
+/************************************************************************/
+/*                                Emit()                                */
+/************************************************************************/
+
+void OGRFeatureQueryProgram::Emit( OGRFeatureQueryOpcode eOpcode, int nArg )
+{
+    Instruction sInstr;
+    sInstr.eOpcode = eOpcode;
+    sInstr.nArg = nArg;
+    sInstr.eOperation = SWQ_OR;
+    sInstr.nSubExprCount = 0;
+    sInstr.eResultType = SWQ_OTHER;
+    m_aoInstructions.push_back(sInstr);
+
+    if( eOpcode < OFQ_AND_SHORTCUT )
+    {
+        m_nStackDepth++;
+        m_nMaxStackDepth = std::max(m_nMaxStackDepth, m_nStackDepth);
+    }
+}
+
+/************************************************************************/
+/*                            EmitSubTree()                             */
+/************************************************************************/
+
+void OGRFeatureQueryProgram::EmitSubTree( swq_expr_node *poNode )
+{
+    Emit(OFQ_PUSH_SUBTREE, static_cast<int>(m_apoSubTrees.size()));
+    m_apoSubTrees.push_back(poNode);
+}
+
+/************************************************************************/
+/*                              EmitNode()                              */
+/************************************************************************/
+
+void OGRFeatureQueryProgram::EmitNode( swq_expr_node *poNode )
+{
+    if( poNode->eNodeType == SNT_CONSTANT )
+    {
+        if( poNode->field_type == SWQ_GEOMETRY )
+        {
+            EmitSubTree(poNode);
+            return;
+        }
+        const OGRFeatureQueryValue sValue = {
+            poNode->field_type, CPL_TO_BOOL(poNode->is_null),
+            poNode->int_value, poNode->float_value, poNode->string_value };
+        Emit(OFQ_PUSH_CONSTANT, static_cast<int>(m_asConstants.size()));
+        m_asConstants.push_back(sValue);
+        return;
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Columns are fetched like OGRFeatureFetcher() does.  Strings     */
+/*      are only read directly from string fields, as the value of      */
+/*      GetFieldAsString() on other fields does not outlive the next    */
+/*      call.                                                           */
+/* -------------------------------------------------------------------- */
+    if( poNode->eNodeType == SNT_COLUMN )
+    {
+        if( poNode->field_index < 0 || poNode->table_index != 0 )
+        {
+            EmitSubTree(poNode);
+            return;
+        }
+        const int iField =
+            OGRFeatureFetcherFixFieldIndex(m_poDefn, poNode->field_index);
+        switch( poNode->field_type )
+        {
+          case SWQ_INTEGER:
+          case SWQ_BOOLEAN:
+            Emit(OFQ_PUSH_INTEGER, iField);
+            break;
+
+          case SWQ_INTEGER64:
+            Emit(OFQ_PUSH_INTEGER64, iField);
+            break;
+
+          case SWQ_FLOAT:
+            Emit(OFQ_PUSH_REAL, iField);
+            break;
+
+          case SWQ_STRING:
+            if( iField < m_poDefn->GetFieldCount() &&
+                m_poDefn->GetFieldDefn(iField)->GetType() == OFTString )
+                Emit(OFQ_PUSH_STRING, iField);
+            else
+                EmitSubTree(poNode);
+            break;
+
+          default:
+            EmitSubTree(poNode);
+            break;
+        }
+        return;
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Only compile operations whose operand types cannot make the     */
+/*      swq evaluator fail.                                             */
+/* -------------------------------------------------------------------- */
+    const swq_op eOperation = static_cast<swq_op>(poNode->nOperation);
+    bool bAllIntegers = poNode->nSubExprCount > 0;
+    bool bAllNumbers = bAllIntegers;
+    bool bAllStrings = bAllIntegers;
+    for( int i = 0; i < poNode->nSubExprCount; i++ )
+    {
+        const swq_field_type eType = poNode->papoSubExpr[i]->field_type;
+        if( !SWQ_IS_INTEGER(eType) && eType != SWQ_BOOLEAN )
+            bAllIntegers = false;
+        if( !SWQ_IS_INTEGER(eType) && eType != SWQ_BOOLEAN &&
+            eType != SWQ_FLOAT )
+            bAllNumbers = false;
+        if( eType != SWQ_STRING )
+            bAllStrings = false;
+    }
+
+    bool bCompile = false;
+    switch( eOperation )
+    {
+      case SWQ_OR:
+      case SWQ_AND:
+        bCompile = poNode->field_type == SWQ_BOOLEAN && bAllIntegers &&
+                   poNode->nSubExprCount == 2;
+        break;
+
+      case SWQ_NOT:
+        bCompile = poNode->field_type == SWQ_BOOLEAN && bAllIntegers;
+        break;
+
+      case SWQ_EQ:
+      case SWQ_NE:
+      case SWQ_GE:
+      case SWQ_LE:
+      case SWQ_LT:
+      case SWQ_GT:
+      case SWQ_ISNULL:
+      case SWQ_IN:
+      case SWQ_BETWEEN:
+        bCompile = poNode->field_type == SWQ_BOOLEAN &&
+                   (bAllNumbers || bAllStrings);
+        break;
+
+      case SWQ_LIKE:
+        bCompile = poNode->field_type == SWQ_BOOLEAN && bAllStrings;
+        break;
+
+      case SWQ_ADD:
+      case SWQ_SUBTRACT:
+      case SWQ_MULTIPLY:
+      case SWQ_DIVIDE:
+      case SWQ_MODULUS:
+        bCompile = (poNode->field_type == SWQ_FLOAT ||
+                    SWQ_IS_INTEGER(poNode->field_type)) && bAllNumbers;
+        break;
+
+      default:
+        break;
+    }
+    if( !bCompile )
+    {
+        EmitSubTree(poNode);
+        return;
+    }
+
+/* -------------------------------------------------------------------- */
+/*      AND and OR skip their second operand when the first one is      */
+/*      enough to decide the result.  This is only done when the        */
+/*      result is the same as when evaluating the second operand: for   */
+/*      OR, a null or failing second operand would make it false.       */
+/* -------------------------------------------------------------------- */
+    EmitNode(poNode->papoSubExpr[0]);
+    size_t iShortcut = 0;
+    if( eOperation == SWQ_AND || eOperation == SWQ_OR )
+    {
+        iShortcut = m_aoInstructions.size();
+        Emit(eOperation == SWQ_AND ? OFQ_AND_SHORTCUT : OFQ_OR_SHORTCUT, 0);
+    }
+    const size_t nSubTreesBefore = m_apoSubTrees.size();
+    for( int i = 1; i < poNode->nSubExprCount; i++ )
+        EmitNode(poNode->papoSubExpr[i]);
+
+    Instruction sInstr;
+    sInstr.eOpcode = OFQ_OPERATION;
+    sInstr.nArg = 0;
+    sInstr.eOperation = eOperation;
+    sInstr.nSubExprCount = poNode->nSubExprCount;
+    sInstr.eResultType = poNode->field_type;
+    m_aoInstructions.push_back(sInstr);
+    m_nStackDepth -= poNode->nSubExprCount - 1;
+
+    if( eOperation == SWQ_AND || eOperation == SWQ_OR )
+    {
+        Instruction& sShortcut = m_aoInstructions[iShortcut];
+        sShortcut.nArg = static_cast<int>(m_aoInstructions.size());
+        // For OR, nSubExprCount tells whether a true first operand is
+        // enough: the second one must be a compiled boolean operation,
+        // that is never null, and without sub-trees that could fail.
+        const Instruction& sLast =
+            m_aoInstructions[m_aoInstructions.size() - 2];
+        sShortcut.nSubExprCount =
+            sLast.eOpcode == OFQ_OPERATION &&
+            sLast.eResultType == SWQ_BOOLEAN &&
+            m_apoSubTrees.size() == nSubTreesBefore;
+    }
+}
+
+/************************************************************************/
+/*                              IsUseful()                              */
+/*                                                                      */
+/*      Whether the program does more than handing the whole            */
+/*      expression to swq.                                              */
+/************************************************************************/
+
+bool OGRFeatureQueryProgram::IsUseful() const
+{
+    return !(m_aoInstructions.size() == 1 &&
+             m_aoInstructions[0].eOpcode == OFQ_PUSH_SUBTREE);
+}
+
+/************************************************************************/
+/*                              Evaluate()                              */
+/*                                                                      */
+/*      Returns false if the expression must be evaluated by swq.       */
+/************************************************************************/
+
+bool OGRFeatureQueryProgram::Evaluate( OGRFeature *poFeature,
+                                       int &bResult ) const
+{
+    OGRFeatureQueryValue asLocalStack[OFQ_LOCAL_STACK_SIZE];
+    std::vector<OGRFeatureQueryValue> asHeapStack;
+    OGRFeatureQueryValue *pasStack = asLocalStack;
+    if( m_nMaxStackDepth > OFQ_LOCAL_STACK_SIZE )
+    {
+        asHeapStack.resize(m_nMaxStackDepth);
+        pasStack = asHeapStack.data();
+    }
+    int nDepth = 0;
+
+    // Results of sub-trees, that hold the strings they point to.
+    std::vector<std::unique_ptr<swq_expr_node>> apoSubTreeResults;
+
+    const size_t nInstructions = m_aoInstructions.size();
+    for( size_t iInstr = 0; iInstr < nInstructions; iInstr++ )
+    {
+        const Instruction& sInstr = m_aoInstructions[iInstr];
+        switch( sInstr.eOpcode )
+        {
+          case OFQ_PUSH_CONSTANT:
+            pasStack[nDepth++] = m_asConstants[sInstr.nArg];
+            break;
+
+          case OFQ_PUSH_INTEGER:
+          case OFQ_PUSH_INTEGER64:
+          case OFQ_PUSH_REAL:
+          case OFQ_PUSH_STRING:
+          {
+            OGRFeatureQueryValue& sValue = pasStack[nDepth++];
+            sValue.bNull = !poFeature->IsFieldSetAndNotNull(sInstr.nArg);
+            sValue.nValue = 0;
+            sValue.dfValue = 0.0;
+            sValue.pszValue = nullptr;
+            if( sInstr.eOpcode == OFQ_PUSH_INTEGER )
+            {
+                sValue.eType = SWQ_INTEGER;
+                sValue.nValue = poFeature->GetFieldAsInteger(sInstr.nArg);
+            }
+            else if( sInstr.eOpcode == OFQ_PUSH_INTEGER64 )
+            {
+                sValue.eType = SWQ_INTEGER64;
+                sValue.nValue = poFeature->GetFieldAsInteger64(sInstr.nArg);
+            }
+            else if( sInstr.eOpcode == OFQ_PUSH_REAL )
+            {
+                sValue.eType = SWQ_FLOAT;
+                sValue.dfValue = poFeature->GetFieldAsDouble(sInstr.nArg);
+            }
+            else
+            {
+                // In case the field type was altered after compilation
+                if( poFeature->GetFieldDefnRef(sInstr.nArg)->GetType() !=
+                                                                OFTString )
+                    return false;
+                sValue.eType = SWQ_STRING;
+                sValue.pszValue = poFeature->GetFieldAsString(sInstr.nArg);
+            }
+            break;
+          }
+
+          case OFQ_PUSH_SUBTREE:
+          {
+            swq_expr_node *poResult = m_apoSubTrees[sInstr.nArg]->Evaluate(
+                                            OGRFeatureFetcher, poFeature);
+            if( poResult == nullptr )
+            {
+                bResult = FALSE;
+                return true;
+            }
+            apoSubTreeResults.emplace_back(poResult);
+            const OGRFeatureQueryValue sValue = {
+                poResult->field_type, CPL_TO_BOOL(poResult->is_null),
+                poResult->int_value, poResult->float_value,
+                poResult->string_value };
+            pasStack[nDepth++] = sValue;
+            break;
+          }
+
+          case OFQ_AND_SHORTCUT:
+          case OFQ_OR_SHORTCUT:
+          {
+            OGRFeatureQueryValue& sValue = pasStack[nDepth - 1];
+            if( !SWQ_IS_INTEGER(sValue.eType) &&
+                sValue.eType != SWQ_BOOLEAN )
+                return false;
+            bool bDecided = sValue.bNull;
+            bool bDecidedValue = false;
+            if( sInstr.eOpcode == OFQ_AND_SHORTCUT )
+                bDecided = bDecided || sValue.nValue == 0;
+            else if( !bDecided && sInstr.nSubExprCount &&
+                     sValue.nValue != 0 )
+                bDecided = bDecidedValue = true;
+            if( bDecided )
+            {
+                const OGRFeatureQueryValue sDecided = {
+                    SWQ_BOOLEAN, false, bDecidedValue ? 1 : 0, 0.0, nullptr };
+                sValue = sDecided;
+                iInstr = static_cast<size_t>(sInstr.nArg) - 1;
+            }
+            break;
+          }
+
+          case OFQ_OPERATION:
+            nDepth -= sInstr.nSubExprCount;
+            if( !OGRFeatureQueryEvaluateOperation(sInstr.eOperation,
+                                                  sInstr.nSubExprCount,
+                                                  sInstr.eResultType,
+                                                  pasStack + nDepth) )
+                return false;
+            nDepth++;
+            break;
+        }
+    }
+
+    CPLAssert( nDepth == 1 );
+    const OGRFeatureQueryValue& sResult = pasStack[0];
+    bResult = (SWQ_IS_INTEGER(sResult.eType) ||
+               sResult.eType == SWQ_BOOLEAN) &&
+              CPL_TO_BOOL(static_cast<int>(sResult.nValue));
+    return true;
+}
+
+} // namespace
+
 /************************************************************************/
 /*                          OGRFeatureQuery()                           */
 /************************************************************************/
 
 OGRFeatureQuery::OGRFeatureQuery() :
     poTargetDefn(nullptr),
-    pSWQExpr(nullptr)
+    pSWQExpr(nullptr),
+    pProgram(nullptr)
 {}
 
 /************************************************************************/
@@ -73,6 +859,7 @@ OGRFeatureQuery::OGRFeatureQuery() :
 OGRFeatureQuery::~OGRFeatureQuery()
 
 {
+    delete static_cast<OGRFeatureQueryProgram *>(pProgram);
     delete static_cast<swq_expr_node *>(pSWQExpr);
 }
 
@@ -117,6 +904,8 @@ OGRFeatureQuery::Compile( OGRLayer *poLayer,
                           swq_custom_func_registrar *poCustomFuncRegistrar )
 {
     // Clear any existing expression.
+    delete static_cast<OGRFeatureQueryProgram *>(pProgram);
+    pProgram = nullptr;
     if( pSWQExpr != nullptr )
     {
         delete static_cast<swq_expr_node *>(pSWQExpr);
@@ -242,6 +1031,17 @@ OGRFeatureQuery::Compile( OGRLayer *poLayer,
         eErr = OGRERR_CORRUPT_DATA;
         pSWQExpr = nullptr;
     }
+    // Field types are only known in checked expressions.
+    else if( bCheck && pSWQExpr != nullptr &&
+             CPLTestBool(CPLGetConfigOption("OGR_SQL_COMPILE_WHERE", "YES")) )
+    {
+        OGRFeatureQueryProgram *poProgram = new OGRFeatureQueryProgram(
+            poDefn, static_cast<swq_expr_node *>(pSWQExpr));
+        if( poProgram->IsUseful() )
+            pProgram = poProgram;
+        else
+            delete poProgram;
+    }
 
     CPLFree(papszFieldNames);
     CPLFree(paeFieldTypes);
@@ -333,6 +1133,14 @@ int OGRFeatureQuery::Evaluate( OGRFeature *poFeature )
     if( pSWQExpr == nullptr )
         return FALSE;
 
+    if( pProgram != nullptr && poFeature->GetDefnRef() == poTargetDefn )
+    {
+        int bResult = FALSE;
+        if( static_cast<OGRFeatureQueryProgram *>(pProgram)->
+                                            Evaluate(poFeature, bResult) )
+            return bResult;
+    }
+
     swq_expr_node *poResult =
         static_cast<swq_expr_node *>(pSWQExpr)->
             Evaluate(OGRFeatureFetcher, poFeature);
@@ -351,6 +1159,106 @@ int OGRFeatureQuery::Evaluate( OGRFeature *poFeature )
     return bLogicalResult;
 }
 
+/************************************************************************/
+/*                  OGRFeatureQueryIsRangeOperation()                   */
+/*                                                                      */
+/*      Whether the node is a comparison of a column with constants     */
+/*      that an index supporting range queries can resolve.             */
+/************************************************************************/
+
+static bool OGRFeatureQueryIsRangeOperation( swq_expr_node *psExpr )
+{
+    switch( psExpr->nOperation )
+    {
+      case SWQ_LT:
+      case SWQ_LE:
+      case SWQ_GT:
+      case SWQ_GE:
+        return psExpr->nSubExprCount == 2;
+      case SWQ_BETWEEN:
+        return psExpr->nSubExprCount == 3 &&
+               psExpr->papoSubExpr[2]->eNodeType == SNT_CONSTANT;
+      default:
+        return false;
+    }
+}
+
+/************************************************************************/
+/*                     OGRFeatureQueryGetRangeBound()                   */
+/*                                                                      */
+/*      Convert a constant to a range bound on a field of the given     */
+/*      type.  Bounds of integer fields compared to non integral        */
+/*      values are rounded towards the inside of the range.  Returns    */
+/*      false if the constant cannot be expressed as a bound, in        */
+/*      which case the index must not be used.                          */
+/************************************************************************/
+
+static bool OGRFeatureQueryGetRangeBound( OGRFieldType eType,
+                                          swq_expr_node *poValue,
+                                          bool bLower, OGRField &sBound,
+                                          bool &bInclusive )
+{
+    if( poValue->is_null )
+        return false;
+
+    const bool bNumeric = poValue->field_type == SWQ_INTEGER ||
+                          poValue->field_type == SWQ_INTEGER64 ||
+                          poValue->field_type == SWQ_FLOAT;
+    switch( eType )
+    {
+      case OFTInteger:
+      case OFTInteger64:
+      {
+        if( !bNumeric )
+            return false;
+        GIntBig nBound = poValue->int_value;
+        if( poValue->field_type == SWQ_FLOAT )
+        {
+            double dfBound = poValue->float_value;
+            if( CPLIsNan(dfBound) )
+                return false;
+            if( dfBound != std::floor(dfBound) )
+            {
+                dfBound = bLower ? std::ceil(dfBound) : std::floor(dfBound);
+                bInclusive = true;
+            }
+            // Stay clear of the limits of GIntBig.
+            if( dfBound < -9.0e18 || dfBound > 9.0e18 )
+                return false;
+            nBound = static_cast<GIntBig>(dfBound);
+        }
+        if( eType == OFTInteger )
+        {
+            if( nBound < INT_MIN || nBound > INT_MAX )
+                return false;
+            sBound.Integer = static_cast<int>(nBound);
+        }
+        else
+        {
+            sBound.Integer64 = nBound;
+        }
+        return true;
+      }
+
+      case OFTReal:
+        if( !bNumeric )
+            return false;
+        sBound.Real = poValue->field_type == SWQ_FLOAT ?
+            poValue->float_value : static_cast<double>(poValue->int_value);
+        return !CPLIsNan(sBound.Real);
+
+      case OFTString:
+        if( poValue->field_type != SWQ_STRING ||
+            poValue->string_value == nullptr )
+            return false;
+        sBound.String = poValue->string_value;
+        return true;
+
+      default:
+        return false;
+    }
+}
+
 /************************************************************************/
 /*                            CanUseIndex()                             */
 /************************************************************************/
@@ -380,7 +1288,9 @@ int OGRFeatureQuery::CanUseIndex( swq_expr_node *psExpr,
                CanUseIndex(psExpr->papoSubExpr[1], poLayer);
     }
 
-    if( !(psExpr->nOperation == SWQ_EQ || psExpr->nOperation == SWQ_IN)
+    const bool bRange = OGRFeatureQueryIsRangeOperation(psExpr);
+    if( !(psExpr->nOperation == SWQ_EQ || psExpr->nOperation == SWQ_IN ||
+          bRange)
         || psExpr->nSubExprCount < 2 )
         return FALSE;
 
@@ -398,6 +1308,9 @@ int OGRFeatureQuery::CanUseIndex( swq_expr_node *psExpr,
     if( poIndex == nullptr )
         return FALSE;
 
+    if( bRange && !poIndex->SupportsRangeQueries() )
+        return FALSE;
+
     // Have an index.
     return TRUE;
 }
@@ -411,9 +1324,9 @@ int OGRFeatureQuery::CanUseIndex( swq_expr_node *psExpr,
 /*      available indices, or an "OGRNullFID" terminated list of        */
 /*      FIDs if it can.                                                 */
 /*                                                                      */
-/*      For now we only support equality tests on a single indexed      */
-/*      attribute field.  Eventually we should make this support        */
-/*      multi-part queries with ranges.                                 */
+/*      Equality, IN and, for indexes that support them, range tests    */
+/*      on indexed attribute fields are supported, possibly combined    */
+/*      with AND and OR.                                                */
 /************************************************************************/
 
 static int CompareGIntBig( const void *pa, const void *pb )
@@ -604,7 +1517,9 @@ GIntBig *OGRFeatureQuery::EvaluateAgainstIndices( swq_expr_node *psExpr,
         return panFIDList;
     }
 
-    if( !(psExpr->nOperation == SWQ_EQ || psExpr->nOperation == SWQ_IN)
+    const bool bRange = OGRFeatureQueryIsRangeOperation(psExpr);
+    if( !(psExpr->nOperation == SWQ_EQ || psExpr->nOperation == SWQ_IN ||
+          bRange)
         || psExpr->nSubExprCount < 2 )
         return nullptr;
 
@@ -628,6 +1543,58 @@ GIntBig *OGRFeatureQuery::EvaluateAgainstIndices( swq_expr_node *psExpr,
     OGRFieldDefn *poFieldDefn =
         poLayer->GetLayerDefn()->GetFieldDefn(nIdx);
 
+    // Handle the case of a range, if the index supports it.
+    if( bRange )
+    {
+        if( !poIndex->SupportsRangeQueries() )
+            return nullptr;
+
+        OGRField sMin;
+        OGRField sMax;
+        bool bHasMin = false;
+        bool bHasMax = false;
+        bool bMinInclusive = true;
+        bool bMaxInclusive = true;
+        bool bOK = true;
+        const OGRFieldType eType = poFieldDefn->GetType();
+        switch( psExpr->nOperation )
+        {
+          case SWQ_GT:
+          case SWQ_GE:
+            bHasMin = true;
+            bMinInclusive = psExpr->nOperation == SWQ_GE;
+            bOK = OGRFeatureQueryGetRangeBound(eType, poValue, true,
+                                               sMin, bMinInclusive);
+            break;
+
+          case SWQ_LT:
+          case SWQ_LE:
+            bHasMax = true;
+            bMaxInclusive = psExpr->nOperation == SWQ_LE;
+            bOK = OGRFeatureQueryGetRangeBound(eType, poValue, false,
+                                               sMax, bMaxInclusive);
+            break;
+
+          default:
+            bHasMin = true;
+            bHasMax = true;
+            bOK = OGRFeatureQueryGetRangeBound(eType, poValue, true,
+                                               sMin, bMinInclusive) &&
+                  OGRFeatureQueryGetRangeBound(eType, psExpr->papoSubExpr[2],
+                                               false, sMax, bMaxInclusive);
+            break;
+        }
+        if( !bOK )
+            return nullptr;
+
+        int nFIDCount32 = 0;
+        GIntBig *panFIDs = poIndex->GetRangeMatches(
+            bHasMin ? &sMin : nullptr, bMinInclusive,
+            bHasMax ? &sMax : nullptr, bMaxInclusive, &nFIDCount32);
+        nFIDCount = nFIDCount32;
+        return panFIDs;
+    }
+
     // Handle the case of an IN operation.
     if( psExpr->nOperation == SWQ_IN )
     {
@@ -33,7 +33,10 @@
 
 #include "ogrsf_frmts.h"
 
+#include <memory>
 #include <set>
+#include <string>
+#include <vector>
 
 #if defined(_MSC_VER) && _MSC_VER <= 1600 // MSVC <= 2010
 # define GDAL_OVERRIDE
@@ -53,6 +56,7 @@ typedef enum
 } OGRCSVGeometryFormat;
 
 class OGRCSVDataSource;
+class CPLWorkerThreadPool;
 
 char **OGRCSVReadParseLineL( VSILFILE *fp, char chDelimiter,
                              bool bDontHonourStrings = false,
@@ -68,6 +72,50 @@ typedef enum
 
 void OGRCSVDriverRemoveFromMap(const char *pszName, GDALDataset *poDS);
 
+/************************************************************************/
+/*                         OGRCSVRecordSplitter                         */
+/*                                                                      */
+/*      Cut a stream of CSV bytes into records, with the same rules as  */
+/*      OGRCSVReadParseLineL(): lines end with LF, CR, CRLF or LFCR,    */
+/*      and a record goes on while it has an odd number of quotes.      */
+/*      Empty records are skipped, as GetNextLineTokens() does.         */
+/************************************************************************/
+
+class OGRCSVRecordSplitter
+{
+    bool                m_bHonourQuotes;
+    bool                m_bKeepText;
+
+    vsi_l_offset        m_nOffset = 0;
+    vsi_l_offset        m_nRecordStart = 0;
+    bool                m_bOddQuotes = false;
+    char                m_chLastEOL = 0;
+    size_t              m_nRecordSize = 0;
+    GByte               m_abyRecordStart[3] = { 0, 0, 0 };
+    std::string         m_osRecord{};
+
+    std::vector<vsi_l_offset> m_anOffsets{};
+    std::string         m_osTexts{};
+    std::vector<size_t> m_anTextOffsets{};
+
+    void                EndRecord();
+
+  public:
+    OGRCSVRecordSplitter( bool bHonourQuotes, bool bKeepText );
+
+    void                Reset( vsi_l_offset nOffset );
+    void                Feed( const char *pabyData, size_t nLen );
+    void                Finish();
+
+    size_t              GetRecordCount() const { return m_anOffsets.size(); }
+    size_t              GetTextSize() const { return m_osTexts.size(); }
+    vsi_l_offset        GetNextRecordOffset() const;
+
+    void                TakeRecords( std::vector<vsi_l_offset> &anOffsets,
+                                     std::string &osTexts,
+                                     std::vector<size_t> &anTextOffsets );
+};
+
 /************************************************************************/
 /*                             OGRCSVLayer                              */
 /************************************************************************/
@@ -142,8 +190,61 @@ class OGRCSVLayer : public OGRLayer
 
     StringQuoting       m_eStringQuoting = StringQuoting::IF_AMBIGUOUS;
 
+    // FIDs that may match the filters, from the attribute or spatial index.
+    GIntBig            *m_panMatchingFIDs = nullptr;
+    GIntBig             m_iMatchingFID = 0;
+    bool                m_bMatchingFIDsEvaluated = false;
+
+    OGRFeature         *GetNextMatchingFeature();
+
     char              **GetNextLineTokens();
 
+    OGRFeature         *TranslateRecord( char **papszTokens, int nFID,
+                                         bool &bWarned,
+                                         CPLString *posDeferredWarning );
+
+    // Parallel translation of records, with OGR_CSV_NUM_THREADS.
+    struct TranslateJob
+    {
+        OGRCSVLayer    *poLayer = nullptr;
+        size_t          nFirstRecord = 0;
+        size_t          nLastRecord = 0;
+        int             nFirstFID = 0;
+        bool            bWarned = false;
+        CPLString       osWarning{};
+    };
+
+    int                 m_nThreads = -1;
+    std::unique_ptr<CPLWorkerThreadPool> m_poThreadPool{};
+    std::unique_ptr<OGRCSVRecordSplitter> m_poSplitter{};
+    bool                m_bParallelReadFinished = false;
+    std::vector<char>   m_abyReadBuffer{};
+    std::vector<vsi_l_offset> m_anBatchOffsets{};
+    std::string         m_osBatchTexts{};
+    std::vector<size_t> m_anBatchTextOffsets{};
+    std::vector<OGRFeature *> m_apoBatchFeatures{};
+    size_t              m_iNextBatchFeature = 0;
+
+    OGRFeature         *GetNextUnfilteredFeatureParallel();
+    bool                TranslateNextBatch();
+    void                StopParallelReading( bool bSeekToNextRecord );
+    static void         TranslateBatchJob( void *pData );
+
+    // Persisted index of the offsets of the records, with ROW_OFFSET_INDEX.
+    bool                m_bUseRowOffsetIndex = false;
+    bool                m_bRowOffsetIndexEvaluated = false;
+    VSILFILE           *m_fpRowOffsetIndex = nullptr;
+    std::vector<GUIntBig> m_anRowOffsets{};
+    GIntBig             m_nRowOffsetCount = -1;
+
+    bool                LoadOrBuildRowOffsetIndex();
+    bool                BuildRowOffsetIndex( const char *pszIndexFilename,
+                                             GUIntBig nSourceSize,
+                                             GIntBig nSourceMTime,
+                                             vsi_l_offset nDataStart );
+    bool                GetRowOffset( GIntBig nFID, vsi_l_offset &nOffset );
+    void                InvalidateRowOffsetIndex();
+
     static bool         Matches( const char *pszFieldName,
                                  char **papszPossibleNames );
 
@@ -173,6 +274,7 @@ class OGRCSVLayer : public OGRLayer
     void                ResetReading() override;
     OGRFeature         *GetNextFeature() override;
     virtual OGRFeature *GetFeature( GIntBig nFID ) override;
+    virtual OGRErr      SetNextByIndex( GIntBig nIndex ) override;
 
     OGRFeatureDefn     *GetLayerDefn() override { return poFeatureDefn; }
 
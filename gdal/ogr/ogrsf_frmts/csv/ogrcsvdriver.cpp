@@ -374,6 +374,7 @@ void RegisterOGRCSV()
 "    <Value>AUTO</Value>"
 "  </Option>"
 "  <Option name='EMPTY_STRING_AS_NULL' type='boolean' description='Whether to consider empty strings as null fields on reading' default='NO'/>"
+"  <Option name='ROW_OFFSET_INDEX' type='boolean' description='Whether to use a .rowidx file with the offsets of records for random access' default='NO'/>"
 "</OpenOptionList>");
 
     poDriver->SetMetadataItem(GDAL_DCAP_VIRTUALIO, "YES");
@@ -40,6 +40,7 @@
 #  include <fcntl.h>
 #endif
 #include <algorithm>
+#include <cstdarg>
 #include <limits>
 #include <string>
 #include <vector>
@@ -49,6 +50,7 @@
 #include "cpl_error.h"
 #include "cpl_string.h"
 #include "cpl_vsi.h"
+#include "cpl_worker_thread_pool.h"
 #include "ogr_api.h"
 #include "ogr_core.h"
 #include "ogr_feature.h"
@@ -225,6 +227,148 @@ char **OGRCSVReadParseLineL( VSILFILE *fp, char chDelimiter,
     return papszReturn;
 }
 
+/************************************************************************/
+/*                        OGRCSVRecordSplitter()                        */
+/************************************************************************/
+
+OGRCSVRecordSplitter::OGRCSVRecordSplitter( bool bHonourQuotes,
+                                            bool bKeepText ) :
+    m_bHonourQuotes(bHonourQuotes),
+    m_bKeepText(bKeepText)
+{}
+
+/************************************************************************/
+/*                               Reset()                                */
+/*                                                                      */
+/*      Start splitting at a record boundary of the file.               */
+/************************************************************************/
+
+void OGRCSVRecordSplitter::Reset( vsi_l_offset nOffset )
+{
+    m_nOffset = nOffset;
+    m_nRecordStart = nOffset;
+    m_bOddQuotes = false;
+    m_chLastEOL = 0;
+    m_nRecordSize = 0;
+    m_osRecord.clear();
+    m_anOffsets.clear();
+    m_osTexts.clear();
+    m_anTextOffsets.clear();
+}
+
+/************************************************************************/
+/*                              EndRecord()                             */
+/************************************************************************/
+
+void OGRCSVRecordSplitter::EndRecord()
+{
+    // OGRCSVReadParseLineL() skips a UTF-8 BOM at the start of a line, so
+    // a line made of a BOM only is an empty record.
+    const bool bBOM = m_nRecordSize >= 3 &&
+                      m_abyRecordStart[0] == 0xEF &&
+                      m_abyRecordStart[1] == 0xBB &&
+                      m_abyRecordStart[2] == 0xBF;
+    if( m_nRecordSize > (bBOM ? 3U : 0U) )
+    {
+        m_anOffsets.push_back(m_nRecordStart);
+        if( m_bKeepText )
+        {
+            m_anTextOffsets.push_back(m_osTexts.size());
+            m_osTexts.append(m_osRecord, bBOM ? 3 : 0, std::string::npos);
+            m_osTexts += '\0';
+        }
+    }
+    m_nRecordSize = 0;
+    m_bOddQuotes = false;
+    m_osRecord.clear();
+}
+
+/************************************************************************/
+/*                                Feed()                                */
+/************************************************************************/
+
+void OGRCSVRecordSplitter::Feed( const char *pabyData, size_t nLen )
+{
+    for( size_t i = 0; i < nLen; i++ )
+    {
+        const char ch = pabyData[i];
+
+        // CRLF and LFCR are a single end of line.
+        if( m_chLastEOL != 0 )
+        {
+            const char chPair = m_chLastEOL == '\r' ? '\n' : '\r';
+            m_chLastEOL = 0;
+            if( ch == chPair )
+                continue;
+        }
+
+        if( ch == '\n' || ch == '\r' )
+        {
+            m_chLastEOL = ch;
+            if( !m_bOddQuotes )
+            {
+                EndRecord();
+            }
+            else
+            {
+                // Lines of a record are joined with a LF.
+                m_nRecordSize++;
+                if( m_bKeepText )
+                    m_osRecord += '\n';
+            }
+            continue;
+        }
+
+        if( m_nRecordSize == 0 )
+            m_nRecordStart = m_nOffset + i;
+        if( m_nRecordSize < 3 )
+            m_abyRecordStart[m_nRecordSize] = static_cast<GByte>(ch);
+        m_nRecordSize++;
+        if( ch == '"' && m_bHonourQuotes )
+            m_bOddQuotes = !m_bOddQuotes;
+        if( m_bKeepText )
+            m_osRecord += ch;
+    }
+    m_nOffset += nLen;
+}
+
+/************************************************************************/
+/*                               Finish()                               */
+/************************************************************************/
+
+void OGRCSVRecordSplitter::Finish()
+{
+    EndRecord();
+    m_chLastEOL = 0;
+}
+
+/************************************************************************/
+/*                         GetNextRecordOffset()                        */
+/*                                                                      */
+/*      Offset of the first record that has not been returned yet.      */
+/************************************************************************/
+
+vsi_l_offset OGRCSVRecordSplitter::GetNextRecordOffset() const
+{
+    return m_nRecordSize > 0 ? m_nRecordStart : m_nOffset;
+}
+
+/************************************************************************/
+/*                             TakeRecords()                            */
+/************************************************************************/
+
+void OGRCSVRecordSplitter::TakeRecords( std::vector<vsi_l_offset> &anOffsets,
+                                        std::string &osTexts,
+                                        std::vector<size_t> &anTextOffsets )
+{
+    anOffsets.clear();
+    osTexts.clear();
+    anTextOffsets.clear();
+    std::swap(anOffsets, m_anOffsets);
+    std::swap(osTexts, m_osTexts);
+    std::swap(anTextOffsets, m_anTextOffsets);
+}
+
 /************************************************************************/
 /*                            OGRCSVLayer()                             */
 /*                                                                      */
@@ -339,6 +483,8 @@ void OGRCSVLayer::BuildFeatureDefn( const char *pszNfdcGeomField,
     bMergeDelimiter = CPLFetchBool(papszOpenOptions, "MERGE_SEPARATOR", false);
     bEmptyStringNull =
         CPLFetchBool(papszOpenOptions, "EMPTY_STRING_AS_NULL", false);
+    m_bUseRowOffsetIndex =
+        CPLFetchBool(papszOpenOptions, "ROW_OFFSET_INDEX", false);
 
     // If this is not a new file, read ahead to establish if it is
     // already in CRLF (DOS) mode, or just a normal unix CR mode.
@@ -1372,8 +1518,15 @@ OGRCSVLayer::~OGRCSVLayer()
     poFeatureDefn->Release();
     CPLFree(pszFilename);
 
+    StopParallelReading(false);
+
     if( fpCSV )
         VSIFCloseL(fpCSV);
+
+    if( m_fpRowOffsetIndex )
+        VSIFCloseL(m_fpRowOffsetIndex);
+
+    CPLFree(m_panMatchingFIDs);
 }
 
 /************************************************************************/
@@ -1383,6 +1536,9 @@ OGRCSVLayer::~OGRCSVLayer()
 void OGRCSVLayer::ResetReading()
 
 {
+    StopParallelReading(false);
+    m_nThreads = -1;
+
     if( fpCSV )
         VSIRewindL(fpCSV);
 
@@ -1393,6 +1549,11 @@ void OGRCSVLayer::ResetReading()
     bNeedRewindBeforeRead = false;
 
     nNextFID = 1;
+
+    CPLFree(m_panMatchingFIDs);
+    m_panMatchingFIDs = nullptr;
+    m_iMatchingFID = 0;
+    m_bMatchingFIDsEvaluated = false;
 }
 
 /************************************************************************/
@@ -1425,6 +1586,22 @@ OGRFeature *OGRCSVLayer::GetFeature(GIntBig nFID)
 {
     if( nFID < 1 || fpCSV == nullptr )
         return nullptr;
+
+    // Jump to the record with the row offset index.
+    if( m_bUseRowOffsetIndex && LoadOrBuildRowOffsetIndex() )
+    {
+        vsi_l_offset nOffset = 0;
+        if( !GetRowOffset(nFID, nOffset) )
+            return nullptr;
+        StopParallelReading(false);
+        if( VSIFSeekL(fpCSV, nOffset, SEEK_SET) != 0 )
+            return nullptr;
+        bNeedRewindBeforeRead = false;
+        nNextFID = static_cast<int>(nFID);
+        return GetNextUnfilteredFeature();
+    }
+
+    StopParallelReading(true);
     if( nFID < nNextFID || bNeedRewindBeforeRead )
         ResetReading();
     while( nNextFID < nFID )
@@ -1453,6 +1630,57 @@ OGRFeature *OGRCSVLayer::GetNextUnfilteredFeature()
     if( papszTokens == nullptr )
         return nullptr;
 
+    OGRFeature *poFeature =
+        TranslateRecord(papszTokens, nNextFID, bWarningBadTypeOrWidth,
+                        nullptr);
+
+    // Translate the record id.
+    poFeature->SetFID(nNextFID++);
+
+    m_nFeaturesRead++;
+
+    return poFeature;
+}
+
+/************************************************************************/
+/*                       OGRCSVWarnBadTypeOrWidth()                     */
+/*                                                                      */
+/*      Emit a warning, or keep it for later if the record is           */
+/*      translated by a worker thread.                                  */
+/************************************************************************/
+
+static void OGRCSVWarnBadTypeOrWidth( CPLString *posDeferredWarning,
+                                      CPL_FORMAT_STRING(const char *pszFmt),
+                                      ... ) CPL_PRINT_FUNC_FORMAT(2, 3);
+
+static void OGRCSVWarnBadTypeOrWidth( CPLString *posDeferredWarning,
+                                      CPL_FORMAT_STRING(const char *pszFmt),
+                                      ... )
+{
+    CPLString osMsg;
+    va_list args;
+    va_start(args, pszFmt);
+    osMsg.vPrintf(pszFmt, args);
+    va_end(args);
+    if( posDeferredWarning != nullptr )
+        *posDeferredWarning = osMsg;
+    else
+        CPLError(CE_Warning, CPLE_AppDefined, "%s", osMsg.c_str());
+}
+
+/************************************************************************/
+/*                           TranslateRecord()                          */
+/*                                                                      */
+/*      Build a feature from the tokens of a record, which are          */
+/*      destroyed.  Safe to call from several threads, provided that    */
+/*      each of them uses its own warning state.                        */
+/************************************************************************/
+
+OGRFeature *OGRCSVLayer::TranslateRecord( char **papszTokens, int nFID,
+                                          bool &bWarned,
+                                          CPLString *posDeferredWarning )
+
+{
     // Create the OGR feature.
     OGRFeature *poFeature = new OGRFeature(poFeatureDefn);
 
@@ -1536,14 +1764,14 @@ OGRFeature *OGRCSVLayer::GetNextUnfilteredFeature()
                 {
                     poFeature->SetField(iOGRField, 0);
                 }
-                else if( !bWarningBadTypeOrWidth )
+                else if( !bWarned )
                 {
-                    bWarningBadTypeOrWidth = true;
-                    CPLError(
-                        CE_Warning, CPLE_AppDefined,
+                    bWarned = true;
+                    OGRCSVWarnBadTypeOrWidth(
+                        posDeferredWarning,
                         "Invalid value type found in record %d for field %s. "
                         "This warning will no longer be emitted",
-                        nNextFID, poFieldDefn->GetNameRef());
+                        nFID, poFieldDefn->GetNameRef());
                 }
             }
         }
@@ -1562,31 +1790,33 @@ OGRFeature *OGRCSVLayer::GetNextUnfilteredFeature()
                 if( eType == CPL_VALUE_INTEGER || eType == CPL_VALUE_REAL )
                 {
                     poFeature->SetField(iOGRField, papszTokens[iAttr]);
-                    if( !bWarningBadTypeOrWidth &&
+                    if( !bWarned &&
                         (eFieldType == OFTInteger ||
                          eFieldType == OFTInteger64) &&
                         eType == CPL_VALUE_REAL )
                     {
-                        bWarningBadTypeOrWidth = true;
-                        CPLError(CE_Warning, CPLE_AppDefined,
-                                 "Invalid value type found in record %d for "
-                                 "field %s. "
-                                 "This warning will no longer be emitted",
-                                 nNextFID, poFieldDefn->GetNameRef());
+                        bWarned = true;
+                        OGRCSVWarnBadTypeOrWidth(
+                            posDeferredWarning,
+                            "Invalid value type found in record %d for "
+                            "field %s. "
+                            "This warning will no longer be emitted",
+                            nFID, poFieldDefn->GetNameRef());
                     }
-                    else if( !bWarningBadTypeOrWidth &&
+                    else if( !bWarned &&
                              poFieldDefn->GetWidth() > 0 &&
                              static_cast<int>(strlen(papszTokens[iAttr])) >
                                  poFieldDefn->GetWidth() )
                     {
-                        bWarningBadTypeOrWidth = true;
-                        CPLError(CE_Warning, CPLE_AppDefined,
-                                 "Value with a width greater than field width "
-                                 "found in record %d for field %s. "
-                                 "This warning will no longer be emitted",
-                                 nNextFID, poFieldDefn->GetNameRef());
+                        bWarned = true;
+                        OGRCSVWarnBadTypeOrWidth(
+                            posDeferredWarning,
+                            "Value with a width greater than field width "
+                            "found in record %d for field %s. "
+                            "This warning will no longer be emitted",
+                            nFID, poFieldDefn->GetNameRef());
                     }
-                    else if( !bWarningBadTypeOrWidth &&
+                    else if( !bWarned &&
                              eType == CPL_VALUE_REAL &&
                              poFieldDefn->GetWidth() > 0)
                     {
@@ -1597,26 +1827,27 @@ OGRFeature *OGRCSVLayer::GetNextUnfilteredFeature()
                                 : 0;
                         if( nPrecision > poFieldDefn->GetPrecision() )
                         {
-                            bWarningBadTypeOrWidth = true;
-                            CPLError(CE_Warning, CPLE_AppDefined,
-                                     "Value with a precision greater than "
-                                     "field precision found in record %d for "
-                                     "field %s. "
-                                     "This warning will no longer be emitted",
-                                     nNextFID, poFieldDefn->GetNameRef());
+                            bWarned = true;
+                            OGRCSVWarnBadTypeOrWidth(
+                                posDeferredWarning,
+                                "Value with a precision greater than "
+                                "field precision found in record %d for "
+                                "field %s. "
+                                "This warning will no longer be emitted",
+                                nFID, poFieldDefn->GetNameRef());
                         }
                     }
                 }
                 else
                 {
-                    if( !bWarningBadTypeOrWidth )
+                    if( !bWarned )
                     {
-                        bWarningBadTypeOrWidth = true;
-                        CPLError(
-                            CE_Warning, CPLE_AppDefined,
+                        bWarned = true;
+                        OGRCSVWarnBadTypeOrWidth(
+                            posDeferredWarning,
                             "Invalid value type found in record %d for field "
                             "%s. This warning will no longer be emitted.",
-                            nNextFID, poFieldDefn->GetNameRef());
+                            nFID, poFieldDefn->GetNameRef());
                     }
                 }
             }
@@ -1626,15 +1857,15 @@ OGRFeature *OGRCSVLayer::GetNextUnfilteredFeature()
             if( papszTokens[iAttr][0] != '\0' && !poFieldDefn->IsIgnored() )
             {
                 poFeature->SetField(iOGRField, papszTokens[iAttr]);
-                if( !bWarningBadTypeOrWidth &&
+                if( !bWarned &&
                     !poFeature->IsFieldSetAndNotNull(iOGRField) )
                 {
-                    bWarningBadTypeOrWidth = true;
-                    CPLError(
-                        CE_Warning, CPLE_AppDefined,
+                    bWarned = true;
+                    OGRCSVWarnBadTypeOrWidth(
+                        posDeferredWarning,
                         "Invalid value type found in record %d for field %s. "
                         "This warning will no longer be emitted",
-                        nNextFID, poFieldDefn->GetNameRef());
+                        nFID, poFieldDefn->GetNameRef());
                 }
             }
         }
@@ -1647,16 +1878,17 @@ OGRFeature *OGRCSVLayer::GetNextUnfilteredFeature()
             else
             {
                 poFeature->SetField(iOGRField, papszTokens[iAttr]);
-                if( !bWarningBadTypeOrWidth && poFieldDefn->GetWidth() > 0 &&
+                if( !bWarned && poFieldDefn->GetWidth() > 0 &&
                     static_cast<int>(strlen(papszTokens[iAttr])) >
                         poFieldDefn->GetWidth() )
                 {
-                    bWarningBadTypeOrWidth = true;
-                    CPLError(CE_Warning, CPLE_AppDefined,
-                             "Value with a width greater than field width "
-                             "found in record %d for field %s. "
-                             "This warning will no longer be emitted",
-                             nNextFID, poFieldDefn->GetNameRef());
+                    bWarned = true;
+                    OGRCSVWarnBadTypeOrWidth(
+                        posDeferredWarning,
+                        "Value with a width greater than field width "
+                        "found in record %d for field %s. "
+                        "This warning will no longer be emitted",
+                        nFID, poFieldDefn->GetNameRef());
                 }
             }
         }
@@ -1767,11 +1999,6 @@ OGRFeature *OGRCSVLayer::GetNextUnfilteredFeature()
 
     CSLDestroy(papszTokens);
 
-    // Translate the record id.
-    poFeature->SetFID(nNextFID++);
-
-    m_nFeaturesRead++;
-
     return poFeature;
 }
 
@@ -1785,10 +2012,63 @@ OGRFeature *OGRCSVLayer::GetNextFeature()
     if( bNeedRewindBeforeRead )
         ResetReading();
 
+    // Use the indexes if the filters can be resolved with them.
+    if( m_poAttrQuery != nullptr || m_poFilterGeom != nullptr )
+    {
+        if( !m_bMatchingFIDsEvaluated )
+        {
+            m_bMatchingFIDsEvaluated = true;
+            m_iMatchingFID = 0;
+            m_panMatchingFIDs = EvaluateFiltersAgainstIndices();
+        }
+        if( m_panMatchingFIDs != nullptr )
+            return GetNextMatchingFeature();
+    }
+
     // Read features till we find one that satisfies our current
     // spatial criteria.
     while( true )
     {
+        OGRFeature *poFeature = GetNextUnfilteredFeatureParallel();
+        if( poFeature == nullptr )
+            return nullptr;
+
+        if( (m_poFilterGeom == nullptr ||
+             FilterGeometry(poFeature->GetGeomFieldRef(m_iGeomFieldFilter))) &&
+            (m_poAttrQuery == nullptr || m_poAttrQuery->Evaluate(poFeature)) )
+            return poFeature;
+
+        delete poFeature;
+    }
+}
+
+/************************************************************************/
+/*                       GetNextMatchingFeature()                       */
+/*                                                                      */
+/*      Read the features whose FID is in the sorted list computed      */
+/*      from the indexes, skipping the lines in between                 */
+/*      without parsing them as features.                               */
+/************************************************************************/
+
+OGRFeature *OGRCSVLayer::GetNextMatchingFeature()
+
+{
+    while( m_panMatchingFIDs[m_iMatchingFID] != OGRNullFID )
+    {
+        const GIntBig nFID = m_panMatchingFIDs[m_iMatchingFID++];
+        // Duplicates, as an IN list can produce.
+        if( nFID < nNextFID )
+            continue;
+
+        while( nNextFID < nFID )
+        {
+            char **papszTokens = GetNextLineTokens();
+            if( papszTokens == nullptr )
+                return nullptr;
+            CSLDestroy(papszTokens);
+            nNextFID++;
+        }
+
         OGRFeature *poFeature = GetNextUnfilteredFeature();
         if( poFeature == nullptr )
             return nullptr;
@@ -1800,6 +2080,533 @@ OGRFeature *OGRCSVLayer::GetNextFeature()
 
         delete poFeature;
     }
+
+    return nullptr;
+}
+
+/************************************************************************/
+/*                         OGRCSVGetThreadCount()                       */
+/************************************************************************/
+
+static int OGRCSVGetThreadCount()
+{
+    const char *pszNumThreads =
+        CPLGetConfigOption("OGR_CSV_NUM_THREADS", "1");
+    int nThreads;
+    if( EQUAL(pszNumThreads, "ALL_CPUS") )
+        nThreads = CPLGetNumCPUs();
+    else
+        nThreads = atoi(pszNumThreads);
+    return std::max(1, std::min(nThreads, 2 * CPLGetNumCPUs()));
+}
+
+/************************************************************************/
+/*                  GetNextUnfilteredFeatureParallel()                  */
+/*                                                                      */
+/*      Same as GetNextUnfilteredFeature(), but records are             */
+/*      translated by batches in a pool of threads when                 */
+/*      OGR_CSV_NUM_THREADS is greater than 1.                          */
+/************************************************************************/
+
+OGRFeature *OGRCSVLayer::GetNextUnfilteredFeatureParallel()
+
+{
+    if( m_nThreads < 0 )
+        m_nThreads = OGRCSVGetThreadCount();
+    if( m_nThreads <= 1 || fpCSV == nullptr )
+        return GetNextUnfilteredFeature();
+
+    while( true )
+    {
+        while( m_iNextBatchFeature < m_apoBatchFeatures.size() )
+        {
+            OGRFeature *poFeature = m_apoBatchFeatures[m_iNextBatchFeature];
+            m_apoBatchFeatures[m_iNextBatchFeature] = nullptr;
+            m_iNextBatchFeature++;
+            if( poFeature != nullptr )
+            {
+                poFeature->SetFID(nNextFID++);
+                m_nFeaturesRead++;
+                return poFeature;
+            }
+        }
+
+        if( !TranslateNextBatch() )
+            return nullptr;
+    }
+}
+
+/************************************************************************/
+/*                          TranslateBatchJob()                         */
+/************************************************************************/
+
+void OGRCSVLayer::TranslateBatchJob( void *pData )
+
+{
+    TranslateJob *psJob = static_cast<TranslateJob *>(pData);
+    OGRCSVLayer *poLayer = psJob->poLayer;
+    for( size_t i = psJob->nFirstRecord; i < psJob->nLastRecord; i++ )
+    {
+        const char *pszRecord = poLayer->m_osBatchTexts.c_str() +
+                                poLayer->m_anBatchTextOffsets[i];
+        char **papszTokens;
+        // Special fix to read NdfcFacilities.xls with un-balanced double
+        // quotes, as in OGRCSVReadParseLineL().
+        if( poLayer->chDelimiter == '\t' && poLayer->bDontHonourStrings )
+            papszTokens =
+                CSLTokenizeStringComplex(pszRecord, "\t", FALSE, TRUE);
+        else
+            papszTokens = CSVSplitLine(pszRecord, poLayer->chDelimiter,
+                                       false, poLayer->bMergeDelimiter);
+        if( papszTokens == nullptr || papszTokens[0] == nullptr )
+        {
+            CSLDestroy(papszTokens);
+            continue;
+        }
+
+        const int nFID =
+            psJob->nFirstFID + static_cast<int>(i - psJob->nFirstRecord);
+        poLayer->m_apoBatchFeatures[i] =
+            poLayer->TranslateRecord(papszTokens, nFID, psJob->bWarned,
+                                     &psJob->osWarning);
+    }
+}
+
+/************************************************************************/
+/*                         TranslateNextBatch()                         */
+/*                                                                      */
+/*      Split the next part of the file into records, and translate     */
+/*      them in the thread pool.  Returns false at end of file.         */
+/************************************************************************/
+
+bool OGRCSVLayer::TranslateNextBatch()
+
+{
+    constexpr size_t BATCH_BYTES_PER_THREAD = 1024 * 1024;
+    constexpr size_t BATCH_RECORDS_PER_THREAD = 4096;
+    constexpr size_t READ_BUFFER_SIZE = 65536;
+
+    for( size_t i = m_iNextBatchFeature; i < m_apoBatchFeatures.size(); i++ )
+        delete m_apoBatchFeatures[i];
+    m_apoBatchFeatures.clear();
+    m_iNextBatchFeature = 0;
+
+    if( m_poSplitter == nullptr )
+    {
+        m_poSplitter.reset(new OGRCSVRecordSplitter(
+            !(chDelimiter == '\t' && bDontHonourStrings), true));
+        m_poSplitter->Reset(VSIFTellL(fpCSV));
+        m_bParallelReadFinished = false;
+        m_abyReadBuffer.resize(READ_BUFFER_SIZE);
+    }
+
+    if( m_poThreadPool == nullptr ||
+        m_poThreadPool->GetThreadCount() != m_nThreads )
+    {
+        m_poThreadPool.reset(new CPLWorkerThreadPool());
+        if( !m_poThreadPool->Setup(m_nThreads, nullptr, nullptr) )
+            m_poThreadPool.reset();
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Collect a batch of records.                                     */
+/* -------------------------------------------------------------------- */
+    const size_t nThreads = static_cast<size_t>(m_nThreads);
+    while( !m_bParallelReadFinished &&
+           m_poSplitter->GetRecordCount() <
+                nThreads * BATCH_RECORDS_PER_THREAD &&
+           m_poSplitter->GetTextSize() < nThreads * BATCH_BYTES_PER_THREAD )
+    {
+        const size_t nRead = VSIFReadL(m_abyReadBuffer.data(), 1,
+                                       m_abyReadBuffer.size(), fpCSV);
+        m_poSplitter->Feed(m_abyReadBuffer.data(), nRead);
+        if( nRead < m_abyReadBuffer.size() )
+        {
+            m_poSplitter->Finish();
+            m_bParallelReadFinished = true;
+        }
+    }
+    m_poSplitter->TakeRecords(m_anBatchOffsets, m_osBatchTexts,
+                              m_anBatchTextOffsets);
+    const size_t nRecords = m_anBatchOffsets.size();
+    if( nRecords == 0 )
+        return false;
+
+/* -------------------------------------------------------------------- */
+/*      Translate them, with several jobs per thread so that a few      */
+/*      long records do not leave the other threads idle.               */
+/* -------------------------------------------------------------------- */
+    m_apoBatchFeatures.resize(nRecords, nullptr);
+    const size_t nJobs = std::min(nRecords, nThreads * 4);
+    std::vector<TranslateJob> asJobs(nJobs);
+    std::vector<void *> apData;
+    for( size_t i = 0; i < nJobs; i++ )
+    {
+        asJobs[i].poLayer = this;
+        asJobs[i].nFirstRecord = i * nRecords / nJobs;
+        asJobs[i].nLastRecord = (i + 1) * nRecords / nJobs;
+        asJobs[i].nFirstFID =
+            nNextFID + static_cast<int>(asJobs[i].nFirstRecord);
+        asJobs[i].bWarned = bWarningBadTypeOrWidth;
+        apData.push_back(&asJobs[i]);
+    }
+    if( m_poThreadPool )
+    {
+        m_poThreadPool->SubmitJobs(TranslateBatchJob, apData);
+        m_poThreadPool->WaitCompletion();
+    }
+    else
+    {
+        for( void *pData : apData )
+            TranslateBatchJob(pData);
+    }
+
+    // Warnings are emitted from this thread, so that they reach the error
+    // handlers installed by the caller.
+    for( const auto &oJob : asJobs )
+    {
+        if( !bWarningBadTypeOrWidth && !oJob.osWarning.empty() )
+        {
+            bWarningBadTypeOrWidth = true;
+            CPLError(CE_Warning, CPLE_AppDefined, "%s",
+                     oJob.osWarning.c_str());
+        }
+    }
+
+    return true;
+}
+
+/************************************************************************/
+/*                         StopParallelReading()                        */
+/*                                                                      */
+/*      Discard the records read ahead by the parallel reader, and      */
+/*      optionally move the file back to the first record that has      */
+/*      not been returned, for the sequential reading functions.        */
+/************************************************************************/
+
+void OGRCSVLayer::StopParallelReading( bool bSeekToNextRecord )
+
+{
+    if( m_poSplitter == nullptr )
+        return;
+
+    if( bSeekToNextRecord && fpCSV != nullptr )
+    {
+        const vsi_l_offset nOffset =
+            m_iNextBatchFeature < m_anBatchOffsets.size()
+                ? m_anBatchOffsets[m_iNextBatchFeature]
+                : m_poSplitter->GetNextRecordOffset();
+        CPL_IGNORE_RET_VAL(VSIFSeekL(fpCSV, nOffset, SEEK_SET));
+    }
+
+    for( size_t i = m_iNextBatchFeature; i < m_apoBatchFeatures.size(); i++ )
+        delete m_apoBatchFeatures[i];
+    m_apoBatchFeatures.clear();
+    m_iNextBatchFeature = 0;
+    m_anBatchOffsets.clear();
+    m_osBatchTexts.clear();
+    m_anBatchTextOffsets.clear();
+    m_poSplitter.reset();
+}
+
+/************************************************************************/
+/*                   Row offset index (de)serialization.                */
+/*                                                                      */
+/*      The <filename>.rowidx file starts with a 48 byte header:        */
+/*      signature, size and modification time of the CSV file, offset   */
+/*      of its first record, delimiter, flags and number of records.    */
+/*      Then come the offsets of the records, as 64 bit LSB integers.   */
+/************************************************************************/
+
+constexpr char OGR_CSV_ROW_INDEX_SIGNATURE[] = "OGRCSVRI";
+constexpr int OGR_CSV_ROW_INDEX_SIGNATURE_SIZE = 8;
+constexpr int OGR_CSV_ROW_INDEX_HEADER_SIZE = 48;
+constexpr int OGR_CSV_ROW_INDEX_COUNT_OFFSET = 40;
+constexpr GUInt32 OGR_CSV_ROW_INDEX_HONOUR_QUOTES = 1;
+
+static void OGRCSVAppendUInt32( std::string &osBuf, GUInt32 nVal )
+{
+    CPL_LSBPTR32(&nVal);
+    osBuf.append(reinterpret_cast<const char *>(&nVal), sizeof(nVal));
+}
+
+static void OGRCSVAppendUInt64( std::string &osBuf, GUIntBig nVal )
+{
+    CPL_LSBPTR64(&nVal);
+    osBuf.append(reinterpret_cast<const char *>(&nVal), sizeof(nVal));
+}
+
+static GUInt32 OGRCSVGetUInt32( const GByte *pabyData )
+{
+    GUInt32 nVal = 0;
+    memcpy(&nVal, pabyData, sizeof(nVal));
+    CPL_LSBPTR32(&nVal);
+    return nVal;
+}
+
+static GUIntBig OGRCSVGetUInt64( const GByte *pabyData )
+{
+    GUIntBig nVal = 0;
+    memcpy(&nVal, pabyData, sizeof(nVal));
+    CPL_LSBPTR64(&nVal);
+    return nVal;
+}
+
+/************************************************************************/
+/*                      LoadOrBuildRowOffsetIndex()                     */
+/*                                                                      */
+/*      Open the persisted row offset index if it matches the current   */
+/*      file, or build it.  Returns false if there is no index.         */
+/************************************************************************/
+
+bool OGRCSVLayer::LoadOrBuildRowOffsetIndex()
+
+{
+    if( m_bRowOffsetIndexEvaluated )
+        return m_nRowOffsetCount >= 0;
+    m_bRowOffsetIndexEvaluated = true;
+
+    if( fpCSV == nullptr )
+        return false;
+
+    VSIStatBufL sStat;
+    if( VSIStatL(pszFilename, &sStat) != 0 )
+        return false;
+    const GUIntBig nSourceSize = static_cast<GUIntBig>(sStat.st_size);
+    const GIntBig nSourceMTime = static_cast<GIntBig>(sStat.st_mtime);
+
+    // Position after the header line.
+    ResetReading();
+    bNeedRewindBeforeRead = true;
+    const vsi_l_offset nDataStart = VSIFTellL(fpCSV);
+    const GUInt32 nIndexFlags = (chDelimiter == '\t' && bDontHonourStrings)
+                                    ? 0 : OGR_CSV_ROW_INDEX_HONOUR_QUOTES;
+
+    const CPLString osIndexFilename(CPLString(pszFilename) + ".rowidx");
+    VSILFILE *fp = VSIFOpenL(osIndexFilename, "rb");
+    if( fp != nullptr )
+    {
+        GByte abyHeader[OGR_CSV_ROW_INDEX_HEADER_SIZE] = {};
+        bool bValid =
+            VSIFReadL(abyHeader, sizeof(abyHeader), 1, fp) == 1 &&
+            memcmp(abyHeader, OGR_CSV_ROW_INDEX_SIGNATURE,
+                   OGR_CSV_ROW_INDEX_SIGNATURE_SIZE) == 0 &&
+            OGRCSVGetUInt64(abyHeader + 8) == nSourceSize &&
+            OGRCSVGetUInt64(abyHeader + 16) ==
+                static_cast<GUIntBig>(nSourceMTime) &&
+            OGRCSVGetUInt64(abyHeader + 24) == nDataStart &&
+            OGRCSVGetUInt32(abyHeader + 32) ==
+                static_cast<GByte>(chDelimiter) &&
+            OGRCSVGetUInt32(abyHeader + 36) == nIndexFlags;
+        const GUIntBig nCount =
+            OGRCSVGetUInt64(abyHeader + OGR_CSV_ROW_INDEX_COUNT_OFFSET);
+        if( bValid )
+        {
+            bValid = VSIFSeekL(fp, 0, SEEK_END) == 0 &&
+                     nCount < static_cast<GUIntBig>(
+                                  std::numeric_limits<int>::max()) &&
+                     VSIFTellL(fp) == OGR_CSV_ROW_INDEX_HEADER_SIZE +
+                                          nCount * sizeof(GUIntBig);
+        }
+        if( bValid )
+        {
+            CPLDebug("CSV", "Using row offset index %s",
+                     osIndexFilename.c_str());
+            m_fpRowOffsetIndex = fp;
+            m_nRowOffsetCount = static_cast<GIntBig>(nCount);
+            return true;
+        }
+        VSIFCloseL(fp);
+    }
+
+    return BuildRowOffsetIndex(osIndexFilename, nSourceSize, nSourceMTime,
+                               nDataStart);
+}
+
+/************************************************************************/
+/*                         BuildRowOffsetIndex()                        */
+/*                                                                      */
+/*      Scan the file for record boundaries, and write the offsets in   */
+/*      the index file.  If the index file cannot be created, the       */
+/*      offsets are kept in memory for the lifetime of the layer.       */
+/************************************************************************/
+
+bool OGRCSVLayer::BuildRowOffsetIndex( const char *pszIndexFilename,
+                                       GUIntBig nSourceSize,
+                                       GIntBig nSourceMTime,
+                                       vsi_l_offset nDataStart )
+
+{
+    CPLDebug("CSV", "Building row offset index %s", pszIndexFilename);
+
+    const bool bHonourQuotes = !(chDelimiter == '\t' && bDontHonourStrings);
+    const CPLString osTmpFilename(CPLString(pszIndexFilename) + ".tmp");
+    VSILFILE *fpOut = VSIFOpenL(osTmpFilename, "wb");
+
+    std::string osBuf(OGR_CSV_ROW_INDEX_SIGNATURE,
+                      OGR_CSV_ROW_INDEX_SIGNATURE_SIZE);
+    OGRCSVAppendUInt64(osBuf, nSourceSize);
+    OGRCSVAppendUInt64(osBuf, static_cast<GUIntBig>(nSourceMTime));
+    OGRCSVAppendUInt64(osBuf, nDataStart);
+    OGRCSVAppendUInt32(osBuf, static_cast<GByte>(chDelimiter));
+    OGRCSVAppendUInt32(osBuf,
+                       bHonourQuotes ? OGR_CSV_ROW_INDEX_HONOUR_QUOTES : 0);
+    OGRCSVAppendUInt64(osBuf, 0);  // Number of records, patched at the end.
+    CPLAssert(osBuf.size() == OGR_CSV_ROW_INDEX_HEADER_SIZE);
+    bool bOK = fpOut == nullptr ||
+               VSIFWriteL(osBuf.data(), osBuf.size(), 1, fpOut) == 1;
+
+    OGRCSVRecordSplitter oSplitter(bHonourQuotes, false);
+    oSplitter.Reset(nDataStart);
+    std::vector<char> abyBuffer(65536);
+    std::vector<vsi_l_offset> anOffsets;
+    std::string osUnusedTexts;
+    std::vector<size_t> anUnusedTextOffsets;
+    GUIntBig nCount = 0;
+    bOK &= VSIFSeekL(fpCSV, nDataStart, SEEK_SET) == 0;
+    while( bOK )
+    {
+        const size_t nRead =
+            VSIFReadL(abyBuffer.data(), 1, abyBuffer.size(), fpCSV);
+        oSplitter.Feed(abyBuffer.data(), nRead);
+        if( nRead < abyBuffer.size() )
+            oSplitter.Finish();
+        oSplitter.TakeRecords(anOffsets, osUnusedTexts, anUnusedTextOffsets);
+
+        nCount += anOffsets.size();
+        if( fpOut != nullptr )
+        {
+            osBuf.clear();
+            for( const vsi_l_offset nOffset : anOffsets )
+                OGRCSVAppendUInt64(osBuf, nOffset);
+            bOK = osBuf.empty() ||
+                  VSIFWriteL(osBuf.data(), osBuf.size(), 1, fpOut) == 1;
+        }
+        else
+        {
+            m_anRowOffsets.insert(m_anRowOffsets.end(),
+                                  anOffsets.begin(), anOffsets.end());
+        }
+
+        if( nRead < abyBuffer.size() )
+            break;
+    }
+    bOK &= nCount < static_cast<GUIntBig>(std::numeric_limits<int>::max());
+
+    if( fpOut == nullptr )
+    {
+        if( !bOK )
+        {
+            m_anRowOffsets.clear();
+            return false;
+        }
+        CPLDebug("CSV", "Cannot create %s. Row offset index kept in memory",
+                 osTmpFilename.c_str());
+        m_nRowOffsetCount = static_cast<GIntBig>(nCount);
+        return true;
+    }
+
+    if( bOK )
+    {
+        osBuf.clear();
+        OGRCSVAppendUInt64(osBuf, nCount);
+        bOK = VSIFSeekL(fpOut, OGR_CSV_ROW_INDEX_COUNT_OFFSET, SEEK_SET) == 0 &&
+              VSIFWriteL(osBuf.data(), osBuf.size(), 1, fpOut) == 1;
+    }
+    bOK &= VSIFCloseL(fpOut) == 0;
+    if( bOK )
+        bOK = VSIRename(osTmpFilename, pszIndexFilename) == 0;
+    if( bOK )
+    {
+        m_fpRowOffsetIndex = VSIFOpenL(pszIndexFilename, "rb");
+        bOK = m_fpRowOffsetIndex != nullptr;
+    }
+    if( !bOK )
+    {
+        CPLDebug("CSV", "Failed to write row offset index %s",
+                 pszIndexFilename);
+        VSIUnlink(osTmpFilename);
+        return false;
+    }
+
+    m_nRowOffsetCount = static_cast<GIntBig>(nCount);
+    return true;
+}
+
+/************************************************************************/
+/*                             GetRowOffset()                           */
+/************************************************************************/
+
+bool OGRCSVLayer::GetRowOffset( GIntBig nFID, vsi_l_offset &nOffset )
+
+{
+    if( nFID < 1 || nFID > m_nRowOffsetCount )
+        return false;
+    if( m_fpRowOffsetIndex == nullptr )
+    {
+        nOffset = m_anRowOffsets[static_cast<size_t>(nFID - 1)];
+        return true;
+    }
+
+    GByte abyOffset[sizeof(GUIntBig)] = {};
+    if( VSIFSeekL(m_fpRowOffsetIndex,
+                  OGR_CSV_ROW_INDEX_HEADER_SIZE +
+                      static_cast<vsi_l_offset>(nFID - 1) * sizeof(GUIntBig),
+                  SEEK_SET) != 0 ||
+        VSIFReadL(abyOffset, sizeof(abyOffset), 1, m_fpRowOffsetIndex) != 1 )
+    {
+        return false;
+    }
+    nOffset = OGRCSVGetUInt64(abyOffset);
+    return true;
+}
+
+/************************************************************************/
+/*                       InvalidateRowOffsetIndex()                     */
+/************************************************************************/
+
+void OGRCSVLayer::InvalidateRowOffsetIndex()
+
+{
+    if( m_fpRowOffsetIndex )
+        VSIFCloseL(m_fpRowOffsetIndex);
+    m_fpRowOffsetIndex = nullptr;
+    m_anRowOffsets.clear();
+    m_nRowOffsetCount = -1;
+    m_bRowOffsetIndexEvaluated = false;
+}
+
+/************************************************************************/
+/*                           SetNextByIndex()                           */
+/************************************************************************/
+
+OGRErr OGRCSVLayer::SetNextByIndex( GIntBig nIndex )
+
+{
+    if( nIndex < 0 || fpCSV == nullptr ||
+        m_poFilterGeom != nullptr || m_poAttrQuery != nullptr ||
+        !m_bUseRowOffsetIndex || !LoadOrBuildRowOffsetIndex() )
+    {
+        return OGRLayer::SetNextByIndex(nIndex);
+    }
+
+    ResetReading();
+
+    // Past the last record, the next read returns nothing.
+    vsi_l_offset nOffset = 0;
+    if( nIndex >= m_nRowOffsetCount )
+    {
+        nIndex = m_nRowOffsetCount;
+        if( VSIFSeekL(fpCSV, 0, SEEK_END) != 0 )
+            return OGRERR_FAILURE;
+    }
+    else if( !GetRowOffset(nIndex + 1, nOffset) ||
+             VSIFSeekL(fpCSV, nOffset, SEEK_SET) != 0 )
+    {
+        return OGRERR_FAILURE;
+    }
+    nNextFID = static_cast<int>(nIndex + 1);
+    return OGRERR_NONE;
 }
 
 /************************************************************************/
@@ -1822,6 +2629,11 @@ int OGRCSVLayer::TestCapability( const char *pszCap )
         return TRUE;
     else if( EQUAL(pszCap, OLCMeasuredGeometries) )
         return TRUE;
+    else if( EQUAL(pszCap, OLCRandomRead) )
+        return m_bUseRowOffsetIndex;
+    else if( EQUAL(pszCap, OLCFastSetNextByIndex) )
+        return m_bUseRowOffsetIndex && m_poFilterGeom == nullptr &&
+               m_poAttrQuery == nullptr;
     else
         return FALSE;
 }
@@ -2270,6 +3082,8 @@ OGRErr OGRCSVLayer::ICreateFeature( OGRFeature *poNewFeature )
     bool bNeedSeekEnd = !bNeedRewindBeforeRead;
 
     bNeedRewindBeforeRead = true;
+    StopParallelReading(false);
+    InvalidateRowOffsetIndex();
 
     // Write field names if we haven't written them yet.
     // Write .csvt file if needed.
@@ -2529,11 +3343,25 @@ GIntBig OGRCSVLayer::GetFeatureCount( int bForce )
 {
     if( m_poFilterGeom != nullptr || m_poAttrQuery != nullptr )
     {
-        GIntBig nRet = OGRLayer::GetFeatureCount(bForce);
-        if( nRet >= 0 )
+        if( !bForce )
+            return -1;
+
+        GIntBig nRet = 0;
+        ResetReading();
+        OGRFeature *poFeature = nullptr;
+        while( (poFeature = GetNextFeature()) != nullptr )
         {
-            nTotalFeatures = nNextFID - 1;
+            nRet++;
+            delete poFeature;
         }
+
+        // The total is only known if the scan reached the end of the file,
+        // which is not the case when the attribute or spatial indexes were
+        // used: it then stops after the last matching feature.
+        if( m_panMatchingFIDs == nullptr )
+            nTotalFeatures = nNextFID - 1;
+
+        ResetReading();
         return nRet;
     }
 
@@ -2543,6 +3371,12 @@ GIntBig OGRCSVLayer::GetFeatureCount( int bForce )
     if( fpCSV == nullptr )
         return 0;
 
+    if( m_bUseRowOffsetIndex && LoadOrBuildRowOffsetIndex() )
+    {
+        nTotalFeatures = m_nRowOffsetCount;
+        return nTotalFeatures;
+    }
+
     ResetReading();
 
     if( chDelimiter == '\t' && bDontHonourStrings )
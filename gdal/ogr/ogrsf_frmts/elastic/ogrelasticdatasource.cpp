@@ -868,6 +868,7 @@ OGRLayer* OGRElasticDataSource::ExecuteSQL( const char *pszSQLCommand,
                 GetLayerIndex( psSelectInfo->table_defs[0].table_name )) >= 0 &&
             psSelectInfo->join_count == 0 &&
             psSelectInfo->order_specs > 0 &&
+            psSelectInfo->group_by_count == 0 &&
             psSelectInfo->poOtherSelect == nullptr )
         {
             OGRElasticLayer* poSrcLayer = m_apoLayers[iLayer].get();
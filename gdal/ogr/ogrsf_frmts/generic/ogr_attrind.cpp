@@ -59,6 +59,26 @@ OGRLayerAttrIndex::~OGRLayerAttrIndex()
     pszIndexPath = nullptr;
 }
 
+/************************************************************************/
+/* ==================================================================== */
+/*                         OGRLayerSpatialIndex                         */
+/* ==================================================================== */
+/************************************************************************/
+
+/************************************************************************/
+/*                        OGRLayerSpatialIndex()                        */
+/************************************************************************/
+
+OGRLayerSpatialIndex::OGRLayerSpatialIndex() :
+    poLayer(nullptr)
+{}
+
+/************************************************************************/
+/*                       ~OGRLayerSpatialIndex()                        */
+/************************************************************************/
+
+OGRLayerSpatialIndex::~OGRLayerSpatialIndex() {}
+
 /************************************************************************/
 /* ==================================================================== */
 /*                             OGRAttrIndex                             */
@@ -77,4 +97,26 @@ OGRAttrIndex::OGRAttrIndex() {}
 
 OGRAttrIndex::~OGRAttrIndex() {}
 
+/************************************************************************/
+/*                          GetRangeMatches()                           */
+/************************************************************************/
+
+GIntBig *OGRAttrIndex::GetRangeMatches( OGRField * /* psMin */,
+                                        bool /* bMinInclusive */,
+                                        OGRField * /* psMax */,
+                                        bool /* bMaxInclusive */,
+                                        int * /* pnFIDCount */ )
+{
+    return nullptr;
+}
+
+/************************************************************************/
+/*                        SupportsRangeQueries()                        */
+/************************************************************************/
+
+bool OGRAttrIndex::SupportsRangeQueries() const
+{
+    return false;
+}
+
 //! @endcond
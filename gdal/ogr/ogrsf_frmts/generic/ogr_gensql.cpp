@@ -32,8 +32,11 @@
 #include "ogr_gensql.h"
 #include "cpl_string.h"
 #include "ogr_api.h"
+#include "ogr_attrind.h"
 #include "cpl_time.h"
 #include <algorithm>
+#include <string>
+#include <unordered_map>
 #include <vector>
 
 //! @cond Doxygen_Suppress
@@ -81,6 +84,165 @@ int OGRGenSQLResultsLayerHasSpecialField(swq_expr_node* expr,
     return FALSE;
 }
 
+/************************************************************************/
+/* ==================================================================== */
+/*                           OGRGenSQLGroupBy                           */
+/* ==================================================================== */
+/*                                                                      */
+/*      Evaluation of GROUP BY queries in a single pass over the        */
+/*      source layer, with a hash table of the groups.  When the        */
+/*      estimated size of the hash table exceeds                        */
+/*      OGR_SQL_GROUP_BY_MAX_MEMORY MB, source rows of groups that are   */
+/*      not already in memory are spilled to temporary partition files, */
+/*      that are then aggregated in subsequent passes.  Result rows are  */
+/*      kept in memory up to the same amount, and written to a          */
+/*      temporary file beyond.                                          */
+/************************************************************************/
+
+class OGRGenSQLGroupBy
+{
+    static constexpr int PARTITION_COUNT = 16;
+
+    enum InputState : GByte { INPUT_SKIP = 0, INPUT_NULL = 1, INPUT_VALUE = 2 };
+
+    struct Input
+    {
+        InputState  eState = INPUT_SKIP;
+        std::string osValue{};
+    };
+
+    struct Partition
+    {
+        CPLString   osFilename{};
+        VSILFILE   *fp = nullptr;
+    };
+
+    swq_select     *m_psSelectInfo;
+    OGRFeatureDefn *m_poDefn;
+    OGRLayer       *m_poSrcLayer;
+    GIntBig         m_nMaxMemory;
+
+    // For each result column, index of the group by definition, or -1
+    // for aggregates.
+    std::vector<int> m_anGroupByDef{};
+
+    // Groups of the current pass
+    std::unordered_map<std::string, size_t> m_oMapKeyToGroup{};
+    std::vector<const std::string*> m_apoKeys{};
+    std::vector<std::vector<swq_summary>> m_aaoSummaries{};
+    GIntBig         m_nMemory = 0;
+    int             m_nLevel = 0;
+    std::vector<Partition> m_aoPartitions{};
+    std::vector<std::pair<CPLString, int>> m_aoPendingPartitions{};
+
+    // Result rows
+    std::vector<OGRFeature*> m_apoRows{};
+    GIntBig         m_nRowsMemory = 0;
+    CPLString       m_osRowsFilename{};
+    VSILFILE       *m_fpRows = nullptr;
+    std::vector<vsi_l_offset> m_anRowOffsets{};
+    std::vector<size_t> m_anOrder{};
+
+    std::string     m_osKey{};
+    std::vector<Input> m_aoInputs{};
+    std::vector<GByte> m_abyBuffer{};
+
+    void        ComputeKey( OGRFeature* poSrcFeature );
+    void        ComputeInputs( OGRFeature* poSrcFeature );
+    bool        ProcessRow();
+    bool        Summarize( size_t iGroup );
+    bool        WriteToPartition();
+    bool        ReadPartition( const CPLString& osFilename );
+    bool        EmitGroups();
+    bool        AddRow( OGRFeature* poRow );
+    OGRFeature *LoadRow( size_t iRow );
+    bool        Sort();
+
+    CPL_DISALLOW_COPY_ASSIGN(OGRGenSQLGroupBy)
+
+  public:
+    OGRGenSQLGroupBy( swq_select* psSelectInfo, OGRFeatureDefn* poDefn,
+                      OGRLayer* poSrcLayer );
+    ~OGRGenSQLGroupBy();
+
+    bool        AddFeature( OGRFeature* poSrcFeature );
+    bool        Finish();
+
+    GIntBig     GetRowCount() const
+        { return static_cast<GIntBig>(m_apoRows.size() +
+                                      m_anRowOffsets.size()); }
+    OGRFeature *GetRow( GIntBig nIdx );
+};
+
+/************************************************************************/
+/* ==================================================================== */
+/*                        OGRGenSQLExternalSort                         */
+/* ==================================================================== */
+/*                                                                      */
+/*      External merge sort of the source features for ORDER BY, used   */
+/*      when fetching them back by FID would be too slow.  Serialized   */
+/*      source features are accumulated in runs of at most              */
+/*      OGR_SQL_ORDER_BY_MAX_MEMORY MB, that are sorted and written to  */
+/*      temporary files.  The runs are merged while reading the result, */
+/*      so that the source layer is only read sequentially.             */
+/************************************************************************/
+
+class OGRGenSQLExternalSort
+{
+    static constexpr size_t MAX_MERGE_FANIN = 64;
+
+    struct Cursor
+    {
+        VSILFILE   *fp = nullptr;
+        std::vector<GByte> abyRecord{};
+        OGRFeature *poFeature = nullptr;
+        std::vector<OGRField> asKeys{};
+    };
+
+    OGRGenSQLResultsLayer *m_poLayer;
+    OGRFeatureDefn *m_poSrcDefn;
+    int             m_nOrderItems;
+    GIntBig         m_nMaxMemory;
+
+    // Current run, or the whole result set if it fits in memory
+    std::vector<std::vector<GByte>> m_aabyRecords{};
+    std::vector<OGRField> m_asKeys{};
+    std::vector<size_t> m_anOrder{};
+    GIntBig         m_nMemory = 0;
+    size_t          m_nNextRecord = 0;
+
+    std::vector<CPLString> m_aosRunFilenames{};
+
+    // State of the merge of the runs
+    std::vector<Cursor> m_aoCursors{};
+    std::vector<size_t> m_anHeap{};
+
+    void        FreeKeys();
+    void        SortRun();
+    bool        SpillRun();
+    bool        OpenCursors( size_t nRuns );
+    void        CloseCursors();
+    bool        ReadCursor( size_t iCursor );
+    bool        IsAfter( size_t iCursorA, size_t iCursorB );
+    void        PushCursor( size_t iCursor );
+    bool        PopCursor( size_t& iCursor );
+    bool        MergeRuns();
+
+    CPL_DISALLOW_COPY_ASSIGN(OGRGenSQLExternalSort)
+
+  public:
+    OGRGenSQLExternalSort( OGRGenSQLResultsLayer* poLayer,
+                           OGRFeatureDefn* poSrcDefn, int nOrderItems );
+    ~OGRGenSQLExternalSort();
+
+    bool        AddFeature( OGRFeature* poSrcFeature );
+    bool        Finish();
+
+    void        Rewind();
+    bool        SetNextByIndex( GIntBig nIndex );
+    OGRFeature *GetNextFeature();
+};
+
 /************************************************************************/
 /*                       OGRGenSQLResultsLayer()                        */
 /************************************************************************/
@@ -141,6 +303,7 @@ OGRGenSQLResultsLayer::OGRGenSQLResultsLayer( GDALDataset *poSrcDSIn,
             papoExtraDS[nExtraDSCount-1] = poTableDS;
         }
 
+        m_apoTableDS.push_back(poTableDS);
         papoTableLayers[iTable] =
             poTableDS->GetLayerByName( psTableDef->table_name );
 
@@ -508,6 +671,9 @@ OGRGenSQLResultsLayer::~OGRGenSQLResultsLayer()
     }
 
     OGRGenSQLResultsLayer::ClearFilters();
+    m_apoHashJoins.clear();
+    m_poGroupBy.reset();
+    m_poExternalSort.reset();
 
 /* -------------------------------------------------------------------- */
 /*      Free various datastructures.                                    */
@@ -662,11 +828,21 @@ OGRErr OGRGenSQLResultsLayer::SetNextByIndex( GIntBig nIndex )
 
     if( psSelectInfo->query_mode == SWQM_SUMMARY_RECORD
         || psSelectInfo->query_mode == SWQM_DISTINCT_LIST
+        || psSelectInfo->query_mode == SWQM_GROUP_BY
         || panFIDIndex != nullptr )
     {
         nNextIndexFID = nIndex + psSelectInfo->offset;
         return OGRERR_NONE;
     }
+    else if( m_bOrderByFailed )
+    {
+        return OGRERR_FAILURE;
+    }
+    else if( m_poExternalSort != nullptr )
+    {
+        return m_poExternalSort->SetNextByIndex(
+                nIndex + psSelectInfo->offset ) ? OGRERR_NONE : OGRERR_FAILURE;
+    }
     else
     {
         return poSrcLayer->SetNextByIndex( nIndex + psSelectInfo->offset );
@@ -731,6 +907,13 @@ GIntBig OGRGenSQLResultsLayer::GetFeatureCount( int bForce )
 
         nRet = psSelectInfo->column_summary[0].count;
     }
+    else if( psSelectInfo->query_mode == SWQM_GROUP_BY )
+    {
+        if( !PrepareGroupBy() )
+            return 0;
+
+        nRet = m_poGroupBy->GetRowCount();
+    }
     else if( psSelectInfo->query_mode != SWQM_RECORDSET )
         return 1;
     else if( m_poAttrQuery == nullptr && !MustEvaluateSpatialFilterOnGenSQL() )
@@ -761,8 +944,11 @@ int OGRGenSQLResultsLayer::TestCapability( const char *pszCap )
     {
         if( psSelectInfo->query_mode == SWQM_SUMMARY_RECORD
             || psSelectInfo->query_mode == SWQM_DISTINCT_LIST
+            || psSelectInfo->query_mode == SWQM_GROUP_BY
             || panFIDIndex != nullptr )
             return TRUE;
+        else if( m_poExternalSort != nullptr )
+            return FALSE;
         else
             return poSrcLayer->TestCapability( pszCap );
     }
@@ -773,6 +959,13 @@ int OGRGenSQLResultsLayer::TestCapability( const char *pszCap )
             || EQUAL(pszCap,OLCFastGetExtent)) )
         return poSrcLayer->TestCapability( pszCap );
 
+    else if( psSelectInfo->query_mode == SWQM_GROUP_BY )
+    {
+        // The result rows are only known once the source layer is read
+        if( EQUAL(pszCap,OLCFastFeatureCount) ||
+            EQUAL(pszCap,OLCRandomRead) )
+            return m_poGroupBy != nullptr;
+    }
     else if( psSelectInfo->query_mode != SWQM_RECORDSET )
     {
         if( EQUAL(pszCap,OLCFastFeatureCount) )
@@ -815,6 +1008,150 @@ int OGRGenSQLResultsLayer::ContainGeomSpecialField(swq_expr_node* expr)
     return FALSE;
 }
 
+/************************************************************************/
+/*                  MustReadSourceGeometryForSummary()                  */
+/*                                                                      */
+/*      Geometry reading can be skipped when computing a summary if no  */
+/*      spatial filter is in place, and that the where clause, the      */
+/*      columns and the GROUP BY fields don't reference OGR_GEOMETRY,   */
+/*      OGR_GEOM_WKT or OGR_GEOM_AREA special fields.                   */
+/************************************************************************/
+
+int OGRGenSQLResultsLayer::MustReadSourceGeometryForSummary()
+{
+    swq_select *psSelectInfo = static_cast<swq_select*>(pSelectInfo);
+
+    if( m_poFilterGeom != nullptr || ( psSelectInfo->where_expr != nullptr &&
+                ContainGeomSpecialField(psSelectInfo->where_expr) ) )
+        return TRUE;
+
+    OGRFeatureDefn* poSrcFDefn = poSrcLayer->GetLayerDefn();
+    const auto IsGeomField = [poSrcFDefn](int iField)
+    {
+        int nSpecialFieldIdx = iField - poSrcFDefn->GetFieldCount();
+        return nSpecialFieldIdx == SPF_OGR_GEOMETRY ||
+               nSpecialFieldIdx == SPF_OGR_GEOM_WKT ||
+               nSpecialFieldIdx == SPF_OGR_GEOM_AREA ||
+               iField == GEOM_FIELD_INDEX_TO_ALL_FIELD_INDEX(poSrcFDefn, 0);
+    };
+
+    for( int iField = 0; iField < psSelectInfo->result_columns; iField++ )
+    {
+        swq_col_def *psColDef = psSelectInfo->column_defs + iField;
+        if (psColDef->table_index == 0 && psColDef->field_index != -1 &&
+            IsGeomField(psColDef->field_index))
+        {
+            return TRUE;
+        }
+        if (psColDef->expr != nullptr && ContainGeomSpecialField(psColDef->expr))
+            return TRUE;
+    }
+
+    for( int i = 0; i < psSelectInfo->group_by_count; i++ )
+    {
+        if( IsGeomField(psSelectInfo->group_by_defs[i].field_index) )
+            return TRUE;
+    }
+
+    return FALSE;
+}
+
+/************************************************************************/
+/*                      OGRGenSQLGetSummaryInput()                      */
+/*                                                                      */
+/*      Return the value of a source feature to pass to                 */
+/*      swq_select_summarize() for a column, or false if the feature    */
+/*      must not be accounted for that column.                          */
+/************************************************************************/
+
+static bool OGRGenSQLGetSummaryInput( OGRLayer* poSrcLayer,
+                                      OGRFeature* poSrcFeature,
+                                      const swq_col_def* psColDef,
+                                      const char** ppszVal )
+{
+    *ppszVal = nullptr;
+    if (psColDef->col_func == SWQCF_COUNT)
+    {
+        /* psColDef->field_index can be -1 in the case of a COUNT(*) */
+        if (psColDef->field_index < 0)
+            *ppszVal = "";
+        else if (IS_GEOM_FIELD_INDEX(poSrcLayer->GetLayerDefn(), psColDef->field_index) )
+        {
+            int iSrcGeomField = ALL_FIELD_INDEX_TO_GEOM_FIELD_INDEX(
+                    poSrcLayer->GetLayerDefn(), psColDef->field_index);
+            OGRGeometry* poGeom = poSrcFeature->GetGeomFieldRef(iSrcGeomField);
+            if( poGeom == nullptr )
+                return false;
+            *ppszVal = "";
+        }
+        else if (poSrcFeature->IsFieldSetAndNotNull(psColDef->field_index))
+            *ppszVal = poSrcFeature->GetFieldAsString(psColDef->field_index);
+        else
+            return false;
+    }
+    else
+    {
+        if (poSrcFeature->IsFieldSetAndNotNull(psColDef->field_index))
+            *ppszVal = poSrcFeature->GetFieldAsString(psColDef->field_index);
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                      OGRGenSQLSetSummaryField()                      */
+/*                                                                      */
+/*      Set the value of an aggregate column from its summary.          */
+/************************************************************************/
+
+static void OGRGenSQLSetSummaryField( OGRFeature* poFeature, int iField,
+                                      const swq_col_def* psColDef,
+                                      const swq_summary& oSummary )
+{
+    if( psColDef->col_func == SWQCF_AVG && oSummary.count > 0 )
+    {
+        if( psColDef->field_type == SWQ_DATE ||
+            psColDef->field_type == SWQ_TIME ||
+            psColDef->field_type == SWQ_TIMESTAMP)
+        {
+            struct tm brokendowntime;
+            double dfAvg = oSummary.sum / oSummary.count;
+            CPLUnixTimeToYMDHMS(static_cast<GIntBig>(dfAvg), &brokendowntime);
+            poFeature->SetField( iField,
+                                 brokendowntime.tm_year + 1900,
+                                 brokendowntime.tm_mon + 1,
+                                 brokendowntime.tm_mday,
+                                 brokendowntime.tm_hour,
+                                 brokendowntime.tm_min,
+                                 static_cast<float>(brokendowntime.tm_sec + fmod(dfAvg, 1)),
+                                 0);
+        }
+        else
+            poFeature->SetField( iField, oSummary.sum / oSummary.count );
+    }
+    else if( psColDef->col_func == SWQCF_MIN && oSummary.count > 0 )
+    {
+        if( psColDef->field_type == SWQ_DATE ||
+            psColDef->field_type == SWQ_TIME ||
+            psColDef->field_type == SWQ_TIMESTAMP)
+            poFeature->SetField( iField, oSummary.osMin.c_str() );
+        else
+            poFeature->SetField( iField, oSummary.min );
+    }
+    else if( psColDef->col_func == SWQCF_MAX && oSummary.count > 0 )
+    {
+        if( psColDef->field_type == SWQ_DATE ||
+            psColDef->field_type == SWQ_TIME ||
+            psColDef->field_type == SWQ_TIMESTAMP)
+            poFeature->SetField( iField, oSummary.osMax.c_str() );
+        else
+            poFeature->SetField( iField, oSummary.max );
+    }
+    else if( psColDef->col_func == SWQCF_COUNT )
+        poFeature->SetField( iField, oSummary.count );
+    else if( psColDef->col_func == SWQCF_SUM && oSummary.count > 0 )
+        poFeature->SetField( iField, oSummary.sum );
+}
+
 /************************************************************************/
 /*                           PrepareSummary()                           */
 /************************************************************************/
@@ -837,46 +1174,11 @@ int OGRGenSQLResultsLayer::PrepareSummary()
     ApplyFiltersToSource();
 
 /* -------------------------------------------------------------------- */
-/*      Ignore geometry reading if no spatial filter in place and that  */
-/*      the where clause and no column references OGR_GEOMETRY,         */
-/*      OGR_GEOM_WKT or OGR_GEOM_AREA special fields.                   */
+/*      Ignore geometry reading if not needed.                          */
 /* -------------------------------------------------------------------- */
     int bSaveIsGeomIgnored = poSrcLayer->GetLayerDefn()->IsGeometryIgnored();
-    if ( m_poFilterGeom == nullptr && ( psSelectInfo->where_expr == nullptr ||
-                !ContainGeomSpecialField(psSelectInfo->where_expr) ) )
-    {
-        int bFoundGeomExpr = FALSE;
-        for( int iField = 0; iField < psSelectInfo->result_columns; iField++ )
-        {
-            swq_col_def *psColDef = psSelectInfo->column_defs + iField;
-            if (psColDef->table_index == 0 && psColDef->field_index != -1)
-            {
-                OGRLayer* poLayer = papoTableLayers[psColDef->table_index];
-                int nSpecialFieldIdx = psColDef->field_index -
-                                poLayer->GetLayerDefn()->GetFieldCount();
-                if (nSpecialFieldIdx == SPF_OGR_GEOMETRY ||
-                    nSpecialFieldIdx == SPF_OGR_GEOM_WKT ||
-                    nSpecialFieldIdx == SPF_OGR_GEOM_AREA)
-                {
-                    bFoundGeomExpr = TRUE;
-                    break;
-                }
-                if( psColDef->field_index ==
-                        GEOM_FIELD_INDEX_TO_ALL_FIELD_INDEX(poLayer->GetLayerDefn(), 0) )
-                {
-                    bFoundGeomExpr = TRUE;
-                    break;
-                }
-            }
-            if (psColDef->expr != nullptr && ContainGeomSpecialField(psColDef->expr))
-            {
-                bFoundGeomExpr = TRUE;
-                break;
-            }
-        }
-        if (!bFoundGeomExpr)
-            poSrcLayer->GetLayerDefn()->SetGeometryIgnored(TRUE);
-    }
+    if( !MustReadSourceGeometryForSummary() )
+        poSrcLayer->GetLayerDefn()->SetGeometryIgnored(TRUE);
 
 /* -------------------------------------------------------------------- */
 /*      We treat COUNT(*) as a special case, and fill with              */
@@ -916,35 +1218,12 @@ int OGRGenSQLResultsLayer::PrepareSummary()
         {
             swq_col_def *psColDef = psSelectInfo->column_defs + iField;
 
-            if (psColDef->col_func == SWQCF_COUNT)
-            {
-                /* psColDef->field_index can be -1 in the case of a COUNT(*) */
-                if (psColDef->field_index < 0)
-                    pszError = swq_select_summarize( psSelectInfo, iField, "" );
-                else if (IS_GEOM_FIELD_INDEX(poSrcLayer->GetLayerDefn(), psColDef->field_index) )
-                {
-                    int iSrcGeomField = ALL_FIELD_INDEX_TO_GEOM_FIELD_INDEX(
-                            poSrcLayer->GetLayerDefn(), psColDef->field_index);
-                    OGRGeometry* poGeom = poSrcFeature->GetGeomFieldRef(iSrcGeomField);
-                    if( poGeom != nullptr )
-                        pszError = swq_select_summarize( psSelectInfo, iField, "" );
-                    else
-                        pszError = nullptr;
-                }
-                else if (poSrcFeature->IsFieldSetAndNotNull(psColDef->field_index))
-                    pszError = swq_select_summarize( psSelectInfo, iField, poSrcFeature->GetFieldAsString(
-                                                psColDef->field_index ) );
-                else
-                    pszError = nullptr;
-            }
-            else
-            {
-                const char* pszVal = nullptr;
-                if (poSrcFeature->IsFieldSetAndNotNull(psColDef->field_index))
-                    pszVal = poSrcFeature->GetFieldAsString(
-                                                psColDef->field_index );
+            const char* pszVal = nullptr;
+            if( OGRGenSQLGetSummaryInput( poSrcLayer, poSrcFeature,
+                                          psColDef, &pszVal ) )
                 pszError = swq_select_summarize( psSelectInfo, iField, pszVal );
-            }
+            else
+                pszError = nullptr;
 
             if( pszError != nullptr )
             {
@@ -1006,269 +1285,2070 @@ int OGRGenSQLResultsLayer::PrepareSummary()
         {
             swq_col_def *psColDef = psSelectInfo->column_defs + iField;
             if (!psSelectInfo->column_summary.empty() )
-            {
-                swq_summary& oSummary = psSelectInfo->column_summary[iField];
-
-                if( psColDef->col_func == SWQCF_AVG && oSummary.count > 0 )
-                {
-                    if( psColDef->field_type == SWQ_DATE ||
-                        psColDef->field_type == SWQ_TIME ||
-                        psColDef->field_type == SWQ_TIMESTAMP)
-                    {
-                        struct tm brokendowntime;
-                        double dfAvg = oSummary.sum / oSummary.count;
-                        CPLUnixTimeToYMDHMS(static_cast<GIntBig>(dfAvg), &brokendowntime);
-                        poSummaryFeature->SetField( iField,
-                                                    brokendowntime.tm_year + 1900,
-                                                    brokendowntime.tm_mon + 1,
-                                                    brokendowntime.tm_mday,
-                                                    brokendowntime.tm_hour,
-                                                    brokendowntime.tm_min,
-                                                    static_cast<float>(brokendowntime.tm_sec + fmod(dfAvg, 1)),
-                                                    0);
-                    }
-                    else
-                        poSummaryFeature->SetField( iField,
-                                                    oSummary.sum / oSummary.count );
-                }
-                else if( psColDef->col_func == SWQCF_MIN && oSummary.count > 0 )
-                {
-                    if( psColDef->field_type == SWQ_DATE ||
-                        psColDef->field_type == SWQ_TIME ||
-                        psColDef->field_type == SWQ_TIMESTAMP)
-                        poSummaryFeature->SetField( iField, oSummary.osMin.c_str() );
-                    else
-                        poSummaryFeature->SetField( iField, oSummary.min );
-                }
-                else if( psColDef->col_func == SWQCF_MAX && oSummary.count > 0 )
-                {
-                    if( psColDef->field_type == SWQ_DATE ||
-                        psColDef->field_type == SWQ_TIME ||
-                        psColDef->field_type == SWQ_TIMESTAMP)
-                        poSummaryFeature->SetField( iField, oSummary.osMax.c_str() );
-                    else
-                        poSummaryFeature->SetField( iField, oSummary.max );
-                }
-                else if( psColDef->col_func == SWQCF_COUNT )
-                    poSummaryFeature->SetField( iField, oSummary.count );
-                else if( psColDef->col_func == SWQCF_SUM && oSummary.count > 0 )
-                    poSummaryFeature->SetField( iField, oSummary.sum );
-            }
+                OGRGenSQLSetSummaryField( poSummaryFeature, iField, psColDef,
+                                    psSelectInfo->column_summary[iField] );
             else if ( psColDef->col_func == SWQCF_COUNT )
                 poSummaryFeature->SetField( iField, 0 );
         }
     }
 
-    return TRUE;
+    return TRUE;
+}
+
+/************************************************************************/
+/*                       OGRMultiFeatureFetcher()                       */
+/************************************************************************/
+
+static swq_expr_node *OGRMultiFeatureFetcher( swq_expr_node *op,
+                                              void *pFeatureList )
+
+{
+    std::vector<OGRFeature*> *papoFeatures =
+        static_cast<std::vector<OGRFeature*> *>(pFeatureList);
+    swq_expr_node *poRetNode = nullptr;
+
+    CPLAssert( op->eNodeType == SNT_COLUMN );
+
+/* -------------------------------------------------------------------- */
+/*      What feature are we using?  The primary or one of the joined ones?*/
+/* -------------------------------------------------------------------- */
+    if( op->table_index < 0 ||
+        op->table_index >= static_cast<int>(papoFeatures->size()) )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined,
+                  "Request for unexpected table_index (%d) in field fetcher.",
+                  op->table_index );
+        return nullptr;
+    }
+
+    OGRFeature *poFeature = (*papoFeatures)[op->table_index];
+
+/* -------------------------------------------------------------------- */
+/*      Fetch the value.                                                */
+/* -------------------------------------------------------------------- */
+    switch( op->field_type )
+    {
+      case SWQ_INTEGER:
+      case SWQ_BOOLEAN:
+        if( poFeature == nullptr
+            || !poFeature->IsFieldSetAndNotNull(op->field_index) )
+        {
+            poRetNode = new swq_expr_node(0);
+            poRetNode->is_null = TRUE;
+        }
+        else
+            poRetNode = new swq_expr_node(
+                poFeature->GetFieldAsInteger(op->field_index) );
+        break;
+
+      case SWQ_INTEGER64:
+        if( poFeature == nullptr
+            || !poFeature->IsFieldSetAndNotNull(op->field_index) )
+        {
+            poRetNode = new swq_expr_node( static_cast<GIntBig>(0) );
+            poRetNode->is_null = TRUE;
+        }
+        else
+            poRetNode = new swq_expr_node(
+                poFeature->GetFieldAsInteger64(op->field_index) );
+        break;
+
+      case SWQ_FLOAT:
+        if( poFeature == nullptr
+            || !poFeature->IsFieldSetAndNotNull(op->field_index) )
+        {
+            poRetNode = new swq_expr_node( 0.0 );
+            poRetNode->is_null = TRUE;
+        }
+        else
+            poRetNode = new swq_expr_node(
+                poFeature->GetFieldAsDouble(op->field_index) );
+        break;
+
+      case SWQ_GEOMETRY:
+        if( poFeature == nullptr )
+        {
+            poRetNode = new swq_expr_node( static_cast<OGRGeometry*>(nullptr) );
+        }
+        else
+        {
+            int iSrcGeomField = ALL_FIELD_INDEX_TO_GEOM_FIELD_INDEX(
+                poFeature->GetDefnRef(), op->field_index);
+            poRetNode = new swq_expr_node(
+                poFeature->GetGeomFieldRef(iSrcGeomField) );
+        }
+        break;
+
+      default:
+        if( poFeature == nullptr
+            || !poFeature->IsFieldSetAndNotNull(op->field_index) )
+        {
+            poRetNode = new swq_expr_node("");
+            poRetNode->is_null = TRUE;
+        }
+        else
+            poRetNode = new swq_expr_node(
+                poFeature->GetFieldAsString(op->field_index) );
+        break;
+    }
+
+    return poRetNode;
+}
+
+/************************************************************************/
+/*                          GetFilterForJoin()                          */
+/************************************************************************/
+
+static CPLString GetFilterForJoin(swq_expr_node* poExpr, OGRFeature* poSrcFeat,
+                                  OGRLayer* poJoinLayer, int secondary_table)
+{
+    if( poExpr->eNodeType == SNT_CONSTANT )
+    {
+        char* pszRes = poExpr->Unparse(nullptr, '"');
+        CPLString osRes = pszRes;
+        CPLFree(pszRes);
+        return osRes;
+    }
+
+    if( poExpr->eNodeType == SNT_COLUMN )
+    {
+        CPLAssert( poExpr->field_index != -1 );
+        CPLAssert( poExpr->table_index == 0 || poExpr->table_index == secondary_table );
+
+        if( poExpr->table_index == 0 )
+        {
+            // if source key is null, we can't do join.
+            if( !poSrcFeat->IsFieldSetAndNotNull( poExpr->field_index ) )
+            {
+                return "";
+            }
+            OGRFieldType ePrimaryFieldType =
+                    poSrcFeat->GetFieldDefnRef(poExpr->field_index)->GetType();
+            OGRField *psSrcField =
+                    poSrcFeat->GetRawFieldRef(poExpr->field_index);
+
+            switch( ePrimaryFieldType )
+            {
+            case OFTInteger:
+                return CPLString().Printf("%d", psSrcField->Integer );
+                break;
+
+            case OFTInteger64:
+                return CPLString().Printf(CPL_FRMT_GIB, psSrcField->Integer64 );
+                break;
+
+            case OFTReal:
+                return CPLString().Printf("%.16g", psSrcField->Real );
+                break;
+
+            case OFTString:
+            {
+                char *pszEscaped = CPLEscapeString( psSrcField->String,
+                                                    static_cast<int>(strlen(psSrcField->String)),
+                                                    CPLES_SQL );
+                CPLString osRes = "'";
+                osRes += pszEscaped;
+                osRes += "'";
+                CPLFree( pszEscaped );
+                return osRes;
+            }
+            break;
+
+            default:
+                CPLAssert( false );
+                return "";
+            }
+        }
+
+        if(  poExpr->table_index == secondary_table )
+        {
+            OGRFieldDefn* poSecondaryFieldDefn =
+                poJoinLayer->GetLayerDefn()->GetFieldDefn(poExpr->field_index);
+            return CPLSPrintf("\"%s\"", poSecondaryFieldDefn->GetNameRef());
+        }
+
+        CPLAssert(false);
+        return "";
+    }
+
+    if( poExpr->eNodeType == SNT_OPERATION )
+    {
+        /* ----------------------------------------------------------------- */
+        /*      Operation - start by unparsing all the subexpressions.       */
+        /* ----------------------------------------------------------------- */
+        std::vector<char*> apszSubExpr;
+        for( int i = 0; i < poExpr->nSubExprCount; i++ )
+        {
+            CPLString osSubExpr = GetFilterForJoin(poExpr->papoSubExpr[i], poSrcFeat,
+                                                   poJoinLayer, secondary_table);
+            if( osSubExpr.empty() )
+            {
+                for( --i; i >=0; i-- )
+                    CPLFree( apszSubExpr[i] );
+                return "";
+            }
+            apszSubExpr.push_back( CPLStrdup(osSubExpr) );
+        }
+
+        CPLString osExpr = poExpr->UnparseOperationFromUnparsedSubExpr(&apszSubExpr[0]);
+
+        /* ----------------------------------------------------------------- */
+        /*      cleanup subexpressions.                                      */
+        /* ----------------------------------------------------------------- */
+        for( int i = 0; i < poExpr->nSubExprCount; i++ )
+            CPLFree( apszSubExpr[i] );
+
+        return osExpr;
+    }
+
+    return "";
+}
+
+/************************************************************************/
+/*                      OGRGenSQLSerializeFeature()                     */
+/*                                                                      */
+/*      Serialization of features into temporary files.  Records are    */
+/*      read back with the same layer definition, so they are trusted.  */
+/************************************************************************/
+
+static void OGRGenSQLSerializeFeature( OGRFeature* poFeature,
+                                       std::vector<GByte>& abyBuffer )
+{
+    const auto Append = [&abyBuffer](const void* pData, size_t nSize)
+    {
+        const GByte* pabyData = static_cast<const GByte*>(pData);
+        abyBuffer.insert(abyBuffer.end(), pabyData, pabyData + nSize);
+    };
+    const auto AppendString = [&Append](const char* pszStr)
+    {
+        const GUInt32 nLen = static_cast<GUInt32>(strlen(pszStr));
+        Append(&nLen, sizeof(nLen));
+        Append(pszStr, nLen);
+    };
+
+    const GIntBig nFID = poFeature->GetFID();
+    Append(&nFID, sizeof(nFID));
+    for( int i = 0; i < poFeature->GetFieldCount(); i++ )
+    {
+        const GByte byState = !poFeature->IsFieldSet(i) ? 0 :
+                               poFeature->IsFieldNull(i) ? 1 : 2;
+        Append(&byState, 1);
+        if( byState != 2 )
+            continue;
+        const OGRField* psField = poFeature->GetRawFieldRef(i);
+        switch( poFeature->GetFieldDefnRef(i)->GetType() )
+        {
+            case OFTInteger:
+                Append(&psField->Integer, sizeof(int));
+                break;
+            case OFTInteger64:
+                Append(&psField->Integer64, sizeof(GIntBig));
+                break;
+            case OFTReal:
+                Append(&psField->Real, sizeof(double));
+                break;
+            case OFTString:
+                AppendString(psField->String);
+                break;
+            case OFTDate:
+            case OFTTime:
+            case OFTDateTime:
+                Append(&psField->Date, sizeof(psField->Date));
+                break;
+            case OFTBinary:
+                Append(&psField->Binary.nCount, sizeof(int));
+                Append(psField->Binary.paData, psField->Binary.nCount);
+                break;
+            case OFTIntegerList:
+                Append(&psField->IntegerList.nCount, sizeof(int));
+                Append(psField->IntegerList.paList,
+                       psField->IntegerList.nCount * sizeof(int));
+                break;
+            case OFTInteger64List:
+                Append(&psField->Integer64List.nCount, sizeof(int));
+                Append(psField->Integer64List.paList,
+                       psField->Integer64List.nCount * sizeof(GIntBig));
+                break;
+            case OFTRealList:
+                Append(&psField->RealList.nCount, sizeof(int));
+                Append(psField->RealList.paList,
+                       psField->RealList.nCount * sizeof(double));
+                break;
+            case OFTStringList:
+                Append(&psField->StringList.nCount, sizeof(int));
+                for( int j = 0; j < psField->StringList.nCount; j++ )
+                    AppendString(psField->StringList.paList[j]);
+                break;
+            default:
+                break;
+        }
+    }
+    for( int i = 0; i < poFeature->GetGeomFieldCount(); i++ )
+    {
+        OGRGeometry* poGeom = poFeature->GetGeomFieldRef(i);
+        const GUInt32 nWkbSize = poGeom ? poGeom->WkbSize() : 0;
+        Append(&nWkbSize, sizeof(nWkbSize));
+        if( nWkbSize )
+        {
+            const size_t nOldSize = abyBuffer.size();
+            abyBuffer.resize(nOldSize + nWkbSize);
+            poGeom->exportToWkb(wkbNDR, &abyBuffer[nOldSize], wkbVariantIso);
+        }
+    }
+    const char* pszStyleString = poFeature->GetStyleString();
+    const GByte bHasStyleString = pszStyleString != nullptr;
+    Append(&bHasStyleString, 1);
+    if( bHasStyleString )
+        AppendString(pszStyleString);
+}
+
+/************************************************************************/
+/*                     OGRGenSQLDeserializeFeature()                    */
+/************************************************************************/
+
+static OGRFeature* OGRGenSQLDeserializeFeature( OGRFeatureDefn* poDefn,
+                                                const GByte* pabyData )
+{
+    const GByte* pabyIter = pabyData;
+    const auto Read = [&pabyIter](void* pData, size_t nSize)
+    {
+        memcpy(pData, pabyIter, nSize);
+        pabyIter += nSize;
+    };
+    const auto ReadString = [&pabyIter, &Read]()
+    {
+        GUInt32 nLen = 0;
+        Read(&nLen, sizeof(nLen));
+        std::string osStr(reinterpret_cast<const char*>(pabyIter), nLen);
+        pabyIter += nLen;
+        return osStr;
+    };
+
+    OGRFeature* poFeature = new OGRFeature(poDefn);
+    GIntBig nFID = 0;
+    Read(&nFID, sizeof(nFID));
+    poFeature->SetFID(nFID);
+    for( int i = 0; i < poFeature->GetFieldCount(); i++ )
+    {
+        GByte byState = 0;
+        Read(&byState, 1);
+        if( byState == 1 )
+            poFeature->SetFieldNull(i);
+        if( byState != 2 )
+            continue;
+        switch( poFeature->GetFieldDefnRef(i)->GetType() )
+        {
+            case OFTInteger:
+            {
+                int nVal = 0;
+                Read(&nVal, sizeof(nVal));
+                poFeature->SetField(i, nVal);
+                break;
+            }
+            case OFTInteger64:
+            {
+                GIntBig nVal = 0;
+                Read(&nVal, sizeof(nVal));
+                poFeature->SetField(i, nVal);
+                break;
+            }
+            case OFTReal:
+            {
+                double dfVal = 0;
+                Read(&dfVal, sizeof(dfVal));
+                poFeature->SetField(i, dfVal);
+                break;
+            }
+            case OFTString:
+                poFeature->SetField(i, ReadString().c_str());
+                break;
+            case OFTDate:
+            case OFTTime:
+            case OFTDateTime:
+            {
+                OGRField sField;
+                Read(&sField.Date, sizeof(sField.Date));
+                poFeature->SetField(i, &sField);
+                break;
+            }
+            case OFTBinary:
+            {
+                int nCount = 0;
+                Read(&nCount, sizeof(nCount));
+                poFeature->SetField(i, nCount, pabyIter);
+                pabyIter += nCount;
+                break;
+            }
+            case OFTIntegerList:
+            {
+                int nCount = 0;
+                Read(&nCount, sizeof(nCount));
+                std::vector<int> anVals(nCount);
+                Read(anVals.data(), nCount * sizeof(int));
+                poFeature->SetField(i, nCount, anVals.data());
+                break;
+            }
+            case OFTInteger64List:
+            {
+                int nCount = 0;
+                Read(&nCount, sizeof(nCount));
+                std::vector<GIntBig> anVals(nCount);
+                Read(anVals.data(), nCount * sizeof(GIntBig));
+                poFeature->SetField(i, nCount, anVals.data());
+                break;
+            }
+            case OFTRealList:
+            {
+                int nCount = 0;
+                Read(&nCount, sizeof(nCount));
+                std::vector<double> adfVals(nCount);
+                Read(adfVals.data(), nCount * sizeof(double));
+                poFeature->SetField(i, nCount, adfVals.data());
+                break;
+            }
+            case OFTStringList:
+            {
+                int nCount = 0;
+                Read(&nCount, sizeof(nCount));
+                CPLStringList aosList;
+                for( int j = 0; j < nCount; j++ )
+                    aosList.AddString(ReadString().c_str());
+                poFeature->SetField(i, aosList.List());
+                break;
+            }
+            default:
+                break;
+        }
+    }
+    for( int i = 0; i < poFeature->GetGeomFieldCount(); i++ )
+    {
+        GUInt32 nWkbSize = 0;
+        Read(&nWkbSize, sizeof(nWkbSize));
+        if( nWkbSize == 0 )
+            continue;
+        OGRGeometry* poGeom = nullptr;
+        OGRGeometryFactory::createFromWkb(
+            pabyIter,
+            poFeature->GetGeomFieldDefnRef(i)->GetSpatialRef(),
+            &poGeom, nWkbSize);
+        pabyIter += nWkbSize;
+        poFeature->SetGeomFieldDirectly(i, poGeom);
+    }
+    GByte bHasStyleString = 0;
+    Read(&bHasStyleString, 1);
+    if( bHasStyleString )
+        poFeature->SetStyleString(ReadString().c_str());
+    return poFeature;
+}
+
+/************************************************************************/
+/*                        OGRGenSQLWriteRecord()                        */
+/************************************************************************/
+
+static bool OGRGenSQLWriteRecord( VSILFILE* fp,
+                                  const std::vector<GByte>& abyBuffer )
+{
+    const GUInt32 nRecordSize = static_cast<GUInt32>(abyBuffer.size());
+    return VSIFWriteL(&nRecordSize, sizeof(nRecordSize), 1, fp) == 1 &&
+           VSIFWriteL(abyBuffer.data(), 1, nRecordSize, fp) == nRecordSize;
+}
+
+/************************************************************************/
+/*                        OGRGenSQLReadRecord()                         */
+/*                                                                      */
+/*      Read the record at the current position of the file.            */
+/************************************************************************/
+
+static bool OGRGenSQLReadRecord( VSILFILE* fp, std::vector<GByte>& abyBuffer )
+{
+    GUInt32 nRecordSize = 0;
+    if( VSIFReadL(&nRecordSize, sizeof(nRecordSize), 1, fp) != 1 )
+        return false;
+    abyBuffer.resize(nRecordSize);
+    return VSIFReadL(abyBuffer.data(), 1, nRecordSize, fp) == nRecordSize;
+}
+
+/************************************************************************/
+/* ==================================================================== */
+/*                          OGRGenSQLHashJoin                           */
+/* ==================================================================== */
+/*                                                                      */
+/*      Resolves a "primary.field = secondary.field" join by reading    */
+/*      the secondary layer once, and indexing its features by the      */
+/*      value of the join field.  Only the first feature of a given     */
+/*      key is kept, consistently with the attribute filter based       */
+/*      approach that only uses the first matching feature.  Features   */
+/*      are kept in memory up to OGR_SQL_HASH_JOIN_MAX_MEMORY MB, and   */
+/*      spilled to a temporary file beyond.                             */
+/************************************************************************/
+
+class OGRGenSQLHashJoin
+{
+  public:
+    enum class KeyType { INTEGER, REAL, STRING };
+
+  private:
+    OGRLayer       *m_poJoinLayer;
+    int             m_iPrimaryField;
+    int             m_iJoinField;
+    KeyType         m_eKeyType;
+
+    struct Entry
+    {
+        OGRFeature   *poFeature = nullptr;  // if in memory
+        vsi_l_offset  nOffset = 0;          // in m_fpSpill otherwise
+    };
+    std::unordered_map<std::string, Entry> m_oMap{};
+
+    CPLString       m_osSpillFilename{};
+    VSILFILE       *m_fpSpill = nullptr;
+    std::vector<GByte> m_abyBuffer{};
+
+    void        SpillFeature( OGRFeature* poFeature, Entry& oEntry );
+    OGRFeature *ReadSpilledFeature( vsi_l_offset nOffset );
+
+    CPL_DISALLOW_COPY_ASSIGN(OGRGenSQLHashJoin)
+
+  public:
+    OGRGenSQLHashJoin( OGRLayer* poJoinLayer, int iPrimaryField,
+                       int iJoinField, KeyType eKeyType ) :
+        m_poJoinLayer(poJoinLayer), m_iPrimaryField(iPrimaryField),
+        m_iJoinField(iJoinField), m_eKeyType(eKeyType) {}
+    ~OGRGenSQLHashJoin();
+
+    static bool GetKey( KeyType eKeyType, OGRFeature* poFeature, int iField,
+                        bool bPrimary, std::string& osKey );
+
+    bool        Build();
+    bool        GetJoinFeature( OGRFeature* poSrcFeat,
+                                OGRFeature*& poJoinFeature );
+};
+
+/************************************************************************/
+/*                         ~OGRGenSQLHashJoin()                         */
+/************************************************************************/
+
+OGRGenSQLHashJoin::~OGRGenSQLHashJoin()
+{
+    for( auto& oIter: m_oMap )
+        delete oIter.second.poFeature;
+    if( m_fpSpill )
+    {
+        VSIFCloseL(m_fpSpill);
+        VSIUnlink(m_osSpillFilename);
+    }
+}
+
+/************************************************************************/
+/*                               GetKey()                               */
+/*                                                                      */
+/*      Compute the hash key of a field value, so that two values       */
+/*      have the same key if and only if they compare equal with the    */
+/*      OGR SQL "=" operator.  Return false for values that can never   */
+/*      match, or that cannot be hashed consistently with the "="       */
+/*      operator.                                                       */
+/*                                                                      */
+/*      Real values of the primary table are rounded as they are when   */
+/*      formatted in the attribute filter set on the secondary table    */
+/*      by GetFilterForJoin(), so that both paths give the same result. */
+/************************************************************************/
+
+bool OGRGenSQLHashJoin::GetKey( KeyType eKeyType, OGRFeature* poFeature,
+                                int iField, bool bPrimary,
+                                std::string& osKey )
+{
+    if( !poFeature->IsFieldSetAndNotNull(iField) )
+        return false;
+
+    switch( eKeyType )
+    {
+        case KeyType::INTEGER:
+        {
+            const GIntBig nVal = poFeature->GetFieldAsInteger64(iField);
+            osKey.assign(reinterpret_cast<const char*>(&nVal), sizeof(nVal));
+            return true;
+        }
+
+        case KeyType::REAL:
+        {
+            double dfVal = poFeature->GetFieldAsDouble(iField);
+            if( CPLIsNan(dfVal) )
+                return false;
+            if( bPrimary &&
+                poFeature->GetFieldDefnRef(iField)->GetType() == OFTReal )
+            {
+                dfVal = CPLAtof(CPLSPrintf("%.16g", dfVal));
+            }
+            if( dfVal == 0.0 )
+                dfVal = 0.0;  // Normalize -0.0
+            osKey.assign(reinterpret_cast<const char*>(&dfVal), sizeof(dfVal));
+            return true;
+        }
+
+        case KeyType::STRING:
+        {
+            // Values looking like timestamps have special comparison rules.
+            const char* pszVal = poFeature->GetFieldAsString(iField);
+            const size_t nLen = strlen(pszVal);
+            if( nLen > 3 && (pszVal[nLen-3] == ':' ||
+                             strcmp(pszVal + nLen - 3, "+00") == 0) )
+            {
+                return false;
+            }
+            // String comparison is case insensitive.
+            osKey.resize(nLen);
+            for( size_t i = 0; i < nLen; i++ )
+                osKey[i] = static_cast<char>(
+                    toupper(static_cast<unsigned char>(pszVal[i])));
+            return true;
+        }
+    }
+    return false;
+}
+
+/************************************************************************/
+/*                                Build()                               */
+/************************************************************************/
+
+bool OGRGenSQLHashJoin::Build()
+{
+    const GIntBig nMaxMemory = std::max(0, atoi(
+        CPLGetConfigOption("OGR_SQL_HASH_JOIN_MAX_MEMORY", "100"))) *
+                                                static_cast<GIntBig>(1024 * 1024);
+    GIntBig nMemory = 0;
+
+    m_poJoinLayer->SetAttributeFilter( nullptr );
+    m_poJoinLayer->ResetReading();
+
+    std::string osKey;
+    OGRFeature* poFeature = nullptr;
+    while( (poFeature = m_poJoinLayer->GetNextFeature()) != nullptr )
+    {
+        if( !GetKey(m_eKeyType, poFeature, m_iJoinField, false, osKey) )
+        {
+            // A string value that cannot be hashed: the join cannot be
+            // resolved with a hash table.
+            if( m_eKeyType == KeyType::STRING &&
+                poFeature->IsFieldSetAndNotNull(m_iJoinField) )
+            {
+                delete poFeature;
+                CPLDebug("GenSQL", "Cannot use hash join on layer %s",
+                         m_poJoinLayer->GetName());
+                return false;
+            }
+            delete poFeature;
+            continue;
+        }
+
+        auto oIter = m_oMap.find(osKey);
+        if( oIter != m_oMap.end() )
+        {
+            delete poFeature;
+            continue;
+        }
+
+        Entry& oEntry = m_oMap[osKey];
+        nMemory += osKey.size() + sizeof(Entry) + 32;
+        if( m_fpSpill == nullptr )
+        {
+            // Rough estimate of the memory used by a feature.
+            GIntBig nFeatureMemory = sizeof(OGRFeature) +
+                poFeature->GetFieldCount() * sizeof(OGRField);
+            for( int i = 0; i < poFeature->GetFieldCount(); i++ )
+            {
+                if( poFeature->GetFieldDefnRef(i)->GetType() == OFTString &&
+                    poFeature->IsFieldSetAndNotNull(i) )
+                {
+                    nFeatureMemory += strlen(poFeature->GetFieldAsString(i));
+                }
+            }
+            for( int i = 0; i < poFeature->GetGeomFieldCount(); i++ )
+            {
+                OGRGeometry* poGeom = poFeature->GetGeomFieldRef(i);
+                if( poGeom )
+                    nFeatureMemory += poGeom->WkbSize();
+            }
+            nMemory += nFeatureMemory;
+        }
+
+        if( m_fpSpill == nullptr && nMemory <= nMaxMemory )
+        {
+            oEntry.poFeature = poFeature;
+        }
+        else
+        {
+            SpillFeature(poFeature, oEntry);
+            delete poFeature;
+            if( m_fpSpill == nullptr )
+                return false;
+        }
+    }
+
+    CPLDebug("GenSQL", "Hash join on layer %s: %d distinct keys%s",
+             m_poJoinLayer->GetName(), static_cast<int>(m_oMap.size()),
+             m_fpSpill ? ", some features spilled to disk" : "");
+    return true;
+}
+
+/************************************************************************/
+/*                            SpillFeature()                            */
+/************************************************************************/
+
+void OGRGenSQLHashJoin::SpillFeature( OGRFeature* poFeature, Entry& oEntry )
+{
+    if( m_fpSpill == nullptr )
+    {
+        m_osSpillFilename = CPLGenerateTempFilename("ogr_gensql_hash_join");
+        m_fpSpill = VSIFOpenL(m_osSpillFilename, "wb+");
+        if( m_fpSpill == nullptr )
+        {
+            CPLError(CE_Failure, CPLE_FileIO, "Cannot create %s",
+                     m_osSpillFilename.c_str());
+            return;
+        }
+        CPLDebug("GenSQL", "Spilling hash join features to %s",
+                 m_osSpillFilename.c_str());
+    }
+
+    m_abyBuffer.clear();
+    OGRGenSQLSerializeFeature(poFeature, m_abyBuffer);
+
+    VSIFSeekL(m_fpSpill, 0, SEEK_END);
+    oEntry.nOffset = VSIFTellL(m_fpSpill);
+    if( !OGRGenSQLWriteRecord(m_fpSpill, m_abyBuffer) )
+    {
+        CPLError(CE_Failure, CPLE_FileIO, "Cannot write into %s",
+                 m_osSpillFilename.c_str());
+        VSIFCloseL(m_fpSpill);
+        VSIUnlink(m_osSpillFilename);
+        m_fpSpill = nullptr;
+    }
+}
+
+/************************************************************************/
+/*                         ReadSpilledFeature()                         */
+/************************************************************************/
+
+OGRFeature *OGRGenSQLHashJoin::ReadSpilledFeature( vsi_l_offset nOffset )
+{
+    if( VSIFSeekL(m_fpSpill, nOffset, SEEK_SET) != 0 ||
+        !OGRGenSQLReadRecord(m_fpSpill, m_abyBuffer) )
+    {
+        return nullptr;
+    }
+    return OGRGenSQLDeserializeFeature(m_poJoinLayer->GetLayerDefn(),
+                                       m_abyBuffer.data());
+}
+
+/************************************************************************/
+/*                           GetJoinFeature()                           */
+/************************************************************************/
+
+bool OGRGenSQLHashJoin::GetJoinFeature( OGRFeature* poSrcFeat,
+                                        OGRFeature*& poJoinFeature )
+{
+    poJoinFeature = nullptr;
+    std::string osKey;
+    if( !GetKey(m_eKeyType, poSrcFeat, m_iPrimaryField, true, osKey) )
+    {
+        // Unhashable non-null strings must go through the regular path.
+        return !(m_eKeyType == KeyType::STRING &&
+                 poSrcFeat->IsFieldSetAndNotNull(m_iPrimaryField));
+    }
+    auto oIter = m_oMap.find(osKey);
+    if( oIter == m_oMap.end() )
+        return true;
+    if( oIter->second.poFeature )
+        poJoinFeature = oIter->second.poFeature->Clone();
+    else
+        poJoinFeature = ReadSpilledFeature(oIter->second.nOffset);
+    return true;
+}
+
+/************************************************************************/
+/*                     EvaluatesAttributeFilters()                      */
+/*                                                                      */
+/*      Whether the layers of a dataset evaluate attribute filters      */
+/*      themselves instead of testing each feature with OGR SQL.        */
+/************************************************************************/
+
+static bool EvaluatesAttributeFilters( GDALDataset* poDS )
+{
+    GDALDriver* poDriver = poDS->GetDriver();
+    if( poDriver == nullptr )
+        return false;
+    const char* const apszDrivers[] = {
+        "SQLite", "GPKG", "PostgreSQL", "PGeo", "OpenFileGDB", "FileGDB",
+        "MSSQLSpatial", "MySQL", "OCI", "ODBC" };
+    const char* pszDriverName = poDriver->GetDescription();
+    for( const char* pszName: apszDrivers )
+    {
+        if( EQUAL(pszDriverName, pszName) )
+            return true;
+    }
+    return false;
+}
+
+/************************************************************************/
+/*                            GetHashJoin()                             */
+/*                                                                      */
+/*      Return the hash join to use to resolve a join, building it      */
+/*      the first time, or nullptr if the join must be resolved by      */
+/*      setting an attribute filter on the secondary layer for each     */
+/*      primary feature.                                                */
+/************************************************************************/
+
+OGRGenSQLHashJoin *OGRGenSQLResultsLayer::GetHashJoin( int iJoin )
+{
+    swq_select *psSelectInfo = static_cast<swq_select*>(pSelectInfo);
+    if( m_abHashJoinsPrepared.empty() )
+    {
+        m_abHashJoinsPrepared.resize(psSelectInfo->join_count);
+        m_apoHashJoins.resize(psSelectInfo->join_count);
+    }
+    if( m_abHashJoinsPrepared[iJoin] )
+        return m_apoHashJoins[iJoin].get();
+    m_abHashJoinsPrepared[iJoin] = true;
+
+    const char* pszHashJoin = CPLGetConfigOption("OGR_SQL_HASH_JOIN", "AUTO");
+    const bool bAuto = EQUAL(pszHashJoin, "AUTO");
+    if( !bAuto && !CPLTestBool(pszHashJoin) )
+        return nullptr;
+
+/* -------------------------------------------------------------------- */
+/*      Only "primary.field = secondary.field" joins are supported.     */
+/* -------------------------------------------------------------------- */
+    swq_join_def *psJoinInfo = psSelectInfo->join_defs + iJoin;
+    swq_expr_node* poExpr = psJoinInfo->poExpr;
+    if( poExpr == nullptr || poExpr->eNodeType != SNT_OPERATION ||
+        poExpr->nOperation != SWQ_EQ || poExpr->nSubExprCount != 2 ||
+        poExpr->papoSubExpr[0]->eNodeType != SNT_COLUMN ||
+        poExpr->papoSubExpr[1]->eNodeType != SNT_COLUMN )
+    {
+        return nullptr;
+    }
+
+    swq_expr_node* poPrimary = poExpr->papoSubExpr[0];
+    swq_expr_node* poSecondary = poExpr->papoSubExpr[1];
+    if( poPrimary->table_index != 0 )
+        std::swap(poPrimary, poSecondary);
+    if( poPrimary->table_index != 0 ||
+        poSecondary->table_index != psJoinInfo->secondary_table )
+    {
+        return nullptr;
+    }
+
+    OGRLayer *poJoinLayer = papoTableLayers[psJoinInfo->secondary_table];
+    if( poJoinLayer == poSrcLayer )
+        return nullptr;
+
+    OGRFeatureDefn* poSrcDefn = poSrcLayer->GetLayerDefn();
+    OGRFeatureDefn* poJoinDefn = poJoinLayer->GetLayerDefn();
+    const int iPrimaryField = poPrimary->field_index;
+    const int iJoinField = poSecondary->field_index;
+    if( iPrimaryField < 0 || iPrimaryField >= poSrcDefn->GetFieldCount() ||
+        iJoinField < 0 || iJoinField >= poJoinDefn->GetFieldCount() )
+    {
+        return nullptr;
+    }
+
+    const auto IsInteger = [](OGRFieldType eType)
+        { return eType == OFTInteger || eType == OFTInteger64; };
+    const OGRFieldType ePrimaryType =
+        poSrcDefn->GetFieldDefn(iPrimaryField)->GetType();
+    const OGRFieldType eJoinType =
+        poJoinDefn->GetFieldDefn(iJoinField)->GetType();
+    OGRGenSQLHashJoin::KeyType eKeyType;
+    if( IsInteger(ePrimaryType) && IsInteger(eJoinType) )
+        eKeyType = OGRGenSQLHashJoin::KeyType::INTEGER;
+    else if( (IsInteger(ePrimaryType) || ePrimaryType == OFTReal) &&
+             (IsInteger(eJoinType) || eJoinType == OFTReal) )
+        eKeyType = OGRGenSQLHashJoin::KeyType::REAL;
+    else if( ePrimaryType == OFTString && eJoinType == OFTString )
+        eKeyType = OGRGenSQLHashJoin::KeyType::STRING;
+    else
+        return nullptr;
+
+/* -------------------------------------------------------------------- */
+/*      Attribute filters are efficient if the secondary layer has an  */
+/*      attribute index on the join field, or if its driver evaluates   */
+/*      them itself, typically with its own indexes.                    */
+/* -------------------------------------------------------------------- */
+    if( bAuto && poJoinLayer->GetIndex() != nullptr &&
+        poJoinLayer->GetIndex()->GetFieldIndex(iJoinField) != nullptr )
+    {
+        return nullptr;
+    }
+    if( bAuto &&
+        static_cast<size_t>(psJoinInfo->secondary_table) <
+                                                m_apoTableDS.size() &&
+        EvaluatesAttributeFilters(
+            m_apoTableDS[psJoinInfo->secondary_table]) )
+    {
+        return nullptr;
+    }
+
+    std::unique_ptr<OGRGenSQLHashJoin> poHashJoin(
+        new OGRGenSQLHashJoin(poJoinLayer, iPrimaryField, iJoinField,
+                              eKeyType));
+    const bool bOK = poHashJoin->Build();
+    poJoinLayer->ResetReading();
+    if( !bOK )
+        return nullptr;
+    m_apoHashJoins[iJoin] = std::move(poHashJoin);
+    return m_apoHashJoins[iJoin].get();
+}
+
+/************************************************************************/
+/*                          OGRGenSQLGroupBy()                          */
+/************************************************************************/
+
+OGRGenSQLGroupBy::OGRGenSQLGroupBy( swq_select* psSelectInfo,
+                                    OGRFeatureDefn* poDefn,
+                                    OGRLayer* poSrcLayer ) :
+    m_psSelectInfo(psSelectInfo),
+    m_poDefn(poDefn),
+    m_poSrcLayer(poSrcLayer),
+    m_nMaxMemory(std::max(0, atoi(
+        CPLGetConfigOption("OGR_SQL_GROUP_BY_MAX_MEMORY", "100"))) *
+                                            static_cast<GIntBig>(1024 * 1024))
+{
+    for( int iField = 0; iField < psSelectInfo->result_columns; iField++ )
+    {
+        const swq_col_def *psColDef = psSelectInfo->column_defs + iField;
+        int iGroupByDef = -1;
+        for( int i = 0; psColDef->col_func == SWQCF_NONE &&
+                        i < psSelectInfo->group_by_count; i++ )
+        {
+            if( psSelectInfo->group_by_defs[i].field_index ==
+                                                    psColDef->field_index )
+            {
+                iGroupByDef = i;
+                break;
+            }
+        }
+        m_anGroupByDef.push_back(iGroupByDef);
+    }
+    m_aoInputs.resize(psSelectInfo->result_columns);
+}
+
+/************************************************************************/
+/*                         ~OGRGenSQLGroupBy()                          */
+/************************************************************************/
+
+OGRGenSQLGroupBy::~OGRGenSQLGroupBy()
+{
+    for( auto& oPartition: m_aoPartitions )
+    {
+        if( oPartition.fp )
+        {
+            VSIFCloseL(oPartition.fp);
+            VSIUnlink(oPartition.osFilename);
+        }
+    }
+    for( const auto& oPending: m_aoPendingPartitions )
+        VSIUnlink(oPending.first);
+    for( auto poRow: m_apoRows )
+        delete poRow;
+    if( m_fpRows )
+    {
+        VSIFCloseL(m_fpRows);
+        VSIUnlink(m_osRowsFilename);
+    }
+}
+
+/************************************************************************/
+/*                             ComputeKey()                             */
+/*                                                                      */
+/*      Compute the binary key made of the values of the GROUP BY       */
+/*      fields.                                                         */
+/************************************************************************/
+
+void OGRGenSQLGroupBy::ComputeKey( OGRFeature* poSrcFeature )
+{
+    m_osKey.clear();
+    const int nSrcFieldCount = poSrcFeature->GetFieldCount();
+    for( int i = 0; i < m_psSelectInfo->group_by_count; i++ )
+    {
+        const swq_group_by_def *psDef = m_psSelectInfo->group_by_defs + i;
+        const int iField = psDef->field_index;
+        if( !poSrcFeature->IsFieldSetAndNotNull(iField) )
+        {
+            m_osKey += '\0';
+            continue;
+        }
+        m_osKey += '\1';
+        switch( psDef->field_type )
+        {
+            case SWQ_INTEGER:
+            case SWQ_INTEGER64:
+            case SWQ_BOOLEAN:
+            {
+                const GIntBig nVal = poSrcFeature->GetFieldAsInteger64(iField);
+                m_osKey.append(reinterpret_cast<const char*>(&nVal),
+                               sizeof(nVal));
+                break;
+            }
+
+            case SWQ_FLOAT:
+            {
+                double dfVal = poSrcFeature->GetFieldAsDouble(iField);
+                if( dfVal == 0.0 )
+                    dfVal = 0.0;  // Normalize -0.0
+                m_osKey.append(reinterpret_cast<const char*>(&dfVal),
+                               sizeof(dfVal));
+                break;
+            }
+
+            case SWQ_DATE:
+            case SWQ_TIME:
+            case SWQ_TIMESTAMP:
+                if( iField < nSrcFieldCount )
+                {
+                    const OGRField* psField =
+                        poSrcFeature->GetRawFieldRef(iField);
+                    m_osKey.append(
+                        reinterpret_cast<const char*>(&psField->Date.Year),
+                        sizeof(psField->Date.Year));
+                    m_osKey += static_cast<char>(psField->Date.Month);
+                    m_osKey += static_cast<char>(psField->Date.Day);
+                    m_osKey += static_cast<char>(psField->Date.Hour);
+                    m_osKey += static_cast<char>(psField->Date.Minute);
+                    m_osKey += static_cast<char>(psField->Date.TZFlag);
+                    m_osKey.append(
+                        reinterpret_cast<const char*>(&psField->Date.Second),
+                        sizeof(psField->Date.Second));
+                    break;
+                }
+                CPL_FALLTHROUGH
+
+            default:
+            {
+                const char* pszVal = poSrcFeature->GetFieldAsString(iField);
+                const GUInt32 nLen = static_cast<GUInt32>(strlen(pszVal));
+                m_osKey.append(reinterpret_cast<const char*>(&nLen),
+                               sizeof(nLen));
+                m_osKey.append(pszVal, nLen);
+                break;
+            }
+        }
+    }
+}
+
+/************************************************************************/
+/*                           ComputeInputs()                            */
+/************************************************************************/
+
+void OGRGenSQLGroupBy::ComputeInputs( OGRFeature* poSrcFeature )
+{
+    for( int iField = 0; iField < m_psSelectInfo->result_columns; iField++ )
+    {
+        Input& oInput = m_aoInputs[iField];
+        const char* pszVal = nullptr;
+        if( m_anGroupByDef[iField] >= 0 ||
+            !OGRGenSQLGetSummaryInput(
+                m_poSrcLayer, poSrcFeature,
+                m_psSelectInfo->column_defs + iField, &pszVal) )
+        {
+            oInput.eState = INPUT_SKIP;
+        }
+        else if( pszVal == nullptr )
+        {
+            oInput.eState = INPUT_NULL;
+        }
+        else
+        {
+            oInput.eState = INPUT_VALUE;
+            oInput.osValue = pszVal;
+        }
+    }
+}
+
+/************************************************************************/
+/*                             AddFeature()                             */
+/************************************************************************/
+
+bool OGRGenSQLGroupBy::AddFeature( OGRFeature* poSrcFeature )
+{
+    ComputeKey(poSrcFeature);
+    ComputeInputs(poSrcFeature);
+    return ProcessRow();
+}
+
+/************************************************************************/
+/*                             ProcessRow()                             */
+/************************************************************************/
+
+bool OGRGenSQLGroupBy::ProcessRow()
+{
+    auto oIter = m_oMapKeyToGroup.find(m_osKey);
+    if( oIter != m_oMapKeyToGroup.end() )
+        return Summarize(oIter->second);
+
+    // Always accept at least one group so that each pass makes progress.
+    if( !m_apoKeys.empty() && m_nMemory > m_nMaxMemory )
+        return WriteToPartition();
+
+    const size_t iGroup = m_apoKeys.size();
+    oIter = m_oMapKeyToGroup.insert(
+        std::pair<std::string, size_t>(m_osKey, iGroup)).first;
+    m_apoKeys.push_back(&(oIter->first));
+    m_aaoSummaries.emplace_back();
+    m_nMemory += 2 * m_osKey.size() + 64 +
+        m_psSelectInfo->result_columns * sizeof(swq_summary);
+    return Summarize(iGroup);
+}
+
+/************************************************************************/
+/*                             Summarize()                              */
+/************************************************************************/
+
+bool OGRGenSQLGroupBy::Summarize( size_t iGroup )
+{
+    // swq_select_summarize() works on the column_summary member of the
+    // select info, so temporarily install the summaries of the group there.
+    std::swap(m_psSelectInfo->column_summary, m_aaoSummaries[iGroup]);
+
+    const char *pszError = nullptr;
+    for( int iField = 0; pszError == nullptr &&
+                         iField < m_psSelectInfo->result_columns; iField++ )
+    {
+        const Input& oInput = m_aoInputs[iField];
+        if( oInput.eState == INPUT_SKIP )
+            continue;
+        const bool bDistinct =
+            CPL_TO_BOOL(m_psSelectInfo->column_defs[iField].distinct_flag);
+        const GIntBig nCountBefore =
+            (bDistinct && !m_psSelectInfo->column_summary.empty()) ?
+                m_psSelectInfo->column_summary[iField].count : 0;
+        pszError = swq_select_summarize(
+            m_psSelectInfo, iField,
+            oInput.eState == INPUT_NULL ? nullptr : oInput.osValue.c_str() );
+        if( pszError == nullptr && bDistinct &&
+            m_psSelectInfo->column_summary[iField].count != nCountBefore )
+        {
+            m_nMemory += 2 * oInput.osValue.size() + 96;
+        }
+    }
+
+    std::swap(m_psSelectInfo->column_summary, m_aaoSummaries[iGroup]);
+
+    if( pszError != nullptr )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined, "%s", pszError );
+        return false;
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                          WriteToPartition()                          */
+/************************************************************************/
+
+bool OGRGenSQLGroupBy::WriteToPartition()
+{
+    // Spread groups among partitions with a hash function that depends
+    // on the pass, so that a partition is split by the next pass.
+    GUInt64 nHash = std::hash<std::string>()(m_osKey);
+    nHash ^= static_cast<GUInt64>(m_nLevel + 1) * 0x9E3779B97F4A7C15ULL;
+    nHash ^= nHash >> 33;
+    nHash *= 0xFF51AFD7ED558CCDULL;
+    nHash ^= nHash >> 33;
+
+    if( m_aoPartitions.empty() )
+        m_aoPartitions.resize(PARTITION_COUNT);
+    Partition& oPartition =
+        m_aoPartitions[static_cast<size_t>(nHash % PARTITION_COUNT)];
+    if( oPartition.fp == nullptr )
+    {
+        oPartition.osFilename =
+            CPLGenerateTempFilename("ogr_gensql_group_by");
+        oPartition.fp = VSIFOpenL(oPartition.osFilename, "wb");
+        if( oPartition.fp == nullptr )
+        {
+            CPLError(CE_Failure, CPLE_FileIO, "Cannot create %s",
+                     oPartition.osFilename.c_str());
+            return false;
+        }
+    }
+
+    m_abyBuffer.clear();
+    const auto AppendString = [this](const std::string& osStr)
+    {
+        const GUInt32 nLen = static_cast<GUInt32>(osStr.size());
+        const GByte* pabyLen = reinterpret_cast<const GByte*>(&nLen);
+        m_abyBuffer.insert(m_abyBuffer.end(), pabyLen, pabyLen + sizeof(nLen));
+        m_abyBuffer.insert(m_abyBuffer.end(), osStr.begin(), osStr.end());
+    };
+    AppendString(m_osKey);
+    for( const auto& oInput: m_aoInputs )
+    {
+        m_abyBuffer.push_back(oInput.eState);
+        if( oInput.eState == INPUT_VALUE )
+            AppendString(oInput.osValue);
+    }
+    if( !OGRGenSQLWriteRecord(oPartition.fp, m_abyBuffer) )
+    {
+        CPLError(CE_Failure, CPLE_FileIO, "Cannot write into %s",
+                 oPartition.osFilename.c_str());
+        return false;
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                           ReadPartition()                            */
+/************************************************************************/
+
+bool OGRGenSQLGroupBy::ReadPartition( const CPLString& osFilename )
+{
+    VSILFILE* fp = VSIFOpenL(osFilename, "rb");
+    if( fp == nullptr )
+    {
+        CPLError(CE_Failure, CPLE_FileIO, "Cannot open %s",
+                 osFilename.c_str());
+        return false;
+    }
+
+    bool bRet = true;
+    while( bRet && OGRGenSQLReadRecord(fp, m_abyBuffer) )
+    {
+        // Records have been written by WriteToPartition(), so are trusted.
+        const GByte* pabyIter = m_abyBuffer.data();
+        const auto ReadString = [&pabyIter](std::string& osStr)
+        {
+            GUInt32 nLen = 0;
+            memcpy(&nLen, pabyIter, sizeof(nLen));
+            pabyIter += sizeof(nLen);
+            osStr.assign(reinterpret_cast<const char*>(pabyIter), nLen);
+            pabyIter += nLen;
+        };
+        ReadString(m_osKey);
+        for( auto& oInput: m_aoInputs )
+        {
+            oInput.eState = static_cast<InputState>(*pabyIter);
+            pabyIter++;
+            if( oInput.eState == INPUT_VALUE )
+                ReadString(oInput.osValue);
+        }
+        bRet = ProcessRow();
+    }
+
+    VSIFCloseL(fp);
+    VSIUnlink(osFilename);
+    return bRet;
+}
+
+/************************************************************************/
+/*                             EmitGroups()                             */
+/*                                                                      */
+/*      Turn the groups of the current pass into result rows, and       */
+/*      reset the hash table.                                           */
+/************************************************************************/
+
+bool OGRGenSQLGroupBy::EmitGroups()
+{
+    bool bRet = true;
+    for( size_t iGroup = 0; bRet && iGroup < m_apoKeys.size(); iGroup++ )
+    {
+        OGRFeature* poRow = new OGRFeature(m_poDefn);
+
+        // Decode the values of the GROUP BY fields from the key.
+        const GByte* pabyIter =
+            reinterpret_cast<const GByte*>(m_apoKeys[iGroup]->data());
+        std::vector<const GByte*> apabyValues;
+        for( int i = 0; i < m_psSelectInfo->group_by_count; i++ )
+        {
+            const swq_group_by_def *psDef = m_psSelectInfo->group_by_defs + i;
+            apabyValues.push_back(*pabyIter == 0 ? nullptr : pabyIter + 1);
+            if( *pabyIter++ == 0 )
+                continue;
+            switch( psDef->field_type )
+            {
+                case SWQ_INTEGER:
+                case SWQ_INTEGER64:
+                case SWQ_BOOLEAN:
+                case SWQ_FLOAT:
+                    pabyIter += 8;
+                    break;
+                case SWQ_DATE:
+                case SWQ_TIME:
+                case SWQ_TIMESTAMP:
+                    if( psDef->field_index <
+                            m_poSrcLayer->GetLayerDefn()->GetFieldCount() )
+                    {
+                        pabyIter += sizeof(GInt16) + 5 + sizeof(float);
+                        break;
+                    }
+                    CPL_FALLTHROUGH
+                default:
+                {
+                    GUInt32 nLen = 0;
+                    memcpy(&nLen, pabyIter, sizeof(nLen));
+                    pabyIter += sizeof(nLen) + nLen;
+                    break;
+                }
+            }
+        }
+
+        std::vector<swq_summary>& aoSummary = m_aaoSummaries[iGroup];
+        for( int iField = 0; iField < m_psSelectInfo->result_columns;
+                                                                iField++ )
+        {
+            const swq_col_def *psColDef = m_psSelectInfo->column_defs + iField;
+            const int iGroupByDef = m_anGroupByDef[iField];
+            if( iGroupByDef < 0 )
+            {
+                if( !aoSummary.empty() )
+                    OGRGenSQLSetSummaryField(poRow, iField, psColDef,
+                                             aoSummary[iField]);
+                else if( psColDef->col_func == SWQCF_COUNT )
+                    poRow->SetField(iField, 0);
+                continue;
+            }
+
+            const GByte* pabyValue = apabyValues[iGroupByDef];
+            if( pabyValue == nullptr )
+            {
+                poRow->SetFieldNull(iField);
+                continue;
+            }
+            const swq_group_by_def *psDef =
+                m_psSelectInfo->group_by_defs + iGroupByDef;
+            switch( psDef->field_type )
+            {
+                case SWQ_INTEGER:
+                case SWQ_INTEGER64:
+                case SWQ_BOOLEAN:
+                {
+                    GIntBig nVal = 0;
+                    memcpy(&nVal, pabyValue, sizeof(nVal));
+                    poRow->SetField(iField, nVal);
+                    break;
+                }
+                case SWQ_FLOAT:
+                {
+                    double dfVal = 0;
+                    memcpy(&dfVal, pabyValue, sizeof(dfVal));
+                    poRow->SetField(iField, dfVal);
+                    break;
+                }
+                case SWQ_DATE:
+                case SWQ_TIME:
+                case SWQ_TIMESTAMP:
+                    if( psDef->field_index <
+                            m_poSrcLayer->GetLayerDefn()->GetFieldCount() )
+                    {
+                        GInt16 nYear = 0;
+                        memcpy(&nYear, pabyValue, sizeof(nYear));
+                        pabyValue += sizeof(nYear);
+                        float fSecond = 0;
+                        memcpy(&fSecond, pabyValue + 5, sizeof(fSecond));
+                        poRow->SetField(iField, nYear, pabyValue[0],
+                                        pabyValue[1], pabyValue[2],
+                                        pabyValue[3], fSecond, pabyValue[4]);
+                        break;
+                    }
+                    CPL_FALLTHROUGH
+                default:
+                {
+                    GUInt32 nLen = 0;
+                    memcpy(&nLen, pabyValue, sizeof(nLen));
+                    poRow->SetField(iField, std::string(
+                        reinterpret_cast<const char*>(pabyValue) +
+                                            sizeof(nLen), nLen).c_str());
+                    break;
+                }
+            }
+        }
+
+/* -------------------------------------------------------------------- */
+/*      Apply the HAVING clause.                                        */
+/* -------------------------------------------------------------------- */
+        bool bKeep = true;
+        if( m_psSelectInfo->having_result_expr != nullptr )
+        {
+            std::vector<OGRFeature*> apoFeatures(1, poRow);
+            swq_expr_node *poResult =
+                m_psSelectInfo->having_result_expr->Evaluate(
+                    OGRMultiFeatureFetcher, &apoFeatures );
+            bKeep = poResult != nullptr && !poResult->is_null &&
+                    (poResult->field_type == SWQ_INTEGER ||
+                     poResult->field_type == SWQ_INTEGER64 ||
+                     poResult->field_type == SWQ_BOOLEAN) &&
+                    poResult->int_value != 0;
+            delete poResult;
+        }
+
+        if( bKeep )
+            bRet = AddRow(poRow);
+        else
+            delete poRow;
+    }
+
+    m_oMapKeyToGroup.clear();
+    m_apoKeys.clear();
+    m_aaoSummaries.clear();
+    m_nMemory = 0;
+    return bRet;
+}
+
+/************************************************************************/
+/*                               AddRow()                               */
+/************************************************************************/
+
+bool OGRGenSQLGroupBy::AddRow( OGRFeature* poRow )
+{
+    if( m_fpRows == nullptr && m_nRowsMemory <= m_nMaxMemory )
+    {
+        m_nRowsMemory += sizeof(OGRFeature) + 16 +
+            poRow->GetFieldCount() * sizeof(OGRField);
+        for( int i = 0; i < poRow->GetFieldCount(); i++ )
+        {
+            if( poRow->GetFieldDefnRef(i)->GetType() == OFTString &&
+                poRow->IsFieldSetAndNotNull(i) )
+            {
+                m_nRowsMemory += strlen(poRow->GetFieldAsString(i));
+            }
+        }
+        m_apoRows.push_back(poRow);
+        return true;
+    }
+
+    if( m_fpRows == nullptr )
+    {
+        m_osRowsFilename = CPLGenerateTempFilename("ogr_gensql_group_by");
+        m_fpRows = VSIFOpenL(m_osRowsFilename, "wb+");
+        if( m_fpRows == nullptr )
+        {
+            CPLError(CE_Failure, CPLE_FileIO, "Cannot create %s",
+                     m_osRowsFilename.c_str());
+            delete poRow;
+            return false;
+        }
+    }
+
+    m_abyBuffer.clear();
+    OGRGenSQLSerializeFeature(poRow, m_abyBuffer);
+    delete poRow;
+    VSIFSeekL(m_fpRows, 0, SEEK_END);
+    m_anRowOffsets.push_back(VSIFTellL(m_fpRows));
+    if( !OGRGenSQLWriteRecord(m_fpRows, m_abyBuffer) )
+    {
+        CPLError(CE_Failure, CPLE_FileIO, "Cannot write into %s",
+                 m_osRowsFilename.c_str());
+        return false;
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                              LoadRow()                               */
+/************************************************************************/
+
+OGRFeature *OGRGenSQLGroupBy::LoadRow( size_t iRow )
+{
+    if( iRow < m_apoRows.size() )
+        return m_apoRows[iRow]->Clone();
+
+    if( VSIFSeekL(m_fpRows, m_anRowOffsets[iRow - m_apoRows.size()],
+                  SEEK_SET) != 0 ||
+        !OGRGenSQLReadRecord(m_fpRows, m_abyBuffer) )
+    {
+        return nullptr;
+    }
+    return OGRGenSQLDeserializeFeature(m_poDefn, m_abyBuffer.data());
+}
+
+/************************************************************************/
+/*                               Finish()                               */
+/*                                                                      */
+/*      Called once all source features have been added.                */
+/************************************************************************/
+
+bool OGRGenSQLGroupBy::Finish()
+{
+    if( !EmitGroups() )
+        return false;
+
+    while( true )
+    {
+        // Partitions written during the last pass will be read by the next
+        // one.
+        for( auto& oPartition: m_aoPartitions )
+        {
+            if( oPartition.fp )
+            {
+                VSIFCloseL(oPartition.fp);
+                oPartition.fp = nullptr;
+                m_aoPendingPartitions.emplace_back(oPartition.osFilename,
+                                                   m_nLevel + 1);
+            }
+        }
+        m_aoPartitions.clear();
+
+        if( m_aoPendingPartitions.empty() )
+            break;
+
+        const auto oPending = m_aoPendingPartitions.back();
+        m_aoPendingPartitions.pop_back();
+        CPLDebug("GenSQL", "GROUP BY: aggregating spilled partition %s",
+                 oPending.first.c_str());
+        m_nLevel = oPending.second;
+        if( !ReadPartition(oPending.first) || !EmitGroups() )
+            return false;
+    }
+
+    return Sort();
+}
+
+/************************************************************************/
+/*                                Sort()                                */
+/*                                                                      */
+/*      Apply the ORDER BY clause on the result rows.                   */
+/************************************************************************/
+
+bool OGRGenSQLGroupBy::Sort()
+{
+    const int nOrderItems = m_psSelectInfo->order_specs;
+    if( nOrderItems == 0 )
+        return true;
+
+    struct SortValue
+    {
+        bool        bNull = true;
+        GIntBig     nVal = 0;
+        double      dfVal = 0;
+        std::string osVal{};
+    };
+
+    const size_t nRows = static_cast<size_t>(GetRowCount());
+    std::vector<SortValue> aoValues;
+    try
+    {
+        aoValues.resize(nRows * nOrderItems);
+    }
+    catch( const std::bad_alloc& )
+    {
+        CPLError(CE_Failure, CPLE_OutOfMemory,
+                 "Cannot allocate memory for ORDER BY");
+        return false;
+    }
+
+    for( size_t iRow = 0; iRow < nRows; iRow++ )
+    {
+        OGRFeature* poRow = LoadRow(iRow);
+        if( poRow == nullptr )
+            return false;
+        for( int iKey = 0; iKey < nOrderItems; iKey++ )
+        {
+            const int iField = m_psSelectInfo->order_defs[iKey].field_index;
+            SortValue& oValue = aoValues[iRow * nOrderItems + iKey];
+            if( !poRow->IsFieldSetAndNotNull(iField) )
+                continue;
+            oValue.bNull = false;
+            switch( m_poDefn->GetFieldDefn(iField)->GetType() )
+            {
+                case OFTInteger:
+                case OFTInteger64:
+                    oValue.nVal = poRow->GetFieldAsInteger64(iField);
+                    break;
+                case OFTReal:
+                    oValue.dfVal = poRow->GetFieldAsDouble(iField);
+                    break;
+                default:
+                    oValue.osVal = poRow->GetFieldAsString(iField);
+                    break;
+            }
+        }
+        delete poRow;
+    }
+
+    m_anOrder.resize(nRows);
+    for( size_t i = 0; i < nRows; i++ )
+        m_anOrder[i] = i;
+
+    std::stable_sort(m_anOrder.begin(), m_anOrder.end(),
+        [this, nOrderItems, &aoValues](size_t iA, size_t iB)
+        {
+            for( int iKey = 0; iKey < nOrderItems; iKey++ )
+            {
+                const SortValue& oA = aoValues[iA * nOrderItems + iKey];
+                const SortValue& oB = aoValues[iB * nOrderItems + iKey];
+                int nCmp = 0;
+                if( oA.bNull || oB.bNull )
+                    nCmp = (oA.bNull ? 0 : 1) - (oB.bNull ? 0 : 1);
+                else if( oA.nVal != oB.nVal )
+                    nCmp = oA.nVal < oB.nVal ? -1 : 1;
+                else if( oA.dfVal != oB.dfVal )
+                    nCmp = oA.dfVal < oB.dfVal ? -1 : 1;
+                else
+                    nCmp = oA.osVal.compare(oB.osVal);
+                if( nCmp != 0 )
+                {
+                    if( !m_psSelectInfo->order_defs[iKey].ascending_flag )
+                        nCmp = -nCmp;
+                    return nCmp < 0;
+                }
+            }
+            return false;
+        });
+    return true;
+}
+
+/************************************************************************/
+/*                               GetRow()                               */
+/************************************************************************/
+
+OGRFeature *OGRGenSQLGroupBy::GetRow( GIntBig nIdx )
+{
+    if( nIdx < 0 || nIdx >= GetRowCount() )
+        return nullptr;
+    size_t iRow = static_cast<size_t>(nIdx);
+    if( !m_anOrder.empty() )
+        iRow = m_anOrder[iRow];
+    OGRFeature* poRow = LoadRow(iRow);
+    if( poRow )
+        poRow->SetFID(nIdx);
+    return poRow;
+}
+
+/************************************************************************/
+/*                       OGRGenSQLExternalSort()                        */
+/************************************************************************/
+
+OGRGenSQLExternalSort::OGRGenSQLExternalSort( OGRGenSQLResultsLayer* poLayer,
+                                              OGRFeatureDefn* poSrcDefn,
+                                              int nOrderItems ) :
+    m_poLayer(poLayer),
+    m_poSrcDefn(poSrcDefn),
+    m_nOrderItems(nOrderItems),
+    // At least 1 MB per run, so that a too small value does not end up
+    // with a temporary file per feature.
+    m_nMaxMemory(std::max(1, atoi(
+        CPLGetConfigOption("OGR_SQL_ORDER_BY_MAX_MEMORY", "100"))) *
+                                            static_cast<GIntBig>(1024 * 1024))
+{
+    // Undocumented: for testing purposes only
+    const char* pszRunSize =
+        CPLGetConfigOption("OGR_SQL_ORDER_BY_RUN_SIZE", nullptr);
+    if( pszRunSize != nullptr )
+        m_nMaxMemory = std::max(static_cast<GIntBig>(0),
+                                CPLAtoGIntBig(pszRunSize));
+}
+
+/************************************************************************/
+/*                       ~OGRGenSQLExternalSort()                       */
+/************************************************************************/
+
+OGRGenSQLExternalSort::~OGRGenSQLExternalSort()
+{
+    CloseCursors();
+    FreeKeys();
+    for( const auto& osFilename: m_aosRunFilenames )
+        VSIUnlink(osFilename);
+}
+
+/************************************************************************/
+/*                              FreeKeys()                              */
+/************************************************************************/
+
+void OGRGenSQLExternalSort::FreeKeys()
+{
+    if( !m_asKeys.empty() )
+    {
+        m_poLayer->FreeIndexFields(m_asKeys.data(),
+                                   m_asKeys.size() / m_nOrderItems, false);
+        m_asKeys.clear();
+    }
+}
+
+/************************************************************************/
+/*                             AddFeature()                             */
+/************************************************************************/
+
+bool OGRGenSQLExternalSort::AddFeature( OGRFeature* poSrcFeature )
+{
+    m_aabyRecords.emplace_back();
+    OGRGenSQLSerializeFeature(poSrcFeature, m_aabyRecords.back());
+
+    const size_t nOldSize = m_asKeys.size();
+    m_asKeys.resize(nOldSize + m_nOrderItems);
+    m_poLayer->ReadIndexFields(poSrcFeature, m_nOrderItems,
+                               &m_asKeys[nOldSize]);
+
+    m_nMemory += m_aabyRecords.back().size() + sizeof(std::vector<GByte>) +
+                 m_nOrderItems * sizeof(OGRField) + sizeof(size_t);
+    if( m_nMemory > m_nMaxMemory )
+        return SpillRun();
+    return true;
+}
+
+/************************************************************************/
+/*                              SortRun()                               */
+/************************************************************************/
+
+void OGRGenSQLExternalSort::SortRun()
+{
+    m_anOrder.resize(m_aabyRecords.size());
+    for( size_t i = 0; i < m_anOrder.size(); i++ )
+        m_anOrder[i] = i;
+    const OGRField* pasKeys = m_asKeys.data();
+    std::stable_sort(m_anOrder.begin(), m_anOrder.end(),
+        [this, pasKeys](size_t iA, size_t iB)
+        {
+            return m_poLayer->Compare(pasKeys + iA * m_nOrderItems,
+                                      pasKeys + iB * m_nOrderItems) < 0;
+        });
+
+    // The keys are no longer needed once sorted.
+    FreeKeys();
+    m_nNextRecord = 0;
+}
+
+/************************************************************************/
+/*                              SpillRun()                              */
+/*                                                                      */
+/*      Sort the current run and write it into a temporary file.        */
+/************************************************************************/
+
+bool OGRGenSQLExternalSort::SpillRun()
+{
+    SortRun();
+
+    const CPLString osFilename(CPLGenerateTempFilename("ogr_gensql_sort"));
+    VSILFILE* fp = VSIFOpenL(osFilename, "wb");
+    if( fp == nullptr )
+    {
+        CPLError(CE_Failure, CPLE_FileIO, "Cannot create %s",
+                 osFilename.c_str());
+        return false;
+    }
+    m_aosRunFilenames.push_back(osFilename);
+
+    bool bRet = true;
+    for( size_t i = 0; bRet && i < m_anOrder.size(); i++ )
+        bRet = OGRGenSQLWriteRecord(fp, m_aabyRecords[m_anOrder[i]]);
+    if( VSIFCloseL(fp) != 0 )
+        bRet = false;
+    if( !bRet )
+    {
+        CPLError(CE_Failure, CPLE_FileIO, "Cannot write into %s",
+                 osFilename.c_str());
+    }
+
+    m_aabyRecords.clear();
+    m_anOrder.clear();
+    m_nMemory = 0;
+    return bRet;
+}
+
+/************************************************************************/
+/*                            CloseCursors()                            */
+/************************************************************************/
+
+void OGRGenSQLExternalSort::CloseCursors()
+{
+    for( auto& oCursor: m_aoCursors )
+    {
+        if( oCursor.fp )
+            VSIFCloseL(oCursor.fp);
+        if( oCursor.poFeature )
+        {
+            delete oCursor.poFeature;
+            m_poLayer->FreeIndexFields(oCursor.asKeys.data(), 1, false);
+        }
+    }
+    m_aoCursors.clear();
+    m_anHeap.clear();
+}
+
+/************************************************************************/
+/*                             ReadCursor()                             */
+/*                                                                      */
+/*      Read the next record of a run, and return false at its end.     */
+/************************************************************************/
+
+bool OGRGenSQLExternalSort::ReadCursor( size_t iCursor )
+{
+    Cursor& oCursor = m_aoCursors[iCursor];
+    if( oCursor.poFeature )
+    {
+        delete oCursor.poFeature;
+        oCursor.poFeature = nullptr;
+        m_poLayer->FreeIndexFields(oCursor.asKeys.data(), 1, false);
+    }
+
+    if( !OGRGenSQLReadRecord(oCursor.fp, oCursor.abyRecord) )
+        return false;
+
+    oCursor.poFeature =
+        OGRGenSQLDeserializeFeature(m_poSrcDefn, oCursor.abyRecord.data());
+    memset(oCursor.asKeys.data(), 0, sizeof(OGRField) * m_nOrderItems);
+    m_poLayer->ReadIndexFields(oCursor.poFeature, m_nOrderItems,
+                               oCursor.asKeys.data());
+    return true;
+}
+
+/************************************************************************/
+/*                            OpenCursors()                             */
+/*                                                                      */
+/*      Start merging the first nRuns runs.                             */
+/************************************************************************/
+
+bool OGRGenSQLExternalSort::OpenCursors( size_t nRuns )
+{
+    CloseCursors();
+    m_aoCursors.resize(nRuns);
+
+
+    for( size_t i = 0; i < nRuns; i++ )
+    {
+        Cursor& oCursor = m_aoCursors[i];
+        oCursor.fp = VSIFOpenL(m_aosRunFilenames[i], "rb");
+        if( oCursor.fp == nullptr )
+        {
+            CPLError(CE_Failure, CPLE_FileIO, "Cannot open %s",
+                     m_aosRunFilenames[i].c_str());
+            CloseCursors();
+            return false;
+        }
+        oCursor.asKeys.resize(m_nOrderItems);
+        if( ReadCursor(i) )
+        {
+            PushCursor(i);
+        }
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                              IsAfter()                               */
+/*                                                                      */
+/*      Ordering of the heap of cursors.  Ties are resolved with the    */
+/*      index of the run, so that the sort is stable.                   */
+/************************************************************************/
+
+bool OGRGenSQLExternalSort::IsAfter( size_t iCursorA, size_t iCursorB )
+{
+    const int nCmp = m_poLayer->Compare(m_aoCursors[iCursorA].asKeys.data(),
+                                        m_aoCursors[iCursorB].asKeys.data());
+    return nCmp > 0 || (nCmp == 0 && iCursorA > iCursorB);
 }
 
 /************************************************************************/
-/*                       OGRMultiFeatureFetcher()                       */
+/*                             PushCursor()                             */
 /************************************************************************/
 
-static swq_expr_node *OGRMultiFeatureFetcher( swq_expr_node *op,
-                                              void *pFeatureList )
-
+void OGRGenSQLExternalSort::PushCursor( size_t iCursor )
 {
-    std::vector<OGRFeature*> *papoFeatures =
-        static_cast<std::vector<OGRFeature*> *>(pFeatureList);
-    swq_expr_node *poRetNode = nullptr;
+    m_anHeap.push_back(iCursor);
+    std::push_heap(m_anHeap.begin(), m_anHeap.end(),
+                   [this](size_t iA, size_t iB) { return IsAfter(iA, iB); });
+}
 
-    CPLAssert( op->eNodeType == SNT_COLUMN );
+/************************************************************************/
+/*                             PopCursor()                              */
+/*                                                                      */
+/*      Return the index of the cursor with the smallest record, or     */
+/*      false if all runs have been consumed.                           */
+/************************************************************************/
 
-/* -------------------------------------------------------------------- */
-/*      What feature are we using?  The primary or one of the joined ones?*/
-/* -------------------------------------------------------------------- */
-    if( op->table_index < 0 ||
-        op->table_index >= static_cast<int>(papoFeatures->size()) )
-    {
-        CPLError( CE_Failure, CPLE_AppDefined,
-                  "Request for unexpected table_index (%d) in field fetcher.",
-                  op->table_index );
-        return nullptr;
-    }
+bool OGRGenSQLExternalSort::PopCursor( size_t& iCursor )
+{
+    if( m_anHeap.empty() )
+        return false;
+    std::pop_heap(m_anHeap.begin(), m_anHeap.end(),
+                  [this](size_t iA, size_t iB) { return IsAfter(iA, iB); });
+    iCursor = m_anHeap.back();
+    m_anHeap.pop_back();
+    return true;
+}
 
-    OGRFeature *poFeature = (*papoFeatures)[op->table_index];
+/************************************************************************/
+/*                             MergeRuns()                              */
+/*                                                                      */
+/*      Merge runs until there are few enough of them to be merged      */
+/*      in a single pass while reading the result.                      */
+/************************************************************************/
 
-/* -------------------------------------------------------------------- */
-/*      Fetch the value.                                                */
-/* -------------------------------------------------------------------- */
-    switch( op->field_type )
+bool OGRGenSQLExternalSort::MergeRuns()
+{
+    while( m_aosRunFilenames.size() > MAX_MERGE_FANIN )
     {
-      case SWQ_INTEGER:
-      case SWQ_BOOLEAN:
-        if( poFeature == nullptr
-            || !poFeature->IsFieldSetAndNotNull(op->field_index) )
-        {
-            poRetNode = new swq_expr_node(0);
-            poRetNode->is_null = TRUE;
-        }
-        else
-            poRetNode = new swq_expr_node(
-                poFeature->GetFieldAsInteger(op->field_index) );
-        break;
-
-      case SWQ_INTEGER64:
-        if( poFeature == nullptr
-            || !poFeature->IsFieldSetAndNotNull(op->field_index) )
-        {
-            poRetNode = new swq_expr_node( static_cast<GIntBig>(0) );
-            poRetNode->is_null = TRUE;
-        }
-        else
-            poRetNode = new swq_expr_node(
-                poFeature->GetFieldAsInteger64(op->field_index) );
-        break;
+        if( !OpenCursors(MAX_MERGE_FANIN) )
+            return false;
 
-      case SWQ_FLOAT:
-        if( poFeature == nullptr
-            || !poFeature->IsFieldSetAndNotNull(op->field_index) )
+        const CPLString osFilename(CPLGenerateTempFilename("ogr_gensql_sort"));
+        VSILFILE* fp = VSIFOpenL(osFilename, "wb");
+        if( fp == nullptr )
         {
-            poRetNode = new swq_expr_node( 0.0 );
-            poRetNode->is_null = TRUE;
+            CPLError(CE_Failure, CPLE_FileIO, "Cannot create %s",
+                     osFilename.c_str());
+            CloseCursors();
+            return false;
         }
-        else
-            poRetNode = new swq_expr_node(
-                poFeature->GetFieldAsDouble(op->field_index) );
-        break;
 
-      case SWQ_GEOMETRY:
-        if( poFeature == nullptr )
+        bool bRet = true;
+        size_t iCursor = 0;
+        while( bRet && PopCursor(iCursor) )
         {
-            poRetNode = new swq_expr_node( static_cast<OGRGeometry*>(nullptr) );
+            bRet = OGRGenSQLWriteRecord(fp, m_aoCursors[iCursor].abyRecord);
+            if( ReadCursor(iCursor) )
+            {
+                PushCursor(iCursor);
+            }
         }
-        else
+        if( VSIFCloseL(fp) != 0 )
+            bRet = false;
+        CloseCursors();
+        if( !bRet )
         {
-            int iSrcGeomField = ALL_FIELD_INDEX_TO_GEOM_FIELD_INDEX(
-                poFeature->GetDefnRef(), op->field_index);
-            poRetNode = new swq_expr_node(
-                poFeature->GetGeomFieldRef(iSrcGeomField) );
+            CPLError(CE_Failure, CPLE_FileIO, "Cannot write into %s",
+                     osFilename.c_str());
+            VSIUnlink(osFilename);
+            return false;
         }
-        break;
 
-      default:
-        if( poFeature == nullptr
-            || !poFeature->IsFieldSetAndNotNull(op->field_index) )
-        {
-            poRetNode = new swq_expr_node("");
-            poRetNode->is_null = TRUE;
-        }
-        else
-            poRetNode = new swq_expr_node(
-                poFeature->GetFieldAsString(op->field_index) );
-        break;
+        // The merged run replaces the runs it comes from, at the same
+        // position to keep the sort stable.
+        for( size_t i = 0; i < MAX_MERGE_FANIN; i++ )
+            VSIUnlink(m_aosRunFilenames[i]);
+        m_aosRunFilenames.erase(m_aosRunFilenames.begin(),
+                                m_aosRunFilenames.begin() + MAX_MERGE_FANIN);
+        m_aosRunFilenames.insert(m_aosRunFilenames.begin(), osFilename);
     }
+    return true;
+}
 
-    return poRetNode;
+/************************************************************************/
+/*                               Finish()                               */
+/*                                                                      */
+/*      Called once all source features have been added.                */
+/************************************************************************/
+
+bool OGRGenSQLExternalSort::Finish()
+{
+    if( m_aosRunFilenames.empty() )
+    {
+        SortRun();
+        return true;
+    }
+
+    if( !m_aabyRecords.empty() && !SpillRun() )
+        return false;
+    CPLDebug("GenSQL", "ORDER BY: merging %d sorted runs",
+             static_cast<int>(m_aosRunFilenames.size()));
+    if( !MergeRuns() )
+        return false;
+    return OpenCursors(m_aosRunFilenames.size());
 }
 
 /************************************************************************/
-/*                          GetFilterForJoin()                          */
+/*                               Rewind()                               */
 /************************************************************************/
 
-static CPLString GetFilterForJoin(swq_expr_node* poExpr, OGRFeature* poSrcFeat,
-                                  OGRLayer* poJoinLayer, int secondary_table)
+void OGRGenSQLExternalSort::Rewind()
 {
-    if( poExpr->eNodeType == SNT_CONSTANT )
+    if( m_aosRunFilenames.empty() )
+        m_nNextRecord = 0;
+    else
+        OpenCursors(m_aosRunFilenames.size());
+}
+
+/************************************************************************/
+/*                           SetNextByIndex()                           */
+/************************************************************************/
+
+bool OGRGenSQLExternalSort::SetNextByIndex( GIntBig nIndex )
+{
+    Rewind();
+    if( m_aosRunFilenames.empty() )
     {
-        char* pszRes = poExpr->Unparse(nullptr, '"');
-        CPLString osRes = pszRes;
-        CPLFree(pszRes);
-        return osRes;
+        if( nIndex > static_cast<GIntBig>(m_anOrder.size()) )
+            return false;
+        m_nNextRecord = static_cast<size_t>(nIndex);
+        return true;
     }
 
-    if( poExpr->eNodeType == SNT_COLUMN )
+    for( GIntBig i = 0; i < nIndex; i++ )
     {
-        CPLAssert( poExpr->field_index != -1 );
-        CPLAssert( poExpr->table_index == 0 || poExpr->table_index == secondary_table );
+        OGRFeature* poFeature = GetNextFeature();
+        if( poFeature == nullptr )
+            return false;
+        delete poFeature;
+    }
+    return true;
+}
 
-        if( poExpr->table_index == 0 )
-        {
-            // if source key is null, we can't do join.
-            if( !poSrcFeat->IsFieldSetAndNotNull( poExpr->field_index ) )
-            {
-                return "";
-            }
-            OGRFieldType ePrimaryFieldType =
-                    poSrcFeat->GetFieldDefnRef(poExpr->field_index)->GetType();
-            OGRField *psSrcField =
-                    poSrcFeat->GetRawFieldRef(poExpr->field_index);
+/************************************************************************/
+/*                           GetNextFeature()                           */
+/************************************************************************/
 
-            switch( ePrimaryFieldType )
-            {
-            case OFTInteger:
-                return CPLString().Printf("%d", psSrcField->Integer );
-                break;
+OGRFeature *OGRGenSQLExternalSort::GetNextFeature()
+{
+    if( m_aosRunFilenames.empty() )
+    {
+        if( m_nNextRecord >= m_anOrder.size() )
+            return nullptr;
+        return OGRGenSQLDeserializeFeature(
+            m_poSrcDefn, m_aabyRecords[m_anOrder[m_nNextRecord++]].data());
+    }
 
-            case OFTInteger64:
-                return CPLString().Printf(CPL_FRMT_GIB, psSrcField->Integer64 );
-                break;
+    size_t iCursor = 0;
+    if( !PopCursor(iCursor) )
+        return nullptr;
 
-            case OFTReal:
-                return CPLString().Printf("%.16g", psSrcField->Real );
-                break;
+    // Take ownership of the feature, and make sure ReadCursor() does not
+    // delete it.
+    Cursor& oCursor = m_aoCursors[iCursor];
+    OGRFeature* poFeature = oCursor.poFeature;
+    oCursor.poFeature = nullptr;
+    m_poLayer->FreeIndexFields(oCursor.asKeys.data(), 1, false);
 
-            case OFTString:
-            {
-                char *pszEscaped = CPLEscapeString( psSrcField->String,
-                                                    static_cast<int>(strlen(psSrcField->String)),
-                                                    CPLES_SQL );
-                CPLString osRes = "'";
-                osRes += pszEscaped;
-                osRes += "'";
-                CPLFree( pszEscaped );
-                return osRes;
-            }
-            break;
+    if( ReadCursor(iCursor) )
+        PushCursor(iCursor);
+    return poFeature;
+}
 
-            default:
-                CPLAssert( false );
-                return "";
-            }
-        }
+/************************************************************************/
+/*                           PrepareGroupBy()                           */
+/*                                                                      */
+/*      Aggregate the source features of a GROUP BY query.              */
+/************************************************************************/
 
-        if(  poExpr->table_index == secondary_table )
-        {
-            OGRFieldDefn* poSecondaryFieldDefn =
-                poJoinLayer->GetLayerDefn()->GetFieldDefn(poExpr->field_index);
-            return CPLSPrintf("\"%s\"", poSecondaryFieldDefn->GetNameRef());
-        }
+int OGRGenSQLResultsLayer::PrepareGroupBy()
 
-        CPLAssert(false);
-        return "";
-    }
+{
+    if( m_poGroupBy != nullptr )
+        return TRUE;
 
-    if( poExpr->eNodeType == SNT_OPERATION )
-    {
-        /* ----------------------------------------------------------------- */
-        /*      Operation - start by unparsing all the subexpressions.       */
-        /* ----------------------------------------------------------------- */
-        std::vector<char*> apszSubExpr;
-        for( int i = 0; i < poExpr->nSubExprCount; i++ )
-        {
-            CPLString osSubExpr = GetFilterForJoin(poExpr->papoSubExpr[i], poSrcFeat,
-                                                   poJoinLayer, secondary_table);
-            if( osSubExpr.empty() )
-            {
-                for( --i; i >=0; i-- )
-                    CPLFree( apszSubExpr[i] );
-                return "";
-            }
-            apszSubExpr.push_back( CPLStrdup(osSubExpr) );
-        }
+    swq_select *psSelectInfo = static_cast<swq_select*>(pSelectInfo);
+    std::unique_ptr<OGRGenSQLGroupBy> poGroupBy(
+        new OGRGenSQLGroupBy(psSelectInfo, poDefn, poSrcLayer));
 
-        CPLString osExpr = poExpr->UnparseOperationFromUnparsedSubExpr(&apszSubExpr[0]);
+    ApplyFiltersToSource();
 
-        /* ----------------------------------------------------------------- */
-        /*      cleanup subexpressions.                                      */
-        /* ----------------------------------------------------------------- */
-        for( int i = 0; i < poExpr->nSubExprCount; i++ )
-            CPLFree( apszSubExpr[i] );
+    int bSaveIsGeomIgnored = poSrcLayer->GetLayerDefn()->IsGeometryIgnored();
+    if( !MustReadSourceGeometryForSummary() )
+        poSrcLayer->GetLayerDefn()->SetGeometryIgnored(TRUE);
 
-        return osExpr;
+    bool bRet = true;
+    OGRFeature *poSrcFeature = nullptr;
+    while( bRet && (poSrcFeature = poSrcLayer->GetNextFeature()) != nullptr )
+    {
+        bRet = poGroupBy->AddFeature(poSrcFeature);
+        delete poSrcFeature;
     }
 
-    return "";
+    poSrcLayer->GetLayerDefn()->SetGeometryIgnored(bSaveIsGeomIgnored);
+    ClearFilters();
+
+    if( !bRet || !poGroupBy->Finish() )
+        return FALSE;
+
+    m_poGroupBy = std::move(poGroupBy);
+    return TRUE;
 }
 
 /************************************************************************/
@@ -1304,6 +3384,17 @@ OGRFeature *OGRGenSQLResultsLayer::TranslateFeature( OGRFeature *poSrcFeat )
 
         OGRLayer *poJoinLayer = papoTableLayers[psJoinInfo->secondary_table];
 
+        OGRGenSQLHashJoin* poHashJoin = GetHashJoin(iJoin);
+        if( poHashJoin )
+        {
+            OGRFeature *poJoinFeature = nullptr;
+            if( poHashJoin->GetJoinFeature(poSrcFeat, poJoinFeature) )
+            {
+                apoFeatures.push_back( poJoinFeature );
+                continue;
+            }
+        }
+
         osFilter = GetFilterForJoin(psJoinInfo->poExpr, poSrcFeat, poJoinLayer,
                                     psJoinInfo->secondary_table);
         //CPLDebug("OGR", "Filter = %s\n", osFilter.c_str());
@@ -1561,7 +3652,13 @@ OGRFeature *OGRGenSQLResultsLayer::GetNextFeature()
         return nullptr;
 
     CreateOrderByIndex();
-    if( panFIDIndex == nullptr &&
+    if( m_bOrderByFailed )
+        return nullptr;
+    if( m_poExternalSort != nullptr && nIteratedFeatures < 0 )
+    {
+        m_poExternalSort->SetNextByIndex(psSelectInfo->offset);
+    }
+    else if( panFIDIndex == nullptr &&
         nIteratedFeatures < 0 && psSelectInfo->offset > 0 &&
         psSelectInfo->query_mode == SWQM_RECORDSET )
     {
@@ -1574,7 +3671,8 @@ OGRFeature *OGRGenSQLResultsLayer::GetNextFeature()
 /*      Handle summary sets.                                            */
 /* -------------------------------------------------------------------- */
     if( psSelectInfo->query_mode == SWQM_SUMMARY_RECORD
-        || psSelectInfo->query_mode == SWQM_DISTINCT_LIST )
+        || psSelectInfo->query_mode == SWQM_DISTINCT_LIST
+        || psSelectInfo->query_mode == SWQM_GROUP_BY )
     {
         nIteratedFeatures ++;
         return GetFeature( nNextIndexFID++ );
@@ -1593,7 +3691,9 @@ OGRFeature *OGRGenSQLResultsLayer::GetNextFeature()
             poFeature = GetFeature( nNextIndexFID++ );
         else
         {
-            OGRFeature *poSrcFeat = poSrcLayer->GetNextFeature();
+            OGRFeature *poSrcFeat = m_poExternalSort != nullptr ?
+                m_poExternalSort->GetNextFeature() :
+                poSrcLayer->GetNextFeature();
 
             if( poSrcFeat == nullptr )
                 return nullptr;
@@ -1642,6 +3742,17 @@ OGRFeature *OGRGenSQLResultsLayer::GetFeature( GIntBig nFID )
             return poSummaryFeature->Clone();
     }
 
+/* -------------------------------------------------------------------- */
+/*      Handle request for a group record.                              */
+/* -------------------------------------------------------------------- */
+    if( psSelectInfo->query_mode == SWQM_GROUP_BY )
+    {
+        if( !PrepareGroupBy() )
+            return nullptr;
+
+        return m_poGroupBy->GetRow( nFID );
+    }
+
 /* -------------------------------------------------------------------- */
 /*      Handle request for distinct list record.                        */
 /* -------------------------------------------------------------------- */
@@ -1912,7 +4023,9 @@ void OGRGenSQLResultsLayer::ReadIndexFields( OGRFeature* poSrcFeat,
 /*      required index.                                                 */
 /*                                                                      */
 /*      Keeping all the key values in memory will *not* scale up to     */
-/*      very large input datasets.                                      */
+/*      very large input datasets.  When the source layer has no fast   */
+/*      random read, or if OGR_SQL_EXTERNAL_SORT=YES, the features      */
+/*      are instead sorted with an OGRGenSQLExternalSort.               */
 /************************************************************************/
 
 void OGRGenSQLResultsLayer::CreateOrderByIndex()
@@ -1978,6 +4091,41 @@ void OGRGenSQLResultsLayer::CreateOrderByIndex()
         return;
     }
 
+/* -------------------------------------------------------------------- */
+/*      Sort complete source features in temporary files, rather than   */
+/*      only the key values in memory, if the source layer cannot       */
+/*      fetch them back efficiently by FID.                             */
+/* -------------------------------------------------------------------- */
+    const char* pszExternalSort =
+        CPLGetConfigOption("OGR_SQL_EXTERNAL_SORT", "AUTO");
+    const bool bExternalSort = EQUAL(pszExternalSort, "AUTO") ?
+        !poSrcLayer->TestCapability(OLCRandomRead) :
+        CPLTestBool(pszExternalSort);
+    if( bExternalSort )
+    {
+        std::unique_ptr<OGRGenSQLExternalSort> poSort(
+            new OGRGenSQLExternalSort(this, poSrcLayer->GetLayerDefn(),
+                                      nOrderItems));
+        bool bOK = true;
+        OGRFeature *poSrcFeat = nullptr;
+        while( bOK && (poSrcFeat = poSrcLayer->GetNextFeature()) != nullptr )
+        {
+            bOK = poSort->AddFeature(poSrcFeat);
+            delete poSrcFeat;
+        }
+        if( bOK && poSort->Finish() )
+            m_poExternalSort = std::move(poSort);
+        else
+        {
+            // Do not return the rows unsorted or partially sorted.
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "Cannot sort the result of the ORDER BY clause");
+            m_bOrderByFailed = true;
+        }
+        ResetReading();
+        return;
+    }
+
 /* -------------------------------------------------------------------- */
 /*      Allocate set of key values, and the output index.               */
 /* -------------------------------------------------------------------- */
@@ -2371,6 +4519,12 @@ void OGRGenSQLResultsLayer::FindAndSetIgnoredFields()
         AddFieldDefnToSet(psOrderDef->table_index, psOrderDef->field_index, hSet);
     }
 
+    for( int i = 0; i < psSelectInfo->group_by_count; i++ )
+    {
+        swq_group_by_def *psGroupByDef = psSelectInfo->group_by_defs + i;
+        AddFieldDefnToSet(psGroupByDef->table_index, psGroupByDef->field_index, hSet);
+    }
+
 /* -------------------------------------------------------------------- */
 /*      2nd phase : now, we can exclude the unused fields               */
 /* -------------------------------------------------------------------- */
@@ -2406,6 +4560,8 @@ void OGRGenSQLResultsLayer::InvalidateOrderByIndex()
 {
     CPLFree( panFIDIndex );
     panFIDIndex = nullptr;
+    m_poExternalSort.reset();
+    m_bOrderByFailed = false;
 
     nIndexSize = 0;
     bOrderByValid = FALSE;
@@ -36,6 +36,7 @@
 #include "cpl_hash_set.h"
 #include "cpl_string.h"
 
+#include <memory>
 #include <vector>
 
 /*! @cond Doxygen_Suppress */
@@ -50,12 +51,18 @@
 #define ALL_FIELD_INDEX_TO_GEOM_FIELD_INDEX(poFDefn, idx) \
     ((idx) - ((poFDefn)->GetFieldCount() + SPECIAL_FIELD_COUNT))
 
+class OGRGenSQLHashJoin;
+class OGRGenSQLGroupBy;
+class OGRGenSQLExternalSort;
+
 /************************************************************************/
 /*                        OGRGenSQLResultsLayer                         */
 /************************************************************************/
 
 class OGRGenSQLResultsLayer final: public OGRLayer
 {
+    friend class OGRGenSQLExternalSort;
+
   private:
     GDALDataset *poSrcDS;
     OGRLayer    *poSrcLayer;
@@ -64,6 +71,7 @@ class OGRGenSQLResultsLayer final: public OGRLayer
     char        *pszWHERE;
 
     OGRLayer   **papoTableLayers;
+    std::vector<GDALDataset*> m_apoTableDS{};
 
     OGRFeatureDefn *poDefn;
 
@@ -84,9 +92,22 @@ class OGRGenSQLResultsLayer final: public OGRLayer
     GIntBig     nIteratedFeatures;
     std::vector<CPLString> m_oDistinctList;
 
+    // One entry per join, null if the join is resolved with attribute filters
+    std::vector<std::unique_ptr<OGRGenSQLHashJoin>> m_apoHashJoins{};
+    std::vector<bool> m_abHashJoinsPrepared{};
+
+    std::unique_ptr<OGRGenSQLGroupBy> m_poGroupBy{};
+
+    // Set instead of panFIDIndex when ORDER BY is done with a merge sort
+    std::unique_ptr<OGRGenSQLExternalSort> m_poExternalSort{};
+    // Set when the merge sort of ORDER BY could not be completed
+    bool        m_bOrderByFailed = false;
+
     int         PrepareSummary();
+    int         PrepareGroupBy();
 
     OGRFeature *TranslateFeature( OGRFeature * );
+    OGRGenSQLHashJoin *GetHashJoin( int iJoin );
     void        CreateOrderByIndex();
     void        ReadIndexFields( OGRFeature* poSrcFeat,
                                  int nOrderItems,
@@ -111,6 +132,7 @@ class OGRGenSQLResultsLayer final: public OGRLayer
     void        InvalidateOrderByIndex();
 
     int         MustEvaluateSpatialFilterOnGenSQL();
+    int         MustReadSourceGeometryForSummary();
 
     CPL_DISALLOW_COPY_ASSIGN(OGRGenSQLResultsLayer)
 
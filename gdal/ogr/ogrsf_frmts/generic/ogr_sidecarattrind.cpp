@@ -0,0 +1,2446 @@
+/******************************************************************************
+ *
+ * Project:  OpenGIS Simple Features Reference Implementation
+ * Purpose:  Driver independent attribute and spatial indexes stored in a
+ *           sidecar file.
+ *
+ ******************************************************************************
+ * Copyright (c) 2020, GDAL contributors
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a
+ * copy of this software and associated documentation files (the "Software"),
+ * to deal in the Software without restriction, including without limitation
+ * the rights to use, copy, modify, merge, publish, distribute, sublicense,
+ * and/or sell copies of the Software, and to permit persons to whom the
+ * Software is furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included
+ * in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+ * OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ * THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ * DEALINGS IN THE SOFTWARE.
+ ****************************************************************************/
+
+#include "cpl_port.h"
+#include "ogr_attrind.h"
+
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#include <memory>
+#include <set>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include "cpl_conv.h"
+#include "cpl_error.h"
+#include "cpl_string.h"
+#include "cpl_vsi.h"
+
+CPL_CVSID("$Id$")
+
+//! @cond Doxygen_Suppress
+
+/*
+ * Layout of a sidecar index file (all integers are little endian):
+ *
+ *   char[8]   signature "OGRAIDX1"
+ *   uint64    size of the indexed dataset file when the index was built
+ *   int64     modification time of the indexed dataset file
+ *   uint32    number of field indexes
+ *   for each field index:
+ *      string    layer name
+ *      string    field name, or geometry field name for a spatial index
+ *      uint32    key type (0=integer, 1=real, 2=string, 3=spatial)
+ *      uint64    number of (key, FID) entries
+ *      uint64    offset of the index blob in the file
+ *      uint64    size of the index blob
+ *      uint64    offset of the page directory, relative to the blob
+ *
+ * A blob is a sequence of leaf pages of up to OGR_SIDECAR_PAGE_ENTRIES
+ * (key, FID) entries sorted by key and FID, followed by a page directory
+ * giving, for each page, its offset (relative to the blob), byte size,
+ * number of entries and first key.  Only the page directory is held in
+ * memory: a lookup binary searches it, and reads the few pages that can
+ * hold matching keys.  Blobs are position independent so that rebuilding
+ * one field index just copies the others.
+ *
+ * Strings are stored as a uint32 length followed by the bytes, integer keys
+ * as int64 and real keys as IEEE doubles.  String keys are ordered and
+ * compared case insensitively, as OGR SQL does.
+ *
+ * The blob of a spatial index is a packed R-tree of the bounding boxes of
+ * the features, whose leaves are sorted along a Hilbert curve:
+ *
+ *   uint32    node size (OGR_SIDECAR_NODE_SIZE)
+ *   uint32    number of levels
+ *   uint64    number of nodes of each level, from the root to the leaves
+ *   for each level, from the root to the leaves:
+ *      for each node: double minx, miny, maxx, maxy, and for leaves only,
+ *                     the int64 FID of the feature
+ *
+ * The children of node i of a level are the nodes i * node size to
+ * (i + 1) * node size - 1 of the next level.  The inner levels are held in
+ * memory, and only the leaves under matching nodes are read.  The page
+ * directory offset of a spatial index is unused and set to 0.
+ */
+
+constexpr char OGR_SIDECAR_SIGNATURE[] = "OGRAIDX1";
+constexpr int OGR_SIDECAR_SIGNATURE_SIZE = 8;
+constexpr GUInt32 OGR_SIDECAR_PAGE_ENTRIES = 256;
+constexpr GUInt32 OGR_SIDECAR_NODE_SIZE = 16;
+// Sanity limit on the size of strings and page directories read from disk.
+constexpr GUInt32 OGR_SIDECAR_MAX_STRING_SIZE = 100 * 1024 * 1024;
+
+enum OGRSidecarKeyType
+{
+    OSKT_INTEGER = 0,
+    OSKT_REAL = 1,
+    OSKT_STRING = 2,
+    OSKT_SPATIAL = 3
+};
+
+namespace {
+
+struct OGRSidecarKey
+{
+    GIntBig     nValue = 0;
+    double      dfValue = 0.0;
+    std::string osValue{};
+};
+
+typedef std::pair<OGRSidecarKey, GIntBig> OGRSidecarEntry;
+
+struct OGRSidecarPage
+{
+    vsi_l_offset  nOffset = 0;
+    GUInt32       nSize = 0;
+    GUInt32       nCount = 0;
+    OGRSidecarKey oFirstKey{};
+};
+
+/* One field index of the sidecar file, as described in its header. */
+struct OGRSidecarDirEntry
+{
+    CPLString     osLayerName{};
+    CPLString     osFieldName{};
+    GUInt32       nKeyType = 0;
+    GUIntBig      nEntryCount = 0;
+    vsi_l_offset  nBlobOffset = 0;
+    GUIntBig      nBlobSize = 0;
+    GUIntBig      nPageDirOffset = 0;
+};
+
+} // namespace
+
+/************************************************************************/
+/*                      OGRSidecarGetKeyType()                          */
+/************************************************************************/
+
+static int OGRSidecarGetKeyType( OGRFieldType eType )
+{
+    switch( eType )
+    {
+      case OFTInteger:
+      case OFTInteger64:
+        return OSKT_INTEGER;
+      case OFTReal:
+        return OSKT_REAL;
+      case OFTString:
+        return OSKT_STRING;
+      default:
+        return -1;
+    }
+}
+
+/************************************************************************/
+/*                      OGRSidecarCompareKeys()                         */
+/************************************************************************/
+
+static int OGRSidecarCompareKeys( int eKeyType, const OGRSidecarKey& oA,
+                                  const OGRSidecarKey& oB )
+{
+    switch( eKeyType )
+    {
+      case OSKT_INTEGER:
+        return oA.nValue < oB.nValue ? -1 : oA.nValue > oB.nValue ? 1 : 0;
+      case OSKT_REAL:
+        return oA.dfValue < oB.dfValue ? -1 :
+               oA.dfValue > oB.dfValue ? 1 : 0;
+      default:
+        return STRCASECMP(oA.osValue.c_str(), oB.osValue.c_str());
+    }
+}
+
+/************************************************************************/
+/*                      Serialization helpers.                          */
+/************************************************************************/
+
+static void OGRSidecarAppendUInt32( std::string& osBuf, GUInt32 nVal )
+{
+    CPL_LSBPTR32(&nVal);
+    osBuf.append(reinterpret_cast<const char*>(&nVal), sizeof(nVal));
+}
+
+static void OGRSidecarAppendUInt64( std::string& osBuf, GUIntBig nVal )
+{
+    CPL_LSBPTR64(&nVal);
+    osBuf.append(reinterpret_cast<const char*>(&nVal), sizeof(nVal));
+}
+
+static void OGRSidecarAppendString( std::string& osBuf,
+                                    const std::string& osVal )
+{
+    OGRSidecarAppendUInt32(osBuf, static_cast<GUInt32>(osVal.size()));
+    osBuf.append(osVal);
+}
+
+static void OGRSidecarAppendKey( std::string& osBuf, int eKeyType,
+                                 const OGRSidecarKey& oKey )
+{
+    if( eKeyType == OSKT_INTEGER )
+    {
+        OGRSidecarAppendUInt64(osBuf, static_cast<GUIntBig>(oKey.nValue));
+    }
+    else if( eKeyType == OSKT_REAL )
+    {
+        GUIntBig nVal = 0;
+        memcpy(&nVal, &oKey.dfValue, sizeof(nVal));
+        OGRSidecarAppendUInt64(osBuf, nVal);
+    }
+    else
+    {
+        OGRSidecarAppendString(osBuf, oKey.osValue);
+    }
+}
+
+/* Bounds checked reader over an in-memory buffer. */
+class OGRSidecarBufferReader
+{
+    const GByte *m_pabyCur;
+    const GByte *m_pabyEnd;
+    bool         m_bError = false;
+
+    CPL_DISALLOW_COPY_ASSIGN(OGRSidecarBufferReader)
+
+  public:
+    OGRSidecarBufferReader( const GByte *pabyData, size_t nSize ) :
+        m_pabyCur(pabyData), m_pabyEnd(pabyData + nSize) {}
+
+    bool HasError() const { return m_bError; }
+    bool AtEnd() const { return m_pabyCur >= m_pabyEnd; }
+
+    GUInt32 ReadUInt32()
+    {
+        GUInt32 nVal = 0;
+        if( m_bError || m_pabyEnd - m_pabyCur < 4 )
+        {
+            m_bError = true;
+            return 0;
+        }
+        memcpy(&nVal, m_pabyCur, sizeof(nVal));
+        CPL_LSBPTR32(&nVal);
+        m_pabyCur += sizeof(nVal);
+        return nVal;
+    }
+
+    GUIntBig ReadUInt64()
+    {
+        GUIntBig nVal = 0;
+        if( m_bError || m_pabyEnd - m_pabyCur < 8 )
+        {
+            m_bError = true;
+            return 0;
+        }
+        memcpy(&nVal, m_pabyCur, sizeof(nVal));
+        CPL_LSBPTR64(&nVal);
+        m_pabyCur += sizeof(nVal);
+        return nVal;
+    }
+
+    void ReadKey( int eKeyType, OGRSidecarKey& oKey )
+    {
+        if( eKeyType == OSKT_INTEGER )
+        {
+            oKey.nValue = static_cast<GIntBig>(ReadUInt64());
+        }
+        else if( eKeyType == OSKT_REAL )
+        {
+            const GUIntBig nVal = ReadUInt64();
+            memcpy(&oKey.dfValue, &nVal, sizeof(nVal));
+        }
+        else
+        {
+            const GUInt32 nLen = ReadUInt32();
+            if( m_bError ||
+                static_cast<size_t>(m_pabyEnd - m_pabyCur) < nLen )
+            {
+                m_bError = true;
+                return;
+            }
+            oKey.osValue.assign(reinterpret_cast<const char*>(m_pabyCur),
+                                nLen);
+            m_pabyCur += nLen;
+        }
+    }
+};
+
+/* File helpers used while parsing the header. */
+
+static bool OGRSidecarReadUInt32( VSILFILE *fp, GUInt32& nVal )
+{
+    if( VSIFReadL(&nVal, sizeof(nVal), 1, fp) != 1 )
+        return false;
+    CPL_LSBPTR32(&nVal);
+    return true;
+}
+
+static bool OGRSidecarReadUInt64( VSILFILE *fp, GUIntBig& nVal )
+{
+    if( VSIFReadL(&nVal, sizeof(nVal), 1, fp) != 1 )
+        return false;
+    CPL_LSBPTR64(&nVal);
+    return true;
+}
+
+static bool OGRSidecarReadString( VSILFILE *fp, CPLString& osVal )
+{
+    GUInt32 nLen = 0;
+    if( !OGRSidecarReadUInt32(fp, nLen) ||
+        nLen > OGR_SIDECAR_MAX_STRING_SIZE )
+        return false;
+    osVal.resize(nLen);
+    return nLen == 0 || VSIFReadL(&osVal[0], nLen, 1, fp) == 1;
+}
+
+/************************************************************************/
+/*                      OGRSidecarReadHeader()                          */
+/*                                                                      */
+/*      Read the header of a sidecar file.  Returns false if the file   */
+/*      is not a valid sidecar index.                                   */
+/************************************************************************/
+
+static bool OGRSidecarReadHeader( VSILFILE *fp, GUIntBig& nSourceSize,
+                                  GIntBig& nSourceMTime,
+                                  std::vector<OGRSidecarDirEntry>& aoEntries )
+{
+    char szSignature[OGR_SIDECAR_SIGNATURE_SIZE] = {};
+    GUInt32 nCount = 0;
+    GUIntBig nMTime = 0;
+
+    aoEntries.clear();
+    if( VSIFSeekL(fp, 0, SEEK_SET) != 0 ||
+        VSIFReadL(szSignature, sizeof(szSignature), 1, fp) != 1 ||
+        memcmp(szSignature, OGR_SIDECAR_SIGNATURE,
+               OGR_SIDECAR_SIGNATURE_SIZE) != 0 ||
+        !OGRSidecarReadUInt64(fp, nSourceSize) ||
+        !OGRSidecarReadUInt64(fp, nMTime) ||
+        !OGRSidecarReadUInt32(fp, nCount) )
+    {
+        return false;
+    }
+    nSourceMTime = static_cast<GIntBig>(nMTime);
+
+    for( GUInt32 i = 0; i < nCount; i++ )
+    {
+        OGRSidecarDirEntry oEntry;
+        GUIntBig nBlobOffset = 0;
+        if( !OGRSidecarReadString(fp, oEntry.osLayerName) ||
+            !OGRSidecarReadString(fp, oEntry.osFieldName) ||
+            !OGRSidecarReadUInt32(fp, oEntry.nKeyType) ||
+            !OGRSidecarReadUInt64(fp, oEntry.nEntryCount) ||
+            !OGRSidecarReadUInt64(fp, nBlobOffset) ||
+            !OGRSidecarReadUInt64(fp, oEntry.nBlobSize) ||
+            !OGRSidecarReadUInt64(fp, oEntry.nPageDirOffset) ||
+            oEntry.nKeyType > OSKT_SPATIAL ||
+            oEntry.nPageDirOffset > oEntry.nBlobSize )
+        {
+            aoEntries.clear();
+            return false;
+        }
+        oEntry.nBlobOffset = static_cast<vsi_l_offset>(nBlobOffset);
+        aoEntries.push_back(oEntry);
+    }
+
+    return true;
+}
+
+/************************************************************************/
+/*                         OGRSidecarStatFile()                         */
+/************************************************************************/
+
+static bool OGRSidecarStatFile( const char *pszFilename,
+                                      GUIntBig& nSize, GIntBig& nMTime )
+{
+    VSIStatBufL sStat;
+    if( VSIStatExL(pszFilename, &sStat,
+                   VSI_STAT_EXISTS_FLAG | VSI_STAT_NATURE_FLAG |
+                   VSI_STAT_SIZE_FLAG) != 0 ||
+        !VSI_ISREG(sStat.st_mode) )
+    {
+        return false;
+    }
+    nSize = static_cast<GUIntBig>(sStat.st_size);
+    nMTime = static_cast<GIntBig>(sStat.st_mtime);
+    return true;
+}
+
+/************************************************************************/
+/*                   OGRGetSidecarAttrIndexFilename()                   */
+/*                                                                      */
+/*      Return the name of the sidecar index of a dataset, or an        */
+/*      empty string if the dataset cannot have one.  Network file      */
+/*      systems are excluded so that opening a remote dataset does      */
+/*      not cost an extra request.                                      */
+/************************************************************************/
+
+CPLString OGRGetSidecarAttrIndexFilename( const char *pszDatasetName )
+{
+    if( pszDatasetName == nullptr || pszDatasetName[0] == '\0' )
+        return CPLString();
+    if( STARTS_WITH(pszDatasetName, "/vsi") &&
+        !STARTS_WITH(pszDatasetName, "/vsimem/") )
+        return CPLString();
+    return CPLString(pszDatasetName) + ".ogrind";
+}
+
+/************************************************************************/
+/* ==================================================================== */
+/*                          OGRSidecarIndexFile                         */
+/*                                                                      */
+/*      A sidecar file, as seen by the attribute or spatial indexes     */
+/*      of one layer: its directory, and the stamps used to notice      */
+/*      rewrites and stale indexes.  A temporary file in /vsimem/ may   */
+/*      be used instead of <dataset>.ogrind, for indexes that must not  */
+/*      outlive the layer.                                              */
+/* ==================================================================== */
+/************************************************************************/
+
+class OGRSidecarIndexFile
+{
+    CPL_DISALLOW_COPY_ASSIGN(OGRSidecarIndexFile)
+
+    CPLString   m_osIndexFilename{};
+    CPLString   m_osSourceFilename{};
+    VSILFILE   *m_fp = nullptr;
+    bool        m_bTemporary = false;
+
+    // Stamp of the sidecar file when it was loaded, to notice rewrites.
+    GUIntBig    m_nIndexFileSize = 0;
+    GIntBig     m_nIndexFileMTime = 0;
+    bool        m_bIndexFileExists = false;
+
+    // Stamp of the dataset recorded in the sidecar file.
+    GUIntBig    m_nSourceSize = 0;
+    GIntBig     m_nSourceMTime = 0;
+
+    std::vector<OGRSidecarDirEntry> m_aoEntries{};
+
+    void        Close();
+
+  public:
+                OGRSidecarIndexFile() = default;
+                ~OGRSidecarIndexFile();
+
+    bool        Initialize( const char *pszDatasetName,
+                            bool bTemporary = false );
+    void        Open();
+    bool        HasChanged() const;
+    bool        IsSourceUpToDate() const;
+    OGRErr      Rewrite( const std::vector<OGRSidecarDirEntry>& aoKeptEntries,
+                         const std::vector<OGRSidecarDirEntry>& aoNewEntries,
+                         const std::vector<std::string>& aosNewBlobs );
+    OGRErr      Remove();
+
+    bool        Exists() const { return m_bIndexFileExists; }
+    VSILFILE   *GetFile() { return m_fp; }
+    const char *GetFilename() const { return m_osIndexFilename.c_str(); }
+    const std::vector<OGRSidecarDirEntry>& GetEntries() const
+                                                    { return m_aoEntries; }
+};
+
+/************************************************************************/
+/*                        ~OGRSidecarIndexFile()                        */
+/************************************************************************/
+
+OGRSidecarIndexFile::~OGRSidecarIndexFile()
+
+{
+    Close();
+    if( m_bTemporary )
+        VSIUnlink(m_osIndexFilename);
+}
+
+/************************************************************************/
+/*                             Initialize()                             */
+/*                                                                      */
+/*      The dataset must be a regular file, since its size and          */
+/*      modification time are used to detect stale indexes.            */
+/************************************************************************/
+
+bool OGRSidecarIndexFile::Initialize( const char *pszDatasetName,
+                                      bool bTemporary )
+
+{
+    const CPLString osIndexFilename(
+        OGRGetSidecarAttrIndexFilename(pszDatasetName));
+    GUIntBig nSize = 0;
+    GIntBig nMTime = 0;
+    if( osIndexFilename.empty() ||
+        !OGRSidecarStatFile(pszDatasetName, nSize, nMTime) )
+    {
+        return false;
+    }
+
+    m_osSourceFilename = pszDatasetName;
+    m_osIndexFilename = bTemporary ?
+        CPLString(CPLSPrintf("/vsimem/ogr_sidecar_%p.ogrind", this)) :
+        osIndexFilename;
+    m_bTemporary = bTemporary;
+    return true;
+}
+
+/************************************************************************/
+/*                               Close()                                */
+/************************************************************************/
+
+void OGRSidecarIndexFile::Close()
+
+{
+    m_aoEntries.clear();
+    if( m_fp != nullptr )
+    {
+        VSIFCloseL(m_fp);
+        m_fp = nullptr;
+    }
+}
+
+/************************************************************************/
+/*                                Open()                                */
+/*                                                                      */
+/*      (Re)open the sidecar file and read its directory, if it         */
+/*      exists.                                                         */
+/************************************************************************/
+
+void OGRSidecarIndexFile::Open()
+
+{
+    Close();
+
+    m_bIndexFileExists =
+        OGRSidecarStatFile(m_osIndexFilename, m_nIndexFileSize,
+                           m_nIndexFileMTime);
+    if( !m_bIndexFileExists )
+        return;
+
+    m_fp = VSIFOpenL(m_osIndexFilename, "rb");
+    if( m_fp == nullptr )
+        return;
+
+    if( !OGRSidecarReadHeader(m_fp, m_nSourceSize, m_nSourceMTime,
+                              m_aoEntries) )
+    {
+        CPLError(CE_Warning, CPLE_AppDefined,
+                 "%s is not a valid attribute index file, ignoring it.",
+                 m_osIndexFilename.c_str());
+        Close();
+    }
+}
+
+/************************************************************************/
+/*                             HasChanged()                             */
+/*                                                                      */
+/*      Whether the sidecar file has been rewritten (possibly through   */
+/*      another layer of the dataset) since it was opened.              */
+/************************************************************************/
+
+bool OGRSidecarIndexFile::HasChanged() const
+
+{
+    GUIntBig nSize = 0;
+    GIntBig nMTime = 0;
+    const bool bExists =
+        OGRSidecarStatFile(m_osIndexFilename, nSize, nMTime);
+    return bExists != m_bIndexFileExists ||
+           (bExists && (nSize != m_nIndexFileSize ||
+                        nMTime != m_nIndexFileMTime));
+}
+
+/************************************************************************/
+/*                          IsSourceUpToDate()                          */
+/*                                                                      */
+/*      Whether the dataset has not been modified since the indexes     */
+/*      of the opened file were built.                                  */
+/************************************************************************/
+
+bool OGRSidecarIndexFile::IsSourceUpToDate() const
+
+{
+    if( m_fp == nullptr )
+        return false;
+
+    GUIntBig nSize = 0;
+    GIntBig nMTime = 0;
+    if( !OGRSidecarStatFile(m_osSourceFilename, nSize, nMTime) ||
+        nSize != m_nSourceSize || nMTime != m_nSourceMTime )
+    {
+        CPLDebug("OGR", "%s is out of date with respect to %s, ignoring it.",
+                 m_osIndexFilename.c_str(), m_osSourceFilename.c_str());
+        return false;
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                              Rewrite()                               */
+/*                                                                      */
+/*      Write a new sidecar file made of the kept indexes of the        */
+/*      current file and the new ones, then reopen it.  The file is     */
+/*      written under a temporary name and renamed, so that a failure   */
+/*      leaves the previous indexes in place.                           */
+/************************************************************************/
+
+OGRErr OGRSidecarIndexFile::Rewrite(
+                    const std::vector<OGRSidecarDirEntry>& aoKeptEntries,
+                    const std::vector<OGRSidecarDirEntry>& aoNewEntries,
+                    const std::vector<std::string>& aosNewBlobs )
+
+{
+    GUIntBig nSourceSize = 0;
+    GIntBig nSourceMTime = 0;
+    if( !OGRSidecarStatFile(m_osSourceFilename, nSourceSize,
+                                  nSourceMTime) )
+        return OGRERR_FAILURE;
+
+    std::vector<OGRSidecarDirEntry> aoEntries(aoKeptEntries);
+    aoEntries.insert(aoEntries.end(), aoNewEntries.begin(),
+                     aoNewEntries.end());
+
+/* -------------------------------------------------------------------- */
+/*      Compute the header, to know where the blobs start.              */
+/* -------------------------------------------------------------------- */
+    vsi_l_offset nHeaderSize = OGR_SIDECAR_SIGNATURE_SIZE + 8 + 8 + 4;
+    for( const auto& oEntry : aoEntries )
+    {
+        nHeaderSize += 4 + oEntry.osLayerName.size() +
+                       4 + oEntry.osFieldName.size() + 4 + 8 * 4;
+    }
+
+    std::string osHeader(OGR_SIDECAR_SIGNATURE, OGR_SIDECAR_SIGNATURE_SIZE);
+    OGRSidecarAppendUInt64(osHeader, nSourceSize);
+    OGRSidecarAppendUInt64(osHeader, static_cast<GUIntBig>(nSourceMTime));
+    OGRSidecarAppendUInt32(osHeader, static_cast<GUInt32>(aoEntries.size()));
+    vsi_l_offset nOffset = nHeaderSize;
+    for( const auto& oEntry : aoEntries )
+    {
+        OGRSidecarAppendString(osHeader, oEntry.osLayerName);
+        OGRSidecarAppendString(osHeader, oEntry.osFieldName);
+        OGRSidecarAppendUInt32(osHeader, oEntry.nKeyType);
+        OGRSidecarAppendUInt64(osHeader, oEntry.nEntryCount);
+        OGRSidecarAppendUInt64(osHeader, nOffset);
+        OGRSidecarAppendUInt64(osHeader, oEntry.nBlobSize);
+        OGRSidecarAppendUInt64(osHeader, oEntry.nPageDirOffset);
+        nOffset += oEntry.nBlobSize;
+    }
+    CPLAssert(osHeader.size() == nHeaderSize);
+
+/* -------------------------------------------------------------------- */
+/*      Write the header, the kept blobs and the new ones.              */
+/* -------------------------------------------------------------------- */
+    const CPLString osTmpFilename(m_osIndexFilename + ".tmp");
+    VSILFILE *fpOut = VSIFOpenL(osTmpFilename, "wb");
+    if( fpOut == nullptr )
+    {
+        CPLError( CE_Failure, CPLE_OpenFailed,
+                  "Failed to open `%s' for write.", osTmpFilename.c_str() );
+        return OGRERR_FAILURE;
+    }
+
+    bool bOK = VSIFWriteL(osHeader.data(), osHeader.size(), 1, fpOut) == 1;
+    std::vector<GByte> abyBuffer;
+    for( const auto& oEntry : aoKeptEntries )
+    {
+        if( !bOK )
+            break;
+        constexpr size_t BUFFER_SIZE = 1024 * 1024;
+        abyBuffer.resize(BUFFER_SIZE);
+        bOK = m_fp != nullptr &&
+              VSIFSeekL(m_fp, oEntry.nBlobOffset, SEEK_SET) == 0;
+        GUIntBig nRemaining = oEntry.nBlobSize;
+        while( bOK && nRemaining > 0 )
+        {
+            const size_t nToCopy = static_cast<size_t>(
+                std::min(nRemaining, static_cast<GUIntBig>(BUFFER_SIZE)));
+            bOK = VSIFReadL(&abyBuffer[0], nToCopy, 1, m_fp) == 1 &&
+                  VSIFWriteL(&abyBuffer[0], nToCopy, 1, fpOut) == 1;
+            nRemaining -= nToCopy;
+        }
+    }
+    for( const auto& osBlob : aosNewBlobs )
+    {
+        if( !bOK )
+            break;
+        bOK = osBlob.empty() ||
+              VSIFWriteL(osBlob.data(), osBlob.size(), 1, fpOut) == 1;
+    }
+    if( VSIFCloseL(fpOut) != 0 )
+        bOK = false;
+
+    Close();
+
+    if( !bOK || VSIRename(osTmpFilename, m_osIndexFilename) != 0 )
+    {
+        CPLError( CE_Failure, CPLE_FileIO,
+                  "Failed to write attribute index %s.",
+                  m_osIndexFilename.c_str() );
+        VSIUnlink(osTmpFilename);
+        Open();
+        return OGRERR_FAILURE;
+    }
+
+    Open();
+    return OGRERR_NONE;
+}
+
+/************************************************************************/
+/*                               Remove()                               */
+/************************************************************************/
+
+OGRErr OGRSidecarIndexFile::Remove()
+
+{
+    Close();
+    OGRErr eErr = OGRERR_NONE;
+    if( VSIUnlink(m_osIndexFilename) != 0 )
+    {
+        CPLError( CE_Failure, CPLE_FileIO,
+                  "Cannot delete %s.", m_osIndexFilename.c_str() );
+        eErr = OGRERR_FAILURE;
+    }
+    Open();
+    return eErr;
+}
+
+/************************************************************************/
+/*                       OGRSidecarGetKeptEntries()                     */
+/*                                                                      */
+/*      Return the indexes of a file that are not replaced by new       */
+/*      ones.  An attribute index and a spatial index never replace     */
+/*      each other, even if their fields have the same name.            */
+/************************************************************************/
+
+static std::vector<OGRSidecarDirEntry> OGRSidecarGetKeptEntries(
+                    const std::vector<OGRSidecarDirEntry>& aoEntries,
+                    const std::vector<OGRSidecarDirEntry>& aoNewEntries )
+{
+    std::vector<OGRSidecarDirEntry> aoKeptEntries;
+    for( const auto& oEntry : aoEntries )
+    {
+        bool bReplaced = false;
+        for( const auto& oNewEntry : aoNewEntries )
+        {
+            if( oEntry.osLayerName == oNewEntry.osLayerName &&
+                oEntry.osFieldName == oNewEntry.osFieldName &&
+                (oEntry.nKeyType == OSKT_SPATIAL) ==
+                    (oNewEntry.nKeyType == OSKT_SPATIAL) )
+                bReplaced = true;
+        }
+        if( !bReplaced )
+            aoKeptEntries.push_back(oEntry);
+    }
+    return aoKeptEntries;
+}
+
+/************************************************************************/
+/*                            OGRSidecarAttrIndex                       */
+/*                                                                      */
+/*      Access to the index of one field.                               */
+/************************************************************************/
+
+class OGRSidecarLayerAttrIndex;
+
+class OGRSidecarAttrIndex final: public OGRAttrIndex
+{
+    CPL_DISALLOW_COPY_ASSIGN(OGRSidecarAttrIndex)
+
+    OGRSidecarLayerAttrIndex    *m_poLIndex;
+    int                          m_eKeyType;
+    vsi_l_offset                 m_nBlobOffset;
+    std::vector<OGRSidecarPage>  m_aoPages{};
+
+    bool        KeyFromField( const OGRField *psField,
+                              OGRSidecarKey& oKey ) const;
+    GIntBig    *GetMatches( const OGRSidecarKey *poMin, bool bMinInclusive,
+                            const OGRSidecarKey *poMax, bool bMaxInclusive,
+                            GIntBig *panFIDList, int *pnFIDCount,
+                            int *pnLength );
+
+  public:
+    int         m_iField;
+
+                OGRSidecarAttrIndex( OGRSidecarLayerAttrIndex *poLIndex,
+                                     int iField, int eKeyType,
+                                     vsi_l_offset nBlobOffset );
+
+    bool        LoadPageDirectory( VSILFILE *fp, GUIntBig nBlobSize,
+                                   GUIntBig nPageDirOffset );
+
+    GIntBig     GetFirstMatch( OGRField *psKey ) override;
+    GIntBig    *GetAllMatches( OGRField *psKey ) override;
+    GIntBig    *GetAllMatches( OGRField *psKey, GIntBig* panFIDList,
+                               int* nFIDCount, int* nLength ) override;
+    GIntBig    *GetRangeMatches( OGRField *psMin, bool bMinInclusive,
+                                 OGRField *psMax, bool bMaxInclusive,
+                                 int *pnFIDCount ) override;
+    bool        SupportsRangeQueries() const override { return true; }
+
+    OGRErr      AddEntry( OGRField *psKey, GIntBig nFID ) override;
+    OGRErr      RemoveEntry( OGRField *psKey, GIntBig nFID ) override;
+
+    OGRErr      Clear() override;
+};
+
+/************************************************************************/
+/* ==================================================================== */
+/*                       OGRSidecarLayerAttrIndex                       */
+/*                                                                      */
+/*      Attribute indexes of the fields of one layer, stored in a       */
+/*      file next to the dataset and shared with the other layers of    */
+/*      that dataset.                                                   */
+/* ==================================================================== */
+/************************************************************************/
+
+class OGRSidecarLayerAttrIndex final: public OGRLayerAttrIndex
+{
+    CPL_DISALLOW_COPY_ASSIGN(OGRSidecarLayerAttrIndex)
+
+    OGRSidecarIndexFile m_oFile{};
+    std::vector<std::unique_ptr<OGRSidecarAttrIndex>> m_apoIndexes{};
+    std::set<int> m_oSetPendingFields{};
+
+    OGRErr      Load();
+    bool        IsUpToDate();
+
+  public:
+                OGRSidecarLayerAttrIndex() = default;
+    virtual     ~OGRSidecarLayerAttrIndex();
+
+    /* base class virtual methods */
+    OGRErr      Initialize( const char *pszDatasetName, OGRLayer * ) override;
+    OGRErr      CreateIndex( int iField ) override;
+    OGRErr      DropIndex( int iField ) override;
+    OGRErr      IndexAllFeatures( int iField = -1 ) override;
+
+    OGRErr      AddToIndex( OGRFeature *poFeature, int iField = -1 ) override;
+    OGRErr      RemoveFromIndex( OGRFeature *poFeature ) override;
+
+    OGRAttrIndex *GetFieldIndex( int iField ) override;
+
+    OGRLayer   *GetLayer() { return poLayer; }
+    VSILFILE   *GetFile() { return m_oFile.GetFile(); }
+};
+
+/************************************************************************/
+/*                        OGRSidecarAttrIndex()                         */
+/************************************************************************/
+
+OGRSidecarAttrIndex::OGRSidecarAttrIndex( OGRSidecarLayerAttrIndex *poLIndex,
+                                          int iField, int eKeyType,
+                                          vsi_l_offset nBlobOffset ) :
+    m_poLIndex(poLIndex),
+    m_eKeyType(eKeyType),
+    m_nBlobOffset(nBlobOffset),
+    m_iField(iField)
+{}
+
+/************************************************************************/
+/*                         LoadPageDirectory()                          */
+/************************************************************************/
+
+bool OGRSidecarAttrIndex::LoadPageDirectory( VSILFILE *fp,
+                                             GUIntBig nBlobSize,
+                                             GUIntBig nPageDirOffset )
+{
+    const GUIntBig nDirSize = nBlobSize - nPageDirOffset;
+    if( nDirSize < 4 || nDirSize > OGR_SIDECAR_MAX_STRING_SIZE )
+        return false;
+
+    std::vector<GByte> abyDir;
+    try
+    {
+        abyDir.resize(static_cast<size_t>(nDirSize));
+    }
+    catch( const std::exception& )
+    {
+        CPLError(CE_Failure, CPLE_OutOfMemory,
+                 "Cannot allocate page directory of attribute index");
+        return false;
+    }
+    if( VSIFSeekL(fp, m_nBlobOffset + nPageDirOffset, SEEK_SET) != 0 ||
+        VSIFReadL(&abyDir[0], abyDir.size(), 1, fp) != 1 )
+    {
+        return false;
+    }
+
+    OGRSidecarBufferReader oReader(&abyDir[0], abyDir.size());
+    const GUInt32 nPages = oReader.ReadUInt32();
+    for( GUInt32 i = 0; i < nPages && !oReader.HasError(); i++ )
+    {
+        OGRSidecarPage oPage;
+        oPage.nOffset = static_cast<vsi_l_offset>(oReader.ReadUInt64());
+        oPage.nSize = oReader.ReadUInt32();
+        oPage.nCount = oReader.ReadUInt32();
+        oReader.ReadKey(m_eKeyType, oPage.oFirstKey);
+        if( oPage.nOffset + oPage.nSize > nPageDirOffset )
+            return false;
+        m_aoPages.push_back(oPage);
+    }
+
+    return !oReader.HasError();
+}
+
+/************************************************************************/
+/*                            KeyFromField()                            */
+/************************************************************************/
+
+bool OGRSidecarAttrIndex::KeyFromField( const OGRField *psField,
+                                        OGRSidecarKey& oKey ) const
+{
+    const OGRFieldType eType =
+        m_poLIndex->GetLayer()->GetLayerDefn()->
+            GetFieldDefn(m_iField)->GetType();
+    switch( eType )
+    {
+      case OFTInteger:
+        oKey.nValue = psField->Integer;
+        return true;
+      case OFTInteger64:
+        oKey.nValue = psField->Integer64;
+        return true;
+      case OFTReal:
+        oKey.dfValue = psField->Real;
+        return !CPLIsNan(oKey.dfValue);
+      case OFTString:
+        if( psField->String == nullptr )
+            return false;
+        oKey.osValue = psField->String;
+        return true;
+      default:
+        return false;
+    }
+}
+
+/************************************************************************/
+/*                             GetMatches()                             */
+/*                                                                      */
+/*      Append to panFIDList the FIDs whose key is in the given         */
+/*      range.  A null bound means an unbounded side.  The list is      */
+/*      terminated by OGRNullFID, like GetAllMatches().                 */
+/************************************************************************/
+
+GIntBig *OGRSidecarAttrIndex::GetMatches( const OGRSidecarKey *poMin,
+                                          bool bMinInclusive,
+                                          const OGRSidecarKey *poMax,
+                                          bool bMaxInclusive,
+                                          GIntBig *panFIDList,
+                                          int *pnFIDCount, int *pnLength )
+{
+    if( panFIDList == nullptr )
+    {
+        panFIDList = static_cast<GIntBig *>(CPLMalloc(sizeof(GIntBig) * 2));
+        *pnFIDCount = 0;
+        *pnLength = 2;
+    }
+    panFIDList[*pnFIDCount] = OGRNullFID;
+
+    VSILFILE *fp = m_poLIndex->GetFile();
+    if( fp == nullptr || m_aoPages.empty() )
+        return panFIDList;
+
+/* -------------------------------------------------------------------- */
+/*      Find the first page that may hold the lower bound.  Equal       */
+/*      keys can span pages, so start from the page before the first   */
+/*      one whose first key is not lower than the bound.                */
+/* -------------------------------------------------------------------- */
+    size_t iPage = 0;
+    if( poMin != nullptr )
+    {
+        const auto oIter = std::lower_bound(
+            m_aoPages.begin(), m_aoPages.end(), *poMin,
+            [this](const OGRSidecarPage& oPage, const OGRSidecarKey& oKey)
+            {
+                return OGRSidecarCompareKeys(m_eKeyType,
+                                             oPage.oFirstKey, oKey) < 0;
+            });
+        iPage = static_cast<size_t>(oIter - m_aoPages.begin());
+        if( iPage > 0 )
+            iPage--;
+    }
+
+    std::vector<GByte> abyPage;
+    for( ; iPage < m_aoPages.size(); iPage++ )
+    {
+        const OGRSidecarPage& oPage = m_aoPages[iPage];
+        if( poMax != nullptr )
+        {
+            const int nCmp =
+                OGRSidecarCompareKeys(m_eKeyType, oPage.oFirstKey, *poMax);
+            if( nCmp > 0 || (nCmp == 0 && !bMaxInclusive) )
+                break;
+        }
+
+        abyPage.resize(oPage.nSize);
+        if( oPage.nSize == 0 ||
+            VSIFSeekL(fp, m_nBlobOffset + oPage.nOffset, SEEK_SET) != 0 ||
+            VSIFReadL(&abyPage[0], oPage.nSize, 1, fp) != 1 )
+        {
+            CPLError(CE_Failure, CPLE_FileIO,
+                     "Cannot read page of attribute index");
+            break;
+        }
+
+        OGRSidecarBufferReader oReader(&abyPage[0], abyPage.size());
+        OGRSidecarKey oKey;
+        bool bPastMax = false;
+        for( GUInt32 i = 0; i < oPage.nCount; i++ )
+        {
+            oReader.ReadKey(m_eKeyType, oKey);
+            const GIntBig nFID = static_cast<GIntBig>(oReader.ReadUInt64());
+            if( oReader.HasError() )
+            {
+                CPLError(CE_Failure, CPLE_AppDefined,
+                         "Corrupted page in attribute index");
+                return panFIDList;
+            }
+            if( poMin != nullptr )
+            {
+                const int nCmp =
+                    OGRSidecarCompareKeys(m_eKeyType, oKey, *poMin);
+                if( nCmp < 0 || (nCmp == 0 && !bMinInclusive) )
+                    continue;
+            }
+            if( poMax != nullptr )
+            {
+                const int nCmp =
+                    OGRSidecarCompareKeys(m_eKeyType, oKey, *poMax);
+                if( nCmp > 0 || (nCmp == 0 && !bMaxInclusive) )
+                {
+                    bPastMax = true;
+                    break;
+                }
+            }
+            if( *pnFIDCount >= *pnLength - 1 )
+            {
+                *pnLength = (*pnLength) * 2 + 10;
+                panFIDList = static_cast<GIntBig *>(
+                    CPLRealloc(panFIDList, sizeof(GIntBig) * (*pnLength)));
+            }
+            panFIDList[(*pnFIDCount)++] = nFID;
+        }
+        if( bPastMax )
+            break;
+    }
+
+    panFIDList[*pnFIDCount] = OGRNullFID;
+    return panFIDList;
+}
+
+/************************************************************************/
+/*                           GetFirstMatch()                            */
+/************************************************************************/
+
+GIntBig OGRSidecarAttrIndex::GetFirstMatch( OGRField *psKey )
+{
+    GIntBig *panFIDList = GetAllMatches(psKey);
+    const GIntBig nFID = panFIDList[0];
+    CPLFree(panFIDList);
+    return nFID;
+}
+
+/************************************************************************/
+/*                           GetAllMatches()                            */
+/************************************************************************/
+
+GIntBig *OGRSidecarAttrIndex::GetAllMatches( OGRField *psKey,
+                                             GIntBig* panFIDList,
+                                             int* nFIDCount, int* nLength )
+{
+    OGRSidecarKey oKey;
+    if( !KeyFromField(psKey, oKey) )
+    {
+        if( panFIDList == nullptr )
+        {
+            panFIDList = static_cast<GIntBig *>(
+                CPLMalloc(sizeof(GIntBig) * 2));
+            *nFIDCount = 0;
+            *nLength = 2;
+        }
+        panFIDList[*nFIDCount] = OGRNullFID;
+        return panFIDList;
+    }
+    return GetMatches(&oKey, true, &oKey, true,
+                      panFIDList, nFIDCount, nLength);
+}
+
+GIntBig *OGRSidecarAttrIndex::GetAllMatches( OGRField *psKey )
+{
+    int nFIDCount = 0;
+    int nLength = 0;
+    return GetAllMatches( psKey, nullptr, &nFIDCount, &nLength );
+}
+
+/************************************************************************/
+/*                          GetRangeMatches()                           */
+/************************************************************************/
+
+GIntBig *OGRSidecarAttrIndex::GetRangeMatches( OGRField *psMin,
+                                               bool bMinInclusive,
+                                               OGRField *psMax,
+                                               bool bMaxInclusive,
+                                               int *pnFIDCount )
+{
+    OGRSidecarKey oMin;
+    OGRSidecarKey oMax;
+    if( (psMin != nullptr && !KeyFromField(psMin, oMin)) ||
+        (psMax != nullptr && !KeyFromField(psMax, oMax)) )
+        return nullptr;
+
+    int nLength = 0;
+    GIntBig *panFIDList =
+        GetMatches(psMin ? &oMin : nullptr, bMinInclusive,
+                   psMax ? &oMax : nullptr, bMaxInclusive,
+                   nullptr, pnFIDCount, &nLength);
+
+    // Entries are sorted by key first, so FIDs of a range are not.
+    std::sort(panFIDList, panFIDList + *pnFIDCount);
+    return panFIDList;
+}
+
+/************************************************************************/
+/*                              AddEntry()                              */
+/*                                                                      */
+/*      The sidecar index is rebuilt as a whole; incremental updates    */
+/*      are not supported.                                              */
+/************************************************************************/
+
+OGRErr OGRSidecarAttrIndex::AddEntry( OGRField * /* psKey */,
+                                      GIntBig /* nFID */ )
+{
+    return OGRERR_UNSUPPORTED_OPERATION;
+}
+
+/************************************************************************/
+/*                            RemoveEntry()                             */
+/************************************************************************/
+
+OGRErr OGRSidecarAttrIndex::RemoveEntry( OGRField * /* psKey */,
+                                         GIntBig /* nFID */ )
+{
+    return OGRERR_UNSUPPORTED_OPERATION;
+}
+
+/************************************************************************/
+/*                               Clear()                                */
+/************************************************************************/
+
+OGRErr OGRSidecarAttrIndex::Clear()
+{
+    return OGRERR_UNSUPPORTED_OPERATION;
+}
+
+/************************************************************************/
+/*                     ~OGRSidecarLayerAttrIndex()                      */
+/************************************************************************/
+
+OGRSidecarLayerAttrIndex::~OGRSidecarLayerAttrIndex()
+
+{
+    m_apoIndexes.clear();
+}
+
+/************************************************************************/
+/*                             Initialize()                             */
+/*                                                                      */
+/*      Unlike the MapInfo implementation, this takes the name of the   */
+/*      dataset, which must be a regular file since its size and        */
+/*      modification time are used to detect stale indexes.            */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerAttrIndex::Initialize( const char *pszDatasetName,
+                                             OGRLayer *poLayerIn )
+
+{
+    if( poLayerIn == poLayer )
+        return OGRERR_NONE;
+
+    if( !m_oFile.Initialize(pszDatasetName) )
+        return OGRERR_FAILURE;
+
+    poLayer = poLayerIn;
+    pszIndexPath = CPLStrdup(m_oFile.GetFilename());
+
+    return Load();
+}
+
+/************************************************************************/
+/*                                Load()                                */
+/*                                                                      */
+/*      (Re)load the description of the indexes of the layer from the   */
+/*      sidecar file, if it exists.                                     */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerAttrIndex::Load()
+
+{
+    m_apoIndexes.clear();
+    m_oFile.Open();
+
+    VSILFILE *fp = m_oFile.GetFile();
+    if( fp == nullptr )
+        return OGRERR_NONE;
+
+    OGRFeatureDefn *poDefn = poLayer->GetLayerDefn();
+    for( const auto& oEntry : m_oFile.GetEntries() )
+    {
+        if( oEntry.osLayerName != poDefn->GetName() ||
+            oEntry.nKeyType == OSKT_SPATIAL )
+            continue;
+        const int iField = poDefn->GetFieldIndex(oEntry.osFieldName);
+        if( iField < 0 ||
+            OGRSidecarGetKeyType(poDefn->GetFieldDefn(iField)->GetType()) !=
+                static_cast<int>(oEntry.nKeyType) )
+        {
+            CPLDebug("OGR", "Ignoring index of %s.%s in %s: field type or "
+                     "layer structure has changed.",
+                     oEntry.osLayerName.c_str(), oEntry.osFieldName.c_str(),
+                     pszIndexPath);
+            continue;
+        }
+
+        std::unique_ptr<OGRSidecarAttrIndex> poIndex(
+            new OGRSidecarAttrIndex(this, iField, oEntry.nKeyType,
+                                    oEntry.nBlobOffset));
+        if( oEntry.nEntryCount > 0 &&
+            !poIndex->LoadPageDirectory(fp, oEntry.nBlobSize,
+                                        oEntry.nPageDirOffset) )
+        {
+            CPLError(CE_Warning, CPLE_AppDefined,
+                     "Corrupted index of %s.%s in %s, ignoring it.",
+                     oEntry.osLayerName.c_str(),
+                     oEntry.osFieldName.c_str(), pszIndexPath);
+            continue;
+        }
+        m_apoIndexes.push_back(std::move(poIndex));
+    }
+
+    if( !m_apoIndexes.empty() )
+    {
+        CPLDebug("OGR", "Restored %d field indexes for layer %s from %s.",
+                 static_cast<int>(m_apoIndexes.size()), poDefn->GetName(),
+                 pszIndexPath);
+    }
+
+    return OGRERR_NONE;
+}
+
+/************************************************************************/
+/*                             IsUpToDate()                             */
+/*                                                                      */
+/*      Reload the sidecar file if it has been rewritten, and check     */
+/*      that the dataset has not been modified since the index was      */
+/*      built.                                                          */
+/************************************************************************/
+
+bool OGRSidecarLayerAttrIndex::IsUpToDate()
+
+{
+    if( m_oFile.HasChanged() )
+        Load();
+    return m_oFile.IsSourceUpToDate();
+}
+
+/************************************************************************/
+/*                           GetFieldIndex()                            */
+/************************************************************************/
+
+OGRAttrIndex *OGRSidecarLayerAttrIndex::GetFieldIndex( int iField )
+
+{
+    if( m_apoIndexes.empty() && !m_oFile.Exists() )
+        return nullptr;
+    if( !IsUpToDate() )
+        return nullptr;
+
+    for( const auto& poIndex : m_apoIndexes )
+    {
+        if( poIndex->m_iField == iField )
+            return poIndex.get();
+    }
+    return nullptr;
+}
+
+/************************************************************************/
+/*                            CreateIndex()                             */
+/*                                                                      */
+/*      Register a field to index.  The index is built by the next      */
+/*      IndexAllFeatures() call.                                        */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerAttrIndex::CreateIndex( int iField )
+
+{
+    OGRFeatureDefn *poDefn = poLayer->GetLayerDefn();
+    if( iField < 0 || iField >= poDefn->GetFieldCount() )
+        return OGRERR_FAILURE;
+
+    OGRFieldDefn *poFldDefn = poDefn->GetFieldDefn(iField);
+    if( GetFieldIndex(iField) != nullptr )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined,
+                  "It seems we already have an index for field %d/%s\n"
+                  "of layer %s.",
+                  iField, poFldDefn->GetNameRef(), poDefn->GetName() );
+        return OGRERR_FAILURE;
+    }
+
+    if( OGRSidecarGetKeyType(poFldDefn->GetType()) < 0 )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined,
+                  "Indexing not support for the field type of field %s.",
+                  poFldDefn->GetNameRef() );
+        return OGRERR_FAILURE;
+    }
+
+    m_oSetPendingFields.insert(iField);
+    return OGRERR_NONE;
+}
+
+/************************************************************************/
+/*                             DropIndex()                              */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerAttrIndex::DropIndex( int iField )
+
+{
+    OGRFeatureDefn *poDefn = poLayer->GetLayerDefn();
+    if( iField < 0 || iField >= poDefn->GetFieldCount() )
+        return OGRERR_FAILURE;
+
+    m_oSetPendingFields.erase(iField);
+
+    const char *pszFieldName = poDefn->GetFieldDefn(iField)->GetNameRef();
+    const bool bUpToDate = IsUpToDate();
+
+    std::vector<OGRSidecarDirEntry> aoKeptEntries;
+    bool bFound = false;
+    for( const auto& oEntry : m_oFile.GetEntries() )
+    {
+        if( oEntry.osLayerName == poDefn->GetName() &&
+            oEntry.osFieldName == pszFieldName &&
+            oEntry.nKeyType != OSKT_SPATIAL )
+            bFound = true;
+        else
+            aoKeptEntries.push_back(oEntry);
+    }
+
+    if( !bFound )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined,
+                  "DROP INDEX on field (%s) that doesn't have an index.",
+                  pszFieldName );
+        return OGRERR_FAILURE;
+    }
+
+    // Indexes of a stale file are useless, and must not be stamped again.
+    OGRErr eErr;
+    m_apoIndexes.clear();
+    if( aoKeptEntries.empty() || !bUpToDate )
+        eErr = m_oFile.Remove();
+    else
+        eErr = m_oFile.Rewrite(aoKeptEntries,
+                               std::vector<OGRSidecarDirEntry>(),
+                               std::vector<std::string>());
+    Load();
+    return eErr;
+}
+
+/************************************************************************/
+/*                        OGRSidecarBuildBlob()                         */
+/*                                                                      */
+/*      Sort the entries of a field and pack them in pages followed     */
+/*      by their directory.                                             */
+/************************************************************************/
+
+static bool OGRSidecarBuildBlob( std::vector<OGRSidecarEntry>& aoEntries,
+                                 int eKeyType, std::string& osBlob,
+                                 GUIntBig& nPageDirOffset )
+{
+    std::stable_sort(aoEntries.begin(), aoEntries.end(),
+        [eKeyType](const OGRSidecarEntry& oA, const OGRSidecarEntry& oB)
+        {
+            const int nCmp =
+                OGRSidecarCompareKeys(eKeyType, oA.first, oB.first);
+            return nCmp < 0 || (nCmp == 0 && oA.second < oB.second);
+        });
+
+    std::string osPageDir;
+    OGRSidecarAppendUInt32(osPageDir, static_cast<GUInt32>(
+        (aoEntries.size() + OGR_SIDECAR_PAGE_ENTRIES - 1) /
+                                            OGR_SIDECAR_PAGE_ENTRIES));
+
+    for( size_t iStart = 0; iStart < aoEntries.size();
+         iStart += OGR_SIDECAR_PAGE_ENTRIES )
+    {
+        const size_t iEnd = std::min(aoEntries.size(),
+                                     iStart + OGR_SIDECAR_PAGE_ENTRIES);
+        const size_t nPageOffset = osBlob.size();
+        for( size_t i = iStart; i < iEnd; i++ )
+        {
+            OGRSidecarAppendKey(osBlob, eKeyType, aoEntries[i].first);
+            OGRSidecarAppendUInt64(osBlob,
+                                   static_cast<GUIntBig>(aoEntries[i].second));
+        }
+        if( osBlob.size() - nPageOffset > OGR_SIDECAR_MAX_STRING_SIZE )
+        {
+            CPLError(CE_Failure, CPLE_NotSupported,
+                     "Keys too large for attribute index");
+            return false;
+        }
+        OGRSidecarAppendUInt64(osPageDir, nPageOffset);
+        OGRSidecarAppendUInt32(osPageDir,
+                               static_cast<GUInt32>(osBlob.size() -
+                                                    nPageOffset));
+        OGRSidecarAppendUInt32(osPageDir,
+                               static_cast<GUInt32>(iEnd - iStart));
+        OGRSidecarAppendKey(osPageDir, eKeyType, aoEntries[iStart].first);
+    }
+
+    nPageDirOffset = osBlob.size();
+    osBlob.append(osPageDir);
+    return true;
+}
+
+/************************************************************************/
+/*                          IndexAllFeatures()                          */
+/*                                                                      */
+/*      Build the indexes registered with CreateIndex() by scanning     */
+/*      the layer, and write them in the sidecar file.                  */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerAttrIndex::IndexAllFeatures( int iField )
+
+{
+    std::vector<int> aiFields;
+    for( int iPending : m_oSetPendingFields )
+    {
+        if( iField < 0 || iPending == iField )
+            aiFields.push_back(iPending);
+    }
+    if( aiFields.empty() )
+        return OGRERR_NONE;
+    for( int iPending : aiFields )
+        m_oSetPendingFields.erase(iPending);
+
+    OGRFeatureDefn *poDefn = poLayer->GetLayerDefn();
+    std::vector<std::vector<OGRSidecarEntry>> aaoEntries(aiFields.size());
+
+/* -------------------------------------------------------------------- */
+/*      Scan the whole layer, without its current filters.             */
+/* -------------------------------------------------------------------- */
+    const CPLString osAttrQuery(poLayer->GetAttrQueryString() ?
+                                poLayer->GetAttrQueryString() : "");
+    const int iGeomFieldFilter = poLayer->GetGeomFieldFilter();
+    OGRGeometry *poSpatialFilter = poLayer->GetSpatialFilter();
+    std::unique_ptr<OGRGeometry> poSavedSpatialFilter(
+        poSpatialFilter ? poSpatialFilter->clone() : nullptr);
+    if( !osAttrQuery.empty() )
+        poLayer->SetAttributeFilter(nullptr);
+    if( poSavedSpatialFilter )
+        poLayer->SetSpatialFilter(iGeomFieldFilter, nullptr);
+
+    OGRErr eErr = OGRERR_NONE;
+    poLayer->ResetReading();
+    OGRFeature *poFeature = nullptr;
+    while( (poFeature = poLayer->GetNextFeature()) != nullptr )
+    {
+        const GIntBig nFID = poFeature->GetFID();
+        if( nFID == OGRNullFID )
+        {
+            delete poFeature;
+            CPLError(CE_Failure, CPLE_NotSupported,
+                     "Layer %s does not have feature ids, "
+                     "cannot index it.", poDefn->GetName());
+            eErr = OGRERR_FAILURE;
+            break;
+        }
+
+        for( size_t i = 0; i < aiFields.size(); i++ )
+        {
+            const int iIdxField = aiFields[i];
+            if( !poFeature->IsFieldSetAndNotNull(iIdxField) )
+                continue;
+
+            OGRSidecarEntry oEntry;
+            oEntry.second = nFID;
+            switch( OGRSidecarGetKeyType(
+                        poDefn->GetFieldDefn(iIdxField)->GetType()) )
+            {
+              case OSKT_INTEGER:
+                oEntry.first.nValue =
+                    poFeature->GetFieldAsInteger64(iIdxField);
+                break;
+              case OSKT_REAL:
+                oEntry.first.dfValue =
+                    poFeature->GetFieldAsDouble(iIdxField);
+                if( CPLIsNan(oEntry.first.dfValue) )
+                    continue;
+                break;
+              default:
+                oEntry.first.osValue =
+                    poFeature->GetFieldAsString(iIdxField);
+                break;
+            }
+            aaoEntries[i].push_back(std::move(oEntry));
+        }
+        delete poFeature;
+    }
+    poLayer->ResetReading();
+
+    if( !osAttrQuery.empty() )
+        poLayer->SetAttributeFilter(osAttrQuery);
+    if( poSavedSpatialFilter )
+        poLayer->SetSpatialFilter(iGeomFieldFilter,
+                                  poSavedSpatialFilter.get());
+
+    if( eErr != OGRERR_NONE )
+        return eErr;
+
+/* -------------------------------------------------------------------- */
+/*      Sort the entries of each field and pack them in pages.          */
+/* -------------------------------------------------------------------- */
+    std::vector<OGRSidecarDirEntry> aoNewEntries;
+    std::vector<std::string> aosNewBlobs;
+    for( size_t i = 0; i < aiFields.size(); i++ )
+    {
+        OGRSidecarDirEntry oEntry;
+        oEntry.osLayerName = poDefn->GetName();
+        oEntry.osFieldName =
+            poDefn->GetFieldDefn(aiFields[i])->GetNameRef();
+        oEntry.nKeyType = static_cast<GUInt32>(OGRSidecarGetKeyType(
+            poDefn->GetFieldDefn(aiFields[i])->GetType()));
+        oEntry.nEntryCount = aaoEntries[i].size();
+
+        std::string osBlob;
+        if( !OGRSidecarBuildBlob(aaoEntries[i], oEntry.nKeyType, osBlob,
+                       oEntry.nPageDirOffset) )
+            return OGRERR_FAILURE;
+        std::vector<OGRSidecarEntry>().swap(aaoEntries[i]);
+        oEntry.nBlobSize = osBlob.size();
+        aoNewEntries.push_back(oEntry);
+        aosNewBlobs.push_back(std::move(osBlob));
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Keep the other indexes of the file, unless they are stale.      */
+/* -------------------------------------------------------------------- */
+    std::vector<OGRSidecarDirEntry> aoKeptEntries;
+    if( IsUpToDate() )
+        aoKeptEntries = OGRSidecarGetKeptEntries(m_oFile.GetEntries(),
+                                                 aoNewEntries);
+
+    m_apoIndexes.clear();
+    eErr = m_oFile.Rewrite(aoKeptEntries, aoNewEntries, aosNewBlobs);
+    Load();
+    return eErr;
+}
+
+/************************************************************************/
+/*                             AddToIndex()                             */
+/*                                                                      */
+/*      Modifications of the dataset make the index stale, and it is    */
+/*      then ignored until rebuilt, so there is nothing to do here.     */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerAttrIndex::AddToIndex( OGRFeature * /* poFeature */,
+                                             int /* iTargetField */ )
+
+{
+    return OGRERR_NONE;
+}
+
+/************************************************************************/
+/*                          RemoveFromIndex()                           */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerAttrIndex::RemoveFromIndex( OGRFeature * /*poFeature*/ )
+
+{
+    return OGRERR_NONE;
+}
+
+/************************************************************************/
+/*                         OGRSidecarHilbertCode()                      */
+/*                                                                      */
+/*      Distance of a cell of a 65536 x 65536 grid along the Hilbert    */
+/*      curve filling it.                                               */
+/************************************************************************/
+
+static GUInt32 OGRSidecarHilbertCode( GUInt32 nX, GUInt32 nY )
+{
+    constexpr GUInt32 GRID_MAX = 65535;
+    GUInt32 nCode = 0;
+    for( GUInt32 nS = (GRID_MAX + 1) / 2; nS > 0; nS /= 2 )
+    {
+        const GUInt32 nRX = (nX & nS) != 0 ? 1 : 0;
+        const GUInt32 nRY = (nY & nS) != 0 ? 1 : 0;
+        nCode += nS * nS * ((3 * nRX) ^ nRY);
+        if( nRY == 0 )
+        {
+            if( nRX == 1 )
+            {
+                nX = GRID_MAX - nX;
+                nY = GRID_MAX - nY;
+            }
+            std::swap(nX, nY);
+        }
+    }
+    return nCode;
+}
+
+/************************************************************************/
+/*                      Envelope serialization.                         */
+/************************************************************************/
+
+static void OGRSidecarAppendDouble( std::string& osBuf, double dfVal )
+{
+    GUIntBig nVal = 0;
+    memcpy(&nVal, &dfVal, sizeof(nVal));
+    OGRSidecarAppendUInt64(osBuf, nVal);
+}
+
+static void OGRSidecarAppendEnvelope( std::string& osBuf,
+                                      const OGREnvelope& sEnvelope )
+{
+    OGRSidecarAppendDouble(osBuf, sEnvelope.MinX);
+    OGRSidecarAppendDouble(osBuf, sEnvelope.MinY);
+    OGRSidecarAppendDouble(osBuf, sEnvelope.MaxX);
+    OGRSidecarAppendDouble(osBuf, sEnvelope.MaxY);
+}
+
+static void OGRSidecarReadEnvelope( OGRSidecarBufferReader& oReader,
+                                    OGREnvelope& sEnvelope )
+{
+    double *padfValues[4] = { &sEnvelope.MinX, &sEnvelope.MinY,
+                              &sEnvelope.MaxX, &sEnvelope.MaxY };
+    for( double *pdfValue : padfValues )
+    {
+        const GUIntBig nVal = oReader.ReadUInt64();
+        memcpy(pdfValue, &nVal, sizeof(nVal));
+    }
+}
+
+/************************************************************************/
+/*                        OGRSidecarBuildRTree()                        */
+/*                                                                      */
+/*      Sort the features along a Hilbert curve, and pack them in the   */
+/*      leaves of an R-tree written from the root to the leaves.        */
+/************************************************************************/
+
+typedef std::pair<OGREnvelope, GIntBig> OGRSidecarSpatialEntry;
+
+static void OGRSidecarBuildRTree( std::vector<OGRSidecarSpatialEntry>& aoEntries,
+                                  std::string& osBlob )
+{
+    OGREnvelope sExtent;
+    for( const auto& oEntry : aoEntries )
+        sExtent.Merge(oEntry.first);
+
+    const double dfWidth = sExtent.MaxX - sExtent.MinX;
+    const double dfHeight = sExtent.MaxY - sExtent.MinY;
+    std::vector<std::pair<GUInt32, size_t>> aoCodes;
+    aoCodes.reserve(aoEntries.size());
+    for( size_t i = 0; i < aoEntries.size(); i++ )
+    {
+        const OGREnvelope& sEnv = aoEntries[i].first;
+        const double dfX = (sEnv.MinX + sEnv.MaxX) / 2 - sExtent.MinX;
+        const double dfY = (sEnv.MinY + sEnv.MaxY) / 2 - sExtent.MinY;
+        const GUInt32 nX = dfWidth > 0 ?
+            static_cast<GUInt32>(std::min(65535.0, dfX / dfWidth * 65535)) : 0;
+        const GUInt32 nY = dfHeight > 0 ?
+            static_cast<GUInt32>(std::min(65535.0, dfY / dfHeight * 65535)) : 0;
+        aoCodes.emplace_back(OGRSidecarHilbertCode(nX, nY), i);
+    }
+    std::sort(aoCodes.begin(), aoCodes.end(),
+        [&aoEntries](const std::pair<GUInt32, size_t>& oA,
+                     const std::pair<GUInt32, size_t>& oB)
+        {
+            return oA.first < oB.first ||
+                   (oA.first == oB.first &&
+                    aoEntries[oA.second].second < aoEntries[oB.second].second);
+        });
+
+/* -------------------------------------------------------------------- */
+/*      Compute the levels from the leaves up to the root.              */
+/* -------------------------------------------------------------------- */
+    std::vector<std::vector<OGREnvelope>> aaoLevels(1);
+    aaoLevels[0].reserve(aoEntries.size());
+    for( const auto& oCode : aoCodes )
+        aaoLevels[0].push_back(aoEntries[oCode.second].first);
+    while( aaoLevels.back().size() > 1 )
+    {
+        const std::vector<OGREnvelope>& aoChildren = aaoLevels.back();
+        std::vector<OGREnvelope> aoParents;
+        for( size_t i = 0; i < aoChildren.size(); i += OGR_SIDECAR_NODE_SIZE )
+        {
+            OGREnvelope sEnv;
+            const size_t nEnd = std::min(aoChildren.size(),
+                                         i + OGR_SIDECAR_NODE_SIZE);
+            for( size_t j = i; j < nEnd; j++ )
+                sEnv.Merge(aoChildren[j]);
+            aoParents.push_back(sEnv);
+        }
+        aaoLevels.push_back(std::move(aoParents));
+    }
+    if( aoEntries.empty() )
+        aaoLevels.clear();
+
+    OGRSidecarAppendUInt32(osBlob, OGR_SIDECAR_NODE_SIZE);
+    OGRSidecarAppendUInt32(osBlob, static_cast<GUInt32>(aaoLevels.size()));
+    for( auto oIter = aaoLevels.rbegin(); oIter != aaoLevels.rend(); ++oIter )
+        OGRSidecarAppendUInt64(osBlob, oIter->size());
+    for( size_t iLevel = aaoLevels.size(); iLevel > 1; iLevel-- )
+    {
+        for( const auto& sEnv : aaoLevels[iLevel - 1] )
+            OGRSidecarAppendEnvelope(osBlob, sEnv);
+    }
+    for( const auto& oCode : aoCodes )
+    {
+        OGRSidecarAppendEnvelope(osBlob, aoEntries[oCode.second].first);
+        OGRSidecarAppendUInt64(osBlob,
+                    static_cast<GUIntBig>(aoEntries[oCode.second].second));
+    }
+}
+
+/************************************************************************/
+/* ==================================================================== */
+/*                            OGRSidecarRTree                           */
+/*                                                                      */
+/*      Access to the spatial index of one geometry field.              */
+/* ==================================================================== */
+/************************************************************************/
+
+class OGRSidecarRTree
+{
+    CPL_DISALLOW_COPY_ASSIGN(OGRSidecarRTree)
+
+    // Inner levels, from the root down.
+    std::vector<std::vector<OGREnvelope>> m_aaoLevels{};
+    GUIntBig        m_nLeafCount = 0;
+    vsi_l_offset    m_nLeafOffset = 0;
+
+  public:
+    int             m_iGeomField;
+    // File the leaves are read from.
+    OGRSidecarIndexFile *m_poFile;
+
+                    OGRSidecarRTree( int iGeomField,
+                                     OGRSidecarIndexFile *poFile ) :
+                                m_iGeomField(iGeomField), m_poFile(poFile) {}
+
+    bool            Load( const OGRSidecarDirEntry& oEntry );
+    GIntBig        *GetMatches( const OGREnvelope& sEnvelope,
+                                int *pnFIDCount );
+};
+
+/************************************************************************/
+/*                                Load()                                */
+/*                                                                      */
+/*      Read the inner levels of the tree, and check that the blob      */
+/*      has the expected structure.                                     */
+/************************************************************************/
+
+bool OGRSidecarRTree::Load( const OGRSidecarDirEntry& oEntry )
+
+{
+    VSILFILE *fp = m_poFile->GetFile();
+    constexpr GUIntBig INNER_NODE_SIZE = 4 * 8;
+    constexpr GUIntBig LEAF_NODE_SIZE = 4 * 8 + 8;
+
+    GUInt32 nNodeSize = 0;
+    GUInt32 nLevels = 0;
+    if( VSIFSeekL(fp, oEntry.nBlobOffset, SEEK_SET) != 0 ||
+        !OGRSidecarReadUInt32(fp, nNodeSize) ||
+        !OGRSidecarReadUInt32(fp, nLevels) ||
+        nNodeSize != OGR_SIDECAR_NODE_SIZE || nLevels > 64 ||
+        (nLevels == 0) != (oEntry.nEntryCount == 0) )
+    {
+        return false;
+    }
+
+    std::vector<GUIntBig> anCounts(nLevels);
+    for( GUInt32 i = 0; i < nLevels; i++ )
+    {
+        if( !OGRSidecarReadUInt64(fp, anCounts[i]) )
+            return false;
+    }
+
+    // Each level must have the number of nodes needed to hold the next
+    // one, down to one leaf per indexed feature.
+    GUIntBig nSize = 8 + 8 * static_cast<GUIntBig>(nLevels);
+    for( GUInt32 i = 0; i < nLevels; i++ )
+    {
+        const bool bLeaves = i + 1 == nLevels;
+        const GUIntBig nExpected = bLeaves ? oEntry.nEntryCount :
+            (anCounts[i + 1] + OGR_SIDECAR_NODE_SIZE - 1) /
+                                                    OGR_SIDECAR_NODE_SIZE;
+        if( anCounts[i] != nExpected || (i == 0 && anCounts[0] != 1) )
+            return false;
+        nSize += anCounts[i] * (bLeaves ? LEAF_NODE_SIZE : INNER_NODE_SIZE);
+    }
+    if( nSize != oEntry.nBlobSize )
+        return false;
+
+    m_aaoLevels.resize(nLevels > 0 ? nLevels - 1 : 0);
+    for( size_t i = 0; i < m_aaoLevels.size(); i++ )
+    {
+        std::vector<GByte> abyLevel;
+        try
+        {
+            abyLevel.resize(static_cast<size_t>(anCounts[i] * INNER_NODE_SIZE));
+            m_aaoLevels[i].resize(static_cast<size_t>(anCounts[i]));
+        }
+        catch( const std::exception& )
+        {
+            CPLError(CE_Failure, CPLE_OutOfMemory,
+                     "Cannot allocate spatial index");
+            return false;
+        }
+        if( VSIFReadL(&abyLevel[0], abyLevel.size(), 1, fp) != 1 )
+            return false;
+        OGRSidecarBufferReader oReader(&abyLevel[0], abyLevel.size());
+        for( auto& sEnv : m_aaoLevels[i] )
+            OGRSidecarReadEnvelope(oReader, sEnv);
+    }
+
+    m_nLeafCount = oEntry.nEntryCount;
+    m_nLeafOffset = VSIFTellL(fp);
+    return true;
+}
+
+/************************************************************************/
+/*                             GetMatches()                             */
+/************************************************************************/
+
+GIntBig *OGRSidecarRTree::GetMatches( const OGREnvelope& sEnvelope,
+                                      int *pnFIDCount )
+
+{
+    VSILFILE *fp = m_poFile->GetFile();
+    std::vector<GIntBig> anFIDs;
+
+/* -------------------------------------------------------------------- */
+/*      Walk down the inner levels, keeping the intersecting nodes.     */
+/* -------------------------------------------------------------------- */
+    std::vector<GUIntBig> anNodes;
+    if( m_nLeafCount > 0 )
+        anNodes.push_back(0);
+    for( size_t iLevel = 0; iLevel < m_aaoLevels.size(); iLevel++ )
+    {
+        const GUIntBig nChildCount = iLevel + 1 < m_aaoLevels.size() ?
+            m_aaoLevels[iLevel + 1].size() : m_nLeafCount;
+        std::vector<GUIntBig> anChildren;
+        for( const GUIntBig nNode : anNodes )
+        {
+            if( !m_aaoLevels[iLevel][static_cast<size_t>(nNode)].
+                                                    Intersects(sEnvelope) )
+                continue;
+            const GUIntBig nEnd = std::min(nChildCount,
+                                    (nNode + 1) * OGR_SIDECAR_NODE_SIZE);
+            for( GUIntBig nChild = nNode * OGR_SIDECAR_NODE_SIZE;
+                 nChild < nEnd; nChild++ )
+                anChildren.push_back(nChild);
+        }
+        anNodes.swap(anChildren);
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Read the runs of consecutive candidate leaves.                  */
+/* -------------------------------------------------------------------- */
+    constexpr size_t LEAF_NODE_SIZE = 4 * 8 + 8;
+    constexpr size_t MAX_LEAVES_PER_READ = 4096;
+    std::vector<GByte> abyLeaves;
+    for( size_t i = 0; i < anNodes.size(); )
+    {
+        size_t nRun = 1;
+        while( i + nRun < anNodes.size() && nRun < MAX_LEAVES_PER_READ &&
+               anNodes[i + nRun] == anNodes[i] + nRun )
+            nRun++;
+
+        abyLeaves.resize(nRun * LEAF_NODE_SIZE);
+        if( VSIFSeekL(fp, m_nLeafOffset + anNodes[i] * LEAF_NODE_SIZE,
+                      SEEK_SET) != 0 ||
+            VSIFReadL(&abyLeaves[0], abyLeaves.size(), 1, fp) != 1 )
+        {
+            CPLError(CE_Failure, CPLE_FileIO,
+                     "Cannot read leaves of spatial index");
+            break;
+        }
+        OGRSidecarBufferReader oReader(&abyLeaves[0], abyLeaves.size());
+        for( size_t j = 0; j < nRun; j++ )
+        {
+            OGREnvelope sEnv;
+            OGRSidecarReadEnvelope(oReader, sEnv);
+            const GIntBig nFID = static_cast<GIntBig>(oReader.ReadUInt64());
+            if( sEnv.Intersects(sEnvelope) )
+                anFIDs.push_back(nFID);
+        }
+        i += nRun;
+    }
+
+    std::sort(anFIDs.begin(), anFIDs.end());
+    GIntBig *panFIDList = static_cast<GIntBig *>(
+        CPLMalloc(sizeof(GIntBig) * (anFIDs.size() + 1)));
+    if( !anFIDs.empty() )
+        memcpy(panFIDList, &anFIDs[0], sizeof(GIntBig) * anFIDs.size());
+    panFIDList[anFIDs.size()] = OGRNullFID;
+    if( pnFIDCount != nullptr )
+        *pnFIDCount = static_cast<int>(anFIDs.size());
+    return panFIDList;
+}
+
+/************************************************************************/
+/* ==================================================================== */
+/*                      OGRSidecarLayerSpatialIndex                     */
+/*                                                                      */
+/*      Spatial indexes of the geometry fields of one layer, stored     */
+/*      in the same sidecar file as the attribute indexes.              */
+/* ==================================================================== */
+/************************************************************************/
+
+class OGRSidecarLayerSpatialIndex final: public OGRLayerSpatialIndex
+{
+    CPL_DISALLOW_COPY_ASSIGN(OGRSidecarLayerSpatialIndex)
+
+    OGRSidecarIndexFile m_oFile{};
+    std::vector<std::unique_ptr<OGRSidecarRTree>> m_apoTrees{};
+
+    // To reopen the dataset when building indexes on demand.
+    CPLString       m_osDatasetName{};
+    CPLString       m_osDriverName{};
+    CPLStringList   m_aosOpenOptions{};
+    bool            m_bBuildOnDemand = false;
+    std::set<int>   m_oSetBuildAttempted{};
+
+    // Indexes built on demand, unless they are written in m_oFile.
+    OGRSidecarIndexFile m_oTempFile{};
+    bool            m_bHasTempFile = false;
+
+    void            Load();
+    void            LoadTrees( OGRSidecarIndexFile& oFile );
+    bool            IsUpToDate( OGRSidecarIndexFile& oFile );
+    OGRSidecarRTree *GetTree( int iGeomField );
+    OGRErr          BuildIndex( int iGeomField, OGRLayer *poSrcLayer,
+                                OGRSidecarIndexFile& oFile );
+    void            BuildOnDemand( int iGeomField );
+
+  public:
+                OGRSidecarLayerSpatialIndex() = default;
+
+    OGRErr      Initialize( GDALDataset *poDS, OGRLayer * ) override;
+
+    bool        HasIndex( int iGeomField ) override;
+    OGRErr      CreateIndex( int iGeomField, OGRLayer *poSrcLayer ) override;
+    OGRErr      DropIndex( int iGeomField ) override;
+    GIntBig    *GetMatches( int iGeomField, const OGREnvelope& sEnvelope,
+                            int *pnFIDCount ) override;
+};
+
+/************************************************************************/
+/*                             Initialize()                             */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerSpatialIndex::Initialize( GDALDataset *poDS,
+                                                OGRLayer *poLayerIn )
+
+{
+    if( poLayerIn == poLayer )
+        return OGRERR_NONE;
+
+    if( !m_oFile.Initialize(poDS->GetDescription()) )
+        return OGRERR_FAILURE;
+
+    poLayer = poLayerIn;
+    m_osDatasetName = poDS->GetDescription();
+    if( poDS->GetDriver() != nullptr )
+        m_osDriverName = poDS->GetDriver()->GetDescription();
+    m_aosOpenOptions.Assign(CSLDuplicate(poDS->GetOpenOptions()), TRUE);
+
+    // With AUTO, indexes built on demand are only kept for the lifetime of
+    // the layer, since the dataset was opened in read-only mode.  They are
+    // written in the sidecar file if explicitly requested with AUTO_WRITE.
+    const char *pszSpatialIndex =
+        CPLGetConfigOption("OGR_SIDECAR_SPATIAL_INDEX", "YES");
+    m_bBuildOnDemand = EQUAL(pszSpatialIndex, "AUTO") ||
+                       EQUAL(pszSpatialIndex, "AUTO_WRITE");
+    m_bHasTempFile = EQUAL(pszSpatialIndex, "AUTO") &&
+                     m_oTempFile.Initialize(poDS->GetDescription(), true);
+
+    Load();
+    return OGRERR_NONE;
+}
+
+/************************************************************************/
+/*                                Load()                                */
+/************************************************************************/
+
+void OGRSidecarLayerSpatialIndex::Load()
+
+{
+    m_apoTrees.clear();
+    m_oFile.Open();
+    LoadTrees(m_oFile);
+    if( m_bHasTempFile )
+    {
+        m_oTempFile.Open();
+        LoadTrees(m_oTempFile);
+    }
+}
+
+/************************************************************************/
+/*                             LoadTrees()                              */
+/************************************************************************/
+
+void OGRSidecarLayerSpatialIndex::LoadTrees( OGRSidecarIndexFile& oFile )
+
+{
+    if( oFile.GetFile() == nullptr )
+        return;
+
+    OGRFeatureDefn *poDefn = poLayer->GetLayerDefn();
+    for( const auto& oEntry : oFile.GetEntries() )
+    {
+        if( oEntry.osLayerName != poDefn->GetName() ||
+            oEntry.nKeyType != OSKT_SPATIAL )
+            continue;
+        const int iGeomField = poDefn->GetGeomFieldIndex(oEntry.osFieldName);
+        if( iGeomField < 0 )
+        {
+            CPLDebug("OGR", "Ignoring spatial index of %s.%s in %s: "
+                     "layer structure has changed.",
+                     oEntry.osLayerName.c_str(), oEntry.osFieldName.c_str(),
+                     oFile.GetFilename());
+            continue;
+        }
+
+        std::unique_ptr<OGRSidecarRTree> poTree(
+            new OGRSidecarRTree(iGeomField, &oFile));
+        if( !poTree->Load(oEntry) )
+        {
+            CPLError(CE_Warning, CPLE_AppDefined,
+                     "Corrupted spatial index of %s.%s in %s, ignoring it.",
+                     oEntry.osLayerName.c_str(),
+                     oEntry.osFieldName.c_str(), oFile.GetFilename());
+            continue;
+        }
+        m_apoTrees.push_back(std::move(poTree));
+    }
+}
+
+/************************************************************************/
+/*                             IsUpToDate()                             */
+/*                                                                      */
+/*      Reload the trees if one of the files has been rewritten, and    */
+/*      return whether the indexes of oFile can be used.                */
+/************************************************************************/
+
+bool OGRSidecarLayerSpatialIndex::IsUpToDate( OGRSidecarIndexFile& oFile )
+
+{
+    if( m_oFile.HasChanged() ||
+        (m_bHasTempFile && m_oTempFile.HasChanged()) )
+        Load();
+    return oFile.IsSourceUpToDate();
+}
+
+/************************************************************************/
+/*                              GetTree()                               */
+/************************************************************************/
+
+OGRSidecarRTree *OGRSidecarLayerSpatialIndex::GetTree( int iGeomField )
+
+{
+    for( OGRSidecarIndexFile *poFile : { &m_oFile, &m_oTempFile } )
+    {
+        if( poFile == &m_oTempFile && !m_bHasTempFile )
+            continue;
+        if( !IsUpToDate(*poFile) )
+            continue;
+        for( const auto& poTree : m_apoTrees )
+        {
+            if( poTree->m_iGeomField == iGeomField &&
+                poTree->m_poFile == poFile )
+                return poTree.get();
+        }
+    }
+    return nullptr;
+}
+
+/************************************************************************/
+/*                              HasIndex()                              */
+/************************************************************************/
+
+bool OGRSidecarLayerSpatialIndex::HasIndex( int iGeomField )
+
+{
+    return GetTree(iGeomField) != nullptr;
+}
+
+/************************************************************************/
+/*                            CreateIndex()                             */
+/*                                                                      */
+/*      Build the index of a geometry field by scanning poSrcLayer,     */
+/*      and write it in the sidecar file.                               */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerSpatialIndex::CreateIndex( int iGeomField,
+                                                 OGRLayer *poSrcLayer )
+
+{
+    return BuildIndex(iGeomField, poSrcLayer, m_oFile);
+}
+
+/************************************************************************/
+/*                             BuildIndex()                             */
+/*                                                                      */
+/*      Build the index of a geometry field by scanning poSrcLayer,     */
+/*      and write it in oFile, which is either the sidecar file or      */
+/*      the temporary file of the indexes built on demand.              */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerSpatialIndex::BuildIndex( int iGeomField,
+                                                OGRLayer *poSrcLayer,
+                                                OGRSidecarIndexFile& oFile )
+
+{
+    OGRFeatureDefn *poDefn = poLayer->GetLayerDefn();
+    if( iGeomField < 0 || iGeomField >= poDefn->GetGeomFieldCount() )
+        return OGRERR_FAILURE;
+    const char *pszGeomFieldName =
+        poDefn->GetGeomFieldDefn(iGeomField)->GetNameRef();
+    const int iSrcGeomField =
+        poSrcLayer->GetLayerDefn()->GetGeomFieldIndex(pszGeomFieldName);
+    if( iSrcGeomField < 0 )
+        return OGRERR_FAILURE;
+
+/* -------------------------------------------------------------------- */
+/*      Scan the whole layer, without its current filters.             */
+/* -------------------------------------------------------------------- */
+    const CPLString osAttrQuery(poSrcLayer->GetAttrQueryString() ?
+                                poSrcLayer->GetAttrQueryString() : "");
+    const int iGeomFieldFilter = poSrcLayer->GetGeomFieldFilter();
+    OGRGeometry *poSpatialFilter = poSrcLayer->GetSpatialFilter();
+    std::unique_ptr<OGRGeometry> poSavedSpatialFilter(
+        poSpatialFilter ? poSpatialFilter->clone() : nullptr);
+    if( !osAttrQuery.empty() )
+        poSrcLayer->SetAttributeFilter(nullptr);
+    if( poSavedSpatialFilter )
+        poSrcLayer->SetSpatialFilter(iGeomFieldFilter, nullptr);
+
+    OGRErr eErr = OGRERR_NONE;
+    std::vector<OGRSidecarSpatialEntry> aoEntries;
+    poSrcLayer->ResetReading();
+    OGRFeature *poFeature = nullptr;
+    while( (poFeature = poSrcLayer->GetNextFeature()) != nullptr )
+    {
+        const GIntBig nFID = poFeature->GetFID();
+        if( nFID == OGRNullFID )
+        {
+            delete poFeature;
+            CPLError(CE_Failure, CPLE_NotSupported,
+                     "Layer %s does not have feature ids, "
+                     "cannot index it.", poDefn->GetName());
+            eErr = OGRERR_FAILURE;
+            break;
+        }
+
+        const OGRGeometry *poGeom = poFeature->GetGeomFieldRef(iSrcGeomField);
+        if( poGeom != nullptr && !poGeom->IsEmpty() )
+        {
+            OGRSidecarSpatialEntry oEntry;
+            poGeom->getEnvelope(&oEntry.first);
+            oEntry.second = nFID;
+            aoEntries.push_back(oEntry);
+        }
+        delete poFeature;
+    }
+    poSrcLayer->ResetReading();
+
+    if( !osAttrQuery.empty() )
+        poSrcLayer->SetAttributeFilter(osAttrQuery);
+    if( poSavedSpatialFilter )
+        poSrcLayer->SetSpatialFilter(iGeomFieldFilter,
+                                     poSavedSpatialFilter.get());
+
+    if( eErr != OGRERR_NONE )
+        return eErr;
+
+/* -------------------------------------------------------------------- */
+/*      Pack the tree, and write it with the other indexes of the       */
+/*      file, unless they are stale.                                    */
+/* -------------------------------------------------------------------- */
+    OGRSidecarDirEntry oEntry;
+    oEntry.osLayerName = poDefn->GetName();
+    oEntry.osFieldName = pszGeomFieldName;
+    oEntry.nKeyType = OSKT_SPATIAL;
+    oEntry.nEntryCount = aoEntries.size();
+
+    std::string osBlob;
+    OGRSidecarBuildRTree(aoEntries, osBlob);
+    std::vector<OGRSidecarSpatialEntry>().swap(aoEntries);
+    oEntry.nBlobSize = osBlob.size();
+
+    const std::vector<OGRSidecarDirEntry> aoNewEntries{oEntry};
+    std::vector<OGRSidecarDirEntry> aoKeptEntries;
+    if( IsUpToDate(oFile) )
+        aoKeptEntries = OGRSidecarGetKeptEntries(oFile.GetEntries(),
+                                                 aoNewEntries);
+
+    m_apoTrees.clear();
+    eErr = oFile.Rewrite(aoKeptEntries, aoNewEntries,
+                         std::vector<std::string>{osBlob});
+    Load();
+    return eErr;
+}
+
+/************************************************************************/
+/*                             DropIndex()                              */
+/************************************************************************/
+
+OGRErr OGRSidecarLayerSpatialIndex::DropIndex( int iGeomField )
+
+{
+    OGRFeatureDefn *poDefn = poLayer->GetLayerDefn();
+    if( iGeomField < 0 || iGeomField >= poDefn->GetGeomFieldCount() )
+        return OGRERR_FAILURE;
+
+    const char *pszGeomFieldName =
+        poDefn->GetGeomFieldDefn(iGeomField)->GetNameRef();
+    const bool bUpToDate = IsUpToDate(m_oFile);
+
+    std::vector<OGRSidecarDirEntry> aoKeptEntries;
+    bool bFound = false;
+    for( const auto& oEntry : m_oFile.GetEntries() )
+    {
+        if( oEntry.osLayerName == poDefn->GetName() &&
+            oEntry.osFieldName == pszGeomFieldName &&
+            oEntry.nKeyType == OSKT_SPATIAL )
+            bFound = true;
+        else
+            aoKeptEntries.push_back(oEntry);
+    }
+
+    if( !bFound )
+    {
+        CPLError( CE_Failure, CPLE_AppDefined,
+                  "DROP SPATIAL INDEX on layer (%s) that doesn't have "
+                  "a spatial index.", poDefn->GetName() );
+        return OGRERR_FAILURE;
+    }
+
+    // Indexes of a stale file are useless, and must not be stamped again.
+    OGRErr eErr;
+    m_apoTrees.clear();
+    if( aoKeptEntries.empty() || !bUpToDate )
+        eErr = m_oFile.Remove();
+    else
+        eErr = m_oFile.Rewrite(aoKeptEntries,
+                               std::vector<OGRSidecarDirEntry>(),
+                               std::vector<std::string>());
+    Load();
+    return eErr;
+}
+
+/************************************************************************/
+/*                           BuildOnDemand()                            */
+/*                                                                      */
+/*      Build the index of a geometry field from another opening of     */
+/*      the dataset, since the layer itself is being read.  This is     */
+/*      tried once per field, and failures are silent, since the        */
+/*      caller just falls back to a sequential scan.  The index is      */
+/*      only written in the sidecar file with AUTO_WRITE.               */
+/************************************************************************/
+
+void OGRSidecarLayerSpatialIndex::BuildOnDemand( int iGeomField )
+
+{
+    if( !m_bBuildOnDemand ||
+        m_oSetBuildAttempted.find(iGeomField) != m_oSetBuildAttempted.end() )
+        return;
+    m_oSetBuildAttempted.insert(iGeomField);
+
+    OGRSidecarIndexFile& oFile = m_bHasTempFile ? m_oTempFile : m_oFile;
+    CPLDebug("OGR", "Building spatial index of layer %s in %s.",
+             poLayer->GetName(), oFile.GetFilename());
+
+    CPLPushErrorHandler(CPLQuietErrorHandler);
+    const char* const apszAllowedDrivers[] = { m_osDriverName.c_str(),
+                                               nullptr };
+    GDALDataset *poDS = GDALDataset::Open(
+        m_osDatasetName,
+        GDAL_OF_VECTOR | GDAL_OF_READONLY | GDAL_OF_INTERNAL,
+        m_osDriverName.empty() ? nullptr : apszAllowedDrivers,
+        m_aosOpenOptions.List(), nullptr);
+    OGRErr eErr = OGRERR_FAILURE;
+    if( poDS != nullptr )
+    {
+        OGRLayer *poSrcLayer = poDS->GetLayerByName(poLayer->GetName());
+        if( poSrcLayer != nullptr )
+            eErr = BuildIndex(iGeomField, poSrcLayer, oFile);
+        GDALClose(poDS);
+    }
+    CPLPopErrorHandler();
+
+    if( eErr != OGRERR_NONE )
+        CPLDebug("OGR", "Building spatial index of layer %s failed.",
+                 poLayer->GetName());
+}
+
+/************************************************************************/
+/*                             GetMatches()                             */
+/************************************************************************/
+
+GIntBig *OGRSidecarLayerSpatialIndex::GetMatches( int iGeomField,
+                                                  const OGREnvelope& sEnvelope,
+                                                  int *pnFIDCount )
+
+{
+    OGRSidecarRTree *poTree = GetTree(iGeomField);
+    if( poTree == nullptr )
+    {
+        BuildOnDemand(iGeomField);
+        poTree = GetTree(iGeomField);
+        if( poTree == nullptr )
+            return nullptr;
+    }
+    return poTree->GetMatches(sEnvelope, pnFIDCount);
+}
+
+/************************************************************************/
+/*                     OGRCreateSidecarLayerIndex()                     */
+/************************************************************************/
+
+OGRLayerAttrIndex *OGRCreateSidecarLayerIndex()
+
+{
+    return new OGRSidecarLayerAttrIndex();
+}
+
+/************************************************************************/
+/*                 OGRCreateSidecarLayerSpatialIndex()                  */
+/************************************************************************/
+
+OGRLayerSpatialIndex *OGRCreateSidecarLayerSpatialIndex()
+
+{
+    return new OGRSidecarLayerSpatialIndex();
+}
+
+/************************************************************************/
+/*                  OGRInitializeSidecarAttrIndexes()                   */
+/*                                                                      */
+/*      Attach the indexes of the sidecar file of a dataset, if there   */
+/*      is one, to the layers it references.  This is done for          */
+/*      datasets opened in read-only mode only, since changes made      */
+/*      through a dataset opened in update mode may not be flushed to   */
+/*      the file yet, which would defeat the staleness detection.       */
+/*                                                                      */
+/*      With OGR_SIDECAR_SPATIAL_INDEX=AUTO or AUTO_WRITE, all layers   */
+/*      get a spatial index object, that builds the index of a          */
+/*      geometry field on the first scan with a spatial filter.         */
+/************************************************************************/
+
+void OGRInitializeSidecarAttrIndexes( GDALDataset *poDS )
+
+{
+    if( poDS->GetAccess() != GA_ReadOnly )
+        return;
+
+    const bool bAttrIndex =
+        CPLTestBool(CPLGetConfigOption("OGR_SIDECAR_ATTR_INDEX", "YES"));
+    const char *pszSpatialIndex =
+        CPLGetConfigOption("OGR_SIDECAR_SPATIAL_INDEX", "YES");
+    const bool bSpatialIndexOnDemand = EQUAL(pszSpatialIndex, "AUTO") ||
+                                       EQUAL(pszSpatialIndex, "AUTO_WRITE");
+    const bool bSpatialIndex =
+        bSpatialIndexOnDemand || CPLTestBool(pszSpatialIndex);
+    if( !bAttrIndex && !bSpatialIndex )
+        return;
+
+    const CPLString osIndexFilename(
+        OGRGetSidecarAttrIndexFilename(poDS->GetDescription()));
+    if( osIndexFilename.empty() )
+        return;
+
+    if( bSpatialIndexOnDemand )
+    {
+        for( int i = 0; i < poDS->GetLayerCount(); i++ )
+        {
+            OGRLayer *poLayer = poDS->GetLayer(i);
+            if( poLayer != nullptr &&
+                poLayer->GetLayerDefn()->GetGeomFieldCount() > 0 )
+                poLayer->InitializeSidecarSpatialIndexSupport(poDS);
+        }
+    }
+
+    VSIStatBufL sStat;
+    if( VSIStatExL(osIndexFilename, &sStat, VSI_STAT_EXISTS_FLAG) != 0 )
+        return;
+
+    VSILFILE *fp = VSIFOpenL(osIndexFilename, "rb");
+    if( fp == nullptr )
+        return;
+    GUIntBig nSourceSize = 0;
+    GIntBig nSourceMTime = 0;
+    std::vector<OGRSidecarDirEntry> aoEntries;
+    const bool bOK =
+        OGRSidecarReadHeader(fp, nSourceSize, nSourceMTime, aoEntries);
+    VSIFCloseL(fp);
+    if( !bOK )
+        return;
+
+    std::set<CPLString> oSetAttrLayerNames;
+    std::set<CPLString> oSetSpatialLayerNames;
+    for( const auto& oEntry : aoEntries )
+    {
+        if( oEntry.nKeyType == OSKT_SPATIAL )
+            oSetSpatialLayerNames.insert(oEntry.osLayerName);
+        else
+            oSetAttrLayerNames.insert(oEntry.osLayerName);
+    }
+
+    for( const auto& osLayerName : oSetAttrLayerNames )
+    {
+        if( !bAttrIndex )
+            break;
+        OGRLayer *poLayer = poDS->GetLayerByName(osLayerName);
+        if( poLayer != nullptr && poLayer->GetIndex() == nullptr )
+            poLayer->InitializeSidecarIndexSupport(poDS->GetDescription());
+    }
+
+    for( const auto& osLayerName : oSetSpatialLayerNames )
+    {
+        if( !bSpatialIndex )
+            break;
+        OGRLayer *poLayer = poDS->GetLayerByName(osLayerName);
+        if( poLayer != nullptr )
+            poLayer->InitializeSidecarSpatialIndexSupport(poDS);
+    }
+}
+
+//! @endcond
@@ -34,11 +34,14 @@
 #include "swq.h"
 #include "ograpispy.h"
 
+#include <algorithm>
+
 CPL_CVSID("$Id$")
 
 struct OGRLayer::Private
 {
     bool         m_bInFeatureIterator = false;
+    std::unique_ptr<OGRLayerSpatialIndex> m_poSpatialIndex{};
 };
 
 /************************************************************************/
@@ -1511,6 +1514,112 @@ OGRErr OGRLayer::InitializeIndexSupport( const char *pszFilename )
 
     return eErr;
 }
+
+/************************************************************************/
+/*                   InitializeSidecarIndexSupport()                    */
+/*                                                                      */
+/*      Same as InitializeIndexSupport(), but with the driver           */
+/*      independent index stored next to the dataset file.  Used by     */
+/*      GDALDataset for layers that do not manage an index by           */
+/*      themselves.                                                     */
+/************************************************************************/
+
+OGRErr OGRLayer::InitializeSidecarIndexSupport( const char *pszDatasetName )
+
+{
+    if (m_poAttrIndex != nullptr)
+        return OGRERR_NONE;
+
+    m_poAttrIndex = OGRCreateSidecarLayerIndex();
+
+    const OGRErr eErr = m_poAttrIndex->Initialize( pszDatasetName, this );
+    if( eErr != OGRERR_NONE )
+    {
+        delete m_poAttrIndex;
+        m_poAttrIndex = nullptr;
+    }
+
+    return eErr;
+}
+
+/************************************************************************/
+/*                InitializeSidecarSpatialIndexSupport()                */
+/*                                                                      */
+/*      Attach the driver independent spatial index stored next to      */
+/*      the dataset file.  Only used by drivers that call               */
+/*      EvaluateFiltersAgainstIndices().                                */
+/************************************************************************/
+
+OGRErr OGRLayer::InitializeSidecarSpatialIndexSupport( GDALDataset *poDS )
+
+{
+    if( m_poPrivate->m_poSpatialIndex )
+        return OGRERR_NONE;
+
+    std::unique_ptr<OGRLayerSpatialIndex> poSpatialIndex(
+        OGRCreateSidecarLayerSpatialIndex());
+    const OGRErr eErr = poSpatialIndex->Initialize( poDS, this );
+    if( eErr == OGRERR_NONE )
+        m_poPrivate->m_poSpatialIndex = std::move(poSpatialIndex);
+
+    return eErr;
+}
+
+/************************************************************************/
+/*                       GetSidecarSpatialIndex()                       */
+/************************************************************************/
+
+OGRLayerSpatialIndex *OGRLayer::GetSidecarSpatialIndex()
+
+{
+    return m_poPrivate->m_poSpatialIndex.get();
+}
+
+/************************************************************************/
+/*                   EvaluateFiltersAgainstIndices()                    */
+/*                                                                      */
+/*      Return the sorted OGRNullFID terminated list of the FIDs of     */
+/*      the features that may match the attribute and spatial          */
+/*      filters, as far as the attribute and sidecar spatial indexes    */
+/*      can tell, or NULL if no index applies.  The features of the     */
+/*      list must still be checked against the filters.                 */
+/************************************************************************/
+
+GIntBig *OGRLayer::EvaluateFiltersAgainstIndices()
+
+{
+    GIntBig *panAttrFIDs = nullptr;
+    if( m_poAttrQuery != nullptr && m_poAttrIndex != nullptr )
+        panAttrFIDs = m_poAttrQuery->EvaluateAgainstIndices(this, nullptr);
+
+    GIntBig *panGeomFIDs = nullptr;
+    int nGeomFIDCount = 0;
+    if( m_poFilterGeom != nullptr && m_poPrivate->m_poSpatialIndex )
+    {
+        panGeomFIDs = m_poPrivate->m_poSpatialIndex->GetMatches(
+            m_iGeomFieldFilter, m_sFilterEnvelope, &nGeomFIDCount);
+    }
+
+    if( panGeomFIDs == nullptr )
+        return panAttrFIDs;
+    if( panAttrFIDs == nullptr )
+        return panGeomFIDs;
+
+    int nAttrFIDCount = 0;
+    while( panAttrFIDs[nAttrFIDCount] != OGRNullFID )
+        nAttrFIDCount++;
+    std::sort(panAttrFIDs, panAttrFIDs + nAttrFIDCount);
+    GIntBig *panFIDs = static_cast<GIntBig *>(
+        CPLMalloc(sizeof(GIntBig) *
+                  (std::min(nAttrFIDCount, nGeomFIDCount) + 1)));
+    GIntBig *panEnd = std::set_intersection(
+        panAttrFIDs, panAttrFIDs + nAttrFIDCount,
+        panGeomFIDs, panGeomFIDs + nGeomFIDCount, panFIDs);
+    *panEnd = OGRNullFID;
+    CPLFree(panAttrFIDs);
+    CPLFree(panGeomFIDs);
+    return panFIDs;
+}
 //! @endcond
 
 /************************************************************************/
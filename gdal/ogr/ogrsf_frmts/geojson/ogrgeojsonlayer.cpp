@@ -133,6 +133,7 @@ void OGRGeoJSONLayer::ResetReading()
         TerminateAppendSession();
         nNextFID_ = 0;
         poReader_->ResetReading();
+        ResetMatchingFIDs();
     }
     else
         OGRMemLayer::ResetReading();
@@ -150,6 +151,8 @@ OGRFeature* OGRGeoJSONLayer::GetNextFeature()
         {
             ResetReading();
         }
+        if( UseIndices() )
+            return GetNextMatchingFeature();
         while ( true )
         {
             OGRFeature* poFeature = poReader_->GetNextFeature(this);
@@ -39,8 +39,12 @@
 #endif
 
 #include "cpl_json_streaming_parser.h"
+#include "cpl_worker_thread_pool.h"
 #include <ogr_api.h>
 
+#include <algorithm>
+#include <atomic>
+
 CPL_CVSID("$Id$")
 
 static
@@ -1061,6 +1065,7 @@ void OGRGeoJSONReader::ResetReading()
     CPLAssert( fp_ );
     delete poStreamingParser_;
     poStreamingParser_ = nullptr;
+    poSplitter_.reset();
 }
 
 /************************************************************************/
@@ -1070,6 +1075,28 @@ void OGRGeoJSONReader::ResetReading()
 OGRFeature* OGRGeoJSONReader::GetNextFeature(OGRGeoJSONLayer* poLayer)
 {
     CPLAssert( fp_ );
+    if( poStreamingParser_ == nullptr && poSplitter_ == nullptr )
+    {
+        const int nThreads =
+            OGRGeoJSONParallelTranslator::GetThreadCountFromConfig();
+        if( nThreads > 1 && poTranslator_ == nullptr )
+        {
+            poTranslator_.reset(
+                new OGRGeoJSONParallelTranslator(*this, poLayer, false));
+            if( !poTranslator_->Setup(nThreads) )
+                poTranslator_.reset();
+        }
+        if( nThreads > 1 && poTranslator_ != nullptr )
+        {
+            poSplitter_.reset(new OGRGeoJSONFeatureSplitter());
+            poTranslator_->Reset();
+            VSIFSeekL(fp_, 0, SEEK_SET);
+            bParallelReadFinished_ = false;
+        }
+    }
+    if( poSplitter_ != nullptr )
+        return GetNextFeatureParallel(poLayer);
+
     if( poStreamingParser_ == nullptr )
     {
         poStreamingParser_ = new OGRGeoJSONReaderStreamingParser(
@@ -1114,6 +1141,37 @@ OGRFeature* OGRGeoJSONReader::GetNextFeature(OGRGeoJSONLayer* poLayer)
     return nullptr;
 }
 
+/************************************************************************/
+/*                       GetNextFeatureParallel()                       */
+/************************************************************************/
+
+OGRFeature* OGRGeoJSONReader::GetNextFeatureParallel(OGRGeoJSONLayer*)
+{
+    while( true )
+    {
+        OGRFeature* poFeat = poTranslator_->GetNextFeature();
+        if( poFeat )
+            return poFeat;
+
+        // Split the next chunk of the file into feature records, and
+        // translate them once enough of them have been collected.
+        while( !bParallelReadFinished_ && !poTranslator_->IsBatchFull() )
+        {
+            const size_t nRead = VSIFReadL(pabyBuffer_, 1, nBufferSize_, fp_);
+            if( nRead < nBufferSize_ )
+                bParallelReadFinished_ = true;
+            if( !poSplitter_->Parse(
+                            reinterpret_cast<const char*>(pabyBuffer_),
+                            nRead, *poTranslator_) )
+            {
+                bParallelReadFinished_ = true;
+            }
+        }
+        if( !poTranslator_->TranslateBatch() )
+            return nullptr;
+    }
+}
+
 /************************************************************************/
 /*                             GetFeature()                             */
 /************************************************************************/
@@ -1128,6 +1186,7 @@ OGRFeature* OGRGeoJSONReader::GetFeature(OGRGeoJSONLayer* poLayer, GIntBig nFID)
 
         delete poStreamingParser_;
         poStreamingParser_ = nullptr;
+        poSplitter_.reset();
 
         OGRGeoJSONReaderStreamingParser oParser(*this, poLayer, false, bStoreNativeData_);
         VSIFSeekL(fp_, 0, SEEK_SET);
@@ -1231,6 +1290,334 @@ OGRFeature* OGRGeoJSONReader::GetFeature(OGRGeoJSONLayer* poLayer, GIntBig nFID)
     return poFeat;
 }
 
+/************************************************************************/
+/*                    OGRGeoJSONParallelTranslator()                    */
+/************************************************************************/
+
+OGRGeoJSONParallelTranslator::OGRGeoJSONParallelTranslator(
+                                            OGRGeoJSONBaseReader& oReader,
+                                            OGRLayer* poLayer,
+                                            bool bAcceptGeometries ) :
+    m_oReader(oReader),
+    m_poLayer(poLayer),
+    m_bAcceptGeometries(bAcceptGeometries)
+{}
+
+/************************************************************************/
+/*                   ~OGRGeoJSONParallelTranslator()                    */
+/************************************************************************/
+
+OGRGeoJSONParallelTranslator::~OGRGeoJSONParallelTranslator()
+{
+    ClearFeatures();
+}
+
+/************************************************************************/
+/*                      GetThreadCountFromConfig()                      */
+/************************************************************************/
+
+int OGRGeoJSONParallelTranslator::GetThreadCountFromConfig()
+{
+    const char* pszNumThreads =
+        CPLGetConfigOption("OGR_GEOJSON_NUM_THREADS", "1");
+    int nThreads;
+    if( EQUAL(pszNumThreads, "ALL_CPUS") )
+        nThreads = CPLGetNumCPUs();
+    else
+        nThreads = atoi(pszNumThreads);
+    return std::max(1, std::min(nThreads, 2 * CPLGetNumCPUs()));
+}
+
+/************************************************************************/
+/*                               Setup()                                */
+/************************************************************************/
+
+bool OGRGeoJSONParallelTranslator::Setup( int nThreads )
+{
+    m_poPool.reset();
+    m_nThreads = std::max(1, nThreads);
+    if( m_nThreads > 1 )
+    {
+        m_poPool.reset(new CPLWorkerThreadPool());
+        if( !m_poPool->Setup(m_nThreads, nullptr, nullptr) )
+        {
+            m_poPool.reset();
+            m_nThreads = 1;
+            return false;
+        }
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                                Reset()                               */
+/************************************************************************/
+
+void OGRGeoJSONParallelTranslator::Reset()
+{
+    ClearFeatures();
+    m_osBatch.clear();
+    m_anRecordOffsets.clear();
+}
+
+/************************************************************************/
+/*                           ClearFeatures()                            */
+/************************************************************************/
+
+void OGRGeoJSONParallelTranslator::ClearFeatures()
+{
+    for( size_t i = m_nNextFeature; i < m_apoFeatures.size(); i++ )
+        delete m_apoFeatures[i];
+    m_apoFeatures.clear();
+    m_nNextFeature = 0;
+}
+
+/************************************************************************/
+/*                              AddRecord()                             */
+/************************************************************************/
+
+void OGRGeoJSONParallelTranslator::AddRecord( const char* pszText,
+                                              size_t nLen )
+{
+    m_anRecordOffsets.push_back(m_osBatch.size());
+    m_osBatch.append(pszText, nLen);
+    m_osBatch += '\0';
+}
+
+/************************************************************************/
+/*                             IsBatchFull()                            */
+/************************************************************************/
+
+bool OGRGeoJSONParallelTranslator::IsBatchFull() const
+{
+    constexpr size_t BATCH_BYTES_PER_THREAD = 1024 * 1024;
+    constexpr size_t BATCH_RECORDS_PER_THREAD = 4096;
+    const size_t nThreads = static_cast<size_t>(m_nThreads);
+    return m_osBatch.size() >= nThreads * BATCH_BYTES_PER_THREAD ||
+           m_anRecordOffsets.size() >= nThreads * BATCH_RECORDS_PER_THREAD;
+}
+
+/************************************************************************/
+/*                          JobErrorHandler()                           */
+/************************************************************************/
+
+void OGRGeoJSONParallelTranslator::JobErrorHandler( CPLErr eErr,
+                                                    CPLErrorNum nErrorNum,
+                                                    const char* pszMsg )
+{
+    Job* psJob = static_cast<Job*>(CPLGetErrorHandlerUserData());
+    JobError oError;
+    oError.eErr = eErr;
+    oError.nErrorNum = nErrorNum;
+    oError.osMsg = pszMsg;
+    psJob->aoErrors.push_back(oError);
+}
+
+/************************************************************************/
+/*                            TranslateJob()                            */
+/************************************************************************/
+
+void OGRGeoJSONParallelTranslator::TranslateJob( void* pData )
+{
+    Job* psJob = static_cast<Job*>(pData);
+    OGRGeoJSONParallelTranslator* poThis = psJob->poTranslator;
+    // Error handlers are per thread: collect the errors, so that they reach
+    // the handlers installed by the caller.
+    CPLPushErrorHandlerEx(JobErrorHandler, psJob);
+    CPLSetCurrentErrorHandlerCatchDebug(false);
+    for( size_t i = psJob->nFirstRecord; i < psJob->nLastRecord; i++ )
+    {
+        const char* pszText =
+            poThis->m_osBatch.c_str() + poThis->m_anRecordOffsets[i];
+        json_object* poObj = nullptr;
+        CPL_IGNORE_RET_VAL(OGRJSonParse(pszText, &poObj));
+        if( json_object_get_type(poObj) == json_type_object )
+        {
+            poThis->m_apoFeatures[i] = poThis->m_bAcceptGeometries ?
+                poThis->m_oReader.ReadFeatureOrGeometry(poThis->m_poLayer,
+                                                        poObj, pszText) :
+                poThis->m_oReader.ReadFeature(poThis->m_poLayer,
+                                              poObj, pszText);
+        }
+        json_object_put(poObj);
+    }
+    CPLPopErrorHandler();
+}
+
+/************************************************************************/
+/*                           TranslateBatch()                           */
+/************************************************************************/
+
+bool OGRGeoJSONParallelTranslator::TranslateBatch()
+{
+    ClearFeatures();
+    const size_t nRecords = m_anRecordOffsets.size();
+    if( nRecords == 0 )
+        return false;
+    m_apoFeatures.resize(nRecords, nullptr);
+
+    // Use several jobs per thread so that a few large records do not
+    // leave the other threads idle.
+    const size_t nJobs =
+        std::min(nRecords, static_cast<size_t>(m_nThreads) * 4);
+    std::vector<Job> asJobs(nJobs);
+    std::vector<void*> apData;
+    for( size_t i = 0; i < nJobs; i++ )
+    {
+        asJobs[i].poTranslator = this;
+        asJobs[i].nFirstRecord = i * nRecords / nJobs;
+        asJobs[i].nLastRecord = (i + 1) * nRecords / nJobs;
+        apData.push_back(&asJobs[i]);
+    }
+    if( m_poPool )
+    {
+        m_poPool->SubmitJobs(TranslateJob, apData);
+        m_poPool->WaitCompletion();
+    }
+    else
+    {
+        for( void* pData: apData )
+            TranslateJob(pData);
+    }
+
+    for( const auto& oJob: asJobs )
+    {
+        for( const auto& oError: oJob.aoErrors )
+        {
+            CPLError(oError.eErr, oError.nErrorNum, "%s",
+                     oError.osMsg.c_str());
+        }
+    }
+
+    m_osBatch.clear();
+    m_anRecordOffsets.clear();
+    return true;
+}
+
+/************************************************************************/
+/*                           GetNextFeature()                           */
+/************************************************************************/
+
+OGRFeature* OGRGeoJSONParallelTranslator::GetNextFeature()
+{
+    while( m_nNextFeature < m_apoFeatures.size() )
+    {
+        OGRFeature* poFeat = m_apoFeatures[m_nNextFeature];
+        m_apoFeatures[m_nNextFeature] = nullptr;
+        m_nNextFeature ++;
+        if( poFeat )
+            return poFeat;
+    }
+    return nullptr;
+}
+
+/************************************************************************/
+/*                    OGRGeoJSONFeatureSplitter::Parse()                */
+/************************************************************************/
+
+bool OGRGeoJSONFeatureSplitter::Parse( const char* pszData, size_t nLen,
+                                       OGRGeoJSONParallelTranslator& oTranslator )
+{
+    // Offset in pszData where the current feature starts, or nLen if we are
+    // not in a feature.
+    size_t nFeatureStart = (m_bInFeaturesArray && m_nDepth > 2) ? 0 : nLen;
+
+    for( size_t i = 0; i < nLen; i++ )
+    {
+        const char ch = pszData[i];
+        if( m_bInString )
+        {
+            if( m_bEscape )
+                m_bEscape = false;
+            else if( ch == '\\' )
+                m_bEscape = true;
+            else if( ch == '"' )
+                m_bInString = false;
+            else if( m_bInKey && m_osKey.size() < 16 )
+                m_osKey += ch;
+            continue;
+        }
+
+        switch( ch )
+        {
+            case '"':
+                m_bInString = true;
+                m_bInKey = m_nDepth == 1;
+                if( m_bInKey )
+                    m_osKey.clear();
+                break;
+
+            case ':':
+                if( m_nDepth == 1 )
+                    m_bAfterFeaturesKey = m_osKey == "features";
+                break;
+
+            case ',':
+                if( m_nDepth == 1 )
+                    m_bAfterFeaturesKey = false;
+                break;
+
+            case '{':
+            case '[':
+                if( m_nDepth == 1 )
+                {
+                    if( ch == '[' && m_bAfterFeaturesKey )
+                        m_bInFeaturesArray = true;
+                    m_bAfterFeaturesKey = false;
+                }
+                else if( m_nDepth == 2 && m_bInFeaturesArray && ch == '{' )
+                {
+                    nFeatureStart = i;
+                }
+                m_nDepth ++;
+                break;
+
+            case '}':
+            case ']':
+                if( m_nDepth == 0 )
+                    break;
+                m_nDepth --;
+                if( m_nDepth == 2 && m_bInFeaturesArray && ch == '}' )
+                {
+                    if( m_osFeature.empty() )
+                    {
+                        oTranslator.AddRecord(pszData + nFeatureStart,
+                                              i + 1 - nFeatureStart);
+                    }
+                    else
+                    {
+                        m_osFeature.append(pszData + nFeatureStart,
+                                           i + 1 - nFeatureStart);
+                        oTranslator.AddRecord(m_osFeature.data(),
+                                              m_osFeature.size());
+                        m_osFeature.clear();
+                    }
+                    nFeatureStart = nLen;
+                }
+                else if( m_nDepth == 1 )
+                {
+                    m_bInFeaturesArray = false;
+                }
+                break;
+
+            default:
+                break;
+        }
+    }
+
+    if( nFeatureStart < nLen )
+    {
+        m_osFeature.append(pszData + nFeatureStart, nLen - nFeatureStart);
+        if( m_osFeature.size() > MAX_OBJECT_SIZE )
+        {
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "GeoJSON object too complex");
+            return false;
+        }
+    }
+    return true;
+}
+
 /************************************************************************/
 /*                           IngestAll()                                */
 /************************************************************************/
@@ -2590,10 +2977,10 @@ OGRFeature* OGRGeoJSONBaseReader::ReadFeature( OGRLayer* poLayer,
     }
     else
     {
-        static bool bWarned = false;
-        if( !bWarned )
+        // Features may be translated by several threads.
+        static std::atomic<bool> bWarned(false);
+        if( !bWarned.exchange(true) )
         {
-            bWarned = true;
             CPLDebug(
                 "GeoJSON",
                 "Non conformant Feature object. Missing \'geometry\' member.");
@@ -2603,6 +2990,33 @@ OGRFeature* OGRGeoJSONBaseReader::ReadFeature( OGRLayer* poLayer,
     return poFeature;
 }
 
+/************************************************************************/
+/*                        ReadFeatureOrGeometry()                       */
+/************************************************************************/
+
+OGRFeature* OGRGeoJSONBaseReader::ReadFeatureOrGeometry(
+                                            OGRLayer* poLayer,
+                                            json_object* poObj,
+                                            const char* pszSerializedObj )
+{
+    const auto eType = OGRGeoJSONGetType(poObj);
+    if( eType == GeoJSONObject::eFeature )
+        return ReadFeature(poLayer, poObj, pszSerializedObj);
+    if( eType == GeoJSONObject::eFeatureCollection ||
+        eType == GeoJSONObject::eUnknown )
+    {
+        return nullptr;
+    }
+
+    // Bare geometry, as found in GeoJSON text sequences.
+    OGRGeometry* poGeom = ReadGeometry(poObj, poLayer->GetSpatialRef());
+    if( poGeom == nullptr )
+        return nullptr;
+    OGRFeature* poFeature = new OGRFeature(poLayer->GetLayerDefn());
+    poFeature->SetGeometryDirectly(poGeom);
+    return poFeature;
+}
+
 /************************************************************************/
 /*                           ReadFeatureCollection()                    */
 /************************************************************************/
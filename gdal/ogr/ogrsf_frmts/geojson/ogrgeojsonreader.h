@@ -37,8 +37,10 @@
 
 #include "ogrgeojsonutils.h"
 
+#include <memory>
 #include <utility>
 #include <set>
+#include <vector>
 
 /************************************************************************/
 /*                         FORWARD DECLARATIONS                         */
@@ -56,6 +58,7 @@ class OGRMultiPolygon;
 class OGRGeometryCollection;
 class OGRFeature;
 class OGRGeoJSONLayer;
+class CPLWorkerThreadPool;
 class OGRSpatialReference;
 
 /************************************************************************/
@@ -106,6 +109,8 @@ class OGRGeoJSONBaseReader
     OGRGeometry* ReadGeometry( json_object* poObj, OGRSpatialReference* poLayerSRS );
     OGRFeature* ReadFeature( OGRLayer* poLayer, json_object* poObj,
                              const char* pszSerializedObj );
+    OGRFeature* ReadFeatureOrGeometry( OGRLayer* poLayer, json_object* poObj,
+                                       const char* pszSerializedObj );
   protected:
     bool bGeometryPreserve_ = true;
     bool bAttributesSkip_ = false;
@@ -136,6 +141,97 @@ class OGRGeoJSONBaseReader
     CPL_DISALLOW_COPY_ASSIGN(OGRGeoJSONBaseReader)
 };
 
+/************************************************************************/
+/*                    OGRGeoJSONParallelTranslator                      */
+/************************************************************************/
+
+/* Translates batches of serialized GeoJSON objects to OGRFeature in a  */
+/* pool of worker threads. Features are returned in the order in which  */
+/* their records were added.                                            */
+
+class OGRGeoJSONParallelTranslator
+{
+  public:
+    OGRGeoJSONParallelTranslator( OGRGeoJSONBaseReader& oReader,
+                                  OGRLayer* poLayer,
+                                  bool bAcceptGeometries );
+    ~OGRGeoJSONParallelTranslator();
+
+    static int GetThreadCountFromConfig();
+
+    bool Setup( int nThreads );
+    void Reset();
+
+    void AddRecord( const char* pszText, size_t nLen );
+    bool IsBatchFull() const;
+    bool IsBatchEmpty() const { return m_anRecordOffsets.empty(); }
+    bool TranslateBatch();
+
+    OGRFeature* GetNextFeature();
+
+  private:
+    struct JobError
+    {
+        CPLErr eErr = CE_None;
+        CPLErrorNum nErrorNum = CPLE_None;
+        std::string osMsg{};
+    };
+
+    struct Job
+    {
+        OGRGeoJSONParallelTranslator* poTranslator = nullptr;
+        size_t nFirstRecord = 0;
+        size_t nLastRecord = 0;
+        // Emitted by the calling thread once the job is completed.
+        std::vector<JobError> aoErrors{};
+    };
+
+    OGRGeoJSONBaseReader& m_oReader;
+    OGRLayer* m_poLayer = nullptr;
+    bool m_bAcceptGeometries = false;
+    std::unique_ptr<CPLWorkerThreadPool> m_poPool{};
+    int m_nThreads = 1;
+
+    // Records are stored back to back, nul terminated, in m_osBatch.
+    std::string m_osBatch{};
+    std::vector<size_t> m_anRecordOffsets{};
+    std::vector<OGRFeature*> m_apoFeatures{};
+    size_t m_nNextFeature = 0;
+
+    void ClearFeatures();
+    static void TranslateJob( void* pData );
+    static void CPL_STDCALL JobErrorHandler( CPLErr eErr, CPLErrorNum nErrorNum,
+                                             const char* pszMsg );
+
+    CPL_DISALLOW_COPY_ASSIGN(OGRGeoJSONParallelTranslator)
+};
+
+/************************************************************************/
+/*                     OGRGeoJSONFeatureSplitter                        */
+/************************************************************************/
+
+/* Locates the members of the "features" array of a FeatureCollection   */
+/* in a byte stream, without building any JSON object.                 */
+
+class OGRGeoJSONFeatureSplitter
+{
+  public:
+    OGRGeoJSONFeatureSplitter() = default;
+
+    bool Parse( const char* pszData, size_t nLen,
+                OGRGeoJSONParallelTranslator& oTranslator );
+
+  private:
+    int m_nDepth = 0;
+    bool m_bInString = false;
+    bool m_bEscape = false;
+    bool m_bInKey = false;
+    bool m_bAfterFeaturesKey = false;
+    bool m_bInFeaturesArray = false;
+    std::string m_osKey{};
+    std::string m_osFeature{};
+};
+
 /************************************************************************/
 /*                           OGRGeoJSONReader                           */
 /************************************************************************/
@@ -186,6 +282,12 @@ class OGRGeoJSONReader: public OGRGeoJSONBaseReader
     GUIntBig nTotalOGRFeatureMemEstimate_;
 
     std::map<GIntBig, std::pair<vsi_l_offset, vsi_l_offset>> oMapFIDToOffsetSize_;
+
+    std::unique_ptr<OGRGeoJSONParallelTranslator> poTranslator_{};
+    std::unique_ptr<OGRGeoJSONFeatureSplitter> poSplitter_{};
+    bool bParallelReadFinished_ = false;
+
+    OGRFeature* GetNextFeatureParallel(OGRGeoJSONLayer* poLayer);
     //
     // Copy operations not supported.
     //
@@ -95,8 +95,13 @@ class OGRGeoJSONSeqLayer final: public OGRLayer
         GIntBig m_nTotalFeatures = 0;
         GIntBig m_nNextFID = 0;
 
+        std::unique_ptr<OGRGeoJSONParallelTranslator> m_poTranslator{};
+        bool m_bParallelReadFinished = false;
+
         void Init();
+        bool GetNextRecord();
         json_object* GetNextObject();
+        OGRFeature* GetNextTranslatedFeature();
 
     public:
         OGRGeoJSONSeqLayer(OGRGeoJSONSeqDataSource* poDS,
@@ -305,11 +310,11 @@ void OGRGeoJSONSeqLayer::Init()
         m_nTotalFeatures ++;
     }
 
-    ResetReading();
-
     m_nFileSize = 0;
     m_nIter = 0;
     m_oReader.FinalizeLayerDefn( this, m_osFIDColumn );
+
+    ResetReading();
 }
 
 /************************************************************************/
@@ -327,13 +332,34 @@ void OGRGeoJSONSeqLayer::ResetReading()
     m_nPosInBuffer = nBufferSize;
     m_nBufferValidSize = nBufferSize;
     m_nNextFID = 0;
+
+    m_bParallelReadFinished = false;
+    const int nThreads =
+        OGRGeoJSONParallelTranslator::GetThreadCountFromConfig();
+    if( nThreads > 1 )
+    {
+        if( m_poTranslator == nullptr )
+        {
+            m_poTranslator.reset(
+                new OGRGeoJSONParallelTranslator(m_oReader, this, true));
+            if( !m_poTranslator->Setup(nThreads) )
+                m_poTranslator.reset();
+        }
+        if( m_poTranslator )
+            m_poTranslator->Reset();
+    }
+    else
+    {
+        m_poTranslator.reset();
+    }
 }
 
 /************************************************************************/
-/*                           GetNextObject()                            */
+/*                           GetNextRecord()                            */
 /************************************************************************/
 
-json_object* OGRGeoJSONSeqLayer::GetNextObject()
+// Collects the next non-empty record of the sequence in m_osFeatureBuffer.
+bool OGRGeoJSONSeqLayer::GetNextRecord()
 {
     m_osFeatureBuffer.clear();
     while( true )
@@ -343,7 +369,7 @@ json_object* OGRGeoJSONSeqLayer::GetNextObject()
         {
             if( m_nBufferValidSize < m_osBuffer.size() )
             {
-                return nullptr;
+                return false;
             }
             m_nBufferValidSize = VSIFReadL(&m_osBuffer[0], 1,
                                            m_osBuffer.size(), m_fp);
@@ -367,7 +393,7 @@ json_object* OGRGeoJSONSeqLayer::GetNextObject()
             }
             if( m_nPosInBuffer >= m_nBufferValidSize )
             {
-                return nullptr;
+                return false;
             }
         }
 
@@ -389,7 +415,7 @@ json_object* OGRGeoJSONSeqLayer::GetNextObject()
             {
                 CPLError(CE_Failure, CPLE_NotSupported,
                             "Too large feature");
-                return nullptr;
+                return false;
             }
             m_nPosInBuffer = m_nBufferValidSize;
             if( m_nBufferValidSize == m_osBuffer.size() )
@@ -400,56 +426,86 @@ json_object* OGRGeoJSONSeqLayer::GetNextObject()
 
         if( !m_osFeatureBuffer.empty() )
         {
-            json_object* poObject = nullptr;
-            CPL_IGNORE_RET_VAL(
-                OGRJSonParse(m_osFeatureBuffer.c_str(), &poObject));
-            m_osFeatureBuffer.clear();
-            if( json_object_get_type(poObject) == json_type_object )
-            {
-                return poObject;
-            }
-            json_object_put(poObject);
+            return true;
         }
     }
 }
 
 /************************************************************************/
-/*                           GetNextFeature()                           */
+/*                           GetNextObject()                            */
 /************************************************************************/
 
-OGRFeature* OGRGeoJSONSeqLayer::GetNextFeature()
+json_object* OGRGeoJSONSeqLayer::GetNextObject()
 {
-    while( true )
+    while( GetNextRecord() )
     {
-        auto poObject = GetNextObject();
-        if( !poObject )
-            return nullptr;
-        OGRFeature* poFeature;
-        auto type = OGRGeoJSONGetType(poObject);
-        if( type == GeoJSONObject::eFeature )
+        json_object* poObject = nullptr;
+        CPL_IGNORE_RET_VAL(
+            OGRJSonParse(m_osFeatureBuffer.c_str(), &poObject));
+        m_osFeatureBuffer.clear();
+        if( json_object_get_type(poObject) == json_type_object )
         {
-            poFeature = m_oReader.ReadFeature(
-                this, poObject, m_osFeatureBuffer.c_str() );
-            json_object_put(poObject);
+            return poObject;
         }
-        else if( type == GeoJSONObject::eFeatureCollection ||
-                 type == GeoJSONObject::eUnknown )
+        json_object_put(poObject);
+    }
+    return nullptr;
+}
+
+/************************************************************************/
+/*                      GetNextTranslatedFeature()                      */
+/************************************************************************/
+
+OGRFeature* OGRGeoJSONSeqLayer::GetNextTranslatedFeature()
+{
+    if( m_poTranslator == nullptr )
+    {
+        while( true )
         {
+            auto poObject = GetNextObject();
+            if( !poObject )
+                return nullptr;
+            OGRFeature* poFeature = m_oReader.ReadFeatureOrGeometry(
+                this, poObject, m_osFeatureBuffer.c_str() );
             json_object_put(poObject);
-            continue;
+            if( poFeature )
+                return poFeature;
         }
-        else
+    }
+
+    // Records are trivially delimited, so collect a batch of them and
+    // let the worker threads of the translator parse them.
+    while( true )
+    {
+        OGRFeature* poFeature = m_poTranslator->GetNextFeature();
+        if( poFeature )
+            return poFeature;
+        while( !m_bParallelReadFinished && !m_poTranslator->IsBatchFull() )
         {
-            OGRGeometry* poGeom = m_oReader.ReadGeometry(poObject,
-                                                         GetSpatialRef());
-            json_object_put(poObject);
-            if( !poGeom )
+            if( !GetNextRecord() )
             {
-                continue;
+                m_bParallelReadFinished = true;
+                break;
             }
-            poFeature = new OGRFeature(m_poFeatureDefn);
-            poFeature->SetGeometryDirectly(poGeom);
+            m_poTranslator->AddRecord(m_osFeatureBuffer.data(),
+                                      m_osFeatureBuffer.size());
         }
+        if( !m_poTranslator->TranslateBatch() )
+            return nullptr;
+    }
+}
+
+/************************************************************************/
+/*                           GetNextFeature()                           */
+/************************************************************************/
+
+OGRFeature* OGRGeoJSONSeqLayer::GetNextFeature()
+{
+    while( true )
+    {
+        OGRFeature* poFeature = GetNextTranslatedFeature();
+        if( !poFeature )
+            return nullptr;
 
         if( poFeature->GetFID() == OGRNullFID )
         {
@@ -34,6 +34,7 @@
 #include <json.h> // JSON-C
 
 #include <algorithm>
+#include <atomic>
 #include <memory>
 
 CPL_CVSID("$Id$")
@@ -686,10 +687,10 @@ OGRFieldType GeoJSONPropertyToFieldType( json_object* poObject,
         {
             if( nVal == MY_INT64_MIN || nVal == MY_INT64_MAX )
             {
-                static bool bWarned = false;
-                if( !bWarned )
+                // Features may be translated by several threads.
+                static std::atomic<bool> bWarned(false);
+                if( !bWarned.exchange(true) )
                 {
-                    bWarned = true;
                     CPLError(
                         CE_Warning, CPLE_AppDefined,
                         "Integer values probably ranging out of 64bit integer "
@@ -72,6 +72,17 @@ class OGRMemLayer : public OGRLayer
     // doesn't change.
     IOGRMemLayerFeatureIterator* GetIterator();
 
+  protected:
+    // FIDs that may match the filters, when they can be resolved with
+    // the attribute or spatial index of the layer.
+    GIntBig            *m_panMatchingFIDs;
+    GIntBig             m_iMatchingFID;
+    bool                m_bMatchingFIDsEvaluated;
+
+    bool                UseIndices();
+    OGRFeature         *GetNextMatchingFeature();
+    void                ResetMatchingFIDs();
+
   public:
                         OGRMemLayer( const char * pszName,
                                      OGRSpatialReference *poSRS,
@@ -77,7 +77,10 @@ OGRMemLayer::OGRMemLayer( const char *pszName, OGRSpatialReference *poSRSIn,
     m_iNextCreateFID(0),
     m_bUpdatable(true),
     m_bAdvertizeUTF8(false),
-    m_bUpdated(false)
+    m_bUpdated(false),
+    m_panMatchingFIDs(nullptr),
+    m_iMatchingFID(0),
+    m_bMatchingFIDsEvaluated(false)
 {
     m_poFeatureDefn->Reference();
 
@@ -128,6 +131,8 @@ OGRMemLayer::~OGRMemLayer()
 
     if( m_poFeatureDefn )
         m_poFeatureDefn->Release();
+
+    CPLFree(m_panMatchingFIDs);
 }
 
 /************************************************************************/
@@ -139,6 +144,76 @@ void OGRMemLayer::ResetReading()
 {
     m_iNextReadFID = 0;
     m_oMapFeaturesIter = m_oMapFeatures.begin();
+    ResetMatchingFIDs();
+}
+
+/************************************************************************/
+/*                         ResetMatchingFIDs()                          */
+/************************************************************************/
+
+void OGRMemLayer::ResetMatchingFIDs()
+
+{
+    CPLFree(m_panMatchingFIDs);
+    m_panMatchingFIDs = nullptr;
+    m_iMatchingFID = 0;
+    m_bMatchingFIDsEvaluated = false;
+}
+
+/************************************************************************/
+/*                             UseIndices()                             */
+/*                                                                      */
+/*      Whether the filters can be resolved with the attribute or       */
+/*      spatial index of the layer, in which case the features are      */
+/*      read with GetNextMatchingFeature().                             */
+/************************************************************************/
+
+bool OGRMemLayer::UseIndices()
+
+{
+    if( m_poAttrQuery == nullptr && m_poFilterGeom == nullptr )
+        return false;
+
+    if( !m_bMatchingFIDsEvaluated )
+    {
+        m_bMatchingFIDsEvaluated = true;
+        m_iMatchingFID = 0;
+        m_panMatchingFIDs = EvaluateFiltersAgainstIndices();
+    }
+
+    return m_panMatchingFIDs != nullptr;
+}
+
+/************************************************************************/
+/*                       GetNextMatchingFeature()                       */
+/************************************************************************/
+
+OGRFeature *OGRMemLayer::GetNextMatchingFeature()
+
+{
+    while( m_panMatchingFIDs[m_iMatchingFID] != OGRNullFID )
+    {
+        const GIntBig nFID = m_panMatchingFIDs[m_iMatchingFID++];
+        // Duplicates, as an IN list can produce.
+        if( m_iMatchingFID > 1 && nFID == m_panMatchingFIDs[m_iMatchingFID-2] )
+            continue;
+
+        OGRFeature *poFeature = GetFeature(nFID);
+        if( poFeature == nullptr )
+            continue;
+
+        if( (m_poFilterGeom == nullptr ||
+             FilterGeometry(poFeature->GetGeomFieldRef(m_iGeomFieldFilter)) )
+            && (m_poAttrQuery == nullptr ||
+                m_poAttrQuery->Evaluate(poFeature)) )
+        {
+            m_nFeaturesRead++;
+            return poFeature;
+        }
+        delete poFeature;
+    }
+
+    return nullptr;
 }
 
 /************************************************************************/
@@ -148,6 +223,9 @@ void OGRMemLayer::ResetReading()
 OGRFeature *OGRMemLayer::GetNextFeature()
 
 {
+    if( UseIndices() )
+        return GetNextMatchingFeature();
+
     while( true )
     {
         OGRFeature *poFeature = nullptr;
@@ -1056,7 +1056,8 @@ OGRLayer *OGRNGWDataset::ExecuteSQL( const char *pszStatement,
         }
 
         if( oSelect.join_count == 0 && oSelect.poOtherSelect == nullptr &&
-            oSelect.table_count == 1 && oSelect.order_specs == 0 )
+            oSelect.table_count == 1 && oSelect.order_specs == 0 &&
+            oSelect.group_by_count == 0 )
         {
             OGRNGWLayer *poLayer = reinterpret_cast<OGRNGWLayer*>(
                 GetLayerByName( oSelect.table_defs[0].table_name ) );
@@ -52,6 +52,13 @@ public:
     virtual GIntBig  *GetAllMatches( OGRField *psKey ) = 0;
     virtual GIntBig  *GetAllMatches( OGRField *psKey, GIntBig* panFIDList, int* nFIDCount, int* nLength ) = 0;
 
+    /* Range lookups. A null bound means an unbounded side. Returns a sorted */
+    /* OGRNullFID terminated list, or NULL if not supported. */
+    virtual GIntBig  *GetRangeMatches( OGRField *psMin, bool bMinInclusive,
+                                       OGRField *psMax, bool bMaxInclusive,
+                                       int *pnFIDCount );
+    virtual bool      SupportsRangeQueries() const;
+
     virtual OGRErr AddEntry( OGRField *psKey, GIntBig nFID ) = 0;
     virtual OGRErr RemoveEntry( OGRField *psKey, GIntBig nFID ) = 0;
 
@@ -91,6 +98,44 @@ public:
 
 OGRLayerAttrIndex CPL_DLL *OGRCreateDefaultLayerIndex();
 
+/************************************************************************/
+/*                         OGRLayerSpatialIndex                         */
+/*                                                                      */
+/*      Base class representing spatial indexes for the geometry        */
+/*      fields of a layer, for drivers that have none of their own.     */
+/************************************************************************/
+
+class CPL_DLL OGRLayerSpatialIndex
+{
+protected:
+    OGRLayer    *poLayer;
+
+                OGRLayerSpatialIndex();
+    CPL_DISALLOW_COPY_ASSIGN(OGRLayerSpatialIndex)
+
+public:
+    virtual     ~OGRLayerSpatialIndex();
+
+    virtual OGRErr Initialize( GDALDataset *poDS, OGRLayer * ) = 0;
+
+    virtual bool   HasIndex( int iGeomField ) = 0;
+    /* Index the features of poSrcLayer, which must be poLayer or the */
+    /* same layer of another opening of the dataset. */
+    virtual OGRErr CreateIndex( int iGeomField, OGRLayer *poSrcLayer ) = 0;
+    virtual OGRErr DropIndex( int iGeomField ) = 0;
+
+    /* Returns a sorted OGRNullFID terminated list of the features whose */
+    /* bounding box intersects the envelope, or NULL if there is no index. */
+    virtual GIntBig *GetMatches( int iGeomField, const OGREnvelope& sEnvelope,
+                                 int *pnFIDCount ) = 0;
+};
+
+/* Driver independent index stored in a <dataset>.ogrind sidecar file */
+OGRLayerAttrIndex CPL_DLL *OGRCreateSidecarLayerIndex();
+CPLString CPL_DLL OGRGetSidecarAttrIndexFilename( const char *pszDatasetName );
+void CPL_DLL OGRInitializeSidecarAttrIndexes( GDALDataset *poDS );
+OGRLayerSpatialIndex CPL_DLL *OGRCreateSidecarLayerSpatialIndex();
+
 //! @endcond
 
 #endif /* ndef OGR_ATTRIND_H_INCLUDED */
@@ -53,6 +53,7 @@
 //! @endcond
 
 class OGRLayerAttrIndex;
+class OGRLayerSpatialIndex;
 class OGRSFDriver;
 
 /************************************************************************/
@@ -243,7 +244,11 @@ class CPL_DLL OGRLayer : public GDALMajorObject
 
     /* consider these private */
     OGRErr               InitializeIndexSupport( const char * );
+    OGRErr               InitializeSidecarIndexSupport( const char * );
+    OGRErr               InitializeSidecarSpatialIndexSupport( GDALDataset * );
     OGRLayerAttrIndex   *GetIndex() { return m_poAttrIndex; }
+    OGRLayerSpatialIndex *GetSidecarSpatialIndex();
+    GIntBig             *EvaluateFiltersAgainstIndices();
     int                 GetGeomFieldFilter() const { return m_iGeomFieldFilter; }
     const char          *GetAttrQueryString() const { return m_pszAttrQueryString; }
 //! @endcond
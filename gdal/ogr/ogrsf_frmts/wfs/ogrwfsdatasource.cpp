@@ -2246,6 +2246,7 @@ OGRLayer * OGRWFSDataSource::ExecuteSQL( const char *pszSQLCommand,
             (iLayer = GetLayerIndex( psSelectInfo->table_defs[0].table_name )) >= 0 &&
             psSelectInfo->join_count == 0 &&
             psSelectInfo->order_specs > 0 &&
+            psSelectInfo->group_by_count == 0 &&
             psSelectInfo->poOtherSelect == nullptr )
         {
             OGRWFSLayer* poSrcLayer = papoLayers[iLayer];
@@ -2302,6 +2303,7 @@ OGRLayer * OGRWFSDataSource::ExecuteSQL( const char *pszSQLCommand,
         }
         else if( bStandardJoinsWFS2 &&
                  psSelectInfo->join_count > 0 &&
+                 psSelectInfo->group_by_count == 0 &&
                  psSelectInfo->poOtherSelect == nullptr )
         {
             // Just to make sure everything is valid, but we won't use
@@ -289,6 +289,10 @@ int swqlex( YYSTYPE *ppNode, swq_parse_context *context )
             nReturn = SWQT_LIMIT;
         else if( EQUAL(osToken, "OFFSET") )
             nReturn = SWQT_OFFSET;
+        else if( EQUAL(osToken, "GROUP") )
+            nReturn = SWQT_GROUP;
+        else if( EQUAL(osToken, "HAVING") )
+            nReturn = SWQT_HAVING;
 
         // Unhandled by OGR SQL.
         else if( EQUAL(osToken, "LIMIT") ||
@@ -361,7 +365,9 @@ swq_select_summarize( swq_select *select_info,
             if( def->distinct_flag )
             {
                 swq_summary::Comparator oComparator;
-                if( select_info->order_specs > 0 )
+                // In GROUP BY mode, ORDER BY applies to the result rows
+                if( select_info->order_specs > 0 &&
+                    select_info->query_mode != SWQM_GROUP_BY )
                 {
                     CPLAssert( select_info->order_specs ==1 );
                     CPLAssert( select_info->result_columns == 1 );
@@ -409,7 +415,8 @@ swq_select_summarize( swq_select *select_info,
                     summary.oSetDistinctValues.end() )
             {
                 summary.oSetDistinctValues.insert(value);
-                if( select_info->order_specs == 0 )
+                if( select_info->order_specs == 0 &&
+                    select_info->query_mode != SWQM_GROUP_BY )
                 {
                     // If not sorted, keep values in their original order
                     summary.oVectorDistinctValues.emplace_back(value);
@@ -817,7 +824,9 @@ static const char* const apszSQLReservedKeywords[] = {
     "ASC",
     "DESC",
     "UNION",
-    "ALL"
+    "ALL",
+    "GROUP",
+    "HAVING"
 };
 
 int swq_is_reserved_keyword(const char* pszStr)
@@ -250,7 +250,8 @@ CPLErr swq_expr_compile2( const char *where_clause,
 /*
 ** Evaluation related.
 */
-int swq_test_like( const char *input, const char *pattern );
+int swq_test_like( const char *input, const char *pattern, char chEscape );
+int swq_test_timestamp_equal( const char *pszFirst, const char *pszSecond );
 
 swq_expr_node *SWQGeneralEvaluator( swq_expr_node *, swq_expr_node **);
 swq_field_type SWQGeneralChecker( swq_expr_node *node, int bAllowMismatchTypeOnFieldComparison );
@@ -265,6 +266,7 @@ const char*    SWQFieldTypeToString( swq_field_type field_type );
 #define SWQM_SUMMARY_RECORD  1
 #define SWQM_RECORDSET       2
 #define SWQM_DISTINCT_LIST   3
+#define SWQM_GROUP_BY        4
 
 typedef enum {
     SWQCF_NONE = 0,
@@ -317,6 +319,8 @@ public:
     CPLString   osMax{};
 };
 
+// In SWQM_GROUP_BY mode, field_index is the index of the result column
+// the records are sorted on, and table_index is -1.
 typedef struct {
     char *table_name;
     char *field_name;
@@ -325,6 +329,14 @@ typedef struct {
     int   ascending_flag;
 } swq_order_def;
 
+typedef struct {
+    char *table_name;
+    char *field_name;
+    int   table_index;
+    int   field_index;
+    swq_field_type field_type;
+} swq_group_by_def;
+
 typedef struct {
     int        secondary_table;
     swq_expr_node  *poExpr;
@@ -380,6 +392,15 @@ public:
 
     swq_expr_node *where_expr = nullptr;
 
+    void        PushGroupBy( const char* pszTableName, const char *pszFieldName );
+    int         group_by_count = 0;
+    swq_group_by_def *group_by_defs = nullptr;
+
+    swq_expr_node *having_expr = nullptr;
+    // HAVING clause resolved by parse(), whose column nodes refer to the
+    // result columns.
+    swq_expr_node *having_result_expr = nullptr;
+
     void        PushOrderBy( const char* pszTableName, const char *pszFieldName, int bAscending );
     int         order_specs = 0;
     swq_order_def *order_defs = nullptr;
@@ -648,6 +648,14 @@ CPLString swq_expr_node::UnparseOperationFromUnparsedSubExpr(char** apszSubExpr)
         {
             if( i > 0 )
                 osExpr += ",";
+            // COUNT(*)
+            if( nOperation == SWQ_COUNT &&
+                papoSubExpr[i]->eNodeType == SNT_COLUMN &&
+                strcmp(apszSubExpr[i], "*") == 0 )
+            {
+                osExpr += apszSubExpr[i];
+                continue;
+            }
             osExpr += "(";
             osExpr += apszSubExpr[i];
             osExpr += ")";
@@ -53,8 +53,7 @@ CPL_CVSID("$Id$")
 /*      Does input match pattern?                                       */
 /************************************************************************/
 
-static int swq_test_like( const char *input, const char *pattern,
-                          char chEscape )
+int swq_test_like( const char *input, const char *pattern, char chEscape )
 
 {
     if( input == nullptr || pattern == nullptr )
@@ -116,6 +115,35 @@ static int swq_test_like( const char *input, const char *pattern,
         return 1;
 }
 
+/************************************************************************/
+/*                      swq_test_timestamp_equal()                      */
+/*                                                                      */
+/*      Case insensitive string equality, except that a +00 timezone    */
+/*      at the end of one value is ignored if the other value has no    */
+/*      explicit timezone.                                              */
+/************************************************************************/
+
+int swq_test_timestamp_equal( const char *pszFirst, const char *pszSecond )
+
+{
+    const size_t nFirstLen = strlen(pszFirst);
+    const size_t nSecondLen = strlen(pszSecond);
+    if( nFirstLen > 3 && nSecondLen > 3 )
+    {
+        if( strcmp(pszFirst + nFirstLen - 3, "+00") == 0 &&
+            pszSecond[nSecondLen - 3] == ':' )
+        {
+            return EQUALN(pszFirst, pszSecond, nSecondLen);
+        }
+        if( pszFirst[nFirstLen - 3] == ':' &&
+            strcmp(pszSecond + nSecondLen - 3, "+00") == 0 )
+        {
+            return EQUALN(pszFirst, pszSecond, nFirstLen);
+        }
+    }
+    return strcasecmp(pszFirst, pszSecond) == 0;
+}
+
 /************************************************************************/
 /*                        OGRHStoreGetValue()                           */
 /************************************************************************/
@@ -737,30 +765,11 @@ swq_expr_node *SWQGeneralEvaluator( swq_expr_node *node,
             if( (sub_node_values[0]->field_type == SWQ_TIMESTAMP ||
                  sub_node_values[0]->field_type == SWQ_STRING) &&
                 (sub_node_values[1]->field_type == SWQ_TIMESTAMP ||
-                 sub_node_values[1]->field_type == SWQ_STRING) &&
-                strlen(sub_node_values[0]->string_value) > 3 &&
-                strlen(sub_node_values[1]->string_value) > 3 &&
-                (strcmp(sub_node_values[0]->string_value + strlen(sub_node_values[0]->string_value)-3, "+00") == 0 &&
-                 sub_node_values[1]->string_value[strlen(sub_node_values[1]->string_value)-3] == ':') )
-            {
-                poRet->int_value =
-                    EQUALN(sub_node_values[0]->string_value,
-                           sub_node_values[1]->string_value,
-                           strlen(sub_node_values[1]->string_value));
-            }
-            else if( (sub_node_values[0]->field_type == SWQ_TIMESTAMP ||
-                      sub_node_values[0]->field_type == SWQ_STRING) &&
-                     (sub_node_values[1]->field_type == SWQ_TIMESTAMP ||
-                      sub_node_values[1]->field_type == SWQ_STRING) &&
-                     strlen(sub_node_values[0]->string_value) > 3 &&
-                     strlen(sub_node_values[1]->string_value) > 3 &&
-                     (sub_node_values[0]->string_value[strlen(sub_node_values[0]->string_value)-3] == ':') &&
-                      strcmp(sub_node_values[1]->string_value + strlen(sub_node_values[1]->string_value)-3, "+00") == 0)
+                 sub_node_values[1]->field_type == SWQ_STRING) )
             {
                 poRet->int_value =
-                    EQUALN(sub_node_values[0]->string_value,
-                           sub_node_values[1]->string_value,
-                           strlen(sub_node_values[0]->string_value));
+                    swq_test_timestamp_equal(sub_node_values[0]->string_value,
+                                             sub_node_values[1]->string_value);
             }
             else
             {
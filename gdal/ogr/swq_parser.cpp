@@ -1,8 +1,9 @@
-/* A Bison parser, made by GNU Bison 3.0.4.  */
+/* A Bison parser, made by GNU Bison 3.8.2.  */
 
 /* Bison implementation for Yacc-like parsers in C
 
-   Copyright (C) 1984, 1989-1990, 2000-2015 Free Software Foundation, Inc.
+   Copyright (C) 1984, 1989-1990, 2000-2015, 2018-2021 Free Software Foundation,
+   Inc.
 
    This program is free software: you can redistribute it and/or modify
    it under the terms of the GNU General Public License as published by
@@ -15,7 +16,7 @@
    GNU General Public License for more details.
 
    You should have received a copy of the GNU General Public License
-   along with this program.  If not, see <http://www.gnu.org/licenses/>.  */
+   along with this program.  If not, see <https://www.gnu.org/licenses/>.  */
 
 /* As a special exception, you may create a larger work that contains
    part or all of the Bison parser skeleton and distribute that work
@@ -33,6 +34,10 @@
 /* C LALR(1) parser skeleton written by Richard Stallman, by
    simplifying the original so-called "semantic" parser.  */
 
+/* DO NOT RELY ON FEATURES THAT ARE NOT DOCUMENTED in the manual,
+   especially those whose name start with YY_ or yy_.  They are
+   private implementation details that can be changed or removed.  */
+
 /* All symbols defined below should begin with yy or YY, to avoid
    infringing on user name space.  This should be done even for local
    variables, as they might otherwise be expanded by user macros.
@@ -40,11 +45,11 @@
    define necessary library symbols; they are noted "INFRINGES ON
    USER NAME SPACE" below.  */
 
-/* Identify Bison output.  */
-#define YYBISON 1
+/* Identify Bison output, and Bison version.  */
+#define YYBISON 30802
 
-/* Bison version.  */
-#define YYBISON_VERSION "3.0.4"
+/* Bison version string.  */
+#define YYBISON_VERSION "3.8.2"
 
 /* Skeleton name.  */
 #define YYSKELETON_NAME "yacc.c"
@@ -66,9 +71,8 @@
 #define yydebug         swqdebug
 #define yynerrs         swqnerrs
 
-
-/* Copy the first part of user declarations.  */
-#line 1 "swq_parser.y" /* yacc.c:339  */
+/* First part of user prologue.  */
+#line 1 "swq_parser.y"
 
 /******************************************************************************
  *
@@ -123,122 +127,203 @@ CPL_CVSID("$Id$")
 /* it appears to be a non documented feature of Bison */
 #define YYSTYPE_IS_TRIVIAL 1
 
-#line 127 "swq_parser.cpp" /* yacc.c:339  */
+#line 131 "swq_parser.cpp"
 
+# ifndef YY_CAST
+#  ifdef __cplusplus
+#   define YY_CAST(Type, Val) static_cast<Type> (Val)
+#   define YY_REINTERPRET_CAST(Type, Val) reinterpret_cast<Type> (Val)
+#  else
+#   define YY_CAST(Type, Val) ((Type) (Val))
+#   define YY_REINTERPRET_CAST(Type, Val) ((Type) (Val))
+#  endif
+# endif
 # ifndef YY_NULLPTR
-#  if defined __cplusplus && 201103L <= __cplusplus
-#   define YY_NULLPTR nullptr
+#  if defined __cplusplus
+#   if 201103L <= __cplusplus
+#    define YY_NULLPTR nullptr
+#   else
+#    define YY_NULLPTR 0
+#   endif
 #  else
-#   define YY_NULLPTR 0
+#   define YY_NULLPTR ((void*)0)
 #  endif
 # endif
 
-/* Enabling verbose error messages.  */
-#ifdef YYERROR_VERBOSE
-# undef YYERROR_VERBOSE
-# define YYERROR_VERBOSE 1
-#else
-# define YYERROR_VERBOSE 1
-#endif
-
-/* In a future release of Bison, this section will be replaced
-   by #include "swq_parser.hpp".  */
-#ifndef YY_SWQ_SWQ_PARSER_HPP_INCLUDED
-# define YY_SWQ_SWQ_PARSER_HPP_INCLUDED
-/* Debug traces.  */
-#ifndef YYDEBUG
-# define YYDEBUG 0
-#endif
-#if YYDEBUG
-extern int swqdebug;
-#endif
-
-/* Token type.  */
-#ifndef YYTOKENTYPE
-# define YYTOKENTYPE
-  enum yytokentype
-  {
-    END = 0,
-    SWQT_INTEGER_NUMBER = 258,
-    SWQT_FLOAT_NUMBER = 259,
-    SWQT_STRING = 260,
-    SWQT_IDENTIFIER = 261,
-    SWQT_IN = 262,
-    SWQT_LIKE = 263,
-    SWQT_ESCAPE = 264,
-    SWQT_BETWEEN = 265,
-    SWQT_NULL = 266,
-    SWQT_IS = 267,
-    SWQT_SELECT = 268,
-    SWQT_LEFT = 269,
-    SWQT_JOIN = 270,
-    SWQT_WHERE = 271,
-    SWQT_ON = 272,
-    SWQT_ORDER = 273,
-    SWQT_BY = 274,
-    SWQT_FROM = 275,
-    SWQT_AS = 276,
-    SWQT_ASC = 277,
-    SWQT_DESC = 278,
-    SWQT_DISTINCT = 279,
-    SWQT_CAST = 280,
-    SWQT_UNION = 281,
-    SWQT_ALL = 282,
-    SWQT_LIMIT = 283,
-    SWQT_OFFSET = 284,
-    SWQT_VALUE_START = 285,
-    SWQT_SELECT_START = 286,
-    SWQT_NOT = 287,
-    SWQT_OR = 288,
-    SWQT_AND = 289,
-    SWQT_UMINUS = 290,
-    SWQT_RESERVED_KEYWORD = 291
-  };
-#endif
+#include "swq_parser.hpp"
+/* Symbol kind.  */
+enum yysymbol_kind_t
+{
+  YYSYMBOL_YYEMPTY = -2,
+  YYSYMBOL_YYEOF = 0,                      /* "end of string"  */
+  YYSYMBOL_YYerror = 1,                    /* error  */
+  YYSYMBOL_YYUNDEF = 2,                    /* "invalid token"  */
+  YYSYMBOL_SWQT_INTEGER_NUMBER = 3,        /* "integer number"  */
+  YYSYMBOL_SWQT_FLOAT_NUMBER = 4,          /* "floating point number"  */
+  YYSYMBOL_SWQT_STRING = 5,                /* "string"  */
+  YYSYMBOL_SWQT_IDENTIFIER = 6,            /* "identifier"  */
+  YYSYMBOL_SWQT_IN = 7,                    /* "IN"  */
+  YYSYMBOL_SWQT_LIKE = 8,                  /* "LIKE"  */
+  YYSYMBOL_SWQT_ESCAPE = 9,                /* "ESCAPE"  */
+  YYSYMBOL_SWQT_BETWEEN = 10,              /* "BETWEEN"  */
+  YYSYMBOL_SWQT_NULL = 11,                 /* "NULL"  */
+  YYSYMBOL_SWQT_IS = 12,                   /* "IS"  */
+  YYSYMBOL_SWQT_SELECT = 13,               /* "SELECT"  */
+  YYSYMBOL_SWQT_LEFT = 14,                 /* "LEFT"  */
+  YYSYMBOL_SWQT_JOIN = 15,                 /* "JOIN"  */
+  YYSYMBOL_SWQT_WHERE = 16,                /* "WHERE"  */
+  YYSYMBOL_SWQT_ON = 17,                   /* "ON"  */
+  YYSYMBOL_SWQT_ORDER = 18,                /* "ORDER"  */
+  YYSYMBOL_SWQT_BY = 19,                   /* "BY"  */
+  YYSYMBOL_SWQT_FROM = 20,                 /* "FROM"  */
+  YYSYMBOL_SWQT_AS = 21,                   /* "AS"  */
+  YYSYMBOL_SWQT_ASC = 22,                  /* "ASC"  */
+  YYSYMBOL_SWQT_DESC = 23,                 /* "DESC"  */
+  YYSYMBOL_SWQT_DISTINCT = 24,             /* "DISTINCT"  */
+  YYSYMBOL_SWQT_CAST = 25,                 /* "CAST"  */
+  YYSYMBOL_SWQT_UNION = 26,                /* "UNION"  */
+  YYSYMBOL_SWQT_ALL = 27,                  /* "ALL"  */
+  YYSYMBOL_SWQT_LIMIT = 28,                /* "LIMIT"  */
+  YYSYMBOL_SWQT_OFFSET = 29,               /* "OFFSET"  */
+  YYSYMBOL_SWQT_GROUP = 30,                /* "GROUP"  */
+  YYSYMBOL_SWQT_HAVING = 31,               /* "HAVING"  */
+  YYSYMBOL_SWQT_VALUE_START = 32,          /* SWQT_VALUE_START  */
+  YYSYMBOL_SWQT_SELECT_START = 33,         /* SWQT_SELECT_START  */
+  YYSYMBOL_SWQT_NOT = 34,                  /* "NOT"  */
+  YYSYMBOL_SWQT_OR = 35,                   /* "OR"  */
+  YYSYMBOL_SWQT_AND = 36,                  /* "AND"  */
+  YYSYMBOL_37_ = 37,                       /* '='  */
+  YYSYMBOL_38_ = 38,                       /* '<'  */
+  YYSYMBOL_39_ = 39,                       /* '>'  */
+  YYSYMBOL_40_ = 40,                       /* '!'  */
+  YYSYMBOL_41_ = 41,                       /* '+'  */
+  YYSYMBOL_42_ = 42,                       /* '-'  */
+  YYSYMBOL_43_ = 43,                       /* '*'  */
+  YYSYMBOL_44_ = 44,                       /* '/'  */
+  YYSYMBOL_45_ = 45,                       /* '%'  */
+  YYSYMBOL_SWQT_UMINUS = 46,               /* SWQT_UMINUS  */
+  YYSYMBOL_SWQT_RESERVED_KEYWORD = 47,     /* "reserved keyword"  */
+  YYSYMBOL_48_ = 48,                       /* '('  */
+  YYSYMBOL_49_ = 49,                       /* ')'  */
+  YYSYMBOL_50_ = 50,                       /* ','  */
+  YYSYMBOL_51_ = 51,                       /* '.'  */
+  YYSYMBOL_YYACCEPT = 52,                  /* $accept  */
+  YYSYMBOL_input = 53,                     /* input  */
+  YYSYMBOL_value_expr = 54,                /* value_expr  */
+  YYSYMBOL_value_expr_list = 55,           /* value_expr_list  */
+  YYSYMBOL_field_value = 56,               /* field_value  */
+  YYSYMBOL_value_expr_non_logical = 57,    /* value_expr_non_logical  */
+  YYSYMBOL_type_def = 58,                  /* type_def  */
+  YYSYMBOL_select_statement = 59,          /* select_statement  */
+  YYSYMBOL_select_core = 60,               /* select_core  */
+  YYSYMBOL_opt_union_all = 61,             /* opt_union_all  */
+  YYSYMBOL_union_all = 62,                 /* union_all  */
+  YYSYMBOL_select_field_list = 63,         /* select_field_list  */
+  YYSYMBOL_column_spec = 64,               /* column_spec  */
+  YYSYMBOL_as_clause = 65,                 /* as_clause  */
+  YYSYMBOL_opt_where = 66,                 /* opt_where  */
+  YYSYMBOL_opt_joins = 67,                 /* opt_joins  */
+  YYSYMBOL_opt_group_by = 68,              /* opt_group_by  */
+  YYSYMBOL_group_spec_list = 69,           /* group_spec_list  */
+  YYSYMBOL_group_spec = 70,                /* group_spec  */
+  YYSYMBOL_opt_having = 71,                /* opt_having  */
+  YYSYMBOL_opt_order_by = 72,              /* opt_order_by  */
+  YYSYMBOL_sort_spec_list = 73,            /* sort_spec_list  */
+  YYSYMBOL_sort_spec = 74,                 /* sort_spec  */
+  YYSYMBOL_opt_limit = 75,                 /* opt_limit  */
+  YYSYMBOL_opt_offset = 76,                /* opt_offset  */
+  YYSYMBOL_table_def = 77                  /* table_def  */
+};
+typedef enum yysymbol_kind_t yysymbol_kind_t;
 
-/* Value type.  */
-#if ! defined YYSTYPE && ! defined YYSTYPE_IS_DECLARED
-typedef int YYSTYPE;
-# define YYSTYPE_IS_TRIVIAL 1
-# define YYSTYPE_IS_DECLARED 1
-#endif
 
 
 
-int swqparse (swq_parse_context *context);
+#ifdef short
+# undef short
+#endif
 
-#endif /* !YY_SWQ_SWQ_PARSER_HPP_INCLUDED  */
+/* On compilers that do not define __PTRDIFF_MAX__ etc., make sure
+   <limits.h> and (if available) <stdint.h> are included
+   so that the code can choose integer types of a good width.  */
 
-/* Copy the second part of user declarations.  */
+#ifndef __PTRDIFF_MAX__
+# include <limits.h> /* INFRINGES ON USER NAME SPACE */
+# if defined __STDC_VERSION__ && 199901 <= __STDC_VERSION__
+#  include <stdint.h> /* INFRINGES ON USER NAME SPACE */
+#  define YY_STDINT_H
+# endif
+#endif
 
-#line 215 "swq_parser.cpp" /* yacc.c:358  */
+/* Narrow types that promote to a signed type and that can represent a
+   signed or unsigned integer of at least N bits.  In tables they can
+   save space and decrease cache pressure.  Promoting to a signed type
+   helps avoid bugs in integer arithmetic.  */
 
-#ifdef short
-# undef short
+#ifdef __INT_LEAST8_MAX__
+typedef __INT_LEAST8_TYPE__ yytype_int8;
+#elif defined YY_STDINT_H
+typedef int_least8_t yytype_int8;
+#else
+typedef signed char yytype_int8;
 #endif
 
-#ifdef YYTYPE_UINT8
-typedef YYTYPE_UINT8 yytype_uint8;
+#ifdef __INT_LEAST16_MAX__
+typedef __INT_LEAST16_TYPE__ yytype_int16;
+#elif defined YY_STDINT_H
+typedef int_least16_t yytype_int16;
 #else
-typedef unsigned char yytype_uint8;
+typedef short yytype_int16;
 #endif
 
-#ifdef YYTYPE_INT8
-typedef YYTYPE_INT8 yytype_int8;
-#else
-typedef signed char yytype_int8;
+/* Work around bug in HP-UX 11.23, which defines these macros
+   incorrectly for preprocessor constants.  This workaround can likely
+   be removed in 2023, as HPE has promised support for HP-UX 11.23
+   (aka HP-UX 11i v2) only through the end of 2022; see Table 2 of
+   <https://h20195.www2.hpe.com/V2/getpdf.aspx/4AA4-7673ENW.pdf>.  */
+#ifdef __hpux
+# undef UINT_LEAST8_MAX
+# undef UINT_LEAST16_MAX
+# define UINT_LEAST8_MAX 255
+# define UINT_LEAST16_MAX 65535
 #endif
 
-#ifdef YYTYPE_UINT16
-typedef YYTYPE_UINT16 yytype_uint16;
+#if defined __UINT_LEAST8_MAX__ && __UINT_LEAST8_MAX__ <= __INT_MAX__
+typedef __UINT_LEAST8_TYPE__ yytype_uint8;
+#elif (!defined __UINT_LEAST8_MAX__ && defined YY_STDINT_H \
+       && UINT_LEAST8_MAX <= INT_MAX)
+typedef uint_least8_t yytype_uint8;
+#elif !defined __UINT_LEAST8_MAX__ && UCHAR_MAX <= INT_MAX
+typedef unsigned char yytype_uint8;
 #else
-typedef unsigned short int yytype_uint16;
+typedef short yytype_uint8;
 #endif
 
-#ifdef YYTYPE_INT16
-typedef YYTYPE_INT16 yytype_int16;
+#if defined __UINT_LEAST16_MAX__ && __UINT_LEAST16_MAX__ <= __INT_MAX__
+typedef __UINT_LEAST16_TYPE__ yytype_uint16;
+#elif (!defined __UINT_LEAST16_MAX__ && defined YY_STDINT_H \
+       && UINT_LEAST16_MAX <= INT_MAX)
+typedef uint_least16_t yytype_uint16;
+#elif !defined __UINT_LEAST16_MAX__ && USHRT_MAX <= INT_MAX
+typedef unsigned short yytype_uint16;
 #else
-typedef short int yytype_int16;
+typedef int yytype_uint16;
+#endif
+
+#ifndef YYPTRDIFF_T
+# if defined __PTRDIFF_TYPE__ && defined __PTRDIFF_MAX__
+#  define YYPTRDIFF_T __PTRDIFF_TYPE__
+#  define YYPTRDIFF_MAXIMUM __PTRDIFF_MAX__
+# elif defined PTRDIFF_MAX
+#  ifndef ptrdiff_t
+#   include <stddef.h> /* INFRINGES ON USER NAME SPACE */
+#  endif
+#  define YYPTRDIFF_T ptrdiff_t
+#  define YYPTRDIFF_MAXIMUM PTRDIFF_MAX
+# else
+#  define YYPTRDIFF_T long
+#  define YYPTRDIFF_MAXIMUM LONG_MAX
+# endif
 #endif
 
 #ifndef YYSIZE_T
@@ -246,15 +331,28 @@ typedef short int yytype_int16;
 #  define YYSIZE_T __SIZE_TYPE__
 # elif defined size_t
 #  define YYSIZE_T size_t
-# elif ! defined YYSIZE_T
+# elif defined __STDC_VERSION__ && 199901 <= __STDC_VERSION__
 #  include <stddef.h> /* INFRINGES ON USER NAME SPACE */
 #  define YYSIZE_T size_t
 # else
-#  define YYSIZE_T unsigned int
+#  define YYSIZE_T unsigned
 # endif
 #endif
 
-#define YYSIZE_MAXIMUM static_cast<YYSIZE_T>(-1)
+#define YYSIZE_MAXIMUM                                  \
+  YY_CAST (YYPTRDIFF_T,                                 \
+           (YYPTRDIFF_MAXIMUM < YY_CAST (YYSIZE_T, -1)  \
+            ? YYPTRDIFF_MAXIMUM                         \
+            : YY_CAST (YYSIZE_T, -1)))
+
+#define YYSIZEOF(X) YY_CAST (YYPTRDIFF_T, sizeof (X))
+
+
+/* Stored state numbers (used for stacks). */
+typedef yytype_uint8 yy_state_t;
+
+/* State numbers in computations.  */
+typedef int yy_state_fast_t;
 
 #ifndef YY_
 # if defined YYENABLE_NLS && YYENABLE_NLS
@@ -268,47 +366,43 @@ typedef short int yytype_int16;
 # endif
 #endif
 
-#ifndef YY_ATTRIBUTE
-# if (defined __GNUC__                                               \
-      && (2 < __GNUC__ || (__GNUC__ == 2 && 96 <= __GNUC_MINOR__)))  \
-     || defined __SUNPRO_C && 0x5110 <= __SUNPRO_C
-#  define YY_ATTRIBUTE(Spec) __attribute__(Spec)
-# else
-#  define YY_ATTRIBUTE(Spec) /* empty */
-# endif
-#endif
 
 #ifndef YY_ATTRIBUTE_PURE
-# define YY_ATTRIBUTE_PURE   YY_ATTRIBUTE ((__pure__))
+# if defined __GNUC__ && 2 < __GNUC__ + (96 <= __GNUC_MINOR__)
+#  define YY_ATTRIBUTE_PURE __attribute__ ((__pure__))
+# else
+#  define YY_ATTRIBUTE_PURE
+# endif
 #endif
 
 #ifndef YY_ATTRIBUTE_UNUSED
-# define YY_ATTRIBUTE_UNUSED YY_ATTRIBUTE ((__unused__))
-#endif
-
-#if !defined _Noreturn \
-     && (!defined __STDC_VERSION__ || __STDC_VERSION__ < 201112)
-# if defined _MSC_VER && 1200 <= _MSC_VER
-#  define _Noreturn __declspec (noreturn)
+# if defined __GNUC__ && 2 < __GNUC__ + (7 <= __GNUC_MINOR__)
+#  define YY_ATTRIBUTE_UNUSED __attribute__ ((__unused__))
 # else
-#  define _Noreturn YY_ATTRIBUTE ((__noreturn__))
+#  define YY_ATTRIBUTE_UNUSED
 # endif
 #endif
 
 /* Suppress unused-variable warnings by "using" E.  */
 #if ! defined lint || defined __GNUC__
-# define YYUSE(E) ((void) (E))
+# define YY_USE(E) ((void) (E))
 #else
-# define YYUSE(E) /* empty */
+# define YY_USE(E) /* empty */
 #endif
 
-#if defined __GNUC__ && 407 <= __GNUC__ * 100 + __GNUC_MINOR__
 /* Suppress an incorrect diagnostic about yylval being uninitialized.  */
-# define YY_IGNORE_MAYBE_UNINITIALIZED_BEGIN \
-    _Pragma ("GCC diagnostic push") \
-    _Pragma ("GCC diagnostic ignored \"-Wuninitialized\"")\
+#if defined __GNUC__ && ! defined __ICC && 406 <= __GNUC__ * 100 + __GNUC_MINOR__
+# if __GNUC__ * 100 + __GNUC_MINOR__ < 407
+#  define YY_IGNORE_MAYBE_UNINITIALIZED_BEGIN                           \
+    _Pragma ("GCC diagnostic push")                                     \
+    _Pragma ("GCC diagnostic ignored \"-Wuninitialized\"")
+# else
+#  define YY_IGNORE_MAYBE_UNINITIALIZED_BEGIN                           \
+    _Pragma ("GCC diagnostic push")                                     \
+    _Pragma ("GCC diagnostic ignored \"-Wuninitialized\"")              \
     _Pragma ("GCC diagnostic ignored \"-Wmaybe-uninitialized\"")
-# define YY_IGNORE_MAYBE_UNINITIALIZED_END \
+# endif
+# define YY_IGNORE_MAYBE_UNINITIALIZED_END      \
     _Pragma ("GCC diagnostic pop")
 #else
 # define YY_INITIAL_VALUE(Value) Value
@@ -321,8 +415,22 @@ typedef short int yytype_int16;
 # define YY_INITIAL_VALUE(Value) /* Nothing. */
 #endif
 
+#if defined __cplusplus && defined __GNUC__ && ! defined __ICC && 6 <= __GNUC__
+# define YY_IGNORE_USELESS_CAST_BEGIN                          \
+    _Pragma ("GCC diagnostic push")                            \
+    _Pragma ("GCC diagnostic ignored \"-Wuseless-cast\"")
+# define YY_IGNORE_USELESS_CAST_END            \
+    _Pragma ("GCC diagnostic pop")
+#endif
+#ifndef YY_IGNORE_USELESS_CAST_BEGIN
+# define YY_IGNORE_USELESS_CAST_BEGIN
+# define YY_IGNORE_USELESS_CAST_END
+#endif
+
+
+#define YY_ASSERT(E) ((void) (0 && (E)))
 
-#if ! defined yyoverflow || YYERROR_VERBOSE
+#if 1
 
 /* The parser invokes alloca or malloc; define the necessary symbols.  */
 
@@ -387,8 +495,7 @@ void free (void *); /* INFRINGES ON USER NAME SPACE */
 #   endif
 #  endif
 # endif
-#endif /* ! defined yyoverflow || YYERROR_VERBOSE */
-
+#endif /* 1 */
 
 #if (! defined yyoverflow \
      && (! defined __cplusplus \
@@ -397,17 +504,17 @@ void free (void *); /* INFRINGES ON USER NAME SPACE */
 /* A type that is properly aligned for any stack member.  */
 union yyalloc
 {
-  yytype_int16 yyss_alloc;
+  yy_state_t yyss_alloc;
   YYSTYPE yyvs_alloc;
 };
 
 /* The size of the maximum gap between one aligned stack and the next.  */
-# define YYSTACK_GAP_MAXIMUM (sizeof (union yyalloc) - 1)
+# define YYSTACK_GAP_MAXIMUM (YYSIZEOF (union yyalloc) - 1)
 
 /* The size of an array large to enough to hold all stacks, each with
    N elements.  */
 # define YYSTACK_BYTES(N) \
-     ((N) * (sizeof (yytype_int16) + sizeof (YYSTYPE)) \
+     ((N) * (YYSIZEOF (yy_state_t) + YYSIZEOF (YYSTYPE)) \
       + YYSTACK_GAP_MAXIMUM)
 
 # define YYCOPY_NEEDED 1
@@ -420,11 +527,11 @@ union yyalloc
 # define YYSTACK_RELOCATE(Stack_alloc, Stack)                           \
     do                                                                  \
       {                                                                 \
-        YYSIZE_T yynewbytes;                                            \
+        YYPTRDIFF_T yynewbytes;                                         \
         YYCOPY (&yyptr->Stack_alloc, Stack, yysize);                    \
         Stack = &yyptr->Stack_alloc;                                    \
-        yynewbytes = yystacksize * sizeof (*Stack) + YYSTACK_GAP_MAXIMUM; \
-        yyptr += yynewbytes / sizeof (*yyptr);                          \
+        yynewbytes = yystacksize * YYSIZEOF (*Stack) + YYSTACK_GAP_MAXIMUM; \
+        yyptr += yynewbytes / YYSIZEOF (*yyptr);                        \
       }                                                                 \
     while (0)
 
@@ -436,12 +543,12 @@ union yyalloc
 # ifndef YYCOPY
 #  if defined __GNUC__ && 1 < __GNUC__
 #   define YYCOPY(Dst, Src, Count) \
-      __builtin_memcpy (Dst, Src, (Count) * sizeof (*(Src)))
+      __builtin_memcpy (Dst, Src, YY_CAST (YYSIZE_T, (Count)) * sizeof (*(Src)))
 #  else
 #   define YYCOPY(Dst, Src, Count)              \
       do                                        \
         {                                       \
-          YYSIZE_T yyi;                         \
+          YYPTRDIFF_T yyi;                      \
           for (yyi = 0; yyi < (Count); yyi++)   \
             (Dst)[yyi] = (Src)[yyi];            \
         }                                       \
@@ -456,33 +563,36 @@ union yyalloc
 #define YYLAST   400
 
 /* YYNTOKENS -- Number of terminals.  */
-#define YYNTOKENS  50
+#define YYNTOKENS  52
 /* YYNNTS -- Number of nonterminals.  */
-#define YYNNTS  22
+#define YYNNTS  26
 /* YYNRULES -- Number of rules.  */
-#define YYNRULES  91
+#define YYNRULES  97
 /* YYNSTATES -- Number of states.  */
-#define YYNSTATES  193
+#define YYNSTATES  205
 
-/* YYTRANSLATE[YYX] -- Symbol number corresponding to YYX as returned
-   by yylex, with out-of-bounds checking.  */
-#define YYUNDEFTOK  2
-#define YYMAXUTOK   291
+/* YYMAXUTOK -- Last valid token kind.  */
+#define YYMAXUTOK   293
 
-#define YYTRANSLATE(YYX)                                                \
-  (static_cast<unsigned int>(YYX) <= YYMAXUTOK ? yytranslate[YYX] : YYUNDEFTOK)
+
+/* YYTRANSLATE(TOKEN-NUM) -- Symbol number corresponding to TOKEN-NUM
+   as returned by yylex, with out-of-bounds checking.  */
+#define YYTRANSLATE(YYX)                                \
+  (0 <= (YYX) && (YYX) <= YYMAXUTOK                     \
+   ? YY_CAST (yysymbol_kind_t, yytranslate[YYX])        \
+   : YYSYMBOL_YYUNDEF)
 
 /* YYTRANSLATE[TOKEN-NUM] -- Symbol number corresponding to TOKEN-NUM
-   as returned by yylex, without out-of-bounds checking.  */
-static const yytype_uint8 yytranslate[] =
+   as returned by yylex.  */
+static const yytype_int8 yytranslate[] =
 {
        0,     2,     2,     2,     2,     2,     2,     2,     2,     2,
        2,     2,     2,     2,     2,     2,     2,     2,     2,     2,
        2,     2,     2,     2,     2,     2,     2,     2,     2,     2,
-       2,     2,     2,    38,     2,     2,     2,    43,     2,     2,
-      46,    47,    41,    39,    48,    40,    49,    42,     2,     2,
+       2,     2,     2,    40,     2,     2,     2,    45,     2,     2,
+      48,    49,    43,    41,    50,    42,    51,    44,     2,     2,
        2,     2,     2,     2,     2,     2,     2,     2,     2,     2,
-      36,    35,    37,     2,     2,     2,     2,     2,     2,     2,
+      38,    37,    39,     2,     2,     2,     2,     2,     2,     2,
        2,     2,     2,     2,     2,     2,     2,     2,     2,     2,
        2,     2,     2,     2,     2,     2,     2,     2,     2,     2,
        2,     2,     2,     2,     2,     2,     2,     2,     2,     2,
@@ -505,323 +615,327 @@ static const yytype_uint8 yytranslate[] =
        5,     6,     7,     8,     9,    10,    11,    12,    13,    14,
       15,    16,    17,    18,    19,    20,    21,    22,    23,    24,
       25,    26,    27,    28,    29,    30,    31,    32,    33,    34,
-      44,    45
+      35,    36,    46,    47
 };
 
 #if YYDEBUG
-  /* YYRLINE[YYN] -- Source line where rule number YYN was defined.  */
-static const yytype_uint16 yyrline[] =
+/* YYRLINE[YYN] -- Source line where rule number YYN was defined.  */
+static const yytype_int16 yyrline[] =
 {
-       0,   122,   122,   123,   128,   134,   139,   147,   155,   162,
-     170,   178,   186,   194,   202,   210,   218,   226,   234,   242,
-     254,   263,   276,   285,   298,   307,   320,   327,   339,   345,
-     352,   360,   373,   378,   383,   387,   392,   397,   402,   437,
-     444,   451,   458,   465,   472,   508,   516,   522,   529,   538,
-     556,   576,   577,   580,   585,   591,   592,   594,   602,   603,
-     606,   615,   626,   641,   662,   693,   728,   753,   782,   788,
-     790,   791,   796,   797,   803,   810,   811,   814,   815,   818,
-     824,   830,   837,   838,   845,   846,   854,   864,   875,   886,
-     899,   910
+       0,   124,   124,   125,   130,   136,   141,   149,   157,   164,
+     172,   180,   188,   196,   204,   212,   220,   228,   236,   244,
+     256,   265,   278,   287,   300,   309,   322,   329,   341,   347,
+     354,   362,   375,   380,   385,   389,   394,   399,   404,   439,
+     446,   453,   460,   467,   474,   510,   535,   543,   549,   556,
+     565,   583,   603,   604,   607,   612,   618,   619,   621,   629,
+     630,   633,   642,   653,   668,   689,   714,   743,   749,   751,
+     752,   757,   758,   764,   771,   772,   775,   776,   779,   786,
+     787,   792,   793,   796,   797,   800,   806,   812,   819,   820,
+     827,   828,   836,   846,   857,   868,   881,   892
 };
 #endif
 
-#if YYDEBUG || YYERROR_VERBOSE || 1
+/** Accessing symbol of state STATE.  */
+#define YY_ACCESSING_SYMBOL(State) YY_CAST (yysymbol_kind_t, yystos[State])
+
+#if 1
+/* The user-facing name of the symbol whose (internal) number is
+   YYSYMBOL.  No bounds checking.  */
+static const char *yysymbol_name (yysymbol_kind_t yysymbol) YY_ATTRIBUTE_UNUSED;
+
 /* YYTNAME[SYMBOL-NUM] -- String name of the symbol SYMBOL-NUM.
    First, the terminals, then, starting at YYNTOKENS, nonterminals.  */
 static const char *const yytname[] =
 {
-  "\"end of string\"", "error", "$undefined", "\"integer number\"",
+  "\"end of string\"", "error", "\"invalid token\"", "\"integer number\"",
   "\"floating point number\"", "\"string\"", "\"identifier\"", "\"IN\"",
   "\"LIKE\"", "\"ESCAPE\"", "\"BETWEEN\"", "\"NULL\"", "\"IS\"",
   "\"SELECT\"", "\"LEFT\"", "\"JOIN\"", "\"WHERE\"", "\"ON\"", "\"ORDER\"",
   "\"BY\"", "\"FROM\"", "\"AS\"", "\"ASC\"", "\"DESC\"", "\"DISTINCT\"",
   "\"CAST\"", "\"UNION\"", "\"ALL\"", "\"LIMIT\"", "\"OFFSET\"",
-  "SWQT_VALUE_START", "SWQT_SELECT_START", "\"NOT\"", "\"OR\"", "\"AND\"",
-  "'='", "'<'", "'>'", "'!'", "'+'", "'-'", "'*'", "'/'", "'%'",
-  "SWQT_UMINUS", "\"reserved keyword\"", "'('", "')'", "','", "'.'",
-  "$accept", "input", "value_expr", "value_expr_list", "field_value",
-  "value_expr_non_logical", "type_def", "select_statement", "select_core",
-  "opt_union_all", "union_all", "select_field_list", "column_spec",
-  "as_clause", "opt_where", "opt_joins", "opt_order_by", "sort_spec_list",
-  "sort_spec", "opt_limit", "opt_offset", "table_def", YY_NULLPTR
+  "\"GROUP\"", "\"HAVING\"", "SWQT_VALUE_START", "SWQT_SELECT_START",
+  "\"NOT\"", "\"OR\"", "\"AND\"", "'='", "'<'", "'>'", "'!'", "'+'", "'-'",
+  "'*'", "'/'", "'%'", "SWQT_UMINUS", "\"reserved keyword\"", "'('", "')'",
+  "','", "'.'", "$accept", "input", "value_expr", "value_expr_list",
+  "field_value", "value_expr_non_logical", "type_def", "select_statement",
+  "select_core", "opt_union_all", "union_all", "select_field_list",
+  "column_spec", "as_clause", "opt_where", "opt_joins", "opt_group_by",
+  "group_spec_list", "group_spec", "opt_having", "opt_order_by",
+  "sort_spec_list", "sort_spec", "opt_limit", "opt_offset", "table_def", YY_NULLPTR
 };
-#endif
 
-# ifdef YYPRINT
-/* YYTOKNUM[NUM] -- (External) token number corresponding to the
-   (internal) symbol number NUM (which must be that of a token).  */
-static const yytype_uint16 yytoknum[] =
+static const char *
+yysymbol_name (yysymbol_kind_t yysymbol)
 {
-       0,   256,   257,   258,   259,   260,   261,   262,   263,   264,
-     265,   266,   267,   268,   269,   270,   271,   272,   273,   274,
-     275,   276,   277,   278,   279,   280,   281,   282,   283,   284,
-     285,   286,   287,   288,   289,    61,    60,    62,    33,    43,
-      45,    42,    47,    37,   290,   291,    40,    41,    44,    46
-};
-# endif
+  return yytname[yysymbol];
+}
+#endif
 
-#define YYPACT_NINF -126
+#define YYPACT_NINF (-116)
 
-#define yypact_value_is_default(Yystate) \
-  (!!((Yystate) == (-126)))
+#define yypact_value_is_default(Yyn) \
+  ((Yyn) == YYPACT_NINF)
 
-#define YYTABLE_NINF -1
+#define YYTABLE_NINF (-1)
 
-#define yytable_value_is_error(Yytable_value) \
+#define yytable_value_is_error(Yyn) \
   0
 
-  /* YYPACT[STATE-NUM] -- Index in YYTABLE of the portion describing
-     STATE-NUM.  */
+/* YYPACT[STATE-NUM] -- Index in YYTABLE of the portion describing
+   STATE-NUM.  */
 static const yytype_int16 yypact[] =
 {
-      10,   181,    -9,    12,  -126,  -126,  -126,   -29,  -126,   -27,
-     181,   204,   181,   314,  -126,   183,    53,     8,  -126,    28,
-    -126,   181,    59,   181,   352,  -126,   230,    30,   181,   204,
-      -8,     6,   181,   181,    86,   104,   158,    63,   204,   204,
-     204,   204,   204,    20,   171,  -126,   266,    94,    58,    69,
-      92,  -126,    -9,   223,    70,  -126,   299,  -126,   181,   111,
-      61,  -126,   110,    78,   181,   204,   331,   346,   181,   181,
-    -126,   181,   181,  -126,   181,  -126,   181,   -13,   -13,  -126,
-    -126,  -126,   148,     1,   107,  -126,   122,  -126,    55,   171,
-      28,  -126,  -126,   181,  -126,   124,    84,   181,   204,  -126,
-     181,   126,   357,  -126,  -126,  -126,  -126,  -126,  -126,   127,
-      91,  -126,    55,  -126,    88,     4,    65,  -126,  -126,  -126,
-      96,    93,  -126,  -126,   183,    98,   181,   204,    97,   100,
-       2,    65,   137,   142,  -126,   140,    55,   141,    49,  -126,
-    -126,  -126,   183,     2,  -126,   141,     2,     2,    55,   143,
-     181,   138,    36,    39,  -126,   138,  -126,  -126,   149,   181,
-     314,   146,   150,  -126,   165,  -126,   167,   150,   181,   281,
-     127,   168,   152,   132,   144,   152,   281,  -126,    90,  -126,
-     147,  -126,   194,  -126,  -126,  -126,  -126,  -126,  -126,  -126,
-     127,  -126,  -126
+      25,   217,   -10,    12,  -116,  -116,  -116,   -38,  -116,   -29,
+     217,   233,   217,   353,  -116,   212,    76,    11,  -116,    14,
+    -116,   167,    31,   217,   137,  -116,   261,    27,   217,   233,
+      -6,    78,   217,   217,    91,   117,   182,     5,   233,   233,
+     233,   233,   233,   -34,   192,  -116,   299,    24,    20,    44,
+      72,  -116,   -10,    68,   254,    82,  -116,   319,  -116,   217,
+      96,    70,  -116,   116,    84,   217,   233,   240,   360,   217,
+     217,  -116,   217,   217,  -116,   217,  -116,   217,    22,    22,
+    -116,  -116,  -116,   157,    -4,   114,  -116,   130,  -116,    56,
+     192,    14,  -116,  -116,  -116,   217,  -116,   131,    89,   217,
+     233,  -116,   217,   132,   333,  -116,  -116,  -116,  -116,  -116,
+    -116,   134,  -116,    56,  -116,    92,     0,    69,  -116,  -116,
+    -116,    98,   101,  -116,  -116,   212,   103,   217,   233,   102,
+     106,    69,   152,   158,  -116,   164,    56,   151,    23,  -116,
+    -116,  -116,   212,     2,   151,     2,     2,    56,   163,   217,
+     153,    41,    54,  -116,   153,  -116,  -116,   172,   217,   353,
+     165,   159,  -116,   191,  -116,   199,   159,   217,   307,   134,
+     217,   186,   162,   169,   186,   307,  -116,  -116,  -116,   156,
+     353,   189,   184,  -116,  -116,   184,  -116,   134,   134,   210,
+     185,   185,  -116,    86,  -116,   175,  -116,   224,  -116,  -116,
+    -116,  -116,   134,  -116,  -116
 };
 
-  /* YYDEFACT[STATE-NUM] -- Default reduction number in state STATE-NUM.
-     Performed when YYTABLE does not specify something else to do.  Zero
-     means the default is an error.  */
-static const yytype_uint8 yydefact[] =
+/* YYDEFACT[STATE-NUM] -- Default reduction number in state STATE-NUM.
+   Performed when YYTABLE does not specify something else to do.  Zero
+   means the default is an error.  */
+static const yytype_int8 yydefact[] =
 {
        2,     0,     0,     0,    32,    33,    34,    30,    37,     0,
-       0,     0,     0,     3,    35,     5,     0,     0,     4,    55,
+       0,     0,     0,     3,    35,     5,     0,     0,     4,    56,
        1,     0,     0,     0,     8,    38,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
-       0,     0,     0,    30,     0,    62,    60,     0,    58,     0,
-       0,    51,     0,    29,     0,    31,     0,    36,     0,    18,
-       0,    26,     0,     0,     0,     0,     7,     6,     0,     0,
-       9,     0,     0,    12,     0,    13,     0,    39,    40,    41,
-      42,    43,     0,     0,     0,    69,     0,    61,     0,     0,
-      55,    57,    56,     0,    44,     0,     0,     0,     0,    27,
-       0,    19,     0,    15,    16,    14,    10,    17,    11,     0,
-       0,    63,     0,    68,     0,    86,    72,    59,    52,    28,
-      46,     0,    22,    20,    24,     0,     0,     0,    30,     0,
-      64,    72,     0,     0,    87,     0,     0,    70,     0,    45,
-      23,    21,    25,    66,    65,    70,    88,    90,     0,     0,
-       0,    75,     0,     0,    67,    75,    89,    91,     0,     0,
-      71,     0,    82,    47,     0,    49,     0,    82,     0,    72,
-       0,     0,    84,     0,     0,    84,    72,    73,    79,    76,
-      78,    83,     0,    53,    48,    50,    54,    74,    80,    81,
-       0,    85,    77
+       0,     0,     0,    30,     0,    63,    61,     0,    59,     0,
+       0,    52,     0,     0,    29,     0,    31,     0,    36,     0,
+      18,     0,    26,     0,     0,     0,     0,     7,     6,     0,
+       0,     9,     0,     0,    12,     0,    13,     0,    39,    40,
+      41,    42,    43,     0,     0,     0,    68,     0,    62,     0,
+       0,    56,    58,    57,    45,     0,    44,     0,     0,     0,
+       0,    27,     0,    19,     0,    15,    16,    14,    10,    17,
+      11,     0,    64,     0,    67,     0,    92,    71,    60,    53,
+      28,    47,     0,    22,    20,    24,     0,     0,     0,    30,
+       0,    71,     0,     0,    93,     0,     0,    69,     0,    46,
+      23,    21,    25,    65,    69,    94,    96,     0,     0,     0,
+      74,     0,     0,    66,    74,    95,    97,     0,     0,    70,
+       0,    79,    48,     0,    50,     0,    79,     0,    71,     0,
+       0,    81,     0,     0,    81,    71,    72,    78,    75,    77,
+      80,     0,    88,    49,    51,    88,    73,     0,     0,     0,
+      90,    90,    76,    85,    82,    84,    89,     0,    54,    55,
+      86,    87,     0,    91,    83
 };
 
-  /* YYPGOTO[NTERM-NUM].  */
+/* YYPGOTO[NTERM-NUM].  */
 static const yytype_int16 yypgoto[] =
 {
-    -126,  -126,    -1,   -19,  -108,     7,  -126,   153,   182,   112,
-    -126,   -39,  -126,   139,    56,  -125,    45,    24,  -126,    51,
-      41,  -110
+    -116,  -116,    -1,   -39,  -110,     7,  -116,   177,   214,   141,
+    -116,   -40,  -116,   -91,    97,  -115,    79,    58,  -116,    77,
+      75,    61,  -116,    85,    55,  -106
 };
 
-  /* YYDEFGOTO[NTERM-NUM].  */
-static const yytype_int16 yydefgoto[] =
+/* YYDEFGOTO[NTERM-NUM].  */
+static const yytype_uint8 yydefgoto[] =
 {
-      -1,     3,    53,    54,    14,    15,   121,    18,    19,    51,
-      52,    47,    48,    87,   151,   137,   162,   179,   180,   172,
-     183,   116
+       0,     3,    54,    55,    14,    15,   122,    18,    19,    51,
+      52,    47,    48,    88,   150,   137,   161,   178,   179,   171,
+     182,   194,   195,   190,   198,   117
 };
 
-  /* YYTABLE[YYPACT[STATE-NUM]] -- What to do in state STATE-NUM.  If
-     positive, shift that token.  If negative, reduce the rule whose
-     number is the opposite.  If YYTABLE_NINF, syntax error.  */
+/* YYTABLE[YYPACT[STATE-NUM]] -- What to do in state STATE-NUM.  If
+   positive, shift that token.  If negative, reduce the rule whose
+   number is the opposite.  If YYTABLE_NINF, syntax error.  */
 static const yytype_uint8 yytable[] =
 {
-      13,   129,   131,    61,    16,    84,   145,    55,    85,    24,
-      85,    26,    20,    63,    64,    46,    65,    21,    25,    23,
-      22,    16,    56,    86,    62,    86,   149,    59,    40,    41,
-      42,    66,    67,    70,    73,    75,    60,    17,   158,    96,
-       1,     2,   111,    46,   177,    77,    78,    79,    80,    81,
-     117,   187,   152,   133,    50,   153,     4,     5,     6,    43,
-     114,   115,   178,   101,     8,    55,    82,   103,   104,    83,
-     105,   106,   102,   107,   119,   108,    58,    44,     9,   135,
-     136,   125,   178,   163,   164,    10,   165,   166,    46,     4,
-       5,     6,     7,    11,    45,    98,   123,     8,    76,    12,
-      38,    39,    40,    41,    42,   124,    89,     4,     5,     6,
-       7,     9,   188,   189,    88,     8,    90,    94,    10,    91,
-      97,    99,    68,    69,   100,   141,    11,   112,   113,     9,
-     120,   122,    12,   128,   142,   126,    10,   132,   130,    71,
-     139,    72,   138,   146,    11,   140,    22,   143,   147,   160,
-      12,     4,     5,     6,     7,   148,   161,   150,   169,     8,
-     159,     4,     5,     6,     7,   170,   168,   176,   173,     8,
-     174,   181,   109,     9,     4,     5,     6,    43,   171,   184,
-      10,   182,     8,     9,     4,     5,     6,     7,    11,   110,
-      10,   185,     8,    74,    12,   190,     9,   191,    11,    49,
-     167,   155,   118,    10,    12,    92,     9,     4,     5,     6,
-       7,    11,    45,    10,   192,     8,   186,    12,   175,     0,
-       0,    11,    38,    39,    40,    41,    42,    12,     0,     9,
-      27,    28,     0,    29,     0,    30,     0,    27,    28,     0,
-      29,     0,    30,     0,    11,     0,     0,     0,     0,     0,
-      12,     0,     0,     0,   134,    31,    32,    33,    34,    35,
-      36,    37,    31,    32,    33,    34,    35,    36,    37,   144,
-       0,    93,    85,    27,    28,     0,    29,    57,    30,     0,
-       0,     0,   154,     0,     0,   156,   157,    86,    27,    28,
-       0,    29,     0,    30,     0,   135,   136,     0,    31,    32,
-      33,    34,    35,    36,    37,     0,    27,    28,     0,    29,
+      13,   130,    56,    16,    85,    62,    86,   131,    86,    24,
+      21,    26,    20,    22,    83,    46,   144,    84,    25,    23,
+      98,    87,    57,    87,    16,   134,   151,    60,    63,   152,
+     148,    67,    68,    71,    74,    76,    61,    56,    17,   112,
+      50,   157,    77,    46,    89,    78,    79,    80,    81,    82,
+     118,   133,   153,   176,   155,   156,   120,     1,     2,   177,
+     186,   115,   116,   126,   103,    40,    41,    42,   105,   106,
+      90,   107,   108,   104,   109,    59,   110,   177,   193,     4,
+       5,     6,    43,   135,   136,    64,    65,     8,    66,    46,
+     162,   163,   193,    91,     4,     5,     6,     7,   124,    92,
+      44,     9,     8,   164,   165,    99,   100,   125,   200,   201,
+      10,    38,    39,    40,    41,    42,     9,    94,    11,    45,
+       4,     5,     6,     7,    12,    10,   141,   101,     8,    69,
+      70,    96,   102,    11,   113,   142,   114,   121,   123,    12,
+     129,   127,     9,   132,    27,    28,   138,    29,   159,    30,
+     139,    10,   140,    22,    72,   143,    73,   168,   145,    11,
+       4,     5,     6,     7,   146,    12,   175,   149,     8,   180,
+       4,     5,     6,     7,    34,    35,    36,    37,     8,   147,
+     158,   111,     9,   160,   169,     4,     5,     6,     7,   167,
+     170,    10,     9,     8,   172,     4,     5,     6,    43,    11,
+      53,    10,   173,     8,   181,    12,   187,     9,   188,    11,
+      53,   183,   189,   196,   197,    12,    10,     9,   184,    75,
+       4,     5,     6,     7,    11,   202,    10,   203,     8,    93,
+      12,    49,   119,   166,    11,    45,     4,     5,     6,     7,
+      12,   154,     9,   174,     8,   192,   199,    27,    28,   185,
+      29,    10,    30,    38,    39,    40,    41,    42,     9,    11,
+       0,    27,    28,   204,    29,    12,    30,     0,    27,    28,
+     191,    29,     0,    30,    31,    11,    33,    34,    35,    36,
+      37,    12,     0,     0,     0,     0,     0,     0,    31,    32,
+      33,    34,    35,    36,    37,    31,    32,    33,    34,    35,
+      36,    37,     0,     0,    95,    86,    27,    28,     0,    29,
+      58,    30,     0,     0,    27,    28,     0,    29,     0,    30,
+      87,   135,   136,     0,     0,     0,    27,    28,     0,    29,
        0,    30,     0,    31,    32,    33,    34,    35,    36,    37,
-      95,    27,    28,     0,    29,     0,    30,     0,     0,     0,
-       0,    31,    32,    33,    34,    35,    36,    37,    27,    28,
-       0,    29,     0,    30,     0,     0,    31,    32,    33,    34,
-      35,    36,    37,    27,    28,     0,    29,     0,    30,    27,
-      28,     0,    29,    31,    30,    33,    34,    35,    36,    37,
-       0,     0,     0,     0,     0,     0,     0,     0,    31,     0,
-       0,    34,    35,    36,    37,     0,     0,    34,    35,    36,
-      37,   127,     0,     0,     0,     0,    38,    39,    40,    41,
-      42
+      97,    31,    32,    33,    34,    35,    36,    37,     0,     0,
+       0,     0,     0,    31,    32,    33,    34,    35,    36,    37,
+      27,    28,     0,    29,     0,    30,     0,    27,    28,   128,
+      29,     0,    30,     0,    38,    39,    40,    41,    42,     0,
+       0,     0,     0,     0,     0,     0,     0,    31,    32,    33,
+      34,    35,    36,    37,    31,     0,     0,    34,    35,    36,
+      37
 };
 
 static const yytype_int16 yycheck[] =
 {
-       1,   109,   112,    11,    13,    44,   131,     6,     6,    10,
-       6,    12,     0,     7,     8,    16,    10,    46,    11,    46,
-      49,    13,    23,    21,    32,    21,   136,    28,    41,    42,
-      43,    32,    33,    34,    35,    36,    29,    46,   148,    58,
-      30,    31,    41,    44,   169,    38,    39,    40,    41,    42,
-      89,   176,     3,    49,    26,     6,     3,     4,     5,     6,
-       5,     6,   170,    64,    11,     6,    46,    68,    69,    49,
-      71,    72,    65,    74,    93,    76,    46,    24,    25,    14,
-      15,   100,   190,    47,    48,    32,    47,    48,    89,     3,
-       4,     5,     6,    40,    41,    34,    97,    11,    35,    46,
-      39,    40,    41,    42,    43,    98,    48,     3,     4,     5,
-       6,    25,    22,    23,    20,    11,    47,    47,    32,    27,
-       9,    11,    36,    37,    46,   126,    40,    20,     6,    25,
-       6,    47,    46,     6,   127,     9,    32,    49,    47,    35,
-      47,    37,    46,     6,    40,    47,    49,    47,     6,   150,
-      46,     3,     4,     5,     6,    15,    18,    16,   159,    11,
-      17,     3,     4,     5,     6,    19,    17,   168,     3,    11,
-       3,     3,    24,    25,     3,     4,     5,     6,    28,    47,
-      32,    29,    11,    25,     3,     4,     5,     6,    40,    41,
-      32,    47,    11,    35,    46,    48,    25,     3,    40,    17,
-     155,   145,    90,    32,    46,    52,    25,     3,     4,     5,
-       6,    40,    41,    32,   190,    11,   175,    46,   167,    -1,
-      -1,    40,    39,    40,    41,    42,    43,    46,    -1,    25,
-       7,     8,    -1,    10,    -1,    12,    -1,     7,     8,    -1,
-      10,    -1,    12,    -1,    40,    -1,    -1,    -1,    -1,    -1,
-      46,    -1,    -1,    -1,   115,    32,    33,    34,    35,    36,
-      37,    38,    32,    33,    34,    35,    36,    37,    38,   130,
-      -1,    48,     6,     7,     8,    -1,    10,    47,    12,    -1,
-      -1,    -1,   143,    -1,    -1,   146,   147,    21,     7,     8,
-      -1,    10,    -1,    12,    -1,    14,    15,    -1,    32,    33,
-      34,    35,    36,    37,    38,    -1,     7,     8,    -1,    10,
-      -1,    12,    -1,    32,    33,    34,    35,    36,    37,    38,
-      21,     7,     8,    -1,    10,    -1,    12,    -1,    -1,    -1,
-      -1,    32,    33,    34,    35,    36,    37,    38,     7,     8,
-      -1,    10,    -1,    12,    -1,    -1,    32,    33,    34,    35,
-      36,    37,    38,     7,     8,    -1,    10,    -1,    12,     7,
-       8,    -1,    10,    32,    12,    34,    35,    36,    37,    38,
-      -1,    -1,    -1,    -1,    -1,    -1,    -1,    -1,    32,    -1,
-      -1,    35,    36,    37,    38,    -1,    -1,    35,    36,    37,
-      38,    34,    -1,    -1,    -1,    -1,    39,    40,    41,    42,
-      43
+       1,   111,     6,    13,    44,    11,     6,   113,     6,    10,
+      48,    12,     0,    51,    48,    16,   131,    51,    11,    48,
+      59,    21,    23,    21,    13,   116,     3,    28,    34,     6,
+     136,    32,    33,    34,    35,    36,    29,     6,    48,    43,
+      26,   147,    37,    44,    20,    38,    39,    40,    41,    42,
+      90,    51,   143,   168,   145,   146,    95,    32,    33,   169,
+     175,     5,     6,   102,    65,    43,    44,    45,    69,    70,
+      50,    72,    73,    66,    75,    48,    77,   187,   188,     3,
+       4,     5,     6,    14,    15,     7,     8,    11,    10,    90,
+      49,    50,   202,    49,     3,     4,     5,     6,    99,    27,
+      24,    25,    11,    49,    50,     9,    36,   100,    22,    23,
+      34,    41,    42,    43,    44,    45,    25,    49,    42,    43,
+       3,     4,     5,     6,    48,    34,   127,    11,    11,    38,
+      39,    49,    48,    42,    20,   128,     6,     6,    49,    48,
+       6,     9,    25,    51,     7,     8,    48,    10,   149,    12,
+      49,    34,    49,    51,    37,    49,    39,   158,     6,    42,
+       3,     4,     5,     6,     6,    48,   167,    16,    11,   170,
+       3,     4,     5,     6,    37,    38,    39,    40,    11,    15,
+      17,    24,    25,    30,    19,     3,     4,     5,     6,    17,
+      31,    34,    25,    11,     3,     3,     4,     5,     6,    42,
+      43,    34,     3,    11,    18,    48,    50,    25,    19,    42,
+      43,    49,    28,     3,    29,    48,    34,    25,    49,    37,
+       3,     4,     5,     6,    42,    50,    34,     3,    11,    52,
+      48,    17,    91,   154,    42,    43,     3,     4,     5,     6,
+      48,   144,    25,   166,    11,   187,   191,     7,     8,   174,
+      10,    34,    12,    41,    42,    43,    44,    45,    25,    42,
+      -1,     7,     8,   202,    10,    48,    12,    -1,     7,     8,
+     185,    10,    -1,    12,    34,    42,    36,    37,    38,    39,
+      40,    48,    -1,    -1,    -1,    -1,    -1,    -1,    34,    35,
+      36,    37,    38,    39,    40,    34,    35,    36,    37,    38,
+      39,    40,    -1,    -1,    50,     6,     7,     8,    -1,    10,
+      49,    12,    -1,    -1,     7,     8,    -1,    10,    -1,    12,
+      21,    14,    15,    -1,    -1,    -1,     7,     8,    -1,    10,
+      -1,    12,    -1,    34,    35,    36,    37,    38,    39,    40,
+      21,    34,    35,    36,    37,    38,    39,    40,    -1,    -1,
+      -1,    -1,    -1,    34,    35,    36,    37,    38,    39,    40,
+       7,     8,    -1,    10,    -1,    12,    -1,     7,     8,    36,
+      10,    -1,    12,    -1,    41,    42,    43,    44,    45,    -1,
+      -1,    -1,    -1,    -1,    -1,    -1,    -1,    34,    35,    36,
+      37,    38,    39,    40,    34,    -1,    -1,    37,    38,    39,
+      40
 };
 
-  /* YYSTOS[STATE-NUM] -- The (internal number of the) accessing
-     symbol of state STATE-NUM.  */
-static const yytype_uint8 yystos[] =
+/* YYSTOS[STATE-NUM] -- The symbol kind of the accessing symbol of
+   state STATE-NUM.  */
+static const yytype_int8 yystos[] =
 {
-       0,    30,    31,    51,     3,     4,     5,     6,    11,    25,
-      32,    40,    46,    52,    54,    55,    13,    46,    57,    58,
-       0,    46,    49,    46,    52,    55,    52,     7,     8,    10,
-      12,    32,    33,    34,    35,    36,    37,    38,    39,    40,
-      41,    42,    43,     6,    24,    41,    52,    61,    62,    58,
-      26,    59,    60,    52,    53,     6,    52,    47,    46,    52,
-      55,    11,    32,     7,     8,    10,    52,    52,    36,    37,
-      52,    35,    37,    52,    35,    52,    35,    55,    55,    55,
-      55,    55,    46,    49,    61,     6,    21,    63,    20,    48,
-      47,    27,    57,    48,    47,    21,    53,     9,    34,    11,
-      46,    52,    55,    52,    52,    52,    52,    52,    52,    24,
-      41,    41,    20,     6,     5,     6,    71,    61,    59,    53,
-       6,    56,    47,    52,    55,    53,     9,    34,     6,    54,
-      47,    71,    49,    49,    63,    14,    15,    65,    46,    47,
-      47,    52,    55,    47,    63,    65,     6,     6,    15,    71,
-      16,    64,     3,     6,    63,    64,    63,    63,    71,    17,
-      52,    18,    66,    47,    48,    47,    48,    66,    17,    52,
-      19,    28,    69,     3,     3,    69,    52,    65,    54,    67,
-      68,     3,    29,    70,    47,    47,    70,    65,    22,    23,
-      48,     3,    67
+       0,    32,    33,    53,     3,     4,     5,     6,    11,    25,
+      34,    42,    48,    54,    56,    57,    13,    48,    59,    60,
+       0,    48,    51,    48,    54,    57,    54,     7,     8,    10,
+      12,    34,    35,    36,    37,    38,    39,    40,    41,    42,
+      43,    44,    45,     6,    24,    43,    54,    63,    64,    60,
+      26,    61,    62,    43,    54,    55,     6,    54,    49,    48,
+      54,    57,    11,    34,     7,     8,    10,    54,    54,    38,
+      39,    54,    37,    39,    54,    37,    54,    37,    57,    57,
+      57,    57,    57,    48,    51,    63,     6,    21,    65,    20,
+      50,    49,    27,    59,    49,    50,    49,    21,    55,     9,
+      36,    11,    48,    54,    57,    54,    54,    54,    54,    54,
+      54,    24,    43,    20,     6,     5,     6,    77,    63,    61,
+      55,     6,    58,    49,    54,    57,    55,     9,    36,     6,
+      56,    77,    51,    51,    65,    14,    15,    67,    48,    49,
+      49,    54,    57,    49,    67,     6,     6,    15,    77,    16,
+      66,     3,     6,    65,    66,    65,    65,    77,    17,    54,
+      30,    68,    49,    50,    49,    50,    68,    17,    54,    19,
+      31,    71,     3,     3,    71,    54,    67,    56,    69,    70,
+      54,    18,    72,    49,    49,    72,    67,    50,    19,    28,
+      75,    75,    69,    56,    73,    74,     3,    29,    76,    76,
+      22,    23,    50,     3,    73
 };
 
-  /* YYR1[YYN] -- Symbol number of symbol that rule YYN derives.  */
-static const yytype_uint8 yyr1[] =
+/* YYR1[RULE-NUM] -- Symbol kind of the left-hand side of rule RULE-NUM.  */
+static const yytype_int8 yyr1[] =
 {
-       0,    50,    51,    51,    51,    52,    52,    52,    52,    52,
-      52,    52,    52,    52,    52,    52,    52,    52,    52,    52,
-      52,    52,    52,    52,    52,    52,    52,    52,    53,    53,
-      54,    54,    55,    55,    55,    55,    55,    55,    55,    55,
-      55,    55,    55,    55,    55,    55,    56,    56,    56,    56,
-      56,    57,    57,    58,    58,    59,    59,    60,    61,    61,
-      62,    62,    62,    62,    62,    62,    62,    62,    63,    63,
-      64,    64,    65,    65,    65,    66,    66,    67,    67,    68,
-      68,    68,    69,    69,    70,    70,    71,    71,    71,    71,
-      71,    71
+       0,    52,    53,    53,    53,    54,    54,    54,    54,    54,
+      54,    54,    54,    54,    54,    54,    54,    54,    54,    54,
+      54,    54,    54,    54,    54,    54,    54,    54,    55,    55,
+      56,    56,    57,    57,    57,    57,    57,    57,    57,    57,
+      57,    57,    57,    57,    57,    57,    57,    58,    58,    58,
+      58,    58,    59,    59,    60,    60,    61,    61,    62,    63,
+      63,    64,    64,    64,    64,    64,    64,    65,    65,    66,
+      66,    67,    67,    67,    68,    68,    69,    69,    70,    71,
+      71,    72,    72,    73,    73,    74,    74,    74,    75,    75,
+      76,    76,    77,    77,    77,    77,    77,    77
 };
 
-  /* YYR2[YYN] -- Number of symbols on the right hand side of rule YYN.  */
-static const yytype_uint8 yyr2[] =
+/* YYR2[RULE-NUM] -- Number of symbols on the right-hand side of rule RULE-NUM.  */
+static const yytype_int8 yyr2[] =
 {
        0,     2,     0,     2,     2,     1,     3,     3,     2,     3,
        4,     4,     3,     3,     4,     4,     4,     4,     3,     4,
        5,     6,     5,     6,     5,     6,     3,     4,     3,     1,
        1,     3,     1,     1,     1,     1,     3,     1,     2,     3,
-       3,     3,     3,     3,     4,     6,     1,     4,     6,     4,
-       6,     2,     4,     9,    10,     0,     2,     2,     1,     3,
-       1,     2,     1,     3,     4,     5,     5,     6,     2,     1,
-       0,     2,     0,     5,     6,     0,     3,     3,     1,     1,
-       2,     2,     0,     2,     0,     2,     1,     2,     3,     4,
-       3,     4
+       3,     3,     3,     3,     4,     4,     6,     1,     4,     6,
+       4,     6,     2,     4,    11,    12,     0,     2,     2,     1,
+       3,     1,     2,     1,     3,     5,     6,     2,     1,     0,
+       2,     0,     5,     6,     0,     3,     3,     1,     1,     0,
+       2,     0,     3,     3,     1,     1,     2,     2,     0,     2,
+       0,     2,     1,     2,     3,     4,     3,     4
 };
 
 
+enum { YYENOMEM = -2 };
+
 #define yyerrok         (yyerrstatus = 0)
 #define yyclearin       (yychar = YYEMPTY)
-#define YYEMPTY         (-2)
-#define YYEOF           0
 
 #define YYACCEPT        goto yyacceptlab
 #define YYABORT         goto yyabortlab
 #define YYERROR         goto yyerrorlab
+#define YYNOMEM         goto yyexhaustedlab
 
 
 #define YYRECOVERING()  (!!yyerrstatus)
 
-#define YYBACKUP(Token, Value)                                  \
-do                                                              \
-  if (yychar == YYEMPTY)                                        \
-    {                                                           \
-      yychar = (Token);                                         \
-      yylval = (Value);                                         \
-      YYPOPSTACK (yylen);                                       \
-      yystate = *yyssp;                                         \
-      goto yybackup;                                            \
-    }                                                           \
-  else                                                          \
-    {                                                           \
-      yyerror (context, YY_("syntax error: cannot back up")); \
-      YYERROR;                                                  \
-    }                                                           \
-while (0)
-
-/* Error token number */
-#define YYTERROR        1
-#define YYERRCODE       256
-
+#define YYBACKUP(Token, Value)                                    \
+  do                                                              \
+    if (yychar == YYEMPTY)                                        \
+      {                                                           \
+        yychar = (Token);                                         \
+        yylval = (Value);                                         \
+        YYPOPSTACK (yylen);                                       \
+        yystate = *yyssp;                                         \
+        goto yybackup;                                            \
+      }                                                           \
+    else                                                          \
+      {                                                           \
+        yyerror (context, YY_("syntax error: cannot back up")); \
+        YYERROR;                                                  \
+      }                                                           \
+  while (0)
+
+/* Backward compatibility with an undocumented macro.
+   Use YYerror or YYUNDEF. */
+#define YYERRCODE YYUNDEF
 
 
 /* Enable debugging if requested.  */
@@ -838,56 +952,53 @@ do {                                            \
     YYFPRINTF Args;                             \
 } while (0)
 
-/* This macro is provided for backward compatibility. */
-#ifndef YY_LOCATION_PRINT
-# define YY_LOCATION_PRINT(File, Loc) ((void) 0)
-#endif
 
 
-# define YY_SYMBOL_PRINT(Title, Type, Value, Location)                    \
+
+# define YY_SYMBOL_PRINT(Title, Kind, Value, Location)                    \
 do {                                                                      \
   if (yydebug)                                                            \
     {                                                                     \
       YYFPRINTF (stderr, "%s ", Title);                                   \
       yy_symbol_print (stderr,                                            \
-                  Type, Value, context); \
+                  Kind, Value, context); \
       YYFPRINTF (stderr, "\n");                                           \
     }                                                                     \
 } while (0)
 
 
-/*----------------------------------------.
-| Print this symbol's value on YYOUTPUT.  |
-`----------------------------------------*/
+/*-----------------------------------.
+| Print this symbol's value on YYO.  |
+`-----------------------------------*/
 
 static void
-yy_symbol_value_print (FILE *yyoutput, int yytype, YYSTYPE const * const yyvaluep, swq_parse_context *context)
+yy_symbol_value_print (FILE *yyo,
+                       yysymbol_kind_t yykind, YYSTYPE const * const yyvaluep, swq_parse_context *context)
 {
-  FILE *yyo = yyoutput;
-  YYUSE (yyo);
-  YYUSE (context);
+  FILE *yyoutput = yyo;
+  YY_USE (yyoutput);
+  YY_USE (context);
   if (!yyvaluep)
     return;
-# ifdef YYPRINT
-  if (yytype < YYNTOKENS)
-    YYPRINT (yyoutput, yytoknum[yytype], *yyvaluep);
-# endif
-  YYUSE (yytype);
+  YY_IGNORE_MAYBE_UNINITIALIZED_BEGIN
+  YY_USE (yykind);
+  YY_IGNORE_MAYBE_UNINITIALIZED_END
 }
 
 
-/*--------------------------------.
-| Print this symbol on YYOUTPUT.  |
-`--------------------------------*/
+/*---------------------------.
+| Print this symbol on YYO.  |
+`---------------------------*/
 
 static void
-yy_symbol_print (FILE *yyoutput, int yytype, YYSTYPE const * const yyvaluep, swq_parse_context *context)
+yy_symbol_print (FILE *yyo,
+                 yysymbol_kind_t yykind, YYSTYPE const * const yyvaluep, swq_parse_context *context)
 {
-  YYFPRINTF (yyoutput, "%s %s (",
-             yytype < YYNTOKENS ? "token" : "nterm", yytname[yytype]);
+  YYFPRINTF (yyo, "%s %s (",
+             yykind < YYNTOKENS ? "token" : "nterm", yysymbol_name (yykind));
 
-  yy_symbol_value_print (yyoutput, yytype, yyvaluep, context);
-  YYFPRINTF (yyoutput, ")");
+  yy_symbol_value_print (yyo, yykind, yyvaluep, context);
+  YYFPRINTF (yyo, ")");
 }
 
 /*------------------------------------------------------------------.
@@ -896,7 +1007,7 @@ yy_symbol_print (FILE *yyoutput, int yytype, YYSTYPE const * const yyvaluep, swq
 `------------------------------------------------------------------*/
 
 static void
-yy_stack_print (yytype_int16 *yybottom, yytype_int16 *yytop)
+yy_stack_print (yy_state_t *yybottom, yy_state_t *yytop)
 {
   YYFPRINTF (stderr, "Stack now");
   for (; yybottom <= yytop; yybottom++)
@@ -919,21 +1030,21 @@ do {                                                            \
 `------------------------------------------------*/
 
 static void
-yy_reduce_print (yytype_int16 *yyssp, YYSTYPE *yyvsp, int yyrule, swq_parse_context *context)
+yy_reduce_print (yy_state_t *yyssp, YYSTYPE *yyvsp,
+                 int yyrule, swq_parse_context *context)
 {
-  unsigned long int yylno = yyrline[yyrule];
+  int yylno = yyrline[yyrule];
   int yynrhs = yyr2[yyrule];
   int yyi;
-  YYFPRINTF (stderr, "Reducing stack by rule %d (line %lu):\n",
+  YYFPRINTF (stderr, "Reducing stack by rule %d (line %d):\n",
              yyrule - 1, yylno);
   /* The symbols being reduced.  */
   for (yyi = 0; yyi < yynrhs; yyi++)
     {
       YYFPRINTF (stderr, "   $%d = ", yyi + 1);
       yy_symbol_print (stderr,
-                       yystos[yyssp[yyi + 1 - yynrhs]],
-                       &(yyvsp[(yyi + 1) - (yynrhs)])
-                                              , context);
+                       YY_ACCESSING_SYMBOL (+yyssp[yyi + 1 - yynrhs]),
+                       &yyvsp[(yyi + 1) - (yynrhs)], context);
       YYFPRINTF (stderr, "\n");
     }
 }
@@ -948,8 +1059,8 @@ do {                                    \
    multiple parsers can coexist.  */
 int yydebug;
 #else /* !YYDEBUG */
-# define YYDPRINTF(Args)
-# define YY_SYMBOL_PRINT(Title, Type, Value, Location)
+# define YYDPRINTF(Args) ((void) 0)
+# define YY_SYMBOL_PRINT(Title, Kind, Value, Location)
 # define YY_STACK_PRINT(Bottom, Top)
 # define YY_REDUCE_PRINT(Rule)
 #endif /* !YYDEBUG */
@@ -972,28 +1083,76 @@ int yydebug;
 #endif
 
 
-#if YYERROR_VERBOSE
+/* Context of a parse error.  */
+typedef struct
+{
+  yy_state_t *yyssp;
+  yysymbol_kind_t yytoken;
+} yypcontext_t;
+
+/* Put in YYARG at most YYARGN of the expected tokens given the
+   current YYCTX, and return the number of tokens stored in YYARG.  If
+   YYARG is null, return the number of expected tokens (guaranteed to
+   be less than YYNTOKENS).  Return YYENOMEM on memory exhaustion.
+   Return 0 if there are more than YYARGN expected tokens, yet fill
+   YYARG up to YYARGN. */
+static int
+yypcontext_expected_tokens (const yypcontext_t *yyctx,
+                            yysymbol_kind_t yyarg[], int yyargn)
+{
+  /* Actual size of YYARG. */
+  int yycount = 0;
+  int yyn = yypact[+*yyctx->yyssp];
+  if (!yypact_value_is_default (yyn))
+    {
+      /* Start YYX at -YYN if negative to avoid negative indexes in
+         YYCHECK.  In other words, skip the first -YYN actions for
+         this state because they are default actions.  */
+      int yyxbegin = yyn < 0 ? -yyn : 0;
+      /* Stay within bounds of both yycheck and yytname.  */
+      int yychecklim = YYLAST - yyn + 1;
+      int yyxend = yychecklim < YYNTOKENS ? yychecklim : YYNTOKENS;
+      int yyx;
+      for (yyx = yyxbegin; yyx < yyxend; ++yyx)
+        if (yycheck[yyx + yyn] == yyx && yyx != YYSYMBOL_YYerror
+            && !yytable_value_is_error (yytable[yyx + yyn]))
+          {
+            if (!yyarg)
+              ++yycount;
+            else if (yycount == yyargn)
+              return 0;
+            else
+              yyarg[yycount++] = YY_CAST (yysymbol_kind_t, yyx);
+          }
+    }
+  if (yyarg && yycount == 0 && 0 < yyargn)
+    yyarg[0] = YYSYMBOL_YYEMPTY;
+  return yycount;
+}
 
-# ifndef yystrlen
-#  if defined __GLIBC__ && defined _STRING_H
-#   define yystrlen strlen
-#  else
+
+
+
+#ifndef yystrlen
+# if defined __GLIBC__ && defined _STRING_H
+#  define yystrlen(S) (YY_CAST (YYPTRDIFF_T, strlen (S)))
+# else
 /* Return the length of YYSTR.  */
-static YYSIZE_T
+static YYPTRDIFF_T
 yystrlen (const char *yystr)
 {
-  YYSIZE_T yylen;
+  YYPTRDIFF_T yylen;
   for (yylen = 0; yystr[yylen]; yylen++)
     continue;
   return yylen;
 }
-#  endif
 # endif
+#endif
 
-# ifndef yystpcpy
-#  if defined __GLIBC__ && defined _STRING_H && defined _GNU_SOURCE
-#   define yystpcpy stpcpy
-#  else
+#ifndef yystpcpy
+# if defined __GLIBC__ && defined _STRING_H && defined _GNU_SOURCE
+#  define yystpcpy stpcpy
+# else
 /* Copy YYSRC to YYDEST, returning the address of the terminating '\0' in
    YYDEST.  */
 static char *
@@ -1007,10 +1166,10 @@ yystpcpy (char *yydest, const char *yysrc)
 
   return yyd - 1;
 }
-#  endif
 # endif
+#endif
 
-# ifndef yytnamerr
+#ifndef yytnamerr
 /* Copy to YYRES the contents of YYSTR after stripping away unnecessary
    quotes and backslashes, so that it's suitable for yyerror.  The
    heuristic is that double-quoting is unnecessary unless the string
@@ -1018,14 +1177,13 @@ yystpcpy (char *yydest, const char *yysrc)
    backslash-backslash).  YYSTR is taken from yytname.  If YYRES is
    null, do not copy; instead, return the length of what the result
    would have been.  */
-static YYSIZE_T
+static YYPTRDIFF_T
 yytnamerr (char *yyres, const char *yystr)
 {
   if (*yystr == '"')
     {
-      YYSIZE_T yyn = 0;
+      YYPTRDIFF_T yyn = 0;
       char const *yyp = yystr;
-
       for (;;)
         switch (*++yyp)
           {
@@ -1036,7 +1194,10 @@ yytnamerr (char *yyres, const char *yystr)
           case '\\':
             if (*++yyp != '\\')
               goto do_not_strip_quotes;
-            CPL_FALLTHROUGH
+            else
+              goto append;
+
+          append:
           default:
             if (yyres)
               yyres[yyn] = *yyp;
@@ -1051,36 +1212,20 @@ yytnamerr (char *yyres, const char *yystr)
     do_not_strip_quotes: ;
     }
 
-  if (! yyres)
+  if (yyres)
+    return yystpcpy (yyres, yystr) - yyres;
+  else
     return yystrlen (yystr);
-
-  return yystpcpy (yyres, yystr) - yyres;
 }
-# endif
+#endif
 
-/* Copy into *YYMSG, which is of size *YYMSG_ALLOC, an error message
-   about the unexpected token YYTOKEN for the state stack whose top is
-   YYSSP.
 
-   Return 0 if *YYMSG was successfully written.  Return 1 if *YYMSG is
-   not large enough to hold the message.  In that case, also set
-   *YYMSG_ALLOC to the required number of bytes.  Return 2 if the
-   required number of bytes is too large to store.  */
 static int
-yysyntax_error (YYSIZE_T *yymsg_alloc, char **yymsg,
-                yytype_int16 *yyssp, int yytoken)
+yy_syntax_error_arguments (const yypcontext_t *yyctx,
+                           yysymbol_kind_t yyarg[], int yyargn)
 {
-  YYSIZE_T yysize0 = yytnamerr (YY_NULLPTR, yytname[yytoken]);
-  YYSIZE_T yysize = yysize0;
-  enum { YYERROR_VERBOSE_ARGS_MAXIMUM = 5 };
-  /* Internationalized format string. */
-  const char *yyformat = YY_NULLPTR;
-  /* Arguments of yyformat. */
-  char const *yyarg[YYERROR_VERBOSE_ARGS_MAXIMUM];
-  /* Number of reported tokens (one for the "unexpected", one per
-     "expected"). */
+  /* Actual size of YYARG. */
   int yycount = 0;
-
   /* There are many possibilities here to consider:
      - If this state is a consistent state with a default action, then
        the only way this function was invoked is if the default action
@@ -1104,63 +1249,78 @@ yysyntax_error (YYSIZE_T *yymsg_alloc, char **yymsg,
        one exception: it will still contain any token that will not be
        accepted due to an error action in a later state.
   */
-  if (yytoken != YYEMPTY)
-    {
-      int yyn = yypact[*yyssp];
-      yyarg[yycount++] = yytname[yytoken];
-      if (!yypact_value_is_default (yyn))
-        {
-          /* Start YYX at -YYN if negative to avoid negative indexes in
-             YYCHECK.  In other words, skip the first -YYN actions for
-             this state because they are default actions.  */
-          int yyxbegin = yyn < 0 ? -yyn : 0;
-          /* Stay within bounds of both yycheck and yytname.  */
-          int yychecklim = YYLAST - yyn + 1;
-          int yyxend = yychecklim < YYNTOKENS ? yychecklim : YYNTOKENS;
-          int yyx;
-
-          for (yyx = yyxbegin; yyx < yyxend; ++yyx)
-            if (yycheck[yyx + yyn] == yyx && yyx != YYTERROR
-                && !yytable_value_is_error (yytable[yyx + yyn]))
-              {
-                if (yycount == YYERROR_VERBOSE_ARGS_MAXIMUM)
-                  {
-                    yycount = 1;
-                    yysize = yysize0;
-                    break;
-                  }
-                yyarg[yycount++] = yytname[yyx];
-                {
-                  YYSIZE_T yysize1 = yysize + yytnamerr (YY_NULLPTR, yytname[yyx]);
-                  if (! (yysize <= yysize1
-                         && yysize1 <= YYSTACK_ALLOC_MAXIMUM))
-                    return 2;
-                  yysize = yysize1;
-                }
-              }
-        }
+  if (yyctx->yytoken != YYSYMBOL_YYEMPTY)
+    {
+      int yyn;
+      if (yyarg)
+        yyarg[yycount] = yyctx->yytoken;
+      ++yycount;
+      yyn = yypcontext_expected_tokens (yyctx,
+                                        yyarg ? yyarg + 1 : yyarg, yyargn - 1);
+      if (yyn == YYENOMEM)
+        return YYENOMEM;
+      else
+        yycount += yyn;
     }
+  return yycount;
+}
+
+/* Copy into *YYMSG, which is of size *YYMSG_ALLOC, an error message
+   about the unexpected token YYTOKEN for the state stack whose top is
+   YYSSP.
+
+   Return 0 if *YYMSG was successfully written.  Return -1 if *YYMSG is
+   not large enough to hold the message.  In that case, also set
+   *YYMSG_ALLOC to the required number of bytes.  Return YYENOMEM if the
+   required number of bytes is too large to store.  */
+static int
+yysyntax_error (YYPTRDIFF_T *yymsg_alloc, char **yymsg,
+                const yypcontext_t *yyctx)
+{
+  enum { YYARGS_MAX = 5 };
+  /* Internationalized format string. */
+  const char *yyformat = YY_NULLPTR;
+  /* Arguments of yyformat: reported tokens (one for the "unexpected",
+     one per "expected"). */
+  yysymbol_kind_t yyarg[YYARGS_MAX];
+  /* Cumulated lengths of YYARG.  */
+  YYPTRDIFF_T yysize = 0;
+
+  /* Actual size of YYARG. */
+  int yycount = yy_syntax_error_arguments (yyctx, yyarg, YYARGS_MAX);
+  if (yycount == YYENOMEM)
+    return YYENOMEM;
 
   switch (yycount)
     {
-# define YYCASE_(N, S)                      \
+#define YYCASE_(N, S)                       \
       case N:                               \
         yyformat = S;                       \
-      break
+        break
+    default: /* Avoid compiler warnings. */
       YYCASE_(0, YY_("syntax error"));
       YYCASE_(1, YY_("syntax error, unexpected %s"));
       YYCASE_(2, YY_("syntax error, unexpected %s, expecting %s"));
       YYCASE_(3, YY_("syntax error, unexpected %s, expecting %s or %s"));
       YYCASE_(4, YY_("syntax error, unexpected %s, expecting %s or %s or %s"));
       YYCASE_(5, YY_("syntax error, unexpected %s, expecting %s or %s or %s or %s"));
-# undef YYCASE_
+#undef YYCASE_
     }
 
+  /* Compute error message size.  Don't count the "%s"s, but reserve
+     room for the terminator.  */
+  yysize = yystrlen (yyformat) - 2 * yycount + 1;
   {
-    YYSIZE_T yysize1 = yysize + yystrlen (yyformat);
-    if (! (yysize <= yysize1 && yysize1 <= YYSTACK_ALLOC_MAXIMUM))
-      return 2;
-    yysize = yysize1;
+    int yyi;
+    for (yyi = 0; yyi < yycount; ++yyi)
+      {
+        YYPTRDIFF_T yysize1
+          = yysize + yytnamerr (YY_NULLPTR, yytname[yyarg[yyi]]);
+        if (yysize <= yysize1 && yysize1 <= YYSTACK_ALLOC_MAXIMUM)
+          yysize = yysize1;
+        else
+          return YYENOMEM;
+      }
   }
 
   if (*yymsg_alloc < yysize)
@@ -1169,7 +1329,7 @@ yysyntax_error (YYSIZE_T *yymsg_alloc, char **yymsg,
       if (! (yysize <= *yymsg_alloc
              && *yymsg_alloc <= YYSTACK_ALLOC_MAXIMUM))
         *yymsg_alloc = YYSTACK_ALLOC_MAXIMUM;
-      return 1;
+      return -1;
     }
 
   /* Avoid sprintf, as that infringes on the user's name space.
@@ -1181,96 +1341,96 @@ yysyntax_error (YYSIZE_T *yymsg_alloc, char **yymsg,
     while ((*yyp = *yyformat) != '\0')
       if (*yyp == '%' && yyformat[1] == 's' && yyi < yycount)
         {
-          yyp += yytnamerr (yyp, yyarg[yyi++]);
+          yyp += yytnamerr (yyp, yytname[yyarg[yyi++]]);
           yyformat += 2;
         }
       else
         {
-          yyp++;
-          yyformat++;
+          ++yyp;
+          ++yyformat;
         }
   }
   return 0;
 }
-#endif /* YYERROR_VERBOSE */
+
 
 /*-----------------------------------------------.
 | Release the memory associated to this symbol.  |
 `-----------------------------------------------*/
 
 static void
-yydestruct (const char *yymsg, int yytype, YYSTYPE *yyvaluep, swq_parse_context *context)
+yydestruct (const char *yymsg,
+            yysymbol_kind_t yykind, YYSTYPE *yyvaluep, swq_parse_context *context)
 {
-  YYUSE (yyvaluep);
-  YYUSE (context);
+  YY_USE (yyvaluep);
+  YY_USE (context);
   if (!yymsg)
     yymsg = "Deleting";
-  YY_SYMBOL_PRINT (yymsg, yytype, yyvaluep, yylocationp);
+  YY_SYMBOL_PRINT (yymsg, yykind, yyvaluep, yylocationp);
 
   YY_IGNORE_MAYBE_UNINITIALIZED_BEGIN
-  switch (yytype)
+  switch (yykind)
     {
-          case 3: /* "integer number"  */
-#line 117 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1217 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_SWQT_INTEGER_NUMBER: /* "integer number"  */
+#line 119 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1378 "swq_parser.cpp"
         break;
 
-    case 4: /* "floating point number"  */
-#line 117 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1223 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_SWQT_FLOAT_NUMBER: /* "floating point number"  */
+#line 119 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1384 "swq_parser.cpp"
         break;
 
-    case 5: /* "string"  */
-#line 117 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1229 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_SWQT_STRING: /* "string"  */
+#line 119 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1390 "swq_parser.cpp"
         break;
 
-    case 6: /* "identifier"  */
-#line 117 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1235 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_SWQT_IDENTIFIER: /* "identifier"  */
+#line 119 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1396 "swq_parser.cpp"
         break;
 
-    case 52: /* value_expr  */
-#line 118 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1241 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_value_expr: /* value_expr  */
+#line 120 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1402 "swq_parser.cpp"
         break;
 
-    case 53: /* value_expr_list  */
-#line 118 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1247 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_value_expr_list: /* value_expr_list  */
+#line 120 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1408 "swq_parser.cpp"
         break;
 
-    case 54: /* field_value  */
-#line 118 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1253 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_field_value: /* field_value  */
+#line 120 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1414 "swq_parser.cpp"
         break;
 
-    case 55: /* value_expr_non_logical  */
-#line 118 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1259 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_value_expr_non_logical: /* value_expr_non_logical  */
+#line 120 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1420 "swq_parser.cpp"
         break;
 
-    case 56: /* type_def  */
-#line 118 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1265 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_type_def: /* type_def  */
+#line 120 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1426 "swq_parser.cpp"
         break;
 
-    case 71: /* table_def  */
-#line 118 "swq_parser.y" /* yacc.c:1257  */
-      { delete ((*yyvaluep)); }
-#line 1271 "swq_parser.cpp" /* yacc.c:1257  */
+    case YYSYMBOL_table_def: /* table_def  */
+#line 120 "swq_parser.y"
+            { delete (*yyvaluep); }
+#line 1432 "swq_parser.cpp"
         break;
 
-
       default:
         break;
     }
@@ -1280,6 +1440,8 @@ yydestruct (const char *yymsg, int yytype, YYSTYPE *yyvaluep, swq_parse_context
 
 
 
+
+
 /*----------.
 | yyparse.  |
 `----------*/
@@ -1287,7 +1449,7 @@ yydestruct (const char *yymsg, int yytype, YYSTYPE *yyvaluep, swq_parse_context
 int
 yyparse (swq_parse_context *context)
 {
-/* The lookahead symbol.  */
+/* Lookahead token kind.  */
 int yychar;
 
 
@@ -1298,45 +1460,41 @@ YY_INITIAL_VALUE (static YYSTYPE yyval_default;)
 YYSTYPE yylval YY_INITIAL_VALUE (= yyval_default);
 
     /* Number of syntax errors so far.  */
-    int yynerrs;
+    int yynerrs = 0;
 
-    int yystate;
+    yy_state_fast_t yystate = 0;
     /* Number of tokens to shift before error messages enabled.  */
-    int yyerrstatus;
-
-    /* The stacks and their tools:
-       'yyss': related to states.
-       'yyvs': related to semantic values.
+    int yyerrstatus = 0;
 
-       Refer to the stacks through separate pointers, to allow yyoverflow
+    /* Refer to the stacks through separate pointers, to allow yyoverflow
        to reallocate them elsewhere.  */
 
-    /* The state stack.  */
-    yytype_int16 yyssa[YYINITDEPTH]; /* workaround bug with gcc 4.1 -O2 */ memset(yyssa, 0, sizeof(yyssa));
-    yytype_int16 *yyss;
-    yytype_int16 *yyssp;
+    /* Their size.  */
+    YYPTRDIFF_T yystacksize = YYINITDEPTH;
 
-    /* The semantic value stack.  */
-    YYSTYPE yyvsa[YYINITDEPTH];
-    YYSTYPE *yyvs;
-    YYSTYPE *yyvsp;
+    /* The state stack: array, bottom, top.  */
+    yy_state_t yyssa[YYINITDEPTH];
+    yy_state_t *yyss = yyssa;
+    yy_state_t *yyssp = yyss;
 
-    YYSIZE_T yystacksize;
+    /* The semantic value stack: array, bottom, top.  */
+    YYSTYPE yyvsa[YYINITDEPTH];
+    YYSTYPE *yyvs = yyvsa;
+    YYSTYPE *yyvsp = yyvs;
 
   int yyn;
+  /* The return value of yyparse.  */
   int yyresult;
-  /* Lookahead token as an internal (translated) token number.  */
-  int yytoken = 0;
+  /* Lookahead symbol kind.  */
+  yysymbol_kind_t yytoken = YYSYMBOL_YYEMPTY;
   /* The variables used to return semantic value and location from the
      action routines.  */
   YYSTYPE yyval;
 
-#if YYERROR_VERBOSE
   /* Buffer for error messages, and its allocated size.  */
   char yymsgbuf[128];
   char *yymsg = yymsgbuf;
-  YYSIZE_T yymsg_alloc = sizeof yymsgbuf;
-#endif
+  YYPTRDIFF_T yymsg_alloc = sizeof yymsgbuf;
 
 #define YYPOPSTACK(N)   (yyvsp -= (N), yyssp -= (N))
 
@@ -1344,71 +1502,75 @@ YYSTYPE yylval YY_INITIAL_VALUE (= yyval_default);
      Keep to zero when no symbol should be popped.  */
   int yylen = 0;
 
-  yyssp = yyss = yyssa;
-  yyvsp = yyvs = yyvsa;
-  yystacksize = YYINITDEPTH;
-
   YYDPRINTF ((stderr, "Starting parse\n"));
 
-  yystate = 0;
-  yyerrstatus = 0;
-  yynerrs = 0;
   yychar = YYEMPTY; /* Cause a token to be read.  */
+
   goto yysetstate;
 
+
 /*------------------------------------------------------------.
-| yynewstate -- Push a new state, which is found in yystate.  |
+| yynewstate -- push a new state, which is found in yystate.  |
 `------------------------------------------------------------*/
- yynewstate:
+yynewstate:
   /* In all cases, when you get here, the value and location stacks
      have just been pushed.  So pushing a state here evens the stacks.  */
   yyssp++;
 
- yysetstate:
-  *yyssp = static_cast<yytype_int16>(yystate);
+
+/*--------------------------------------------------------------------.
+| yysetstate -- set current state (the top of the stack) to yystate.  |
+`--------------------------------------------------------------------*/
+yysetstate:
+  YYDPRINTF ((stderr, "Entering state %d\n", yystate));
+  YY_ASSERT (0 <= yystate && yystate < YYNSTATES);
+  YY_IGNORE_USELESS_CAST_BEGIN
+  *yyssp = YY_CAST (yy_state_t, yystate);
+  YY_IGNORE_USELESS_CAST_END
+  YY_STACK_PRINT (yyss, yyssp);
 
   if (yyss + yystacksize - 1 <= yyssp)
+#if !defined yyoverflow && !defined YYSTACK_RELOCATE
+    YYNOMEM;
+#else
     {
       /* Get the current used size of the three stacks, in elements.  */
-      YYSIZE_T yysize = yyssp - yyss + 1;
+      YYPTRDIFF_T yysize = yyssp - yyss + 1;
 
-#ifdef yyoverflow
+# if defined yyoverflow
       {
         /* Give user a chance to reallocate the stack.  Use copies of
            these so that the &'s don't force the real ones into
            memory.  */
+        yy_state_t *yyss1 = yyss;
         YYSTYPE *yyvs1 = yyvs;
-        yytype_int16 *yyss1 = yyss;
 
         /* Each stack pointer address is followed by the size of the
            data in use in that stack, in bytes.  This used to be a
            conditional around just the two extra args, but that might
            be undefined if yyoverflow is a macro.  */
         yyoverflow (YY_("memory exhausted"),
-                    &yyss1, yysize * sizeof (*yyssp),
-                    &yyvs1, yysize * sizeof (*yyvsp),
+                    &yyss1, yysize * YYSIZEOF (*yyssp),
+                    &yyvs1, yysize * YYSIZEOF (*yyvsp),
                     &yystacksize);
-
         yyss = yyss1;
         yyvs = yyvs1;
       }
-#else /* no yyoverflow */
-# ifndef YYSTACK_RELOCATE
-      goto yyexhaustedlab;
-# else
+# else /* defined YYSTACK_RELOCATE */
       /* Extend the stack our own way.  */
       if (YYMAXDEPTH <= yystacksize)
-        goto yyexhaustedlab;
+        YYNOMEM;
       yystacksize *= 2;
       if (YYMAXDEPTH < yystacksize)
         yystacksize = YYMAXDEPTH;
 
       {
-        yytype_int16 *yyss1 = yyss;
+        yy_state_t *yyss1 = yyss;
         union yyalloc *yyptr =
-          static_cast<union yyalloc *>(YYSTACK_ALLOC (YYSTACK_BYTES (yystacksize)));
+          YY_CAST (union yyalloc *,
+                   YYSTACK_ALLOC (YY_CAST (YYSIZE_T, YYSTACK_BYTES (yystacksize))));
         if (! yyptr)
-          goto yyexhaustedlab;
+          YYNOMEM;
         YYSTACK_RELOCATE (yyss_alloc, yyss);
         YYSTACK_RELOCATE (yyvs_alloc, yyvs);
 #  undef YYSTACK_RELOCATE
@@ -1416,30 +1578,31 @@ YYSTYPE yylval YY_INITIAL_VALUE (= yyval_default);
           YYSTACK_FREE (yyss1);
       }
 # endif
-#endif /* no yyoverflow */
 
       yyssp = yyss + yysize - 1;
       yyvsp = yyvs + yysize - 1;
 
-      YYDPRINTF ((stderr, "Stack size increased to %lu\n",
-                  (unsigned long int) yystacksize));
+      YY_IGNORE_USELESS_CAST_BEGIN
+      YYDPRINTF ((stderr, "Stack size increased to %ld\n",
+                  YY_CAST (long, yystacksize)));
+      YY_IGNORE_USELESS_CAST_END
 
       if (yyss + yystacksize - 1 <= yyssp)
         YYABORT;
     }
+#endif /* !defined yyoverflow && !defined YYSTACK_RELOCATE */
 
-  YYDPRINTF ((stderr, "Entering state %d\n", yystate));
 
   if (yystate == YYFINAL)
     YYACCEPT;
 
   goto yybackup;
 
+
 /*-----------.
 | yybackup.  |
 `-----------*/
 yybackup:
-
   /* Do appropriate processing given the current state.  Read a
      lookahead token if we need one and don't already have one.  */
 
@@ -1450,18 +1613,29 @@ yybackup:
 
   /* Not known => get a lookahead token if don't already have one.  */
 
-  /* YYCHAR is either YYEMPTY or YYEOF or a valid lookahead symbol.  */
+  /* YYCHAR is either empty, or end-of-input, or a valid lookahead.  */
   if (yychar == YYEMPTY)
     {
-      YYDPRINTF ((stderr, "Reading a token: "));
+      YYDPRINTF ((stderr, "Reading a token\n"));
       yychar = yylex (&yylval, context);
     }
 
-  if (yychar <= YYEOF)
+  if (yychar <= END)
     {
-      yychar = yytoken = YYEOF;
+      yychar = END;
+      yytoken = YYSYMBOL_YYEOF;
       YYDPRINTF ((stderr, "Now at end of input.\n"));
     }
+  else if (yychar == YYerror)
+    {
+      /* The scanner already issued an error message, process directly
+         to error recovery.  But do not keep the error token as
+         lookahead, it is too special and may lead us to an endless
+         loop in error recovery. */
+      yychar = YYUNDEF;
+      yytoken = YYSYMBOL_YYerror;
+      goto yyerrlab1;
+    }
   else
     {
       yytoken = YYTRANSLATE (yychar);
@@ -1489,15 +1663,13 @@ yybackup:
 
   /* Shift the lookahead token.  */
   YY_SYMBOL_PRINT ("Shifting", yytoken, &yylval, &yylloc);
-
-  /* Discard the shifted token.  */
-  yychar = YYEMPTY;
-
   yystate = yyn;
   YY_IGNORE_MAYBE_UNINITIALIZED_BEGIN
   *++yyvsp = yylval;
   YY_IGNORE_MAYBE_UNINITIALIZED_END
 
+  /* Discard the shifted token.  */
+  yychar = YYEMPTY;
   goto yynewstate;
 
 
@@ -1512,7 +1684,7 @@ yydefault:
 
 
 /*-----------------------------.
-| yyreduce -- Do a reduction.  |
+| yyreduce -- do a reduction.  |
 `-----------------------------*/
 yyreduce:
   /* yyn is the number of a rule to reduce with.  */
@@ -1532,652 +1704,680 @@ yyreduce:
   YY_REDUCE_PRINT (yyn);
   switch (yyn)
     {
-        case 3:
-#line 124 "swq_parser.y" /* yacc.c:1646  */
-    {
-            context->poRoot = (yyvsp[0]);
+  case 3: /* input: SWQT_VALUE_START value_expr  */
+#line 126 "swq_parser.y"
+        {
+            context->poRoot = yyvsp[0];
         }
-#line 1541 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1713 "swq_parser.cpp"
     break;
 
-  case 4:
-#line 129 "swq_parser.y" /* yacc.c:1646  */
-    {
-            context->poRoot = (yyvsp[0]);
+  case 4: /* input: SWQT_SELECT_START select_statement  */
+#line 131 "swq_parser.y"
+        {
+            context->poRoot = yyvsp[0];
         }
-#line 1549 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1721 "swq_parser.cpp"
     break;
 
-  case 5:
-#line 135 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[0]);
+  case 5: /* value_expr: value_expr_non_logical  */
+#line 137 "swq_parser.y"
+        {
+            yyval = yyvsp[0];
         }
-#line 1557 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1729 "swq_parser.cpp"
     break;
 
-  case 6:
-#line 140 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_AND );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 6: /* value_expr: value_expr "AND" value_expr  */
+#line 142 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_AND );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1568 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1740 "swq_parser.cpp"
     break;
 
-  case 7:
-#line 148 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_OR );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 7: /* value_expr: value_expr "OR" value_expr  */
+#line 150 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_OR );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1579 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1751 "swq_parser.cpp"
     break;
 
-  case 8:
-#line 156 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_NOT );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 8: /* value_expr: "NOT" value_expr  */
+#line 158 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_NOT );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1589 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1761 "swq_parser.cpp"
     break;
 
-  case 9:
-#line 163 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_EQ );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 9: /* value_expr: value_expr '=' value_expr  */
+#line 165 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_EQ );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1600 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1772 "swq_parser.cpp"
     break;
 
-  case 10:
-#line 171 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_NE );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-3]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 10: /* value_expr: value_expr '<' '>' value_expr  */
+#line 173 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_NE );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-3] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1611 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1783 "swq_parser.cpp"
     break;
 
-  case 11:
-#line 179 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_NE );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-3]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 11: /* value_expr: value_expr '!' '=' value_expr  */
+#line 181 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_NE );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-3] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1622 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1794 "swq_parser.cpp"
     break;
 
-  case 12:
-#line 187 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_LT );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 12: /* value_expr: value_expr '<' value_expr  */
+#line 189 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_LT );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1633 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1805 "swq_parser.cpp"
     break;
 
-  case 13:
-#line 195 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_GT );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 13: /* value_expr: value_expr '>' value_expr  */
+#line 197 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_GT );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1644 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1816 "swq_parser.cpp"
     break;
 
-  case 14:
-#line 203 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_LE );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-3]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 14: /* value_expr: value_expr '<' '=' value_expr  */
+#line 205 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_LE );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-3] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1655 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1827 "swq_parser.cpp"
     break;
 
-  case 15:
-#line 211 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_LE );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-3]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 15: /* value_expr: value_expr '=' '<' value_expr  */
+#line 213 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_LE );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-3] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1666 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1838 "swq_parser.cpp"
     break;
 
-  case 16:
-#line 219 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_LE );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-3]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 16: /* value_expr: value_expr '=' '>' value_expr  */
+#line 221 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_LE );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-3] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1677 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1849 "swq_parser.cpp"
     break;
 
-  case 17:
-#line 227 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_GE );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-3]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 17: /* value_expr: value_expr '>' '=' value_expr  */
+#line 229 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_GE );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-3] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1688 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1860 "swq_parser.cpp"
     break;
 
-  case 18:
-#line 235 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_LIKE );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 18: /* value_expr: value_expr "LIKE" value_expr  */
+#line 237 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_LIKE );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1699 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1871 "swq_parser.cpp"
     break;
 
-  case 19:
-#line 243 "swq_parser.y" /* yacc.c:1646  */
-    {
+  case 19: /* value_expr: value_expr "NOT" "LIKE" value_expr  */
+#line 245 "swq_parser.y"
+        {
             swq_expr_node *like = new swq_expr_node( SWQ_LIKE );
             like->field_type = SWQ_BOOLEAN;
-            like->PushSubExpression( (yyvsp[-3]) );
-            like->PushSubExpression( (yyvsp[0]) );
+            like->PushSubExpression( yyvsp[-3] );
+            like->PushSubExpression( yyvsp[0] );
 
-            (yyval) = new swq_expr_node( SWQ_NOT );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( like );
+            yyval = new swq_expr_node( SWQ_NOT );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( like );
         }
-#line 1714 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1886 "swq_parser.cpp"
     break;
 
-  case 20:
-#line 255 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_LIKE );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-4]) );
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 20: /* value_expr: value_expr "LIKE" value_expr "ESCAPE" value_expr  */
+#line 257 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_LIKE );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-4] );
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1726 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1898 "swq_parser.cpp"
     break;
 
-  case 21:
-#line 264 "swq_parser.y" /* yacc.c:1646  */
-    {
+  case 21: /* value_expr: value_expr "NOT" "LIKE" value_expr "ESCAPE" value_expr  */
+#line 266 "swq_parser.y"
+        {
             swq_expr_node *like = new swq_expr_node( SWQ_LIKE );
             like->field_type = SWQ_BOOLEAN;
-            like->PushSubExpression( (yyvsp[-5]) );
-            like->PushSubExpression( (yyvsp[-2]) );
-            like->PushSubExpression( (yyvsp[0]) );
+            like->PushSubExpression( yyvsp[-5] );
+            like->PushSubExpression( yyvsp[-2] );
+            like->PushSubExpression( yyvsp[0] );
 
-            (yyval) = new swq_expr_node( SWQ_NOT );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( like );
+            yyval = new swq_expr_node( SWQ_NOT );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( like );
         }
-#line 1742 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1914 "swq_parser.cpp"
     break;
 
-  case 22:
-#line 277 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[-1]);
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->nOperation = SWQ_IN;
-            (yyval)->PushSubExpression( (yyvsp[-4]) );
-            (yyval)->ReverseSubExpressions();
+  case 22: /* value_expr: value_expr "IN" '(' value_expr_list ')'  */
+#line 279 "swq_parser.y"
+        {
+            yyval = yyvsp[-1];
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->nOperation = SWQ_IN;
+            yyval->PushSubExpression( yyvsp[-4] );
+            yyval->ReverseSubExpressions();
         }
-#line 1754 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1926 "swq_parser.cpp"
     break;
 
-  case 23:
-#line 286 "swq_parser.y" /* yacc.c:1646  */
-    {
-            swq_expr_node *in = (yyvsp[-1]);
+  case 23: /* value_expr: value_expr "NOT" "IN" '(' value_expr_list ')'  */
+#line 288 "swq_parser.y"
+        {
+            swq_expr_node *in = yyvsp[-1];
             in->field_type = SWQ_BOOLEAN;
             in->nOperation = SWQ_IN;
-            in->PushSubExpression( (yyvsp[-5]) );
+            in->PushSubExpression( yyvsp[-5] );
             in->ReverseSubExpressions();
 
-            (yyval) = new swq_expr_node( SWQ_NOT );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( in );
+            yyval = new swq_expr_node( SWQ_NOT );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( in );
         }
-#line 1770 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1942 "swq_parser.cpp"
     break;
 
-  case 24:
-#line 299 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_BETWEEN );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-4]) );
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 24: /* value_expr: value_expr "BETWEEN" value_expr_non_logical "AND" value_expr_non_logical  */
+#line 301 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_BETWEEN );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-4] );
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1782 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1954 "swq_parser.cpp"
     break;
 
-  case 25:
-#line 308 "swq_parser.y" /* yacc.c:1646  */
-    {
+  case 25: /* value_expr: value_expr "NOT" "BETWEEN" value_expr_non_logical "AND" value_expr_non_logical  */
+#line 310 "swq_parser.y"
+        {
             swq_expr_node *between = new swq_expr_node( SWQ_BETWEEN );
             between->field_type = SWQ_BOOLEAN;
-            between->PushSubExpression( (yyvsp[-5]) );
-            between->PushSubExpression( (yyvsp[-2]) );
-            between->PushSubExpression( (yyvsp[0]) );
+            between->PushSubExpression( yyvsp[-5] );
+            between->PushSubExpression( yyvsp[-2] );
+            between->PushSubExpression( yyvsp[0] );
 
-            (yyval) = new swq_expr_node( SWQ_NOT );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( between );
+            yyval = new swq_expr_node( SWQ_NOT );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( between );
         }
-#line 1798 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1970 "swq_parser.cpp"
     break;
 
-  case 26:
-#line 321 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_ISNULL );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
+  case 26: /* value_expr: value_expr "IS" "NULL"  */
+#line 323 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_ISNULL );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( yyvsp[-2] );
         }
-#line 1808 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1980 "swq_parser.cpp"
     break;
 
-  case 27:
-#line 328 "swq_parser.y" /* yacc.c:1646  */
-    {
+  case 27: /* value_expr: value_expr "IS" "NOT" "NULL"  */
+#line 330 "swq_parser.y"
+        {
             swq_expr_node *isnull = new swq_expr_node( SWQ_ISNULL );
             isnull->field_type = SWQ_BOOLEAN;
-            isnull->PushSubExpression( (yyvsp[-3]) );
+            isnull->PushSubExpression( yyvsp[-3] );
 
-            (yyval) = new swq_expr_node( SWQ_NOT );
-            (yyval)->field_type = SWQ_BOOLEAN;
-            (yyval)->PushSubExpression( isnull );
+            yyval = new swq_expr_node( SWQ_NOT );
+            yyval->field_type = SWQ_BOOLEAN;
+            yyval->PushSubExpression( isnull );
         }
-#line 1822 "swq_parser.cpp" /* yacc.c:1646  */
+#line 1994 "swq_parser.cpp"
     break;
 
-  case 28:
-#line 340 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[0]);
-            (yyvsp[0])->PushSubExpression( (yyvsp[-2]) );
+  case 28: /* value_expr_list: value_expr ',' value_expr_list  */
+#line 342 "swq_parser.y"
+        {
+            yyval = yyvsp[0];
+            yyvsp[0]->PushSubExpression( yyvsp[-2] );
         }
-#line 1831 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2003 "swq_parser.cpp"
     break;
 
-  case 29:
-#line 346 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_ARGUMENT_LIST ); /* temporary value */
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 29: /* value_expr_list: value_expr  */
+#line 348 "swq_parser.y"
+            {
+            yyval = new swq_expr_node( SWQ_ARGUMENT_LIST ); /* temporary value */
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1840 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2012 "swq_parser.cpp"
     break;
 
-  case 30:
-#line 353 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[0]);  // validation deferred.
-            (yyval)->eNodeType = SNT_COLUMN;
-            (yyval)->field_index = -1;
-            (yyval)->table_index = -1;
+  case 30: /* field_value: "identifier"  */
+#line 355 "swq_parser.y"
+        {
+            yyval = yyvsp[0];  // validation deferred.
+            yyval->eNodeType = SNT_COLUMN;
+            yyval->field_index = -1;
+            yyval->table_index = -1;
         }
-#line 1851 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2023 "swq_parser.cpp"
     break;
 
-  case 31:
-#line 361 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[-2]);  // validation deferred.
-            (yyval)->eNodeType = SNT_COLUMN;
-            (yyval)->field_index = -1;
-            (yyval)->table_index = -1;
-            (yyval)->table_name = (yyval)->string_value;
-            (yyval)->string_value = CPLStrdup((yyvsp[0])->string_value);
-            delete (yyvsp[0]);
-            (yyvsp[0]) = nullptr;
+  case 31: /* field_value: "identifier" '.' "identifier"  */
+#line 363 "swq_parser.y"
+        {
+            yyval = yyvsp[-2];  // validation deferred.
+            yyval->eNodeType = SNT_COLUMN;
+            yyval->field_index = -1;
+            yyval->table_index = -1;
+            yyval->table_name = yyval->string_value;
+            yyval->string_value = CPLStrdup(yyvsp[0]->string_value);
+            delete yyvsp[0];
+            yyvsp[0] = nullptr;
         }
-#line 1866 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2038 "swq_parser.cpp"
     break;
 
-  case 32:
-#line 374 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[0]);
+  case 32: /* value_expr_non_logical: "integer number"  */
+#line 376 "swq_parser.y"
+        {
+            yyval = yyvsp[0];
         }
-#line 1874 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2046 "swq_parser.cpp"
     break;
 
-  case 33:
-#line 379 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[0]);
+  case 33: /* value_expr_non_logical: "floating point number"  */
+#line 381 "swq_parser.y"
+        {
+            yyval = yyvsp[0];
         }
-#line 1882 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2054 "swq_parser.cpp"
     break;
 
-  case 34:
-#line 384 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[0]);
+  case 34: /* value_expr_non_logical: "string"  */
+#line 386 "swq_parser.y"
+        {
+            yyval = yyvsp[0];
         }
-#line 1890 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2062 "swq_parser.cpp"
     break;
 
-  case 35:
-#line 388 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[0]);
+  case 35: /* value_expr_non_logical: field_value  */
+#line 390 "swq_parser.y"
+        {
+            yyval = yyvsp[0];
         }
-#line 1898 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2070 "swq_parser.cpp"
     break;
 
-  case 36:
-#line 393 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[-1]);
+  case 36: /* value_expr_non_logical: '(' value_expr ')'  */
+#line 395 "swq_parser.y"
+        {
+            yyval = yyvsp[-1];
         }
-#line 1906 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2078 "swq_parser.cpp"
     break;
 
-  case 37:
-#line 398 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node(static_cast<const char*>(nullptr));
+  case 37: /* value_expr_non_logical: "NULL"  */
+#line 400 "swq_parser.y"
+        {
+            yyval = new swq_expr_node(static_cast<const char*>(nullptr));
         }
-#line 1914 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2086 "swq_parser.cpp"
     break;
 
-  case 38:
-#line 403 "swq_parser.y" /* yacc.c:1646  */
-    {
-            if ((yyvsp[0])->eNodeType == SNT_CONSTANT)
+  case 38: /* value_expr_non_logical: '-' value_expr_non_logical  */
+#line 405 "swq_parser.y"
+        {
+            if (yyvsp[0]->eNodeType == SNT_CONSTANT)
             {
-                if( (yyvsp[0])->field_type == SWQ_FLOAT &&
-                    (yyvsp[0])->string_value &&
-                    strcmp((yyvsp[0])->string_value, "9223372036854775808") == 0 )
+                if( yyvsp[0]->field_type == SWQ_FLOAT &&
+                    yyvsp[0]->string_value &&
+                    strcmp(yyvsp[0]->string_value, "9223372036854775808") == 0 )
                 {
-                    (yyval) = (yyvsp[0]);
-                    (yyval)->field_type = SWQ_INTEGER64;
-                    (yyval)->int_value = std::numeric_limits<GIntBig>::min();
-                    (yyval)->float_value = static_cast<double>(std::numeric_limits<GIntBig>::min());
+                    yyval = yyvsp[0];
+                    yyval->field_type = SWQ_INTEGER64;
+                    yyval->int_value = std::numeric_limits<GIntBig>::min();
+                    yyval->float_value = static_cast<double>(std::numeric_limits<GIntBig>::min());
                 }
                 // - (-9223372036854775808) cannot be represented on int64
                 // the classic overflow is that its negation is itself.
-                else if( (yyvsp[0])->field_type == SWQ_INTEGER64 &&
-                         (yyvsp[0])->int_value == std::numeric_limits<GIntBig>::min() )
+                else if( yyvsp[0]->field_type == SWQ_INTEGER64 &&
+                         yyvsp[0]->int_value == std::numeric_limits<GIntBig>::min() )
                 {
-                    (yyval) = (yyvsp[0]);
+                    yyval = yyvsp[0];
                 }
                 else
                 {
-                    (yyval) = (yyvsp[0]);
-                    (yyval)->int_value *= -1;
-                    (yyval)->float_value *= -1;
+                    yyval = yyvsp[0];
+                    yyval->int_value *= -1;
+                    yyval->float_value *= -1;
                 }
             }
             else
             {
-                (yyval) = new swq_expr_node( SWQ_MULTIPLY );
-                (yyval)->PushSubExpression( new swq_expr_node(-1) );
-                (yyval)->PushSubExpression( (yyvsp[0]) );
+                yyval = new swq_expr_node( SWQ_MULTIPLY );
+                yyval->PushSubExpression( new swq_expr_node(-1) );
+                yyval->PushSubExpression( yyvsp[0] );
             }
         }
-#line 1952 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2124 "swq_parser.cpp"
     break;
 
-  case 39:
-#line 438 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_ADD );
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 39: /* value_expr_non_logical: value_expr_non_logical '+' value_expr_non_logical  */
+#line 440 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_ADD );
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1962 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2134 "swq_parser.cpp"
     break;
 
-  case 40:
-#line 445 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_SUBTRACT );
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 40: /* value_expr_non_logical: value_expr_non_logical '-' value_expr_non_logical  */
+#line 447 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_SUBTRACT );
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1972 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2144 "swq_parser.cpp"
     break;
 
-  case 41:
-#line 452 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_MULTIPLY );
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 41: /* value_expr_non_logical: value_expr_non_logical '*' value_expr_non_logical  */
+#line 454 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_MULTIPLY );
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1982 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2154 "swq_parser.cpp"
     break;
 
-  case 42:
-#line 459 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_DIVIDE );
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 42: /* value_expr_non_logical: value_expr_non_logical '/' value_expr_non_logical  */
+#line 461 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_DIVIDE );
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 1992 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2164 "swq_parser.cpp"
     break;
 
-  case 43:
-#line 466 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = new swq_expr_node( SWQ_MODULUS );
-            (yyval)->PushSubExpression( (yyvsp[-2]) );
-            (yyval)->PushSubExpression( (yyvsp[0]) );
+  case 43: /* value_expr_non_logical: value_expr_non_logical '%' value_expr_non_logical  */
+#line 468 "swq_parser.y"
+        {
+            yyval = new swq_expr_node( SWQ_MODULUS );
+            yyval->PushSubExpression( yyvsp[-2] );
+            yyval->PushSubExpression( yyvsp[0] );
         }
-#line 2002 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2174 "swq_parser.cpp"
     break;
 
-  case 44:
-#line 473 "swq_parser.y" /* yacc.c:1646  */
-    {
+  case 44: /* value_expr_non_logical: "identifier" '(' value_expr_list ')'  */
+#line 475 "swq_parser.y"
+        {
             const swq_operation *poOp =
-                    swq_op_registrar::GetOperator( (yyvsp[-3])->string_value );
+                    swq_op_registrar::GetOperator( yyvsp[-3]->string_value );
 
             if( poOp == nullptr )
             {
                 if( context->bAcceptCustomFuncs )
                 {
-                    (yyval) = (yyvsp[-1]);
-                    (yyval)->eNodeType = SNT_OPERATION;
-                    (yyval)->nOperation = SWQ_CUSTOM_FUNC;
-                    (yyval)->string_value = CPLStrdup((yyvsp[-3])->string_value);
-                    (yyval)->ReverseSubExpressions();
-                    delete (yyvsp[-3]);
+                    yyval = yyvsp[-1];
+                    yyval->eNodeType = SNT_OPERATION;
+                    yyval->nOperation = SWQ_CUSTOM_FUNC;
+                    yyval->string_value = CPLStrdup(yyvsp[-3]->string_value);
+                    yyval->ReverseSubExpressions();
+                    delete yyvsp[-3];
                 }
                 else
                 {
                     CPLError( CE_Failure, CPLE_AppDefined,
                                     "Undefined function '%s' used.",
-                                    (yyvsp[-3])->string_value );
-                    delete (yyvsp[-3]);
-                    delete (yyvsp[-1]);
+                                    yyvsp[-3]->string_value );
+                    delete yyvsp[-3];
+                    delete yyvsp[-1];
                     YYERROR;
                 }
             }
             else
             {
-                (yyval) = (yyvsp[-1]);
-                (yyval)->eNodeType = SNT_OPERATION;
-                (yyval)->nOperation = poOp->eOperation;
-                (yyval)->ReverseSubExpressions();
-                delete (yyvsp[-3]);
+                yyval = yyvsp[-1];
+                yyval->eNodeType = SNT_OPERATION;
+                yyval->nOperation = poOp->eOperation;
+                yyval->ReverseSubExpressions();
+                delete yyvsp[-3];
             }
         }
-#line 2041 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2213 "swq_parser.cpp"
     break;
 
-  case 45:
-#line 509 "swq_parser.y" /* yacc.c:1646  */
-    {
-            (yyval) = (yyvsp[-1]);
-            (yyval)->PushSubExpression( (yyvsp[-3]) );
-            (yyval)->ReverseSubExpressions();
+  case 45: /* value_expr_non_logical: "identifier" '(' '*' ')'  */
+#line 511 "swq_parser.y"
+        {
+            // special case for COUNT(*), confirm it.
+            if( !EQUAL(yyvsp[-3]->string_value, "COUNT") )
+            {
+                CPLError( CE_Failure, CPLE_AppDefined,
+                        "Syntax Error with %s(*).",
+                        yyvsp[-3]->string_value );
+                delete yyvsp[-3];
+                YYERROR;
+            }
+
+            delete yyvsp[-3];
+            yyvsp[-3] = nullptr;
+
+            swq_expr_node *poNode = new swq_expr_node();
+            poNode->eNodeType = SNT_COLUMN;
+            poNode->string_value = CPLStrdup( "*" );
+            poNode->table_index = -1;
+            poNode->field_index = -1;
+
+            yyval = new swq_expr_node( SWQ_COUNT );
+            yyval->PushSubExpression( poNode );
+        }
+#line 2241 "swq_parser.cpp"
+    break;
+
+  case 46: /* value_expr_non_logical: "CAST" '(' value_expr "AS" type_def ')'  */
+#line 536 "swq_parser.y"
+        {
+            yyval = yyvsp[-1];
+            yyval->PushSubExpression( yyvsp[-3] );
+            yyval->ReverseSubExpressions();
         }
-#line 2051 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2251 "swq_parser.cpp"
     break;
 
-  case 46:
-#line 517 "swq_parser.y" /* yacc.c:1646  */
+  case 47: /* type_def: "identifier"  */
+#line 544 "swq_parser.y"
     {
-        (yyval) = new swq_expr_node( SWQ_CAST );
-        (yyval)->PushSubExpression( (yyvsp[0]) );
+        yyval = new swq_expr_node( SWQ_CAST );
+        yyval->PushSubExpression( yyvsp[0] );
     }
-#line 2060 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2260 "swq_parser.cpp"
     break;
 
-  case 47:
-#line 523 "swq_parser.y" /* yacc.c:1646  */
+  case 48: /* type_def: "identifier" '(' "integer number" ')'  */
+#line 550 "swq_parser.y"
     {
-        (yyval) = new swq_expr_node( SWQ_CAST );
-        (yyval)->PushSubExpression( (yyvsp[-1]) );
-        (yyval)->PushSubExpression( (yyvsp[-3]) );
+        yyval = new swq_expr_node( SWQ_CAST );
+        yyval->PushSubExpression( yyvsp[-1] );
+        yyval->PushSubExpression( yyvsp[-3] );
     }
-#line 2070 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2270 "swq_parser.cpp"
     break;
 
-  case 48:
-#line 530 "swq_parser.y" /* yacc.c:1646  */
+  case 49: /* type_def: "identifier" '(' "integer number" ',' "integer number" ')'  */
+#line 557 "swq_parser.y"
     {
-        (yyval) = new swq_expr_node( SWQ_CAST );
-        (yyval)->PushSubExpression( (yyvsp[-1]) );
-        (yyval)->PushSubExpression( (yyvsp[-3]) );
-        (yyval)->PushSubExpression( (yyvsp[-5]) );
+        yyval = new swq_expr_node( SWQ_CAST );
+        yyval->PushSubExpression( yyvsp[-1] );
+        yyval->PushSubExpression( yyvsp[-3] );
+        yyval->PushSubExpression( yyvsp[-5] );
     }
-#line 2081 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2281 "swq_parser.cpp"
     break;
 
-  case 49:
-#line 539 "swq_parser.y" /* yacc.c:1646  */
+  case 50: /* type_def: "identifier" '(' "identifier" ')'  */
+#line 566 "swq_parser.y"
     {
-        OGRwkbGeometryType eType = OGRFromOGCGeomType((yyvsp[-1])->string_value);
-        if( !EQUAL((yyvsp[-3])->string_value, "GEOMETRY") ||
+        OGRwkbGeometryType eType = OGRFromOGCGeomType(yyvsp[-1]->string_value);
+        if( !EQUAL(yyvsp[-3]->string_value, "GEOMETRY") ||
             (wkbFlatten(eType) == wkbUnknown &&
-            !STARTS_WITH_CI((yyvsp[-1])->string_value, "GEOMETRY")) )
+            !STARTS_WITH_CI(yyvsp[-1]->string_value, "GEOMETRY")) )
         {
             yyerror (context, "syntax error");
-            delete (yyvsp[-3]);
-            delete (yyvsp[-1]);
+            delete yyvsp[-3];
+            delete yyvsp[-1];
             YYERROR;
         }
-        (yyval) = new swq_expr_node( SWQ_CAST );
-        (yyval)->PushSubExpression( (yyvsp[-1]) );
-        (yyval)->PushSubExpression( (yyvsp[-3]) );
+        yyval = new swq_expr_node( SWQ_CAST );
+        yyval->PushSubExpression( yyvsp[-1] );
+        yyval->PushSubExpression( yyvsp[-3] );
     }
-#line 2101 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2301 "swq_parser.cpp"
     break;
 
-  case 50:
-#line 557 "swq_parser.y" /* yacc.c:1646  */
+  case 51: /* type_def: "identifier" '(' "identifier" ',' "integer number" ')'  */
+#line 584 "swq_parser.y"
     {
-        OGRwkbGeometryType eType = OGRFromOGCGeomType((yyvsp[-3])->string_value);
-        if( !EQUAL((yyvsp[-5])->string_value, "GEOMETRY") ||
+        OGRwkbGeometryType eType = OGRFromOGCGeomType(yyvsp[-3]->string_value);
+        if( !EQUAL(yyvsp[-5]->string_value, "GEOMETRY") ||
             (wkbFlatten(eType) == wkbUnknown &&
-            !STARTS_WITH_CI((yyvsp[-3])->string_value, "GEOMETRY")) )
+            !STARTS_WITH_CI(yyvsp[-3]->string_value, "GEOMETRY")) )
         {
             yyerror (context, "syntax error");
-            delete (yyvsp[-5]);
-            delete (yyvsp[-3]);
-            delete (yyvsp[-1]);
+            delete yyvsp[-5];
+            delete yyvsp[-3];
+            delete yyvsp[-1];
             YYERROR;
         }
-        (yyval) = new swq_expr_node( SWQ_CAST );
-        (yyval)->PushSubExpression( (yyvsp[-1]) );
-        (yyval)->PushSubExpression( (yyvsp[-3]) );
-        (yyval)->PushSubExpression( (yyvsp[-5]) );
+        yyval = new swq_expr_node( SWQ_CAST );
+        yyval->PushSubExpression( yyvsp[-1] );
+        yyval->PushSubExpression( yyvsp[-3] );
+        yyval->PushSubExpression( yyvsp[-5] );
     }
-#line 2123 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2323 "swq_parser.cpp"
     break;
 
-  case 53:
-#line 581 "swq_parser.y" /* yacc.c:1646  */
+  case 54: /* select_core: "SELECT" select_field_list "FROM" table_def opt_joins opt_where opt_group_by opt_having opt_order_by opt_limit opt_offset  */
+#line 608 "swq_parser.y"
     {
-        delete (yyvsp[-5]);
+        delete yyvsp[-7];
     }
-#line 2131 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2331 "swq_parser.cpp"
     break;
 
-  case 54:
-#line 586 "swq_parser.y" /* yacc.c:1646  */
+  case 55: /* select_core: "SELECT" "DISTINCT" select_field_list "FROM" table_def opt_joins opt_where opt_group_by opt_having opt_order_by opt_limit opt_offset  */
+#line 613 "swq_parser.y"
     {
         context->poCurSelect->query_mode = SWQM_DISTINCT_LIST;
-        delete (yyvsp[-5]);
+        delete yyvsp[-7];
     }
-#line 2140 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2340 "swq_parser.cpp"
     break;
 
-  case 57:
-#line 595 "swq_parser.y" /* yacc.c:1646  */
+  case 58: /* union_all: "UNION" "ALL"  */
+#line 622 "swq_parser.y"
     {
         swq_select* poNewSelect = new swq_select();
         context->poCurSelect->PushUnionAll(poNewSelect);
         context->poCurSelect = poNewSelect;
     }
-#line 2150 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2350 "swq_parser.cpp"
     break;
 
-  case 60:
-#line 607 "swq_parser.y" /* yacc.c:1646  */
-    {
-            if( !context->poCurSelect->PushField( (yyvsp[0]) ) )
+  case 61: /* column_spec: value_expr  */
+#line 634 "swq_parser.y"
+        {
+            if( !context->poCurSelect->PushField( yyvsp[0] ) )
             {
-                delete (yyvsp[0]);
+                delete yyvsp[0];
                 YYERROR;
             }
         }
-#line 2162 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2362 "swq_parser.cpp"
     break;
 
-  case 61:
-#line 616 "swq_parser.y" /* yacc.c:1646  */
-    {
-            if( !context->poCurSelect->PushField( (yyvsp[-1]), (yyvsp[0])->string_value ) )
+  case 62: /* column_spec: value_expr as_clause  */
+#line 643 "swq_parser.y"
+        {
+            if( !context->poCurSelect->PushField( yyvsp[-1], yyvsp[0]->string_value ) )
             {
-                delete (yyvsp[-1]);
-                delete (yyvsp[0]);
+                delete yyvsp[-1];
+                delete yyvsp[0];
                 YYERROR;
             }
-            delete (yyvsp[0]);
+            delete yyvsp[0];
         }
-#line 2176 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2376 "swq_parser.cpp"
     break;
 
-  case 62:
-#line 627 "swq_parser.y" /* yacc.c:1646  */
-    {
+  case 63: /* column_spec: '*'  */
+#line 654 "swq_parser.y"
+        {
             swq_expr_node *poNode = new swq_expr_node();
             poNode->eNodeType = SNT_COLUMN;
             poNode->string_value = CPLStrdup( "*" );
@@ -2190,16 +2390,16 @@ yyreduce:
                 YYERROR;
             }
         }
-#line 2194 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2394 "swq_parser.cpp"
     break;
 
-  case 63:
-#line 642 "swq_parser.y" /* yacc.c:1646  */
-    {
-            CPLString osTableName = (yyvsp[-2])->string_value;
+  case 64: /* column_spec: "identifier" '.' '*'  */
+#line 669 "swq_parser.y"
+        {
+            CPLString osTableName = yyvsp[-2]->string_value;
 
-            delete (yyvsp[-2]);
-            (yyvsp[-2]) = nullptr;
+            delete yyvsp[-2];
+            yyvsp[-2] = nullptr;
 
             swq_expr_node *poNode = new swq_expr_node();
             poNode->eNodeType = SNT_COLUMN;
@@ -2214,99 +2414,27 @@ yyreduce:
                 YYERROR;
             }
         }
-#line 2218 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2418 "swq_parser.cpp"
     break;
 
-  case 64:
-#line 663 "swq_parser.y" /* yacc.c:1646  */
-    {
-                // special case for COUNT(*), confirm it.
-            if( !EQUAL((yyvsp[-3])->string_value, "COUNT") )
-            {
-                CPLError( CE_Failure, CPLE_AppDefined,
-                        "Syntax Error with %s(*).",
-                        (yyvsp[-3])->string_value );
-                delete (yyvsp[-3]);
-                YYERROR;
-            }
-
-            delete (yyvsp[-3]);
-            (yyvsp[-3]) = nullptr;
-
-            swq_expr_node *poNode = new swq_expr_node();
-            poNode->eNodeType = SNT_COLUMN;
-            poNode->string_value = CPLStrdup( "*" );
-            poNode->table_index = -1;
-            poNode->field_index = -1;
-
-            swq_expr_node *count = new swq_expr_node( SWQ_COUNT );
-            count->PushSubExpression( poNode );
-
-            if( !context->poCurSelect->PushField( count ) )
-            {
-                delete count;
-                YYERROR;
-            }
-        }
-#line 2252 "swq_parser.cpp" /* yacc.c:1646  */
-    break;
-
-  case 65:
-#line 694 "swq_parser.y" /* yacc.c:1646  */
-    {
-                // special case for COUNT(*), confirm it.
-            if( !EQUAL((yyvsp[-4])->string_value, "COUNT") )
-            {
-                CPLError( CE_Failure, CPLE_AppDefined,
-                        "Syntax Error with %s(*).",
-                        (yyvsp[-4])->string_value );
-                delete (yyvsp[-4]);
-                delete (yyvsp[0]);
-                YYERROR;
-            }
-
-            delete (yyvsp[-4]);
-            (yyvsp[-4]) = nullptr;
-
-            swq_expr_node *poNode = new swq_expr_node();
-            poNode->eNodeType = SNT_COLUMN;
-            poNode->string_value = CPLStrdup( "*" );
-            poNode->table_index = -1;
-            poNode->field_index = -1;
-
-            swq_expr_node *count = new swq_expr_node( SWQ_COUNT );
-            count->PushSubExpression( poNode );
-
-            if( !context->poCurSelect->PushField( count, (yyvsp[0])->string_value ) )
-            {
-                delete count;
-                delete (yyvsp[0]);
-                YYERROR;
-            }
-
-            delete (yyvsp[0]);
-        }
-#line 2290 "swq_parser.cpp" /* yacc.c:1646  */
-    break;
-
-  case 66:
-#line 729 "swq_parser.y" /* yacc.c:1646  */
-    {
+  case 65: /* column_spec: "identifier" '(' "DISTINCT" field_value ')'  */
+#line 690 "swq_parser.y"
+        {
                 // special case for COUNT(DISTINCT x), confirm it.
-            if( !EQUAL((yyvsp[-4])->string_value, "COUNT") )
+            if( !EQUAL(yyvsp[-4]->string_value, "COUNT") )
             {
                 CPLError(
                     CE_Failure, CPLE_AppDefined,
                     "DISTINCT keyword can only be used in COUNT() operator." );
-                delete (yyvsp[-4]);
-                delete (yyvsp[-1]);
+                delete yyvsp[-4];
+                delete yyvsp[-1];
                     YYERROR;
             }
 
-            delete (yyvsp[-4]);
+            delete yyvsp[-4];
 
             swq_expr_node *count = new swq_expr_node( SWQ_COUNT );
-            count->PushSubExpression( (yyvsp[-1]) );
+            count->PushSubExpression( yyvsp[-1] );
 
             if( !context->poCurSelect->PushField( count, nullptr, TRUE ) )
             {
@@ -2314,216 +2442,235 @@ yyreduce:
                 YYERROR;
             }
         }
-#line 2318 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2446 "swq_parser.cpp"
     break;
 
-  case 67:
-#line 754 "swq_parser.y" /* yacc.c:1646  */
-    {
+  case 66: /* column_spec: "identifier" '(' "DISTINCT" field_value ')' as_clause  */
+#line 715 "swq_parser.y"
+        {
             // special case for COUNT(DISTINCT x), confirm it.
-            if( !EQUAL((yyvsp[-5])->string_value, "COUNT") )
+            if( !EQUAL(yyvsp[-5]->string_value, "COUNT") )
             {
                 CPLError( CE_Failure, CPLE_AppDefined,
                         "DISTINCT keyword can only be used in COUNT() operator." );
-                delete (yyvsp[-5]);
-                delete (yyvsp[-2]);
-                delete (yyvsp[0]);
+                delete yyvsp[-5];
+                delete yyvsp[-2];
+                delete yyvsp[0];
                 YYERROR;
             }
 
             swq_expr_node *count = new swq_expr_node( SWQ_COUNT );
-            count->PushSubExpression( (yyvsp[-2]) );
+            count->PushSubExpression( yyvsp[-2] );
 
-            if( !context->poCurSelect->PushField( count, (yyvsp[0])->string_value, TRUE ) )
+            if( !context->poCurSelect->PushField( count, yyvsp[0]->string_value, TRUE ) )
             {
-                delete (yyvsp[-5]);
+                delete yyvsp[-5];
                 delete count;
-                delete (yyvsp[0]);
+                delete yyvsp[0];
                 YYERROR;
             }
 
-            delete (yyvsp[-5]);
-            delete (yyvsp[0]);
+            delete yyvsp[-5];
+            delete yyvsp[0];
         }
-#line 2349 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2477 "swq_parser.cpp"
     break;
 
-  case 68:
-#line 783 "swq_parser.y" /* yacc.c:1646  */
-    {
-            delete (yyvsp[-1]);
-            (yyval) = (yyvsp[0]);
+  case 67: /* as_clause: "AS" "identifier"  */
+#line 744 "swq_parser.y"
+        {
+            delete yyvsp[-1];
+            yyval = yyvsp[0];
         }
-#line 2358 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2486 "swq_parser.cpp"
     break;
 
-  case 71:
-#line 792 "swq_parser.y" /* yacc.c:1646  */
-    {
-            context->poCurSelect->where_expr = (yyvsp[0]);
+  case 70: /* opt_where: "WHERE" value_expr  */
+#line 753 "swq_parser.y"
+        {
+            context->poCurSelect->where_expr = yyvsp[0];
         }
-#line 2366 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2494 "swq_parser.cpp"
     break;
 
-  case 73:
-#line 798 "swq_parser.y" /* yacc.c:1646  */
-    {
-            context->poCurSelect->PushJoin( static_cast<int>((yyvsp[-3])->int_value),
-                                            (yyvsp[-1]) );
-            delete (yyvsp[-3]);
+  case 72: /* opt_joins: "JOIN" table_def "ON" value_expr opt_joins  */
+#line 759 "swq_parser.y"
+        {
+            context->poCurSelect->PushJoin( static_cast<int>(yyvsp[-3]->int_value),
+                                            yyvsp[-1] );
+            delete yyvsp[-3];
         }
-#line 2376 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2504 "swq_parser.cpp"
     break;
 
-  case 74:
-#line 804 "swq_parser.y" /* yacc.c:1646  */
-    {
-            context->poCurSelect->PushJoin( static_cast<int>((yyvsp[-3])->int_value),
-                                            (yyvsp[-1]) );
-            delete (yyvsp[-3]);
+  case 73: /* opt_joins: "LEFT" "JOIN" table_def "ON" value_expr opt_joins  */
+#line 765 "swq_parser.y"
+        {
+            context->poCurSelect->PushJoin( static_cast<int>(yyvsp[-3]->int_value),
+                                            yyvsp[-1] );
+            delete yyvsp[-3];
         }
-#line 2386 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2514 "swq_parser.cpp"
     break;
 
-  case 79:
-#line 819 "swq_parser.y" /* yacc.c:1646  */
-    {
-            context->poCurSelect->PushOrderBy( (yyvsp[0])->table_name, (yyvsp[0])->string_value, TRUE );
-            delete (yyvsp[0]);
-            (yyvsp[0]) = nullptr;
+  case 78: /* group_spec: field_value  */
+#line 780 "swq_parser.y"
+        {
+            context->poCurSelect->PushGroupBy( yyvsp[0]->table_name, yyvsp[0]->string_value );
+            delete yyvsp[0];
+            yyvsp[0] = nullptr;
         }
-#line 2396 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2524 "swq_parser.cpp"
     break;
 
-  case 80:
-#line 825 "swq_parser.y" /* yacc.c:1646  */
-    {
-            context->poCurSelect->PushOrderBy( (yyvsp[-1])->table_name, (yyvsp[-1])->string_value, TRUE );
-            delete (yyvsp[-1]);
-            (yyvsp[-1]) = nullptr;
+  case 80: /* opt_having: "HAVING" value_expr  */
+#line 788 "swq_parser.y"
+        {
+            context->poCurSelect->having_expr = yyvsp[0];
         }
-#line 2406 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2532 "swq_parser.cpp"
     break;
 
-  case 81:
-#line 831 "swq_parser.y" /* yacc.c:1646  */
-    {
-            context->poCurSelect->PushOrderBy( (yyvsp[-1])->table_name, (yyvsp[-1])->string_value, FALSE );
-            delete (yyvsp[-1]);
-            (yyvsp[-1]) = nullptr;
+  case 85: /* sort_spec: field_value  */
+#line 801 "swq_parser.y"
+        {
+            context->poCurSelect->PushOrderBy( yyvsp[0]->table_name, yyvsp[0]->string_value, TRUE );
+            delete yyvsp[0];
+            yyvsp[0] = nullptr;
         }
-#line 2416 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2542 "swq_parser.cpp"
     break;
 
-  case 83:
-#line 839 "swq_parser.y" /* yacc.c:1646  */
+  case 86: /* sort_spec: field_value "ASC"  */
+#line 807 "swq_parser.y"
+        {
+            context->poCurSelect->PushOrderBy( yyvsp[-1]->table_name, yyvsp[-1]->string_value, TRUE );
+            delete yyvsp[-1];
+            yyvsp[-1] = nullptr;
+        }
+#line 2552 "swq_parser.cpp"
+    break;
+
+  case 87: /* sort_spec: field_value "DESC"  */
+#line 813 "swq_parser.y"
+        {
+            context->poCurSelect->PushOrderBy( yyvsp[-1]->table_name, yyvsp[-1]->string_value, FALSE );
+            delete yyvsp[-1];
+            yyvsp[-1] = nullptr;
+        }
+#line 2562 "swq_parser.cpp"
+    break;
+
+  case 89: /* opt_limit: "LIMIT" "integer number"  */
+#line 821 "swq_parser.y"
     {
-        context->poCurSelect->SetLimit( (yyvsp[0])->int_value );
-        delete (yyvsp[0]);
-        (yyvsp[0]) = nullptr;
+        context->poCurSelect->SetLimit( yyvsp[0]->int_value );
+        delete yyvsp[0];
+        yyvsp[0] = nullptr;
     }
-#line 2426 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2572 "swq_parser.cpp"
     break;
 
-  case 85:
-#line 847 "swq_parser.y" /* yacc.c:1646  */
+  case 91: /* opt_offset: "OFFSET" "integer number"  */
+#line 829 "swq_parser.y"
     {
-        context->poCurSelect->SetOffset( (yyvsp[0])->int_value );
-        delete (yyvsp[0]);
-        (yyvsp[0]) = nullptr;
+        context->poCurSelect->SetOffset( yyvsp[0]->int_value );
+        delete yyvsp[0];
+        yyvsp[0] = nullptr;
     }
-#line 2436 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2582 "swq_parser.cpp"
     break;
 
-  case 86:
-#line 855 "swq_parser.y" /* yacc.c:1646  */
+  case 92: /* table_def: "identifier"  */
+#line 837 "swq_parser.y"
     {
         const int iTable =
-            context->poCurSelect->PushTableDef( nullptr, (yyvsp[0])->string_value,
+            context->poCurSelect->PushTableDef( nullptr, yyvsp[0]->string_value,
                                                 nullptr );
-        delete (yyvsp[0]);
+        delete yyvsp[0];
 
-        (yyval) = new swq_expr_node( iTable );
+        yyval = new swq_expr_node( iTable );
     }
-#line 2449 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2595 "swq_parser.cpp"
     break;
 
-  case 87:
-#line 865 "swq_parser.y" /* yacc.c:1646  */
+  case 93: /* table_def: "identifier" as_clause  */
+#line 847 "swq_parser.y"
     {
         const int iTable =
-            context->poCurSelect->PushTableDef( nullptr, (yyvsp[-1])->string_value,
-                                                (yyvsp[0])->string_value );
-        delete (yyvsp[-1]);
-        delete (yyvsp[0]);
+            context->poCurSelect->PushTableDef( nullptr, yyvsp[-1]->string_value,
+                                                yyvsp[0]->string_value );
+        delete yyvsp[-1];
+        delete yyvsp[0];
 
-        (yyval) = new swq_expr_node( iTable );
+        yyval = new swq_expr_node( iTable );
     }
-#line 2463 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2609 "swq_parser.cpp"
     break;
 
-  case 88:
-#line 876 "swq_parser.y" /* yacc.c:1646  */
+  case 94: /* table_def: "string" '.' "identifier"  */
+#line 858 "swq_parser.y"
     {
         const int iTable =
-            context->poCurSelect->PushTableDef( (yyvsp[-2])->string_value,
-                                                (yyvsp[0])->string_value, nullptr );
-        delete (yyvsp[-2]);
-        delete (yyvsp[0]);
+            context->poCurSelect->PushTableDef( yyvsp[-2]->string_value,
+                                                yyvsp[0]->string_value, nullptr );
+        delete yyvsp[-2];
+        delete yyvsp[0];
 
-        (yyval) = new swq_expr_node( iTable );
+        yyval = new swq_expr_node( iTable );
     }
-#line 2477 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2623 "swq_parser.cpp"
     break;
 
-  case 89:
-#line 887 "swq_parser.y" /* yacc.c:1646  */
+  case 95: /* table_def: "string" '.' "identifier" as_clause  */
+#line 869 "swq_parser.y"
     {
         const int iTable =
-            context->poCurSelect->PushTableDef( (yyvsp[-3])->string_value,
-                                                (yyvsp[-1])->string_value,
-                                                (yyvsp[0])->string_value );
-        delete (yyvsp[-3]);
-        delete (yyvsp[-1]);
-        delete (yyvsp[0]);
-
-        (yyval) = new swq_expr_node( iTable );
+            context->poCurSelect->PushTableDef( yyvsp[-3]->string_value,
+                                                yyvsp[-1]->string_value,
+                                                yyvsp[0]->string_value );
+        delete yyvsp[-3];
+        delete yyvsp[-1];
+        delete yyvsp[0];
+
+        yyval = new swq_expr_node( iTable );
     }
-#line 2493 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2639 "swq_parser.cpp"
     break;
 
-  case 90:
-#line 900 "swq_parser.y" /* yacc.c:1646  */
+  case 96: /* table_def: "identifier" '.' "identifier"  */
+#line 882 "swq_parser.y"
     {
         const int iTable =
-            context->poCurSelect->PushTableDef( (yyvsp[-2])->string_value,
-                                                (yyvsp[0])->string_value, nullptr );
-        delete (yyvsp[-2]);
-        delete (yyvsp[0]);
+            context->poCurSelect->PushTableDef( yyvsp[-2]->string_value,
+                                                yyvsp[0]->string_value, nullptr );
+        delete yyvsp[-2];
+        delete yyvsp[0];
 
-        (yyval) = new swq_expr_node( iTable );
+        yyval = new swq_expr_node( iTable );
     }
-#line 2507 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2653 "swq_parser.cpp"
     break;
 
-  case 91:
-#line 911 "swq_parser.y" /* yacc.c:1646  */
+  case 97: /* table_def: "identifier" '.' "identifier" as_clause  */
+#line 893 "swq_parser.y"
     {
         const int iTable =
-            context->poCurSelect->PushTableDef( (yyvsp[-3])->string_value,
-                                                (yyvsp[-1])->string_value,
-                                                (yyvsp[0])->string_value );
-        delete (yyvsp[-3]);
-        delete (yyvsp[-1]);
-        delete (yyvsp[0]);
-
-        (yyval) = new swq_expr_node( iTable );
+            context->poCurSelect->PushTableDef( yyvsp[-3]->string_value,
+                                                yyvsp[-1]->string_value,
+                                                yyvsp[0]->string_value );
+        delete yyvsp[-3];
+        delete yyvsp[-1];
+        delete yyvsp[0];
+
+        yyval = new swq_expr_node( iTable );
     }
-#line 2523 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2669 "swq_parser.cpp"
     break;
 
 
-#line 2527 "swq_parser.cpp" /* yacc.c:1646  */
+#line 2673 "swq_parser.cpp"
+
       default: break;
     }
   /* User semantic actions sometimes alter yychar, and that requires
@@ -2537,25 +2684,23 @@ yyreduce:
      case of YYERROR or YYBACKUP, subsequent parser actions might lead
      to an incorrect destructor call or verbose syntax error message
      before the lookahead is translated.  */
-  YY_SYMBOL_PRINT ("-> $$ =", yyr1[yyn], &yyval, &yyloc);
+  YY_SYMBOL_PRINT ("-> $$ =", YY_CAST (yysymbol_kind_t, yyr1[yyn]), &yyval, &yyloc);
 
   YYPOPSTACK (yylen);
   yylen = 0;
-  YY_STACK_PRINT (yyss, yyssp);
 
   *++yyvsp = yyval;
 
   /* Now 'shift' the result of the reduction.  Determine what state
      that goes to, based on the state we popped back to and the rule
      number reduced by.  */
-
-  yyn = yyr1[yyn];
-
-  yystate = yypgoto[yyn - YYNTOKENS] + *yyssp;
-  if (0 <= yystate && yystate <= YYLAST && yycheck[yystate] == *yyssp)
-    yystate = yytable[yystate];
-  else
-    yystate = yydefgoto[yyn - YYNTOKENS];
+  {
+    const int yylhs = yyr1[yyn] - YYNTOKENS;
+    const int yyi = yypgoto[yylhs] + *yyssp;
+    yystate = (0 <= yyi && yyi <= YYLAST && yycheck[yyi] == *yyssp
+               ? yytable[yyi]
+               : yydefgoto[yylhs]);
+  }
 
   goto yynewstate;
 
@@ -2566,59 +2711,53 @@ yyreduce:
 yyerrlab:
   /* Make sure we have latest lookahead translation.  See comments at
      user semantic actions for why this is necessary.  */
-  yytoken = yychar == YYEMPTY ? YYEMPTY : YYTRANSLATE (yychar);
-
+  yytoken = yychar == YYEMPTY ? YYSYMBOL_YYEMPTY : YYTRANSLATE (yychar);
   /* If not already recovering from an error, report this error.  */
   if (!yyerrstatus)
     {
       ++yynerrs;
-#if ! YYERROR_VERBOSE
-      yyerror (context, YY_("syntax error"));
-#else
-# define YYSYNTAX_ERROR yysyntax_error (&yymsg_alloc, &yymsg, \
-                                        yyssp, yytoken)
       {
+        yypcontext_t yyctx
+          = {yyssp, yytoken};
         char const *yymsgp = YY_("syntax error");
         int yysyntax_error_status;
-        yysyntax_error_status = YYSYNTAX_ERROR;
+        yysyntax_error_status = yysyntax_error (&yymsg_alloc, &yymsg, &yyctx);
         if (yysyntax_error_status == 0)
           yymsgp = yymsg;
-        else if (yysyntax_error_status == 1)
+        else if (yysyntax_error_status == -1)
           {
             if (yymsg != yymsgbuf)
               YYSTACK_FREE (yymsg);
-            yymsg = static_cast<char *>(YYSTACK_ALLOC (yymsg_alloc));
-            if (!yymsg)
+            yymsg = YY_CAST (char *,
+                             YYSTACK_ALLOC (YY_CAST (YYSIZE_T, yymsg_alloc)));
+            if (yymsg)
               {
-                yymsg = yymsgbuf;
-                yymsg_alloc = sizeof yymsgbuf;
-                yysyntax_error_status = 2;
+                yysyntax_error_status
+                  = yysyntax_error (&yymsg_alloc, &yymsg, &yyctx);
+                yymsgp = yymsg;
               }
             else
               {
-                yysyntax_error_status = YYSYNTAX_ERROR;
-                yymsgp = yymsg;
+                yymsg = yymsgbuf;
+                yymsg_alloc = sizeof yymsgbuf;
+                yysyntax_error_status = YYENOMEM;
               }
           }
         yyerror (context, yymsgp);
-        if (yysyntax_error_status == 2)
-          goto yyexhaustedlab;
+        if (yysyntax_error_status == YYENOMEM)
+          YYNOMEM;
       }
-# undef YYSYNTAX_ERROR
-#endif
     }
 
-
-
   if (yyerrstatus == 3)
     {
       /* If just tried and failed to reuse lookahead token after an
          error, discard it.  */
 
-      if (yychar <= YYEOF)
+      if (yychar <= END)
         {
           /* Return failure if at end of input.  */
-          if (yychar == YYEOF)
+          if (yychar == END)
             YYABORT;
         }
       else
@@ -2638,12 +2777,11 @@ yyerrlab:
 | yyerrorlab -- error raised explicitly by YYERROR.  |
 `---------------------------------------------------*/
 yyerrorlab:
-
-  /* Pacify compilers like GCC when the user code never invokes
-     YYERROR and the label yyerrorlab therefore never appears in user
-     code.  */
-  if (/*CONSTCOND*/ 0)
-     goto yyerrorlab;
+  /* Pacify compilers when the user code never invokes YYERROR and the
+     label yyerrorlab therefore never appears in user code.  */
+  if (0)
+    YYERROR;
+  ++yynerrs;
 
   /* Do not reclaim the symbols of the rule whose action triggered
      this YYERROR.  */
@@ -2660,13 +2798,14 @@ yyerrorlab:
 yyerrlab1:
   yyerrstatus = 3;      /* Each real token shifted decrements this.  */
 
+  /* Pop stack until we find a state that shifts the error token.  */
   for (;;)
     {
       yyn = yypact[yystate];
       if (!yypact_value_is_default (yyn))
         {
-          yyn += YYTERROR;
-          if (0 <= yyn && yyn <= YYLAST && yycheck[yyn] == YYTERROR)
+          yyn += YYSYMBOL_YYerror;
+          if (0 <= yyn && yyn <= YYLAST && yycheck[yyn] == YYSYMBOL_YYerror)
             {
               yyn = yytable[yyn];
               if (0 < yyn)
@@ -2680,7 +2819,7 @@ yyerrlab1:
 
 
       yydestruct ("Error: popping",
-                  yystos[yystate], yyvsp, context);
+                  YY_ACCESSING_SYMBOL (yystate), yyvsp, context);
       YYPOPSTACK (1);
       yystate = *yyssp;
       YY_STACK_PRINT (yyss, yyssp);
@@ -2692,7 +2831,7 @@ yyerrlab1:
 
 
   /* Shift the error token.  */
-  YY_SYMBOL_PRINT ("Shifting", yystos[yyn], yyvsp, yylsp);
+  YY_SYMBOL_PRINT ("Shifting", YY_ACCESSING_SYMBOL (yyn), yyvsp, yylsp);
 
   yystate = yyn;
   goto yynewstate;
@@ -2703,26 +2842,30 @@ yyerrlab1:
 `-------------------------------------*/
 yyacceptlab:
   yyresult = 0;
-  goto yyreturn;
+  goto yyreturnlab;
+
 
 /*-----------------------------------.
 | yyabortlab -- YYABORT comes here.  |
 `-----------------------------------*/
 yyabortlab:
   yyresult = 1;
-  goto yyreturn;
+  goto yyreturnlab;
+
 
-#if !defined yyoverflow || YYERROR_VERBOSE
-/*-------------------------------------------------.
-| yyexhaustedlab -- memory exhaustion comes here.  |
-`-------------------------------------------------*/
+/*-----------------------------------------------------------.
+| yyexhaustedlab -- YYNOMEM (memory exhaustion) comes here.  |
+`-----------------------------------------------------------*/
 yyexhaustedlab:
   yyerror (context, YY_("memory exhausted"));
   yyresult = 2;
-  /* Fall through.  */
-#endif
+  goto yyreturnlab;
+
 
-yyreturn:
+/*----------------------------------------------------------.
+| yyreturnlab -- parsing is finished, clean up and return.  |
+`----------------------------------------------------------*/
+yyreturnlab:
   if (yychar != YYEMPTY)
     {
       /* Make sure we have latest lookahead translation.  See comments at
@@ -2738,16 +2881,15 @@ yyreturn:
   while (yyssp != yyss)
     {
       yydestruct ("Cleanup: popping",
-                  yystos[*yyssp], yyvsp, context);
+                  YY_ACCESSING_SYMBOL (+*yyssp), yyvsp, context);
       YYPOPSTACK (1);
     }
 #ifndef yyoverflow
   if (yyss != yyssa)
     YYSTACK_FREE (yyss);
 #endif
-#if YYERROR_VERBOSE
   if (yymsg != yymsgbuf)
     YYSTACK_FREE (yymsg);
-#endif
   return yyresult;
 }
+
@@ -1,8 +1,9 @@
-/* A Bison parser, made by GNU Bison 3.0.4.  */
+/* A Bison parser, made by GNU Bison 3.8.2.  */
 
 /* Bison interface for Yacc-like parsers in C
 
-   Copyright (C) 1984, 1989-1990, 2000-2015 Free Software Foundation, Inc.
+   Copyright (C) 1984, 1989-1990, 2000-2015, 2018-2021 Free Software Foundation,
+   Inc.
 
    This program is free software: you can redistribute it and/or modify
    it under the terms of the GNU General Public License as published by
@@ -15,7 +16,7 @@
    GNU General Public License for more details.
 
    You should have received a copy of the GNU General Public License
-   along with this program.  If not, see <http://www.gnu.org/licenses/>.  */
+   along with this program.  If not, see <https://www.gnu.org/licenses/>.  */
 
 /* As a special exception, you may create a larger work that contains
    part or all of the Bison parser skeleton and distribute that work
@@ -30,6 +31,10 @@
    This special exception was added by the Free Software Foundation in
    version 2.2 of Bison.  */
 
+/* DO NOT RELY ON FEATURES THAT ARE NOT DOCUMENTED in the manual,
+   especially those whose name start with YY_ or yy_.  They are
+   private implementation details that can be changed or removed.  */
+
 #ifndef YY_SWQ_SWQ_PARSER_HPP_INCLUDED
 # define YY_SWQ_SWQ_PARSER_HPP_INCLUDED
 /* Debug traces.  */
@@ -40,47 +45,53 @@
 extern int swqdebug;
 #endif
 
-/* Token type.  */
+/* Token kinds.  */
 #ifndef YYTOKENTYPE
 # define YYTOKENTYPE
   enum yytokentype
   {
-    END = 0,
-    SWQT_INTEGER_NUMBER = 258,
-    SWQT_FLOAT_NUMBER = 259,
-    SWQT_STRING = 260,
-    SWQT_IDENTIFIER = 261,
-    SWQT_IN = 262,
-    SWQT_LIKE = 263,
-    SWQT_ESCAPE = 264,
-    SWQT_BETWEEN = 265,
-    SWQT_NULL = 266,
-    SWQT_IS = 267,
-    SWQT_SELECT = 268,
-    SWQT_LEFT = 269,
-    SWQT_JOIN = 270,
-    SWQT_WHERE = 271,
-    SWQT_ON = 272,
-    SWQT_ORDER = 273,
-    SWQT_BY = 274,
-    SWQT_FROM = 275,
-    SWQT_AS = 276,
-    SWQT_ASC = 277,
-    SWQT_DESC = 278,
-    SWQT_DISTINCT = 279,
-    SWQT_CAST = 280,
-    SWQT_UNION = 281,
-    SWQT_ALL = 282,
-    SWQT_LIMIT = 283,
-    SWQT_OFFSET = 284,
-    SWQT_VALUE_START = 285,
-    SWQT_SELECT_START = 286,
-    SWQT_NOT = 287,
-    SWQT_OR = 288,
-    SWQT_AND = 289,
-    SWQT_UMINUS = 290,
-    SWQT_RESERVED_KEYWORD = 291
+    YYEMPTY = -2,
+    END = 0,                       /* "end of string"  */
+    YYerror = 256,                 /* error  */
+    YYUNDEF = 257,                 /* "invalid token"  */
+    SWQT_INTEGER_NUMBER = 258,     /* "integer number"  */
+    SWQT_FLOAT_NUMBER = 259,       /* "floating point number"  */
+    SWQT_STRING = 260,             /* "string"  */
+    SWQT_IDENTIFIER = 261,         /* "identifier"  */
+    SWQT_IN = 262,                 /* "IN"  */
+    SWQT_LIKE = 263,               /* "LIKE"  */
+    SWQT_ESCAPE = 264,             /* "ESCAPE"  */
+    SWQT_BETWEEN = 265,            /* "BETWEEN"  */
+    SWQT_NULL = 266,               /* "NULL"  */
+    SWQT_IS = 267,                 /* "IS"  */
+    SWQT_SELECT = 268,             /* "SELECT"  */
+    SWQT_LEFT = 269,               /* "LEFT"  */
+    SWQT_JOIN = 270,               /* "JOIN"  */
+    SWQT_WHERE = 271,              /* "WHERE"  */
+    SWQT_ON = 272,                 /* "ON"  */
+    SWQT_ORDER = 273,              /* "ORDER"  */
+    SWQT_BY = 274,                 /* "BY"  */
+    SWQT_FROM = 275,               /* "FROM"  */
+    SWQT_AS = 276,                 /* "AS"  */
+    SWQT_ASC = 277,                /* "ASC"  */
+    SWQT_DESC = 278,               /* "DESC"  */
+    SWQT_DISTINCT = 279,           /* "DISTINCT"  */
+    SWQT_CAST = 280,               /* "CAST"  */
+    SWQT_UNION = 281,              /* "UNION"  */
+    SWQT_ALL = 282,                /* "ALL"  */
+    SWQT_LIMIT = 283,              /* "LIMIT"  */
+    SWQT_OFFSET = 284,             /* "OFFSET"  */
+    SWQT_GROUP = 285,              /* "GROUP"  */
+    SWQT_HAVING = 286,             /* "HAVING"  */
+    SWQT_VALUE_START = 287,        /* SWQT_VALUE_START  */
+    SWQT_SELECT_START = 288,       /* SWQT_SELECT_START  */
+    SWQT_NOT = 289,                /* "NOT"  */
+    SWQT_OR = 290,                 /* "OR"  */
+    SWQT_AND = 291,                /* "AND"  */
+    SWQT_UMINUS = 292,             /* SWQT_UMINUS  */
+    SWQT_RESERVED_KEYWORD = 293    /* "reserved keyword"  */
   };
+  typedef enum yytokentype yytoken_kind_t;
 #endif
 
 /* Value type.  */
@@ -92,6 +103,8 @@ typedef int YYSTYPE;
 
 
 
+
 int swqparse (swq_parse_context *context);
 
+
 #endif /* !YY_SWQ_SWQ_PARSER_HPP_INCLUDED  */
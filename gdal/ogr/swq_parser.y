@@ -89,6 +89,8 @@ CPL_CVSID("$Id$")
 %token SWQT_ALL                 "ALL"
 %token SWQT_LIMIT               "LIMIT"
 %token SWQT_OFFSET              "OFFSET"
+%token SWQT_GROUP               "GROUP"
+%token SWQT_HAVING              "HAVING"
 
 %token SWQT_VALUE_START
 %token SWQT_SELECT_START
@@ -505,6 +507,31 @@ value_expr_non_logical:
             }
         }
 
+    | SWQT_IDENTIFIER '(' '*' ')'
+        {
+            // special case for COUNT(*), confirm it.
+            if( !EQUAL($1->string_value, "COUNT") )
+            {
+                CPLError( CE_Failure, CPLE_AppDefined,
+                        "Syntax Error with %s(*).",
+                        $1->string_value );
+                delete $1;
+                YYERROR;
+            }
+
+            delete $1;
+            $1 = nullptr;
+
+            swq_expr_node *poNode = new swq_expr_node();
+            poNode->eNodeType = SNT_COLUMN;
+            poNode->string_value = CPLStrdup( "*" );
+            poNode->table_index = -1;
+            poNode->field_index = -1;
+
+            $$ = new swq_expr_node( SWQ_COUNT );
+            $$->PushSubExpression( poNode );
+        }
+
     | SWQT_CAST '(' value_expr SWQT_AS type_def ')'
         {
             $$ = $5;
@@ -577,12 +604,12 @@ select_statement:
     | '(' select_core ')' opt_union_all
 
 select_core:
-    SWQT_SELECT select_field_list SWQT_FROM table_def opt_joins opt_where opt_order_by opt_limit opt_offset
+    SWQT_SELECT select_field_list SWQT_FROM table_def opt_joins opt_where opt_group_by opt_having opt_order_by opt_limit opt_offset
     {
         delete $4;
     }
 
-    | SWQT_SELECT SWQT_DISTINCT select_field_list SWQT_FROM table_def opt_joins opt_where opt_order_by opt_limit opt_offset
+    | SWQT_SELECT SWQT_DISTINCT select_field_list SWQT_FROM table_def opt_joins opt_where opt_group_by opt_having opt_order_by opt_limit opt_offset
     {
         context->poCurSelect->query_mode = SWQM_DISTINCT_LIST;
         delete $5;
@@ -659,72 +686,6 @@ column_spec:
             }
         }
 
-    | SWQT_IDENTIFIER '(' '*' ')'
-        {
-                // special case for COUNT(*), confirm it.
-            if( !EQUAL($1->string_value, "COUNT") )
-            {
-                CPLError( CE_Failure, CPLE_AppDefined,
-                        "Syntax Error with %s(*).",
-                        $1->string_value );
-                delete $1;
-                YYERROR;
-            }
-
-            delete $1;
-            $1 = nullptr;
-
-            swq_expr_node *poNode = new swq_expr_node();
-            poNode->eNodeType = SNT_COLUMN;
-            poNode->string_value = CPLStrdup( "*" );
-            poNode->table_index = -1;
-            poNode->field_index = -1;
-
-            swq_expr_node *count = new swq_expr_node( SWQ_COUNT );
-            count->PushSubExpression( poNode );
-
-            if( !context->poCurSelect->PushField( count ) )
-            {
-                delete count;
-                YYERROR;
-            }
-        }
-
-    | SWQT_IDENTIFIER '(' '*' ')' as_clause
-        {
-                // special case for COUNT(*), confirm it.
-            if( !EQUAL($1->string_value, "COUNT") )
-            {
-                CPLError( CE_Failure, CPLE_AppDefined,
-                        "Syntax Error with %s(*).",
-                        $1->string_value );
-                delete $1;
-                delete $5;
-                YYERROR;
-            }
-
-            delete $1;
-            $1 = nullptr;
-
-            swq_expr_node *poNode = new swq_expr_node();
-            poNode->eNodeType = SNT_COLUMN;
-            poNode->string_value = CPLStrdup( "*" );
-            poNode->table_index = -1;
-            poNode->field_index = -1;
-
-            swq_expr_node *count = new swq_expr_node( SWQ_COUNT );
-            count->PushSubExpression( poNode );
-
-            if( !context->poCurSelect->PushField( count, $5->string_value ) )
-            {
-                delete count;
-                delete $5;
-                YYERROR;
-            }
-
-            delete $5;
-        }
-
     | SWQT_IDENTIFIER '(' SWQT_DISTINCT field_value ')'
         {
                 // special case for COUNT(DISTINCT x), confirm it.
@@ -807,6 +768,27 @@ opt_joins:
             delete $3;
         }
 
+opt_group_by:
+    | SWQT_GROUP SWQT_BY group_spec_list
+
+group_spec_list:
+    group_spec ',' group_spec_list
+    | group_spec
+
+group_spec:
+    field_value
+        {
+            context->poCurSelect->PushGroupBy( $1->table_name, $1->string_value );
+            delete $1;
+            $1 = nullptr;
+        }
+
+opt_having:
+    | SWQT_HAVING value_expr
+        {
+            context->poCurSelect->having_expr = $2;
+        }
+
 opt_order_by:
     | SWQT_ORDER SWQT_BY sort_spec_list
 
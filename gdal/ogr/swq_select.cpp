@@ -89,6 +89,16 @@ swq_select::~swq_select()
 
     CPLFree( order_defs );
 
+    for( int i = 0; i < group_by_count; i++ )
+    {
+        CPLFree( group_by_defs[i].table_name );
+        CPLFree( group_by_defs[i].field_name );
+    }
+
+    CPLFree( group_by_defs );
+    delete having_expr;
+    delete having_result_expr;
+
     for( int i = 0; i < join_count; i++ )
     {
         delete join_defs[i].poExpr;
@@ -397,6 +407,27 @@ char* swq_select::Unparse()
         CPLFree(pszTmp);
     }
 
+    for( int i = 0; i < group_by_count; i++ )
+    {
+        osSelect += i == 0 ? " GROUP BY " : ", ";
+        if( group_by_defs[i].table_name[0] != '\0' )
+        {
+            osSelect += swq_expr_node::QuoteIfNecessary(
+                group_by_defs[i].table_name, '"');
+            osSelect += ".";
+        }
+        osSelect +=
+            swq_expr_node::QuoteIfNecessary(group_by_defs[i].field_name, '"');
+    }
+
+    if( having_expr != nullptr )
+    {
+        osSelect += " HAVING ";
+        char* pszTmp = having_expr->Unparse(nullptr, '"');
+        osSelect += pszTmp;
+        CPLFree(pszTmp);
+    }
+
     for( int i = 0; i < order_specs; i++ )
     {
         osSelect += " ORDER BY ";
@@ -745,6 +776,26 @@ void swq_select::PushOrderBy( const char* pszTableName,
     order_defs[order_specs-1].ascending_flag = bAscending;
 }
 
+/************************************************************************/
+/*                            PushGroupBy()                             */
+/************************************************************************/
+
+void swq_select::PushGroupBy( const char* pszTableName,
+                              const char *pszFieldName )
+
+{
+    group_by_count++;
+    group_by_defs = static_cast<swq_group_by_def *>(
+        CPLRealloc(group_by_defs, sizeof(swq_group_by_def) * group_by_count));
+
+    group_by_defs[group_by_count-1].table_name =
+        CPLStrdup(pszTableName ? pszTableName : "");
+    group_by_defs[group_by_count-1].field_name = CPLStrdup(pszFieldName);
+    group_by_defs[group_by_count-1].table_index = -1;
+    group_by_defs[group_by_count-1].field_index = -1;
+    group_by_defs[group_by_count-1].field_type = SWQ_OTHER;
+}
+
 /************************************************************************/
 /*                              PushJoin()                              */
 /************************************************************************/
@@ -1020,6 +1071,342 @@ static bool CheckCompatibleJoinExpr( swq_expr_node* poExpr,
     return false;
 }
 
+/************************************************************************/
+/*                        GetResultColumnType()                         */
+/*                                                                      */
+/*      Type of the value of a result column in SWQM_GROUP_BY mode.     */
+/************************************************************************/
+
+static swq_field_type GetResultColumnType( const swq_col_def* def )
+{
+    if( def->col_func == SWQCF_COUNT )
+        return SWQ_INTEGER64;
+    if( def->col_func == SWQCF_AVG &&
+        def->field_type != SWQ_DATE &&
+        def->field_type != SWQ_TIME &&
+        def->field_type != SWQ_TIMESTAMP )
+        return SWQ_FLOAT;
+    return def->field_type;
+}
+
+/************************************************************************/
+/*                       FindGroupByResultColumn()                      */
+/*                                                                      */
+/*      Find the result column matching a column reference in the       */
+/*      ORDER BY or HAVING clause of a GROUP BY query.  The name is     */
+/*      first looked up among the column aliases, and then among the    */
+/*      grouping columns of the primary table.                          */
+/************************************************************************/
+
+static int FindGroupByResultColumn( swq_select* psSelect,
+                                    swq_field_list *field_list,
+                                    const char* pszTableName,
+                                    const char* pszFieldName )
+{
+    if( pszTableName == nullptr || pszTableName[0] == '\0' )
+    {
+        for( int i = 0; i < psSelect->result_columns; i++ )
+        {
+            const swq_col_def *def = psSelect->column_defs + i;
+            if( def->field_alias != nullptr &&
+                EQUAL(def->field_alias, pszFieldName) )
+                return i;
+        }
+    }
+
+    swq_field_type eType = SWQ_OTHER;
+    int table_index = -1;
+    const int field_index =
+        swq_identify_field( pszTableName, pszFieldName, field_list,
+                            &eType, &table_index );
+    if( field_index < 0 )
+        return -1;
+    for( int i = 0; i < psSelect->result_columns; i++ )
+    {
+        const swq_col_def *def = psSelect->column_defs + i;
+        if( def->col_func == SWQCF_NONE &&
+            def->table_index == table_index &&
+            def->field_index == field_index )
+            return i;
+    }
+    return -1;
+}
+
+/************************************************************************/
+/*                        ResolveHavingExpr()                           */
+/*                                                                      */
+/*      Replace column references and aggregate functions of the        */
+/*      HAVING clause by references to the result columns.  Returns     */
+/*      the new node, or nullptr in case of error.                      */
+/************************************************************************/
+
+static swq_expr_node* ResolveHavingExpr( swq_select* psSelect,
+                                         swq_field_list *field_list,
+                                         swq_expr_node* poNode )
+{
+    int iResultColumn = -1;
+
+    if( poNode->eNodeType == SNT_CONSTANT )
+        return poNode;
+
+    if( poNode->eNodeType == SNT_COLUMN )
+    {
+        iResultColumn = FindGroupByResultColumn(
+            psSelect, field_list, poNode->table_name, poNode->string_value );
+        if( iResultColumn < 0 )
+        {
+            CPLError( CE_Failure, CPLE_AppDefined,
+                      "Field %s in HAVING clause must be a column selected "
+                      "by the GROUP BY query.",
+                      poNode->string_value );
+            return nullptr;
+        }
+    }
+    else if( poNode->nOperation >= SWQ_AVG && poNode->nOperation <= SWQ_SUM )
+    {
+        const swq_operation *poOp = swq_op_registrar::GetOperator(
+            static_cast<swq_op>(poNode->nOperation) );
+        if( poNode->nSubExprCount != 1 ||
+            poNode->papoSubExpr[0]->eNodeType != SNT_COLUMN )
+        {
+            CPLError( CE_Failure, CPLE_AppDefined,
+                      "Argument of column Summary Function '%s' "
+                      "should be a column.",
+                      poOp->pszName );
+            return nullptr;
+        }
+
+        swq_expr_node* poArg = poNode->papoSubExpr[0];
+        int field_index = -1;
+        int table_index = -1;
+        if( !(poNode->nOperation == SWQ_COUNT &&
+              strcmp(poArg->string_value, "*") == 0) )
+        {
+            swq_field_type eType = SWQ_OTHER;
+            field_index = swq_identify_field( poArg->table_name,
+                                              poArg->string_value,
+                                              field_list,
+                                              &eType, &table_index );
+            if( field_index < 0 )
+            {
+                CPLError( CE_Failure, CPLE_AppDefined,
+                          "Unrecognized field name %s in HAVING clause.",
+                          poArg->string_value );
+                return nullptr;
+            }
+        }
+
+        for( int i = 0; i < psSelect->result_columns; i++ )
+        {
+            const swq_col_def *def = psSelect->column_defs + i;
+            if( static_cast<int>(def->col_func) == poNode->nOperation &&
+                !def->distinct_flag &&
+                def->field_index == field_index &&
+                (field_index < 0 || def->table_index == table_index) )
+            {
+                iResultColumn = i;
+                break;
+            }
+        }
+        if( iResultColumn < 0 )
+        {
+            CPLError( CE_Failure, CPLE_AppDefined,
+                      "%s(%s) in HAVING clause must also be in the list of "
+                      "selected columns.",
+                      poOp->pszName, poArg->string_value );
+            return nullptr;
+        }
+    }
+    else
+    {
+        for( int i = 0; i < poNode->nSubExprCount; i++ )
+        {
+            swq_expr_node* poNewSubExpr = ResolveHavingExpr(
+                psSelect, field_list, poNode->papoSubExpr[i] );
+            if( poNewSubExpr == nullptr )
+                return nullptr;
+            if( poNewSubExpr != poNode->papoSubExpr[i] )
+            {
+                delete poNode->papoSubExpr[i];
+                poNode->papoSubExpr[i] = poNewSubExpr;
+            }
+        }
+        return poNode;
+    }
+
+    const swq_col_def *def = psSelect->column_defs + iResultColumn;
+    swq_expr_node* poColumn = new swq_expr_node();
+    poColumn->eNodeType = SNT_COLUMN;
+    poColumn->string_value = CPLStrdup(
+        def->field_alias ? def->field_alias : def->field_name );
+    poColumn->table_index = 0;
+    poColumn->field_index = iResultColumn;
+    poColumn->field_type = GetResultColumnType(def);
+    return poColumn;
+}
+
+/************************************************************************/
+/*                           ParseGroupBy()                             */
+/*                                                                      */
+/*      Post-parse processing of the GROUP BY, HAVING and ORDER BY      */
+/*      clauses of a GROUP BY query.                                    */
+/************************************************************************/
+
+static CPLErr ParseGroupBy( swq_select* psSelect, swq_field_list *field_list,
+                            swq_custom_func_registrar* poCustomFuncRegistrar )
+{
+    if( psSelect->query_mode == SWQM_DISTINCT_LIST )
+    {
+        CPLError( CE_Failure, CPLE_NotSupported,
+                  "SELECT DISTINCT and GROUP BY not supported together." );
+        return CE_Failure;
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Identify grouping fields.                                       */
+/* -------------------------------------------------------------------- */
+    for( int i = 0; i < psSelect->group_by_count; i++ )
+    {
+        swq_group_by_def *def = psSelect->group_by_defs + i;
+
+        def->field_index = swq_identify_field( def->table_name,
+                                               def->field_name, field_list,
+                                               &(def->field_type),
+                                               &(def->table_index) );
+        if( def->field_index == -1 )
+        {
+            CPLError( CE_Failure, CPLE_AppDefined,
+                      "Unrecognized field name %s in GROUP BY.",
+                      def->table_name[0] ?
+                      CPLSPrintf("%s.%s", def->table_name, def->field_name)
+                      : def->field_name );
+            return CE_Failure;
+        }
+
+        if( def->table_index != 0 )
+        {
+            CPLError( CE_Failure, CPLE_AppDefined,
+                      "Cannot use field '%s' of a secondary table in "
+                      "a GROUP BY clause",
+                      def->field_name );
+            return CE_Failure;
+        }
+
+        if( def->field_type == SWQ_GEOMETRY )
+        {
+            CPLError( CE_Failure, CPLE_AppDefined,
+                      "Cannot use geometry field '%s' in a GROUP BY clause",
+                      def->field_name );
+            return CE_Failure;
+        }
+    }
+
+/* -------------------------------------------------------------------- */
+/*      Each result column must be either a grouping field, or an       */
+/*      aggregate of a field of the primary table.                      */
+/* -------------------------------------------------------------------- */
+    for( int i = 0; i < psSelect->result_columns; i++ )
+    {
+        const swq_col_def *def = psSelect->column_defs + i;
+
+        if( def->col_func == SWQCF_MIN
+            || def->col_func == SWQCF_MAX
+            || def->col_func == SWQCF_AVG
+            || def->col_func == SWQCF_SUM
+            || def->col_func == SWQCF_COUNT )
+        {
+            if( def->field_index >= 0 && def->table_index != 0 )
+            {
+                CPLError( CE_Failure, CPLE_AppDefined,
+                          "Cannot use field '%s' of a secondary table in "
+                          "an aggregate function of a GROUP BY query",
+                          def->field_name );
+                return CE_Failure;
+            }
+            if( def->col_func == SWQCF_COUNT &&
+                def->distinct_flag &&
+                def->field_type == SWQ_GEOMETRY )
+            {
+                CPLError(CE_Failure, CPLE_AppDefined,
+                         "SELECT COUNT DISTINCT on a geometry not supported.");
+                return CE_Failure;
+            }
+            continue;
+        }
+
+        bool bGrouped = false;
+        if( def->col_func == SWQCF_NONE &&
+            (def->expr == nullptr || def->expr->eNodeType == SNT_COLUMN) )
+        {
+            for( int j = 0; j < psSelect->group_by_count; j++ )
+            {
+                if( psSelect->group_by_defs[j].table_index ==
+                                                        def->table_index &&
+                    psSelect->group_by_defs[j].field_index ==
+                                                        def->field_index )
+                {
+                    bGrouped = true;
+                    break;
+                }
+            }
+        }
+        if( !bGrouped )
+        {
+            CPLError( CE_Failure, CPLE_AppDefined,
+                      "Column %s must appear in the GROUP BY clause or be "
+                      "used in an aggregate function.",
+                      def->field_name[0] ? def->field_name :
+                      CPLSPrintf("#%d", i + 1) );
+            return CE_Failure;
+        }
+    }
+
+    psSelect->query_mode = SWQM_GROUP_BY;
+
+/* -------------------------------------------------------------------- */
+/*      ORDER BY applies to the result columns.                         */
+/* -------------------------------------------------------------------- */
+    for( int i = 0; i < psSelect->order_specs; i++ )
+    {
+        swq_order_def *def = psSelect->order_defs + i;
+
+        const int iResultColumn = FindGroupByResultColumn(
+            psSelect, field_list, def->table_name, def->field_name );
+        if( iResultColumn < 0 )
+        {
+            CPLError( CE_Failure, CPLE_AppDefined,
+                      "Field %s in ORDER BY clause must be a column selected "
+                      "by the GROUP BY query.",
+                      def->field_name );
+            return CE_Failure;
+        }
+        def->table_index = -1;
+        def->field_index = iResultColumn;
+    }
+
+/* -------------------------------------------------------------------- */
+/*      HAVING applies to the result columns too.                       */
+/* -------------------------------------------------------------------- */
+    if( psSelect->having_expr != nullptr )
+    {
+        swq_expr_node* poExpr = psSelect->having_expr->Clone();
+        swq_expr_node* poNewExpr = ResolveHavingExpr(
+            psSelect, field_list, poExpr );
+        if( poNewExpr != poExpr )
+            delete poExpr;
+        if( poNewExpr == nullptr )
+            return CE_Failure;
+        delete psSelect->having_result_expr;
+        psSelect->having_result_expr = poNewExpr;
+        if( psSelect->having_result_expr->Check( field_list, FALSE, FALSE,
+                                                 poCustomFuncRegistrar ) ==
+                                                                SWQ_ERROR )
+            return CE_Failure;
+    }
+
+    return CE_None;
+}
+
 /************************************************************************/
 /*                               parse()                                */
 /*                                                                      */
@@ -1107,6 +1494,19 @@ CPLErr swq_select::parse( swq_field_list *field_list,
 /*      indications.                                                    */
 /* -------------------------------------------------------------------- */
 
+    if( group_by_count > 0 )
+    {
+        if( ParseGroupBy( this, field_list, poCustomFuncRegistrar ) !=
+                                                                CE_None )
+            return CE_Failure;
+    }
+    else if( having_expr != nullptr )
+    {
+        CPLError( CE_Failure, CPLE_NotSupported,
+                  "HAVING clause without GROUP BY not supported." );
+        return CE_Failure;
+    }
+
     int bAllowDistinctOnMultipleFields = (
         poParseOptions && poParseOptions->bAllowDistinctOnMultipleFields );
     if( query_mode == SWQM_DISTINCT_LIST && result_columns > 1 &&
@@ -1117,7 +1517,7 @@ CPLErr swq_select::parse( swq_field_list *field_list,
             return CE_Failure;
     }
 
-    for( int i = 0; i < result_columns; i++ )
+    for( int i = 0; query_mode != SWQM_GROUP_BY && i < result_columns; i++ )
     {
         swq_col_def *def = column_defs + i;
         int this_indicator = -1;
@@ -1198,7 +1598,7 @@ CPLErr swq_select::parse( swq_field_list *field_list,
 /* -------------------------------------------------------------------- */
 /*      Process column names in order specs.                            */
 /* -------------------------------------------------------------------- */
-    for( int i = 0; i < order_specs; i++ )
+    for( int i = 0; query_mode != SWQM_GROUP_BY && i < order_specs; i++ )
     {
         swq_order_def *def = order_defs + i;
 
@@ -31,9 +31,12 @@
 #include "cpl_vsil_curl_class.h"
 
 #include <algorithm>
+#include <chrono>
 #include <set>
 #include <map>
 #include <memory>
+#include <mutex>
+#include <vector>
 
 #include "cpl_aws.h"
 #include "cpl_minixml.h"
@@ -43,6 +46,7 @@
 #include "cpl_vsi.h"
 #include "cpl_vsi_virtual.h"
 #include "cpl_http.h"
+#include "cpl_md5.h"
 #include "cpl_mem_cache.h"
 
 CPL_CVSID("$Id$")
@@ -757,10 +761,12 @@ vsi_l_offset VSICurlHandle::GetFileSize( bool bSetError )
     CPLString osURL(m_pszURL);
     bool bRetryWithGet = false;
     bool bS3LikeRedirect = false;
+    bool bAddFirstBytesToCache = false;
     int nRetryCount = 0;
     double dfRetryDelay = m_dfRetryDelay;
 
 retry:
+    bAddFirstBytesToCache = false;
     CURL* hCurlHandle = curl_easy_init();
 
     struct curl_slist* headers =
@@ -987,19 +993,10 @@ retry:
                         CPLAtoGIntBig(pszContentRange + 1));
                 }
 
-                // Add first bytes to cache
-                if( sWriteFuncData.pBuffer != nullptr )
-                {
-                    for( size_t nOffset = 0;
-                            nOffset + DOWNLOAD_CHUNK_SIZE <= sWriteFuncData.nSize;
-                            nOffset += DOWNLOAD_CHUNK_SIZE )
-                    {
-                        poFS->AddRegion(m_pszURL,
-                                        nOffset,
-                                        DOWNLOAD_CHUNK_SIZE,
-                                        sWriteFuncData.pBuffer + nOffset);
-                    }
-                }
+                // The first bytes are added to the cache once the file
+                // properties are set, as they are needed to store them in
+                // the disk cache.
+                bAddFirstBytesToCache = sWriteFuncData.pBuffer != nullptr;
             }
         }
         else if ( IsDirectoryFromExists(osVerb,
@@ -1127,7 +1124,6 @@ retry:
         }
     }
 
-    CPLFree(sWriteFuncData.pBuffer);
     CPLFree(sWriteFuncHeaderData.pBuffer);
     curl_easy_cleanup(hCurlHandle);
 
@@ -1136,6 +1132,21 @@ retry:
         oFileProp.mTime = mtime;
     poFS->SetCachedFileProp(m_pszURL, oFileProp);
 
+    // Add first bytes to cache
+    if( bAddFirstBytesToCache )
+    {
+        for( size_t nOffset = 0;
+                nOffset + DOWNLOAD_CHUNK_SIZE <= sWriteFuncData.nSize;
+                nOffset += DOWNLOAD_CHUNK_SIZE )
+        {
+            poFS->AddRegion(m_pszURL,
+                            nOffset,
+                            DOWNLOAD_CHUNK_SIZE,
+                            sWriteFuncData.pBuffer + nOffset);
+        }
+    }
+    CPLFree(sWriteFuncData.pBuffer);
+
     return oFileProp.fileSize;
 }
 
@@ -2426,6 +2437,274 @@ CURLM* VSICurlFilesystemHandler::GetCurlMultiHandleFor(const CPLString& /*osURL*
     return conn.hCurlMultiHandle;
 }
 
+/************************************************************************/
+/*                       Persistent disk cache                          */
+/*                                                                      */
+/*      When CPL_VSIL_CURL_DISK_CACHE_DIR is set, downloaded chunks     */
+/*      are also stored in that directory, one file per chunk, so that  */
+/*      other processes can reuse them.  Files are named after the      */
+/*      URL, the ETag (or the modification time and size) of the       */
+/*      remote file and the chunk size, so that chunks of a modified    */
+/*      remote file are never reused.  The total size of the directory  */
+/*      is bounded by CPL_VSIL_CURL_DISK_CACHE_SIZE, least recently     */
+/*      used chunks being removed first.                                */
+/*                                                                      */
+/*      Each chunk file starts with the sequence number of its last     */
+/*      access, as a little-endian 64 bit integer, which gives the      */
+/*      order of eviction.  Sequence numbers are the time in            */
+/*      microseconds, made strictly increasing within a process, so     */
+/*      that they are also ordered between processes.                   */
+/************************************************************************/
+
+static std::mutex goDiskCacheMutex;
+static GIntBig gnDiskCacheBytesWritten = 0;
+static bool gbDiskCacheEvictionDone = false;
+static GUInt64 gnDiskCacheLastAccessSeq = 0;
+
+constexpr int DISK_CACHE_HEADER_SIZE = 8;
+
+/************************************************************************/
+/*                     GetDiskCacheAccessSequence()                     */
+/************************************************************************/
+
+static GUInt64 GetDiskCacheAccessSequence()
+{
+    const GUInt64 nNow = static_cast<GUInt64>(
+        std::chrono::duration_cast<std::chrono::microseconds>(
+            std::chrono::system_clock::now().time_since_epoch()).count());
+    std::lock_guard<std::mutex> oLock(goDiskCacheMutex);
+    gnDiskCacheLastAccessSeq = std::max(gnDiskCacheLastAccessSeq + 1, nNow);
+    return gnDiskCacheLastAccessSeq;
+}
+
+/************************************************************************/
+/*                     WriteDiskCacheAccessSequence()                   */
+/************************************************************************/
+
+static bool WriteDiskCacheAccessSequence( VSILFILE* fp )
+{
+    GUInt64 nSeq = GetDiskCacheAccessSequence();
+    CPL_LSBPTR64(&nSeq);
+    return VSIFSeekL(fp, 0, SEEK_SET) == 0 &&
+           VSIFWriteL(&nSeq, 1, sizeof(nSeq), fp) == sizeof(nSeq);
+}
+
+/************************************************************************/
+/*                     ReadDiskCacheAccessSequence()                    */
+/************************************************************************/
+
+static bool ReadDiskCacheAccessSequence( const char* pszFilename,
+                                         GUInt64& nSeq )
+{
+    VSILFILE* fp = VSIFOpenL(pszFilename, "rb");
+    if( fp == nullptr )
+        return false;
+    const bool bOK = VSIFReadL(&nSeq, 1, sizeof(nSeq), fp) == sizeof(nSeq);
+    VSIFCloseL(fp);
+    CPL_LSBPTR64(&nSeq);
+    return bOK;
+}
+
+/************************************************************************/
+/*                      GetDiskCacheChunkFilename()                     */
+/************************************************************************/
+
+static CPLString GetDiskCacheChunkFilename( const char* pszCacheDir,
+                                            const char* pszURL,
+                                            const FileProp& oFileProp,
+                                            vsi_l_offset nFileOffsetStart )
+{
+    CPLString osKey(pszURL);
+    if( !oFileProp.ETag.empty() )
+    {
+        osKey += "\nETag:" + oFileProp.ETag;
+    }
+    else if( oFileProp.mTime != 0 && oFileProp.bHasComputedFileSize )
+    {
+        osKey += CPLSPrintf("\nmtime:" CPL_FRMT_GIB ",size:" CPL_FRMT_GUIB,
+                            static_cast<GIntBig>(oFileProp.mTime),
+                            static_cast<GUIntBig>(oFileProp.fileSize));
+    }
+    else
+    {
+        // Cannot check that the remote file has not changed.
+        return CPLString();
+    }
+    osKey += CPLSPrintf("\n%d", DOWNLOAD_CHUNK_SIZE);
+
+    const CPLString osBasename(
+        CPLSPrintf("%s_" CPL_FRMT_GUIB, CPLMD5String(osKey),
+                   static_cast<GUIntBig>(
+                       nFileOffsetStart / DOWNLOAD_CHUNK_SIZE)));
+    return CPLFormFilename(pszCacheDir, osBasename, "vsicurl_chunk");
+}
+
+/************************************************************************/
+/*                        ReadFromDiskCache()                           */
+/************************************************************************/
+
+static std::shared_ptr<std::string> ReadFromDiskCache(
+                                            const CPLString& osFilename )
+{
+    // Opened in update mode to record the access, unless the cache is
+    // read-only.
+    bool bUpdate = true;
+    VSILFILE* fp = VSIFOpenL(osFilename, "r+b");
+    if( fp == nullptr )
+    {
+        bUpdate = false;
+        fp = VSIFOpenL(osFilename, "rb");
+        if( fp == nullptr )
+            return nullptr;
+    }
+
+    std::shared_ptr<std::string> poData;
+    VSIFSeekL(fp, 0, SEEK_END);
+    const vsi_l_offset nFileSize = VSIFTellL(fp);
+    if( nFileSize > DISK_CACHE_HEADER_SIZE &&
+        nFileSize <= static_cast<vsi_l_offset>(DISK_CACHE_HEADER_SIZE +
+                                               DOWNLOAD_CHUNK_SIZE) )
+    {
+        poData = std::make_shared<std::string>();
+        poData->resize(static_cast<size_t>(nFileSize) -
+                       DISK_CACHE_HEADER_SIZE);
+        VSIFSeekL(fp, DISK_CACHE_HEADER_SIZE, SEEK_SET);
+        if( VSIFReadL(&(*poData)[0], 1, poData->size(), fp) != poData->size() )
+            poData.reset();
+    }
+
+    if( poData && bUpdate )
+        WriteDiskCacheAccessSequence(fp);
+    VSIFCloseL(fp);
+
+    return poData;
+}
+
+/************************************************************************/
+/*                          EvictFromDiskCache()                        */
+/************************************************************************/
+
+static void EvictFromDiskCache( const char* pszCacheDir, GIntBig nMaxSize )
+{
+    const time_t nNow = time(nullptr);
+
+    // Only one process at a time does the eviction. Remove a lock left by
+    // a process that died.
+    const CPLString osLockTarget(
+        CPLFormFilename(pszCacheDir, "vsicurl_disk_cache", nullptr));
+    const CPLString osLockFilename(osLockTarget + ".lock");
+    VSIStatBufL sStat;
+    if( VSIStatL(osLockFilename, &sStat) == 0 &&
+        sStat.st_mtime + 600 < nNow )
+    {
+        VSIUnlink(osLockFilename);
+    }
+    void* hLock = CPLLockFile(osLockTarget, 0.0);
+    if( hLock == nullptr )
+        return;
+
+    struct DiskCacheEntry
+    {
+        CPLString osFilename{};
+        GUInt64   nAccessSeq = 0;
+        GIntBig   nSize = 0;
+    };
+    std::vector<DiskCacheEntry> aoEntries;
+    GIntBig nTotalSize = 0;
+    char** papszFiles = VSIReadDir(pszCacheDir);
+    for( char** papszIter = papszFiles; papszIter && *papszIter; ++papszIter )
+    {
+        const CPLString osFilename(
+            CPLFormFilename(pszCacheDir, *papszIter, nullptr));
+        // Do not use CPLGetExtension(): it ignores extensions longer than
+        // 10 characters, such as "vsicurl_chunk".
+        const CPLString osName(*papszIter);
+        const bool bIsChunk = osName.endsWith(".vsicurl_chunk");
+        const bool bIsTmp = osName.endsWith(".tmp");
+        if( (!bIsChunk && !bIsTmp) || VSIStatL(osFilename, &sStat) != 0 )
+            continue;
+        if( bIsTmp )
+        {
+            // Left by a process that died while writing.
+            if( sStat.st_mtime + 3600 < nNow )
+                VSIUnlink(osFilename);
+            continue;
+        }
+        DiskCacheEntry oEntry;
+        oEntry.osFilename = osFilename;
+        // Chunks whose header cannot be read are evicted first.
+        if( !ReadDiskCacheAccessSequence(osFilename, oEntry.nAccessSeq) )
+            oEntry.nAccessSeq = 0;
+        oEntry.nSize = static_cast<GIntBig>(sStat.st_size);
+        nTotalSize += oEntry.nSize;
+        aoEntries.emplace_back(oEntry);
+    }
+    CSLDestroy(papszFiles);
+
+    if( nTotalSize > nMaxSize )
+    {
+        // Leave some room so that eviction does not run too often.
+        const GIntBig nTargetSize = nMaxSize - nMaxSize / 10;
+        std::sort(aoEntries.begin(), aoEntries.end(),
+                  [](const DiskCacheEntry& a, const DiskCacheEntry& b)
+                  { return a.nAccessSeq < b.nAccessSeq; });
+        for( const auto& oEntry: aoEntries )
+        {
+            if( nTotalSize <= nTargetSize )
+                break;
+            if( VSIUnlink(oEntry.osFilename) == 0 )
+                nTotalSize -= oEntry.nSize;
+        }
+        CPLDebug("VSICURL", "Disk cache %s trimmed to " CPL_FRMT_GIB " bytes",
+                 pszCacheDir, nTotalSize);
+    }
+
+    CPLUnlockFile(hLock);
+}
+
+/************************************************************************/
+/*                          WriteToDiskCache()                          */
+/************************************************************************/
+
+static void WriteToDiskCache( const char* pszCacheDir,
+                              const CPLString& osFilename,
+                              size_t nSize, const char* pData )
+{
+    // Write to a temporary file, and rename it, so that concurrent readers
+    // never see a partially written chunk.
+    const CPLString osTmpFilename(
+        osFilename + CPLSPrintf(".%d_" CPL_FRMT_GIB ".tmp",
+                                CPLGetCurrentProcessID(), CPLGetPID()));
+    VSILFILE* fp = VSIFOpenL(osTmpFilename, "wb");
+    if( fp == nullptr )
+        return;
+    const bool bOK = WriteDiskCacheAccessSequence(fp) &&
+                     VSIFWriteL(pData, 1, nSize, fp) == nSize;
+    if( VSIFCloseL(fp) != 0 || !bOK ||
+        VSIRename(osTmpFilename, osFilename) != 0 )
+    {
+        VSIUnlink(osTmpFilename);
+        return;
+    }
+
+    const GIntBig nMaxSize = std::max(
+        static_cast<GIntBig>(DISK_CACHE_HEADER_SIZE + DOWNLOAD_CHUNK_SIZE),
+        CPLAtoGIntBig(CPLGetConfigOption("CPL_VSIL_CURL_DISK_CACHE_SIZE",
+                                         "1073741824")));
+    {
+        std::lock_guard<std::mutex> oLock(goDiskCacheMutex);
+        gnDiskCacheBytesWritten += DISK_CACHE_HEADER_SIZE + nSize;
+        if( gbDiskCacheEvictionDone &&
+            gnDiskCacheBytesWritten < nMaxSize / 10 )
+        {
+            return;
+        }
+        gbDiskCacheEvictionDone = true;
+        gnDiskCacheBytesWritten = 0;
+    }
+    EvictFromDiskCache(pszCacheDir, nMaxSize);
+}
+
 /************************************************************************/
 /*                          GetRegion()                                 */
 /************************************************************************/
@@ -2434,19 +2713,43 @@ std::shared_ptr<std::string>
 VSICurlFilesystemHandler::GetRegion( const char* pszURL,
                                      vsi_l_offset nFileOffsetStart )
 {
-    CPLMutexHolder oHolder( &hMutex );
-
     nFileOffsetStart =
         (nFileOffsetStart / DOWNLOAD_CHUNK_SIZE) * DOWNLOAD_CHUNK_SIZE;
 
     std::shared_ptr<std::string> out;
-    if( oRegionCache.tryGet(
-        FilenameOffsetPair(std::string(pszURL), nFileOffsetStart), out) )
     {
-        return out;
+        CPLMutexHolder oHolder( &hMutex );
+
+        if( oRegionCache.tryGet(
+            FilenameOffsetPair(std::string(pszURL), nFileOffsetStart), out) )
+        {
+            return out;
+        }
     }
 
-    return nullptr;
+/* -------------------------------------------------------------------- */
+/*      Try the persistent disk cache.                                  */
+/* -------------------------------------------------------------------- */
+    const char* pszDiskCacheDir =
+        CPLGetConfigOption("CPL_VSIL_CURL_DISK_CACHE_DIR", nullptr);
+    FileProp oFileProp;
+    if( pszDiskCacheDir == nullptr || pszDiskCacheDir[0] == '\0' ||
+        !GetCachedFileProp(pszURL, oFileProp) )
+    {
+        return nullptr;
+    }
+    const CPLString osFilename(GetDiskCacheChunkFilename(
+        pszDiskCacheDir, pszURL, oFileProp, nFileOffsetStart));
+    if( osFilename.empty() )
+        return nullptr;
+    out = ReadFromDiskCache(osFilename);
+    if( out )
+    {
+        CPLMutexHolder oHolder( &hMutex );
+        oRegionCache.insert(
+            FilenameOffsetPair(std::string(pszURL), nFileOffsetStart), out);
+    }
+    return out;
 }
 
 /************************************************************************/
@@ -2458,13 +2761,27 @@ void VSICurlFilesystemHandler::AddRegion( const char* pszURL,
                                           size_t nSize,
                                           const char *pData )
 {
-    CPLMutexHolder oHolder( &hMutex );
+    {
+        CPLMutexHolder oHolder( &hMutex );
 
-    std::shared_ptr<std::string> value(new std::string());
-    value->assign(pData, nSize);
-    oRegionCache.insert(
-        FilenameOffsetPair(std::string(pszURL), nFileOffsetStart),
-        value);
+        std::shared_ptr<std::string> value(new std::string());
+        value->assign(pData, nSize);
+        oRegionCache.insert(
+            FilenameOffsetPair(std::string(pszURL), nFileOffsetStart),
+            value);
+    }
+
+    const char* pszDiskCacheDir =
+        CPLGetConfigOption("CPL_VSIL_CURL_DISK_CACHE_DIR", nullptr);
+    FileProp oFileProp;
+    if( pszDiskCacheDir != nullptr && pszDiskCacheDir[0] != '\0' &&
+        GetCachedFileProp(pszURL, oFileProp) )
+    {
+        const CPLString osFilename(GetDiskCacheChunkFilename(
+            pszDiskCacheDir, pszURL, oFileProp, nFileOffsetStart));
+        if( !osFilename.empty() )
+            WriteToDiskCache(pszDiskCacheDir, osFilename, nSize, pData);
+    }
 }
 
 /************************************************************************/
@@ -2734,6 +3051,12 @@ const char* VSICurlFilesystemHandler::GetActualURL(const char* pszFilename)
     "  <Option name='CPL_VSIL_CURL_CACHE_SIZE' type='integer' " \
         "description='Size in bytes of the global /vsicurl/ cache' " \
         "default='16384000'/>" \
+    "  <Option name='CPL_VSIL_CURL_DISK_CACHE_DIR' type='string' " \
+        "description='Directory where to persistently cache downloaded " \
+        "chunks, so that other processes can reuse them'/>" \
+    "  <Option name='CPL_VSIL_CURL_DISK_CACHE_SIZE' type='integer' " \
+        "description='Maximum size in bytes of the persistent disk cache' " \
+        "default='1073741824'/>" \
     "  <Option name='CPL_VSIL_CURL_IGNORE_GLACIER_STORAGE' type='boolean' " \
         "description='Whether to skip files with Glacier storage class in " \
         "directory listing.' default='YES'/>"
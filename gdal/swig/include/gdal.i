@@ -315,6 +315,9 @@ $1;
 %rename (GetCacheMax) wrapper_GDALGetCacheMax;
 %rename (SetCacheMax) wrapper_GDALSetCacheMax;
 %rename (GetCacheUsed) wrapper_GDALGetCacheUsed;
+%rename (GetDatasetPoolHits) wrapper_GDALGetDatasetPoolHits;
+%rename (GetDatasetPoolMisses) wrapper_GDALGetDatasetPoolMisses;
+%rename (GetDatasetPoolEvictions) wrapper_GDALGetDatasetPoolEvictions;
 %rename (GetDataTypeSize) GDALGetDataTypeSize;
 %rename (DataTypeIsComplex) GDALDataTypeIsComplex;
 %rename (GetDataTypeName) GDALGetDataTypeName;
@@ -629,6 +632,33 @@ void wrapper_GDALSetCacheMax(GIntBig nBytes)
 }
 }
 
+%inline {
+GIntBig wrapper_GDALGetDatasetPoolHits()
+{
+    GIntBig nHits = 0;
+    GDALGetDatasetPoolStatistics(&nHits, NULL, NULL);
+    return nHits;
+}
+}
+
+%inline {
+GIntBig wrapper_GDALGetDatasetPoolMisses()
+{
+    GIntBig nMisses = 0;
+    GDALGetDatasetPoolStatistics(NULL, &nMisses, NULL);
+    return nMisses;
+}
+}
+
+%inline {
+GIntBig wrapper_GDALGetDatasetPoolEvictions()
+{
+    GIntBig nEvictions = 0;
+    GDALGetDatasetPoolStatistics(NULL, NULL, &nEvictions);
+    return nEvictions;
+}
+}
+
 #else
 %inline {
 int wrapper_GDALGetCacheMax()
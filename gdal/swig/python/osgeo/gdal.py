@@ -645,6 +645,9 @@ def VectorTranslateOptions(options=None, format=None,
          zField=None,
          skipFailures=False,
          limit=None,
+         pipelineThreads=None,
+         pipelineUnordered=False,
+         layerThreads=None,
          callback=None, callback_data=None):
     """ Create a VectorTranslateOptions() object that can be passed to gdal.VectorTranslate()
         Keyword arguments are :
@@ -673,6 +676,9 @@ def VectorTranslateOptions(options=None, format=None,
           zField --- name of field to use to set the Z component of geometries
           skipFailures --- whether to skip failures
           limit -- maximum number of features to read per layer
+          pipelineThreads --- number of threads used to translate features, or 'ALL_CPUS'
+          pipelineUnordered --- whether translated features may be written in a different order than read
+          layerThreads --- number of layers translated concurrently, or 'ALL_CPUS'
           callback --- callback method
           callback_data --- user data for callback
     """
@@ -749,6 +755,12 @@ def VectorTranslateOptions(options=None, format=None,
             new_options += ['-skip']
         if limit is not None:
             new_options += ['-limit', str(limit)]
+        if pipelineThreads is not None:
+            new_options += ['-pipeline_threads', str(pipelineThreads)]
+        if pipelineUnordered:
+            new_options += ['-pipeline_unordered']
+        if layerThreads is not None:
+            new_options += ['-layer_threads', str(layerThreads)]
     if callback is not None:
         new_options += ['-progress']
 
@@ -781,7 +793,7 @@ def DEMProcessingOptions(options=None, colorFilename=None, format=None,
               zFactor=None, scale=None, azimuth=None, altitude=None,
               combined=False, multiDirectional=False, igor=False,
               slopeFormat=None, trigonometric=False, zeroForFlat=False,
-              addAlpha=None,
+              addAlpha=None, numThreads=None,
               callback=None, callback_data=None):
     """ Create a DEMProcessingOptions() object that can be passed to gdal.DEMProcessing()
         Keyword arguments are :
@@ -803,6 +815,7 @@ def DEMProcessingOptions(options=None, colorFilename=None, format=None,
           trigonometric --- (aspect only) whether to return trigonometric angle instead of azimuth. Thus 0deg means East, 90deg North, 180deg West, 270deg South.
           zeroForFlat --- (aspect only) whether to return 0 for flat areas with slope=0, instead of -9999.
           addAlpha --- adds an alpha band to the output file (only for processing = 'color-relief')
+          numThreads --- number of worker threads, or 'ALL_CPUS'
           callback --- callback method
           callback_data --- user data for callback
     """
@@ -844,6 +857,8 @@ def DEMProcessingOptions(options=None, colorFilename=None, format=None,
             new_options += ['-zero_for_flat']
         if addAlpha:
             new_options += ['-alpha']
+        if numThreads is not None:
+            new_options += ['-num_threads', str(numThreads)]
 
     return (GDALDEMProcessingOptions(new_options), colorFilename, callback, callback_data)
 
@@ -956,6 +971,7 @@ def GridOptions(options=None, format=None,
               zfield=None,
               z_increase=None,
               z_multiply=None,
+              tileSize=None,
               callback=None, callback_data=None):
     """ Create a GridOptions() object that can be passed to gdal.Grid()
         Keyword arguments are :
@@ -976,6 +992,7 @@ def GridOptions(options=None, format=None,
           zfield --- Identifies an attribute field on the features to be used to get a Z value from. This value overrides Z value read from feature geometry record.
           z_increase --- Addition to the attribute field on the features to be used to get a Z value from. The addition should be the same unit as Z value. The result value will be Z value + Z increase value. The default value is 0.
           z_multiply - Multiplication ratio for Z field. This can be used for shift from e.g. foot to meters or from  elevation to deep. The result value will be (Z value + Z increase value) * Z multiply value.  The default value is 1.
+          tileSize --- (width, height) of the tiles by which the output is gridded, to bound memory use. Requires an algorithm with a search radius.
           callback --- callback method
           callback_data --- user data for callback
     """
@@ -1016,6 +1033,8 @@ def GridOptions(options=None, format=None,
             new_options += ['-z_increase', str(z_increase)]
         if z_multiply is not None:
             new_options += ['-z_multiply', str(z_multiply)]
+        if tileSize is not None:
+            new_options += ['-tile_size', str(tileSize[0]), str(tileSize[1])]
         if spatFilter is not None:
             new_options += ['-spat', str(spatFilter[0]), str(spatFilter[1]), str(spatFilter[2]), str(spatFilter[3])]
 
@@ -1050,6 +1069,7 @@ def RasterizeOptions(options=None, format=None,
          bands=None, inverse=False, allTouched=False,
          burnValues=None, attribute=None, useZ=False, layers=None,
          SQLStatement=None, SQLDialect=None, where=None, optim=None,
+         numThreads=None,
          callback=None, callback_data=None):
     """ Create a RasterizeOptions() object that can be passed to gdal.Rasterize()
         Keyword arguments are :
@@ -1076,6 +1096,8 @@ def RasterizeOptions(options=None, format=None,
           SQLStatement --- SQL statement to apply to the source dataset
           SQLDialect --- SQL dialect ('OGRSQL', 'SQLITE', ...)
           where --- WHERE clause to apply to source layer(s)
+          optim --- optimization mode ('AUTO', 'VECTOR', 'RASTER')
+          numThreads --- number of worker threads, or 'ALL_CPUS'
           callback --- callback method
           callback_data --- user data for callback
     """
@@ -1146,6 +1168,8 @@ def RasterizeOptions(options=None, format=None,
             new_options += ['-where', str(where)]
         if optim is not None:
             new_options += ['-optim', str(optim)]
+        if numThreads is not None:
+            new_options += ['-num_threads', str(numThreads)]
 
     return (GDALRasterizeOptions(new_options), callback, callback_data)
 
@@ -3239,6 +3263,18 @@ def SetCacheMax(*args):
     """SetCacheMax(GIntBig nBytes)"""
     return _gdal.SetCacheMax(*args)
 
+def GetDatasetPoolHits(*args):
+    """GetDatasetPoolHits() -> GIntBig"""
+    return _gdal.GetDatasetPoolHits(*args)
+
+def GetDatasetPoolMisses(*args):
+    """GetDatasetPoolMisses() -> GIntBig"""
+    return _gdal.GetDatasetPoolMisses(*args)
+
+def GetDatasetPoolEvictions(*args):
+    """GetDatasetPoolEvictions() -> GIntBig"""
+    return _gdal.GetDatasetPoolEvictions(*args)
+
 def GetDataTypeSize(*args):
     """GetDataTypeSize(GDALDataType eDataType) -> int"""
     return _gdal.GetDataTypeSize(*args)
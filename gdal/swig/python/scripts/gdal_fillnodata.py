@@ -44,7 +44,7 @@ def CopyBand(srcband, dstband):
 def Usage():
     print("""
 gdal_fillnodata [-q] [-md max_distance] [-si smooth_iterations]
-                [-o name=value] [-b band]
+                [-o name=value] [-num_threads n|ALL_CPUS] [-b band]
                 srcfile [-nomask] [-mask filename] [-of format] [-co name=value]* [dstfile]
 """)
     sys.exit(1)
@@ -92,6 +92,14 @@ while i < len(argv):
         i = i + 1
         smoothing_iterations = int(argv[i])
 
+    elif arg == '-o':
+        i = i + 1
+        options.append(argv[i])
+
+    elif arg == '-num_threads':
+        i = i + 1
+        options.append('NUM_THREADS=' + argv[i])
+
     elif arg == '-b':
         i = i + 1
         src_band = int(argv[i])
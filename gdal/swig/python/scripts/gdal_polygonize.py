@@ -40,7 +40,8 @@ from osgeo import ogr
 def Usage():
     print("""
 gdal_polygonize [-8] [-nomask] [-mask filename] raster_file [-b band|mask]
-                [-q] [-f ogr_format] out_file [layer] [fieldname]
+                [-num_threads n|ALL_CPUS] [-q] [-f ogr_format] out_file
+                [layer] [fieldname]
 """)
     sys.exit(1)
 
@@ -125,6 +126,10 @@ while i < len(argv):
     elif arg == '-8':
         options.append('8CONNECTED=8')
 
+    elif arg == '-num_threads':
+        i = i + 1
+        options.append('NUM_THREADS=' + argv[i])
+
     elif arg == '-nomask':
         mask = 'none'
 
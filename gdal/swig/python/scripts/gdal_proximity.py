@@ -43,7 +43,8 @@ gdal_proximity.py srcfile dstfile [-srcband n] [-dstband n]
                   [-ot Byte/Int16/Int32/Float32/etc]
                   [-values n,n,n] [-distunits PIXEL/GEO]
                   [-maxdist n] [-nodata n] [-use_input_nodata YES/NO]
-                  [-fixed-buf-val n] [-q] """)
+                  [-fixed-buf-val n] [-algorithm SCANLINE/EXACT]
+                  [-num_threads n|ALL_CPUS] [-nearest_index_band n] [-q] """)
     sys.exit(1)
 
 
@@ -108,6 +109,7 @@ src_band_n = 1
 dst_filename = None
 dst_band_n = 1
 creation_type = 'Float32'
+nearest_index_band_n = None
 quiet_flag = 0
 
 gdal.AllRegister()
@@ -156,6 +158,19 @@ while i < len(argv):
         i = i + 1
         options.append('FIXED_BUF_VAL=' + argv[i])
 
+    elif arg == '-algorithm':
+        i = i + 1
+        options.append('ALGORITHM=' + argv[i])
+
+    elif arg == '-num_threads':
+        i = i + 1
+        options.append('NUM_THREADS=' + argv[i])
+
+    elif arg == '-nearest_index_band':
+        i = i + 1
+        nearest_index_band_n = int(argv[i])
+        options.append('NEAREST_INDEX_BAND=' + argv[i])
+
     elif arg == '-srcband':
         i = i + 1
         src_band_n = int(argv[i])
@@ -215,8 +230,11 @@ if dst_ds is None:
         frmt = GetOutputDriverFor(dst_filename)
 
     drv = gdal.GetDriverByName(frmt)
+    band_count = 1
+    if nearest_index_band_n is not None:
+        band_count = max(band_count, nearest_index_band_n)
     dst_ds = drv.Create(dst_filename,
-                        src_ds.RasterXSize, src_ds.RasterYSize, 1,
+                        src_ds.RasterXSize, src_ds.RasterYSize, band_count,
                         gdal.GetDataTypeByName(creation_type), creation_options)
 
     dst_ds.SetGeoTransform(src_ds.GetGeoTransform())
@@ -38,6 +38,7 @@ from osgeo import gdal
 def Usage():
     print("""
 gdal_sieve [-q] [-st threshold] [-4] [-8] [-o name=value]
+           [-num_threads n|ALL_CPUS]
            srcfile [-nomask] [-mask filename] [-of format] [dstfile]
 """)
     sys.exit(1)
@@ -134,6 +135,14 @@ while i < len(argv):
         i = i + 1
         threshold = int(argv[i])
 
+    elif arg == '-o':
+        i = i + 1
+        options.append(argv[i])
+
+    elif arg == '-num_threads':
+        i = i + 1
+        options.append('NUM_THREADS=' + argv[i])
+
     elif arg == '-nomask':
         mask = 'none'
 
@@ -227,7 +236,7 @@ else:
     prog_func = gdal.TermProgress_nocb
 
 result = gdal.SieveFilter(srcband, maskband, dstband,
-                          threshold, connectedness,
+                          threshold, connectedness, options,
                           callback=prog_func)
 
 src_ds = None
@@ -48,13 +48,18 @@ def Usage():
     print('            [-src_geom_type geom_type_name[,geom_type_name]*]')
     print('            [-dsco NAME=VALUE]* [-lco NAME=VALUE]*')
     print('            [-s_srs srs_def] [-t_srs srs_def | -a_srs srs_def]')
-    print('            [-progress] [-skipfailures] [--help-general]')
+    print('            [-progress] [-skipfailures] [-j num_threads|ALL_CPUS]')
+    print('            [--help-general]')
     print('')
     print('Options specific to -single:')
     print('            [-field_strategy FirstLayer|Union|Intersection]')
     print('            [-src_layer_field_name name]')
     print('            [-src_layer_field_content layer_name_template]')
     print('')
+    print('-j: number of output layers written concurrently, when the output')
+    print('    format allows it (directory of shapefiles, PostgreSQL).')
+    print('    Ignored with -single.')
+    print('')
     print('* layer_name_template can contain the following substituable '
           'variables:')
     print('     {AUTO_NAME}  : {DS_BASENAME}_{LAYER_NAME} if they are '
@@ -217,6 +222,7 @@ def process(argv, progress=None, progress_arg=None):
     t_srs = None
     dsco = []
     lco = []
+    layer_threads = None
 
     i = 0
     while i < len(argv):
@@ -273,6 +279,9 @@ def process(argv, progress=None, progress_arg=None):
         elif arg == '-lco' and i + 1 < len(argv):
             i = i + 1
             lco.append(argv[i])
+        elif arg == '-j' and i + 1 < len(argv):
+            i = i + 1
+            layer_threads = argv[i]
         elif arg == '-src_geom_type' and i + 1 < len(argv):
             i = i + 1
             src_geom_type_names = argv[i].split(',')
@@ -333,6 +342,11 @@ def process(argv, progress=None, progress_arg=None):
         else:
             layer_name_template = '{AUTO_NAME}'
 
+    # With -j, let VectorTranslate() open or create the output dataset by
+    # its name, so that it can open other connections to it to write
+    # several layers concurrently. This is a no-op with -single.
+    translate_by_name = layer_threads is not None and not single_layer
+
     vrt_filename = None
     if not EQUAL(output_format, 'VRT'):
         dst_ds = gdal.OpenEx(dst_filename, gdal.OF_VECTOR | gdal.OF_UPDATE)
@@ -357,10 +371,11 @@ def process(argv, progress=None, progress_arg=None):
             if drv is None:
                 print('ERROR: Invalid driver: %s' % output_format)
                 return 1
-            dst_ds = drv.Create(
-                dst_filename, 0, 0, 0, gdal.GDT_Unknown, dsco)
-            if dst_ds is None:
-                return 1
+            if not translate_by_name:
+                dst_ds = drv.Create(
+                    dst_filename, 0, 0, 0, gdal.GDT_Unknown, dsco)
+                if dst_ds is None:
+                    return 1
 
         vrt_filename = '/vsimem/_ogrmerge_.vrt'
     else:
@@ -589,12 +604,36 @@ def process(argv, progress=None, progress_arg=None):
             accessMode = 'append'
         elif overwrite_layer:
             accessMode = 'overwrite'
-        ret = gdal.VectorTranslate(dst_ds, vrt_filename,
-                                   accessMode=accessMode,
-                                   layerCreationOptions=lco,
-                                   skipFailures=skip_failures,
-                                   callback=progress,
-                                   callback_data=progress_arg)
+        if translate_by_name:
+            if dst_ds is not None:
+                dst_ds = None
+                if accessMode is None:
+                    accessMode = 'update'
+                ret = gdal.VectorTranslate(dst_filename, vrt_filename,
+                                           accessMode=accessMode,
+                                           layerCreationOptions=lco,
+                                           skipFailures=skip_failures,
+                                           layerThreads=layer_threads,
+                                           callback=progress,
+                                           callback_data=progress_arg)
+            else:
+                ret = gdal.VectorTranslate(dst_filename, vrt_filename,
+                                           format=output_format,
+                                           datasetCreationOptions=dsco,
+                                           layerCreationOptions=lco,
+                                           skipFailures=skip_failures,
+                                           layerThreads=layer_threads,
+                                           callback=progress,
+                                           callback_data=progress_arg)
+            # Close the output dataset returned by VectorTranslate()
+            ret = 1 if ret is not None else 0
+        else:
+            ret = gdal.VectorTranslate(dst_ds, vrt_filename,
+                                       accessMode=accessMode,
+                                       layerCreationOptions=lco,
+                                       skipFailures=skip_failures,
+                                       callback=progress,
+                                       callback_data=progress_arg)
         if ret == 1:
             ret = 0
         else:
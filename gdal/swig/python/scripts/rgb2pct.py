@@ -36,7 +36,8 @@ from osgeo import gdal
 
 
 def Usage():
-    print('Usage: rgb2pct.py [-n colors | -pct palette_file] [-of format] source_file dest_file')
+    print('Usage: rgb2pct.py [-n colors | -pct palette_file] [-sample_step n]')
+    print('                  [-num_threads n|ALL_CPUS] [-of format] source_file dest_file')
     sys.exit(1)
 
 
@@ -98,6 +99,8 @@ frmt = None
 src_filename = None
 dst_filename = None
 pct_filename = None
+sample_step = 1
+num_threads = None
 
 gdal.AllRegister()
 argv = gdal.GeneralCmdLineProcessor(sys.argv)
@@ -121,6 +124,14 @@ while i < len(argv):
         i = i + 1
         pct_filename = argv[i]
 
+    elif arg == '-sample_step':
+        i = i + 1
+        sample_step = int(argv[i])
+
+    elif arg == '-num_threads':
+        i = i + 1
+        num_threads = argv[i]
+
     elif src_filename is None:
         src_filename = argv[i]
 
@@ -157,15 +168,30 @@ if dst_driver is None:
     print('"%s" driver not registered.' % frmt)
     sys.exit(1)
 
+# The median cut uses worker threads when GDAL_NUM_THREADS is set, and the
+# dithering when GDAL_DITHER_NUM_THREADS is set, as its result then changes.
+
+if num_threads is not None:
+    gdal.SetConfigOption('GDAL_NUM_THREADS', num_threads)
+    gdal.SetConfigOption('GDAL_DITHER_NUM_THREADS', num_threads)
+
 # Generate palette
 
 ct = gdal.ColorTable()
 if pct_filename is None:
-    err = gdal.ComputeMedianCutPCT(src_ds.GetRasterBand(1),
-                                   src_ds.GetRasterBand(2),
-                                   src_ds.GetRasterBand(3),
+    # With -sample_step, compute the histogram on a downsampled view of the
+    # image, which reads from an overview when one is available.
+    hist_ds = src_ds
+    if sample_step > 1:
+        hist_ds = gdal.Translate('', src_ds, format='VRT', bandList=[1, 2, 3],
+                                 width=max(1, src_ds.RasterXSize // sample_step),
+                                 height=max(1, src_ds.RasterYSize // sample_step))
+    err = gdal.ComputeMedianCutPCT(hist_ds.GetRasterBand(1),
+                                   hist_ds.GetRasterBand(2),
+                                   hist_ds.GetRasterBand(3),
                                    color_count, ct,
                                    callback=gdal.TermProgress_nocb)
+    hist_ds = None
 else:
     pct_ds = gdal.Open(pct_filename)
     ct = pct_ds.GetRasterBand(1).GetRasterColorTable().Clone()